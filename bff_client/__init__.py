@@ -0,0 +1,16 @@
+"""Async Python client for the srnext BFF GraphQL API (see bff_client/client.py)."""
+
+from .auth import CommandToken, RefreshingToken, StaticToken, TokenProvider
+from .client import BffClient, ClientStats, GraphQLError
+from .spec import FieldSpec
+
+__all__ = [
+    "BffClient",
+    "ClientStats",
+    "CommandToken",
+    "FieldSpec",
+    "GraphQLError",
+    "RefreshingToken",
+    "StaticToken",
+    "TokenProvider",
+]
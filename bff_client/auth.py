@@ -0,0 +1,99 @@
+"""Bearer tokens for the BFF: fixed, or fetched once and refreshed before they expire."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import time
+from typing import Awaitable, Callable
+
+
+def jwt_expiry(token: str) -> float | None:
+    """The `exp` claim of a JWT (epoch seconds), read without verifying it."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+    except ValueError:
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class TokenProvider:
+    """Where the client gets its bearer token from."""
+
+    async def token(self) -> str:
+        raise NotImplementedError
+
+    def invalidate(self, token: str) -> None:
+        """The API rejected `token`; the next `token()` call should not return it."""
+
+
+class StaticToken(TokenProvider):
+    def __init__(self, token: str):
+        self._token = token
+
+    async def token(self) -> str:
+        return self._token
+
+
+class RefreshingToken(TokenProvider):
+    """A token from `fetch`, cached until `refresh_margin` seconds before it
+    expires (its JWT `exp`, or `default_ttl` after fetching for other tokens).
+    Concurrent callers share one fetch."""
+
+    def __init__(self, fetch: Callable[[], Awaitable[str]], refresh_margin: float = 60.0,
+                 default_ttl: float = 900.0, clock: Callable[[], float] = time.time):
+        self._fetch = fetch
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._token: str | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self.fetches = 0
+
+    def _fresh(self) -> str | None:
+        if self._token is not None and self._clock() < self._expires_at - self.refresh_margin:
+            return self._token
+        return None
+
+    async def token(self) -> str:
+        cached = self._fresh()
+        if cached is not None:
+            return cached
+        async with self._lock:
+            cached = self._fresh()
+            if cached is not None:
+                return cached
+            token = (await self._fetch()).strip()
+            if not token:
+                raise RuntimeError("Token source returned an empty token")
+            self.fetches += 1
+            self._token = token
+            self._expires_at = jwt_expiry(token) or self._clock() + self.default_ttl
+            return token
+
+    def invalidate(self, token: str) -> None:
+        if token == self._token:
+            self._token = None
+
+
+class CommandToken(RefreshingToken):
+    """A token printed by a shell command, e.g. ./get_token.sh, run again when it expires."""
+
+    def __init__(self, command: str, **options):
+        super().__init__(self._run, **options)
+        self.command = command
+
+    async def _run(self) -> str:
+        process = await asyncio.create_subprocess_shell(
+            self.command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"{self.command!r} exited with {process.returncode}: {stderr.decode().strip()}")
+        return stdout.decode()
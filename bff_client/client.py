@@ -0,0 +1,222 @@
+"""Async client for the srnext BFF GraphQL API.
+
+Every Query and Mutation field is a typed method (see schema.py). Calls made
+close together are sent as one GraphQL document: each call becomes an aliased
+root field with its own variables, so fetching 200 work orders with
+`asyncio.gather` takes a handful of requests instead of 200, and AppSync
+resolves the fields of one document concurrently (mutations in order).
+Requests go over a pool of keep-alive connections, and the bearer token is
+fetched once and refreshed when it expires or is rejected.
+
+    async with BffClient.from_env() as bff:
+        units = await asyncio.gather(*(bff.get_unit(id=unit_id) for unit_id in unit_ids))
+        async for work_order in bff.iter_list_work_orders(account_id=account_id, page_size=100):
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from .auth import CommandToken, StaticToken, TokenProvider
+from .http import HttpPool
+from .schema import Operations
+from .spec import FieldSpec
+
+
+class GraphQLError(Exception):
+    """The API answered with errors for a field (or the whole request)."""
+
+    def __init__(self, errors: list[dict]):
+        self.errors = errors
+        first = errors[0] if errors else {}
+        # AppSync's errorType: the resolver's error name, e.g. ThrottledError or Unauthorized
+        self.error_type: str | None = first.get("errorType")
+        super().__init__("; ".join(str(error.get("message", error)) for error in errors) or "GraphQL request failed")
+
+
+@dataclass
+class _Call:
+    spec: FieldSpec
+    arguments: dict
+    selection: str
+    future: asyncio.Future
+
+
+@dataclass
+class ClientStats:
+    # HTTP requests sent, and the field calls they carried
+    requests: int = 0
+    calls: int = 0
+    rejected_tokens: int = 0
+
+
+class BffClient(Operations):
+    """Typed, batching GraphQL client; use as an async context manager.
+
+    `batch_size` caps the fields of one document (0 or 1 turns batching off)
+    and `batch_window` is how long, in seconds, a call waits for others to
+    share its request. A field that fails raises GraphQLError for that call
+    only; partial errors below a field that still returned data are dropped,
+    as the data is what the caller selected.
+    """
+
+    def __init__(self, url: str, token: TokenProvider | str | None = None, *, max_connections: int = 16,
+                 timeout: float = 30.0, batch_size: int = 25, batch_window: float = 0.002,
+                 headers: dict[str, str] | None = None):
+        self.url = url
+        self.tokens = StaticToken(token) if isinstance(token, str) else token
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.headers = dict(headers or {})
+        self.stats = ClientStats()
+        self._pool = HttpPool(url, max_connections=max_connections, timeout=timeout)
+        self._queues: dict[str, list[_Call]] = {"query": [], "mutation": []}
+        self._timer: asyncio.TimerHandle | None = None
+        self._sending: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_env(cls, **options) -> "BffClient":
+        """A client for APPSYNC_URL, with APPSYNC_TOKEN or the token printed by
+        APPSYNC_TOKEN_COMMAND (e.g. ./get_token.sh)"""
+        url = os.environ.get("APPSYNC_URL")
+        if not url:
+            raise RuntimeError("APPSYNC_URL is not set")
+        command = os.environ.get("APPSYNC_TOKEN_COMMAND")
+        token = CommandToken(command) if command else os.environ.get("APPSYNC_TOKEN")
+        return cls(url, token, **options)
+
+    async def execute(self, document: str, variables: dict | None = None) -> dict:
+        """Run a GraphQL document as written (not batched) and return its data."""
+        body = await self._post({"query": document, "variables": variables or {}})
+        if body.get("errors"):
+            raise GraphQLError(body["errors"])
+        return body.get("data") or {}
+
+    async def close(self) -> None:
+        await self.flush()
+        await self._pool.close()
+
+    async def flush(self) -> None:
+        """Send every queued call now and wait for the requests in flight."""
+        self._send_queued()
+        while self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    async def __aenter__(self) -> "BffClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _call(self, spec: FieldSpec, arguments: dict, fields: str | None):
+        call = _Call(spec, {name: value for name, value in arguments.items() if value is not None},
+                     spec.selection if fields is None else fields, asyncio.get_running_loop().create_future())
+        queue = self._queues[spec.operation]
+        queue.append(call)
+        if len(queue) >= max(self.batch_size, 1):
+            self._send_queued(spec.operation)
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.batch_window, self._send_queued)
+        return await call.future
+
+    async def _iterate(self, spec: FieldSpec, arguments: dict, fields: str | None) -> AsyncIterator:
+        """Every item of a connection, following its cursor. The next page is
+        requested as soon as a page arrives, while its items are consumed."""
+        if fields is not None:
+            fields = f"items {{ {fields} }}"
+        selection = f"{fields or spec.selection} {spec.cursor}"
+        page = asyncio.ensure_future(self._call(spec, arguments, selection))
+        try:
+            while page is not None:
+                result = await page or {}
+                page = None
+                items = result.get("items") or []
+                cursor = result.get(spec.cursor or "")
+                if cursor and items:
+                    page = asyncio.ensure_future(self._call(spec, {**arguments, "cursor": cursor}, selection))
+                for item in items:
+                    yield item
+        finally:
+            if page is not None:
+                page.cancel()
+
+    def _send_queued(self, operation: str | None = None) -> None:
+        if operation is None and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for kind in [operation] if operation else list(self._queues):
+            calls, self._queues[kind] = self._queues[kind], []
+            size = max(self.batch_size, 1)
+            for start in range(0, len(calls), size):
+                task = asyncio.ensure_future(self._send(kind, calls[start:start + size]))
+                self._sending.add(task)
+                task.add_done_callback(self._sending.discard)
+
+    async def _send(self, operation: str, calls: list[_Call]) -> None:
+        calls = [call for call in calls if not call.future.done()]
+        if not calls:
+            return
+        definitions, fields, variables = [], [], {}
+        for index, call in enumerate(calls):
+            arguments = []
+            for name, value in call.arguments.items():
+                variable = f"v{index}_{name}"
+                definitions.append(f"${variable}: {call.spec.arguments[name]}")
+                arguments.append(f"{name}: ${variable}")
+                variables[variable] = value
+            field = f"f{index}: {call.spec.name}" + (f"({', '.join(arguments)})" if arguments else "")
+            fields.append(field + (f" {{ {call.selection} }}" if call.selection else ""))
+        document = operation + (f"({', '.join(definitions)})" if definitions else "") + f" {{ {' '.join(fields)} }}"
+        self.stats.calls += len(calls)
+
+        try:
+            body = await self._post({"query": document, "variables": variables})
+        except BaseException as error:
+            for call in calls:
+                if not call.future.done():
+                    call.future.set_exception(error if isinstance(error, Exception) else ConnectionError(str(error)))
+            if not isinstance(error, Exception):
+                raise
+            return
+
+        data = body.get("data") or {}
+        by_alias: dict[str | None, list[dict]] = {}
+        for error in body.get("errors") or []:
+            path = error.get("path") or [None]
+            by_alias.setdefault(path[0], []).append(error)
+        for index, call in enumerate(calls):
+            if call.future.done():
+                continue
+            alias = f"f{index}"
+            value = data.get(alias)
+            errors = by_alias.get(alias, []) + by_alias.get(None, [])
+            if value is None and errors:
+                call.future.set_exception(GraphQLError(errors))
+            else:
+                call.future.set_result(value)
+
+    async def _post(self, body: dict) -> dict:
+        """POST a GraphQL request; a rejected token is refreshed and the request sent once more."""
+        for attempt in range(2):
+            token = await self.tokens.token() if self.tokens is not None else None
+            headers = {**self.headers, **({"Authorization": f"Bearer {token}"} if token else {})}
+            self.stats.requests += 1
+            response = await self._pool.post_json(body, headers)
+            if response.status == 401 and token and attempt == 0:
+                self.tokens.invalidate(token)
+                self.stats.rejected_tokens += 1
+                continue
+            try:
+                answer = response.json()
+            except ValueError:
+                answer = None
+            if not isinstance(answer, dict):
+                raise GraphQLError([{"message": f"HTTP {response.status}", "errorType": "HttpError"}])
+            if response.status >= 400 and not answer.get("errors"):
+                answer["errors"] = [{"message": f"HTTP {response.status}", "errorType": "HttpError"}]
+            return answer
+        raise GraphQLError([{"message": "Unauthorized", "errorType": "UnauthorizedException"}])
@@ -0,0 +1,453 @@
+"""Generate bff_client/schema.py from the AppSync schema.
+
+Reads terraform/schema.graphql and writes, for every Query and Mutation field
+a user pool token can call, a typed async method on `Operations` (and, for
+connections, an `iter_` method following the cursor), TypedDicts for the
+object and input types and Literal aliases for the enums. Run it after
+changing the schema:
+
+    python -m bff_client.codegen            # rewrite bff_client/schema.py
+    python -m bff_client.codegen --check    # exit 1 if it is out of date
+"""
+
+from __future__ import annotations
+
+import argparse
+import keyword
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TERRAFORM = REPO_ROOT / "terraform"
+SCHEMA = TERRAFORM / "schema.graphql"
+OUTPUT = Path(__file__).resolve().parent / "schema.py"
+
+SCALARS = {
+    "ID": "str",
+    "String": "str",
+    "Int": "int",
+    "Float": "float",
+    "Boolean": "bool",
+    # AppSync scalars: AWSJSON is a JSON document in a string, AWSTimestamp epoch seconds
+    "AWSJSON": "str",
+    "AWSTimestamp": "int",
+    "AWSDateTime": "str",
+    "AWSDate": "str",
+    "AWSEmail": "str",
+}
+# How deep default selections follow object fields below the root field's type
+MAX_SELECTION_DEPTH = 3
+LINE_WIDTH = 120
+_NESTED_RESOLVER = re.compile(
+    r'resource\s+"aws_appsync_resolver"[^{]*\{[^}]*?\btype\s*=\s*"(\w+)"\s*\n\s*field\s*=\s*"(\w+)"'
+)
+
+_TOKEN = re.compile(
+    r'(?P<skip>[\s,﻿]+|#[^\n]*)'
+    r'|(?P<block>"""(?:\\"""|[^"]|"(?!""))*""")'
+    r'|(?P<string>"(?:\\.|[^"\\])*")'
+    r'|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)'
+    r'|(?P<name>[_A-Za-z][_0-9A-Za-z]*)'
+    r'|(?P<punct>[!$&():=@\[\]{}|])'
+)
+
+
+class SchemaSyntaxError(ValueError):
+    pass
+
+
+@dataclass
+class TypeRef:
+    name: str
+    non_null: bool = False
+    # Set for list types; `name` is then unused
+    of: "TypeRef | None" = None
+
+    def __str__(self) -> str:
+        inner = f"[{self.of}]" if self.of is not None else self.name
+        return inner + ("!" if self.non_null else "")
+
+    @property
+    def named(self) -> str:
+        return self.of.named if self.of is not None else self.name
+
+
+@dataclass
+class Argument:
+    name: str
+    type: TypeRef
+
+
+@dataclass
+class Field:
+    name: str
+    type: TypeRef
+    arguments: list[Argument] = field(default_factory=list)
+    directives: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Definition:
+    kind: str
+    name: str
+    fields: list[Field] = field(default_factory=list)
+    values: list[str] = field(default_factory=list)
+    directives: list[str] = field(default_factory=list)
+
+
+class _Parser:
+    def __init__(self, source: str):
+        self.tokens = []
+        position = 0
+        while position < len(source):
+            match = _TOKEN.match(source, position)
+            if match is None:
+                raise SchemaSyntaxError(f"Unexpected character {source[position]!r} at {position}")
+            position = match.end()
+            if match.lastgroup not in ("skip", "block", "string"):
+                self.tokens.append((match.lastgroup, match.group()))
+        self.index = 0
+
+    def peek(self, value: str | None = None) -> bool:
+        return self.index < len(self.tokens) and (value is None or self.tokens[self.index][1] == value)
+
+    def take(self, value: str | None = None, kind: str | None = None) -> str:
+        if self.index >= len(self.tokens):
+            raise SchemaSyntaxError(f"Expected {value or kind}, found end of schema")
+        token_kind, token_value = self.tokens[self.index]
+        if (value is not None and token_value != value) or (kind is not None and token_kind != kind):
+            raise SchemaSyntaxError(f"Expected {value or kind}, found {token_value!r}")
+        self.index += 1
+        return token_value
+
+    def definitions(self) -> dict[str, Definition]:
+        definitions: dict[str, Definition] = {}
+        while self.peek():
+            kind = self.take(kind="name")
+            if kind == "schema":
+                self.directives()
+                self.skip_block()
+                continue
+            name = self.take(kind="name")
+            definition = Definition(kind, name)
+            if kind in ("type", "input", "interface"):
+                if self.peek("implements"):
+                    self.take("implements")
+                    while self.peek("&") or (self.peek() and self.tokens[self.index][0] == "name"):
+                        self.index += 1
+                definition.directives = self.directives()
+                definition.fields = self.fields()
+            elif kind == "enum":
+                definition.directives = self.directives()
+                self.take("{")
+                while not self.peek("}"):
+                    definition.values.append(self.take(kind="name"))
+                    self.directives()
+                self.take("}")
+            elif kind == "union":
+                definition.directives = self.directives()
+                self.take("=")
+                if self.peek("|"):
+                    self.take("|")
+                definition.values.append(self.take(kind="name"))
+                while self.peek("|"):
+                    self.take("|")
+                    definition.values.append(self.take(kind="name"))
+            elif kind == "scalar":
+                definition.directives = self.directives()
+            else:
+                raise SchemaSyntaxError(f"Unsupported definition {kind!r}")
+            definitions[name] = definition
+        return definitions
+
+    def fields(self) -> list[Field]:
+        fields = []
+        self.take("{")
+        while not self.peek("}"):
+            name = self.take(kind="name")
+            arguments = []
+            if self.peek("("):
+                self.take("(")
+                while not self.peek(")"):
+                    argument = self.take(kind="name")
+                    self.take(":")
+                    arguments.append(Argument(argument, self.type_ref()))
+                    if self.peek("="):
+                        self.take("=")
+                        self.value()
+                    self.directives()
+                self.take(")")
+            self.take(":")
+            fields.append(Field(name, self.type_ref(), arguments, self.directives()))
+        self.take("}")
+        return fields
+
+    def type_ref(self) -> TypeRef:
+        if self.peek("["):
+            self.take("[")
+            ref = TypeRef("", of=self.type_ref())
+            self.take("]")
+        else:
+            ref = TypeRef(self.take(kind="name"))
+        if self.peek("!"):
+            self.take("!")
+            ref.non_null = True
+        return ref
+
+    def directives(self) -> list[str]:
+        names = []
+        while self.peek("@"):
+            self.take("@")
+            names.append(self.take(kind="name"))
+            if self.peek("("):
+                self.skip_group("(", ")")
+        return names
+
+    def value(self) -> None:
+        if self.peek("["):
+            self.skip_group("[", "]")
+        elif self.peek("{"):
+            self.skip_group("{", "}")
+        else:
+            self.index += 1
+
+    def skip_block(self) -> None:
+        self.skip_group("{", "}")
+
+    def skip_group(self, opening: str, closing: str) -> None:
+        depth = 0
+        while True:
+            token = self.take()
+            depth += token == opening
+            depth -= token == closing
+            if depth == 0:
+                return
+
+
+def parse_schema(source: str) -> dict[str, Definition]:
+    return _Parser(source).definitions()
+
+
+def snake_case(name: str) -> str:
+    snake = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower()
+    return f"{snake}_" if keyword.iskeyword(snake) else snake
+
+
+def nested_resolvers(terraform: Path = TERRAFORM) -> set[tuple[str, str]]:
+    """(type, field) of every resolver Terraform attaches below the root types"""
+    found = set()
+    for path in sorted(terraform.glob("*.tf")):
+        for type_name, field_name in _NESTED_RESOLVER.findall(path.read_text(encoding="utf-8")):
+            if type_name not in ("Query", "Mutation", "Subscription"):
+                found.add((type_name, field_name))
+    return found
+
+
+class Generator:
+    def __init__(self, definitions: dict[str, Definition], skipped: set[tuple[str, str]] = frozenset()):
+        self.definitions = definitions
+        # Fields with a resolver of their own cost an invocation per page; callers select them explicitly
+        self.skipped = skipped
+
+    def python_type(self, ref: TypeRef, nullable: bool = True) -> str:
+        if ref.of is not None:
+            inner = f"list[{self.python_type(ref.of)}]"
+        else:
+            inner = SCALARS.get(ref.name, ref.name)
+        return inner if ref.non_null or not nullable else f"{inner} | None"
+
+    def is_leaf(self, name: str) -> bool:
+        definition = self.definitions.get(name)
+        return definition is None or definition.kind in ("scalar", "enum")
+
+    def selection(self, type_name: str, depth: int = 0, path: tuple[str, ...] = ()) -> str:
+        """Every leaf field of a type, following object fields MAX_SELECTION_DEPTH deep
+        except those with a resolver of their own"""
+        definition = self.definitions[type_name]
+        if definition.kind == "union":
+            members = [f"... on {member} {{ {self.selection(member, depth, path)} }}" for member in definition.values]
+            return " ".join(["__typename", *members])
+        parts = []
+        for item in definition.fields:
+            if any(argument.type.non_null for argument in item.arguments) or (type_name, item.name) in self.skipped:
+                continue
+            named = item.type.named
+            if self.is_leaf(named):
+                parts.append(item.name)
+            elif depth < MAX_SELECTION_DEPTH and named not in path:
+                inner = self.selection(named, depth + 1, (*path, type_name))
+                if inner:
+                    parts.append(f"{item.name} {{ {inner} }}")
+        return " ".join(parts)
+
+    def root_fields(self, type_name: str) -> list[Field]:
+        definition = self.definitions.get(type_name)
+        if definition is None:
+            return []
+        # IAM-only fields (publishChange) cannot be called with a user pool token
+        return [item for item in definition.fields
+                if not ("aws_iam" in item.directives and "aws_cognito_user_pools" not in item.directives)]
+
+    def connection_cursor(self, root: Field) -> str | None:
+        """The cursor field of a connection a root field pages through, if it does"""
+        definition = self.definitions.get(root.type.named)
+        if definition is None or definition.kind != "type" or "cursor" not in [a.name for a in root.arguments]:
+            return None
+        names = {item.name: item for item in definition.fields}
+        if "items" not in names or names["items"].type.of is None:
+            return None
+        return next((name for name in ("nextCursor", "cursor") if name in names), None)
+
+    def render(self) -> str:
+        lines = [
+            '"""Types and operations of the srnext BFF GraphQL API.',
+            "",
+            "Generated by `python -m bff_client.codegen` from terraform/schema.graphql;",
+            "do not edit this file, change the schema and run the generator again.",
+            '"""',
+            "",
+            "from __future__ import annotations",
+            "",
+            "from typing import AsyncIterator, Literal, Required, TypedDict, Union",
+            "",
+            "from .spec import FieldSpec",
+            "",
+        ]
+        enums = [d for d in self.definitions.values() if d.kind == "enum"]
+        objects = [d for d in self.definitions.values()
+                   if d.kind in ("type", "interface") and d.name not in ("Query", "Mutation", "Subscription")]
+        inputs = [d for d in self.definitions.values() if d.kind == "input"]
+        unions = [d for d in self.definitions.values() if d.kind == "union"]
+
+        lines.append("")
+        for enum in enums:
+            values = ", ".join(f'"{value}"' for value in enum.values)
+            lines.append(f"{enum.name} = Literal[{values}]")
+        for definition in inputs:
+            lines += ["", "", *self.typed_dict(definition, required=True)]
+        for definition in objects:
+            lines += ["", "", *self.typed_dict(definition, required=False)]
+        lines.append("")
+        for union in unions:
+            lines += ["", f"{union.name} = Union[{', '.join(union.values)}]"]
+
+        roots = [("query", item) for item in self.root_fields("Query")] + \
+                [("mutation", item) for item in self.root_fields("Mutation")]
+        lines += ["", "", "FIELDS: dict[str, FieldSpec] = {"]
+        for operation, root in roots:
+            arguments = ", ".join(f'"{argument.name}": "{argument.type}"' for argument in root.arguments)
+            selection = "" if self.is_leaf(root.type.named) else self.selection(root.type.named)
+            cursor = self.connection_cursor(root)
+            lines.append(f'    "{root.name}": FieldSpec(')
+            lines.append(f'        "{root.name}", "{operation}", {{{arguments}}},')
+            lines.append(f'        "{selection}",')
+            if cursor is not None:
+                lines.append(f'        cursor="{cursor}",')
+            lines.append("    ),")
+        lines.append("}")
+
+        lines += [
+            "",
+            "",
+            "class Operations:",
+            '    """One typed method per Query and Mutation field. `fields` replaces the',
+            "    default selection set (every field, a few levels deep) with your own,",
+            '    e.g. "items { workOrderId status } nextCursor"."""',
+            "",
+            "    async def _call(self, spec: FieldSpec, arguments: dict, fields: str | None):",
+            "        raise NotImplementedError",
+            "",
+            "    def _iterate(self, spec: FieldSpec, arguments: dict, fields: str | None) -> AsyncIterator:",
+            "        raise NotImplementedError",
+        ]
+        for operation, root in roots:
+            lines += ["", *self.method(root, operation)]
+            if self.connection_cursor(root) is not None:
+                lines += ["", *self.iterate_method(root)]
+        return "\n".join(lines) + "\n"
+
+    def typed_dict(self, definition: Definition, required: bool) -> list[str]:
+        fields = []
+        for item in definition.fields:
+            annotation = self.python_type(item.type)
+            if required and item.type.non_null:
+                annotation = f"Required[{annotation}]"
+            fields.append((item.name, annotation))
+        if any(keyword.iskeyword(name) for name, _ in fields):
+            # Evaluated at import time, so the annotations are quoted as forward references
+            entries = [f'    "{name}": "{annotation}",' for name, annotation in fields]
+            return [f'{definition.name} = TypedDict("{definition.name}", {{', *entries, "}, total=False)"]
+        return [f"class {definition.name}(TypedDict, total=False):", *(f"    {name}: {annotation}" for name, annotation in fields)]
+
+    def parameters(self, root: Field, skip: tuple[str, ...] = ()) -> tuple[list[str], list[str]]:
+        """The method's keyword parameters and the entries mapping them to GraphQL arguments"""
+        arguments = [argument for argument in root.arguments if argument.name not in skip]
+        # Required arguments first, so they read as such in signatures
+        ordered = sorted(arguments, key=lambda argument: not argument.type.non_null)
+        parameters = ["self", "*"]
+        for argument in ordered:
+            default = "" if argument.type.non_null else " = None"
+            parameters.append(f"{snake_case(argument.name)}: {self.python_type(argument.type)}{default}")
+        parameters.append("fields: str | None = None")
+        return parameters, [f'"{argument.name}": {snake_case(argument.name)}' for argument in arguments]
+
+    def method(self, root: Field, operation: str) -> list[str]:
+        parameters, entries = self.parameters(root)
+        return [
+            *self.signature(f"async def {snake_case(root.name)}", parameters, self.python_type(root.type)),
+            f'        """{operation.capitalize()} {root.name}: {root.type}"""',
+            *self.call(f'return await self._call(FIELDS["{root.name}"], ', entries),
+        ]
+
+    def iterate_method(self, root: Field) -> list[str]:
+        parameters, entries = self.parameters(root, skip=("cursor",))
+        items = self.definitions[root.type.named].fields
+        item_type = next(item for item in items if item.name == "items").type.named
+        return [
+            *self.signature(f"def iter_{snake_case(root.name)}", parameters, f"AsyncIterator[{item_type}]"),
+            f'        """Every item of {root.name}, page by page; `fields` selects within items"""',
+            *self.call(f'return self._iterate(FIELDS["{root.name}"], ', entries),
+        ]
+
+    @staticmethod
+    def signature(head: str, parameters: list[str], returns: str) -> list[str]:
+        line = f"    {head}({', '.join(parameters)}) -> {returns}:"
+        if len(line) <= LINE_WIDTH:
+            return [line]
+        return [f"    {head}(", *(f"        {parameter}," for parameter in parameters), f"    ) -> {returns}:"]
+
+    @staticmethod
+    def call(head: str, entries: list[str]) -> list[str]:
+        line = f"        {head}{{{', '.join(entries)}}}, fields)"
+        if len(line) <= LINE_WIDTH:
+            return [line]
+        return [f"        {head}{{", *(f"            {entry}," for entry in entries), "        }, fields)"]
+
+
+def generate(schema: Path = SCHEMA, terraform: Path = TERRAFORM) -> str:
+    return Generator(parse_schema(schema.read_text(encoding="utf-8")), nested_resolvers(terraform)).render()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bff_client.codegen", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--schema", type=Path, default=SCHEMA, help="GraphQL schema to read")
+    parser.add_argument("--output", type=Path, default=OUTPUT, help="module to write")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the module is out of date instead of writing it")
+    args = parser.parse_args(argv)
+
+    source = generate(args.schema)
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current != source:
+            print(f"{args.output} is out of date; run python -m bff_client.codegen", file=sys.stderr)
+            return 1
+        return 0
+    args.output.write_text(source, encoding="utf-8")
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Pooled keep-alive HTTP/1.1 client on asyncio streams.
+
+Enough HTTP for posting GraphQL requests at a target rate: persistent
+connections reused across requests, a cap on open connections, TLS for real
+endpoints, Content-Length and chunked responses. Standard library only, so
+the client and the load generator run wherever Python does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class HttpPool:
+    """Keep-alive connections to one origin, at most `max_connections` open."""
+
+    def __init__(self, url: str, max_connections: int = 64, timeout: float = 30.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme in {url!r}")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path += f"?{parts.query}"
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.timeout = timeout
+        self._idle: list[_Connection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self.connections_opened = 0
+
+    async def post_json(self, body: object, headers: dict[str, str] | None = None, path: str | None = None) -> HttpResponse:
+        payload = json.dumps(body).encode()
+        request_headers = {"Content-Type": "application/json", **(headers or {})}
+        return await self.request("POST", path or self.path, payload, request_headers)
+
+    async def request(self, method: str, path: str, body: bytes = b"", headers: dict[str, str] | None = None) -> HttpResponse:
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        head += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        message = ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+        async with self._slots:
+            # A pooled connection may have been closed by the server while idle;
+            # retry once on a fresh one in that case
+            for attempt in range(2):
+                reused = bool(self._idle)
+                connection = self._idle.pop() if reused else await self._open()
+                try:
+                    response, keep_alive = await asyncio.wait_for(self._exchange(connection, message), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError) as error:
+                    connection.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise ConnectionError(f"{method} {path} failed: {error}") from error
+                except BaseException:
+                    connection.close()
+                    raise
+                if keep_alive:
+                    self._idle.append(connection)
+                else:
+                    connection.close()
+                return response
+        raise ConnectionError(f"{method} {path} failed")
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    async def __aenter__(self) -> "HttpPool":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _open(self) -> _Connection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout
+        )
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    @staticmethod
+    async def _exchange(connection: _Connection, message: bytes) -> tuple[HttpResponse, bool]:
+        connection.writer.write(message)
+        await connection.writer.drain()
+
+        reader = connection.reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed")
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+        headers: dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            headers["connection"] = "close"
+
+        connection_header = headers.get("connection", "").lower()
+        keep_alive = connection_header != "close" and (version != "HTTP/1.0" or connection_header == "keep-alive")
+        return HttpResponse(int(status), headers, body), keep_alive
@@ -0,0 +1,1884 @@
+"""Types and operations of the srnext BFF GraphQL API.
+
+Generated by `python -m bff_client.codegen` from terraform/schema.graphql;
+do not edit this file, change the schema and run the generator again.
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Literal, Required, TypedDict, Union
+
+from .spec import FieldSpec
+
+
+UnitDetailSection = Literal["unit", "location", "workOrders", "parts", "events"]
+AccountStatus = Literal["active", "suspended", "pending"]
+ContactStatus = Literal["active", "inactive"]
+EventCategory = Literal["maintenance", "fault", "certification", "error_report", "inspection", "accident", "violation", "fuel", "driver_report", "other"]
+EventSeverity = Literal["low", "medium", "high", "critical"]
+EventPriority = Literal["low", "medium", "high", "critical"]
+EventStatus = Literal["created", "acknowledged", "in_progress", "resolved", "closed", "cancelled", "on_hold", "escalated"]
+SourceSystem = Literal["telematics", "driver_app", "maintenance_system", "inspection_app", "manual_entry", "eld", "diagnostic_tool", "external_api", "other"]
+EventExportStatus = Literal["RUNNING", "COMPLETED", "FAILED"]
+PartCondition = Literal["new", "used", "refurbished", "damaged", "unknown"]
+PartStatus = Literal["available", "installed", "reserved", "maintenance", "disposed"]
+TaskStatus = Literal["pending", "inProgress", "completed"]
+WorkOrderStatus = Literal["draft", "pending", "inProgress", "completed"]
+ChangeEntity = Literal["WorkOrder", "Event", "Task"]
+ChangeOperation = Literal["CREATED", "UPDATED", "DELETED"]
+
+
+class CreateUnitInput(TypedDict, total=False):
+    locationId: Required[str]
+    suggestedVin: Required[str]
+    unitType: str | None
+    errorCode: str | None
+    possibleValues: str | None
+    additionalErrorText: str | None
+    errorText: str | None
+    vehicleDescriptor: str | None
+    destinationMarket: str | None
+    make: str | None
+    manufacturerName: str | None
+    model: str | None
+    modelYear: str | None
+    plantCity: str | None
+    series: str | None
+    trim: str | None
+    vehicleType: str | None
+    plantCountry: str | None
+    plantCompanyName: str | None
+    plantState: str | None
+    trim2: str | None
+    series2: str | None
+    note: str | None
+    basePrice: str | None
+    nonLandUse: str | None
+    bodyClass: str | None
+    doors: str | None
+    windows: str | None
+    wheelBaseType: str | None
+    trackWidthInches: str | None
+    grossVehicleWeightRatingFrom: str | None
+    bedLengthInches: str | None
+    curbWeightPounds: str | None
+    wheelBaseInchesFrom: str | None
+    wheelBaseInchesTo: str | None
+    grossCombinationWeightRatingFrom: str | None
+    grossCombinationWeightRatingTo: str | None
+    grossVehicleWeightRatingTo: str | None
+    bedType: str | None
+    cabType: str | None
+    trailerTypeConnection: str | None
+    trailerBodyType: str | None
+    trailerLengthFeet: str | None
+    otherTrailerInfo: str | None
+    numberOfWheels: str | None
+    wheelSizeFrontInches: str | None
+    wheelSizeRearInches: str | None
+    engineNumberOfCylinders: str | None
+    displacementCc: str | None
+    displacementCi: str | None
+    displacementL: str | None
+    fuelTypePrimary: str | None
+    engineBrakeHpFrom: str | None
+    engineBrakeHpTo: str | None
+    seatBeltType: str | None
+    otherRestraintSystemInfo: str | None
+    frontAirBagLocations: str | None
+    busType: str | None
+    busFloorConfigurationType: str | None
+    motorcycleChassisType: str | None
+    motorcycleSuspensionType: str | None
+    customMotorcycleType: str | None
+    extendedAttributes: list[ExtendedAttributeInput] | None
+    acesAttributes: list[AcesAttributeInput] | None
+
+
+class UpdateUnitInput(TypedDict, total=False):
+    locationId: str | None
+    suggestedVin: str | None
+    unitType: str | None
+    errorCode: str | None
+    possibleValues: str | None
+    additionalErrorText: str | None
+    errorText: str | None
+    vehicleDescriptor: str | None
+    destinationMarket: str | None
+    make: str | None
+    manufacturerName: str | None
+    model: str | None
+    modelYear: str | None
+    plantCity: str | None
+    series: str | None
+    trim: str | None
+    vehicleType: str | None
+    plantCountry: str | None
+    plantCompanyName: str | None
+    plantState: str | None
+    trim2: str | None
+    series2: str | None
+    note: str | None
+    basePrice: str | None
+    nonLandUse: str | None
+    bodyClass: str | None
+    doors: str | None
+    windows: str | None
+    wheelBaseType: str | None
+    trackWidthInches: str | None
+    grossVehicleWeightRatingFrom: str | None
+    bedLengthInches: str | None
+    curbWeightPounds: str | None
+    wheelBaseInchesFrom: str | None
+    wheelBaseInchesTo: str | None
+    grossCombinationWeightRatingFrom: str | None
+    grossCombinationWeightRatingTo: str | None
+    grossVehicleWeightRatingTo: str | None
+    bedType: str | None
+    cabType: str | None
+    trailerTypeConnection: str | None
+    trailerBodyType: str | None
+    trailerLengthFeet: str | None
+    otherTrailerInfo: str | None
+    numberOfWheels: str | None
+    wheelSizeFrontInches: str | None
+    wheelSizeRearInches: str | None
+    engineNumberOfCylinders: str | None
+    displacementCc: str | None
+    displacementCi: str | None
+    displacementL: str | None
+    fuelTypePrimary: str | None
+    engineBrakeHpFrom: str | None
+    engineBrakeHpTo: str | None
+    seatBeltType: str | None
+    otherRestraintSystemInfo: str | None
+    frontAirBagLocations: str | None
+    busType: str | None
+    busFloorConfigurationType: str | None
+    motorcycleChassisType: str | None
+    motorcycleSuspensionType: str | None
+    customMotorcycleType: str | None
+    extendedAttributes: list[ExtendedAttributeInput] | None
+    acesAttributes: list[AcesAttributeInput] | None
+
+
+class ExtendedAttributeInput(TypedDict, total=False):
+    attributeName: Required[str]
+    attributeValue: Required[str]
+
+
+class AcesAttributeInput(TypedDict, total=False):
+    attributeName: Required[str]
+    attributeValue: Required[str]
+    attributeKey: Required[str]
+
+
+class CreateAccountInput(TypedDict, total=False):
+    id: str | None
+    name: Required[str]
+    status: Required[AccountStatus]
+    billingContactId: str | None
+    billingLocationId: str | None
+    extendedAttributes: list[ExtendedAttributeInput] | None
+
+
+class UpdateAccountInput(TypedDict, total=False):
+    name: str | None
+    status: AccountStatus | None
+    billingContactId: str | None
+    billingLocationId: str | None
+    extendedAttributes: list[ExtendedAttributeInput] | None
+
+
+class CreateContactInput(TypedDict, total=False):
+    email: Required[str]
+    firstName: str | None
+    lastName: str | None
+    phone: str | None
+    status: ContactStatus | None
+    locationIds: list[str] | None
+    config: str | None
+
+
+class UpdateContactInput(TypedDict, total=False):
+    firstName: str | None
+    lastName: str | None
+    phone: str | None
+    status: ContactStatus | None
+    locationIds: list[str] | None
+    config: str | None
+
+
+EventExportInput = TypedDict("EventExportInput", {
+    "from": "Required[str]",
+    "to": "Required[str]",
+    "unitId": "str | None",
+    "eventCategory": "EventCategory | None",
+    "status": "EventStatus | None",
+    "severity": "EventSeverity | None",
+    "priority": "EventPriority | None",
+    "sourceSystem": "SourceSystem | None",
+}, total=False)
+
+
+class CreateEventInput(TypedDict, total=False):
+    accountId: Required[str]
+    unitId: Required[str]
+    eventType: Required[str]
+    eventCategory: Required[EventCategory]
+    severity: EventSeverity | None
+    priority: EventPriority | None
+    description: str | None
+    summary: str | None
+    sourceSystem: SourceSystem | None
+    maintenanceDetails: MaintenanceDetailsInput | None
+    extendedAttributes: str | None
+
+
+class UpdateEventInput(TypedDict, total=False):
+    eventType: str | None
+    eventCategory: EventCategory | None
+    severity: EventSeverity | None
+    priority: EventPriority | None
+    description: str | None
+    summary: str | None
+    sourceSystem: SourceSystem | None
+    maintenanceDetails: MaintenanceDetailsInput | None
+    status: EventStatus | None
+    extendedAttributes: str | None
+
+
+class MaintenanceDetailsInput(TypedDict, total=False):
+    actionType: str | None
+    description: str | None
+    cost: float | None
+    partNumbers: list[str] | None
+    laborHours: float | None
+    scheduledAt: str | None
+    completedAt: str | None
+    nextDueAt: str | None
+    components: list[MaintenanceComponentInput] | None
+
+
+class MaintenanceComponentInput(TypedDict, total=False):
+    name: Required[str]
+    action: Required[str]
+    notes: str | None
+
+
+class CreateLaborLineInput(TypedDict, total=False):
+    laborLineId: str | None
+    taskId: Required[str]
+    partId: list[str] | None
+    notes: list[str] | None
+    description: str | None
+
+
+class UpdateLaborLineInput(TypedDict, total=False):
+    taskId: str | None
+    partId: list[str] | None
+    notes: list[str] | None
+    description: str | None
+
+
+class CreateLocationInput(TypedDict, total=False):
+    accountId: Required[str]
+    locationType: Required[str]
+    address: AddressInput | None
+    coordinates: CoordinatesInput | None
+    extendedAttributes: str | None
+
+
+class UpdateLocationInput(TypedDict, total=False):
+    accountId: str | None
+    locationType: str | None
+    address: AddressInput | None
+    coordinates: CoordinatesInput | None
+    extendedAttributes: str | None
+
+
+class AddressInput(TypedDict, total=False):
+    streetAddress: Required[str]
+    streetAddress2: str | None
+    city: Required[str]
+    stateProvince: str | None
+    postalCode: Required[str]
+    country: Required[str]
+
+
+class CoordinatesInput(TypedDict, total=False):
+    latitude: Required[float]
+    longitude: Required[float]
+    altitude: float | None
+    accuracy: float | None
+
+
+class CreatePartInput(TypedDict, total=False):
+    partNumber: Required[str]
+    description: Required[str]
+    manufacturer: Required[str]
+    category: Required[str]
+    subcategory: str | None
+    unitId: str | None
+    locationId: str | None
+    condition: Required[PartCondition]
+    status: Required[PartStatus]
+    quantity: Required[int]
+    serialNumber: str | None
+    batchNumber: str | None
+    installDate: int | None
+    purchaseDate: int | None
+    warrantyExpiration: int | None
+    vendor: str | None
+    weight: float | None
+    dimensions: DimensionsInput | None
+    specifications: str | None
+    extendedAttributes: str | None
+    tags: list[str] | None
+    notes: str | None
+
+
+class UpdatePartInput(TypedDict, total=False):
+    partNumber: str | None
+    description: str | None
+    manufacturer: str | None
+    category: str | None
+    subcategory: str | None
+    unitId: str | None
+    locationId: str | None
+    condition: PartCondition | None
+    status: PartStatus | None
+    quantity: int | None
+    serialNumber: str | None
+    batchNumber: str | None
+    installDate: int | None
+    purchaseDate: int | None
+    warrantyExpiration: int | None
+    vendor: str | None
+    weight: float | None
+    dimensions: DimensionsInput | None
+    specifications: str | None
+    extendedAttributes: str | None
+    tags: list[str] | None
+    notes: str | None
+
+
+class DimensionsInput(TypedDict, total=False):
+    length: float | None
+    width: float | None
+    height: float | None
+
+
+class CreateTaskInput(TypedDict, total=False):
+    workOrderId: Required[str]
+    contactId: Required[str]
+    locationId: Required[str]
+    laborlinesId: list[str] | None
+    description: str | None
+    notes: list[str] | None
+    status: TaskStatus | None
+    estimateHours: float | None
+    actualHours: float | None
+    startDate: int | None
+    endDate: int | None
+
+
+class UpdateTaskInput(TypedDict, total=False):
+    contactId: str | None
+    locationId: str | None
+    laborlinesId: list[str] | None
+    description: str | None
+    notes: list[str] | None
+    status: TaskStatus | None
+    estimateHours: float | None
+    actualHours: float | None
+    startDate: int | None
+    endDate: int | None
+
+
+class CreateWorkOrderInput(TypedDict, total=False):
+    contactId: Required[str]
+    unitId: Required[str]
+    status: Required[WorkOrderStatus]
+    description: Required[str]
+    notes: list[str] | None
+
+
+class UpdateWorkOrderInput(TypedDict, total=False):
+    contactId: str | None
+    unitId: str | None
+    status: WorkOrderStatus | None
+    description: str | None
+    notes: list[str] | None
+
+
+class WorkOrderUpdateItem(TypedDict, total=False):
+    workOrderId: Required[str]
+    input: Required[UpdateWorkOrderInput]
+
+
+class ChangeInput(TypedDict, total=False):
+    entity: Required[ChangeEntity]
+    operation: Required[ChangeOperation]
+    accountId: Required[str]
+    id: Required[str]
+    unitId: str | None
+    workOrderId: str | None
+    status: str | None
+    statusChanged: Required[bool]
+    changes: str | None
+    changedAt: Required[int]
+
+
+class HelloResponse(TypedDict, total=False):
+    message: str
+
+
+class Unit(TypedDict, total=False):
+    id: str
+    accountId: str
+    locationId: str
+    unitType: str | None
+    suggestedVin: str
+    errorCode: str | None
+    possibleValues: str | None
+    additionalErrorText: str | None
+    errorText: str | None
+    vehicleDescriptor: str | None
+    destinationMarket: str | None
+    make: str | None
+    manufacturerName: str | None
+    model: str | None
+    modelYear: str | None
+    plantCity: str | None
+    series: str | None
+    trim: str | None
+    vehicleType: str | None
+    plantCountry: str | None
+    plantCompanyName: str | None
+    plantState: str | None
+    trim2: str | None
+    series2: str | None
+    note: str | None
+    basePrice: str | None
+    nonLandUse: str | None
+    bodyClass: str | None
+    doors: str | None
+    windows: str | None
+    wheelBaseType: str | None
+    trackWidthInches: str | None
+    grossVehicleWeightRatingFrom: str | None
+    bedLengthInches: str | None
+    curbWeightPounds: str | None
+    wheelBaseInchesFrom: str | None
+    wheelBaseInchesTo: str | None
+    grossCombinationWeightRatingFrom: str | None
+    grossCombinationWeightRatingTo: str | None
+    grossVehicleWeightRatingTo: str | None
+    bedType: str | None
+    cabType: str | None
+    trailerTypeConnection: str | None
+    trailerBodyType: str | None
+    trailerLengthFeet: str | None
+    otherTrailerInfo: str | None
+    numberOfWheels: str | None
+    wheelSizeFrontInches: str | None
+    wheelSizeRearInches: str | None
+    engineNumberOfCylinders: str | None
+    displacementCc: str | None
+    displacementCi: str | None
+    displacementL: str | None
+    fuelTypePrimary: str | None
+    engineBrakeHpFrom: str | None
+    engineBrakeHpTo: str | None
+    seatBeltType: str | None
+    otherRestraintSystemInfo: str | None
+    frontAirBagLocations: str | None
+    busType: str | None
+    busFloorConfigurationType: str | None
+    motorcycleChassisType: str | None
+    motorcycleSuspensionType: str | None
+    customMotorcycleType: str | None
+    createdAt: int
+    updatedAt: int
+    deletedAt: int
+    extendedAttributes: list[ExtendedAttribute] | None
+    acesAttributes: list[AcesAttribute] | None
+
+
+class ExtendedAttribute(TypedDict, total=False):
+    attributeName: str
+    attributeValue: str
+
+
+class AcesAttribute(TypedDict, total=False):
+    attributeName: str
+    attributeValue: str
+    attributeKey: str
+
+
+class UnitsConnection(TypedDict, total=False):
+    items: list[Unit]
+    cursor: str | None
+    hasMore: bool | None
+
+
+class UnitDetail(TypedDict, total=False):
+    unit: Unit | None
+    location: Location | None
+    workOrders: UnitDetailWorkOrders | None
+    parts: UnitDetailParts | None
+    events: UnitDetailEvents | None
+    errors: list[UnitDetailSectionError]
+
+
+class UnitDetailWorkOrders(TypedDict, total=False):
+    items: list[WorkOrder]
+    nextCursor: str | None
+
+
+class UnitDetailParts(TypedDict, total=False):
+    items: list[Part]
+    nextCursor: str | None
+
+
+class UnitDetailEvents(TypedDict, total=False):
+    items: list[Event]
+    nextCursor: str | None
+
+
+class UnitDetailSectionError(TypedDict, total=False):
+    section: UnitDetailSection
+    message: str
+    errorType: str
+
+
+class UnitWithWorkOrders(TypedDict, total=False):
+    id: str
+    accountId: str
+    locationId: str
+    unitType: str | None
+    suggestedVin: str
+    errorCode: str | None
+    possibleValues: str | None
+    additionalErrorText: str | None
+    errorText: str | None
+    vehicleDescriptor: str | None
+    destinationMarket: str | None
+    make: str | None
+    manufacturerName: str | None
+    model: str | None
+    modelYear: str | None
+    plantCity: str | None
+    series: str | None
+    trim: str | None
+    vehicleType: str | None
+    plantCountry: str | None
+    plantCompanyName: str | None
+    plantState: str | None
+    trim2: str | None
+    series2: str | None
+    note: str | None
+    basePrice: str | None
+    nonLandUse: str | None
+    bodyClass: str | None
+    doors: str | None
+    windows: str | None
+    wheelBaseType: str | None
+    trackWidthInches: str | None
+    grossVehicleWeightRatingFrom: str | None
+    bedLengthInches: str | None
+    curbWeightPounds: str | None
+    wheelBaseInchesFrom: str | None
+    wheelBaseInchesTo: str | None
+    grossCombinationWeightRatingFrom: str | None
+    grossCombinationWeightRatingTo: str | None
+    grossVehicleWeightRatingTo: str | None
+    bedType: str | None
+    cabType: str | None
+    trailerTypeConnection: str | None
+    trailerBodyType: str | None
+    trailerLengthFeet: str | None
+    otherTrailerInfo: str | None
+    numberOfWheels: str | None
+    wheelSizeFrontInches: str | None
+    wheelSizeRearInches: str | None
+    engineNumberOfCylinders: str | None
+    displacementCc: str | None
+    displacementCi: str | None
+    displacementL: str | None
+    fuelTypePrimary: str | None
+    engineBrakeHpFrom: str | None
+    engineBrakeHpTo: str | None
+    seatBeltType: str | None
+    otherRestraintSystemInfo: str | None
+    frontAirBagLocations: str | None
+    busType: str | None
+    busFloorConfigurationType: str | None
+    motorcycleChassisType: str | None
+    motorcycleSuspensionType: str | None
+    customMotorcycleType: str | None
+    createdAt: int
+    updatedAt: int
+    deletedAt: int
+    extendedAttributes: list[ExtendedAttribute] | None
+    acesAttributes: list[AcesAttribute] | None
+    workOrders: list[WorkOrder]
+    workOrdersError: str | None
+
+
+class UnitsWithWorkOrdersConnection(TypedDict, total=False):
+    items: list[UnitWithWorkOrders]
+    cursor: str | None
+    hasMore: bool | None
+
+
+class DeleteUnitResponse(TypedDict, total=False):
+    success: bool
+    id: str
+    message: str | None
+
+
+class Account(TypedDict, total=False):
+    id: str
+    name: str
+    status: AccountStatus
+    createdAt: int
+    updatedAt: int
+    billingContactId: str | None
+    billingLocationId: str | None
+    extendedAttributes: list[ExtendedAttribute] | None
+
+
+class AccountsConnection(TypedDict, total=False):
+    items: list[Account]
+    nextCursor: str | None
+    hasMore: bool
+
+
+class DeleteAccountResponse(TypedDict, total=False):
+    success: bool
+    id: str
+    message: str | None
+
+
+class Contact(TypedDict, total=False):
+    accountId: str
+    contactId: str
+    email: str
+    firstName: str | None
+    lastName: str | None
+    phone: str | None
+    status: ContactStatus | None
+    locationIds: list[str] | None
+    config: str | None
+    createdAt: int
+    updatedAt: int
+    deletedAt: int | None
+
+
+class ContactsConnection(TypedDict, total=False):
+    items: list[Contact]
+    nextCursor: str | None
+    limit: int
+
+
+class Event(TypedDict, total=False):
+    accountId: str
+    eventId: str
+    unitId: str
+    eventType: str
+    eventCategory: EventCategory
+    severity: EventSeverity | None
+    priority: EventPriority | None
+    description: str | None
+    summary: str | None
+    sourceSystem: SourceSystem | None
+    maintenanceDetails: MaintenanceDetails | None
+    status: EventStatus
+    createdAt: int
+    updatedAt: int | None
+    acknowledgedAt: int | None
+    deletedAt: int | None
+    extendedAttributes: str | None
+
+
+class MaintenanceDetails(TypedDict, total=False):
+    actionType: str | None
+    description: str | None
+    cost: float | None
+    partNumbers: list[str] | None
+    laborHours: float | None
+    scheduledAt: str | None
+    completedAt: str | None
+    nextDueAt: str | None
+    components: list[MaintenanceComponent] | None
+
+
+class MaintenanceComponent(TypedDict, total=False):
+    name: str
+    action: str
+    notes: str | None
+
+
+class EventsConnection(TypedDict, total=False):
+    items: list[Event]
+    nextCursor: str | None
+    limit: int
+    count: int
+
+
+class EventWithUnitInfo(TypedDict, total=False):
+    accountId: str
+    eventId: str
+    unitId: str
+    eventType: str
+    eventCategory: EventCategory
+    severity: EventSeverity | None
+    priority: EventPriority | None
+    description: str | None
+    summary: str | None
+    sourceSystem: SourceSystem | None
+    maintenanceDetails: MaintenanceDetails | None
+    status: EventStatus
+    createdAt: int
+    updatedAt: int | None
+    acknowledgedAt: int | None
+    deletedAt: int | None
+    extendedAttributes: str | None
+    unitInfo: UnitInfo
+    unit: Unit | None
+
+
+class UnitInfo(TypedDict, total=False):
+    model: str | None
+    modelYear: str | None
+    suggestedVin: str
+
+
+class EventsByStatusConnection(TypedDict, total=False):
+    items: list[EventWithUnitInfo]
+    nextCursor: str | None
+    limit: int
+    count: int
+
+
+class DeleteEventResponse(TypedDict, total=False):
+    success: bool
+    accountId: str
+    eventId: str
+    message: str | None
+
+
+EventExport = TypedDict("EventExport", {
+    "exportId": "str",
+    "accountId": "str",
+    "status": "EventExportStatus",
+    "from": "str",
+    "to": "str",
+    "count": "int | None",
+    "url": "str | None",
+    "error": "str | None",
+    "startedAt": "int",
+    "completedAt": "int | None",
+}, total=False)
+
+
+class LaborLine(TypedDict, total=False):
+    laborLineId: str
+    accountId: str
+    taskId: str
+    partId: list[str] | None
+    notes: list[str] | None
+    description: str | None
+
+
+class LaborLineConnection(TypedDict, total=False):
+    items: list[LaborLine]
+    nextCursor: str | None
+    hasMore: bool
+
+
+class DeleteLaborLineResponse(TypedDict, total=False):
+    success: bool
+    accountId: str
+    laborLineId: str
+    message: str | None
+
+
+class AddressLocation(TypedDict, total=False):
+    id: str | None
+    accountId: str
+    locationType: str
+    address: Address
+    extendedAttributes: str | None
+    createdAt: int | None
+    updatedAt: int | None
+    deletedAt: int | None
+
+
+class CoordinatesLocation(TypedDict, total=False):
+    id: str | None
+    accountId: str
+    locationType: str
+    coordinates: Coordinates
+    extendedAttributes: str | None
+    createdAt: int | None
+    updatedAt: int | None
+    deletedAt: int | None
+
+
+class Address(TypedDict, total=False):
+    streetAddress: str
+    streetAddress2: str | None
+    city: str
+    stateProvince: str | None
+    postalCode: str
+    country: str
+
+
+class Coordinates(TypedDict, total=False):
+    latitude: float
+    longitude: float
+    altitude: float | None
+    accuracy: float | None
+
+
+class LocationConnection(TypedDict, total=False):
+    items: list[Location]
+    nextCursor: str | None
+    limit: int
+    count: int
+
+
+class Part(TypedDict, total=False):
+    accountId: str
+    sortKey: str
+    partId: str
+    partNumber: str
+    description: str
+    manufacturer: str
+    category: str
+    subcategory: str | None
+    unitId: str | None
+    locationId: str | None
+    condition: PartCondition
+    status: PartStatus
+    quantity: int
+    serialNumber: str | None
+    batchNumber: str | None
+    installDate: int | None
+    purchaseDate: int | None
+    warrantyExpiration: int | None
+    vendor: str | None
+    weight: float | None
+    dimensions: Dimensions | None
+    specifications: str | None
+    extendedAttributes: str | None
+    tags: list[str] | None
+    notes: str | None
+    createdAt: int | None
+    updatedAt: int | None
+    deletedAt: int | None
+    location: Location | None
+
+
+class Dimensions(TypedDict, total=False):
+    length: float | None
+    width: float | None
+    height: float | None
+
+
+class PartConnection(TypedDict, total=False):
+    items: list[Part]
+    nextCursor: str | None
+    limit: int
+    count: int
+
+
+class Task(TypedDict, total=False):
+    taskId: str
+    accountId: str
+    workOrderId: str
+    contactId: str
+    locationId: str
+    laborlinesId: list[str]
+    description: str
+    notes: list[str]
+    status: TaskStatus
+    estimateHours: float | None
+    actualHours: float | None
+    startDate: int | None
+    endDate: int | None
+    createdAt: int
+    updatedAt: int
+    deletedAt: int | None
+
+
+class TaskConnection(TypedDict, total=False):
+    items: list[Task]
+    nextCursor: str | None
+    limit: int
+    count: int
+
+
+class WorkOrder(TypedDict, total=False):
+    workOrderId: str
+    accountId: str
+    contactId: str
+    unitId: str
+    status: WorkOrderStatus
+    description: str
+    notes: list[str]
+    createdAt: int
+    updatedAt: int
+    deletedAt: int | None
+    unit: Unit | None
+
+
+class WorkOrderConnection(TypedDict, total=False):
+    items: list[WorkOrder]
+    nextCursor: str | None
+    pageSize: int
+    count: int
+
+
+class BulkItemError(TypedDict, total=False):
+    message: str
+    errorType: str
+
+
+class WorkOrderBulkResult(TypedDict, total=False):
+    index: int
+    workOrder: WorkOrder | None
+    error: BulkItemError | None
+
+
+class PartBulkResult(TypedDict, total=False):
+    index: int
+    part: Part | None
+    error: BulkItemError | None
+
+
+class DeleteBulkResult(TypedDict, total=False):
+    index: int
+    id: str
+    deleted: bool
+    error: BulkItemError | None
+
+
+class Change(TypedDict, total=False):
+    entity: ChangeEntity
+    operation: ChangeOperation
+    accountId: str
+    id: str
+    unitId: str | None
+    workOrderId: str | None
+    status: str | None
+    statusChanged: bool
+    changes: str | None
+    changedAt: int
+
+
+Location = Union[AddressLocation, CoordinatesLocation]
+
+
+FIELDS: dict[str, FieldSpec] = {
+    "hello": FieldSpec(
+        "hello", "query", {},
+        "message",
+    ),
+    "getUnit": FieldSpec(
+        "getUnit", "query", {"id": "ID!"},
+        "id accountId locationId unitType suggestedVin errorCode possibleValues additionalErrorText errorText vehicleDescriptor destinationMarket make manufacturerName model modelYear plantCity series trim vehicleType plantCountry plantCompanyName plantState trim2 series2 note basePrice nonLandUse bodyClass doors windows wheelBaseType trackWidthInches grossVehicleWeightRatingFrom bedLengthInches curbWeightPounds wheelBaseInchesFrom wheelBaseInchesTo grossCombinationWeightRatingFrom grossCombinationWeightRatingTo grossVehicleWeightRatingTo bedType cabType trailerTypeConnection trailerBodyType trailerLengthFeet otherTrailerInfo numberOfWheels wheelSizeFrontInches wheelSizeRearInches engineNumberOfCylinders displacementCc displacementCi displacementL fuelTypePrimary engineBrakeHpFrom engineBrakeHpTo seatBeltType otherRestraintSystemInfo frontAirBagLocations busType busFloorConfigurationType motorcycleChassisType motorcycleSuspensionType customMotorcycleType createdAt updatedAt deletedAt extendedAttributes { attributeName attributeValue } acesAttributes { attributeName attributeValue attributeKey }",
+    ),
+    "listUnits": FieldSpec(
+        "listUnits", "query", {"cursor": "String", "limit": "Int"},
+        "items { id accountId locationId unitType suggestedVin errorCode possibleValues additionalErrorText errorText vehicleDescriptor destinationMarket make manufacturerName model modelYear plantCity series trim vehicleType plantCountry plantCompanyName plantState trim2 series2 note basePrice nonLandUse bodyClass doors windows wheelBaseType trackWidthInches grossVehicleWeightRatingFrom bedLengthInches curbWeightPounds wheelBaseInchesFrom wheelBaseInchesTo grossCombinationWeightRatingFrom grossCombinationWeightRatingTo grossVehicleWeightRatingTo bedType cabType trailerTypeConnection trailerBodyType trailerLengthFeet otherTrailerInfo numberOfWheels wheelSizeFrontInches wheelSizeRearInches engineNumberOfCylinders displacementCc displacementCi displacementL fuelTypePrimary engineBrakeHpFrom engineBrakeHpTo seatBeltType otherRestraintSystemInfo frontAirBagLocations busType busFloorConfigurationType motorcycleChassisType motorcycleSuspensionType customMotorcycleType createdAt updatedAt deletedAt extendedAttributes { attributeName attributeValue } acesAttributes { attributeName attributeValue attributeKey } } cursor hasMore",
+        cursor="cursor",
+    ),
+    "getUnitWithWorkOrders": FieldSpec(
+        "getUnitWithWorkOrders", "query", {"cursor": "String", "limit": "Int"},
+        "items { id accountId locationId unitType suggestedVin errorCode possibleValues additionalErrorText errorText vehicleDescriptor destinationMarket make manufacturerName model modelYear plantCity series trim vehicleType plantCountry plantCompanyName plantState trim2 series2 note basePrice nonLandUse bodyClass doors windows wheelBaseType trackWidthInches grossVehicleWeightRatingFrom bedLengthInches curbWeightPounds wheelBaseInchesFrom wheelBaseInchesTo grossCombinationWeightRatingFrom grossCombinationWeightRatingTo grossVehicleWeightRatingTo bedType cabType trailerTypeConnection trailerBodyType trailerLengthFeet otherTrailerInfo numberOfWheels wheelSizeFrontInches wheelSizeRearInches engineNumberOfCylinders displacementCc displacementCi displacementL fuelTypePrimary engineBrakeHpFrom engineBrakeHpTo seatBeltType otherRestraintSystemInfo frontAirBagLocations busType busFloorConfigurationType motorcycleChassisType motorcycleSuspensionType customMotorcycleType createdAt updatedAt deletedAt extendedAttributes { attributeName attributeValue } acesAttributes { attributeName attributeValue attributeKey } workOrders { workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt } workOrdersError } cursor hasMore",
+        cursor="cursor",
+    ),
+    "getUnitDetail": FieldSpec(
+        "getUnitDetail", "query", {"id": "ID!", "workOrdersLimit": "Int", "partsLimit": "Int", "eventsLimit": "Int"},
+        "unit { id accountId locationId unitType suggestedVin errorCode possibleValues additionalErrorText errorText vehicleDescriptor destinationMarket make manufacturerName model modelYear plantCity series trim vehicleType plantCountry plantCompanyName plantState trim2 series2 note basePrice nonLandUse bodyClass doors windows wheelBaseType trackWidthInches grossVehicleWeightRatingFrom bedLengthInches curbWeightPounds wheelBaseInchesFrom wheelBaseInchesTo grossCombinationWeightRatingFrom grossCombinationWeightRatingTo grossVehicleWeightRatingTo bedType cabType trailerTypeConnection trailerBodyType trailerLengthFeet otherTrailerInfo numberOfWheels wheelSizeFrontInches wheelSizeRearInches engineNumberOfCylinders displacementCc displacementCi displacementL fuelTypePrimary engineBrakeHpFrom engineBrakeHpTo seatBeltType otherRestraintSystemInfo frontAirBagLocations busType busFloorConfigurationType motorcycleChassisType motorcycleSuspensionType customMotorcycleType createdAt updatedAt deletedAt extendedAttributes { attributeName attributeValue } acesAttributes { attributeName attributeValue attributeKey } } location { __typename ... on AddressLocation { id accountId locationType address { streetAddress streetAddress2 city stateProvince postalCode country } extendedAttributes createdAt updatedAt deletedAt } ... on CoordinatesLocation { id accountId locationType coordinates { latitude longitude altitude accuracy } extendedAttributes createdAt updatedAt deletedAt } } workOrders { items { workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt } nextCursor } parts { items { accountId sortKey partId partNumber description manufacturer category subcategory unitId locationId condition status quantity serialNumber batchNumber installDate purchaseDate warrantyExpiration vendor weight dimensions { length width height } specifications extendedAttributes tags notes createdAt updatedAt deletedAt } nextCursor } events { items { accountId eventId unitId eventType eventCategory severity priority description summary sourceSystem maintenanceDetails { actionType description cost partNumbers laborHours scheduledAt completedAt nextDueAt } status createdAt updatedAt acknowledgedAt deletedAt extendedAttributes } nextCursor } errors { section message errorType }",
+    ),
+    "getAccount": FieldSpec(
+        "getAccount", "query", {"id": "ID!"},
+        "id name status createdAt updatedAt billingContactId billingLocationId extendedAttributes { attributeName attributeValue }",
+    ),
+    "listAccounts": FieldSpec(
+        "listAccounts", "query", {"cursor": "String", "limit": "Int"},
+        "items { id name status createdAt updatedAt billingContactId billingLocationId extendedAttributes { attributeName attributeValue } } nextCursor hasMore",
+        cursor="nextCursor",
+    ),
+    "getContact": FieldSpec(
+        "getContact", "query", {"accountId": "ID!", "email": "String!"},
+        "accountId contactId email firstName lastName phone status locationIds config createdAt updatedAt deletedAt",
+    ),
+    "listContacts": FieldSpec(
+        "listContacts", "query", {"accountId": "ID!", "cursor": "String", "limit": "Int"},
+        "items { accountId contactId email firstName lastName phone status locationIds config createdAt updatedAt deletedAt } nextCursor limit",
+        cursor="nextCursor",
+    ),
+    "getEvent": FieldSpec(
+        "getEvent", "query", {"accountId": "ID!", "eventId": "ID!"},
+        "accountId eventId unitId eventType eventCategory severity priority description summary sourceSystem maintenanceDetails { actionType description cost partNumbers laborHours scheduledAt completedAt nextDueAt components { name action notes } } status createdAt updatedAt acknowledgedAt deletedAt extendedAttributes",
+    ),
+    "listEvents": FieldSpec(
+        "listEvents", "query", {"accountId": "ID!", "unitId": "String", "eventCategory": "EventCategory", "status": "EventStatus", "severity": "EventSeverity", "priority": "EventPriority", "sourceSystem": "SourceSystem", "from": "String", "to": "String", "cursor": "String", "limit": "Int"},
+        "items { accountId eventId unitId eventType eventCategory severity priority description summary sourceSystem maintenanceDetails { actionType description cost partNumbers laborHours scheduledAt completedAt nextDueAt components { name action notes } } status createdAt updatedAt acknowledgedAt deletedAt extendedAttributes } nextCursor limit count",
+        cursor="nextCursor",
+    ),
+    "listEventsByStatus": FieldSpec(
+        "listEventsByStatus", "query", {"accountId": "ID!", "status": "[EventStatus!]", "cursor": "String", "limit": "Int"},
+        "items { accountId eventId unitId eventType eventCategory severity priority description summary sourceSystem maintenanceDetails { actionType description cost partNumbers laborHours scheduledAt completedAt nextDueAt components { name action notes } } status createdAt updatedAt acknowledgedAt deletedAt extendedAttributes unitInfo { model modelYear suggestedVin } } nextCursor limit count",
+        cursor="nextCursor",
+    ),
+    "getEventExport": FieldSpec(
+        "getEventExport", "query", {"accountId": "ID!", "exportId": "ID!"},
+        "exportId accountId status from to count url error startedAt completedAt",
+    ),
+    "getLaborLine": FieldSpec(
+        "getLaborLine", "query", {"accountId": "ID!", "laborLineId": "ID!"},
+        "laborLineId accountId taskId partId notes description",
+    ),
+    "listLaborLines": FieldSpec(
+        "listLaborLines", "query", {"accountId": "ID!", "taskId": "String", "cursor": "String", "limit": "Int"},
+        "items { laborLineId accountId taskId partId notes description } nextCursor hasMore",
+        cursor="nextCursor",
+    ),
+    "getLocation": FieldSpec(
+        "getLocation", "query", {"accountId": "ID!", "locationId": "ID!"},
+        "__typename ... on AddressLocation { id accountId locationType address { streetAddress streetAddress2 city stateProvince postalCode country } extendedAttributes createdAt updatedAt deletedAt } ... on CoordinatesLocation { id accountId locationType coordinates { latitude longitude altitude accuracy } extendedAttributes createdAt updatedAt deletedAt }",
+    ),
+    "listLocations": FieldSpec(
+        "listLocations", "query", {"accountId": "ID!", "cursor": "String", "limit": "Int"},
+        "items { __typename ... on AddressLocation { id accountId locationType address { streetAddress streetAddress2 city stateProvince postalCode country } extendedAttributes createdAt updatedAt deletedAt } ... on CoordinatesLocation { id accountId locationType coordinates { latitude longitude altitude accuracy } extendedAttributes createdAt updatedAt deletedAt } } nextCursor limit count",
+        cursor="nextCursor",
+    ),
+    "getPart": FieldSpec(
+        "getPart", "query", {"accountId": "ID!", "partId": "ID!"},
+        "accountId sortKey partId partNumber description manufacturer category subcategory unitId locationId condition status quantity serialNumber batchNumber installDate purchaseDate warrantyExpiration vendor weight dimensions { length width height } specifications extendedAttributes tags notes createdAt updatedAt deletedAt",
+    ),
+    "listParts": FieldSpec(
+        "listParts", "query", {"accountId": "ID!", "locationId": "String", "unitId": "String", "cursor": "String", "limit": "Int"},
+        "items { accountId sortKey partId partNumber description manufacturer category subcategory unitId locationId condition status quantity serialNumber batchNumber installDate purchaseDate warrantyExpiration vendor weight dimensions { length width height } specifications extendedAttributes tags notes createdAt updatedAt deletedAt } nextCursor limit count",
+        cursor="nextCursor",
+    ),
+    "getTask": FieldSpec(
+        "getTask", "query", {"accountId": "ID!", "taskId": "ID!"},
+        "taskId accountId workOrderId contactId locationId laborlinesId description notes status estimateHours actualHours startDate endDate createdAt updatedAt deletedAt",
+    ),
+    "listTasks": FieldSpec(
+        "listTasks", "query", {"accountId": "ID!", "cursor": "String", "limit": "Int"},
+        "items { taskId accountId workOrderId contactId locationId laborlinesId description notes status estimateHours actualHours startDate endDate createdAt updatedAt deletedAt } nextCursor limit count",
+        cursor="nextCursor",
+    ),
+    "getWorkOrder": FieldSpec(
+        "getWorkOrder", "query", {"accountId": "ID!", "workOrderId": "ID!"},
+        "workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt",
+    ),
+    "listWorkOrders": FieldSpec(
+        "listWorkOrders", "query", {"accountId": "ID!", "cursor": "String", "pageSize": "Int"},
+        "items { workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt } nextCursor pageSize count",
+        cursor="nextCursor",
+    ),
+    "createUnit": FieldSpec(
+        "createUnit", "mutation", {"input": "CreateUnitInput!"},
+        "id accountId locationId unitType suggestedVin errorCode possibleValues additionalErrorText errorText vehicleDescriptor destinationMarket make manufacturerName model modelYear plantCity series trim vehicleType plantCountry plantCompanyName plantState trim2 series2 note basePrice nonLandUse bodyClass doors windows wheelBaseType trackWidthInches grossVehicleWeightRatingFrom bedLengthInches curbWeightPounds wheelBaseInchesFrom wheelBaseInchesTo grossCombinationWeightRatingFrom grossCombinationWeightRatingTo grossVehicleWeightRatingTo bedType cabType trailerTypeConnection trailerBodyType trailerLengthFeet otherTrailerInfo numberOfWheels wheelSizeFrontInches wheelSizeRearInches engineNumberOfCylinders displacementCc displacementCi displacementL fuelTypePrimary engineBrakeHpFrom engineBrakeHpTo seatBeltType otherRestraintSystemInfo frontAirBagLocations busType busFloorConfigurationType motorcycleChassisType motorcycleSuspensionType customMotorcycleType createdAt updatedAt deletedAt extendedAttributes { attributeName attributeValue } acesAttributes { attributeName attributeValue attributeKey }",
+    ),
+    "updateUnit": FieldSpec(
+        "updateUnit", "mutation", {"id": "ID!", "input": "UpdateUnitInput!"},
+        "id accountId locationId unitType suggestedVin errorCode possibleValues additionalErrorText errorText vehicleDescriptor destinationMarket make manufacturerName model modelYear plantCity series trim vehicleType plantCountry plantCompanyName plantState trim2 series2 note basePrice nonLandUse bodyClass doors windows wheelBaseType trackWidthInches grossVehicleWeightRatingFrom bedLengthInches curbWeightPounds wheelBaseInchesFrom wheelBaseInchesTo grossCombinationWeightRatingFrom grossCombinationWeightRatingTo grossVehicleWeightRatingTo bedType cabType trailerTypeConnection trailerBodyType trailerLengthFeet otherTrailerInfo numberOfWheels wheelSizeFrontInches wheelSizeRearInches engineNumberOfCylinders displacementCc displacementCi displacementL fuelTypePrimary engineBrakeHpFrom engineBrakeHpTo seatBeltType otherRestraintSystemInfo frontAirBagLocations busType busFloorConfigurationType motorcycleChassisType motorcycleSuspensionType customMotorcycleType createdAt updatedAt deletedAt extendedAttributes { attributeName attributeValue } acesAttributes { attributeName attributeValue attributeKey }",
+    ),
+    "deleteUnit": FieldSpec(
+        "deleteUnit", "mutation", {"id": "ID!"},
+        "success id message",
+    ),
+    "createAccount": FieldSpec(
+        "createAccount", "mutation", {"input": "CreateAccountInput!"},
+        "id name status createdAt updatedAt billingContactId billingLocationId extendedAttributes { attributeName attributeValue }",
+    ),
+    "updateAccount": FieldSpec(
+        "updateAccount", "mutation", {"id": "ID!", "input": "UpdateAccountInput!"},
+        "id name status createdAt updatedAt billingContactId billingLocationId extendedAttributes { attributeName attributeValue }",
+    ),
+    "deleteAccount": FieldSpec(
+        "deleteAccount", "mutation", {"id": "ID!"},
+        "success id message",
+    ),
+    "createContact": FieldSpec(
+        "createContact", "mutation", {"accountId": "ID!", "input": "CreateContactInput!"},
+        "accountId contactId email firstName lastName phone status locationIds config createdAt updatedAt deletedAt",
+    ),
+    "updateContact": FieldSpec(
+        "updateContact", "mutation", {"accountId": "ID!", "email": "String!", "input": "UpdateContactInput!"},
+        "accountId contactId email firstName lastName phone status locationIds config createdAt updatedAt deletedAt",
+    ),
+    "deleteContact": FieldSpec(
+        "deleteContact", "mutation", {"accountId": "ID!", "email": "String!"},
+        "accountId contactId email firstName lastName phone status locationIds config createdAt updatedAt deletedAt",
+    ),
+    "createEvent": FieldSpec(
+        "createEvent", "mutation", {"input": "CreateEventInput!"},
+        "accountId eventId unitId eventType eventCategory severity priority description summary sourceSystem maintenanceDetails { actionType description cost partNumbers laborHours scheduledAt completedAt nextDueAt components { name action notes } } status createdAt updatedAt acknowledgedAt deletedAt extendedAttributes",
+    ),
+    "updateEvent": FieldSpec(
+        "updateEvent", "mutation", {"accountId": "ID!", "eventId": "ID!", "input": "UpdateEventInput!"},
+        "accountId eventId unitId eventType eventCategory severity priority description summary sourceSystem maintenanceDetails { actionType description cost partNumbers laborHours scheduledAt completedAt nextDueAt components { name action notes } } status createdAt updatedAt acknowledgedAt deletedAt extendedAttributes",
+    ),
+    "deleteEvent": FieldSpec(
+        "deleteEvent", "mutation", {"accountId": "ID!", "eventId": "ID!"},
+        "success accountId eventId message",
+    ),
+    "startEventExport": FieldSpec(
+        "startEventExport", "mutation", {"accountId": "ID!", "input": "EventExportInput!"},
+        "exportId accountId status from to count url error startedAt completedAt",
+    ),
+    "createLaborLine": FieldSpec(
+        "createLaborLine", "mutation", {"accountId": "ID!", "input": "CreateLaborLineInput!"},
+        "laborLineId accountId taskId partId notes description",
+    ),
+    "updateLaborLine": FieldSpec(
+        "updateLaborLine", "mutation", {"accountId": "ID!", "laborLineId": "ID!", "input": "UpdateLaborLineInput!"},
+        "laborLineId accountId taskId partId notes description",
+    ),
+    "deleteLaborLine": FieldSpec(
+        "deleteLaborLine", "mutation", {"accountId": "ID!", "laborLineId": "ID!"},
+        "success accountId laborLineId message",
+    ),
+    "createLocation": FieldSpec(
+        "createLocation", "mutation", {"accountId": "ID!", "input": "CreateLocationInput!"},
+        "__typename ... on AddressLocation { id accountId locationType address { streetAddress streetAddress2 city stateProvince postalCode country } extendedAttributes createdAt updatedAt deletedAt } ... on CoordinatesLocation { id accountId locationType coordinates { latitude longitude altitude accuracy } extendedAttributes createdAt updatedAt deletedAt }",
+    ),
+    "updateLocation": FieldSpec(
+        "updateLocation", "mutation", {"accountId": "ID!", "locationId": "ID!", "input": "UpdateLocationInput!"},
+        "__typename ... on AddressLocation { id accountId locationType address { streetAddress streetAddress2 city stateProvince postalCode country } extendedAttributes createdAt updatedAt deletedAt } ... on CoordinatesLocation { id accountId locationType coordinates { latitude longitude altitude accuracy } extendedAttributes createdAt updatedAt deletedAt }",
+    ),
+    "deleteLocation": FieldSpec(
+        "deleteLocation", "mutation", {"accountId": "ID!", "locationId": "ID!"},
+        "",
+    ),
+    "createPart": FieldSpec(
+        "createPart", "mutation", {"accountId": "ID!", "input": "CreatePartInput!"},
+        "accountId sortKey partId partNumber description manufacturer category subcategory unitId locationId condition status quantity serialNumber batchNumber installDate purchaseDate warrantyExpiration vendor weight dimensions { length width height } specifications extendedAttributes tags notes createdAt updatedAt deletedAt",
+    ),
+    "createParts": FieldSpec(
+        "createParts", "mutation", {"accountId": "ID!", "inputs": "[CreatePartInput!]!"},
+        "index part { accountId sortKey partId partNumber description manufacturer category subcategory unitId locationId condition status quantity serialNumber batchNumber installDate purchaseDate warrantyExpiration vendor weight dimensions { length width height } specifications extendedAttributes tags notes createdAt updatedAt deletedAt } error { message errorType }",
+    ),
+    "updatePart": FieldSpec(
+        "updatePart", "mutation", {"accountId": "ID!", "partId": "ID!", "input": "UpdatePartInput!"},
+        "accountId sortKey partId partNumber description manufacturer category subcategory unitId locationId condition status quantity serialNumber batchNumber installDate purchaseDate warrantyExpiration vendor weight dimensions { length width height } specifications extendedAttributes tags notes createdAt updatedAt deletedAt",
+    ),
+    "deletePart": FieldSpec(
+        "deletePart", "mutation", {"accountId": "ID!", "partId": "ID!"},
+        "",
+    ),
+    "createTask": FieldSpec(
+        "createTask", "mutation", {"accountId": "ID!", "input": "CreateTaskInput!"},
+        "taskId accountId workOrderId contactId locationId laborlinesId description notes status estimateHours actualHours startDate endDate createdAt updatedAt deletedAt",
+    ),
+    "updateTask": FieldSpec(
+        "updateTask", "mutation", {"accountId": "ID!", "taskId": "ID!", "input": "UpdateTaskInput!"},
+        "taskId accountId workOrderId contactId locationId laborlinesId description notes status estimateHours actualHours startDate endDate createdAt updatedAt deletedAt",
+    ),
+    "deleteTask": FieldSpec(
+        "deleteTask", "mutation", {"accountId": "ID!", "taskId": "ID!"},
+        "",
+    ),
+    "createWorkOrder": FieldSpec(
+        "createWorkOrder", "mutation", {"accountId": "ID!", "input": "CreateWorkOrderInput!"},
+        "workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt",
+    ),
+    "updateWorkOrder": FieldSpec(
+        "updateWorkOrder", "mutation", {"accountId": "ID!", "workOrderId": "ID!", "input": "UpdateWorkOrderInput!"},
+        "workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt",
+    ),
+    "deleteWorkOrder": FieldSpec(
+        "deleteWorkOrder", "mutation", {"accountId": "ID!", "workOrderId": "ID!"},
+        "",
+    ),
+    "createWorkOrders": FieldSpec(
+        "createWorkOrders", "mutation", {"accountId": "ID!", "inputs": "[CreateWorkOrderInput!]!"},
+        "index workOrder { workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt } error { message errorType }",
+    ),
+    "updateWorkOrders": FieldSpec(
+        "updateWorkOrders", "mutation", {"accountId": "ID!", "inputs": "[WorkOrderUpdateItem!]!"},
+        "index workOrder { workOrderId accountId contactId unitId status description notes createdAt updatedAt deletedAt } error { message errorType }",
+    ),
+    "deleteWorkOrders": FieldSpec(
+        "deleteWorkOrders", "mutation", {"accountId": "ID!", "workOrderIds": "[ID!]!"},
+        "index id deleted error { message errorType }",
+    ),
+}
+
+
+class Operations:
+    """One typed method per Query and Mutation field. `fields` replaces the
+    default selection set (every field, a few levels deep) with your own,
+    e.g. "items { workOrderId status } nextCursor"."""
+
+    async def _call(self, spec: FieldSpec, arguments: dict, fields: str | None):
+        raise NotImplementedError
+
+    def _iterate(self, spec: FieldSpec, arguments: dict, fields: str | None) -> AsyncIterator:
+        raise NotImplementedError
+
+    async def hello(self, *, fields: str | None = None) -> HelloResponse:
+        """Query hello: HelloResponse!"""
+        return await self._call(FIELDS["hello"], {}, fields)
+
+    async def get_unit(self, *, id: str, fields: str | None = None) -> Unit | None:
+        """Query getUnit: Unit"""
+        return await self._call(FIELDS["getUnit"], {"id": id}, fields)
+
+    async def list_units(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> UnitsConnection:
+        """Query listUnits: UnitsConnection!"""
+        return await self._call(FIELDS["listUnits"], {"cursor": cursor, "limit": limit}, fields)
+
+    def iter_list_units(self, *, limit: int | None = None, fields: str | None = None) -> AsyncIterator[Unit]:
+        """Every item of listUnits, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listUnits"], {"limit": limit}, fields)
+
+    async def get_unit_with_work_orders(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> UnitsWithWorkOrdersConnection:
+        """Query getUnitWithWorkOrders: UnitsWithWorkOrdersConnection!"""
+        return await self._call(FIELDS["getUnitWithWorkOrders"], {"cursor": cursor, "limit": limit}, fields)
+
+    def iter_get_unit_with_work_orders(
+        self,
+        *,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[UnitWithWorkOrders]:
+        """Every item of getUnitWithWorkOrders, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["getUnitWithWorkOrders"], {"limit": limit}, fields)
+
+    async def get_unit_detail(
+        self,
+        *,
+        id: str,
+        work_orders_limit: int | None = None,
+        parts_limit: int | None = None,
+        events_limit: int | None = None,
+        fields: str | None = None,
+    ) -> UnitDetail:
+        """Query getUnitDetail: UnitDetail!"""
+        return await self._call(FIELDS["getUnitDetail"], {
+            "id": id,
+            "workOrdersLimit": work_orders_limit,
+            "partsLimit": parts_limit,
+            "eventsLimit": events_limit,
+        }, fields)
+
+    async def get_account(self, *, id: str, fields: str | None = None) -> Account | None:
+        """Query getAccount: Account"""
+        return await self._call(FIELDS["getAccount"], {"id": id}, fields)
+
+    async def list_accounts(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AccountsConnection:
+        """Query listAccounts: AccountsConnection!"""
+        return await self._call(FIELDS["listAccounts"], {"cursor": cursor, "limit": limit}, fields)
+
+    def iter_list_accounts(self, *, limit: int | None = None, fields: str | None = None) -> AsyncIterator[Account]:
+        """Every item of listAccounts, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listAccounts"], {"limit": limit}, fields)
+
+    async def get_contact(self, *, account_id: str, email: str, fields: str | None = None) -> Contact | None:
+        """Query getContact: Contact"""
+        return await self._call(FIELDS["getContact"], {"accountId": account_id, "email": email}, fields)
+
+    async def list_contacts(
+        self,
+        *,
+        account_id: str,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> ContactsConnection:
+        """Query listContacts: ContactsConnection!"""
+        return await self._call(FIELDS["listContacts"], {
+            "accountId": account_id,
+            "cursor": cursor,
+            "limit": limit,
+        }, fields)
+
+    def iter_list_contacts(
+        self,
+        *,
+        account_id: str,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[Contact]:
+        """Every item of listContacts, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listContacts"], {"accountId": account_id, "limit": limit}, fields)
+
+    async def get_event(self, *, account_id: str, event_id: str, fields: str | None = None) -> Event | None:
+        """Query getEvent: Event"""
+        return await self._call(FIELDS["getEvent"], {"accountId": account_id, "eventId": event_id}, fields)
+
+    async def list_events(
+        self,
+        *,
+        account_id: str,
+        unit_id: str | None = None,
+        event_category: EventCategory | None = None,
+        status: EventStatus | None = None,
+        severity: EventSeverity | None = None,
+        priority: EventPriority | None = None,
+        source_system: SourceSystem | None = None,
+        from_: str | None = None,
+        to: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> EventsConnection:
+        """Query listEvents: EventsConnection!"""
+        return await self._call(FIELDS["listEvents"], {
+            "accountId": account_id,
+            "unitId": unit_id,
+            "eventCategory": event_category,
+            "status": status,
+            "severity": severity,
+            "priority": priority,
+            "sourceSystem": source_system,
+            "from": from_,
+            "to": to,
+            "cursor": cursor,
+            "limit": limit,
+        }, fields)
+
+    def iter_list_events(
+        self,
+        *,
+        account_id: str,
+        unit_id: str | None = None,
+        event_category: EventCategory | None = None,
+        status: EventStatus | None = None,
+        severity: EventSeverity | None = None,
+        priority: EventPriority | None = None,
+        source_system: SourceSystem | None = None,
+        from_: str | None = None,
+        to: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[Event]:
+        """Every item of listEvents, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listEvents"], {
+            "accountId": account_id,
+            "unitId": unit_id,
+            "eventCategory": event_category,
+            "status": status,
+            "severity": severity,
+            "priority": priority,
+            "sourceSystem": source_system,
+            "from": from_,
+            "to": to,
+            "limit": limit,
+        }, fields)
+
+    async def list_events_by_status(
+        self,
+        *,
+        account_id: str,
+        status: list[EventStatus] | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> EventsByStatusConnection:
+        """Query listEventsByStatus: EventsByStatusConnection!"""
+        return await self._call(FIELDS["listEventsByStatus"], {
+            "accountId": account_id,
+            "status": status,
+            "cursor": cursor,
+            "limit": limit,
+        }, fields)
+
+    def iter_list_events_by_status(
+        self,
+        *,
+        account_id: str,
+        status: list[EventStatus] | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[EventWithUnitInfo]:
+        """Every item of listEventsByStatus, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listEventsByStatus"], {
+            "accountId": account_id,
+            "status": status,
+            "limit": limit,
+        }, fields)
+
+    async def get_event_export(
+        self,
+        *,
+        account_id: str,
+        export_id: str,
+        fields: str | None = None,
+    ) -> EventExport | None:
+        """Query getEventExport: EventExport"""
+        return await self._call(FIELDS["getEventExport"], {"accountId": account_id, "exportId": export_id}, fields)
+
+    async def get_labor_line(
+        self,
+        *,
+        account_id: str,
+        labor_line_id: str,
+        fields: str | None = None,
+    ) -> LaborLine | None:
+        """Query getLaborLine: LaborLine"""
+        return await self._call(FIELDS["getLaborLine"], {"accountId": account_id, "laborLineId": labor_line_id}, fields)
+
+    async def list_labor_lines(
+        self,
+        *,
+        account_id: str,
+        task_id: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> LaborLineConnection:
+        """Query listLaborLines: LaborLineConnection!"""
+        return await self._call(FIELDS["listLaborLines"], {
+            "accountId": account_id,
+            "taskId": task_id,
+            "cursor": cursor,
+            "limit": limit,
+        }, fields)
+
+    def iter_list_labor_lines(
+        self,
+        *,
+        account_id: str,
+        task_id: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[LaborLine]:
+        """Every item of listLaborLines, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listLaborLines"], {
+            "accountId": account_id,
+            "taskId": task_id,
+            "limit": limit,
+        }, fields)
+
+    async def get_location(self, *, account_id: str, location_id: str, fields: str | None = None) -> Location | None:
+        """Query getLocation: Location"""
+        return await self._call(FIELDS["getLocation"], {"accountId": account_id, "locationId": location_id}, fields)
+
+    async def list_locations(
+        self,
+        *,
+        account_id: str,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> LocationConnection:
+        """Query listLocations: LocationConnection!"""
+        return await self._call(FIELDS["listLocations"], {
+            "accountId": account_id,
+            "cursor": cursor,
+            "limit": limit,
+        }, fields)
+
+    def iter_list_locations(
+        self,
+        *,
+        account_id: str,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[Location]:
+        """Every item of listLocations, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listLocations"], {"accountId": account_id, "limit": limit}, fields)
+
+    async def get_part(self, *, account_id: str, part_id: str, fields: str | None = None) -> Part | None:
+        """Query getPart: Part"""
+        return await self._call(FIELDS["getPart"], {"accountId": account_id, "partId": part_id}, fields)
+
+    async def list_parts(
+        self,
+        *,
+        account_id: str,
+        location_id: str | None = None,
+        unit_id: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> PartConnection:
+        """Query listParts: PartConnection!"""
+        return await self._call(FIELDS["listParts"], {
+            "accountId": account_id,
+            "locationId": location_id,
+            "unitId": unit_id,
+            "cursor": cursor,
+            "limit": limit,
+        }, fields)
+
+    def iter_list_parts(
+        self,
+        *,
+        account_id: str,
+        location_id: str | None = None,
+        unit_id: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[Part]:
+        """Every item of listParts, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listParts"], {
+            "accountId": account_id,
+            "locationId": location_id,
+            "unitId": unit_id,
+            "limit": limit,
+        }, fields)
+
+    async def get_task(self, *, account_id: str, task_id: str, fields: str | None = None) -> Task | None:
+        """Query getTask: Task"""
+        return await self._call(FIELDS["getTask"], {"accountId": account_id, "taskId": task_id}, fields)
+
+    async def list_tasks(
+        self,
+        *,
+        account_id: str,
+        cursor: str | None = None,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> TaskConnection:
+        """Query listTasks: TaskConnection!"""
+        return await self._call(FIELDS["listTasks"], {
+            "accountId": account_id,
+            "cursor": cursor,
+            "limit": limit,
+        }, fields)
+
+    def iter_list_tasks(
+        self,
+        *,
+        account_id: str,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[Task]:
+        """Every item of listTasks, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listTasks"], {"accountId": account_id, "limit": limit}, fields)
+
+    async def get_work_order(
+        self,
+        *,
+        account_id: str,
+        work_order_id: str,
+        fields: str | None = None,
+    ) -> WorkOrder | None:
+        """Query getWorkOrder: WorkOrder"""
+        return await self._call(FIELDS["getWorkOrder"], {"accountId": account_id, "workOrderId": work_order_id}, fields)
+
+    async def list_work_orders(
+        self,
+        *,
+        account_id: str,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        fields: str | None = None,
+    ) -> WorkOrderConnection:
+        """Query listWorkOrders: WorkOrderConnection!"""
+        return await self._call(FIELDS["listWorkOrders"], {
+            "accountId": account_id,
+            "cursor": cursor,
+            "pageSize": page_size,
+        }, fields)
+
+    def iter_list_work_orders(
+        self,
+        *,
+        account_id: str,
+        page_size: int | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[WorkOrder]:
+        """Every item of listWorkOrders, page by page; `fields` selects within items"""
+        return self._iterate(FIELDS["listWorkOrders"], {"accountId": account_id, "pageSize": page_size}, fields)
+
+    async def create_unit(self, *, input: CreateUnitInput, fields: str | None = None) -> Unit:
+        """Mutation createUnit: Unit!"""
+        return await self._call(FIELDS["createUnit"], {"input": input}, fields)
+
+    async def update_unit(self, *, id: str, input: UpdateUnitInput, fields: str | None = None) -> Unit:
+        """Mutation updateUnit: Unit!"""
+        return await self._call(FIELDS["updateUnit"], {"id": id, "input": input}, fields)
+
+    async def delete_unit(self, *, id: str, fields: str | None = None) -> DeleteUnitResponse:
+        """Mutation deleteUnit: DeleteUnitResponse!"""
+        return await self._call(FIELDS["deleteUnit"], {"id": id}, fields)
+
+    async def create_account(self, *, input: CreateAccountInput, fields: str | None = None) -> Account:
+        """Mutation createAccount: Account!"""
+        return await self._call(FIELDS["createAccount"], {"input": input}, fields)
+
+    async def update_account(self, *, id: str, input: UpdateAccountInput, fields: str | None = None) -> Account:
+        """Mutation updateAccount: Account!"""
+        return await self._call(FIELDS["updateAccount"], {"id": id, "input": input}, fields)
+
+    async def delete_account(self, *, id: str, fields: str | None = None) -> DeleteAccountResponse:
+        """Mutation deleteAccount: DeleteAccountResponse!"""
+        return await self._call(FIELDS["deleteAccount"], {"id": id}, fields)
+
+    async def create_contact(self, *, account_id: str, input: CreateContactInput, fields: str | None = None) -> Contact:
+        """Mutation createContact: Contact!"""
+        return await self._call(FIELDS["createContact"], {"accountId": account_id, "input": input}, fields)
+
+    async def update_contact(
+        self,
+        *,
+        account_id: str,
+        email: str,
+        input: UpdateContactInput,
+        fields: str | None = None,
+    ) -> Contact:
+        """Mutation updateContact: Contact!"""
+        return await self._call(FIELDS["updateContact"], {
+            "accountId": account_id,
+            "email": email,
+            "input": input,
+        }, fields)
+
+    async def delete_contact(self, *, account_id: str, email: str, fields: str | None = None) -> Contact:
+        """Mutation deleteContact: Contact!"""
+        return await self._call(FIELDS["deleteContact"], {"accountId": account_id, "email": email}, fields)
+
+    async def create_event(self, *, input: CreateEventInput, fields: str | None = None) -> Event:
+        """Mutation createEvent: Event!"""
+        return await self._call(FIELDS["createEvent"], {"input": input}, fields)
+
+    async def update_event(
+        self,
+        *,
+        account_id: str,
+        event_id: str,
+        input: UpdateEventInput,
+        fields: str | None = None,
+    ) -> Event:
+        """Mutation updateEvent: Event!"""
+        return await self._call(FIELDS["updateEvent"], {
+            "accountId": account_id,
+            "eventId": event_id,
+            "input": input,
+        }, fields)
+
+    async def delete_event(self, *, account_id: str, event_id: str, fields: str | None = None) -> DeleteEventResponse:
+        """Mutation deleteEvent: DeleteEventResponse!"""
+        return await self._call(FIELDS["deleteEvent"], {"accountId": account_id, "eventId": event_id}, fields)
+
+    async def start_event_export(
+        self,
+        *,
+        account_id: str,
+        input: EventExportInput,
+        fields: str | None = None,
+    ) -> EventExport:
+        """Mutation startEventExport: EventExport!"""
+        return await self._call(FIELDS["startEventExport"], {"accountId": account_id, "input": input}, fields)
+
+    async def create_labor_line(
+        self,
+        *,
+        account_id: str,
+        input: CreateLaborLineInput,
+        fields: str | None = None,
+    ) -> LaborLine:
+        """Mutation createLaborLine: LaborLine!"""
+        return await self._call(FIELDS["createLaborLine"], {"accountId": account_id, "input": input}, fields)
+
+    async def update_labor_line(
+        self,
+        *,
+        account_id: str,
+        labor_line_id: str,
+        input: UpdateLaborLineInput,
+        fields: str | None = None,
+    ) -> LaborLine:
+        """Mutation updateLaborLine: LaborLine!"""
+        return await self._call(FIELDS["updateLaborLine"], {
+            "accountId": account_id,
+            "laborLineId": labor_line_id,
+            "input": input,
+        }, fields)
+
+    async def delete_labor_line(
+        self,
+        *,
+        account_id: str,
+        labor_line_id: str,
+        fields: str | None = None,
+    ) -> DeleteLaborLineResponse:
+        """Mutation deleteLaborLine: DeleteLaborLineResponse!"""
+        return await self._call(FIELDS["deleteLaborLine"], {
+            "accountId": account_id,
+            "laborLineId": labor_line_id,
+        }, fields)
+
+    async def create_location(
+        self,
+        *,
+        account_id: str,
+        input: CreateLocationInput,
+        fields: str | None = None,
+    ) -> Location:
+        """Mutation createLocation: Location!"""
+        return await self._call(FIELDS["createLocation"], {"accountId": account_id, "input": input}, fields)
+
+    async def update_location(
+        self,
+        *,
+        account_id: str,
+        location_id: str,
+        input: UpdateLocationInput,
+        fields: str | None = None,
+    ) -> Location:
+        """Mutation updateLocation: Location!"""
+        return await self._call(FIELDS["updateLocation"], {
+            "accountId": account_id,
+            "locationId": location_id,
+            "input": input,
+        }, fields)
+
+    async def delete_location(self, *, account_id: str, location_id: str, fields: str | None = None) -> bool:
+        """Mutation deleteLocation: Boolean!"""
+        return await self._call(FIELDS["deleteLocation"], {"accountId": account_id, "locationId": location_id}, fields)
+
+    async def create_part(self, *, account_id: str, input: CreatePartInput, fields: str | None = None) -> Part:
+        """Mutation createPart: Part!"""
+        return await self._call(FIELDS["createPart"], {"accountId": account_id, "input": input}, fields)
+
+    async def create_parts(
+        self,
+        *,
+        account_id: str,
+        inputs: list[CreatePartInput],
+        fields: str | None = None,
+    ) -> list[PartBulkResult]:
+        """Mutation createParts: [PartBulkResult!]!"""
+        return await self._call(FIELDS["createParts"], {"accountId": account_id, "inputs": inputs}, fields)
+
+    async def update_part(
+        self,
+        *,
+        account_id: str,
+        part_id: str,
+        input: UpdatePartInput,
+        fields: str | None = None,
+    ) -> Part:
+        """Mutation updatePart: Part!"""
+        return await self._call(FIELDS["updatePart"], {
+            "accountId": account_id,
+            "partId": part_id,
+            "input": input,
+        }, fields)
+
+    async def delete_part(self, *, account_id: str, part_id: str, fields: str | None = None) -> bool:
+        """Mutation deletePart: Boolean!"""
+        return await self._call(FIELDS["deletePart"], {"accountId": account_id, "partId": part_id}, fields)
+
+    async def create_task(self, *, account_id: str, input: CreateTaskInput, fields: str | None = None) -> Task:
+        """Mutation createTask: Task!"""
+        return await self._call(FIELDS["createTask"], {"accountId": account_id, "input": input}, fields)
+
+    async def update_task(
+        self,
+        *,
+        account_id: str,
+        task_id: str,
+        input: UpdateTaskInput,
+        fields: str | None = None,
+    ) -> Task:
+        """Mutation updateTask: Task!"""
+        return await self._call(FIELDS["updateTask"], {
+            "accountId": account_id,
+            "taskId": task_id,
+            "input": input,
+        }, fields)
+
+    async def delete_task(self, *, account_id: str, task_id: str, fields: str | None = None) -> bool:
+        """Mutation deleteTask: Boolean!"""
+        return await self._call(FIELDS["deleteTask"], {"accountId": account_id, "taskId": task_id}, fields)
+
+    async def create_work_order(
+        self,
+        *,
+        account_id: str,
+        input: CreateWorkOrderInput,
+        fields: str | None = None,
+    ) -> WorkOrder:
+        """Mutation createWorkOrder: WorkOrder!"""
+        return await self._call(FIELDS["createWorkOrder"], {"accountId": account_id, "input": input}, fields)
+
+    async def update_work_order(
+        self,
+        *,
+        account_id: str,
+        work_order_id: str,
+        input: UpdateWorkOrderInput,
+        fields: str | None = None,
+    ) -> WorkOrder:
+        """Mutation updateWorkOrder: WorkOrder!"""
+        return await self._call(FIELDS["updateWorkOrder"], {
+            "accountId": account_id,
+            "workOrderId": work_order_id,
+            "input": input,
+        }, fields)
+
+    async def delete_work_order(self, *, account_id: str, work_order_id: str, fields: str | None = None) -> bool:
+        """Mutation deleteWorkOrder: Boolean!"""
+        return await self._call(FIELDS["deleteWorkOrder"], {
+            "accountId": account_id,
+            "workOrderId": work_order_id,
+        }, fields)
+
+    async def create_work_orders(
+        self,
+        *,
+        account_id: str,
+        inputs: list[CreateWorkOrderInput],
+        fields: str | None = None,
+    ) -> list[WorkOrderBulkResult]:
+        """Mutation createWorkOrders: [WorkOrderBulkResult!]!"""
+        return await self._call(FIELDS["createWorkOrders"], {"accountId": account_id, "inputs": inputs}, fields)
+
+    async def update_work_orders(
+        self,
+        *,
+        account_id: str,
+        inputs: list[WorkOrderUpdateItem],
+        fields: str | None = None,
+    ) -> list[WorkOrderBulkResult]:
+        """Mutation updateWorkOrders: [WorkOrderBulkResult!]!"""
+        return await self._call(FIELDS["updateWorkOrders"], {"accountId": account_id, "inputs": inputs}, fields)
+
+    async def delete_work_orders(
+        self,
+        *,
+        account_id: str,
+        work_order_ids: list[str],
+        fields: str | None = None,
+    ) -> list[DeleteBulkResult]:
+        """Mutation deleteWorkOrders: [DeleteBulkResult!]!"""
+        return await self._call(FIELDS["deleteWorkOrders"], {
+            "accountId": account_id,
+            "workOrderIds": work_order_ids,
+        }, fields)
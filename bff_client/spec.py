@@ -0,0 +1,20 @@
+"""What the client needs to know about a root field to call it."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """One Query or Mutation field of the schema."""
+
+    name: str
+    # "query" or "mutation"
+    operation: str
+    # GraphQL argument name -> its type as written in the schema, e.g. {"accountId": "ID!"}
+    arguments: dict[str, str] = field(default_factory=dict)
+    # Selection set used when the caller passes no `fields`, without the outer braces
+    selection: str = ""
+    # For connections: the field holding the next page's cursor (nextCursor or cursor)
+    cursor: str | None = None
@@ -0,0 +1,91 @@
+"""A fake AppSync endpoint for the client tests.
+
+Serves GraphQL POSTs on a local port over keep-alive HTTP/1.1, the way the
+client talks to AppSync. Each aliased root field of a document is answered by
+`resolve(field_name, arguments)`; raising FieldError makes that field null
+with an error whose path is its alias. Tokens `accept` turns down get a 401.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Callable
+
+_ROOT_FIELD = re.compile(r"(f\d+): (\w+)(?:\(([^)]*)\))?")
+_ARGUMENT = re.compile(r"(\w+): \$(\w+)")
+
+
+class FieldError(Exception):
+    def __init__(self, message: str, error_type: str = "Error"):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+@dataclass
+class ReceivedRequest:
+    token: str | None
+    # (alias, field name, arguments) of each root field, in document order
+    fields: list[tuple[str, str, dict]] = field(default_factory=list)
+
+
+class FakeAppSync:
+    def __init__(self, resolve: Callable[[str, dict], object], accept: Callable[[str | None], bool] = lambda token: True):
+        self.resolve = resolve
+        self.accept = accept
+        self.requests: list[ReceivedRequest] = []
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/graphql"
+
+    async def start(self) -> "FakeAppSync":
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                headers = {}
+                while (line := (await reader.readline()).decode("latin-1").rstrip("\r\n")):
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = json.loads(await reader.readexactly(int(headers.get("content-length", "0"))))
+                authorization = headers.get("authorization")
+                status, answer = self._answer(body, authorization.removeprefix("Bearer ") if authorization else None)
+                payload = json.dumps(answer).encode()
+                writer.write(f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _answer(self, body: dict, token: str | None) -> tuple[int, dict]:
+        received = ReceivedRequest(token)
+        self.requests.append(received)
+        if not self.accept(token):
+            return 401, {"errors": [{"message": "Unauthorized", "errorType": "UnauthorizedException"}]}
+        variables = body.get("variables") or {}
+        data, errors = {}, []
+        for alias, name, arguments in _ROOT_FIELD.findall(body["query"]):
+            values = {argument: variables.get(variable) for argument, variable in _ARGUMENT.findall(arguments)}
+            received.fields.append((alias, name, values))
+            try:
+                data[alias] = self.resolve(name, values)
+            except FieldError as error:
+                data[alias] = None
+                errors.append({"message": str(error), "errorType": error.error_type, "path": [alias]})
+        return 200, {"data": data, **({"errors": errors} if errors else {})}
@@ -0,0 +1,149 @@
+"""BffClient against a fake AppSync endpoint: batching, token refresh, pagination.
+
+    python -m unittest discover -s bff_client/tests -t .
+"""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from bff_client import BffClient, GraphQLError, RefreshingToken
+
+from .fake_appsync import FakeAppSync, FieldError
+
+
+def unit(unit_id: str) -> dict:
+    return {"id": unit_id, "accountId": "acct-1"}
+
+
+def resolve_units(name: str, arguments: dict) -> object:
+    if name == "getUnit":
+        if arguments["id"] == "missing":
+            raise FieldError("Unit not found", "NotFound")
+        return unit(arguments["id"])
+    raise FieldError(f"Unexpected field {name}")
+
+
+class BatchingTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = await FakeAppSync(resolve_units).start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_calls_made_together_share_requests_and_get_their_own_answers(self):
+        async with BffClient(self.server.url, "token-1", batch_size=25) as bff:
+            ids = [f"unit-{index}" for index in range(60)]
+            units = await asyncio.gather(*(bff.get_unit(id=unit_id, fields="id accountId") for unit_id in ids))
+
+        self.assertEqual([result["id"] for result in units], ids)
+        # 60 calls in documents of at most 25 fields
+        self.assertEqual([len(request.fields) for request in self.server.requests], [25, 25, 10])
+        self.assertEqual((bff.stats.requests, bff.stats.calls), (3, 60))
+        self.assertIn(("f1", "getUnit", {"id": "unit-1"}), [request.fields[1] for request in self.server.requests])
+        self.assertEqual({request.token for request in self.server.requests}, {"token-1"})
+
+    async def test_a_failed_field_raises_for_its_call_only(self):
+        async with BffClient(self.server.url, "token-1") as bff:
+            results = await asyncio.gather(
+                bff.get_unit(id="unit-1"), bff.get_unit(id="missing"), bff.get_unit(id="unit-2"),
+                return_exceptions=True,
+            )
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(results[0]["id"], "unit-1")
+        self.assertIsInstance(results[1], GraphQLError)
+        self.assertEqual((str(results[1]), results[1].error_type), ("Unit not found", "NotFound"))
+        self.assertEqual(results[2]["id"], "unit-2")
+
+    async def test_batching_off_sends_a_request_per_call(self):
+        async with BffClient(self.server.url, "token-1", batch_size=1) as bff:
+            await asyncio.gather(*(bff.get_unit(id=f"unit-{index}") for index in range(4)))
+
+        self.assertEqual([len(request.fields) for request in self.server.requests], [1, 1, 1, 1])
+
+
+class TokenRefreshTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.revoked: set[str] = set()
+        self.server = await FakeAppSync(resolve_units, accept=lambda token: token not in self.revoked).start()
+        self.issued = iter(["token-1", "token-2", "token-3"])
+
+        async def fetch() -> str:
+            return next(self.issued)
+
+        self.tokens = RefreshingToken(fetch)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_a_token_rejected_mid_batch_is_refreshed_once_and_the_requests_resent(self):
+        async with BffClient(self.server.url, self.tokens, batch_size=25) as bff:
+            await bff.get_unit(id="unit-0")
+            self.revoked.add("token-1")
+
+            units = await asyncio.gather(*(bff.get_unit(id=f"unit-{index}") for index in range(50)))
+
+        self.assertEqual([result["id"] for result in units], [f"unit-{index}" for index in range(50)])
+        # Both in-flight requests of the batch were rejected; they share one new token
+        self.assertEqual(self.tokens.fetches, 2)
+        self.assertEqual(bff.stats.rejected_tokens, 2)
+        self.assertEqual([request.token for request in self.server.requests],
+                         ["token-1", "token-1", "token-1", "token-2", "token-2"])
+
+    async def test_a_token_rejected_again_after_refreshing_fails_the_calls(self):
+        self.revoked.update({"token-1", "token-2"})
+
+        async with BffClient(self.server.url, self.tokens) as bff:
+            with self.assertRaises(GraphQLError) as raised:
+                await bff.get_unit(id="unit-0")
+
+        self.assertEqual(raised.exception.error_type, "UnauthorizedException")
+        self.assertEqual(len(self.server.requests), 2)
+
+
+class PaginationTest(unittest.IsolatedAsyncioTestCase):
+    PAGES = 10
+    PAGE_SIZE = 3
+
+    async def asyncSetUp(self):
+        def resolve(name: str, arguments: dict) -> object:
+            page = int(arguments.get("cursor") or 0)
+            return {
+                "items": [unit(f"unit-{page * self.PAGE_SIZE + index}") for index in range(self.PAGE_SIZE)],
+                "cursor": str(page + 1) if page + 1 < self.PAGES else None,
+            }
+
+        self.server = await FakeAppSync(resolve).start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    def cursors(self) -> list:
+        return [request.fields[0][2].get("cursor") for request in self.server.requests]
+
+    async def test_iterating_follows_the_cursor_to_the_last_page(self):
+        async with BffClient(self.server.url, "token-1") as bff:
+            ids = [item["id"] async for item in bff.iter_list_units(limit=self.PAGE_SIZE, fields="id")]
+
+        self.assertEqual(ids, [f"unit-{index}" for index in range(self.PAGES * self.PAGE_SIZE)])
+        self.assertEqual(self.cursors(), [None] + [str(page) for page in range(1, self.PAGES)])
+
+    async def test_stopping_early_requests_no_more_than_the_page_fetched_ahead(self):
+        async with BffClient(self.server.url, "token-1") as bff:
+            ids = []
+            async for item in bff.iter_list_units(limit=self.PAGE_SIZE, fields="id"):
+                ids.append(item["id"])
+                if len(ids) == 4:
+                    break
+            await bff.flush()
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(ids, ["unit-0", "unit-1", "unit-2", "unit-3"])
+        # The second page was fetched ahead while the first was consumed, the third never asked for
+        self.assertEqual(self.cursors(), [None, "1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
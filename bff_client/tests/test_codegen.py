@@ -0,0 +1,62 @@
+"""bff_client.codegen: the checked-in schema.py matches the schema, and --check catches drift.
+
+    python -m unittest discover -s bff_client/tests -t .
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from bff_client import codegen
+
+
+class CodegenCheckTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.schema = self.directory / "schema.graphql"
+        self.output = self.directory / "schema.py"
+        shutil.copy(codegen.SCHEMA, self.schema)
+        shutil.copy(codegen.OUTPUT, self.output)
+
+    def check(self) -> tuple[int, str]:
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            status = codegen.main(["--check", "--schema", str(self.schema), "--output", str(self.output)])
+        return status, errors.getvalue()
+
+    def test_the_checked_in_module_is_up_to_date(self):
+        self.assertEqual(codegen.main(["--check"]), 0)
+
+    def test_a_schema_change_without_regenerating_fails_the_check(self):
+        source = self.schema.read_text(encoding="utf-8")
+        self.schema.write_text(source.replace("type Query {", "type Query {\n  ping: String", 1), encoding="utf-8")
+
+        status, errors = self.check()
+
+        self.assertEqual(status, 1)
+        self.assertIn("is out of date", errors)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(codegen.main(["--schema", str(self.schema), "--output", str(self.output)]), 0)
+        self.assertIn("async def ping(", self.output.read_text(encoding="utf-8"))
+        self.assertEqual(self.check(), (0, ""))
+
+    def test_a_hand_edit_of_the_module_fails_the_check(self):
+        self.output.write_text(self.output.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+
+        self.assertEqual(self.check()[0], 1)
+
+    def test_a_missing_module_fails_the_check(self):
+        self.output.unlink()
+
+        self.assertEqual(self.check()[0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
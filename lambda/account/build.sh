@@ -6,6 +6,9 @@ echo "Building Account Lambda..."
 # Clean previous builds
 rm -rf dist lambda.zip
 
+# Make sure the shared sources copied into src/shared are current
+../shared/sync.sh --check
+
 # Install dependencies
 npm install
 
@@ -10,10 +10,12 @@ import {
   AccountPageResponse,
 } from '../types';
 import { AccountsApiService } from '../services/accounts-api.service';
+import { getTenantCache, logger } from '../shared';
 
 export class AccountResolver {
   private readonly accountsApiService: AccountsApiService;
   private readonly accountId: string | undefined;
+  private readonly cache = getTenantCache();
 
   constructor(authToken: string, accountId?: string) {
     this.accountsApiService = new AccountsApiService(authToken);
@@ -23,10 +25,10 @@ export class AccountResolver {
   async handleRequest(event: AppSyncEvent): Promise<unknown> {
     const { fieldName } = event.info;
 
-    console.log(`Handling ${fieldName} request`, {
+    logger.debug('Handling request', () => ({
       arguments: event.arguments,
       identity: event.identity,
-    });
+    }));
 
     switch (fieldName) {
       case 'getAccount':
@@ -52,7 +54,7 @@ export class AccountResolver {
       throw new Error('Unauthorized: You can only access your own account');
     }
 
-    const account = await this.accountsApiService.getAccount(id);
+    const account = await this.loadAccount(id);
     return this.convertTimestamps(account);
   }
 
@@ -64,7 +66,7 @@ export class AccountResolver {
     }
 
     try {
-      const account = await this.accountsApiService.getAccount(this.accountId);
+      const account = await this.loadAccount(this.accountId);
       return {
         items: [this.convertTimestamps(account)],
         hasMore: false,
@@ -98,6 +100,7 @@ export class AccountResolver {
     };
 
     const account = await this.accountsApiService.createAccount(accountData);
+    await this.cache.invalidate(accountId, 'account');
     return this.convertTimestamps(account);
   }
 
@@ -110,6 +113,7 @@ export class AccountResolver {
     }
 
     const account = await this.accountsApiService.updateAccount(id, input);
+    await this.cache.invalidate(id, 'account');
     return this.convertTimestamps(account);
   }
 
@@ -123,6 +127,7 @@ export class AccountResolver {
     }
 
     await this.accountsApiService.deleteAccount(id);
+    await this.cache.invalidate(id, 'account');
 
     return {
       success: true,
@@ -131,6 +136,14 @@ export class AccountResolver {
     };
   }
 
+  /**
+   * Fetch an account through the tenant cache; the caller has already checked
+   * that it is the caller's own account
+   */
+  private loadAccount(id: string): Promise<Account> {
+    return this.cache.getOrLoad(id, 'account', id, () => this.accountsApiService.getAccount(id));
+  }
+
   private convertTimestamps(account: Account): any {
     return {
       ...account,
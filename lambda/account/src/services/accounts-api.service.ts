@@ -8,52 +8,48 @@ import {
   ErrorResponse,
   ValidationErrorResponse,
 } from '../types';
+import { getPooledClient, logger, withAuth } from '../shared';
 
 export class AccountsApiService {
   private readonly client: AxiosInstance;
   private readonly baseUrl: string;
 
-  constructor(authToken: string) {
+  constructor(private readonly authToken: string) {
     this.baseUrl = process.env['ACCOUNTS_API_URL'] || 'https://account-srnext.sb.fullbay.com';
-    
-    this.client = axios.create({
-      baseURL: this.baseUrl,
-      headers: {
-        'Content-Type': 'application/json',
-        Authorization: `Bearer ${authToken}`,
-      },
-      timeout: 30000, // 30 seconds
-    });
 
-    // Add request interceptor for logging
-    this.client.interceptors.request.use(
-      (config) => {
-        console.log(`Making request to ${config.method?.toUpperCase()} ${config.url}`);
-        return config;
-      },
-      (error) => {
-        console.error('Request error:', error);
-        return Promise.reject(error);
-      }
-    );
+    // Pooled client is shared across warm invocations, so interceptors are
+    // registered once and the auth token is added per request
+    this.client = getPooledClient(this.baseUrl, (client) => {
+      // Add request interceptor for logging
+      client.interceptors.request.use(
+        (config) => {
+          logger.debug('API request', { method: config.method?.toUpperCase(), url: config.url });
+          return config;
+        },
+        (error) => {
+          logger.error('API request error', { error });
+          return Promise.reject(error);
+        }
+      );
 
-    // Add response interceptor for error handling
-    this.client.interceptors.response.use(
-      (response) => response,
-      (error: AxiosError<ErrorResponse | ValidationErrorResponse>) => {
-        console.error('Response error:', {
-          status: error.response?.status,
-          data: error.response?.data,
-          message: error.message,
-        });
-        return Promise.reject(error);
-      }
-    );
+      // Add response interceptor for error handling
+      client.interceptors.response.use(
+        (response) => response,
+        (error: AxiosError<ErrorResponse | ValidationErrorResponse>) => {
+          logger.error('API response error', {
+            status: error.response?.status,
+            data: error.response?.data,
+            message: error.message,
+          });
+          return Promise.reject(error);
+        }
+      );
+    });
   }
 
   async getAccount(accountId: string): Promise<Account> {
     try {
-      const response = await this.client.get<Account>(`/accounts/${accountId}`);
+      const response = await this.client.get<Account>(`/accounts/${accountId}`, withAuth(this.authToken));
       return response.data;
     } catch (error) {
       if (axios.isAxiosError(error) && error.response?.status === 404) {
@@ -69,7 +65,7 @@ export class AccountsApiService {
       if (cursor) params['cursor'] = cursor;
       if (limit) params['limit'] = limit;
 
-      const response = await this.client.get<AccountPageResponse>('/accounts', { params });
+      const response = await this.client.get<AccountPageResponse>('/accounts', withAuth(this.authToken, { params }));
       return response.data;
     } catch (error) {
       throw this.handleError(error);
@@ -78,7 +74,7 @@ export class AccountsApiService {
 
   async createAccount(account: AccountCreate): Promise<Account> {
     try {
-      const response = await this.client.post<Account>('/accounts', account);
+      const response = await this.client.post<Account>('/accounts', account, withAuth(this.authToken));
       return response.data;
     } catch (error) {
       if (axios.isAxiosError(error) && error.response?.status === 400) {
@@ -96,7 +92,7 @@ export class AccountsApiService {
 
   async updateAccount(accountId: string, updates: AccountPartialUpdate): Promise<Account> {
     try {
-      const response = await this.client.put<Account>(`/accounts/${accountId}`, updates);
+      const response = await this.client.put<Account>(`/accounts/${accountId}`, updates, withAuth(this.authToken));
       return response.data;
     } catch (error) {
       if (axios.isAxiosError(error)) {
@@ -119,7 +115,7 @@ export class AccountsApiService {
 
   async deleteAccount(accountId: string): Promise<void> {
     try {
-      await this.client.delete(`/accounts/${accountId}`);
+      await this.client.delete(`/accounts/${accountId}`, withAuth(this.authToken));
     } catch (error) {
       if (axios.isAxiosError(error) && error.response?.status === 404) {
         throw new Error(`Account with ID ${accountId} not found`);
@@ -9,10 +9,12 @@ import {
   PaginatedContactResponse,
 } from '../types';
 import { ContactsApiService } from '../services/contacts-api.service';
+import { getTenantCache, logger, spanSync } from '../shared';
 
 export class ContactResolver {
   private readonly contactsApiService: ContactsApiService;
   private readonly jwtAccountId: string | undefined;
+  private readonly cache = getTenantCache();
 
   constructor(authToken: string, jwtAccountId?: string) {
     this.contactsApiService = new ContactsApiService(authToken);
@@ -22,10 +24,10 @@ export class ContactResolver {
   async handleRequest(event: AppSyncEvent): Promise<unknown> {
     const { fieldName } = event.info;
 
-    console.log(`Handling ${fieldName} request`, {
+    logger.debug('Handling request', () => ({
       arguments: event.arguments,
       identity: event.identity,
-    });
+    }));
 
     switch (fieldName) {
       case 'getContact':
@@ -51,7 +53,9 @@ export class ContactResolver {
       throw new Error('Unauthorized: You can only access contacts for your own account');
     }
 
-    const contact = await this.contactsApiService.getContact(accountId, email);
+    const contact = await this.cache.getOrLoad(accountId, 'contact', email, () =>
+      this.contactsApiService.getContact(accountId, email)
+    );
     return this.convertTimestamps(contact);
   }
 
@@ -63,11 +67,23 @@ export class ContactResolver {
       throw new Error('Unauthorized: You can only list contacts for your own account');
     }
 
-    const response = await this.contactsApiService.listContacts(accountId, cursor, limit);
+    const response = await this.cache.getOrLoad(accountId, 'contact', { list: { cursor, limit } }, () =>
+      this.contactsApiService.listContacts(accountId, cursor, limit)
+    );
+
+    // Clients usually ask for the next page right away; load it in the background
+    const nextCursor = response.nextCursor;
+    if (nextCursor !== undefined) {
+      this.cache.prefetch(accountId, 'contact', { list: { cursor: nextCursor, limit } }, () =>
+        this.contactsApiService.listContacts(accountId, nextCursor, limit)
+      );
+    }
     
     return {
       ...response,
-      items: response.items.map(contact => this.convertTimestamps(contact)),
+      items: spanSync('transform', () => response.items.map(contact => this.convertTimestamps(contact)), {
+        rows: response.items.length,
+      }),
     };
   }
 
@@ -77,6 +93,7 @@ export class ContactResolver {
     // For create operation, we allow any accountId as specified in requirements
     // The API will handle validation of the account existence
     const contact = await this.contactsApiService.createContact(accountId, input);
+    await this.cache.invalidate(accountId, 'contact');
     return this.convertTimestamps(contact);
   }
 
@@ -89,6 +106,7 @@ export class ContactResolver {
     }
 
     const contact = await this.contactsApiService.updateContact(accountId, email, input);
+    await this.cache.invalidate(accountId, 'contact');
     return this.convertTimestamps(contact);
   }
 
@@ -101,6 +119,7 @@ export class ContactResolver {
     }
 
     const deletedContact = await this.contactsApiService.deleteContact(accountId, email);
+    await this.cache.invalidate(accountId, 'contact');
     return this.convertTimestamps(deletedContact);
   }
 
@@ -120,7 +139,7 @@ export class ContactResolver {
     const maxTimestamp = 2147483647;
     
     if (seconds > maxTimestamp) {
-      console.warn(`Timestamp ${seconds} exceeds AWSTimestamp max value. Capping at ${maxTimestamp}`);
+      logger.warn('Timestamp exceeds AWSTimestamp max value, capping', { seconds, maxTimestamp });
       return maxTimestamp;
     }
     
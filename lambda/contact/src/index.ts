@@ -2,37 +2,59 @@ import { Handler } from 'aws-lambda';
 
 import { AppSyncEvent } from './types';
 import { ContactResolver } from './handlers/contact-resolver';
+import { logger, resolveBatch, spanSync, withCompactResponses, withDeadline, withProfiling, withTracing } from './shared';
 
-export const handler: Handler = async (event: AppSyncEvent): Promise<unknown> => {
-  console.log('Received event:', JSON.stringify(event, null, 2));
+// AWSJSON fields of the types returned here, passed through as stored
+const JSON_FIELDS = ['config'];
 
-  try {
-    // Extract JWT token from the authorization header
-    const authHeader = event.request?.headers?.['authorization'] || event.request?.headers?.['Authorization'];
-    if (!authHeader) {
-      throw new Error('No authorization header found');
-    }
+export const handler: Handler = withDeadline(withProfiling(withTracing(withCompactResponses(async (event: AppSyncEvent | AppSyncEvent[]): Promise<unknown> => {
+  if (Array.isArray(event)) {
+    // BatchInvoke: one result per item, in order, with per-item errors
+    logger.info('Received batch', { size: event.length });
+    return resolveBatch(event, {}, (item) => logger.runWithField(item.info.fieldName, () => resolveEvent(item)));
+  }
+
+  return logger.runWithField(event.info.fieldName, async () => {
+    logger.debug('Received event', () => ({ event }));
 
-    // Remove 'Bearer ' prefix if present
-    const token = authHeader.startsWith('Bearer ') ? authHeader.slice(7) : authHeader;
+    try {
+      const result = await resolveEvent(event);
 
-    // Extract account ID from the JWT sub claim
-    const jwtAccountId = event.identity?.sub;
-    if (!jwtAccountId) {
-      console.warn('No account ID found in JWT sub claim');
+      logger.debug('Returning result', () => ({ result }));
+      return result;
+    } catch (error) {
+      logger.error('Error processing request', { error });
+
+      // Format error for AppSync
+      const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
+      throw new Error(errorMessage);
     }
+  });
+}, JSON_FIELDS))));
+
+async function resolveEvent(event: AppSyncEvent): Promise<unknown> {
+  const resolver = spanSync('auth', () => createResolver(event));
+  return resolver.handleRequest(event);
+}
 
-    // Create resolver instance and handle the request
-    const resolver = new ContactResolver(token, jwtAccountId);
-    const result = await resolver.handleRequest(event);
-
-    console.log('Returning result:', JSON.stringify(result, null, 2));
-    return result;
-  } catch (error) {
-    console.error('Error processing request:', error);
-    
-    // Format error for AppSync
-    const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
-    throw new Error(errorMessage);
+/**
+ * A resolver acting for the caller's token and account
+ */
+function createResolver(event: AppSyncEvent): ContactResolver {
+  // Extract JWT token from the authorization header
+  const authHeader = event.request?.headers?.['authorization'] || event.request?.headers?.['Authorization'];
+  if (!authHeader) {
+    throw new Error('No authorization header found');
   }
-};
\ No newline at end of file
+
+  // Remove 'Bearer ' prefix if present
+  const token = authHeader.startsWith('Bearer ') ? authHeader.slice(7) : authHeader;
+
+  // Extract account ID from the JWT sub claim
+  const jwtAccountId = event.identity?.sub;
+  if (!jwtAccountId) {
+    logger.warn('No account ID found in JWT sub claim');
+  }
+
+  return new ContactResolver(token, jwtAccountId);
+}
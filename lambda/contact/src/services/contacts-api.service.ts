@@ -7,53 +7,50 @@ import {
   PaginatedContactResponse,
   ErrorResponse,
 } from '../types';
+import { PageStreamOptions, getPooledClient, logger, streamPages, withAuth } from '../shared';
 
 export class ContactsApiService {
   private readonly client: AxiosInstance;
   private readonly baseUrl: string;
 
-  constructor(authToken: string) {
+  constructor(private readonly authToken: string) {
     this.baseUrl = process.env['CONTACTS_API_URL'] || 'https://contact-srnext.sb.fullbay.com';
-    
-    this.client = axios.create({
-      baseURL: this.baseUrl,
-      headers: {
-        'Content-Type': 'application/json',
-        Authorization: `Bearer ${authToken}`,
-      },
-      timeout: 30000, // 30 seconds
-    });
 
-    // Add request interceptor for logging
-    this.client.interceptors.request.use(
-      (config) => {
-        console.log(`Making request to ${config.method?.toUpperCase()} ${config.url}`);
-        return config;
-      },
-      (error) => {
-        console.error('Request error:', error);
-        return Promise.reject(error);
-      }
-    );
+    // Pooled client is shared across warm invocations, so interceptors are
+    // registered once and the auth token is added per request
+    this.client = getPooledClient(this.baseUrl, (client) => {
+      // Add request interceptor for logging
+      client.interceptors.request.use(
+        (config) => {
+          logger.debug('API request', { method: config.method?.toUpperCase(), url: config.url });
+          return config;
+        },
+        (error) => {
+          logger.error('API request error', { error });
+          return Promise.reject(error);
+        }
+      );
 
-    // Add response interceptor for error handling
-    this.client.interceptors.response.use(
-      (response) => response,
-      (error: AxiosError<ErrorResponse>) => {
-        console.error('Response error:', {
-          status: error.response?.status,
-          data: error.response?.data,
-          message: error.message,
-        });
-        return Promise.reject(error);
-      }
-    );
+      // Add response interceptor for error handling
+      client.interceptors.response.use(
+        (response) => response,
+        (error: AxiosError<ErrorResponse>) => {
+          logger.error('API response error', {
+            status: error.response?.status,
+            data: error.response?.data,
+            message: error.message,
+          });
+          return Promise.reject(error);
+        }
+      );
+    });
   }
 
   async getContact(accountId: string, email: string): Promise<Contact> {
     try {
       const response = await this.client.get<Contact>(
-        `/contacts/${encodeURIComponent(accountId)}/${encodeURIComponent(email)}`
+        `/contacts/${encodeURIComponent(accountId)}/${encodeURIComponent(email)}`,
+        withAuth(this.authToken)
       );
       return response.data;
     } catch (error) {
@@ -76,7 +73,7 @@ export class ContactsApiService {
 
       const response = await this.client.get<PaginatedContactResponse>(
         `/contacts/${encodeURIComponent(accountId)}`,
-        { params }
+        withAuth(this.authToken, { params })
       );
       return response.data;
     } catch (error) {
@@ -84,11 +81,19 @@ export class ContactsApiService {
     }
   }
 
+  /**
+   * Stream all of an account's contacts page by page, prefetching the next page
+   */
+  streamContacts(accountId: string, pageSize = 100, options?: PageStreamOptions): AsyncGenerator<Contact[], void, undefined> {
+    return streamPages(cursor => this.listContacts(accountId, cursor, pageSize), options);
+  }
+
   async createContact(accountId: string, contact: ContactInput): Promise<Contact> {
     try {
       const response = await this.client.post<Contact>(
         `/contacts/${encodeURIComponent(accountId)}`,
-        contact
+        contact,
+        withAuth(this.authToken)
       );
       return response.data;
     } catch (error) {
@@ -113,7 +118,8 @@ export class ContactsApiService {
     try {
       const response = await this.client.put<Contact>(
         `/contacts/${encodeURIComponent(accountId)}/${encodeURIComponent(email)}`,
-        updates
+        updates,
+        withAuth(this.authToken)
       );
       return response.data;
     } catch (error) {
@@ -142,7 +148,8 @@ export class ContactsApiService {
       
       // Now delete the contact
       const response = await this.client.delete<Contact>(
-        `/contacts/${encodeURIComponent(accountId)}/${encodeURIComponent(email)}`
+        `/contacts/${encodeURIComponent(accountId)}/${encodeURIComponent(email)}`,
+        withAuth(this.authToken)
       );
       
       // If the delete response has data, use it. Otherwise, return the contact we fetched
@@ -0,0 +1,130 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+interface LruEntry {
+  group: string;
+  value: string;
+  bytes: number;
+  expiresAt: number;
+}
+
+// Map entry, key string and bookkeeping overhead per cached value
+const ENTRY_OVERHEAD_BYTES = 96;
+
+/**
+ * Size of a cached string in memory (V8 strings are UTF-16 in the worst case)
+ */
+function stringBytes(value: string): number {
+  return value.length * 2;
+}
+
+/**
+ * Least-recently-used map of serialized values bounded by an estimated byte
+ * size rather than an entry count, with a per-entry expiry.
+ *
+ * Every entry belongs to a group (for the tenant cache: account and entity
+ * type) so all of a group's entries can be dropped at once without scanning
+ * the whole map.
+ */
+export class ByteBudgetLru {
+  private readonly entries = new Map<string, LruEntry>();
+  private readonly groups = new Map<string, Set<string>>();
+  private totalBytes = 0;
+  private evictionCount = 0;
+
+  constructor(private readonly maxBytes: number) {}
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get bytes(): number {
+    return this.totalBytes;
+  }
+
+  /** Entries dropped to stay under the byte budget */
+  get evictions(): number {
+    return this.evictionCount;
+  }
+
+  /**
+   * The value for `key` if present and not expired; marks it most recently used
+   */
+  get(key: string, now = Date.now()): string | undefined {
+    const entry = this.entries.get(key);
+    if (entry === undefined) {
+      return undefined;
+    }
+    if (entry.expiresAt <= now) {
+      this.delete(key);
+      return undefined;
+    }
+    // Re-insert so Map iteration order stays least- to most-recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * Store a value, evicting least recently used entries until it fits.
+   * Values larger than the whole budget are not stored.
+   */
+  set(key: string, group: string, value: string, ttlMs: number, now = Date.now()): void {
+    const bytes = stringBytes(key) + stringBytes(value) + ENTRY_OVERHEAD_BYTES;
+    this.delete(key);
+    if (bytes > this.maxBytes || ttlMs <= 0) {
+      return;
+    }
+
+    while (this.totalBytes + bytes > this.maxBytes) {
+      const oldest = this.entries.keys().next();
+      if (oldest.done === true) {
+        break;
+      }
+      this.delete(oldest.value);
+      this.evictionCount += 1;
+    }
+
+    this.entries.set(key, { group, value, bytes, expiresAt: now + ttlMs });
+    this.totalBytes += bytes;
+    let members = this.groups.get(group);
+    if (members === undefined) {
+      members = new Set();
+      this.groups.set(group, members);
+    }
+    members.add(key);
+  }
+
+  delete(key: string): void {
+    const entry = this.entries.get(key);
+    if (entry === undefined) {
+      return;
+    }
+    this.entries.delete(key);
+    this.totalBytes -= entry.bytes;
+    const members = this.groups.get(entry.group);
+    members?.delete(key);
+    if (members?.size === 0) {
+      this.groups.delete(entry.group);
+    }
+  }
+
+  /**
+   * Drop every entry in a group; returns how many were removed
+   */
+  deleteGroup(group: string): number {
+    const members = this.groups.get(group);
+    if (members === undefined) {
+      return 0;
+    }
+    const count = members.size;
+    for (const key of [...members]) {
+      this.delete(key);
+    }
+    return count;
+  }
+
+  clear(): void {
+    this.entries.clear();
+    this.groups.clear();
+    this.totalBytes = 0;
+  }
+}
@@ -0,0 +1,378 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { createHash } from 'crypto';
+import fs from 'fs';
+
+import axios, { AxiosAdapter, AxiosError, AxiosHeaders, AxiosResponse, InternalAxiosRequestConfig } from 'axios';
+
+import { logger } from '../logging/logger';
+
+/**
+ * One backend exchange as stored in a fixture: a line of JSON per exchange.
+ * Request headers and bodies are never stored (they carry the caller's
+ * token); a request with a body is matched on its hash instead.
+ */
+export interface RecordedExchange {
+  method: string;
+  /** Path and query string, e.g. "/units/acct-1?limit=20" */
+  url: string;
+  /** Backend host when recorded; informational, replay matches on method and url */
+  host?: string;
+  /** First 16 hex digits of the request body's SHA-1, for requests with a body */
+  bodyHash?: string;
+  requestBytes: number;
+  /** When the request started, in ms since recording began */
+  startMs: number;
+  durationMs: number;
+  /** Absent when no response arrived; `error` then holds its code (ECONNRESET, ECONNABORTED...) */
+  status?: number;
+  headers?: Record<string, string>;
+  /** Response body: parsed JSON, or `text` for anything else */
+  body?: unknown;
+  text?: string;
+  responseBytes?: number;
+  error?: string;
+}
+
+export type TrafficMode = 'off' | 'record' | 'replay';
+
+export interface TrafficOptions {
+  mode: TrafficMode;
+  /** JSON lines fixture: written when recording, read when replaying */
+  fixture: string | undefined;
+  /** Replay from these exchanges instead of `fixture` (tests) */
+  exchanges: readonly RecordedExchange[] | undefined;
+  /** Replayed latency = recorded duration x this; 0 answers at once */
+  latencyScale: number;
+}
+
+export interface TrafficStats {
+  /** Requests that reached the transport (hedges and retries included) */
+  calls: number;
+  /** Most requests in flight at once */
+  peakConcurrency: number;
+  /** Replayed requests with no recorded exchange */
+  unmatched: number;
+  /** Requests per "METHOD /path?query" */
+  routes: Record<string, number>;
+}
+
+/**
+ * Record/replay settings from the environment:
+ *
+ *   HTTP_TRAFFIC_MODE             "record" captures every backend exchange, "replay"
+ *                                 answers from a fixture instead of the network (default off)
+ *   HTTP_TRAFFIC_FIXTURE          fixture file (JSON lines)
+ *   HTTP_TRAFFIC_LATENCY_SCALE    replayed latency as a multiple of the recorded one (default 1)
+ */
+export function trafficOptionsFromEnv(): TrafficOptions {
+  const mode = process.env['HTTP_TRAFFIC_MODE'];
+  const scale = Number(process.env['HTTP_TRAFFIC_LATENCY_SCALE'] ?? '');
+  return {
+    mode: mode === 'record' || mode === 'replay' ? mode : 'off',
+    fixture: process.env['HTTP_TRAFFIC_FIXTURE'] || undefined,
+    exchanges: undefined,
+    latencyScale: process.env['HTTP_TRAFFIC_LATENCY_SCALE'] && Number.isFinite(scale) && scale >= 0 ? scale : 1,
+  };
+}
+
+/**
+ * Read a fixture written by a recording
+ */
+export function loadTrafficFixture(file: string): RecordedExchange[] {
+  return fs
+    .readFileSync(file, 'utf-8')
+    .split('\n')
+    .filter(line => line.trim() !== '')
+    .map(line => JSON.parse(line) as RecordedExchange);
+}
+
+// Volatile or per-connection response headers, left out of fixtures
+const UNRECORDED_HEADERS = new Set([
+  'connection',
+  'date',
+  'keep-alive',
+  'set-cookie',
+  'transfer-encoding',
+  'x-amz-apigw-id',
+  'x-amzn-requestid',
+  'x-amzn-trace-id',
+]);
+
+function requestOf(config: InternalAxiosRequestConfig): Pick<RecordedExchange, 'method' | 'url' | 'host' | 'bodyHash' | 'requestBytes'> {
+  const method = (config.method ?? 'get').toUpperCase();
+  let url: string;
+  let host: string | undefined;
+  try {
+    const parsed = new URL(axios.getUri(config));
+    url = `${parsed.pathname}${parsed.search}`;
+    host = parsed.host;
+  } catch {
+    url = config.url ?? '';
+  }
+  const body = config.data;
+  if (body === undefined || body === null || body === '') {
+    return { method, url, host, requestBytes: 0 };
+  }
+  const payload = typeof body === 'string' || Buffer.isBuffer(body) ? body : JSON.stringify(body);
+  return {
+    method,
+    url,
+    host,
+    bodyHash: createHash('sha1').update(payload).digest('hex').slice(0, 16),
+    requestBytes: Buffer.byteLength(payload),
+  };
+}
+
+function keyOf(exchange: Pick<RecordedExchange, 'method' | 'url' | 'bodyHash'>): string {
+  return exchange.bodyHash === undefined
+    ? `${exchange.method} ${exchange.url}`
+    : `${exchange.method} ${exchange.url} #${exchange.bodyHash}`;
+}
+
+function responseOf(response: AxiosResponse): Pick<RecordedExchange, 'status' | 'headers' | 'body' | 'text' | 'responseBytes'> {
+  const headers: Record<string, string> = {};
+  for (const [name, value] of Object.entries(AxiosHeaders.from(response.headers as AxiosHeaders).toJSON(true))) {
+    if (!UNRECORDED_HEADERS.has(name.toLowerCase()) && value !== undefined && value !== null) {
+      headers[name.toLowerCase()] = String(value);
+    }
+  }
+  const { data } = response;
+  const text = Buffer.isBuffer(data) ? data.toString('utf-8') : typeof data === 'string' ? data : JSON.stringify(data ?? '');
+  try {
+    return { status: response.status, headers, body: JSON.parse(text) as unknown, responseBytes: Buffer.byteLength(text) };
+  } catch {
+    return { status: response.status, headers, text, responseBytes: Buffer.byteLength(text) };
+  }
+}
+
+/**
+ * Counts the requests that reach the transport while a recording or replay
+ * is active: totals, per route, and the most in flight at once.
+ */
+abstract class TrafficTape {
+  private calls = 0;
+  private inFlight = 0;
+  private peakConcurrency = 0;
+  protected unmatched = 0;
+  private readonly routes = new Map<string, number>();
+  protected readonly startedAt = Date.now();
+
+  abstract send(config: InternalAxiosRequestConfig, transport: AxiosAdapter): Promise<AxiosResponse>;
+
+  protected async track<T>(route: string, run: () => Promise<T>): Promise<T> {
+    this.calls += 1;
+    this.routes.set(route, (this.routes.get(route) ?? 0) + 1);
+    this.inFlight += 1;
+    this.peakConcurrency = Math.max(this.peakConcurrency, this.inFlight);
+    try {
+      return await run();
+    } finally {
+      this.inFlight -= 1;
+    }
+  }
+
+  stats(): TrafficStats {
+    return {
+      calls: this.calls,
+      peakConcurrency: this.peakConcurrency,
+      unmatched: this.unmatched,
+      routes: Object.fromEntries(this.routes),
+    };
+  }
+}
+
+/**
+ * Sends every request and keeps the exchange, appending it to `fixture`
+ * as soon as it completes so a container stopped mid-run keeps what it saw.
+ */
+class TrafficRecorder extends TrafficTape {
+  readonly exchanges: RecordedExchange[] = [];
+
+  constructor(private readonly fixture: string | undefined) {
+    super();
+    if (fixture !== undefined) {
+      fs.writeFileSync(fixture, '');
+    }
+  }
+
+  send(config: InternalAxiosRequestConfig, transport: AxiosAdapter): Promise<AxiosResponse> {
+    const request = requestOf(config);
+    return this.track(`${request.method} ${request.url}`, async () => {
+      const startMs = Date.now() - this.startedAt;
+      const save = (outcome: Partial<RecordedExchange>): void =>
+        this.save({ ...request, startMs, durationMs: Date.now() - this.startedAt - startMs, ...outcome });
+      try {
+        const response = await transport(config);
+        save(responseOf(response));
+        return response;
+      } catch (error) {
+        if (axios.isAxiosError(error) && error.response !== undefined) {
+          save(responseOf(error.response));
+        } else if (!axios.isCancel(error)) {
+          save({ error: (error as { code?: string }).code ?? 'ERROR' });
+        }
+        throw error;
+      }
+    });
+  }
+
+  private save(exchange: RecordedExchange): void {
+    this.exchanges.push(exchange);
+    if (this.fixture === undefined) {
+      return;
+    }
+    try {
+      fs.appendFileSync(this.fixture, `${JSON.stringify(exchange)}\n`);
+    } catch (error) {
+      logger.warn('Could not write traffic fixture', { fixture: this.fixture, error: (error as Error).message });
+    }
+  }
+}
+
+/**
+ * Answers requests from recorded exchanges after their recorded latency,
+ * never touching the network. Exchanges recorded for the same request are
+ * served in order, the last one again once they run out. A request with no
+ * recording fails with ETRAFFICMISS.
+ */
+class TrafficReplayer extends TrafficTape {
+  private readonly recorded = new Map<string, RecordedExchange[]>();
+
+  constructor(exchanges: readonly RecordedExchange[], private readonly latencyScale: number) {
+    super();
+    for (const exchange of [...exchanges].sort((a, b) => a.startMs - b.startMs)) {
+      const key = keyOf(exchange);
+      this.recorded.set(key, [...(this.recorded.get(key) ?? []), exchange]);
+    }
+  }
+
+  send(config: InternalAxiosRequestConfig): Promise<AxiosResponse> {
+    const request = requestOf(config);
+    return this.track(`${request.method} ${request.url}`, async () => {
+      const queue = this.recorded.get(keyOf(request));
+      const exchange = queue !== undefined && queue.length > 1 ? queue.shift() : queue?.[0];
+      if (exchange === undefined) {
+        this.unmatched += 1;
+        logger.warn('No recorded exchange for request', { traffic: { method: request.method, url: request.url } });
+        throw new AxiosError(`No recorded exchange for ${request.method} ${request.url}`, 'ETRAFFICMISS', config);
+      }
+      await this.wait(exchange.durationMs * this.latencyScale, config);
+      return this.answer(exchange, config);
+    });
+  }
+
+  /**
+   * The recorded latency, cut short like a real request by the request's
+   * timeout or abort signal
+   */
+  private wait(delayMs: number, config: InternalAxiosRequestConfig): Promise<void> {
+    const timeout = config.timeout !== undefined && config.timeout > 0 ? config.timeout : Infinity;
+    const signal = config.signal as AbortSignal | undefined;
+    return new Promise((resolve, reject) => {
+      const onAbort = (): void => {
+        clearTimeout(timer);
+        reject(new axios.CanceledError(undefined, undefined, config));
+      };
+      const timer = setTimeout(() => {
+        signal?.removeEventListener('abort', onAbort);
+        if (delayMs > timeout) {
+          reject(new AxiosError(`timeout of ${timeout}ms exceeded`, AxiosError.ECONNABORTED, config));
+        } else {
+          resolve();
+        }
+      }, Math.min(delayMs, timeout));
+      if (signal?.aborted) {
+        onAbort();
+      } else {
+        signal?.addEventListener('abort', onAbort, { once: true });
+      }
+    });
+  }
+
+  private answer(exchange: RecordedExchange, config: InternalAxiosRequestConfig): AxiosResponse {
+    if (exchange.status === undefined) {
+      throw new AxiosError(`Recorded failure: ${exchange.error ?? 'ERROR'}`, exchange.error, config);
+    }
+    const response: AxiosResponse = {
+      data: exchange.text ?? (exchange.body === undefined ? '' : JSON.stringify(exchange.body)),
+      status: exchange.status,
+      statusText: '',
+      headers: new AxiosHeaders(exchange.headers ?? {}),
+      config,
+    };
+    const validateStatus = config.validateStatus;
+    if (validateStatus && !validateStatus(exchange.status)) {
+      throw new AxiosError(
+        `Request failed with status code ${exchange.status}`,
+        exchange.status >= 500 ? AxiosError.ERR_BAD_RESPONSE : AxiosError.ERR_BAD_REQUEST,
+        config,
+        undefined,
+        response,
+      );
+    }
+    return response;
+  }
+}
+
+let tape: TrafficTape | undefined;
+let configured = false;
+
+function currentTape(): TrafficTape | undefined {
+  if (!configured) {
+    configureTraffic(trafficOptionsFromEnv());
+  }
+  return tape;
+}
+
+/**
+ * Start recording or replaying backend traffic, replacing any earlier
+ * recording or replay and its stats. Intended for tests and local runs;
+ * without options the settings are read from the environment again.
+ */
+export function configureTraffic(options?: Partial<TrafficOptions>): void {
+  if (options === undefined) {
+    tape = undefined;
+    configured = false;
+    return;
+  }
+  const { mode, fixture, exchanges, latencyScale } = { ...trafficOptionsFromEnv(), ...options };
+  configured = true;
+  if (mode === 'record') {
+    tape = new TrafficRecorder(fixture);
+  } else if (mode === 'replay') {
+    if (exchanges === undefined && fixture === undefined) {
+      throw new Error('Replaying traffic needs a fixture (HTTP_TRAFFIC_FIXTURE)');
+    }
+    tape = new TrafficReplayer(exchanges ?? loadTrafficFixture(fixture as string), latencyScale);
+  } else {
+    tape = undefined;
+  }
+}
+
+/**
+ * Requests, routes and peak concurrency seen since recording or replay
+ * started; undefined when neither is on
+ */
+export function getTrafficStats(): TrafficStats | undefined {
+  return currentTape()?.stats();
+}
+
+/**
+ * The exchanges captured so far by the current recording
+ */
+export function getRecordedExchanges(): RecordedExchange[] {
+  const current = currentTape();
+  return current instanceof TrafficRecorder ? [...current.exchanges] : [];
+}
+
+/**
+ * The transport seen by the pool's adapter chain: the network, recorded, or
+ * replaced by a replay. Sits below tracing, the circuit breakers and hedging,
+ * so replayed latency drives them as the recorded backend did.
+ */
+export function throughTraffic(transport: AxiosAdapter): AxiosAdapter {
+  return config => {
+    const current = currentTape();
+    return current === undefined ? transport(config) : current.send(config, transport);
+  };
+}
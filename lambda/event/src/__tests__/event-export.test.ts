@@ -0,0 +1,316 @@
+import { Readable } from 'stream';
+
+import { EventsApiService } from '../services/events-api.service';
+import {
+  EventExportInvocation,
+  ExportStore,
+  S3ExportStore,
+  TokenSealer,
+  configureEventExports,
+  getEventExport,
+  runEventExport,
+  startEventExport,
+  tokenExpiresAt,
+} from '../services/event-export';
+import { EventCategory, EventExport, EventExportStatus, EventStatus, ListEventsParams, UnitEvent } from '../types';
+
+jest.mock('../services/events-api.service');
+
+// The S3 client S3ExportStore loads, recording each request
+const mockS3 = {
+  putObject: jest.fn(),
+  getObject: jest.fn(),
+  upload: jest.fn(),
+  getSignedUrlPromise: jest.fn(),
+};
+jest.mock('aws-sdk/clients/s3', () => jest.fn(() => mockS3));
+
+const HOUR_MS = 3_600_000;
+const START = Date.parse('2026-01-01T00:00:00.000Z');
+
+const createEvent = (hour: number): UnitEvent => ({
+  accountId: 'acct-1',
+  eventId: `evt-${String(hour).padStart(2, '0')}`,
+  unitId: 'unit-1',
+  eventType: 'inspection',
+  eventCategory: EventCategory.MAINTENANCE,
+  status: EventStatus.CREATED,
+  createdAt: new Date(START + hour * HOUR_MS).toISOString(),
+});
+
+const events = Array.from({ length: 6 }, (_, hour) => createEvent(hour));
+const params: ListEventsParams = {
+  accountId: 'acct-1',
+  from: new Date(START).toISOString(),
+  to: new Date(START + 6 * HOUR_MS - 1).toISOString(),
+};
+
+const jwt = (exp: number): string =>
+  ['e30', Buffer.from(JSON.stringify({ sub: 'acct-1', exp })).toString('base64url'), 'signature'].join('.');
+const inSeconds = (seconds: number): number => Math.floor(Date.now() / 1000) + seconds;
+
+/** Exports kept in memory, keyed as S3ExportStore keys them */
+class MemoryExportStore implements ExportStore {
+  readonly objects = new Map<string, string>();
+
+  async saveManifest(manifest: EventExport): Promise<void> {
+    this.objects.set(`exports/${manifest.accountId}/${manifest.exportId}.json`, JSON.stringify(manifest));
+  }
+
+  async loadManifest(accountId: string, exportId: string): Promise<EventExport | undefined> {
+    const manifest = this.objects.get(`exports/${accountId}/${exportId}.json`);
+    return manifest === undefined ? undefined : (JSON.parse(manifest) as EventExport);
+  }
+
+  async saveEvents(manifest: EventExport, lines: AsyncIterable<string>): Promise<void> {
+    let ndjson = '';
+    for await (const line of lines) {
+      ndjson += line;
+    }
+    this.objects.set(`exports/${manifest.accountId}/${manifest.exportId}.ndjson`, ndjson);
+  }
+
+  async downloadUrl(manifest: EventExport): Promise<string> {
+    return `https://exports.example/${manifest.accountId}/${manifest.exportId}`;
+  }
+}
+
+// Seals a token for one export; unsealing it for another fails, as KMS's encryption context does
+const sealer: TokenSealer = {
+  seal: async (token, manifest) => `${manifest.accountId}/${manifest.exportId}/${Buffer.from(token).toString('hex')}`,
+  unseal: async (sealed, manifest) => {
+    const [accountId, exportId, token] = sealed.split('/');
+    if (accountId !== manifest.accountId || exportId !== manifest.exportId) {
+      throw new Error('InvalidCiphertextException');
+    }
+    return Buffer.from(token!, 'hex').toString('utf8');
+  },
+};
+
+describe('event exports', () => {
+  let store: MemoryExportStore;
+  let invoke: jest.Mock<Promise<void>, [string, EventExportInvocation]>;
+  const listEvents = jest.fn();
+
+  beforeEach(() => {
+    store = new MemoryExportStore();
+    invoke = jest.fn(async () => undefined);
+    configureEventExports({
+      store,
+      functionName: 'srnext-test-event-export',
+      invoke,
+      sealer,
+      timeoutSeconds: 900,
+      scan: { shards: 3, concurrency: 2, minWindowMs: HOUR_MS },
+    });
+    listEvents.mockReset();
+    listEvents.mockImplementation(async (request: ListEventsParams) => {
+      const from = Date.parse(request.from!);
+      const to = Date.parse(request.to!);
+      const items = events.filter(event => Date.parse(event.createdAt) >= from && Date.parse(event.createdAt) <= to);
+      // Newest first, as the backend may list a page
+      return { items: items.reverse(), limit: request.limit, count: items.length };
+    });
+    jest.mocked(EventsApiService).mockClear();
+    jest.mocked(EventsApiService).mockImplementation(() => ({ listEvents }) as unknown as EventsApiService);
+  });
+
+  afterAll(() => {
+    configureEventExports();
+  });
+
+  describe('startEventExport', () => {
+    it('records a RUNNING manifest under the account and invokes the worker with the token sealed for it', async () => {
+      const token = jwt(inSeconds(HOUR_MS / 1000));
+
+      const manifest = await startEventExport(params, token);
+
+      expect(manifest).toMatchObject({
+        accountId: 'acct-1',
+        status: EventExportStatus.RUNNING,
+        from: params.from,
+        to: params.to,
+      });
+      expect(manifest.exportId).toMatch(/^exp_[0-9a-z]+_[0-9a-f]{8}$/);
+      expect([...store.objects.keys()]).toEqual([`exports/acct-1/${manifest.exportId}.json`]);
+      expect(invoke).toHaveBeenCalledTimes(1);
+      const [functionName, payload] = invoke.mock.calls[0]!;
+      expect(functionName).toBe('srnext-test-event-export');
+      expect(payload.eventExport).toMatchObject({ manifest, params });
+      expect(payload.eventExport.authToken).toBeUndefined();
+      expect(JSON.stringify(payload)).not.toContain(token);
+      expect(await sealer.unseal(payload.eventExport.sealedToken!, manifest)).toBe(token);
+    });
+
+    it('refuses a token that expires before the export could queue and run', async () => {
+      await expect(startEventExport(params, jwt(inSeconds(600)))).rejects.toThrow('sign in again');
+
+      expect(store.objects.size).toBe(0);
+      expect(invoke).not.toHaveBeenCalled();
+    });
+
+    it('marks the export FAILED when the worker cannot be invoked', async () => {
+      invoke.mockRejectedValueOnce(new Error('TooManyRequestsException'));
+
+      await expect(startEventExport(params, 'opaque-token')).rejects.toThrow('Could not start event export');
+
+      const [manifest] = [...store.objects.values()].map(value => JSON.parse(value) as EventExport);
+      expect(manifest).toMatchObject({ status: EventExportStatus.FAILED, error: 'TooManyRequestsException' });
+    });
+  });
+
+  describe('runEventExport', () => {
+    const start = async (token: string): Promise<EventExportInvocation> => {
+      await startEventExport(params, token);
+      return invoke.mock.calls[0]![1];
+    };
+
+    it("streams the window's events oldest first as NDJSON and completes the manifest", async () => {
+      const token = jwt(inSeconds(HOUR_MS / 1000));
+      const { eventExport } = await start(token);
+
+      const result = await runEventExport(eventExport);
+
+      expect(result).toMatchObject({ status: EventExportStatus.COMPLETED, count: 6 });
+      expect(EventsApiService).toHaveBeenCalledWith(token);
+      const ndjson = store.objects.get(`exports/acct-1/${result.exportId}.ndjson`)!;
+      expect(ndjson.trimEnd().split('\n').map(line => (JSON.parse(line) as UnitEvent).eventId)).toEqual(
+        events.map(event => event.eventId)
+      );
+      expect(await store.loadManifest('acct-1', result.exportId)).toEqual(result);
+      // Three time shards, one backend page each
+      expect(listEvents).toHaveBeenCalledTimes(3);
+      expect(await getEventExport('acct-1', result.exportId)).toMatchObject({
+        url: `https://exports.example/acct-1/${result.exportId}`,
+      });
+    });
+
+    it('records a failed scan in the manifest instead of throwing', async () => {
+      const { eventExport } = await start('opaque-token');
+      listEvents.mockRejectedValueOnce(new Error('Request failed with status code 503'));
+
+      const result = await runEventExport(eventExport);
+
+      expect(result).toMatchObject({ status: EventExportStatus.FAILED, error: 'Request failed with status code 503' });
+      expect(await store.loadManifest('acct-1', result.exportId)).toEqual(result);
+      expect(store.objects.has(`exports/acct-1/${result.exportId}.ndjson`)).toBe(false);
+    });
+
+    it('fails without a backend call for a token that expired in the queue or was sealed for another export', async () => {
+      const { eventExport } = await start('opaque-token');
+      const expired = { ...eventExport, sealedToken: await sealer.seal(jwt(inSeconds(-5)), eventExport.manifest) };
+      const stolen = { ...eventExport, manifest: { ...eventExport.manifest, exportId: 'exp_other' } };
+
+      expect(await runEventExport(expired)).toMatchObject({
+        status: EventExportStatus.FAILED,
+        error: expect.stringContaining('expired'),
+      });
+      expect(await runEventExport(stolen)).toMatchObject({
+        status: EventExportStatus.FAILED,
+        error: 'InvalidCiphertextException',
+      });
+      expect(listEvents).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('getEventExport', () => {
+    it("reads only the requested account's exports, and fails one whose invocation never ran", async () => {
+      const manifest = await startEventExport(params, 'opaque-token');
+      const stale = { ...manifest, exportId: 'exp_stale', startedAt: manifest.startedAt - 1300 };
+      await store.saveManifest(stale);
+
+      expect(await getEventExport('acct-2', manifest.exportId)).toBeUndefined();
+      expect(await getEventExport('acct-1', manifest.exportId)).toEqual(manifest);
+      expect(await getEventExport('acct-1', 'exp_stale')).toMatchObject({
+        status: EventExportStatus.FAILED,
+        error: 'Export did not finish',
+      });
+    });
+  });
+});
+
+describe('S3ExportStore', () => {
+  const manifest: EventExport = {
+    exportId: 'exp_1',
+    accountId: 'acct-1',
+    status: EventExportStatus.COMPLETED,
+    from: params.from!,
+    to: params.to!,
+    startedAt: 1,
+  };
+  const s3Store = new S3ExportStore('exports-bucket', 'us-west-2', 600);
+
+  beforeEach(() => {
+    Object.values(mockS3).forEach(mock => mock.mockReset());
+  });
+
+  it('keeps manifests and events under exports/{accountId}/{exportId}', async () => {
+    mockS3.putObject.mockReturnValue({ promise: async () => ({}) });
+    mockS3.getObject.mockReturnValue({ promise: async () => ({ Body: Buffer.from(JSON.stringify(manifest)) }) });
+    mockS3.getSignedUrlPromise.mockResolvedValue('https://signed.example');
+
+    await s3Store.saveManifest(manifest);
+    expect(await s3Store.loadManifest('acct-1', 'exp_1')).toEqual(manifest);
+    expect(await s3Store.downloadUrl(manifest)).toBe('https://signed.example');
+
+    expect(mockS3.putObject.mock.calls[0][0]).toMatchObject({
+      Bucket: 'exports-bucket',
+      Key: 'exports/acct-1/exp_1.json',
+    });
+    expect(mockS3.getObject.mock.calls[0][0]).toEqual({ Bucket: 'exports-bucket', Key: 'exports/acct-1/exp_1.json' });
+    expect(mockS3.getSignedUrlPromise).toHaveBeenCalledWith('getObject', {
+      Bucket: 'exports-bucket',
+      Key: 'exports/acct-1/exp_1.ndjson',
+      Expires: 600,
+    });
+  });
+
+  it('treats a missing manifest as no export', async () => {
+    mockS3.getObject.mockReturnValue({
+      promise: async () => Promise.reject(Object.assign(new Error('gone'), { code: 'NoSuchKey' })),
+    });
+
+    expect(await s3Store.loadManifest('acct-1', 'exp_missing')).toBeUndefined();
+  });
+
+  it('streams the events as a multipart upload, and aborts it when the lines fail', async () => {
+    const uploaded: string[] = [];
+    const abort = jest.fn();
+    mockS3.upload.mockImplementation(({ Body }: { Body: Readable }) => ({
+      abort,
+      promise: async () => {
+        for await (const chunk of Body) {
+          uploaded.push(chunk.toString());
+        }
+        return {};
+      },
+    }));
+    async function* lines(fail: boolean): AsyncGenerator<string> {
+      yield '{"eventId":"evt-00"}\n';
+      if (fail) {
+        throw new Error('scan failed');
+      }
+      yield '{"eventId":"evt-01"}\n';
+    }
+
+    await s3Store.saveEvents(manifest, lines(false));
+    expect(uploaded.join('')).toBe('{"eventId":"evt-00"}\n{"eventId":"evt-01"}\n');
+    expect(mockS3.upload.mock.calls[0][0]).toMatchObject({
+      Bucket: 'exports-bucket',
+      Key: 'exports/acct-1/exp_1.ndjson',
+      ContentType: 'application/x-ndjson',
+    });
+    expect(mockS3.upload.mock.calls[0][1]).toMatchObject({ partSize: 5 * 1024 * 1024 });
+
+    await expect(s3Store.saveEvents(manifest, lines(true))).rejects.toThrow('scan failed');
+    expect(abort).toHaveBeenCalled();
+  });
+});
+
+describe('tokenExpiresAt', () => {
+  it("reads a JWT's exp claim, and nothing from other tokens", () => {
+    expect(tokenExpiresAt(jwt(1_800_000_000))).toBe(1_800_000_000);
+    expect(tokenExpiresAt('opaque-token')).toBeUndefined();
+    expect(tokenExpiresAt('a.not-json.c')).toBeUndefined();
+  });
+});
@@ -0,0 +1,190 @@
+import { decodeShardCursor, encodeShardCursor } from '../shared';
+import { EventsApiService } from '../services/events-api.service';
+import {
+  EventScanOptions,
+  eventScanFanOut,
+  planEventScan,
+  scanEventsPage,
+  sortOldestFirst,
+} from '../services/event-scan';
+import { EventCategory, EventStatus, ListEventsParams, PagedEventResponse, UnitEvent } from '../types';
+
+const HOUR_MS = 3_600_000;
+const START = Date.parse('2026-01-01T00:00:00.000Z');
+
+const createEvent = (hour: number, eventId = `evt-${String(hour).padStart(2, '0')}`): UnitEvent => ({
+  accountId: 'acct-1',
+  eventId,
+  unitId: 'unit-1',
+  eventType: 'inspection',
+  eventCategory: EventCategory.MAINTENANCE,
+  status: EventStatus.CREATED,
+  createdAt: new Date(START + hour * HOUR_MS).toISOString(),
+});
+
+// Twelve events an hour apart; a 12 hour window in three shards has four in each
+const events = Array.from({ length: 12 }, (_, hour) => createEvent(hour));
+const window = { from: new Date(START).toISOString(), to: new Date(START + 12 * HOUR_MS - 1).toISOString() };
+const options: EventScanOptions = { shards: 3, concurrency: 2, minWindowMs: HOUR_MS };
+
+type ListEventsMock = jest.Mock<Promise<PagedEventResponse>, [ListEventsParams]>;
+
+/**
+ * An events backend whose pages follow one another in time but list their
+ * events newest first, as a page of a createdAt sort key may; cursors are offsets
+ */
+const createApi = (): { api: EventsApiService; listEvents: ListEventsMock } => {
+  const listEvents = jest.fn(async (params: ListEventsParams): Promise<PagedEventResponse> => {
+    const from = Date.parse(params.from!);
+    const to = Date.parse(params.to!);
+    const matching = events.filter(event => Date.parse(event.createdAt) >= from && Date.parse(event.createdAt) <= to);
+    const offset = Number(params.cursor ?? 0);
+    const limit = params.limit ?? 50;
+    const items = matching.slice(offset, offset + limit).reverse();
+    return {
+      items,
+      ...(offset + limit < matching.length && { nextCursor: String(offset + limit) }),
+      limit,
+      count: items.length,
+    };
+  });
+  return { api: { listEvents } as unknown as EventsApiService, listEvents };
+};
+
+const ids = (page: PagedEventResponse): string[] => page.items.map(event => event.eventId);
+
+describe('planEventScan', () => {
+  const params: ListEventsParams = { accountId: 'acct-1', ...window };
+
+  it('scans a wide window from its first shard', () => {
+    expect(planEventScan(params, options)).toEqual({
+      from: Date.parse(window.from),
+      to: Date.parse(window.to),
+      shards: 3,
+      position: { shard: 0, offset: 0 },
+    });
+  });
+
+  it("pages the backend's way with scanning off, a narrow window or the backend's own cursor", () => {
+    expect(planEventScan(params, { ...options, shards: 1 })).toBeUndefined();
+    expect(planEventScan(params, { ...options, minWindowMs: 24 * HOUR_MS })).toBeUndefined();
+    expect(planEventScan({ ...params, cursor: 'backend-cursor' }, options)).toBeUndefined();
+  });
+
+  it('resumes a scan cursor even with scanning since turned off, and only for its own window', () => {
+    const cursor = encodeShardCursor({
+      from: Date.parse(window.from),
+      to: Date.parse(window.to),
+      shards: 3,
+      position: { shard: 1, cursor: '4', offset: 2 },
+    });
+
+    expect(planEventScan({ ...params, cursor }, { ...options, shards: 1 })?.position).toEqual({
+      shard: 1,
+      cursor: '4',
+      offset: 2,
+    });
+    expect(() => planEventScan({ ...params, to: new Date(START + HOUR_MS).toISOString(), cursor }, options)).toThrow(
+      'Invalid cursor'
+    );
+  });
+});
+
+describe('shards: cursors', () => {
+  it('round-trip a scan position, cursor and offset included', () => {
+    const scan = { from: 1, to: 2000, shards: 8, position: { shard: 3, cursor: 'opaque==', offset: 17 } };
+
+    expect(decodeShardCursor(encodeShardCursor(scan))).toEqual(scan);
+    expect(decodeShardCursor(encodeShardCursor({ ...scan, position: { shard: 0, offset: 0 } }))).toEqual({
+      ...scan,
+      position: { shard: 0, offset: 0 },
+    });
+  });
+
+  it("leave anything else to the backend, and reject a mangled scan cursor's state", () => {
+    expect(decodeShardCursor('backend-cursor')).toBeUndefined();
+    expect(decodeShardCursor('shards:not-json')).toBeUndefined();
+    expect(decodeShardCursor(`shards:${Buffer.from('{"f":1}').toString('base64url')}`)).toBeUndefined();
+  });
+});
+
+describe('scanEventsPage', () => {
+  const params: ListEventsParams = { accountId: 'acct-1', ...window };
+
+  const scanAll = async (limit: number): Promise<{ pages: PagedEventResponse[]; calls: ListEventsParams[] }> => {
+    const { api, listEvents } = createApi();
+    const pages: PagedEventResponse[] = [];
+    let cursor: string | undefined;
+    do {
+      const scan = planEventScan({ ...params, ...(cursor !== undefined && { cursor }) }, options)!;
+      const page = await scanEventsPage(api, params, scan, options, limit);
+      pages.push(page);
+      cursor = page.nextCursor;
+    } while (cursor !== undefined);
+    return { pages, calls: listEvents.mock.calls.map(([call]) => call) };
+  };
+
+  it('returns the window oldest first, in pages that resume across shard boundaries', async () => {
+    const { pages } = await scanAll(5);
+
+    expect(pages.map(ids)).toEqual([
+      ['evt-00', 'evt-01', 'evt-02', 'evt-03', 'evt-04'],
+      ['evt-05', 'evt-06', 'evt-07', 'evt-08', 'evt-09'],
+      ['evt-10', 'evt-11'],
+    ]);
+    // The first page stops one event into the second shard
+    expect(decodeShardCursor(pages[0]!.nextCursor!)?.position).toEqual({ shard: 1, offset: 1 });
+    expect(pages[2]).toMatchObject({ count: 2, limit: 5 });
+  });
+
+  it("resumes mid-shard from the backend page's cursor and offset", async () => {
+    const { pages, calls } = await scanAll(3);
+
+    expect(pages.flatMap(ids)).toEqual(events.map(event => event.eventId));
+    // Shard 0 holds four events: its second backend page is asked for by cursor
+    expect(decodeShardCursor(pages[0]!.nextCursor!)?.position).toEqual({ shard: 0, cursor: '3', offset: 0 });
+    expect(calls).toContainEqual(expect.objectContaining({ from: window.from, cursor: '3', limit: 3 }));
+  });
+
+  it('asks each shard for its own slice of the window with the other filters', async () => {
+    const { api, listEvents } = createApi();
+
+    await scanEventsPage(api, { ...params, unitId: 'unit-1' }, planEventScan(params, options)!, options, 2);
+
+    expect(listEvents.mock.calls[0]![0]).toMatchObject({
+      unitId: 'unit-1',
+      from: '2026-01-01T00:00:00.000Z',
+      to: '2026-01-01T03:59:59.999Z',
+      limit: 2,
+    });
+    // The first shard plus the one read ahead, at most `concurrency` at once
+    expect(new Set(listEvents.mock.calls.map(([call]) => call.from)).size).toBe(2);
+  });
+});
+
+describe('sortOldestFirst', () => {
+  it('orders by createdAt, then eventId, without touching its input', () => {
+    const input = [createEvent(2, 'evt-b'), createEvent(1), createEvent(2, 'evt-a')];
+
+    expect(sortOldestFirst(input).map(event => event.eventId)).toEqual(['evt-01', 'evt-a', 'evt-b']);
+    expect(input[0]!.eventId).toBe('evt-b');
+  });
+});
+
+describe('eventScanFanOut', () => {
+  const scanOptions: EventScanOptions = { shards: 8, concurrency: 4, minWindowMs: HOUR_MS };
+
+  it('counts the shards a scanned page reads at once, and 1 otherwise', () => {
+    const cursor = encodeShardCursor({
+      from: Date.parse(window.from),
+      to: Date.parse(window.to),
+      shards: 8,
+      position: { shard: 6, offset: 0 },
+    });
+
+    expect(eventScanFanOut({ accountId: 'acct-1', ...window }, scanOptions)).toBe(4);
+    expect(eventScanFanOut({ accountId: 'acct-1', ...window, cursor }, scanOptions)).toBe(2);
+    expect(eventScanFanOut({ accountId: 'acct-1', ...window }, { ...scanOptions, shards: 1 })).toBe(1);
+    expect(eventScanFanOut({ accountId: 'acct-1', cursor }, scanOptions)).toBe(1);
+  });
+});
@@ -0,0 +1,259 @@
+import {
+  EventStatusIndex,
+  EventStatusIndexCache,
+  IndexedEvent,
+  compareIndexed,
+  decodeStatusCursor,
+  encodeStatusCursor,
+  mergeSortedStreams,
+  toIndexedEvent,
+} from '../services/event-status-index';
+import { EventCategory, EventStatus, EventWithUnitInfo } from '../types';
+
+const indexed = (eventId: string, status: EventStatus, createdAt: string, unitId = 'unit-1'): IndexedEvent =>
+  toIndexedEvent(
+    {
+      accountId: 'acct-1',
+      eventId,
+      unitId,
+      eventType: 'inspection',
+      eventCategory: EventCategory.MAINTENANCE,
+      status,
+      createdAt,
+      unitInfo: { suggestedVin: `vin-${unitId}` },
+    } as EventWithUnitInfo,
+    createdAt
+  );
+
+const sorted = (entries: IndexedEvent[]): IndexedEvent[] => [...entries].sort(compareIndexed);
+const ids = (events: Array<{ eventId: string }>): string[] => events.map(event => event.eventId);
+
+// Two units' events, each stream sorted; evt-03/evt-04 and evt-06/evt-07 tie on status and createdAt
+const unit1 = sorted([
+  indexed('evt-01', EventStatus.CREATED, '2026-01-03T00:00:00Z'),
+  indexed('evt-04', EventStatus.CREATED, '2026-01-02T00:00:00Z'),
+  indexed('evt-06', EventStatus.ACKNOWLEDGED, '2026-01-01T00:00:00Z'),
+  indexed('evt-09', EventStatus.RESOLVED, '2026-01-05T00:00:00Z'),
+]);
+const unit2 = sorted([
+  indexed('evt-03', EventStatus.CREATED, '2026-01-02T00:00:00Z', 'unit-2'),
+  indexed('evt-07', EventStatus.ACKNOWLEDGED, '2026-01-01T00:00:00Z', 'unit-2'),
+  indexed('evt-08', EventStatus.CLOSED, '2026-01-04T00:00:00Z', 'unit-2'),
+]);
+const unitInfo = new Map([
+  ['unit-1', { suggestedVin: 'vin-unit-1' }],
+  ['unit-2', { suggestedVin: 'vin-unit-2' }],
+]);
+
+// Status (alphabetical), then newest first, then eventId
+const ORDER = ['evt-06', 'evt-07', 'evt-08', 'evt-01', 'evt-03', 'evt-04', 'evt-09'];
+
+const pageThrough = (index: EventStatusIndex, limit: number, statuses?: EventStatus[]): string[][] => {
+  const pages: string[][] = [];
+  let cursor: string | undefined;
+  do {
+    const page = index.page(statuses, cursor === undefined ? undefined : decodeStatusCursor(cursor), limit);
+    pages.push(ids(page.items));
+    cursor = page.nextCursor;
+  } while (cursor !== undefined);
+  return pages;
+};
+
+describe('mergeSortedStreams', () => {
+  it('merges sorted streams into one, breaking createdAt ties by eventId across streams', () => {
+    expect(ids(mergeSortedStreams([unit1, unit2]))).toEqual(ORDER);
+    expect(ids(mergeSortedStreams([unit2, [], unit1]))).toEqual(ORDER);
+  });
+
+  it('handles no streams, empty streams and a single stream', () => {
+    expect(mergeSortedStreams([])).toEqual([]);
+    expect(mergeSortedStreams([[], []])).toEqual([]);
+    expect(mergeSortedStreams([unit1])).toEqual(unit1);
+  });
+});
+
+describe('status cursors', () => {
+  it('round-trip the position of the last event served', () => {
+    const entry = unit1[1]!;
+
+    expect(decodeStatusCursor(encodeStatusCursor(entry))).toEqual({
+      status: entry.event.status,
+      createdAt: entry.createdAtMs,
+      eventId: entry.eventId,
+    });
+  });
+
+  it('decode anything else to undefined', () => {
+    expect(decodeStatusCursor('not a cursor')).toBeUndefined();
+    expect(decodeStatusCursor('')).toBeUndefined();
+    expect(decodeStatusCursor(Buffer.from('null').toString('base64'))).toBeUndefined();
+    const mistyped = { s: 'created', c: 'yesterday', e: 'evt-1' };
+    expect(decodeStatusCursor(Buffer.from(JSON.stringify(mistyped)).toString('base64'))).toBeUndefined();
+    // A legacy offset cursor
+    expect(decodeStatusCursor(Buffer.from('{"offset":20}').toString('base64'))).toBeUndefined();
+  });
+});
+
+describe('EventStatusIndex', () => {
+  const build = (): EventStatusIndex => EventStatusIndex.fromSortedStreams(unitInfo, [unit1, unit2]);
+
+  it('pages through every event exactly once, across ties and status boundaries', () => {
+    const index = build();
+
+    expect(pageThrough(index, 2)).toEqual([
+      ['evt-06', 'evt-07'],
+      ['evt-08', 'evt-01'],
+      ['evt-03', 'evt-04'],
+      ['evt-09'],
+    ]);
+    expect(pageThrough(index, 7)).toEqual([ORDER]);
+    expect(index.size).toBe(7);
+    expect(index.unitInfoFor('unit-2')).toEqual({ suggestedVin: 'vin-unit-2' });
+  });
+
+  it('serves only the requested statuses', () => {
+    expect(pageThrough(build(), 2, [EventStatus.RESOLVED, EventStatus.ACKNOWLEDGED])).toEqual([
+      ['evt-06', 'evt-07'],
+      ['evt-09'],
+    ]);
+  });
+
+  it('resumes after a cursor whose event has since been removed', () => {
+    const index = build();
+    const first = index.page(undefined, undefined, 4);
+
+    index.remove('evt-01');
+
+    expect(ids(first.items)).toEqual(['evt-06', 'evt-07', 'evt-08', 'evt-01']);
+    expect(ids(index.page(undefined, decodeStatusCursor(first.nextCursor!), 4).items)).toEqual([
+      'evt-03',
+      'evt-04',
+      'evt-09',
+    ]);
+  });
+
+  it('keeps segments sorted and the event lookup consistent through upserts and removals', () => {
+    const index = build();
+
+    // A status change moves the event to its new segment
+    index.upsert(indexed('evt-04', EventStatus.CLOSED, '2026-01-02T00:00:00Z'));
+    // A new event lands in its sorted place
+    index.upsert(indexed('evt-02', EventStatus.CREATED, '2026-01-02T00:00:00Z'));
+    // Replacing an event with the same key does not duplicate it
+    index.upsert(indexed('evt-09', EventStatus.RESOLVED, '2026-01-05T00:00:00Z'));
+    index.remove('evt-07');
+    index.remove('evt-missing');
+
+    expect(pageThrough(index, 3)).toEqual([
+      ['evt-06', 'evt-08', 'evt-04'],
+      ['evt-01', 'evt-02', 'evt-03'],
+      ['evt-09'],
+    ]);
+    expect(index.size).toBe(7);
+    expect(index.page([EventStatus.CLOSED], undefined, 10).items.map(event => event.status)).toEqual([
+      EventStatus.CLOSED,
+      EventStatus.CLOSED,
+    ]);
+
+    index.remove('evt-04');
+    index.upsert(indexed('evt-04', EventStatus.CREATED, '2026-01-02T00:00:00Z'));
+    expect(pageThrough(index, 10)).toEqual([['evt-06', 'evt-08', 'evt-01', 'evt-02', 'evt-03', 'evt-04', 'evt-09']]);
+  });
+});
+
+describe('EventStatusIndexCache', () => {
+  const index = EventStatusIndex.fromSortedStreams(unitInfo, [unit1]);
+  let now: number;
+
+  beforeEach(() => {
+    now = 1_000_000;
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('serves a built index until its TTL expires, then builds it again', async () => {
+    const cache = new EventStatusIndexCache(60_000);
+    const build = jest.fn(async () => ({ index, complete: true }));
+
+    expect(await cache.get('acct-1', build)).toBe(index);
+    now += 59_999;
+    expect(await cache.get('acct-1', build)).toBe(index);
+    expect(build).toHaveBeenCalledTimes(1);
+
+    now += 1;
+    expect(cache.peek('acct-1')).toBeUndefined();
+    await cache.get('acct-1', build);
+    expect(build).toHaveBeenCalledTimes(2);
+  });
+
+  it('shares one build between concurrent requests and keeps accounts apart', async () => {
+    const cache = new EventStatusIndexCache(60_000);
+    const build = jest.fn(async () => ({ index, complete: true }));
+
+    await Promise.all([cache.get('acct-1', build), cache.get('acct-1', build), cache.get('acct-2', build)]);
+
+    expect(build).toHaveBeenCalledTimes(2);
+  });
+
+  it('does not cache a build that a mutation overtook, nor share it with later requests', async () => {
+    const cache = new EventStatusIndexCache(60_000);
+    const builds: Array<(result: { index: EventStatusIndex; complete: boolean }) => void> = [];
+    const build = jest.fn(() => new Promise<{ index: EventStatusIndex; complete: boolean }>(resolve => builds.push(resolve)));
+
+    const before = cache.get('acct-1', build);
+    // An event created while the first build is reading the units' events
+    cache.changed('acct-1');
+    const after = cache.get('acct-1', build);
+    expect(build).toHaveBeenCalledTimes(2);
+
+    const stale = EventStatusIndex.fromSortedStreams(unitInfo, []);
+    builds[0]!({ index: stale, complete: true });
+    expect(await before).toBe(stale);
+    expect(cache.peek('acct-1')).toBeUndefined();
+
+    builds[1]!({ index, complete: true });
+    expect(await after).toBe(index);
+    expect(cache.peek('acct-1')).toBe(index);
+  });
+
+  it('keeps at most maxAccounts indexes, dropping the least recently used first', async () => {
+    const cache = new EventStatusIndexCache(60_000, 2);
+    const build = async () => ({ index, complete: true });
+
+    await cache.get('acct-1', build);
+    await cache.get('acct-2', build);
+    cache.peek('acct-1');
+    await cache.get('acct-3', build);
+
+    expect(cache.peek('acct-2')).toBeUndefined();
+    expect(cache.peek('acct-1')).toBe(index);
+    expect(cache.peek('acct-3')).toBe(index);
+  });
+
+  it('drops expired indexes when it stores one, without waiting for their accounts to come back', async () => {
+    const cache = new EventStatusIndexCache(60_000);
+    const build = async () => ({ index, complete: true });
+
+    await cache.get('acct-1', build);
+    await cache.get('acct-2', build);
+    now += 60_000;
+    await cache.get('acct-3', build);
+
+    expect(cache.size).toBe(1);
+  });
+
+  it('never caches a partial index, and drops an invalidated one', async () => {
+    const cache = new EventStatusIndexCache(60_000);
+
+    await cache.get('acct-1', async () => ({ index, complete: false }));
+    expect(cache.peek('acct-1')).toBeUndefined();
+
+    await cache.get('acct-1', async () => ({ index, complete: true }));
+    expect(cache.peek('acct-1')).toBe(index);
+    cache.invalidate('acct-1');
+    expect(cache.peek('acct-1')).toBeUndefined();
+  });
+});
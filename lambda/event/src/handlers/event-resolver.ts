@@ -10,11 +10,85 @@ import {
   DeleteEventParams,
   ListEventsParams,
   EventsByStatusConnection,
-  EventWithUnitInfo,
   EventStatus,
+  UnitInfo,
+  EventExport,
+  EventExportInput,
 } from '../types';
 import { EventsApiService } from '../services/events-api.service';
 import { UnitsApiService } from '../services/units-api.service';
+import { DEFAULT_SCAN_LIMIT, eventScanOptionsFromEnv, planEventScan, scanEventsPage } from '../services/event-scan';
+import type {
+  EventStatusIndex,
+  EventStatusIndexCache,
+  IndexedEvent,
+  StatusIndexPosition,
+} from '../services/event-status-index';
+import { Selection, changeOf, envInt, logger, mapWithConcurrency, projectAll, publishChanges } from '../shared';
+
+// Event fields kept in projected rows: nested resolvers (EventWithUnitInfo.unit) read them
+const EVENT_KEY_FIELDS = ['accountId', 'eventId', 'unitId'] as const;
+
+/**
+ * A backend event as the GraphQL Event type returns it, with AWSTimestamp
+ * (epoch seconds) timestamps
+ */
+export function convertTimestamps(unitEvent: UnitEvent): any {
+  return {
+    ...unitEvent,
+    // Projected rows may leave createdAt out
+    createdAt: unitEvent.createdAt 
+      ? Math.floor(new Date(unitEvent.createdAt).getTime() / 1000) 
+      : undefined,
+    updatedAt: unitEvent.updatedAt 
+      ? Math.floor(new Date(unitEvent.updatedAt).getTime() / 1000) 
+      : undefined,
+    acknowledgedAt: unitEvent.acknowledgedAt 
+      ? Math.floor(new Date(unitEvent.acknowledgedAt).getTime() / 1000) 
+      : undefined,
+    deletedAt: unitEvent.deletedAt 
+      ? Math.floor(new Date(unitEvent.deletedAt).getTime() / 1000) 
+      : undefined,
+  };
+}
+
+type StatusIndexModule = typeof import('../services/event-status-index');
+
+interface LoadedStatusIndex {
+  api: StatusIndexModule;
+  cache: EventStatusIndexCache;
+}
+
+// Only listEventsByStatus needs the status index, so its module is loaded on
+// first use instead of during every cold start. Once loaded, the cache lives in
+// module scope so indexes are reused across warm invocations.
+let statusIndex: LoadedStatusIndex | undefined;
+let statusIndexLoading: Promise<LoadedStatusIndex> | undefined;
+
+function loadStatusIndex(): Promise<LoadedStatusIndex> {
+  statusIndexLoading ??= import('../services/event-status-index').then(api => {
+    statusIndex = {
+      api,
+      cache: new api.EventStatusIndexCache(
+        envInt('EVENT_STATUS_INDEX_TTL_MS', 60000),
+        envInt('EVENT_STATUS_INDEX_MAX_ACCOUNTS', 16)
+      ),
+    };
+    return statusIndex;
+  });
+  return statusIndexLoading;
+}
+
+type EventExportModule = typeof import('../services/event-export');
+
+// Exports are rare, and their module (and the AWS SDK clients it loads) is
+// only loaded by the first export request
+let eventExportLoading: Promise<EventExportModule> | undefined;
+
+function loadEventExport(): Promise<EventExportModule> {
+  eventExportLoading ??= import('../services/event-export');
+  return eventExportLoading;
+}
 
 export interface GetEventArguments {
   accountId: string;
@@ -57,12 +131,22 @@ export interface ListEventsByStatusArguments {
   limit?: number;
 }
 
+export interface StartEventExportArguments {
+  accountId: string;
+  input: EventExportInput;
+}
+
+export interface GetEventExportArguments {
+  accountId: string;
+  exportId: string;
+}
+
 export class EventResolver {
   private readonly eventsApiService: EventsApiService;
   private readonly unitsApiService: UnitsApiService;
   private readonly jwtAccountId: string | undefined;
 
-  constructor(authToken: string, jwtAccountId?: string) {
+  constructor(private readonly authToken: string, jwtAccountId?: string) {
     this.eventsApiService = new EventsApiService(authToken);
     this.unitsApiService = new UnitsApiService(authToken);
     this.jwtAccountId = jwtAccountId;
@@ -71,10 +155,10 @@ export class EventResolver {
   async handleRequest(event: AppSyncEvent): Promise<unknown> {
     const { fieldName } = event.info;
 
-    console.log(`Handling ${fieldName} request`, {
+    logger.debug('Handling request', () => ({
       arguments: event.arguments,
       identity: event.identity,
-    });
+    }));
 
     switch (fieldName) {
       case 'getEvent':
@@ -89,6 +173,10 @@ export class EventResolver {
         return this.updateEvent(event as unknown as AppSyncEvent<UpdateEventArguments>);
       case 'deleteEvent':
         return this.deleteEvent(event as unknown as AppSyncEvent<DeleteEventArguments>);
+      case 'startEventExport':
+        return this.startEventExport(event as unknown as AppSyncEvent<StartEventExportArguments>);
+      case 'getEventExport':
+        return this.getEventExport(event as unknown as AppSyncEvent<GetEventExportArguments>);
       default:
         throw new Error(`Unknown field: ${fieldName}`);
     }
@@ -104,7 +192,7 @@ export class EventResolver {
 
     const params: GetEventParams = { accountId, eventId };
     const unitEvent = await this.eventsApiService.getEvent(params);
-    return this.convertTimestamps(unitEvent);
+    return convertTimestamps(unitEvent);
   }
 
   private async listEvents(event: AppSyncEvent<ListEventsArguments>): Promise<PagedEventResponse> {
@@ -141,11 +229,19 @@ export class EventResolver {
       limit,
     };
 
-    const response = await this.eventsApiService.listEvents(params);
-    
+    // A wide from/to window is read as time shards fetched concurrently
+    const scanOptions = eventScanOptionsFromEnv();
+    const scan = planEventScan(params, scanOptions);
+    const response = scan
+      ? await scanEventsPage(this.eventsApiService, params, scan, scanOptions, limit ?? DEFAULT_SCAN_LIMIT)
+      : await this.eventsApiService.listEvents(params);
+
+    // Project before converting so unselected timestamps are never parsed
+    const items = projectAll(response.items, Selection.fromEvent(event).at('items'), EVENT_KEY_FIELDS);
+
     return {
       ...response,
-      items: response.items.map(unitEvent => this.convertTimestamps(unitEvent)),
+      items: items.map(unitEvent => convertTimestamps(unitEvent)),
     };
   }
 
@@ -161,10 +257,13 @@ export class EventResolver {
     // Transform the input to match backend API requirements
     const transformedInput = this.transformCreateEventInput(input);
 
-    console.log('Transformed create event input:', JSON.stringify(transformedInput, null, 2));
+    logger.debug('Transformed create event input', () => ({ input: transformedInput }));
 
     const unitEvent = await this.eventsApiService.createEvent(transformedInput);
-    return this.convertTimestamps(unitEvent);
+    this.applyToStatusIndex(unitEvent.accountId, unitEvent);
+    const created = convertTimestamps(unitEvent);
+    await publishChanges([changeOf('Event', 'CREATED', created.accountId, created.eventId, created)]);
+    return created;
   }
 
   private async updateEvent(event: AppSyncEvent<UpdateEventArguments>): Promise<UnitEvent> {
@@ -177,7 +276,10 @@ export class EventResolver {
 
     const params: UpdateEventParams = { accountId, eventId };
     const unitEvent = await this.eventsApiService.updateEvent(params, input);
-    return this.convertTimestamps(unitEvent);
+    this.applyToStatusIndex(accountId, unitEvent);
+    const updated = convertTimestamps(unitEvent);
+    await publishChanges([changeOf('Event', 'UPDATED', accountId, eventId, updated, Object.keys(input))]);
+    return updated;
   }
 
   private async deleteEvent(event: AppSyncEvent<DeleteEventArguments>): Promise<DeleteEventResponse> {
@@ -190,6 +292,11 @@ export class EventResolver {
 
     const params: DeleteEventParams = { accountId, eventId };
     await this.eventsApiService.deleteEvent(params);
+    if (statusIndex) {
+      statusIndex.cache.peek(accountId)?.remove(eventId);
+      statusIndex.cache.changed(accountId);
+    }
+    await publishChanges([changeOf('Event', 'DELETED', accountId, eventId)]);
 
     return {
       success: true,
@@ -199,6 +306,36 @@ export class EventResolver {
     };
   }
 
+  private async startEventExport(event: AppSyncEvent<StartEventExportArguments>): Promise<EventExport> {
+    const { accountId, input } = event.arguments;
+
+    // Verify that the account being exported matches the JWT sub claim
+    if (accountId !== this.jwtAccountId) {
+      throw new Error('Unauthorized: You can only export events for your own account');
+    }
+
+    const from = Date.parse(input.from);
+    const to = Date.parse(input.to);
+    if (Number.isNaN(from) || Number.isNaN(to) || to < from) {
+      throw new Error('Invalid export window: from and to must be timestamps, from before to');
+    }
+
+    const exports = await loadEventExport();
+    return exports.startEventExport({ ...input, accountId }, this.authToken);
+  }
+
+  private async getEventExport(event: AppSyncEvent<GetEventExportArguments>): Promise<EventExport | null> {
+    const { accountId, exportId } = event.arguments;
+
+    // Verify that the requested account ID matches the JWT sub claim
+    if (accountId !== this.jwtAccountId) {
+      throw new Error('Unauthorized: You can only access exports for your own account');
+    }
+
+    const exports = await loadEventExport();
+    return (await exports.getEventExport(accountId, exportId)) ?? null;
+  }
+
   private transformCreateEventInput(input: any): any {
     // Generate required fields that are missing from GraphQL input
     const transformedInput = {
@@ -253,22 +390,6 @@ export class EventResolver {
     return typeMapping[eventType] || 'other';
   }
 
-  private convertTimestamps(unitEvent: UnitEvent): any {
-    return {
-      ...unitEvent,
-      createdAt: Math.floor(new Date(unitEvent.createdAt).getTime() / 1000),
-      updatedAt: unitEvent.updatedAt 
-        ? Math.floor(new Date(unitEvent.updatedAt).getTime() / 1000) 
-        : undefined,
-      acknowledgedAt: unitEvent.acknowledgedAt 
-        ? Math.floor(new Date(unitEvent.acknowledgedAt).getTime() / 1000) 
-        : undefined,
-      deletedAt: unitEvent.deletedAt 
-        ? Math.floor(new Date(unitEvent.deletedAt).getTime() / 1000) 
-        : undefined,
-    };
-  }
-
   private async listEventsByStatus(event: AppSyncEvent<ListEventsByStatusArguments>): Promise<EventsByStatusConnection> {
     const { accountId, status: statusFilter, cursor, limit = 20 } = event.arguments;
 
@@ -277,125 +398,121 @@ export class EventResolver {
       throw new Error('Unauthorized: You can only list events for your own account');
     }
 
-    console.log(`Fetching events by status for account ${accountId}`, { statusFilter, cursor, limit });
+    logger.debug('Fetching events by status', { accountId, statusFilter, cursor, limit });
 
-    // Step 1: Get all units for the account
-    console.log('Step 1: Fetching all units for account');
-    const units = await this.unitsApiService.getAllUnits(accountId);
-    console.log(`Found ${units.length} units`);
+    const { api, cache } = await loadStatusIndex();
 
-    // Create a map of unitId to unit info for quick lookup
-    const unitInfoMap = new Map(units.map(unit => [
-      unit.id,
-      {
-        model: unit.model,
-        modelYear: unit.modelYear,
-        suggestedVin: unit.suggestedVin,
+    let after: StatusIndexPosition | undefined;
+    if (cursor) {
+      after = api.decodeStatusCursor(cursor);
+      if (!after) {
+        // Invalid or legacy offset cursor, start from beginning
+        logger.warn('Invalid cursor, starting from the first page', { cursor });
       }
-    ]));
-
-    // Step 2: Get all events for all units
-    console.log('Step 2: Fetching events for all units');
-    const allEvents: EventWithUnitInfo[] = [];
-    
-    // Fetch events for each unit in parallel (batch by 10 to avoid overwhelming the API)
-    const batchSize = 10;
-    for (let i = 0; i < units.length; i += batchSize) {
-      const unitBatch = units.slice(i, i + batchSize);
-      const eventPromises = unitBatch.map(async (unit) => {
-        try {
-          const params: ListEventsParams = {
-            accountId,
-            unitId: unit.id,
-            // If status filter is provided, we'll filter after getting all events
-            // since we need to sort across all units
-          };
-          
-          const response = await this.eventsApiService.listEvents(params);
-          
-          // Add unit info to each event
-          return response.items.map(unitEvent => ({
-            ...this.convertTimestamps(unitEvent),
-            unitInfo: unitInfoMap.get(unit.id) || {
-              model: undefined,
-              modelYear: undefined,
-              suggestedVin: unit.suggestedVin,
-            },
-          }));
-        } catch (error) {
-          console.error(`Error fetching events for unit ${unit.id}:`, error);
-          // Return empty array if there's an error for this unit
-          return [];
-        }
-      });
-      
-      const batchResults = await Promise.all(eventPromises);
-      batchResults.forEach(events => allEvents.push(...events));
     }
 
-    console.log(`Total events fetched: ${allEvents.length}`);
+    const index = await cache.get(accountId, () => this.buildStatusIndex(api, accountId));
+    const page = index.page(statusFilter, after, limit);
 
-    // Step 3: Filter by status if specified
-    let filteredEvents = allEvents;
-    if (statusFilter && statusFilter.length > 0) {
-      filteredEvents = allEvents.filter(event => 
-        statusFilter.includes(event.status as EventStatus)
-      );
-      console.log(`Events after status filter: ${filteredEvents.length}`);
-    }
+    return {
+      // Indexed events are shared across requests; projection copies only the selected fields,
+      // and each unit's unitInfo is projected once and shared by its events
+      items: projectAll(page.items, Selection.fromEvent(event).at('items'), EVENT_KEY_FIELDS, { unitInfo: [] }),
+      nextCursor: page.nextCursor,
+      limit,
+      count: page.items.length,
+    };
+  }
 
-    // Step 4: Sort events by status (alphabetically)
-    const statusOrder = [
-      EventStatus.ACKNOWLEDGED,
-      EventStatus.CANCELLED,
-      EventStatus.CLOSED,
-      EventStatus.CREATED,
-      EventStatus.ESCALATED,
-      EventStatus.IN_PROGRESS,
-      EventStatus.ON_HOLD,
-      EventStatus.RESOLVED,
-    ];
-
-    filteredEvents.sort((a, b) => {
-      const statusIndexA = statusOrder.indexOf(a.status as EventStatus);
-      const statusIndexB = statusOrder.indexOf(b.status as EventStatus);
-      
-      // First sort by status
-      if (statusIndexA !== statusIndexB) {
-        return statusIndexA - statusIndexB;
+  /**
+   * Build the account's status index: stream the units page by page, fetch
+   * each page's events with bounded concurrency while the next page of units
+   * is requested, sort each (small) per-unit stream once, then k-way merge them.
+   */
+  private async buildStatusIndex(
+    api: StatusIndexModule,
+    accountId: string
+  ): Promise<{ index: EventStatusIndex; complete: boolean }> {
+    logger.info('Building status index', { accountId });
+
+    const unitInfoMap = new Map<string, UnitInfo>();
+    const streams: IndexedEvent[][] = [];
+    const concurrency = envInt('EVENT_INDEX_CONCURRENCY', 10);
+    let complete = true;
+
+    for await (const units of this.unitsApiService.streamUnits(accountId)) {
+      for (const unit of units) {
+        unitInfoMap.set(unit.id, {
+          model: unit.model,
+          modelYear: unit.modelYear,
+          suggestedVin: unit.suggestedVin,
+        });
       }
-      
-      // Then sort by createdAt timestamp (newest first)
-      return new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime();
-    });
 
-    // Step 5: Implement cursor-based pagination
-    let startIndex = 0;
-    if (cursor) {
-      try {
-        // Decode cursor (base64 encoded index)
-        startIndex = parseInt(Buffer.from(cursor, 'base64').toString('utf-8'), 10);
-      } catch (error) {
-        console.error('Invalid cursor:', error);
-        // Invalid cursor, start from beginning
-        startIndex = 0;
-      }
+      const pageStreams = await mapWithConcurrency(
+        units,
+        concurrency,
+        async (unit): Promise<IndexedEvent[]> => {
+          try {
+            const unitEvents = await this.listAllUnitEvents(accountId, unit.id);
+            const unitInfo = unitInfoMap.get(unit.id)!;
+            return unitEvents
+              .map(unitEvent => this.toIndexedEvent(api, unitEvent, unitInfo))
+              .sort(api.compareIndexed);
+          } catch (error) {
+            logger.error('Error fetching events for unit', { unitId: unit.id, error });
+            complete = false;
+            return [];
+          }
+        }
+      );
+      streams.push(...pageStreams);
     }
 
-    const endIndex = startIndex + limit;
-    const paginatedEvents = filteredEvents.slice(startIndex, endIndex);
-    
-    // Create next cursor if there are more events
-    let nextCursor: string | undefined;
-    if (endIndex < filteredEvents.length) {
-      nextCursor = Buffer.from(endIndex.toString()).toString('base64');
-    }
+    const index = api.EventStatusIndex.fromSortedStreams(unitInfoMap, streams);
+    logger.info('Status index built', { accountId, units: unitInfoMap.size, events: index.size, complete });
+    return { index, complete };
+  }
 
-    return {
-      items: paginatedEvents,
-      nextCursor,
-      limit,
-      count: paginatedEvents.length,
-    };
+  private async listAllUnitEvents(accountId: string, unitId: string): Promise<UnitEvent[]> {
+    const unitEvents: UnitEvent[] = [];
+    let cursor: string | undefined;
+    do {
+      const response = await this.eventsApiService.listEvents({ accountId, unitId, cursor });
+      unitEvents.push(...response.items);
+      cursor = response.nextCursor || undefined;
+    } while (cursor);
+    return unitEvents;
   }
-}
\ No newline at end of file
+
+  private toIndexedEvent(api: StatusIndexModule, unitEvent: UnitEvent, unitInfo: UnitInfo): IndexedEvent {
+    return api.toIndexedEvent(
+      { ...convertTimestamps(unitEvent), unitInfo },
+      unitEvent.createdAt
+    );
+  }
+
+  /**
+   * Apply a created or updated event to this container's cached status index
+   */
+  private applyToStatusIndex(accountId: string, unitEvent: UnitEvent): void {
+    if (!statusIndex) {
+      // No listEventsByStatus in this container yet, so there is nothing to update
+      return;
+    }
+    const { api, cache } = statusIndex;
+    // A build still running may have missed this change; it is not cached
+    cache.changed(accountId);
+    const index = cache.peek(accountId);
+    if (!index) {
+      return;
+    }
+    const unitInfo = index.unitInfoFor(unitEvent.unitId);
+    if (!unitInfo) {
+      // Event for a unit the index has not seen; rebuild on next read
+      cache.invalidate(accountId);
+      return;
+    }
+    index.upsert(this.toIndexedEvent(api, unitEvent, unitInfo));
+  }
+}
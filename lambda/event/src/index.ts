@@ -2,37 +2,88 @@ import { Handler } from 'aws-lambda';
 
 import { AppSyncEvent } from './types';
 import { EventResolver } from './handlers/event-resolver';
+import type { EventExportInvocation } from './services/event-export';
+import { eventScanFanOut } from './services/event-scan';
+import {
+  FieldCosts,
+  logger,
+  resolveBatch,
+  spanSync,
+  withAdmission,
+  withCompactResponses,
+  withDeadline,
+  withProfiling,
+  withTracing,
+} from './shared';
 
-export const handler: Handler = async (event: AppSyncEvent): Promise<unknown> => {
-  console.log('Received event:', JSON.stringify(event, null, 2));
+/**
+ * Admission cost of the event fields (see withAdmission). listEventsByStatus
+ * may have to build the account's status index, which reads every unit's
+ * events; a scanned listEvents page is charged for every shard it reads at once.
+ */
+const FIELD_COSTS: FieldCosts = {
+  listEvents: { base: 2, limitArg: 'limit', maxLimit: 200, fanOut: args => eventScanFanOut(args) },
+  listEventsByStatus: { base: 10, limitArg: 'limit', defaultLimit: 20, maxLimit: 100 },
+  startEventExport: { base: 20 },
+};
 
-  try {
-    // Extract JWT token from the authorization header
-    const authHeader = event.request?.headers?.['authorization'] || event.request?.headers?.['Authorization'];
-    if (!authHeader) {
-      throw new Error('No authorization header found');
-    }
+// AWSJSON fields of the types returned here, passed through as stored
+const JSON_FIELDS = ['extendedAttributes'];
+
+export const handler: Handler = withDeadline(withProfiling(withTracing(withAdmission(FIELD_COSTS, withCompactResponses(async (event: AppSyncEvent | AppSyncEvent[] | EventExportInvocation): Promise<unknown> => {
+  if ('eventExport' in event) {
+    // Asynchronous invocation made by startEventExport
+    const { runEventExport } = await import('./services/event-export');
+    return logger.runWithField('eventExport', () => runEventExport(event.eventExport));
+  }
+
+  if (Array.isArray(event)) {
+    // BatchInvoke: one result per item, in order, with per-item errors
+    logger.info('Received batch', { size: event.length });
+    return resolveBatch(event, {}, (item) => logger.runWithField(item.info.fieldName, () => resolveEvent(item)));
+  }
+
+  return logger.runWithField(event.info.fieldName, async () => {
+    logger.debug('Received event', () => ({ event }));
 
-    // Remove 'Bearer ' prefix if present
-    const token = authHeader.startsWith('Bearer ') ? authHeader.slice(7) : authHeader;
+    try {
+      const result = await resolveEvent(event);
 
-    // Extract account ID from the JWT sub claim
-    const jwtAccountId = event.identity?.sub;
-    if (!jwtAccountId) {
-      console.warn('No account ID found in JWT sub claim');
+      logger.debug('Returning result', () => ({ result }));
+      return result;
+    } catch (error) {
+      logger.error('Error processing request', { error });
+
+      // Format error for AppSync
+      const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
+      throw new Error(errorMessage);
     }
+  });
+}, JSON_FIELDS)))));
+
+async function resolveEvent(event: AppSyncEvent): Promise<unknown> {
+  const resolver = spanSync('auth', () => createResolver(event));
+  return resolver.handleRequest(event);
+}
+
+/**
+ * A resolver acting for the caller's token and account
+ */
+function createResolver(event: AppSyncEvent): EventResolver {
+  // Extract JWT token from the authorization header
+  const authHeader = event.request?.headers?.['authorization'] || event.request?.headers?.['Authorization'];
+  if (!authHeader) {
+    throw new Error('No authorization header found');
+  }
+
+  // Remove 'Bearer ' prefix if present
+  const token = authHeader.startsWith('Bearer ') ? authHeader.slice(7) : authHeader;
 
-    // Create resolver instance and handle the request
-    const resolver = new EventResolver(token, jwtAccountId);
-    const result = await resolver.handleRequest(event);
-
-    console.log('Returning result:', JSON.stringify(result, null, 2));
-    return result;
-  } catch (error) {
-    console.error('Error processing request:', error);
-    
-    // Format error for AppSync
-    const errorMessage = error instanceof Error ? error.message : 'Unknown error occurred';
-    throw new Error(errorMessage);
+  // Extract account ID from the JWT sub claim
+  const jwtAccountId = event.identity?.sub;
+  if (!jwtAccountId) {
+    logger.warn('No account ID found in JWT sub claim');
   }
-};
\ No newline at end of file
+
+  return new EventResolver(token, jwtAccountId);
+}
@@ -0,0 +1,416 @@
+import crypto from 'crypto';
+import { Readable } from 'stream';
+
+import type KMS from 'aws-sdk/clients/kms';
+import type S3 from 'aws-sdk/clients/s3';
+
+import { EventExport, EventExportStatus, ListEventsParams } from '../types';
+import { EventsApiService } from './events-api.service';
+import { EventScanOptions, eventScanOptionsFromEnv, scanEvents } from './event-scan';
+import { envInt, logger, span } from '../shared';
+
+// Backend page size while exporting; larger than a screen's, since every event is read
+const EXPORT_PAGE_SIZE = 200;
+
+// Parts of the multipart upload an export's events are streamed as, and how
+// many are buffered or in flight at once: S3's minimum part size, so an
+// export holds about 10MB however many events it has
+const UPLOAD_PART_SIZE = 5 * 1024 * 1024;
+const UPLOAD_QUEUE_SIZE = 2;
+
+// How long an export's invocation may wait in Lambda's queue before it is
+// dropped; Terraform's maximum_event_age_in_seconds for the worker
+const EXPORT_QUEUE_SECONDS = 300;
+
+/**
+ * The payload an export's asynchronous invocation of the export worker
+ * carries: the manifest it started with, the listEvents filters of the
+ * window, and the caller's token, which the backend requests are made with.
+ * The token is sealed with the TokenSealer whenever one is configured, so the
+ * payload, wherever Lambda keeps it, holds no usable token; the export must
+ * finish while the token is valid (see startEventExport).
+ */
+export interface EventExportJob {
+  manifest: EventExport;
+  params: ListEventsParams;
+  sealedToken?: string;
+  /** The token in the clear, only without a sealer (local runs) */
+  authToken?: string;
+}
+
+export interface EventExportInvocation {
+  eventExport: EventExportJob;
+}
+
+/**
+ * Where exports are kept: a manifest per export and, once it completed, its
+ * events as newline-delimited JSON. saveEvents consumes the lines as they are
+ * produced and rejects with the iterator's error if it throws.
+ */
+export interface ExportStore {
+  saveManifest(manifest: EventExport): Promise<void>;
+  loadManifest(accountId: string, exportId: string): Promise<EventExport | undefined>;
+  saveEvents(manifest: EventExport, lines: AsyncIterable<string>): Promise<void>;
+  /** A URL the events can be downloaded from without AWS credentials */
+  downloadUrl(manifest: EventExport): Promise<string>;
+}
+
+/**
+ * Exports in an S3 bucket, under exports/{accountId}/{exportId}. The S3
+ * client is only loaded by the first export request.
+ */
+export class S3ExportStore implements ExportStore {
+  private client: Promise<S3> | undefined;
+
+  constructor(
+    private readonly bucket: string,
+    private readonly region: string,
+    private readonly urlTtlSeconds: number
+  ) {}
+
+  async saveManifest(manifest: EventExport): Promise<void> {
+    await this.put(`${this.prefix(manifest.accountId, manifest.exportId)}.json`, JSON.stringify(manifest), 'application/json');
+  }
+
+  async loadManifest(accountId: string, exportId: string): Promise<EventExport | undefined> {
+    const s3 = await this.s3();
+    try {
+      const response = await s3
+        .getObject({ Bucket: this.bucket, Key: `${this.prefix(accountId, exportId)}.json` })
+        .promise();
+      return response.Body === undefined ? undefined : (JSON.parse(response.Body.toString()) as EventExport);
+    } catch (error) {
+      if ((error as { code?: string }).code === 'NoSuchKey') {
+        return undefined;
+      }
+      throw error;
+    }
+  }
+
+  async saveEvents(manifest: EventExport, lines: AsyncIterable<string>): Promise<void> {
+    const s3 = await this.s3();
+    const body = Readable.from(lines, { objectMode: false });
+    const upload = s3.upload(
+      {
+        Bucket: this.bucket,
+        Key: `${this.prefix(manifest.accountId, manifest.exportId)}.ndjson`,
+        Body: body,
+        ContentType: 'application/x-ndjson',
+      },
+      { partSize: UPLOAD_PART_SIZE, queueSize: UPLOAD_QUEUE_SIZE }
+    );
+    // A failed scan aborts the upload, so no partial object (or orphaned
+    // parts) is left behind, and is what the export fails with
+    let failure: unknown;
+    body.once('error', error => {
+      failure = error;
+      upload.abort();
+    });
+    try {
+      await upload.promise();
+    } catch (error) {
+      throw failure ?? error;
+    }
+  }
+
+  async downloadUrl(manifest: EventExport): Promise<string> {
+    const s3 = await this.s3();
+    return s3.getSignedUrlPromise('getObject', {
+      Bucket: this.bucket,
+      Key: `${this.prefix(manifest.accountId, manifest.exportId)}.ndjson`,
+      Expires: this.urlTtlSeconds,
+    });
+  }
+
+  private prefix(accountId: string, exportId: string): string {
+    return `exports/${accountId}/${exportId}`;
+  }
+
+  private async put(key: string, body: string, contentType: string): Promise<void> {
+    const s3 = await this.s3();
+    await s3.putObject({ Bucket: this.bucket, Key: key, Body: body, ContentType: contentType }).promise();
+  }
+
+  private s3(): Promise<S3> {
+    this.client ??= import('aws-sdk/clients/s3').then(
+      ({ default: S3Client }) => new S3Client({ region: this.region, signatureVersion: 'v4' })
+    );
+    return this.client;
+  }
+}
+
+/**
+ * Seals the caller's token into an export's payload, for that export only
+ */
+export interface TokenSealer {
+  seal(token: string, manifest: EventExport): Promise<string>;
+  unseal(sealed: string, manifest: EventExport): Promise<string>;
+}
+
+/**
+ * Tokens encrypted with a KMS key, bound to the account and export with the
+ * encryption context, so a sealed token cannot be replayed for another
+ * export. The KMS client is only loaded by the first export request.
+ */
+export class KmsTokenSealer implements TokenSealer {
+  private client: Promise<KMS> | undefined;
+
+  constructor(
+    private readonly keyId: string,
+    private readonly region: string
+  ) {}
+
+  async seal(token: string, manifest: EventExport): Promise<string> {
+    const kms = await this.kms();
+    const { CiphertextBlob } = await kms
+      .encrypt({ KeyId: this.keyId, Plaintext: token, EncryptionContext: this.context(manifest) })
+      .promise();
+    return (CiphertextBlob as Buffer).toString('base64');
+  }
+
+  async unseal(sealed: string, manifest: EventExport): Promise<string> {
+    const kms = await this.kms();
+    const { Plaintext } = await kms
+      .decrypt({ CiphertextBlob: Buffer.from(sealed, 'base64'), EncryptionContext: this.context(manifest) })
+      .promise();
+    return (Plaintext as Buffer).toString('utf8');
+  }
+
+  private context(manifest: EventExport): Record<string, string> {
+    return { accountId: manifest.accountId, exportId: manifest.exportId };
+  }
+
+  private kms(): Promise<KMS> {
+    this.client ??= import('aws-sdk/clients/kms').then(
+      ({ default: KmsClient }) => new KmsClient({ region: this.region })
+    );
+    return this.client;
+  }
+}
+
+export interface EventExportOptions {
+  /** Where exports are kept; none turns exports off */
+  store?: ExportStore;
+  /** The function an export runs in, invoked asynchronously */
+  functionName?: string;
+  /** Invoke the export function asynchronously with a payload */
+  invoke: (functionName: string, payload: EventExportInvocation) => Promise<void>;
+  /** Seals the token in the payload; none sends it in the clear */
+  sealer?: TokenSealer;
+  /** The longest an export runs, which the caller's token must outlive */
+  timeoutSeconds: number;
+  scan: EventScanOptions;
+}
+
+/**
+ * Export settings from the environment:
+ *
+ *   EVENT_EXPORT_BUCKET             S3 bucket exports are written to (unset: no exports)
+ *   EVENT_EXPORT_FUNCTION           function the export runs in, with the event
+ *                                   lambda's code (default: this function)
+ *   EVENT_EXPORT_URL_TTL_SECONDS    lifetime of a download URL (default 3600)
+ *   EVENT_EXPORT_SHARDS             time shards an export's window is read as (default 8)
+ *   EVENT_EXPORT_KMS_KEY            KMS key the caller's token is sealed with in the
+ *                                   payload (unset: sent in the clear, for local runs)
+ *   EVENT_EXPORT_TIMEOUT_SECONDS    timeout of the export function (default 900)
+ *   AWS_REGION                      region of the bucket and function (set by Lambda)
+ *
+ * An export reads its shards EVENT_SCAN_CONCURRENCY at a time; it is always
+ * written oldest first, so it shards whether or not listEvents does.
+ */
+export function eventExportOptionsFromEnv(): EventExportOptions {
+  const bucket = process.env['EVENT_EXPORT_BUCKET'] || undefined;
+  const functionName = process.env['EVENT_EXPORT_FUNCTION'] || process.env['AWS_LAMBDA_FUNCTION_NAME'] || undefined;
+  const keyId = process.env['EVENT_EXPORT_KMS_KEY'] || undefined;
+  const region = process.env['AWS_REGION'] ?? 'us-west-2';
+  return {
+    ...(bucket !== undefined && {
+      store: new S3ExportStore(bucket, region, envInt('EVENT_EXPORT_URL_TTL_SECONDS', 3600)),
+    }),
+    ...(functionName !== undefined && { functionName }),
+    invoke: invokeAsync,
+    ...(keyId !== undefined && { sealer: new KmsTokenSealer(keyId, region) }),
+    timeoutSeconds: envInt('EVENT_EXPORT_TIMEOUT_SECONDS', 900),
+    scan: { ...eventScanOptionsFromEnv(), shards: envInt('EVENT_EXPORT_SHARDS', 8) },
+  };
+}
+
+let settings: EventExportOptions | undefined;
+
+function eventExportSettings(): EventExportOptions {
+  if (settings === undefined) {
+    settings = eventExportOptionsFromEnv();
+  }
+  return settings;
+}
+
+/**
+ * Replace the export settings. Intended for tests and the local harness;
+ * without options they are read from the environment again.
+ */
+export function configureEventExports(options?: Partial<EventExportOptions>): void {
+  settings = options === undefined ? undefined : { ...eventExportOptionsFromEnv(), ...options };
+}
+
+function requireStore(): ExportStore {
+  const { store } = eventExportSettings();
+  if (store === undefined) {
+    throw new Error('Event exports are not configured');
+  }
+  return store;
+}
+
+/**
+ * When a JWT expires, in epoch seconds; undefined for a token that is not a
+ * JWT or has no exp claim. The token is not verified: the backends do that.
+ */
+export function tokenExpiresAt(token: string): number | undefined {
+  const payload = token.split('.')[1];
+  if (payload === undefined) {
+    return undefined;
+  }
+  try {
+    const { exp } = JSON.parse(Buffer.from(payload, 'base64url').toString('utf8')) as { exp?: unknown };
+    return typeof exp === 'number' ? exp : undefined;
+  } catch {
+    return undefined;
+  }
+}
+
+function generateExportId(): string {
+  return `exp_${Date.now().toString(36)}_${crypto.randomBytes(4).toString('hex')}`;
+}
+
+async function invokeAsync(functionName: string, payload: EventExportInvocation): Promise<void> {
+  const { default: Lambda } = await import('aws-sdk/clients/lambda');
+  const lambda = new Lambda({ region: process.env['AWS_REGION'] ?? 'us-west-2' });
+  await lambda.invoke({ FunctionName: functionName, InvocationType: 'Event', Payload: JSON.stringify(payload) }).promise();
+}
+
+/**
+ * Start exporting the events of a from/to window: record a RUNNING manifest
+ * and invoke the export worker asynchronously to run the export, so the
+ * mutation answers at once. Clients poll getEventExport until it completed.
+ *
+ * The backend requests are made with the caller's token, so an export is
+ * refused unless the token outlives the longest the export can wait in
+ * Lambda's queue and run. The token is sealed for this export; the worker
+ * is invoked without retries or a dead-letter queue (see Terraform), so a
+ * failed invocation keeps no copy of the payload.
+ */
+export async function startEventExport(params: ListEventsParams, authToken: string): Promise<EventExport> {
+  const store = requireStore();
+  const { functionName, invoke, sealer, timeoutSeconds } = eventExportSettings();
+  if (functionName === undefined) {
+    throw new Error('Event exports are not configured');
+  }
+  const expiresAt = tokenExpiresAt(authToken);
+  const needed = Math.floor(Date.now() / 1000) + EXPORT_QUEUE_SECONDS + timeoutSeconds;
+  if (expiresAt !== undefined && expiresAt < needed) {
+    throw new Error('Your session expires before an export could finish; sign in again to export');
+  }
+  const manifest: EventExport = {
+    exportId: generateExportId(),
+    accountId: params.accountId,
+    status: EventExportStatus.RUNNING,
+    from: params.from ?? '',
+    to: params.to ?? '',
+    startedAt: Math.floor(Date.now() / 1000),
+  };
+  await store.saveManifest(manifest);
+  try {
+    const token = sealer === undefined ? { authToken } : { sealedToken: await sealer.seal(authToken, manifest) };
+    await invoke(functionName, { eventExport: { manifest, params, ...token } });
+  } catch (error) {
+    logger.error('Could not start event export', { exportId: manifest.exportId, error });
+    await store.saveManifest(failed(manifest, error));
+    throw new Error('Could not start event export');
+  }
+  logger.info('Event export started', { exportId: manifest.exportId, from: manifest.from, to: manifest.to });
+  return manifest;
+}
+
+/**
+ * An export's manifest, with a fresh download URL once it completed. An
+ * export still RUNNING after it could have waited in the queue and run is
+ * reported FAILED: its invocation was dropped, as it is never retried.
+ */
+export async function getEventExport(accountId: string, exportId: string): Promise<EventExport | undefined> {
+  const store = requireStore();
+  const manifest = await store.loadManifest(accountId, exportId);
+  if (manifest?.status === EventExportStatus.RUNNING) {
+    const deadline = manifest.startedAt + EXPORT_QUEUE_SECONDS + eventExportSettings().timeoutSeconds;
+    return Math.floor(Date.now() / 1000) > deadline ? failed(manifest, new Error('Export did not finish')) : manifest;
+  }
+  if (manifest?.status !== EventExportStatus.COMPLETED) {
+    return manifest;
+  }
+  return { ...manifest, url: await store.downloadUrl(manifest) };
+}
+
+async function unsealToken(job: EventExportJob, sealer: TokenSealer | undefined): Promise<string> {
+  if (job.sealedToken !== undefined && sealer !== undefined) {
+    return sealer.unseal(job.sealedToken, job.manifest);
+  }
+  if (job.authToken !== undefined && sealer === undefined) {
+    return job.authToken;
+  }
+  throw new Error('The export has no token this function can use');
+}
+
+function failed(manifest: EventExport, error: unknown): EventExport {
+  return {
+    ...manifest,
+    status: EventExportStatus.FAILED,
+    error: error instanceof Error ? error.message : String(error),
+    completedAt: Math.floor(Date.now() / 1000),
+  };
+}
+
+/**
+ * Run an export in the asynchronous invocation startEventExport made: scan
+ * the window's time shards concurrently, as listEvents does for a wide
+ * window, and stream the events, oldest first, into one NDJSON object as
+ * pages arrive, then complete the manifest. Any failure is recorded in the
+ * manifest instead of being thrown, so Lambda does not retry a half-done
+ * export.
+ */
+export async function runEventExport(job: EventExportJob): Promise<EventExport> {
+  const store = requireStore();
+  const { scan: scanOptions, sealer } = eventExportSettings();
+  const { manifest, params } = job;
+  const from = Date.parse(manifest.from);
+  const to = Date.parse(manifest.to);
+  const scan = { from, to, shards: scanOptions.shards, position: { shard: 0, offset: 0 } };
+
+  let count = 0;
+  async function* lines(api: EventsApiService): AsyncGenerator<string> {
+    for await (const { item } of scanEvents(api, params, scan, scanOptions.concurrency, EXPORT_PAGE_SIZE)) {
+      count += 1;
+      yield `${JSON.stringify(item)}\n`;
+    }
+  }
+
+  let result: EventExport;
+  try {
+    const authToken = await unsealToken(job, sealer);
+    const expiresAt = tokenExpiresAt(authToken);
+    if (expiresAt !== undefined && expiresAt <= Math.floor(Date.now() / 1000)) {
+      throw new Error('The session the export was started with expired before it ran');
+    }
+    const api = new EventsApiService(authToken);
+    await span('export', () => store.saveEvents(manifest, lines(api)), { shards: scan.shards });
+    result = {
+      ...manifest,
+      status: EventExportStatus.COMPLETED,
+      count,
+      completedAt: Math.floor(Date.now() / 1000),
+    };
+  } catch (error) {
+    logger.error('Event export failed', { exportId: manifest.exportId, error });
+    result = failed(manifest, error);
+  }
+  await store.saveManifest(result);
+  logger.info('Event export finished', { exportId: manifest.exportId, status: result.status, count: result.count });
+  return result;
+}
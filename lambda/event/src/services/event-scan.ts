@@ -0,0 +1,164 @@
+import { ListEventsParams, PagedEventResponse, UnitEvent } from '../types';
+import { EventsApiService } from './events-api.service';
+import {
+  ScannedItem,
+  ShardCursor,
+  collect,
+  decodeShardCursor,
+  encodeShardCursor,
+  envInt,
+  scanShards,
+  span,
+  timeShards,
+} from '../shared';
+
+const HOUR_MS = 3_600_000;
+
+/** Page size of a scanned listEvents request that sets no limit */
+export const DEFAULT_SCAN_LIMIT = 50;
+
+export interface EventScanOptions {
+  /** Time shards a wide window is split into; 1 turns scan mode off */
+  shards: number;
+  /** Shards fetched at once */
+  concurrency: number;
+  /** Narrowest from/to window worth splitting */
+  minWindowMs: number;
+}
+
+/**
+ * Scan settings from the environment:
+ *
+ *   EVENT_SCAN_SHARDS             shards a wide window is split into (default 1: off)
+ *   EVENT_SCAN_CONCURRENCY        shards fetched at once (default 4)
+ *   EVENT_SCAN_MIN_WINDOW_HOURS   narrowest window that is split (default 24)
+ *
+ * Scanned pages come back oldest first with `shards:` cursors, where the
+ * backend's own paging keeps its order and cursors, so scanning is opt-in.
+ */
+export function eventScanOptionsFromEnv(): EventScanOptions {
+  return {
+    shards: envInt('EVENT_SCAN_SHARDS', 1),
+    concurrency: envInt('EVENT_SCAN_CONCURRENCY', 4),
+    minWindowMs: envInt('EVENT_SCAN_MIN_WINDOW_HOURS', 24) * HOUR_MS,
+  };
+}
+
+/**
+ * The scan a listEvents request continues or starts, or undefined when it is
+ * paged the backend's way: a cursor from an earlier scan page resumes that
+ * scan (even with scanning since turned off), any other cursor is the
+ * backend's own and keeps paging the backend's way, and a first page is
+ * scanned when from and to span at least minWindowMs.
+ */
+export function planEventScan(params: ListEventsParams, options: EventScanOptions): ShardCursor | undefined {
+  const from = Date.parse(params.from ?? '');
+  const to = Date.parse(params.to ?? '');
+  if (params.cursor) {
+    const resumed = decodeShardCursor(params.cursor);
+    if (resumed !== undefined && (resumed.from !== from || resumed.to !== to)) {
+      throw new Error('Invalid cursor: it belongs to a different from/to window');
+    }
+    return resumed;
+  }
+  if (Number.isNaN(from) || Number.isNaN(to) || options.shards <= 1 || to - from < options.minWindowMs) {
+    return undefined;
+  }
+  return { from, to, shards: options.shards, position: { shard: 0, offset: 0 } };
+}
+
+/**
+ * Backend requests a listEvents page with these arguments can have in flight
+ * at once: the shards a scan reads ahead (at most EVENT_SCAN_CONCURRENCY and
+ * the shards left), or 1 when it is paged the backend's way. The field's
+ * admission cost is multiplied by it.
+ */
+export function eventScanFanOut(args: Record<string, unknown>, options = eventScanOptionsFromEnv()): number {
+  let scan: ShardCursor | undefined;
+  try {
+    scan = planEventScan(args as unknown as ListEventsParams, options);
+  } catch {
+    // A cursor of another window; the resolver rejects it without a backend call
+    return 1;
+  }
+  if (scan === undefined) {
+    return 1;
+  }
+  const left = timeShards(scan.from, scan.to, scan.shards).length - scan.position.shard;
+  return Math.max(1, Math.min(options.concurrency, left));
+}
+
+/**
+ * Events oldest first (createdAt, then eventId). Unparseable timestamps sort first.
+ */
+export function sortOldestFirst(events: readonly UnitEvent[]): UnitEvent[] {
+  const time = (event: UnitEvent): number => Date.parse(event.createdAt) || 0;
+  return [...events].sort(
+    (a, b) => time(a) - time(b) || (a.eventId < b.eventId ? -1 : a.eventId > b.eventId ? 1 : 0)
+  );
+}
+
+/**
+ * The events of a scan's window from the position it stands at. The window
+ * is split into time shards that are listed concurrently with the request's
+ * other filters, `pageSize` events per backend page, and shards are returned
+ * one after the other. Each backend page is sorted oldest first before its
+ * items get positions, so a page re-read to resume a scan lines up with the
+ * offsets handed out; the whole result is in createdAt order when the
+ * backend's pages of a window follow one another in time (as pages of a
+ * query on a createdAt sort key do), whatever order it lists a page in.
+ */
+export function scanEvents(
+  api: EventsApiService,
+  params: ListEventsParams,
+  scan: ShardCursor,
+  concurrency: number,
+  pageSize: number
+): AsyncGenerator<ScannedItem<UnitEvent>, void, undefined> {
+  const shards = timeShards(scan.from, scan.to, scan.shards);
+  return scanShards(
+    shards.length,
+    async (shard, cursor) => {
+      const page = await api.listEvents({
+        ...params,
+        from: new Date(shards[shard]!.from).toISOString(),
+        to: new Date(shards[shard]!.to).toISOString(),
+        cursor,
+        limit: pageSize,
+      });
+      return { ...page, items: sortOldestFirst(page.items) };
+    },
+    { concurrency, start: scan.position }
+  );
+}
+
+/**
+ * One listEvents page served by a scan: `limit` events from where the scan
+ * stands, with a cursor holding the position after the last of them. The
+ * shards after it are fetched ahead while the page fills, so a filtered
+ * window whose backend pages come back sparse fills a page in about one
+ * round trip per shard group instead of one per backend page. A page its
+ * first shard fills on its own pays for the shards fetched ahead of it.
+ */
+export async function scanEventsPage(
+  api: EventsApiService,
+  params: ListEventsParams,
+  scan: ShardCursor,
+  options: EventScanOptions,
+  limit: number
+): Promise<PagedEventResponse> {
+  const shardCount = timeShards(scan.from, scan.to, scan.shards).length;
+  const scanned = await span(
+    'scan',
+    () => collect(scanEvents(api, params, scan, options.concurrency, limit), limit),
+    { shards: shardCount, shard: scan.position.shard }
+  );
+  const next = scanned[scanned.length - 1]?.next;
+  const more = scanned.length === limit && next !== undefined && next.shard < shardCount;
+  return {
+    items: scanned.map(({ item }) => item),
+    ...(more && { nextCursor: encodeShardCursor({ ...scan, position: next }) }),
+    limit,
+    count: scanned.length,
+  };
+}
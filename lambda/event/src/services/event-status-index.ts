@@ -0,0 +1,365 @@
+import { EventStatus, EventWithUnitInfo, UnitInfo } from '../types';
+
+/**
+ * Status order used by listEventsByStatus (alphabetical by status name)
+ */
+export const STATUS_ORDER: EventStatus[] = [
+  EventStatus.ACKNOWLEDGED,
+  EventStatus.CANCELLED,
+  EventStatus.CLOSED,
+  EventStatus.CREATED,
+  EventStatus.ESCALATED,
+  EventStatus.IN_PROGRESS,
+  EventStatus.ON_HOLD,
+  EventStatus.RESOLVED,
+];
+
+const STATUS_RANK = new Map<string, number>(STATUS_ORDER.map((status, rank) => [status, rank]));
+
+/**
+ * An event together with its precomputed sort key
+ */
+export interface IndexedEvent {
+  rank: number;
+  createdAtMs: number;
+  eventId: string;
+  event: EventWithUnitInfo;
+}
+
+type SortKey = Pick<IndexedEvent, 'rank' | 'createdAtMs' | 'eventId'>;
+
+/**
+ * A stable position in the index: the last (status, createdAt, eventId) served
+ */
+export interface StatusIndexPosition {
+  status: EventStatus;
+  createdAt: number;
+  eventId: string;
+}
+
+export interface StatusIndexPage {
+  items: EventWithUnitInfo[];
+  nextCursor?: string;
+}
+
+export function statusRank(status: string): number {
+  return STATUS_RANK.get(status) ?? STATUS_ORDER.length;
+}
+
+/**
+ * Sort key order: status rank ascending, createdAt descending, eventId ascending
+ */
+export function compareIndexed(a: SortKey, b: SortKey): number {
+  if (a.rank !== b.rank) {
+    return a.rank - b.rank;
+  }
+  if (a.createdAtMs !== b.createdAtMs) {
+    return b.createdAtMs - a.createdAtMs;
+  }
+  return a.eventId < b.eventId ? -1 : a.eventId > b.eventId ? 1 : 0;
+}
+
+export function toIndexedEvent(event: EventWithUnitInfo, createdAt: string): IndexedEvent {
+  const createdAtMs = Date.parse(createdAt);
+  return {
+    rank: statusRank(event.status),
+    createdAtMs: Number.isNaN(createdAtMs) ? 0 : createdAtMs,
+    eventId: event.eventId,
+    event,
+  };
+}
+
+export function encodeStatusCursor(entry: IndexedEvent): string {
+  const position = { s: entry.event.status, c: entry.createdAtMs, e: entry.eventId };
+  return Buffer.from(JSON.stringify(position)).toString('base64');
+}
+
+/**
+ * Decode a cursor produced by encodeStatusCursor; returns undefined for anything else
+ */
+export function decodeStatusCursor(cursor: string): StatusIndexPosition | undefined {
+  try {
+    const decoded = JSON.parse(Buffer.from(cursor, 'base64').toString('utf-8'));
+    if (
+      decoded &&
+      typeof decoded.s === 'string' &&
+      typeof decoded.c === 'number' &&
+      typeof decoded.e === 'string'
+    ) {
+      return { status: decoded.s as EventStatus, createdAt: decoded.c, eventId: decoded.e };
+    }
+  } catch {
+    // fall through
+  }
+  return undefined;
+}
+
+/**
+ * Merge already-sorted streams into one sorted array using a binary min-heap
+ * over the stream heads, so the total cost is O(n log k) for k streams.
+ */
+export function mergeSortedStreams(streams: IndexedEvent[][]): IndexedEvent[] {
+  const heap: Array<{ stream: IndexedEvent[]; offset: number }> = streams
+    .filter(stream => stream.length > 0)
+    .map(stream => ({ stream, offset: 0 }));
+  const head = (i: number): IndexedEvent => heap[i].stream[heap[i].offset];
+  const less = (i: number, j: number): boolean => compareIndexed(head(i), head(j)) < 0;
+  const swap = (i: number, j: number): void => {
+    const tmp = heap[i];
+    heap[i] = heap[j];
+    heap[j] = tmp;
+  };
+  const siftDown = (start: number): void => {
+    let i = start;
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let smallest = i;
+      if (left < heap.length && less(left, smallest)) smallest = left;
+      if (right < heap.length && less(right, smallest)) smallest = right;
+      if (smallest === i) return;
+      swap(i, smallest);
+      i = smallest;
+    }
+  };
+
+  for (let i = Math.floor(heap.length / 2) - 1; i >= 0; i--) {
+    siftDown(i);
+  }
+
+  const merged: IndexedEvent[] = [];
+  while (heap.length > 0) {
+    const top = heap[0];
+    merged.push(top.stream[top.offset]);
+    top.offset++;
+    if (top.offset >= top.stream.length) {
+      const last = heap.pop()!;
+      if (heap.length === 0) break;
+      heap[0] = last;
+    }
+    siftDown(0);
+  }
+  return merged;
+}
+
+/**
+ * Status-keyed index of an account's events. Each status segment is kept
+ * sorted by (createdAt desc, eventId asc) so pages can be served by binary
+ * search from a stable cursor position, and mutations can be applied in place.
+ */
+export class EventStatusIndex {
+  private readonly segments = new Map<number, IndexedEvent[]>();
+  private readonly byEventId = new Map<string, IndexedEvent>();
+
+  constructor(
+    private readonly unitInfo: Map<string, UnitInfo>,
+    sortedEntries: IndexedEvent[],
+  ) {
+    for (const entry of sortedEntries) {
+      let segment = this.segments.get(entry.rank);
+      if (!segment) {
+        segment = [];
+        this.segments.set(entry.rank, segment);
+      }
+      segment.push(entry);
+      this.byEventId.set(entry.eventId, entry);
+    }
+  }
+
+  /**
+   * Build an index from per-unit streams that are each already sorted with compareIndexed
+   */
+  static fromSortedStreams(unitInfo: Map<string, UnitInfo>, streams: IndexedEvent[][]): EventStatusIndex {
+    return new EventStatusIndex(unitInfo, mergeSortedStreams(streams));
+  }
+
+  get size(): number {
+    return this.byEventId.size;
+  }
+
+  unitInfoFor(unitId: string): UnitInfo | undefined {
+    return this.unitInfo.get(unitId);
+  }
+
+  /**
+   * Serve up to `limit` events after `after`, restricted to `statuses` when given
+   */
+  page(statuses: EventStatus[] | undefined, after: StatusIndexPosition | undefined, limit: number): StatusIndexPage {
+    const wanted = statuses && statuses.length > 0 ? new Set(statuses.map(statusRank)) : undefined;
+    const afterKey: SortKey | undefined = after ? {
+      rank: statusRank(after.status),
+      createdAtMs: after.createdAt,
+      eventId: after.eventId,
+    } : undefined;
+
+    // Collect one extra entry to learn whether another page follows
+    const selected: IndexedEvent[] = [];
+    const ranks = [...this.segments.keys()].sort((a, b) => a - b);
+    for (const rank of ranks) {
+      if (wanted && !wanted.has(rank)) continue;
+      if (afterKey && rank < afterKey.rank) continue;
+
+      const segment = this.segments.get(rank)!;
+      const start = afterKey && rank === afterKey.rank ? this.upperBound(segment, afterKey) : 0;
+      selected.push(...segment.slice(start, start + limit + 1 - selected.length));
+      if (selected.length > limit) break;
+    }
+
+    const pageEntries = selected.slice(0, limit);
+    const result: StatusIndexPage = { items: pageEntries.map(entry => entry.event) };
+    if (selected.length > limit && pageEntries.length > 0) {
+      result.nextCursor = encodeStatusCursor(pageEntries[pageEntries.length - 1]);
+    }
+    return result;
+  }
+
+  /**
+   * Insert or replace an event, moving it between status segments if needed
+   */
+  upsert(entry: IndexedEvent): void {
+    this.remove(entry.eventId);
+    let segment = this.segments.get(entry.rank);
+    if (!segment) {
+      segment = [];
+      this.segments.set(entry.rank, segment);
+    }
+    segment.splice(this.upperBound(segment, entry), 0, entry);
+    this.byEventId.set(entry.eventId, entry);
+  }
+
+  remove(eventId: string): void {
+    const existing = this.byEventId.get(eventId);
+    if (!existing) return;
+    const segment = this.segments.get(existing.rank);
+    if (segment) {
+      const position = segment.indexOf(existing);
+      if (position >= 0) segment.splice(position, 1);
+    }
+    this.byEventId.delete(eventId);
+  }
+
+  /**
+   * First index in a segment whose entry sorts strictly after `key`
+   */
+  private upperBound(segment: IndexedEvent[], key: SortKey): number {
+    let low = 0;
+    let high = segment.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (compareIndexed(segment[mid], key) <= 0) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+}
+
+interface CachedIndex {
+  index: EventStatusIndex;
+  expiresAt: number;
+}
+
+/**
+ * Per-account index cache that lives in module scope, so it survives across
+ * warm invocations of the same container. Mutations made through this
+ * container are applied in place; changes made elsewhere are picked up when
+ * the entry's TTL expires.
+ *
+ * At most `maxAccounts` indexes are kept, least recently used first out, and
+ * expired ones are dropped whenever an index is stored, so accounts that are
+ * not read again do not pin their index in memory.
+ */
+export class EventStatusIndexCache {
+  private readonly entries = new Map<string, CachedIndex>();
+  private readonly pending = new Map<string, Promise<{ index: EventStatusIndex; complete: boolean }>>();
+
+  constructor(
+    private readonly ttlMs: number,
+    private readonly maxAccounts = 16,
+  ) {}
+
+  async get(
+    accountId: string,
+    build: () => Promise<{ index: EventStatusIndex; complete: boolean }>,
+  ): Promise<EventStatusIndex> {
+    const cached = this.peek(accountId);
+    if (cached) {
+      return cached;
+    }
+
+    // Concurrent requests for the same account share one build
+    let building = this.pending.get(accountId);
+    if (!building) {
+      building = build();
+      this.pending.set(accountId, building);
+    }
+
+    try {
+      const { index, complete } = await building;
+      // Partial indexes (some units failed to load) are served but never cached,
+      // nor are builds a mutation overtook (see `changed`)
+      if (complete && this.pending.get(accountId) === building) {
+        this.store(accountId, index);
+      }
+      return index;
+    } finally {
+      if (this.pending.get(accountId) === building) {
+        this.pending.delete(accountId);
+      }
+    }
+  }
+
+  /** Accounts with an index held, expired ones not yet dropped included */
+  get size(): number {
+    return this.entries.size;
+  }
+
+  peek(accountId: string): EventStatusIndex | undefined {
+    const cached = this.entries.get(accountId);
+    if (!cached) {
+      return undefined;
+    }
+    if (cached.expiresAt <= Date.now()) {
+      this.entries.delete(accountId);
+      return undefined;
+    }
+    // Most recently used last
+    this.entries.delete(accountId);
+    this.entries.set(accountId, cached);
+    return cached.index;
+  }
+
+  /**
+   * Note a create, update or delete of one of the account's events. A build
+   * still running may have read the events before the change: it still
+   * answers the requests waiting on it, but is not cached, and later requests
+   * start a new one.
+   */
+  changed(accountId: string): void {
+    this.pending.delete(accountId);
+  }
+
+  invalidate(accountId: string): void {
+    this.entries.delete(accountId);
+    this.pending.delete(accountId);
+  }
+
+  private store(accountId: string, index: EventStatusIndex): void {
+    const now = Date.now();
+    for (const [cachedAccountId, cached] of this.entries) {
+      if (cached.expiresAt <= now) {
+        this.entries.delete(cachedAccountId);
+      }
+    }
+    this.entries.delete(accountId);
+    this.entries.set(accountId, { index, expiresAt: now + this.ttlMs });
+    for (const oldest of this.entries.keys()) {
+      if (this.entries.size <= this.maxAccounts) {
+        break;
+      }
+      this.entries.delete(oldest);
+    }
+  }
+}
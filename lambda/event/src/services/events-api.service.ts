@@ -10,6 +10,7 @@ import {
   PagedEventResponse,
   ServiceError,
 } from '../types';
+import { getPooledClient, logger, withAuth } from '../shared';
 
 interface ErrorResponse {
   error: string;
@@ -23,48 +24,46 @@ export class EventsApiService {
   private readonly client: AxiosInstance;
   private readonly baseUrl: string;
 
-  constructor(authToken: string) {
+  constructor(private readonly authToken: string) {
     this.baseUrl = process.env['EVENTS_API_URL'] || 'https://event-srnext.sb.fullbay.com';
-    
-    this.client = axios.create({
-      baseURL: this.baseUrl,
-      headers: {
-        'Content-Type': 'application/json',
-        Authorization: `Bearer ${authToken}`,
-      },
-      timeout: 30000,
-    });
 
-    this.client.interceptors.request.use(
-      (config) => {
-        console.log(`Making request to ${config.method?.toUpperCase()} ${config.url}`);
-        return config;
-      },
-      (error) => {
-        console.error('Request error:', error);
-        return Promise.reject(error);
-      }
-    );
+    // Pooled client is shared across warm invocations, so interceptors are
+    // registered once and the auth token is added per request
+    this.client = getPooledClient(this.baseUrl, (client) => {
+      client.interceptors.request.use(
+        (config) => {
+          logger.debug('API request', { method: config.method?.toUpperCase(), url: config.url });
+          return config;
+        },
+        (error) => {
+          logger.error('API request error', { error });
+          return Promise.reject(error);
+        }
+      );
 
-    this.client.interceptors.response.use(
-      (response) => response,
-      (error: AxiosError<ErrorResponse>) => {
-        console.error('Response error:', {
-          status: error.response?.status,
-          data: error.response?.data,
-          message: error.message,
-        });
-        return Promise.reject(this.handleError(error));
-      }
-    );
+      client.interceptors.response.use(
+        (response) => response,
+        (error) => {
+          if (!axios.isAxiosError(error)) {
+            return Promise.reject(error);
+          }
+          logger.error('API response error', {
+            status: error.response?.status,
+            data: error.response?.data,
+            message: error.message,
+          });
+          return Promise.reject(EventsApiService.handleError(error as AxiosError<ErrorResponse>));
+        }
+      );
+    });
   }
 
   async createEvent(input: CreateEventInput): Promise<UnitEvent> {
     try {
-      const response = await this.client.post<UnitEvent>('/events', input);
+      const response = await this.client.post<UnitEvent>('/events', input, withAuth(this.authToken));
       return response.data;
     } catch (error) {
-      console.error('Error creating event:', error);
+      logger.error('Error creating event', { error });
       throw error;
     }
   }
@@ -72,11 +71,12 @@ export class EventsApiService {
   async getEvent(params: GetEventParams): Promise<UnitEvent> {
     try {
       const response = await this.client.get<UnitEvent>(
-        `/events/${encodeURIComponent(params.accountId)}/${encodeURIComponent(params.eventId)}`
+        `/events/${encodeURIComponent(params.accountId)}/${encodeURIComponent(params.eventId)}`,
+        withAuth(this.authToken)
       );
       return response.data;
     } catch (error) {
-      console.error('Error getting event:', error);
+      logger.error('Error getting event', { error });
       throw error;
     }
   }
@@ -100,10 +100,10 @@ export class EventsApiService {
         queryParams.toString() ? `?${queryParams.toString()}` : ''
       }`;
 
-      const response = await this.client.get<PagedEventResponse>(url);
+      const response = await this.client.get<PagedEventResponse>(url, withAuth(this.authToken));
       return response.data;
     } catch (error) {
-      console.error('Error listing events:', error);
+      logger.error('Error listing events', { error });
       throw error;
     }
   }
@@ -112,11 +112,12 @@ export class EventsApiService {
     try {
       const response = await this.client.put<UnitEvent>(
         `/events/${encodeURIComponent(params.accountId)}/${encodeURIComponent(params.eventId)}`,
-        input
+        input,
+        withAuth(this.authToken)
       );
       return response.data;
     } catch (error) {
-      console.error('Error updating event:', error);
+      logger.error('Error updating event', { error });
       throw error;
     }
   }
@@ -124,15 +125,16 @@ export class EventsApiService {
   async deleteEvent(params: DeleteEventParams): Promise<void> {
     try {
       await this.client.delete(
-        `/events/${encodeURIComponent(params.accountId)}/${encodeURIComponent(params.eventId)}`
+        `/events/${encodeURIComponent(params.accountId)}/${encodeURIComponent(params.eventId)}`,
+        withAuth(this.authToken)
       );
     } catch (error) {
-      console.error('Error deleting event:', error);
+      logger.error('Error deleting event', { error });
       throw error;
     }
   }
 
-  private handleError(error: AxiosError<ErrorResponse>): ServiceError {
+  private static handleError(error: AxiosError<ErrorResponse>): ServiceError {
     const serviceError = new Error() as ServiceError;
     
     if (error.response) {
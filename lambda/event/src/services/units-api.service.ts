@@ -1,5 +1,7 @@
 import axios, { AxiosInstance, AxiosError } from 'axios';
 
+import { PageStreamOptions, collect, getPooledClient, logger, streamPages, withAuth } from '../shared';
+
 // Unit type based on the OpenAPI schema
 export interface Unit {
   id: string;
@@ -62,48 +64,44 @@ export class UnitsApiService {
   private readonly client: AxiosInstance;
   private readonly baseUrl: string;
 
-  constructor(authToken: string) {
+  constructor(private readonly authToken: string) {
     this.baseUrl = process.env['UNITS_API_URL'] || 'https://unit-srnext.sb.fullbay.com';
-    
-    this.client = axios.create({
-      baseURL: this.baseUrl,
-      headers: {
-        'Content-Type': 'application/json',
-        Authorization: `Bearer ${authToken}`,
-      },
-      timeout: 30000, // 30 seconds
-    });
 
-    // Add request interceptor for logging
-    this.client.interceptors.request.use(
-      (config) => {
-        console.log(`Making request to ${config.method?.toUpperCase()} ${config.url}`);
-        return config;
-      },
-      (error) => {
-        console.error('Request error:', error);
-        return Promise.reject(error);
-      }
-    );
+    // Pooled client is shared across warm invocations, so interceptors are
+    // registered once and the auth token is added per request
+    this.client = getPooledClient(this.baseUrl, (client) => {
+      // Add request interceptor for logging
+      client.interceptors.request.use(
+        (config) => {
+          logger.debug('API request', { method: config.method?.toUpperCase(), url: config.url });
+          return config;
+        },
+        (error) => {
+          logger.error('API request error', { error });
+          return Promise.reject(error);
+        }
+      );
 
-    // Add response interceptor for error handling
-    this.client.interceptors.response.use(
-      (response) => response,
-      (error: AxiosError<ErrorResponse>) => {
-        console.error('Response error:', {
-          status: error.response?.status,
-          data: error.response?.data,
-          message: error.message,
-        });
-        return Promise.reject(error);
-      }
-    );
+      // Add response interceptor for error handling
+      client.interceptors.response.use(
+        (response) => response,
+        (error: AxiosError<ErrorResponse>) => {
+          logger.error('API response error', {
+            status: error.response?.status,
+            data: error.response?.data,
+            message: error.message,
+          });
+          return Promise.reject(error);
+        }
+      );
+    });
   }
 
   async listUnits(
     accountId: string, 
     cursor?: string, 
-    limit?: number
+    limit?: number,
+    signal?: AbortSignal
   ): Promise<PaginatedUnitsResponse> {
     try {
       const params: Record<string, string | number> = {};
@@ -112,7 +110,7 @@ export class UnitsApiService {
 
       const response = await this.client.get<PaginatedUnitsResponse>(
         `/units/${encodeURIComponent(accountId)}`,
-        { params }
+        withAuth(this.authToken, { params, ...(signal && { signal }) })
       );
       return response.data;
     } catch (error) {
@@ -120,24 +118,26 @@ export class UnitsApiService {
     }
   }
 
-  async getAllUnits(accountId: string): Promise<Unit[]> {
-    const allUnits: Unit[] = [];
-    let cursor: string | undefined;
-    let hasMore = true;
-
-    while (hasMore) {
-      const response = await this.listUnits(accountId, cursor, 100);
-      allUnits.push(...response.items);
-      cursor = response.cursor;
-      hasMore = response.hasMore || false;
-      
-      // If no cursor is returned, we've reached the end
-      if (!cursor) {
-        break;
-      }
-    }
+  /**
+   * Stream the account's units page by page. The next page is requested while
+   * the caller works on the current one, at most `options.prefetch` pages are
+   * buffered, and breaking out of the loop stops paging.
+   */
+  streamUnits(accountId: string, options?: PageStreamOptions): AsyncGenerator<Unit[], void, undefined> {
+    return streamPages(async (cursor, signal) => {
+      const response = await this.listUnits(accountId, cursor, 100, signal);
+      // The last page may still carry a cursor; hasMore is authoritative
+      return { items: response.items, nextCursor: response.hasMore ? response.cursor : undefined };
+    }, options);
+  }
 
-    return allUnits;
+  /**
+   * Every unit of the account. Prefer `streamUnits` for anything that can
+   * work page by page or stop early.
+   */
+  async getAllUnits(accountId: string): Promise<Unit[]> {
+    const pages = await collect(this.streamUnits(accountId));
+    return pages.flat();
   }
 
   private handleError(error: unknown): Error {
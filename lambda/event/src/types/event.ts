@@ -169,4 +169,34 @@ export interface EventsByStatusConnection {
   nextCursor?: string;
   limit: number;
   count: number;
-}
\ No newline at end of file
+}
+
+export enum EventExportStatus {
+  RUNNING = 'RUNNING',
+  COMPLETED = 'COMPLETED',
+  FAILED = 'FAILED'
+}
+
+export interface EventExportInput {
+  from: string;
+  to: string;
+  unitId?: string;
+  eventCategory?: EventCategory;
+  status?: EventStatus;
+  severity?: EventSeverity;
+  priority?: EventPriority;
+  sourceSystem?: SourceSystem;
+}
+
+export interface EventExport {
+  exportId: string;
+  accountId: string;
+  status: EventExportStatus;
+  from: string;
+  to: string;
+  count?: number;
+  url?: string;
+  error?: string;
+  startedAt: number;
+  completedAt?: number;
+}
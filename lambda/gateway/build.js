@@ -0,0 +1,76 @@
+#!/usr/bin/env node
+/*
+ * Bundle the consolidated resolver into dist/index.js.
+ *
+ *   node build.js            minified bundle, as deployed
+ *   node build.js --debug    readable output with inline source maps
+ *
+ * src/index.ts imports every resolver lambda's src/index.ts. Two resolution
+ * rules make those lambdas share one runtime instead of carrying nine copies
+ * of everything:
+ *
+ * - each lambda's synced src/shared copy resolves to lambda/shared/src, so
+ *   there is one HTTP pool, one tenant cache and one logger;
+ * - packages resolve from this directory's node_modules, so there is one
+ *   axios and one uuid.
+ *
+ * The lambdas are reached through import(), so each one's modules are only
+ * evaluated on the first request for one of its fields. dist/meta.json is the
+ * esbuild metafile, for a size breakdown per input.
+ */
+const fs = require('fs');
+const path = require('path');
+
+const esbuild = require('esbuild');
+
+const GATEWAY_DIR = __dirname;
+const GATEWAY_MODULES = path.join(GATEWAY_DIR, 'node_modules');
+const SHARED_ENTRY = path.resolve(GATEWAY_DIR, '..', 'shared', 'src', 'index.ts');
+
+const debug = process.argv.includes('--debug');
+
+const gatewayResolution = {
+  name: 'gateway-resolution',
+  setup(build) {
+    build.onResolve({ filter: /^\.\.?\/shared$/ }, args => {
+      // Only the synced copies: <lambda>/src/shared imported from <lambda>/src/**
+      const target = path.resolve(args.resolveDir, args.path);
+      return path.basename(path.dirname(target)) === 'src' ? { path: SHARED_ENTRY } : undefined;
+    });
+
+    build.onResolve({ filter: /^[^./]/ }, args => {
+      if (args.pluginData === 'gateway' || args.resolveDir.startsWith(GATEWAY_MODULES)) {
+        return undefined;
+      }
+      return build.resolve(args.path, { kind: args.kind, resolveDir: GATEWAY_DIR, pluginData: 'gateway' });
+    });
+  },
+};
+
+async function main() {
+  const result = await esbuild.build({
+    entryPoints: [path.join(GATEWAY_DIR, 'src', 'index.ts')],
+    outfile: path.join(GATEWAY_DIR, 'dist', 'index.js'),
+    bundle: true,
+    platform: 'node',
+    target: 'node18',
+    format: 'cjs',
+    minify: !debug,
+    keepNames: true,
+    sourcemap: debug ? 'inline' : false,
+    legalComments: 'none',
+    external: ['@aws-sdk/*'],
+    metafile: true,
+    logLevel: 'warning',
+    plugins: [gatewayResolution],
+  });
+
+  fs.writeFileSync(path.join(GATEWAY_DIR, 'dist', 'meta.json'), JSON.stringify(result.metafile));
+  const bytes = fs.statSync(path.join(GATEWAY_DIR, 'dist', 'index.js')).size;
+  console.log(`dist/index.js: ${bytes} bytes`);
+}
+
+main().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,109 @@
+import type { Callback, Context } from 'aws-lambda';
+
+import { FunctionName, HandlerLoaders, ResolverHandler, createGateway } from '../gateway';
+
+const context = {} as Context;
+const callback: Callback = () => undefined;
+
+const event = (fieldName: string, id = 0): { info: { fieldName: string }; id: number } => ({
+  info: { fieldName },
+  id,
+});
+
+function fakeLoaders(handlers: Partial<Record<FunctionName, ResolverHandler>> = {}): {
+  loaders: HandlerLoaders;
+  loads: FunctionName[];
+} {
+  const loads: FunctionName[] = [];
+  const names: FunctionName[] = [
+    'aggregate', 'account', 'contact', 'event', 'laborline', 'location', 'part', 'task', 'unit', 'workorder',
+  ];
+  const loaders = Object.fromEntries(
+    names.map(name => [
+      name,
+      async (): Promise<ResolverHandler> => {
+        loads.push(name);
+        return handlers[name] ?? (async (e: unknown): Promise<unknown> => ({ from: name, e }));
+      },
+    ])
+  ) as HandlerLoaders;
+  return { loaders, loads };
+}
+
+describe('createGateway', () => {
+  it('routes each field to the lambda that owns it, loading each lambda once on first use', async () => {
+    const { loaders, loads } = fakeLoaders();
+    const gateway = createGateway(loaders);
+
+    expect(loads).toEqual([]);
+    await expect(gateway(event('listWorkOrders'), context, callback)).resolves.toMatchObject({ from: 'workorder' });
+    await expect(gateway(event('getWorkOrder'), context, callback)).resolves.toMatchObject({ from: 'workorder' });
+    await expect(gateway(event('unit'), context, callback)).resolves.toMatchObject({ from: 'unit' });
+    await expect(gateway(event('listEventsByStatus'), context, callback)).resolves.toMatchObject({ from: 'event' });
+
+    expect(loads).toEqual(['workorder', 'unit', 'event']);
+  });
+
+  it('rejects fields no lambda answers', async () => {
+    const gateway = createGateway(fakeLoaders().loaders);
+
+    await expect(gateway(event('toString'), context, callback)).rejects.toThrow('Unknown field: toString');
+  });
+
+  it('retries a lambda whose import failed', async () => {
+    const { loaders } = fakeLoaders();
+    const load = jest
+      .fn<Promise<ResolverHandler>, []>()
+      .mockRejectedValueOnce(new Error('Cannot find module'))
+      .mockImplementation(loaders.part);
+    const gateway = createGateway({ ...loaders, part: load });
+
+    await expect(gateway(event('getPart'), context, callback)).rejects.toThrow('Cannot find module');
+    await expect(gateway(event('getPart'), context, callback)).resolves.toMatchObject({ from: 'part' });
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it('splits a batch by lambda and answers in payload order', async () => {
+    const unit = jest.fn(async (events: unknown) =>
+      (events as Array<{ id: number }>).map(e => ({ data: `unit-${e.id}` }))
+    );
+    const location = jest.fn(async (events: unknown) =>
+      (events as Array<{ id: number }>).map(e => ({ data: `location-${e.id}` }))
+    );
+    const gateway = createGateway(fakeLoaders({ unit, location }).loaders);
+
+    const results = await gateway(
+      [event('unit', 0), event('location', 1), event('unit', 2), event('nope', 3)],
+      context,
+      callback
+    );
+
+    expect(unit).toHaveBeenCalledTimes(1);
+    expect(location).toHaveBeenCalledTimes(1);
+    expect(results).toEqual([
+      { data: 'unit-0' },
+      { data: 'location-1' },
+      { data: 'unit-2' },
+      { data: null, errorMessage: 'Unknown field: nope', errorType: 'Error' },
+    ]);
+  });
+
+  it('fails only the batch items of a lambda that could not be loaded', async () => {
+    const { loaders } = fakeLoaders({
+      unit: async (events: unknown) => (events as unknown[]).map(() => ({ data: 'ok' })),
+    });
+    const gateway = createGateway({
+      ...loaders,
+      location: async () => {
+        throw new Error('Cannot find module');
+      },
+    });
+
+    const results = await gateway([event('location', 0), event('unit', 1)], context, callback);
+
+    expect(results).toEqual([
+      { data: null, errorMessage: 'Cannot find module', errorType: 'Error' },
+      { data: 'ok' },
+    ]);
+  });
+});
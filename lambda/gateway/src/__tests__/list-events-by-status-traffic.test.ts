@@ -0,0 +1,79 @@
+import path from 'path';
+
+import type { Callback, Context } from 'aws-lambda';
+
+import { handler } from '../../../event/src/index';
+import { configureTraffic, getTrafficStats, resetHttpPool } from '../../../event/src/shared';
+
+// The gateway serves listEventsByStatus with the event lambda's resolver, which
+// is replayed here against backend exchanges recorded with HTTP_TRAFFIC_MODE=record
+const context = { getRemainingTimeInMillis: () => 30000 } as Context;
+const callback: Callback = () => undefined;
+
+interface Page {
+  items: Array<{ eventId: string; status: string }>;
+  nextCursor?: string;
+}
+
+const listEventsByStatus = async (args: { cursor?: string; limit?: number }): Promise<Page> =>
+  (await handler(
+    {
+      arguments: { accountId: 'acct-1', ...args },
+      identity: { sub: 'acct-1', claims: { sub: 'acct-1' } },
+      request: { headers: { authorization: 'Bearer token-1' } },
+      info: {
+        fieldName: 'listEventsByStatus',
+        parentTypeName: 'Query',
+        selectionSetList: ['items', 'items/eventId', 'items/status', 'nextCursor'],
+      },
+    },
+    context,
+    callback
+  )) as Page;
+
+const statuses = (page: Page): string[][] => page.items.map(item => [item.eventId, item.status]);
+
+describe('listEventsByStatus against recorded backends', () => {
+  const env = process.env;
+
+  beforeAll(() => {
+    process.env = { ...env, EVENT_INDEX_CONCURRENCY: '2' };
+    resetHttpPool();
+    configureTraffic({
+      mode: 'replay',
+      fixture: path.join(__dirname, 'fixtures', 'list-events-by-status.jsonl'),
+      latencyScale: 0.2,
+    });
+  });
+
+  afterAll(() => {
+    process.env = env;
+    configureTraffic({ mode: 'off' });
+    resetHttpPool();
+  });
+
+  it('builds the status index with one call per unit events page, at most EVENT_INDEX_CONCURRENCY at once', async () => {
+    const first = await listEventsByStatus({ limit: 3 });
+
+    expect(statuses(first)).toEqual([
+      ['evt-10', 'acknowledged'],
+      ['evt-04', 'acknowledged'],
+      ['evt-11', 'closed'],
+    ]);
+    const stats = getTrafficStats();
+    expect(stats).toMatchObject({ calls: 7, unmatched: 0 });
+    expect(stats?.peakConcurrency).toBe(2);
+    expect(stats?.routes['GET /units/acct-1?limit=100']).toBe(1);
+    expect(stats?.routes['GET /events/acct-1?unitId=unit-2&cursor=evt-page-2']).toBe(1);
+
+    const second = await listEventsByStatus({ limit: 3, cursor: first.nextCursor });
+
+    expect(statuses(second)).toEqual([
+      ['evt-05', 'closed'],
+      ['evt-09', 'created'],
+      ['evt-06', 'created'],
+    ]);
+    // Later pages come from the container's index, not the backends
+    expect(getTrafficStats()?.calls).toBe(7);
+  });
+});
@@ -0,0 +1,131 @@
+import { UnitDetailClients, UnitDetailEvent, createUnitDetailResolver } from '../unit-detail';
+
+const unit = { id: 'unit-1', accountId: 'acct-1', locationId: 'loc-1' };
+const location = { locationId: 'loc-1', accountId: 'acct-1', locationType: 'address' };
+
+const event = (selectionSetList: string[] = [], args: Partial<UnitDetailEvent['arguments']> = {}): UnitDetailEvent => ({
+  arguments: { id: 'unit-1', ...args },
+  identity: { sub: 'acct-1', claims: { sub: 'acct-1' } },
+  request: { headers: { authorization: 'Bearer token-1' } },
+  info: { selectionSetList },
+});
+
+function fakeClients(overrides: Partial<UnitDetailClients> = {}): UnitDetailClients {
+  return {
+    getUnit: jest.fn(async () => unit as never),
+    getLocation: jest.fn(async () => location as never),
+    listWorkOrders: jest.fn(async () => ({ items: [{ workOrderId: 'wo-1' } as never], nextCursor: 'wo-next' })),
+    listParts: jest.fn(async () => ({ items: [{ partId: 'part-1' } as never] })),
+    listEvents: jest.fn(async () => ({ items: [{ eventId: 'evt-1' } as never] })),
+    ...overrides,
+  };
+}
+
+describe('getUnitDetail', () => {
+  const env = process.env;
+
+  beforeEach(() => {
+    process.env = { ...env };
+  });
+
+  afterAll(() => {
+    process.env = env;
+  });
+
+  it('loads every section for the caller and account in the token', async () => {
+    const clients = fakeClients();
+    const clientsFor = jest.fn(() => clients);
+
+    const detail = await createUnitDetailResolver(clientsFor)(event());
+
+    expect(clientsFor).toHaveBeenCalledWith('token-1');
+    expect(clients.getUnit).toHaveBeenCalledWith('acct-1', 'unit-1');
+    expect(clients.getLocation).toHaveBeenCalledWith('acct-1', 'loc-1');
+    expect(detail).toEqual({
+      unit,
+      location,
+      workOrders: { items: [{ workOrderId: 'wo-1' }], nextCursor: 'wo-next' },
+      parts: { items: [{ partId: 'part-1' }] },
+      events: { items: [{ eventId: 'evt-1' }] },
+      errors: [],
+    });
+  });
+
+  it('starts the list sections without waiting for the unit', async () => {
+    let releaseUnit: () => void = () => undefined;
+    const clients = fakeClients({
+      getUnit: jest.fn(() => new Promise<never>(resolve => {
+        releaseUnit = () => resolve(unit as never);
+      })),
+    });
+
+    const pending = createUnitDetailResolver(() => clients)(event());
+    await new Promise(resolve => setImmediate(resolve));
+
+    expect(clients.listWorkOrders).toHaveBeenCalled();
+    expect(clients.listParts).toHaveBeenCalled();
+    expect(clients.listEvents).toHaveBeenCalled();
+    expect(clients.getLocation).not.toHaveBeenCalled();
+    releaseUnit();
+    await expect(pending).resolves.toMatchObject({ location });
+  });
+
+  it('returns the other sections when some fail', async () => {
+    const clients = fakeClients({
+      listParts: jest.fn(async () => {
+        throw new Error('Parts API unavailable');
+      }),
+      getUnit: jest.fn(async () => {
+        throw new TypeError('Unit not found');
+      }),
+    });
+
+    const detail = await createUnitDetailResolver(() => clients)(event());
+
+    expect(detail.unit).toBeNull();
+    expect(detail.location).toBeNull();
+    expect(detail.parts).toBeNull();
+    expect(detail.workOrders?.items).toHaveLength(1);
+    expect(detail.events?.items).toHaveLength(1);
+    expect(clients.getLocation).not.toHaveBeenCalled();
+    expect(detail.errors).toEqual([
+      { section: 'unit', message: 'Unit not found', errorType: 'TypeError' },
+      { section: 'parts', message: 'Parts API unavailable', errorType: 'Error' },
+    ]);
+  });
+
+  it('fetches only the selected sections', async () => {
+    const clients = fakeClients();
+
+    const detail = await createUnitDetailResolver(() => clients)(
+      event(['location', 'location/locationId', 'events', 'events/items', 'events/items/eventId', 'errors'])
+    );
+
+    expect(clients.getUnit).toHaveBeenCalled();
+    expect(clients.listWorkOrders).not.toHaveBeenCalled();
+    expect(clients.listParts).not.toHaveBeenCalled();
+    expect(detail).toMatchObject({ location, workOrders: null, parts: null, events: { items: [{ eventId: 'evt-1' }] } });
+  });
+
+  it('sizes each list section from its argument, the default and the cap', async () => {
+    process.env['UNIT_DETAIL_PAGE_SIZE'] = '15';
+    process.env['UNIT_DETAIL_MAX_PAGE_SIZE'] = '50';
+    const clients = fakeClients();
+
+    await createUnitDetailResolver(() => clients)(event([], { workOrdersLimit: 5, partsLimit: 500, eventsLimit: null }));
+
+    expect(clients.listWorkOrders).toHaveBeenCalledWith('acct-1', 'unit-1', 5);
+    expect(clients.listParts).toHaveBeenCalledWith('acct-1', 'unit-1', 50);
+    expect(clients.listEvents).toHaveBeenCalledWith('acct-1', 'unit-1', 15);
+  });
+
+  it('fails the whole field without credentials', async () => {
+    const clients = fakeClients();
+    const unauthenticated = { ...event(), request: { headers: {} } };
+
+    await expect(createUnitDetailResolver(() => clients)(unauthenticated)).rejects.toThrow(
+      'Authorization header is missing'
+    );
+    expect(clients.getUnit).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,198 @@
+import type { Callback, Context } from 'aws-lambda';
+
+import { BatchItemResult, BatchableEvent, logger } from './shared';
+
+export type FunctionName =
+  | 'aggregate'
+  | 'account'
+  | 'contact'
+  | 'event'
+  | 'laborline'
+  | 'location'
+  | 'part'
+  | 'task'
+  | 'unit'
+  | 'workorder';
+
+/**
+ * A resolver lambda's exported handler, called exactly as Lambda calls it
+ */
+export type ResolverHandler = (event: unknown, context: Context, callback: Callback) => unknown;
+
+/**
+ * Imports one resolver lambda's handler; called once per container, on the
+ * first request for one of its fields
+ */
+export type HandlerLoaders = Record<FunctionName, () => Promise<ResolverHandler>>;
+
+/**
+ * Every field the resolver lambdas answer and the lambda that owns it. Nested
+ * fields (WorkOrder.unit, EventWithUnitInfo.unit, location) are keyed by field
+ * name, as in the lambdas' own routing. A new resolver field must be added here
+ * before the gateway can serve it. `aggregate` fields exist only here: they
+ * combine several lambdas' backends in one invocation.
+ */
+export const FIELD_ROUTES: Readonly<Record<string, FunctionName>> = {
+  getUnitDetail: 'aggregate',
+
+  getAccount: 'account',
+  listAccounts: 'account',
+  createAccount: 'account',
+  updateAccount: 'account',
+  deleteAccount: 'account',
+
+  getContact: 'contact',
+  listContacts: 'contact',
+  createContact: 'contact',
+  updateContact: 'contact',
+  deleteContact: 'contact',
+
+  getEvent: 'event',
+  listEvents: 'event',
+  listEventsByStatus: 'event',
+  createEvent: 'event',
+  updateEvent: 'event',
+  deleteEvent: 'event',
+  startEventExport: 'event',
+  getEventExport: 'event',
+
+  getLaborLine: 'laborline',
+  listLaborLines: 'laborline',
+  createLaborLine: 'laborline',
+  updateLaborLine: 'laborline',
+  deleteLaborLine: 'laborline',
+
+  getLocation: 'location',
+  listLocations: 'location',
+  createLocation: 'location',
+  updateLocation: 'location',
+  deleteLocation: 'location',
+  location: 'location',
+
+  getPart: 'part',
+  listParts: 'part',
+  createPart: 'part',
+  createParts: 'part',
+  updatePart: 'part',
+  deletePart: 'part',
+
+  getTask: 'task',
+  listTasks: 'task',
+  createTask: 'task',
+  updateTask: 'task',
+  deleteTask: 'task',
+
+  getUnit: 'unit',
+  listUnits: 'unit',
+  createUnit: 'unit',
+  updateUnit: 'unit',
+  deleteUnit: 'unit',
+  getUnitWithWorkOrders: 'unit',
+  unit: 'unit',
+
+  getWorkOrder: 'workorder',
+  listWorkOrders: 'workorder',
+  createWorkOrder: 'workorder',
+  updateWorkOrder: 'workorder',
+  deleteWorkOrder: 'workorder',
+  createWorkOrders: 'workorder',
+  updateWorkOrders: 'workorder',
+  deleteWorkOrders: 'workorder',
+};
+
+function fieldNameOf(event: BatchableEvent): string {
+  return event.info?.fieldName ?? 'unknown';
+}
+
+function routeOf(event: BatchableEvent): FunctionName | undefined {
+  const fieldName = fieldNameOf(event);
+  return Object.prototype.hasOwnProperty.call(FIELD_ROUTES, fieldName) ? FIELD_ROUTES[fieldName] : undefined;
+}
+
+function failedItem(error: unknown): BatchItemResult {
+  return {
+    data: null,
+    errorMessage: error instanceof Error ? error.message : String(error),
+    errorType: error instanceof Error ? error.name : 'Error',
+  };
+}
+
+/**
+ * Build the consolidated handler: one routing table in front of every
+ * resolver lambda's own handler, so all of them share one warm container and
+ * its HTTP pool, tenant cache and logger. A lambda's module is imported on
+ * the first request for one of its fields, so fields that are never called
+ * cost nothing at init. Each lambda keeps its own auth checks and error
+ * shapes, since its handler is called unchanged.
+ */
+export function createGateway(loaders: HandlerLoaders): ResolverHandler {
+  const loaded = new Map<FunctionName, Promise<ResolverHandler>>();
+
+  function load(name: FunctionName): Promise<ResolverHandler> {
+    let handler = loaded.get(name);
+    if (handler === undefined) {
+      const started = process.hrtime.bigint();
+      handler = loaders[name]().then(loadedHandler => {
+        logger.info('Resolver module loaded', {
+          function: name,
+          loadMs: Number(process.hrtime.bigint() - started) / 1e6,
+        });
+        return loadedHandler;
+      });
+      // A failed import is retried by the next request instead of being remembered
+      handler.catch(() => loaded.delete(name));
+      loaded.set(name, handler);
+    }
+    return handler;
+  }
+
+  async function routeBatch(events: BatchableEvent[], context: Context, callback: Callback): Promise<unknown[]> {
+    const results = new Array<unknown>(events.length);
+    const groups = new Map<FunctionName, number[]>();
+    events.forEach((event, index) => {
+      const name = routeOf(event);
+      if (name === undefined) {
+        results[index] = failedItem(new Error(`Unknown field: ${fieldNameOf(event)}`));
+        return;
+      }
+      const group = groups.get(name);
+      if (group === undefined) {
+        groups.set(name, [index]);
+      } else {
+        group.push(index);
+      }
+    });
+
+    // Each lambda answers its share of the batch with one result per item, in order
+    await Promise.all(
+      [...groups].map(async ([name, indexes]) => {
+        try {
+          const handler = await load(name);
+          const answers = (await handler(indexes.map(index => events[index]), context, callback)) as unknown[];
+          indexes.forEach((eventIndex, position) => {
+            results[eventIndex] = answers[position];
+          });
+        } catch (error) {
+          logger.error('Batched items failed', { function: name, size: indexes.length, error });
+          indexes.forEach(eventIndex => {
+            results[eventIndex] = failedItem(error);
+          });
+        }
+      })
+    );
+    return results;
+  }
+
+  return async (event: unknown, context: Context, callback: Callback): Promise<unknown> => {
+    if (Array.isArray(event)) {
+      return routeBatch(event as BatchableEvent[], context, callback);
+    }
+
+    const name = routeOf(event as BatchableEvent);
+    if (name === undefined) {
+      throw new Error(`Unknown field: ${fieldNameOf(event as BatchableEvent)}`);
+    }
+    const handler = await load(name);
+    return handler(event, context, callback);
+  };
+}
@@ -0,0 +1,26 @@
+import { ResolverHandler, createGateway } from './gateway';
+
+// The resolver lambdas' handlers have differently typed events; the gateway
+// passes each one the event AppSync sent, untouched
+function asResolverHandler(resolverModule: { handler: unknown }): ResolverHandler {
+  return resolverModule.handler as ResolverHandler;
+}
+
+/**
+ * Consolidated AppSync resolver: answers the fields of every resolver lambda
+ * whose data source points at this function (terraform var.gateway_functions),
+ * and the aggregate fields such as getUnitDetail that only it serves. Each
+ * module is imported on first use.
+ */
+export const handler = createGateway({
+  aggregate: () => import('./unit-detail').then(asResolverHandler),
+  account: () => import('../../account/src/index').then(asResolverHandler),
+  contact: () => import('../../contact/src/index').then(asResolverHandler),
+  event: () => import('../../event/src/index').then(asResolverHandler),
+  laborline: () => import('../../laborline/src/index').then(asResolverHandler),
+  location: () => import('../../location/src/index').then(asResolverHandler),
+  part: () => import('../../part/src/index').then(asResolverHandler),
+  task: () => import('../../task/src/index').then(asResolverHandler),
+  unit: () => import('../../unit/src/index').then(asResolverHandler),
+  workorder: () => import('../../workorder/src/index').then(asResolverHandler),
+});
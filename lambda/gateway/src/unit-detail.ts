@@ -0,0 +1,223 @@
+import { convertTimestamps } from '../../event/src/handlers/event-resolver';
+import { EventsApiService } from '../../event/src/services/events-api.service';
+import type { UnitEvent } from '../../event/src/types';
+import { LocationsApiService } from '../../location/src/services/locations-api.service';
+import type { Location } from '../../location/src/types';
+import { PartsApiService } from '../../part/src/services/parts-api';
+import type { Part } from '../../part/src/types';
+import { UnitsApiService } from '../../unit/src/services/units-api.service';
+import type { Unit } from '../../unit/src/types';
+import { workOrderToGraphQL } from '../../workorder/src/handlers/workorder-resolver';
+import { WorkOrdersApiService } from '../../workorder/src/services/workorders-api';
+import type { GraphQLWorkOrder } from '../../workorder/src/types';
+import {
+  FieldCosts,
+  Selection,
+  SelectionSource,
+  envInt,
+  getTenantCache,
+  logger,
+  span,
+  withAdmission,
+  withCompactResponses,
+  withDeadline,
+  withProfiling,
+  withTracing,
+} from './shared';
+
+export interface UnitDetailArguments {
+  id: string;
+  workOrdersLimit?: number | null;
+  partsLimit?: number | null;
+  eventsLimit?: number | null;
+}
+
+export interface UnitDetailEvent extends SelectionSource {
+  arguments: UnitDetailArguments;
+  identity?: { sub?: string; claims?: Record<string, unknown> } | null;
+  request?: { headers?: Record<string, string | undefined> };
+}
+
+export type UnitDetailSection = 'unit' | 'location' | 'workOrders' | 'parts' | 'events';
+
+// Order of the `errors` entries, whichever section failed first
+const SECTIONS: readonly UnitDetailSection[] = ['unit', 'location', 'workOrders', 'parts', 'events'];
+
+export interface UnitDetailPage<T> {
+  items: T[];
+  nextCursor?: string;
+}
+
+export interface UnitDetailSectionError {
+  section: UnitDetailSection;
+  message: string;
+  errorType: string;
+}
+
+export interface UnitDetail {
+  unit: Unit | null;
+  location: Location | null;
+  workOrders: UnitDetailPage<GraphQLWorkOrder> | null;
+  parts: UnitDetailPage<Part> | null;
+  events: UnitDetailPage<UnitEvent> | null;
+  errors: UnitDetailSectionError[];
+}
+
+/**
+ * The backend calls behind each section, for one caller's token
+ */
+export interface UnitDetailClients {
+  getUnit(accountId: string, unitId: string): Promise<Unit>;
+  getLocation(accountId: string, locationId: string): Promise<Location>;
+  listWorkOrders(accountId: string, unitId: string, limit: number): Promise<UnitDetailPage<GraphQLWorkOrder>>;
+  listParts(accountId: string, unitId: string, limit: number): Promise<UnitDetailPage<Part>>;
+  listEvents(accountId: string, unitId: string, limit: number): Promise<UnitDetailPage<UnitEvent>>;
+}
+
+/**
+ * The resolver lambdas' own API services, shaped as their list fields answer
+ * (GraphQL timestamps for work orders and events). Unit and location lookups
+ * go through the tenant cache under the keys getUnit and getLocation use.
+ */
+export function apiClients(authToken: string): UnitDetailClients {
+  const cache = getTenantCache();
+  return {
+    getUnit: (accountId, unitId) =>
+      cache.getOrLoad(accountId, 'unit', unitId, () => new UnitsApiService(authToken).getUnit({ accountId, id: unitId })),
+
+    getLocation: (accountId, locationId) =>
+      cache.getOrLoad(accountId, 'location', locationId, () =>
+        new LocationsApiService(authToken).getLocation({ accountId, locationId })
+      ),
+
+    listWorkOrders: async (accountId, unitId, limit) => {
+      const service = new WorkOrdersApiService(
+        process.env['WORKORDERS_API_URL'] ?? 'https://workorder-srnext.sb.fullbay.com'
+      );
+      const response = await service.listWorkOrders(accountId, { unitId, pageSize: limit }, authToken);
+      return {
+        items: response.items.map(workOrder => workOrderToGraphQL(workOrder)),
+        ...(response.nextCursor !== undefined && { nextCursor: response.nextCursor }),
+      };
+    },
+
+    listParts: async (accountId, unitId, limit) => {
+      const service = new PartsApiService(process.env['PARTS_API_URL'] ?? 'https://part-srnext.sb.fullbay.com');
+      const response = await service.listParts(accountId, { unitId, limit }, authToken);
+      const nextCursor = response.pagination.nextCursor;
+      return {
+        items: response.data,
+        ...(nextCursor !== null && nextCursor !== undefined && { nextCursor }),
+      };
+    },
+
+    listEvents: async (accountId, unitId, limit) => {
+      const response = await new EventsApiService(authToken).listEvents({ accountId, unitId, limit });
+      return {
+        items: response.items.map(unitEvent => convertTimestamps(unitEvent)),
+        ...(response.nextCursor !== undefined && { nextCursor: response.nextCursor }),
+      };
+    },
+  };
+}
+
+/**
+ * Rows per list section: the field's argument, else UNIT_DETAIL_PAGE_SIZE
+ * (default 20), capped at UNIT_DETAIL_MAX_PAGE_SIZE (default 100)
+ */
+function pageSize(requested: number | null | undefined): number {
+  const limit = requested !== null && requested !== undefined && requested > 0
+    ? requested
+    : envInt('UNIT_DETAIL_PAGE_SIZE', 20);
+  return Math.min(limit, envInt('UNIT_DETAIL_MAX_PAGE_SIZE', 100));
+}
+
+function sectionError(section: UnitDetailSection, error: unknown): UnitDetailSectionError {
+  return {
+    section,
+    message: error instanceof Error ? error.message : String(error),
+    errorType: error instanceof Error ? error.name : 'Error',
+  };
+}
+
+/**
+ * Build the `getUnitDetail` resolver: everything the unit detail screen shows,
+ * in one invocation instead of one root field (and lambda) per section.
+ *
+ * The work order, part and event pages only need the unit ID, so they load
+ * at the same time as the unit; the location follows as soon as the unit
+ * names it. Only selected sections are fetched. A failing section comes back
+ * as null with an entry in `errors` and the others are still returned, so
+ * one slow or broken backend costs the screen one panel, not the whole page
+ * (without the unit there is no location either). Missing credentials fail
+ * the field as a whole.
+ */
+export function createUnitDetailResolver(
+  clientsFor: (authToken: string) => UnitDetailClients
+): (event: UnitDetailEvent) => Promise<UnitDetail> {
+  return async event => {
+    const authorization = event.request?.headers?.['authorization'];
+    if (authorization === undefined || authorization === '') {
+      throw new Error('Authorization header is missing');
+    }
+    const claimedSub = event.identity?.claims?.['sub'];
+    const accountId = typeof claimedSub === 'string' ? claimedSub : event.identity?.sub;
+    if (accountId === undefined || accountId === '') {
+      throw new Error('User identity not found in token');
+    }
+
+    const { id, workOrdersLimit, partsLimit, eventsLimit } = event.arguments;
+    const clients = clientsFor(authorization.replace(/^Bearer\s+/i, ''));
+    const selection = Selection.fromEvent(event);
+    const errors: UnitDetailSectionError[] = [];
+
+    // Each section settles on its own; a failure becomes null plus an error entry
+    const load = <T>(section: UnitDetailSection, fetch: () => Promise<T>): Promise<T | null> =>
+      span('section', fetch, { section }).catch((error: unknown) => {
+        logger.warn('Unit detail section failed', { section, unitId: id, error });
+        errors.push(sectionError(section, error));
+        return null;
+      });
+    const skipped = Promise.resolve(null);
+
+    const wantsLocation = selection.has('location');
+    const unit: Promise<Unit | null> =
+      selection.has('unit') || wantsLocation ? load('unit', () => clients.getUnit(accountId, id)) : skipped;
+    const location: Promise<Location | null> = wantsLocation
+      ? unit.then(loaded =>
+          loaded === null ? null : load('location', () => clients.getLocation(accountId, loaded.locationId))
+        )
+      : skipped;
+
+    const [unitResult, locationResult, workOrders, parts, events] = await Promise.all([
+      unit,
+      location,
+      selection.has('workOrders')
+        ? load('workOrders', () => clients.listWorkOrders(accountId, id, pageSize(workOrdersLimit)))
+        : skipped,
+      selection.has('parts') ? load('parts', () => clients.listParts(accountId, id, pageSize(partsLimit))) : skipped,
+      selection.has('events') ? load('events', () => clients.listEvents(accountId, id, pageSize(eventsLimit))) : skipped,
+    ]);
+
+    errors.sort((a, b) => SECTIONS.indexOf(a.section) - SECTIONS.indexOf(b.section));
+    return { unit: unitResult, location: locationResult, workOrders, parts, events, errors };
+  };
+}
+
+const resolveUnitDetail = createUnitDetailResolver(apiClients);
+
+// Five sections of one backend request each; pageSize caps their pages
+const FIELD_COSTS: FieldCosts = { getUnitDetail: { base: 5 } };
+
+// AWSJSON fields of the parts and events sections, passed through as stored
+const JSON_FIELDS = ['specifications', 'extendedAttributes'];
+
+/**
+ * Lambda entry point for `getUnitDetail`, reached through the gateway's
+ * routing table
+ */
+export const handler = withDeadline(withProfiling(withTracing(withAdmission(FIELD_COSTS, withCompactResponses(
+  (event: UnitDetailEvent): Promise<UnitDetail> =>
+    logger.runWithField('getUnitDetail', () => resolveUnitDetail(event)),
+  JSON_FIELDS
+)))));
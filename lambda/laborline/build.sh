@@ -2,6 +2,9 @@
 
 set -e
 
+echo "Checking shared sources..."
+../shared/sync.sh --check
+
 echo "Installing dependencies..."
 npm install
 
@@ -8,6 +8,7 @@ import {
   DeleteLaborLineResponse,
 } from '../types';
 import { LaborLinesApiService } from '../services/laborlines-api.service';
+import { logger } from '../shared';
 
 // GraphQL operation argument types
 interface GetLaborLineArguments {
@@ -74,12 +75,12 @@ export class LaborLineResolver {
   }
 
   async handleRequest(event: AppSyncEvent): Promise<unknown> {
-    console.log('Received AppSync event:', JSON.stringify(event, null, 2));
+    logger.debug('Received AppSync event', () => ({ event }));
 
     try {
       // Extract JWT account ID from the event
       this.jwtAccountId = this.extractJwtAccountId(event);
-      console.log('Authenticated user (JWT sub):', this.jwtAccountId);
+      logger.debug('Authenticated user', { jwtAccountId: this.jwtAccountId });
 
       const fieldName = event.info?.fieldName;
       
@@ -98,7 +99,7 @@ export class LaborLineResolver {
           throw new Error(`Unknown field: ${fieldName}`);
       }
     } catch (error) {
-      console.error('Error handling request:', error);
+      logger.error('Error handling request', { error });
       throw error;
     }
   }
@@ -109,12 +110,12 @@ export class LaborLineResolver {
     // Validate that the requested accountId matches the JWT sub claim
     this.validateAccountAccess(accountId);
     
-    console.log(`Getting labor line: ${laborLineId} for account: ${accountId}`);
+    logger.debug('Getting labor line', { accountId, laborLineId });
     
     const apiService = this.ensureApiService();
     const laborLine = await apiService.getLaborLine({ accountId, laborLineId });
     
-    console.log('Labor line retrieved successfully');
+    logger.debug('Labor line retrieved successfully');
     return laborLine;
   }
 
@@ -124,7 +125,7 @@ export class LaborLineResolver {
     // Validate that the requested accountId matches the JWT sub claim
     this.validateAccountAccess(accountId);
     
-    console.log(`Listing labor lines for account: ${accountId}, taskId: ${taskId || 'all'}`);
+    logger.debug('Listing labor lines', { accountId, taskId: taskId || 'all' });
     
     const apiService = this.ensureApiService();
     const result = await apiService.listLaborLines({
@@ -134,7 +135,7 @@ export class LaborLineResolver {
       limit,
     });
     
-    console.log(`Retrieved ${result.items.length} labor lines`);
+    logger.debug('Retrieved labor lines', { count: result.items.length });
     return result;
   }
 
@@ -144,7 +145,7 @@ export class LaborLineResolver {
     // Validate that the requested accountId matches the JWT sub claim
     this.validateAccountAccess(accountId);
     
-    console.log(`Creating labor line for account: ${accountId}`);
+    logger.debug('Creating labor line', { accountId });
     
     // Generate laborLineId if not provided
     const createInput: CreateLaborLineInput = {
@@ -152,12 +153,12 @@ export class LaborLineResolver {
       laborLineId: input.laborLineId || uuidv4(),
     };
     
-    console.log('Create labor line input:', JSON.stringify(createInput, null, 2));
+    logger.debug('Create labor line input', () => ({ input: createInput }));
     
     const apiService = this.ensureApiService();
     const laborLine = await apiService.createLaborLine({ accountId }, createInput);
     
-    console.log('Labor line created successfully');
+    logger.debug('Labor line created successfully');
     return laborLine;
   }
 
@@ -167,13 +168,13 @@ export class LaborLineResolver {
     // Validate that the requested accountId matches the JWT sub claim
     this.validateAccountAccess(accountId);
     
-    console.log(`Updating labor line: ${laborLineId} for account: ${accountId}`);
-    console.log('Update labor line input:', JSON.stringify(input, null, 2));
+    logger.debug('Updating labor line', { accountId, laborLineId });
+    logger.debug('Update labor line input', () => ({ input }));
     
     const apiService = this.ensureApiService();
     const laborLine = await apiService.updateLaborLine({ accountId, laborLineId }, input);
     
-    console.log('Labor line updated successfully');
+    logger.debug('Labor line updated successfully');
     return laborLine;
   }
 
@@ -183,12 +184,12 @@ export class LaborLineResolver {
     // Validate that the requested accountId matches the JWT sub claim
     this.validateAccountAccess(accountId);
     
-    console.log(`Deleting labor line: ${laborLineId} for account: ${accountId}`);
+    logger.debug('Deleting labor line', { accountId, laborLineId });
     
     const apiService = this.ensureApiService();
     await apiService.deleteLaborLine({ accountId, laborLineId });
     
-    console.log('Labor line deleted successfully');
+    logger.debug('Labor line deleted successfully');
     return {
       success: true,
       accountId,
@@ -1,30 +1,54 @@
 import { AppSyncEvent } from './types';
 import { LaborLineResolver } from './handlers/laborline-resolver';
+import { logger, resolveBatch, spanSync, withCompactResponses, withDeadline, withProfiling, withTracing } from './shared';
 
-export const handler = async (event: AppSyncEvent): Promise<unknown> => {
-  console.log('Lambda function started');
+export const handler = withDeadline(withProfiling(withTracing(withCompactResponses(async (event: AppSyncEvent | AppSyncEvent[]): Promise<unknown> => {
+  if (Array.isArray(event)) {
+    // BatchInvoke: one result per item, in order, with per-item errors
+    logger.info('Lambda function started for a batch', { size: event.length });
+    return resolveBatch(event, {}, (item) => logger.runWithField(fieldNameOf(item), () => resolveEvent(item)));
+  }
+
+  return logger.runWithField(fieldNameOf(event), async () => {
+    logger.debug('Lambda function started');
 
-  try {
-    // Extract JWT token from the event
-    const authToken = event.request?.headers?.['Authorization'] || 
-                     event.request?.headers?.['authorization'];
+    try {
+      const result = await resolveEvent(event);
 
-    if (!authToken) {
-      throw new Error('Authentication required: No authorization token found');
+      logger.debug('Lambda function completed successfully');
+      return result;
+    } catch (error) {
+      logger.error('Lambda function error', { error });
+      throw error;
     }
+  });
+}))));
+
+function fieldNameOf(event: AppSyncEvent): string {
+  return event.info?.fieldName || 'unknown';
+}
 
-    // Remove 'Bearer ' prefix if present
-    const token = authToken.startsWith('Bearer ') 
-      ? authToken.slice(7) 
-      : authToken;
+async function resolveEvent(event: AppSyncEvent): Promise<unknown> {
+  const resolver = spanSync('auth', () => createResolver(event));
+  return resolver.handleRequest(event);
+}
 
-    const resolver = new LaborLineResolver(token);
-    const result = await resolver.handleRequest(event);
+/**
+ * A resolver acting for the caller's token
+ */
+function createResolver(event: AppSyncEvent): LaborLineResolver {
+  // Extract JWT token from the event
+  const authToken = event.request?.headers?.['Authorization'] || 
+                   event.request?.headers?.['authorization'];
 
-    console.log('Lambda function completed successfully');
-    return result;
-  } catch (error) {
-    console.error('Lambda function error:', error);
-    throw error;
+  if (!authToken) {
+    throw new Error('Authentication required: No authorization token found');
   }
-};
\ No newline at end of file
+
+  // Remove 'Bearer ' prefix if present
+  const token = authToken.startsWith('Bearer ') 
+    ? authToken.slice(7) 
+    : authToken;
+
+  return new LaborLineResolver(token);
+}
@@ -10,55 +10,55 @@ import {
   UpdateLaborLineParams,
   DeleteLaborLineParams,
 } from '../types';
+import { PageStreamOptions, getPooledClient, logger, streamPages, withAuth } from '../shared';
 
 export class LaborLinesApiService {
   private readonly httpClient: AxiosInstance;
   private readonly baseUrl: string;
 
-  constructor(authToken: string) {
+  constructor(private readonly authToken: string) {
     this.baseUrl = process.env.LABORLINES_API_URL || 'https://laborlines-dev.sb.fullbay.com';
-    
-    this.httpClient = axios.create({
-      baseURL: this.baseUrl,
-      timeout: 30000,
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${authToken}`,
-      },
-    });
 
-    this.httpClient.interceptors.response.use(
-      (response: AxiosResponse) => response,
-      (error: AxiosError) => {
-        console.error('Response error:', {
-          status: error.response?.status,
-          data: error.response?.data,
-          message: error.message,
-        });
-        return Promise.reject(this.handleError(error));
-      }
-    );
+    // Pooled client is shared across warm invocations, so interceptors are
+    // registered once and the auth token is added per request
+    this.httpClient = getPooledClient(this.baseUrl, (client) => {
+      client.interceptors.response.use(
+        (response: AxiosResponse) => response,
+        (error) => {
+          if (!axios.isAxiosError(error)) {
+            return Promise.reject(error);
+          }
+          logger.error('API response error', {
+            status: error.response?.status,
+            data: error.response?.data,
+            message: error.message,
+          });
+          return Promise.reject(LaborLinesApiService.handleError(error));
+        }
+      );
+    });
   }
 
   async getLaborLine(params: GetLaborLineParams): Promise<LaborLine> {
     try {
-      console.log(`Getting labor line: ${params.laborLineId} for account: ${params.accountId}`);
+      logger.debug('Getting labor line', { accountId: params.accountId, laborLineId: params.laborLineId });
       
       const response = await this.httpClient.get<LaborLine>(
-        `/labor-lines/${params.accountId}/${params.laborLineId}`
+        `/labor-lines/${params.accountId}/${params.laborLineId}`,
+        withAuth(this.authToken)
       );
       
-      console.log('Labor line retrieved successfully');
+      logger.debug('Labor line retrieved successfully');
       return response.data;
     } catch (error) {
-      console.error('Error getting labor line:', error);
+      logger.error('Error getting labor line', { error });
       throw error;
     }
   }
 
   async listLaborLines(params: ListLaborLinesParams): Promise<LaborLinePageResponse> {
     try {
-      console.log(`Listing labor lines for account: ${params.accountId}`);
+      logger.debug('Listing labor lines', { accountId: params.accountId });
       
       const queryParams = new URLSearchParams();
       if (params.taskId) queryParams.append('taskId', params.taskId);
@@ -67,68 +67,85 @@ export class LaborLinesApiService {
 
       const url = `/labor-lines/${params.accountId}${queryParams.toString() ? `?${queryParams.toString()}` : ''}`;
       
-      const response = await this.httpClient.get<LaborLinePageResponse>(url);
+      const response = await this.httpClient.get<LaborLinePageResponse>(url, withAuth(this.authToken));
       
-      console.log(`Retrieved ${response.data.items.length} labor lines`);
+      logger.debug('Retrieved labor lines', { count: response.data.items.length });
       return response.data;
     } catch (error) {
-      console.error('Error listing labor lines:', error);
+      logger.error('Error listing labor lines', { error });
       throw error;
     }
   }
 
+  /**
+   * Stream all of an account's labor lines (optionally for one task) page by
+   * page, prefetching the next page
+   */
+  streamLaborLines(
+    params: Omit<ListLaborLinesParams, 'cursor'>,
+    options?: PageStreamOptions
+  ): AsyncGenerator<LaborLine[], void, undefined> {
+    return streamPages(async cursor => {
+      const response = await this.listLaborLines({ limit: 100, ...params, cursor });
+      return { items: response.items, nextCursor: response.hasMore ? response.nextCursor : undefined };
+    }, options);
+  }
+
   async createLaborLine(params: CreateLaborLineParams, input: CreateLaborLineInput): Promise<LaborLine> {
     try {
-      console.log(`Creating labor line for account: ${params.accountId}`);
-      console.log('Create labor line input:', JSON.stringify(input, null, 2));
+      logger.debug('Creating labor line', { accountId: params.accountId });
+      logger.debug('Create labor line input', () => ({ input }));
       
       const response = await this.httpClient.post<LaborLine>(
         `/labor-lines/${params.accountId}`,
-        input
+        input,
+        withAuth(this.authToken)
       );
       
-      console.log('Labor line created successfully');
+      logger.debug('Labor line created successfully');
       return response.data;
     } catch (error) {
-      console.error('Error creating labor line:', error);
+      logger.error('Error creating labor line', { error });
       throw error;
     }
   }
 
   async updateLaborLine(params: UpdateLaborLineParams, input: UpdateLaborLineInput): Promise<LaborLine> {
     try {
-      console.log(`Updating labor line: ${params.laborLineId} for account: ${params.accountId}`);
-      console.log('Update labor line input:', JSON.stringify(input, null, 2));
+      logger.debug('Updating labor line', { accountId: params.accountId, laborLineId: params.laborLineId });
+      logger.debug('Update labor line input', () => ({ input }));
       
       const response = await this.httpClient.put<LaborLine>(
         `/labor-lines/${params.accountId}/${params.laborLineId}`,
-        input
+        input,
+        withAuth(this.authToken)
       );
       
-      console.log('Labor line updated successfully');
+      logger.debug('Labor line updated successfully');
       return response.data;
     } catch (error) {
-      console.error('Error updating labor line:', error);
+      logger.error('Error updating labor line', { error });
       throw error;
     }
   }
 
   async deleteLaborLine(params: DeleteLaborLineParams): Promise<void> {
     try {
-      console.log(`Deleting labor line: ${params.laborLineId} for account: ${params.accountId}`);
+      logger.debug('Deleting labor line', { accountId: params.accountId, laborLineId: params.laborLineId });
       
       await this.httpClient.delete(
-        `/labor-lines/${params.accountId}/${params.laborLineId}`
+        `/labor-lines/${params.accountId}/${params.laborLineId}`,
+        withAuth(this.authToken)
       );
       
-      console.log('Labor line deleted successfully');
+      logger.debug('Labor line deleted successfully');
     } catch (error) {
-      console.error('Error deleting labor line:', error);
+      logger.error('Error deleting labor line', { error });
       throw error;
     }
   }
 
-  private handleError(error: AxiosError): Error {
+  private static handleError(error: AxiosError): Error {
     if (error.response) {
       const status = error.response.status;
       const data = error.response.data as any;
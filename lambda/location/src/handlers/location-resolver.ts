@@ -6,6 +6,7 @@ import {
   UpdateLocationInput,
   LocationPageResponse,
 } from '../types';
+import { getTenantCache, logger, resolveBySourceId } from '../shared';
 
 interface GetLocationArguments {
   accountId: string;
@@ -37,6 +38,7 @@ interface DeleteLocationArguments {
 export class LocationResolver {
   private locationsApiService: LocationsApiService | undefined;
   private jwtAccountId: string | undefined;
+  private readonly cache = getTenantCache();
 
   constructor(event: AppSyncEvent) {
     this.initializeJwtContext(event);
@@ -46,9 +48,9 @@ export class LocationResolver {
   private initializeJwtContext(event: AppSyncEvent): void {
     if (event.identity?.claims?.sub) {
       this.jwtAccountId = event.identity.claims.sub;
-      console.log('JWT Account ID extracted:', this.jwtAccountId);
+      logger.debug('JWT account ID extracted', { jwtAccountId: this.jwtAccountId });
     } else {
-      console.warn('No JWT claims found in AppSync event');
+      logger.warn('No JWT claims found in AppSync event');
     }
   }
 
@@ -56,18 +58,17 @@ export class LocationResolver {
     const authHeader = event.request?.headers?.authorization || event.request?.headers?.Authorization;
     
     if (!authHeader) {
-      console.error('No authorization header found');
+      logger.error('No authorization header found');
       return;
     }
 
     const token = authHeader.replace(/^Bearer\s+/i, '');
     this.locationsApiService = new LocationsApiService(token);
-    console.log('Locations API service initialized with JWT token');
   }
 
   async resolve(event: AppSyncEvent): Promise<unknown> {
     const operation = event.info?.fieldName;
-    console.log(`Processing location operation: ${operation}`);
+    logger.debug('Processing location operation', { operation });
 
     try {
       switch (operation) {
@@ -81,15 +82,53 @@ export class LocationResolver {
           return this.updateLocation(event as unknown as AppSyncEvent<UpdateLocationArguments>);
         case 'deleteLocation':
           return this.deleteLocation(event as unknown as AppSyncEvent<DeleteLocationArguments>);
+        case 'location': {
+          const [location] = await this.resolvePartLocations([event]);
+          if (location instanceof Error) {
+            throw location;
+          }
+          return location;
+        }
         default:
           throw new Error(`Unknown operation: ${operation}`);
       }
     } catch (error) {
-      console.error(`Error in ${operation}:`, error);
+      logger.error('Location operation failed', { operation, error });
       throw error;
     }
   }
 
+  /**
+   * Resolve a batch of Part.location fields. Returns one entry per event, in
+   * order: the location, null when the part has no locationId, or an Error.
+   */
+  async resolvePartLocations(events: AppSyncEvent[]): Promise<unknown[]> {
+    if (!this.jwtAccountId) {
+      throw new Error('Authentication required: JWT token must be provided');
+    }
+    if (!this.locationsApiService) {
+      throw new Error('Locations API service not initialized');
+    }
+    const accountId = this.jwtAccountId;
+    const service = this.locationsApiService;
+
+    // Parts from another account resolve to an error, never to that account's locations
+    const ownsPart = (event: AppSyncEvent): boolean => event.source?.['accountId'] === accountId;
+
+    const locations = await resolveBySourceId(
+      events,
+      event => {
+        const locationId = event.source?.['locationId'];
+        return ownsPart(event) && typeof locationId === 'string' ? locationId : undefined;
+      },
+      locationIds => service.getLocationsByIds(accountId, locationIds),
+    );
+
+    return locations.map((location, index) =>
+      ownsPart(events[index]) ? location : new Error('Access denied: part belongs to another account')
+    );
+  }
+
   private validateAccountAccess(requestedAccountId: string): void {
     if (!this.jwtAccountId) {
       throw new Error('Authentication required: JWT token must be provided');
@@ -110,12 +149,15 @@ export class LocationResolver {
       throw new Error('Locations API service not initialized');
     }
 
-    console.log(`Getting location: ${locationId} for account: ${accountId}`);
+    logger.debug('Getting location', { accountId, locationId });
     
-    const location = await this.locationsApiService.getLocation({
-      accountId,
-      locationId,
-    });
+    const service = this.locationsApiService;
+    const location = await this.cache.getOrLoad(accountId, 'location', locationId, () =>
+      service.getLocation({
+        accountId,
+        locationId,
+      })
+    );
 
     return location;
   }
@@ -130,13 +172,28 @@ export class LocationResolver {
       throw new Error('Locations API service not initialized');
     }
 
-    console.log(`Listing locations for account: ${accountId}`);
+    logger.debug('Listing locations', { accountId });
     
-    const response = await this.locationsApiService.listLocations({
-      accountId,
-      cursor,
-      limit,
-    });
+    const service = this.locationsApiService;
+    const response = await this.cache.getOrLoad(accountId, 'location', { list: { cursor, limit } }, () =>
+      service.listLocations({
+        accountId,
+        cursor,
+        limit,
+      })
+    );
+
+    // Clients usually ask for the next page right away; load it in the background
+    const nextCursor = response.nextCursor;
+    if (nextCursor !== undefined) {
+      this.cache.prefetch(accountId, 'location', { list: { cursor: nextCursor, limit } }, () =>
+        service.listLocations({
+          accountId,
+          cursor: nextCursor,
+          limit,
+        })
+      );
+    }
 
     return response;
   }
@@ -156,13 +213,14 @@ export class LocationResolver {
       throw new Error('Input accountId must match request accountId');
     }
 
-    console.log(`Creating location for account: ${accountId}`);
-    console.log('Create location input:', JSON.stringify(input, null, 2));
+    logger.debug('Creating location', { accountId });
+    logger.debug('Create location input', () => ({ input }));
     
     const location = await this.locationsApiService.createLocation(
       { accountId },
       input
     );
+    await this.cache.invalidate(accountId, 'location');
 
     return location;
   }
@@ -182,13 +240,14 @@ export class LocationResolver {
       throw new Error('Input accountId must match request accountId');
     }
 
-    console.log(`Updating location: ${locationId} for account: ${accountId}`);
-    console.log('Update location input:', JSON.stringify(input, null, 2));
+    logger.debug('Updating location', { accountId, locationId });
+    logger.debug('Update location input', () => ({ input }));
     
     const location = await this.locationsApiService.updateLocation(
       { accountId, locationId },
       input
     );
+    await this.cache.invalidate(accountId, 'location');
 
     return location;
   }
@@ -203,12 +262,13 @@ export class LocationResolver {
       throw new Error('Locations API service not initialized');
     }
 
-    console.log(`Deleting location: ${locationId} for account: ${accountId}`);
+    logger.debug('Deleting location', { accountId, locationId });
     
     await this.locationsApiService.deleteLocation({
       accountId,
       locationId,
     });
+    await this.cache.invalidate(accountId, 'location');
 
     return true;
   }
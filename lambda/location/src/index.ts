@@ -1,19 +1,52 @@
 import { LocationResolver } from './handlers/location-resolver';
+import { BatchItemResult, logger, resolveBatch, spanSync, withCompactResponses, withDeadline, withProfiling, withTracing } from './shared';
 import { AppSyncEvent } from './types';
 
-export const handler = async (event: AppSyncEvent): Promise<unknown> => {
-  console.log('Location Lambda invoked with event:', JSON.stringify(event, null, 2));
-
-  try {
-    const resolver = new LocationResolver(event);
-    const result = await resolver.resolve(event);
-    
-    console.log('Location operation completed successfully');
-    return result;
-  } catch (error) {
-    console.error('Location Lambda error:', error);
-    
-    // Re-throw the error to let AppSync handle it
-    throw error;
+// AWSJSON fields of the types returned here, passed through as stored
+const JSON_FIELDS = ['extendedAttributes'];
+
+export const handler = withDeadline(withProfiling(withTracing(withCompactResponses(async (event: AppSyncEvent | AppSyncEvent[]): Promise<unknown> => {
+  if (Array.isArray(event)) {
+    return handleBatch(event);
   }
-};
\ No newline at end of file
+
+  return logger.runWithField(fieldNameOf(event), async () => {
+    logger.debug('Location Lambda invoked', () => ({ event }));
+
+    try {
+      const resolver = spanSync('auth', () => new LocationResolver(event));
+      const result = await resolver.resolve(event);
+
+      logger.debug('Location operation completed successfully');
+      return result;
+    } catch (error) {
+      logger.error('Location Lambda error', { error });
+
+      // Re-throw the error to let AppSync handle it
+      throw error;
+    }
+  });
+}, JSON_FIELDS))));
+
+/**
+ * Answer a BatchInvoke payload. All items come from the same GraphQL request,
+ * so one resolver (and one set of credentials) serves the whole batch, and
+ * Part.location is loaded for every part at once.
+ */
+async function handleBatch(events: AppSyncEvent[]): Promise<BatchItemResult[]> {
+  logger.info('Location Lambda invoked with a batch', { size: events.length });
+  if (events.length === 0) {
+    return [];
+  }
+
+  const resolver = spanSync('auth', () => new LocationResolver(events[0]));
+  return resolveBatch(
+    events,
+    { location: items => logger.runWithField('location', () => resolver.resolvePartLocations(items)) },
+    item => logger.runWithField(fieldNameOf(item), () => resolver.resolve(item)),
+  );
+}
+
+function fieldNameOf(event: AppSyncEvent): string {
+  return event.info?.fieldName || 'unknown';
+}
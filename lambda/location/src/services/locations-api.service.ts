@@ -10,42 +10,50 @@ import {
   UpdateLocationParams,
   DeleteLocationParams,
 } from '../types';
+import {
+  PageStreamOptions,
+  envInt,
+  getPooledClient,
+  logger,
+  mapWithConcurrency,
+  streamPages,
+  withAuth,
+} from '../shared';
 
 export class LocationsApiService {
   private readonly httpClient: AxiosInstance;
   private readonly baseUrl: string;
 
-  constructor(authToken: string) {
+  constructor(private readonly authToken: string) {
     this.baseUrl = process.env.LOCATIONS_API_URL || 'https://location-srnext.sb.fullbay.com';
-    
-    this.httpClient = axios.create({
-      baseURL: this.baseUrl,
-      timeout: 30000,
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${authToken}`,
-      },
-    });
 
-    this.httpClient.interceptors.response.use(
-      (response: AxiosResponse) => response,
-      (error: AxiosError) => {
-        console.error('Response error:', {
-          status: error.response?.status,
-          data: error.response?.data,
-          message: error.message,
-        });
-        return Promise.reject(this.handleError(error));
-      }
-    );
+    // Pooled client is shared across warm invocations, so interceptors are
+    // registered once and the auth token is added per request
+    this.httpClient = getPooledClient(this.baseUrl, (client) => {
+      client.interceptors.response.use(
+        (response: AxiosResponse) => response,
+        (error) => {
+          if (!axios.isAxiosError(error)) {
+            return Promise.reject(error);
+          }
+          logger.error('API response error', {
+            status: error.response?.status,
+            data: error.response?.data,
+            message: error.message,
+          });
+          return Promise.reject(LocationsApiService.handleError(error));
+        }
+      );
+    });
   }
 
   async getLocation(params: GetLocationParams): Promise<Location> {
     try {
-      console.log(`Getting location: ${params.locationId} for account: ${params.accountId}`);
+      logger.debug('Getting location', { accountId: params.accountId, locationId: params.locationId });
       
       const response = await this.httpClient.get<Location>(
-        `/locations/${params.locationId}`
+        `/locations/${params.locationId}`,
+        withAuth(this.authToken)
       );
       
       // Validate that the returned location belongs to the correct account
@@ -53,17 +61,17 @@ export class LocationsApiService {
         throw new Error(`Location ${params.locationId} does not belong to account ${params.accountId}`);
       }
       
-      console.log('Location retrieved successfully');
+      logger.debug('Location retrieved successfully');
       return response.data;
     } catch (error) {
-      console.error('Error getting location:', error);
+      logger.error('Error getting location', { error });
       throw error;
     }
   }
 
   async listLocations(params: ListLocationsParams): Promise<LocationPageResponse> {
     try {
-      console.log(`Listing locations for account: ${params.accountId}`);
+      logger.debug('Listing locations', { accountId: params.accountId });
       
       const queryParams = new URLSearchParams();
       queryParams.append('accountId', params.accountId);
@@ -72,40 +80,99 @@ export class LocationsApiService {
 
       const url = `/locations?${queryParams.toString()}`;
       
-      const response = await this.httpClient.get<LocationPageResponse>(url);
+      const response = await this.httpClient.get<LocationPageResponse>(url, withAuth(this.authToken));
       
-      console.log(`Retrieved ${response.data.items.length} locations`);
+      logger.debug('Retrieved locations', { count: response.data.items.length });
       return response.data;
     } catch (error) {
-      console.error('Error listing locations:', error);
+      logger.error('Error listing locations', { error });
       throw error;
     }
   }
 
+  /**
+   * Stream all of an account's locations page by page, prefetching the next page
+   */
+  streamLocations(accountId: string, limit = 100, options?: PageStreamOptions): AsyncGenerator<Location[], void, undefined> {
+    return streamPages(cursor => this.listLocations({ accountId, cursor, limit }), options);
+  }
+
+  /**
+   * Load several locations of one account, keyed by location ID.
+   *
+   * Used by the batched Part.location resolver. The account's location list
+   * is scanned first, bounded so it never costs more requests than fetching
+   * each location would; anything the scan did not reach is fetched by ID
+   * with bounded concurrency. Per-location failures are returned as errors.
+   */
+  async getLocationsByIds(accountId: string, locationIds: string[]): Promise<Map<string, Location | Error>> {
+    const wanted = new Set(locationIds);
+    const found = new Map<string, Location | Error>();
+    if (wanted.size === 0) {
+      return found;
+    }
+
+    let scanComplete = false;
+    const pageBudget = Math.min(envInt('LOCATIONS_SCAN_MAX_PAGES', 3), wanted.size - 1);
+    try {
+      let cursor: string | undefined;
+      for (let page = 0; page < pageBudget && !scanComplete; page++) {
+        const response = await this.listLocations({
+          accountId,
+          cursor,
+          limit: envInt('LOCATIONS_SCAN_PAGE_SIZE', 100),
+        });
+        for (const location of response.items) {
+          if (location.id && wanted.has(location.id)) {
+            found.set(location.id, location);
+          }
+        }
+        cursor = response.nextCursor;
+        scanComplete = !cursor || found.size === wanted.size;
+      }
+    } catch (error) {
+      logger.error('Location scan failed, falling back to per-location requests', { accountId, error });
+    }
+
+    if (scanComplete) {
+      return found;
+    }
+
+    const remaining = [...wanted].filter(id => !found.has(id));
+    await mapWithConcurrency(remaining, envInt('LOCATIONS_FETCH_CONCURRENCY', 8), async locationId => {
+      try {
+        found.set(locationId, await this.getLocation({ accountId, locationId }));
+      } catch (error) {
+        found.set(locationId, error instanceof Error ? error : new Error(String(error)));
+      }
+    });
+    return found;
+  }
+
   async createLocation(params: CreateLocationParams, input: CreateLocationInput): Promise<Location> {
     try {
-      console.log(`Creating location for account: ${params.accountId}`);
-      console.log('Create location input:', JSON.stringify(input, null, 2));
+      logger.debug('Creating location', { accountId: params.accountId });
+      logger.debug('Create location input', () => ({ input }));
       
       // Validate that input accountId matches params accountId
       if (input.accountId !== params.accountId) {
         throw new Error('Input accountId must match params accountId');
       }
       
-      const response = await this.httpClient.post<Location>('/locations', input);
+      const response = await this.httpClient.post<Location>('/locations', input, withAuth(this.authToken));
       
-      console.log('Location created successfully');
+      logger.debug('Location created successfully');
       return response.data;
     } catch (error) {
-      console.error('Error creating location:', error);
+      logger.error('Error creating location', { error });
       throw error;
     }
   }
 
   async updateLocation(params: UpdateLocationParams, input: UpdateLocationInput): Promise<Location> {
     try {
-      console.log(`Updating location: ${params.locationId} for account: ${params.accountId}`);
-      console.log('Update location input:', JSON.stringify(input, null, 2));
+      logger.debug('Updating location', { accountId: params.accountId, locationId: params.locationId });
+      logger.debug('Update location input', () => ({ input }));
       
       // If accountId is provided in input, validate it matches params
       if (input.accountId && input.accountId !== params.accountId) {
@@ -114,7 +181,8 @@ export class LocationsApiService {
       
       const response = await this.httpClient.put<Location>(
         `/locations/${params.locationId}`,
-        input
+        input,
+        withAuth(this.authToken)
       );
       
       // Validate that the returned location belongs to the correct account
@@ -122,17 +190,17 @@ export class LocationsApiService {
         throw new Error(`Location ${params.locationId} does not belong to account ${params.accountId}`);
       }
       
-      console.log('Location updated successfully');
+      logger.debug('Location updated successfully');
       return response.data;
     } catch (error) {
-      console.error('Error updating location:', error);
+      logger.error('Error updating location', { error });
       throw error;
     }
   }
 
   async deleteLocation(params: DeleteLocationParams): Promise<void> {
     try {
-      console.log(`Deleting location: ${params.locationId} for account: ${params.accountId}`);
+      logger.debug('Deleting location', { accountId: params.accountId, locationId: params.locationId });
       
       // First get the location to validate ownership
       const location = await this.getLocation({
@@ -144,16 +212,16 @@ export class LocationsApiService {
         throw new Error(`Location ${params.locationId} does not belong to account ${params.accountId}`);
       }
       
-      await this.httpClient.delete(`/locations/${params.locationId}`);
+      await this.httpClient.delete(`/locations/${params.locationId}`, withAuth(this.authToken));
       
-      console.log('Location deleted successfully');
+      logger.debug('Location deleted successfully');
     } catch (error) {
-      console.error('Error deleting location:', error);
+      logger.error('Error deleting location', { error });
       throw error;
     }
   }
 
-  private handleError(error: AxiosError): Error {
+  private static handleError(error: AxiosError): Error {
     if (error.response) {
       const status = error.response.status;
       const data = error.response.data as any;
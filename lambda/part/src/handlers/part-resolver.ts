@@ -3,6 +3,7 @@ import {
   AppSyncEvent,
   GetPartArguments,
   CreatePartArguments,
+  CreatePartsArguments,
   UpdatePartArguments,
   DeletePartArguments,
   ListPartsArguments,
@@ -12,13 +13,19 @@ import {
   GraphQLPartListResponse,
   GraphQLPartInput,
   GraphQLPartUpdateInput,
+  GraphQLPartBulkResult,
 } from '../types';
 import { PartsApiService } from '../services/parts-api';
+import { Selection, assertBulkSize, getTenantCache, logger, projectAll, runBulk } from '../shared';
+
+// Part fields kept in projected rows: nested resolvers (Part.location) read them
+const PART_KEY_FIELDS = ['accountId', 'partId', 'sortKey', 'locationId'] as const;
 
 export class PartResolver {
   private readonly partsApiService: PartsApiService;
   private readonly jwtToken: string | undefined;
   private readonly jwtAccountId: string | undefined;
+  private readonly cache = getTenantCache();
 
   constructor(event: AppSyncEvent) {
     const apiUrl = process.env['PARTS_API_URL'] ?? 'https://part-srnext.sb.fullbay.com';
@@ -53,7 +60,7 @@ export class PartResolver {
     try {
       return JSON.parse(value) as T;
     } catch {
-      console.warn('Failed to parse JSON:', value);
+      logger.warn('Failed to parse JSON', { value });
       return undefined;
     }
   }
@@ -174,7 +181,7 @@ export class PartResolver {
 
   async resolve(event: AppSyncEvent): Promise<unknown> {
     const fieldName = event.info.fieldName;
-    console.log(`Resolving ${fieldName}`, JSON.stringify(event.arguments, null, 2));
+    logger.debug('Resolving field', () => ({ arguments: event.arguments }));
 
     try {
       switch (fieldName) {
@@ -182,6 +189,8 @@ export class PartResolver {
           return await this.getPart(event as unknown as AppSyncEvent<GetPartArguments>);
         case 'createPart':
           return await this.createPart(event as unknown as AppSyncEvent<CreatePartArguments>);
+        case 'createParts':
+          return await this.createParts(event as unknown as AppSyncEvent<CreatePartsArguments>);
         case 'updatePart':
           return await this.updatePart(event as unknown as AppSyncEvent<UpdatePartArguments>);
         case 'deletePart':
@@ -192,7 +201,7 @@ export class PartResolver {
           throw new Error(`Unknown field: ${fieldName}`);
       }
     } catch (error) {
-      console.error(`Error in ${fieldName}:`, error);
+      logger.error('Resolver failed', { error });
       throw error;
     }
   }
@@ -202,44 +211,74 @@ export class PartResolver {
     
     this.validateAccountAccess(accountId);
     
-    const parts = await this.partsApiService.listParts(
-      accountId,
-      { limit: 100 },
-      this.jwtToken
-    );
-    
-    const part = parts.data.find(p => {
-      const extractedPartId = this.extractPartIdFromSortKey(p.sortKey);
-      return extractedPartId === partId;
+    return this.cache.getOrLoad(accountId, 'part', partId, async () => {
+      const parts = await this.partsApiService.listParts(
+        accountId,
+        { limit: 100 },
+        this.jwtToken
+      );
+      
+      const part = parts.data.find(p => {
+        const extractedPartId = this.extractPartIdFromSortKey(p.sortKey);
+        return extractedPartId === partId;
+      });
+      
+      if (!part) {
+        throw new Error(`Part not found: ${partId}`);
+      }
+      
+      return part;
     });
+  }
+
+  private async createPart(event: AppSyncEvent<CreatePartArguments>): Promise<Part> {
+    const { accountId, input } = event.arguments;
     
-    if (!part) {
-      throw new Error(`Part not found: ${partId}`);
-    }
+    this.validateAccountAccess(accountId);
+    
+    const partInput = this.toPartCreateInput(input);
+    
+    logger.debug('Creating part', () => ({ input: partInput }));
     
+    const part = await this.partsApiService.createPart(accountId, partInput, this.jwtToken);
+    await this.cache.invalidate(accountId, 'part');
     return part;
   }
 
-  private async createPart(event: AppSyncEvent<CreatePartArguments>): Promise<Part> {
-    const { accountId, input } = event.arguments;
+  private async createParts(event: AppSyncEvent<CreatePartsArguments>): Promise<GraphQLPartBulkResult[]> {
+    const { accountId, inputs } = event.arguments;
     
     this.validateAccountAccess(accountId);
+    assertBulkSize(inputs);
     
+    const partInputs = inputs.map(input => this.toPartCreateInput(input));
+    
+    const results = await runBulk(
+      partInputs,
+      partInput => this.partsApiService.createPart(accountId, partInput, this.jwtToken),
+      { bulk: chunk => this.partsApiService.createPartsBulk(accountId, chunk, this.jwtToken) }
+    );
+    
+    const failed = results.filter(result => result.error !== null).length;
+    if (failed > 0) {
+      logger.warn('Bulk items failed', { failed, size: results.length });
+    }
+    // Even failed items may have been applied (a chunk can fail after the backend wrote it)
+    await this.cache.invalidate(accountId, 'part');
+    return results.map(({ index, data, error }) => ({ index, part: data, error }));
+  }
+
+  private toPartCreateInput(input: GraphQLPartInput): PartCreateInput {
     const createInput = this.transformGraphQLInputToPart(input);
     
     const partId = uuidv4();
     const sortKey = this.generateSortKey(createInput.locationId, createInput.unitId, partId);
     
-    const partInput: PartCreateInput = {
+    return {
       partId,
       sortKey,
       ...createInput,
     };
-    
-    console.log('Creating part with input:', JSON.stringify(partInput, null, 2));
-    
-    const part = await this.partsApiService.createPart(accountId, partInput, this.jwtToken);
-    return part;
   }
 
   private async updatePart(event: AppSyncEvent<UpdatePartArguments>): Promise<Part> {
@@ -276,9 +315,10 @@ export class PartResolver {
       newSortKey = this.generateSortKey(locationId, unitId, partId);
     }
     
-    console.log('Updating part with input:', JSON.stringify(updateInput, null, 2));
+    logger.debug('Updating part', () => ({ input: updateInput }));
     
     const part = await this.partsApiService.updatePart(accountId, newSortKey, updateInput, this.jwtToken);
+    await this.cache.invalidate(accountId, 'part');
     return part;
   }
 
@@ -303,6 +343,7 @@ export class PartResolver {
     }
     
     const success = await this.partsApiService.deletePart(accountId, part.sortKey, this.jwtToken);
+    await this.cache.invalidate(accountId, 'part');
     return success;
   }
 
@@ -319,22 +360,33 @@ export class PartResolver {
     if (unitId !== undefined) { options.unitId = unitId; }
     if (cursor !== undefined) { options.cursor = cursor; }
     
-    const response = await this.partsApiService.listParts(
-      accountId,
-      options,
-      this.jwtToken
+    const response = await this.cache.getOrLoad(accountId, 'part', { list: options }, () =>
+      this.partsApiService.listParts(accountId, options, this.jwtToken)
     );
     
     const result: GraphQLPartListResponse = {
-      items: response.data,
+      items: projectAll(response.data, Selection.fromEvent(event).at('items'), PART_KEY_FIELDS),
       limit: response.pagination.limit,
       count: response.pagination.count,
     };
     
     if (response.pagination.nextCursor !== null && response.pagination.nextCursor !== undefined) {
       result.nextCursor = response.pagination.nextCursor;
+      this.prefetchNextPage(accountId, { ...options, cursor: response.pagination.nextCursor });
     }
     
     return result;
   }
+
+  /**
+   * Clients usually ask for the next page right away; load it in the background
+   */
+  private prefetchNextPage(
+    accountId: string,
+    options: { locationId?: string; unitId?: string; limit?: number; cursor?: string }
+  ): void {
+    this.cache.prefetch(accountId, 'part', { list: options }, () =>
+      this.partsApiService.listParts(accountId, options, this.jwtToken)
+    );
+  }
 }
\ No newline at end of file
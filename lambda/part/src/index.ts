@@ -1,17 +1,31 @@
 import { Handler } from 'aws-lambda';
 import { AppSyncEvent } from './types';
 import { PartResolver } from './handlers/part-resolver';
+import { logger, resolveBatch, spanSync, withCompactResponses, withDeadline, withProfiling, withTracing } from './shared';
 
-export const handler: Handler<AppSyncEvent, unknown> = async (event: AppSyncEvent): Promise<unknown> => {
-  console.log('Received event:', JSON.stringify(event, null, 2));
-  
-  try {
-    const resolver = new PartResolver(event);
-    const result = await resolver.resolve(event);
-    console.log('Resolver result:', JSON.stringify(result, null, 2));
-    return result;
-  } catch (error) {
-    console.error('Error in part resolver:', error);
-    throw error;
+// AWSJSON fields of the types returned here, passed through as stored
+const JSON_FIELDS = ['specifications', 'extendedAttributes'];
+
+export const handler: Handler<AppSyncEvent | AppSyncEvent[], unknown> = withDeadline(withProfiling(withTracing(withCompactResponses(async (event: AppSyncEvent | AppSyncEvent[]): Promise<unknown> => {
+  if (Array.isArray(event)) {
+    // BatchInvoke: one result per item, in order, with per-item errors
+    logger.info('Received batch', { size: event.length });
+    return resolveBatch(event, {}, item =>
+      logger.runWithField(item.info.fieldName, () => spanSync('auth', () => new PartResolver(item)).resolve(item)),
+    );
   }
-};
\ No newline at end of file
+
+  return logger.runWithField(event.info.fieldName, async () => {
+    logger.debug('Received event', () => ({ event }));
+
+    try {
+      const resolver = spanSync('auth', () => new PartResolver(event));
+      const result = await resolver.resolve(event);
+      logger.debug('Resolver result', () => ({ result }));
+      return result;
+    } catch (error) {
+      logger.error('Error in part resolver', { error });
+      throw error;
+    }
+  });
+}, JSON_FIELDS))));
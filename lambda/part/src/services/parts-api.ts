@@ -1,18 +1,25 @@
 import axios, { AxiosInstance, AxiosError } from 'axios';
 import { Part, PartCreateInput, PartUpdateInput } from '../types/part';
-import { PartListApiResponse, PartApiResponse, DeleteApiResponse } from '../types/responses';
+import { PartListApiResponse, PartApiResponse, PartBulkApiResponse, DeleteApiResponse } from '../types/responses';
+import {
+  MissingEndpointLatch,
+  PageStreamOptions,
+  getPooledClient,
+  isMissingEndpoint,
+  logger,
+  streamPages,
+  withAuth,
+} from '../shared';
+
+// Set when the backend answers that it has no bulk endpoint, so bulk
+// creates in this container go straight to per-item calls for a while
+const bulkEndpoint = new MissingEndpointLatch();
 
 export class PartsApiService {
   private readonly apiClient: AxiosInstance;
 
   constructor(baseUrl: string) {
-    this.apiClient = axios.create({
-      baseURL: baseUrl,
-      timeout: 30000,
-      headers: {
-        'Content-Type': 'application/json',
-      },
-    });
+    this.apiClient = getPooledClient(baseUrl);
   }
 
   private handleApiError(error: unknown): never {
@@ -20,7 +27,7 @@ export class PartsApiService {
       const axiosError = error as AxiosError;
       const errorData = axiosError.response?.data as { error?: { message?: string } } | undefined;
       const message = errorData?.error?.message ?? axiosError.message;
-      console.error('API Error:', {
+      logger.error('API response error', {
         status: axiosError.response?.status,
         message,
         data: axiosError.response?.data,
@@ -55,17 +62,9 @@ export class PartsApiService {
         params.append('cursor', options.cursor);
       }
 
-      const headers: Record<string, string> = {};
-      if (jwtToken) {
-        headers['Authorization'] = `Bearer ${jwtToken}`;
-      }
-
       const response = await this.apiClient.get<PartListApiResponse>(
         `/parts/${accountId}`,
-        {
-          params,
-          headers,
-        }
+        withAuth(jwtToken, { params })
       );
 
       return response.data;
@@ -74,20 +73,35 @@ export class PartsApiService {
     }
   }
 
+  /**
+   * Stream all of an account's parts (optionally for one location or unit)
+   * page by page, prefetching the next page
+   */
+  streamParts(
+    accountId: string,
+    filter: { locationId?: string; unitId?: string; limit?: number } = {},
+    jwtToken?: string,
+    options?: PageStreamOptions
+  ): AsyncGenerator<Part[], void, undefined> {
+    return streamPages(async cursor => {
+      const response = await this.listParts(
+        accountId,
+        { limit: 100, ...filter, ...(cursor !== undefined && { cursor }) },
+        jwtToken
+      );
+      return { items: response.data, nextCursor: response.pagination.nextCursor };
+    }, options);
+  }
+
   async getPart(
     accountId: string,
     sortKey: string,
     jwtToken?: string
   ): Promise<Part> {
     try {
-      const headers: Record<string, string> = {};
-      if (jwtToken) {
-        headers['Authorization'] = `Bearer ${jwtToken}`;
-      }
-
       const response = await this.apiClient.get<PartApiResponse>(
         `/parts/${accountId}/${encodeURIComponent(sortKey)}`,
-        { headers }
+        withAuth(jwtToken)
       );
 
       if (!response.data.success || !response.data.data) {
@@ -106,15 +120,10 @@ export class PartsApiService {
     jwtToken?: string
   ): Promise<Part> {
     try {
-      const headers: Record<string, string> = {};
-      if (jwtToken) {
-        headers['Authorization'] = `Bearer ${jwtToken}`;
-      }
-
       const response = await this.apiClient.post<PartApiResponse>(
         `/parts/${accountId}`,
         input,
-        { headers }
+        withAuth(jwtToken)
       );
 
       if (!response.data.success || !response.data.data) {
@@ -127,6 +136,45 @@ export class PartsApiService {
     }
   }
 
+  /**
+   * Create parts through the backend's bulk endpoint: one part or Error per
+   * input, in order, or undefined if the backend has no bulk endpoint
+   */
+  async createPartsBulk(
+    accountId: string,
+    inputs: PartCreateInput[],
+    jwtToken?: string
+  ): Promise<Array<Part | Error> | undefined> {
+    if (bulkEndpoint.missing) {
+      return undefined;
+    }
+    try {
+      const response = await this.apiClient.post<PartBulkApiResponse>(
+        `/parts/${accountId}/bulk`,
+        { items: inputs },
+        withAuth(jwtToken)
+      );
+
+      if (!response.data.success || !Array.isArray(response.data.data)) {
+        throw new Error('Invalid response from parts API');
+      }
+
+      return response.data.data.map(entry => {
+        if ('error' in entry) {
+          return new Error(entry.error.message);
+        }
+        return entry.success && entry.data ? entry.data : new Error('Invalid response from parts API');
+      });
+    } catch (error) {
+      if (isMissingEndpoint(error)) {
+        bulkEndpoint.markMissing();
+        logger.info('No part bulk endpoint; creating one part per call');
+        return undefined;
+      }
+      this.handleApiError(error);
+    }
+  }
+
   async updatePart(
     accountId: string,
     sortKey: string,
@@ -134,15 +182,10 @@ export class PartsApiService {
     jwtToken?: string
   ): Promise<Part> {
     try {
-      const headers: Record<string, string> = {};
-      if (jwtToken) {
-        headers['Authorization'] = `Bearer ${jwtToken}`;
-      }
-
       const response = await this.apiClient.put<PartApiResponse>(
         `/parts/${accountId}/${encodeURIComponent(sortKey)}`,
         input,
-        { headers }
+        withAuth(jwtToken)
       );
 
       if (!response.data.success || !response.data.data) {
@@ -161,14 +204,9 @@ export class PartsApiService {
     jwtToken?: string
   ): Promise<boolean> {
     try {
-      const headers: Record<string, string> = {};
-      if (jwtToken) {
-        headers['Authorization'] = `Bearer ${jwtToken}`;
-      }
-
       const response = await this.apiClient.delete<DeleteApiResponse>(
         `/parts/${accountId}/${encodeURIComponent(sortKey)}`,
-        { headers }
+        withAuth(jwtToken)
       );
 
       return response.data.success === true;
@@ -0,0 +1,415 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { logger } from '../logging/logger';
+import { outsideDeadline } from '../utils/deadline';
+import { ByteBudgetLru } from './lru';
+
+/**
+ * A cache tier behind the container's own memory, e.g. a cache cluster shared
+ * by every container of a function. Values are serialized JSON. A tier that
+ * fails must fail soft: the tenant cache treats errors as misses.
+ */
+export interface CacheTier {
+  get(key: string): Promise<string | undefined>;
+  set(key: string, group: string, value: string, ttlMs: number): Promise<void>;
+  /** Drop every entry of a group (one account's records of one entity type) */
+  deleteGroup(group: string): Promise<void>;
+}
+
+/**
+ * In-process stand-in for a shared second tier, for tests and local runs.
+ * Share one instance between caches to simulate several containers.
+ */
+export class MemoryCacheTier implements CacheTier {
+  private readonly lru: ByteBudgetLru;
+
+  constructor(maxBytes = 256 * 1024 * 1024) {
+    this.lru = new ByteBudgetLru(maxBytes);
+  }
+
+  async get(key: string): Promise<string | undefined> {
+    return this.lru.get(key);
+  }
+
+  async set(key: string, group: string, value: string, ttlMs: number): Promise<void> {
+    this.lru.set(key, group, value, ttlMs);
+  }
+
+  async deleteGroup(group: string): Promise<void> {
+    this.lru.deleteGroup(group);
+  }
+}
+
+export interface TenantCacheOptions {
+  /** Master switch; when false every lookup goes to the loader */
+  enabled: boolean;
+  /** Byte budget of the in-container tier */
+  maxBytes: number;
+  /** TTL for entity types without an entry in ttls */
+  defaultTtlMs: number;
+  /** TTL by entity type */
+  ttls: ReadonlyMap<string, number>;
+  /** Optional shared tier consulted on an in-container miss */
+  secondTier?: CacheTier;
+  /** Background loading of the next list page; off when absent */
+  prefetch?: PrefetchOptions;
+}
+
+export interface PrefetchOptions {
+  /** TTL of a prefetched page (capped by the entity's own TTL) */
+  ttlMs: number;
+  /** Prefetches in flight at once; more are skipped */
+  maxInFlight: number;
+  /** Prefetching pauses while RSS is above this fraction of the function memory */
+  maxMemoryFraction: number;
+}
+
+export interface TenantCacheStats {
+  hits: number;
+  secondTierHits: number;
+  misses: number;
+  evictions: number;
+  entries: number;
+  bytes: number;
+  /** Prefetches started */
+  prefetches: number;
+  /** Hits answered by a prefetched page (or by joining a prefetch in flight) */
+  prefetchHits: number;
+  /** Prefetches not started because too many were in flight or memory was short */
+  prefetchSkipped: number;
+}
+
+/**
+ * How long each entity type may be served from cache. Work orders and tasks
+ * change during the day and are kept briefly; accounts and locations rarely
+ * change.
+ */
+export const DEFAULT_ENTITY_TTLS_MS: Readonly<Record<string, number>> = {
+  account: 300_000,
+  contact: 120_000,
+  location: 300_000,
+  part: 60_000,
+  task: 30_000,
+  unit: 60_000,
+  workOrder: 15_000,
+};
+
+const DEFAULT_MEMORY_MB = 256;
+
+function envNumber(name: string, fallback: number): number {
+  const raw = process.env[name];
+  if (raw === undefined || raw === '') {
+    return fallback;
+  }
+  const value = Number(raw);
+  return Number.isFinite(value) && value >= 0 ? value : fallback;
+}
+
+/**
+ * Cache settings from the environment:
+ *
+ *   CACHE_ENABLED           "false" turns caching off (default on)
+ *   CACHE_MAX_BYTES         in-container budget; defaults to CACHE_MEMORY_FRACTION
+ *                           of the function's memory (AWS_LAMBDA_FUNCTION_MEMORY_SIZE)
+ *   CACHE_MEMORY_FRACTION   default 0.125, i.e. 32 MiB of a 256 MB function
+ *   CACHE_TTL_MS            TTL for entities without a default (default 30000)
+ *   CACHE_TTLS              per-entity overrides, e.g. "workOrder=5000,unit=120000"
+ *   CACHE_SECOND_TIER       "memory" plugs in the in-process MemoryCacheTier
+ *   CACHE_PREFETCH          "true" prefetches the next page of list calls (default off)
+ *   CACHE_PREFETCH_TTL_MS   how long a prefetched page is kept (default 10000)
+ *   CACHE_PREFETCH_MAX_IN_FLIGHT           concurrent prefetches (default 2)
+ *   CACHE_PREFETCH_MAX_MEMORY_FRACTION     RSS share of the function memory above
+ *                                          which prefetching pauses (default 0.8)
+ */
+export function tenantCacheOptionsFromEnv(): TenantCacheOptions {
+  const memoryBytes = envNumber('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', DEFAULT_MEMORY_MB) * 1024 * 1024;
+  const ttls = new Map<string, number>(Object.entries(DEFAULT_ENTITY_TTLS_MS));
+  for (const entry of (process.env['CACHE_TTLS'] ?? '').split(',')) {
+    const [entity, ttl] = entry.split('=');
+    const ttlMs = Number(ttl);
+    if (entity !== undefined && entity.trim() !== '' && Number.isFinite(ttlMs) && ttlMs >= 0) {
+      ttls.set(entity.trim(), ttlMs);
+    }
+  }
+  return {
+    enabled: process.env['CACHE_ENABLED'] !== 'false',
+    maxBytes: envNumber('CACHE_MAX_BYTES', Math.floor(memoryBytes * envNumber('CACHE_MEMORY_FRACTION', 0.125))),
+    defaultTtlMs: envNumber('CACHE_TTL_MS', 30_000),
+    ttls,
+    ...(process.env['CACHE_SECOND_TIER'] === 'memory' && { secondTier: new MemoryCacheTier() }),
+    ...(process.env['CACHE_PREFETCH'] === 'true' && {
+      prefetch: {
+        ttlMs: envNumber('CACHE_PREFETCH_TTL_MS', 10_000),
+        maxInFlight: envNumber('CACHE_PREFETCH_MAX_IN_FLIGHT', 2),
+        maxMemoryFraction: envNumber('CACHE_PREFETCH_MAX_MEMORY_FRACTION', 0.8),
+      },
+    }),
+  };
+}
+
+/**
+ * Serialize lookup arguments so equal arguments give equal keys regardless of
+ * property order; undefined properties are ignored.
+ */
+function stableKey(value: unknown): string {
+  if (value === null || typeof value !== 'object') {
+    return JSON.stringify(value) ?? '';
+  }
+  if (Array.isArray(value)) {
+    return `[${value.map(stableKey).join(',')}]`;
+  }
+  const fields = Object.entries(value as Record<string, unknown>)
+    .filter(([, field]) => field !== undefined)
+    .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0))
+    .map(([name, field]) => `${JSON.stringify(name)}:${stableKey(field)}`);
+  return `{${fields.join(',')}}`;
+}
+
+/**
+ * Read-through cache for backend records, partitioned by account.
+ *
+ * Keys combine the account, the entity type and either a record ID or the
+ * arguments of a list call, so one tenant can never be served another's
+ * entries. Lookups go to the in-container LRU first, then the optional second
+ * tier, then the loader. Any create/update/delete of an entity type should
+ * call `invalidate` for the account, which drops both its records and its
+ * list pages.
+ *
+ * `prefetch` loads the page a client is likely to ask for next (typically the
+ * next cursor of a list) in the background. A later lookup of that page is a
+ * hit, or joins the load if it is still in flight. Note that Lambda freezes a
+ * container between invocations: a prefetch still in flight when the handler
+ * returns resumes with the container's next invocation.
+ *
+ * Loads race invalidations: a record loaded before a mutation may resolve
+ * after the mutation's `invalidate`. Every invalidation bumps its group's
+ * generation, and a load only fills the cache if the generation it started
+ * under is still current, so the next lookup goes back to the loader.
+ *
+ * Only call it after the caller's access to the account has been checked.
+ */
+export class TenantCache {
+  private readonly local: ByteBudgetLru;
+  private readonly counters = {
+    hits: 0,
+    secondTierHits: 0,
+    misses: 0,
+    prefetches: 0,
+    prefetchHits: 0,
+    prefetchSkipped: 0,
+  };
+  /** Prefetches in flight by key, with the generation of their group they started under */
+  private readonly inFlight = new Map<string, { group: string; generation: number; value: Promise<unknown> }>();
+  /** Invalidations by group; groups never invalidated are at generation 0 */
+  private readonly generations = new Map<string, number>();
+  /** Keys of prefetched pages not looked up yet, to count prefetch hits */
+  private readonly prefetched = new Set<string>();
+
+  constructor(private readonly options: TenantCacheOptions = tenantCacheOptionsFromEnv()) {
+    this.local = new ByteBudgetLru(options.maxBytes);
+  }
+
+  /**
+   * The cached value for (accountId, entity, lookup), loading and caching it
+   * on a miss. `lookup` is a record ID or the list arguments. Loader errors
+   * and null/undefined results are passed through without caching.
+   */
+  async getOrLoad<T>(accountId: string, entity: string, lookup: string | object, load: () => Promise<T>): Promise<T> {
+    if (!this.options.enabled) {
+      return load();
+    }
+
+    const group = groupKey(accountId, entity);
+    const key = cacheKey(group, lookup);
+    const ttlMs = this.options.ttls.get(entity) ?? this.options.defaultTtlMs;
+    const generation = this.generation(group);
+
+    const local = this.local.get(key);
+    if (local !== undefined) {
+      this.counters.hits += 1;
+      if (this.prefetched.delete(key)) {
+        this.counters.prefetchHits += 1;
+        this.logLookup(entity, 'prefetch-hit');
+      } else {
+        this.logLookup(entity, 'hit');
+      }
+      return JSON.parse(local) as T;
+    }
+
+    const prefetching = this.inFlight.get(key);
+    if (prefetching !== undefined && prefetching.generation === generation) {
+      const value = (await prefetching.value) as T | undefined;
+      if (this.generation(group) === generation && value !== undefined && value !== null) {
+        this.prefetched.delete(key);
+        this.counters.hits += 1;
+        this.counters.prefetchHits += 1;
+        this.logLookup(entity, 'prefetch-hit');
+        return value;
+      }
+    }
+
+    const shared = await this.secondTierGet(key);
+    if (shared !== undefined) {
+      this.counters.secondTierHits += 1;
+      if (this.generation(group) === generation) {
+        this.local.set(key, group, shared, ttlMs);
+      }
+      this.logLookup(entity, 'second-tier-hit');
+      return JSON.parse(shared) as T;
+    }
+
+    this.counters.misses += 1;
+    this.logLookup(entity, 'miss');
+    const value = await load();
+    if (this.generation(group) !== generation) {
+      logger.debug('Cache load outlived an invalidation; not cached', { entity });
+    } else if (value !== undefined && value !== null) {
+      const serialized = JSON.stringify(value);
+      this.local.set(key, group, serialized, ttlMs);
+      await this.secondTierCall('set', tier => tier.set(key, group, serialized, ttlMs));
+    }
+    return value;
+  }
+
+  /**
+   * Start loading (accountId, entity, lookup) in the background so a later
+   * `getOrLoad` of it is a hit. Does nothing when prefetching is off, the
+   * entry is already cached or loading, `maxInFlight` prefetches are running
+   * or the container is short of memory. The load runs outside the current
+   * invocation's deadline; its errors are logged and dropped.
+   */
+  prefetch<T>(accountId: string, entity: string, lookup: string | object, load: () => Promise<T>): void {
+    const settings = this.options.prefetch;
+    if (!this.options.enabled || settings === undefined) {
+      return;
+    }
+    const group = groupKey(accountId, entity);
+    const key = cacheKey(group, lookup);
+    if (this.inFlight.has(key) || this.local.get(key) !== undefined) {
+      return;
+    }
+    if (this.inFlight.size >= settings.maxInFlight || underMemoryPressure(settings.maxMemoryFraction)) {
+      this.counters.prefetchSkipped += 1;
+      return;
+    }
+
+    this.counters.prefetches += 1;
+    const ttlMs = Math.min(settings.ttlMs, this.options.ttls.get(entity) ?? this.options.defaultTtlMs);
+    const entry = { group, generation: this.generation(group), value: Promise.resolve<unknown>(undefined) };
+    entry.value = outsideDeadline(load)
+      .then(value => {
+        if (this.generation(group) === entry.generation && value !== undefined && value !== null) {
+          this.local.set(key, group, JSON.stringify(value), ttlMs);
+          this.rememberPrefetched(key);
+        }
+        return value;
+      })
+      .catch((error: unknown) => {
+        logger.debug('Prefetch failed', { entity, error });
+        return undefined;
+      })
+      .finally(() => this.inFlight.delete(key));
+    this.inFlight.set(key, entry);
+  }
+
+  /**
+   * Drop every cached record and list page of `entity` for an account
+   */
+  async invalidate(accountId: string, entity: string): Promise<void> {
+    if (!this.options.enabled) {
+      return;
+    }
+    const group = groupKey(accountId, entity);
+    // Before any await, so loads in flight see it when they resolve
+    this.generations.set(group, this.generation(group) + 1);
+    const dropped = this.local.deleteGroup(group);
+    await this.secondTierCall('deleteGroup', tier => tier.deleteGroup(group));
+    logger.debug('Cache invalidated', { accountId, entity, dropped });
+  }
+
+  stats(): TenantCacheStats {
+    return {
+      ...this.counters,
+      evictions: this.local.evictions,
+      entries: this.local.size,
+      bytes: this.local.bytes,
+    };
+  }
+
+  private generation(group: string): number {
+    return this.generations.get(group) ?? 0;
+  }
+
+  private logLookup(entity: string, outcome: 'hit' | 'prefetch-hit' | 'second-tier-hit' | 'miss'): void {
+    logger.info('Cache lookup', () => ({ cache: { entity, outcome, ...this.stats() } }));
+  }
+
+  private rememberPrefetched(key: string): void {
+    this.prefetched.add(key);
+    // Pages expire or are evicted without being looked up; forget the oldest
+    if (this.prefetched.size > MAX_TRACKED_PREFETCHES) {
+      const oldest = this.prefetched.values().next();
+      if (oldest.done !== true) {
+        this.prefetched.delete(oldest.value);
+      }
+    }
+  }
+
+  private async secondTierGet(key: string): Promise<string | undefined> {
+    const tier = this.options.secondTier;
+    if (tier === undefined) {
+      return undefined;
+    }
+    try {
+      return await tier.get(key);
+    } catch (error) {
+      logger.warn('Cache second tier failed', { operation: 'get', error });
+      return undefined;
+    }
+  }
+
+  private async secondTierCall(operation: string, call: (tier: CacheTier) => Promise<void>): Promise<void> {
+    const tier = this.options.secondTier;
+    if (tier === undefined) {
+      return;
+    }
+    try {
+      await call(tier);
+    } catch (error) {
+      logger.warn('Cache second tier failed', { operation, error });
+    }
+  }
+}
+
+function groupKey(accountId: string, entity: string): string {
+  return `${accountId}|${entity}`;
+}
+
+function cacheKey(group: string, lookup: string | object): string {
+  return `${group}|${typeof lookup === 'string' ? lookup : stableKey(lookup)}`;
+}
+
+const MAX_TRACKED_PREFETCHES = 1000;
+
+function underMemoryPressure(maxFraction: number): boolean {
+  const limitBytes = envNumber('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', DEFAULT_MEMORY_MB) * 1024 * 1024;
+  return process.memoryUsage.rss() > limitBytes * maxFraction;
+}
+
+let cache: TenantCache | undefined;
+
+/**
+ * The container-wide tenant cache, created from the environment on first use
+ */
+export function getTenantCache(): TenantCache {
+  if (cache === undefined) {
+    cache = new TenantCache();
+  }
+  return cache;
+}
+
+/**
+ * Replace the container-wide cache. Intended for tests and benchmarks.
+ */
+export function resetTenantCache(options?: Partial<TenantCacheOptions>): void {
+  cache = options === undefined ? undefined : new TenantCache({ ...tenantCacheOptionsFromEnv(), ...options });
+}
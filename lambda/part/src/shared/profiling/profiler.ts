@@ -0,0 +1,347 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import crypto from 'crypto';
+import { promises as fs } from 'fs';
+import http from 'http';
+import https from 'https';
+import { Session } from 'inspector';
+import os from 'os';
+import path from 'path';
+
+import { credentialsFromEnv, sha256, signRequest } from '../http/sigv4';
+import { logger } from '../logging/logger';
+import type { InvocationTimer } from '../utils/deadline';
+
+/**
+ * Where captured profiles go: an S3 bucket when PROFILING_BUCKET is set,
+ * otherwise files in a directory (/tmp in Lambda, which nobody can read
+ * back, so only useful locally). Another store implements this interface and
+ * is plugged in with `configureProfiling({ sink })`.
+ */
+export interface ProfileSink {
+  write(name: string, contents: string): Promise<void>;
+}
+
+/**
+ * Writes each profile as a file in `directory`, creating it on first use
+ */
+export class DirectoryProfileSink implements ProfileSink {
+  constructor(readonly directory: string) {}
+
+  async write(name: string, contents: string): Promise<void> {
+    await fs.mkdir(this.directory, { recursive: true });
+    await fs.writeFile(path.join(this.directory, name), contents);
+  }
+}
+
+// S3 encodes every character outside RFC 3986's unreserved set in the signed path
+const encodeKeySegment = (segment: string): string =>
+  encodeURIComponent(segment).replace(/[!'()*]/g, char => `%${char.charCodeAt(0).toString(16).toUpperCase()}`);
+
+function put(url: URL, headers: Record<string, string>, body: Buffer, timeoutMs: number): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const request = (url.protocol === 'https:' ? https : http).request(url, { method: 'PUT', headers }, response => {
+      const chunks: Buffer[] = [];
+      response.on('data', (chunk: Buffer) => chunks.push(chunk));
+      response.on('end', () => {
+        const status = response.statusCode ?? 0;
+        if (status >= 200 && status < 300) {
+          resolve();
+        } else {
+          const detail = Buffer.concat(chunks).toString('utf8').slice(0, 200);
+          reject(new Error(`PUT ${url.pathname} failed with ${status}: ${detail}`));
+        }
+      });
+      response.on('error', reject);
+    });
+    request.setTimeout(timeoutMs, () => {
+      request.destroy(new Error(`PUT ${url.pathname} timed out after ${timeoutMs} ms`));
+    });
+    request.on('error', reject);
+    request.end(body);
+  });
+}
+
+/**
+ * Puts each profile into an S3 bucket as `<prefix>/<name>`, signed with the
+ * function's role. `endpoint` (e.g. http://localhost:9000) replaces the
+ * regional S3 endpoint for a local stand-in, with the bucket in the path.
+ */
+export class S3ProfileSink implements ProfileSink {
+  constructor(
+    readonly bucket: string,
+    private readonly region: string,
+    readonly prefix = '',
+    private readonly endpoint?: string,
+    private readonly timeoutMs = 5000,
+  ) {}
+
+  async write(name: string, contents: string): Promise<void> {
+    const key = [...this.prefix.split('/'), name]
+      .filter(segment => segment !== '')
+      .map(encodeKeySegment)
+      .join('/');
+    const url =
+      this.endpoint === undefined
+        ? new URL(`https://${this.bucket}.s3.${this.region}.amazonaws.com/${key}`)
+        : new URL(`${this.endpoint.replace(/\/+$/, '')}/${this.bucket}/${key}`);
+    const body = Buffer.from(contents, 'utf8');
+    const payloadHash = sha256(body);
+    const unsigned = { 'content-type': 'application/json', 'x-amz-content-sha256': payloadHash };
+    const credentials = credentialsFromEnv();
+    const request = { method: 'PUT', url, headers: unsigned, payloadHash, service: 's3', region: this.region };
+    const headers = credentials === undefined ? unsigned : signRequest(request, credentials);
+    await put(url, { ...headers, 'content-length': String(body.length) }, body, this.timeoutMs);
+  }
+}
+
+export interface ProfilingOptions {
+  /** GraphQL fields profiled on every invocation */
+  fields: ReadonlySet<string>;
+  /** Share of all other invocations profiled, 0..1 */
+  sampleRate: number;
+  /** Request header that asks for a profile of its invocation; off when absent */
+  header?: string;
+  /** Value the header must carry; without it the header is ignored */
+  headerSecret?: string;
+  /** Also record a sampling heap profile (of all allocations, collected ones included) */
+  heap: boolean;
+  /** CPU sampling interval in microseconds */
+  samplingIntervalUs: number;
+  /** Average bytes allocated between heap samples */
+  heapSamplingIntervalBytes: number;
+  sink: ProfileSink;
+}
+
+/**
+ * The Lambda context, as far as profiling needs it
+ */
+export interface ProfiledContext extends InvocationTimer {
+  awsRequestId?: string;
+}
+
+function envNumber(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return process.env[name] !== undefined && process.env[name] !== '' && Number.isFinite(value) && value >= 0
+    ? value
+    : fallback;
+}
+
+/**
+ * Profiling settings from the environment:
+ *
+ *   PROFILING_FIELDS        comma-separated fields profiled on every invocation
+ *   PROFILING_SAMPLE_RATE   share of other invocations profiled (default 0)
+ *   PROFILING_HEADER        request header (e.g. x-bff-profile) that profiles
+ *                           its invocation when it carries the secret below
+ *                           (default none)
+ *   PROFILING_HEADER_SECRET value PROFILING_HEADER must carry (unset: the
+ *                           header is ignored)
+ *   PROFILING_HEAP          "false" skips the heap profile
+ *   PROFILING_INTERVAL_US   CPU sampling interval (default 1000)
+ *   PROFILING_HEAP_INTERVAL_BYTES   heap sampling interval (default 32768)
+ *   PROFILING_BUCKET        S3 bucket profiles are put into (unset: PROFILING_DIR)
+ *   PROFILING_PREFIX        key prefix in the bucket (default the function name)
+ *   PROFILING_DIR           where profiles are written without a bucket
+ *                           (default <tmpdir>/profiles)
+ *   AWS_REGION              the bucket's region (set by Lambda)
+ */
+export function profilingOptionsFromEnv(): ProfilingOptions {
+  const header = process.env['PROFILING_HEADER']?.trim().toLowerCase() || undefined;
+  const headerSecret = process.env['PROFILING_HEADER_SECRET'] || undefined;
+  if (header !== undefined && headerSecret === undefined) {
+    logger.warn('PROFILING_HEADER is ignored without PROFILING_HEADER_SECRET', { header });
+  }
+  const bucket = process.env['PROFILING_BUCKET'] || undefined;
+  return {
+    fields: new Set(
+      (process.env['PROFILING_FIELDS'] ?? '')
+        .split(',')
+        .map(field => field.trim())
+        .filter(field => field !== ''),
+    ),
+    sampleRate: Math.min(1, envNumber('PROFILING_SAMPLE_RATE', 0)),
+    ...(header !== undefined && { header }),
+    ...(headerSecret !== undefined && { headerSecret }),
+    heap: process.env['PROFILING_HEAP'] !== 'false',
+    samplingIntervalUs: envNumber('PROFILING_INTERVAL_US', 1000),
+    heapSamplingIntervalBytes: envNumber('PROFILING_HEAP_INTERVAL_BYTES', 32 * 1024),
+    sink:
+      bucket === undefined
+        ? new DirectoryProfileSink(process.env['PROFILING_DIR'] || path.join(os.tmpdir(), 'profiles'))
+        : new S3ProfileSink(
+            bucket,
+            process.env['AWS_REGION'] ?? 'us-west-2',
+            process.env['PROFILING_PREFIX'] ?? process.env['AWS_LAMBDA_FUNCTION_NAME'] ?? '',
+          ),
+  };
+}
+
+let settings: ProfilingOptions | undefined;
+// The inspector's profilers are process-wide: one capture at a time
+let capturing = false;
+
+function profilingSettings(): ProfilingOptions {
+  if (settings === undefined) {
+    settings = profilingOptionsFromEnv();
+  }
+  return settings;
+}
+
+/**
+ * Replace the profiling settings. Intended for tests and the local harness;
+ * without options they are read from the environment again.
+ */
+export function configureProfiling(options?: Partial<ProfilingOptions>): void {
+  settings = options === undefined ? undefined : { ...profilingOptionsFromEnv(), ...options };
+}
+
+function headerEnabled(options: ProfilingOptions): boolean {
+  return options.header !== undefined && options.headerSecret !== undefined;
+}
+
+function profilingConfigured(options: ProfilingOptions): boolean {
+  return options.fields.size > 0 || options.sampleRate > 0 || headerEnabled(options);
+}
+
+interface ProfiledEvent {
+  info?: { fieldName?: string };
+  request?: { headers?: Record<string, string | undefined> };
+}
+
+function eventsOf(event: unknown): ProfiledEvent[] {
+  return (Array.isArray(event) ? event : [event]) as ProfiledEvent[];
+}
+
+function fieldNameOf(event: unknown): string {
+  return eventsOf(event)[0]?.info?.fieldName ?? 'unknown';
+}
+
+const digest = (value: string): Buffer => crypto.createHash('sha256').update(value, 'utf8').digest();
+
+/** The request carries the profiling header with the secret, compared in constant time */
+function carriesSecret(item: ProfiledEvent, { header, headerSecret }: ProfilingOptions): boolean {
+  const headers = item.request?.headers ?? {};
+  const name = Object.keys(headers).find(candidate => candidate.toLowerCase() === header);
+  const value = name === undefined ? undefined : headers[name];
+  if (value === undefined || headerSecret === undefined) {
+    return false;
+  }
+  return crypto.timingSafeEqual(digest(value), digest(headerSecret));
+}
+
+function shouldProfile(event: unknown, options: ProfilingOptions): boolean {
+  const items = eventsOf(event);
+  if (items.some(item => options.fields.has(item.info?.fieldName ?? ''))) {
+    return true;
+  }
+  if (headerEnabled(options) && items.some(item => carriesSecret(item, options))) {
+    return true;
+  }
+  return options.sampleRate > 0 && Math.random() < options.sampleRate;
+}
+
+function post<T>(session: Session, method: string, params?: object): Promise<T> {
+  return new Promise((resolve, reject) => {
+    session.post(method, params, (error, result) => (error ? reject(error) : resolve(result as T)));
+  });
+}
+
+/**
+ * A CPU profile and, optionally, a sampling heap profile recorded through the
+ * inspector protocol in this process
+ */
+class Capture {
+  private readonly session = new Session();
+
+  constructor(private readonly options: ProfilingOptions) {}
+
+  async start(): Promise<void> {
+    this.session.connect();
+    await post(this.session, 'Profiler.enable');
+    await post(this.session, 'Profiler.setSamplingInterval', { interval: this.options.samplingIntervalUs });
+    if (this.options.heap) {
+      await post(this.session, 'HeapProfiler.enable');
+      // Count short-lived garbage too: per-item transforms allocate far more than they retain
+      await post(this.session, 'HeapProfiler.startSampling', {
+        samplingInterval: this.options.heapSamplingIntervalBytes,
+        includeObjectsCollectedByMajorGC: true,
+        includeObjectsCollectedByMinorGC: true,
+      });
+    }
+    await post(this.session, 'Profiler.start');
+  }
+
+  /** Stop both profilers and write them as `<base>.cpuprofile` and `<base>.heapprofile` */
+  async stop(base: string): Promise<string[]> {
+    try {
+      const { profile } = await post<{ profile: object }>(this.session, 'Profiler.stop');
+      const written = [`${base}.cpuprofile`];
+      await this.options.sink.write(`${base}.cpuprofile`, JSON.stringify(profile));
+      if (this.options.heap) {
+        const heap = await post<{ profile: object }>(this.session, 'HeapProfiler.stopSampling');
+        await this.options.sink.write(`${base}.heapprofile`, JSON.stringify(heap.profile));
+        written.push(`${base}.heapprofile`);
+      }
+      return written;
+    } finally {
+      this.close();
+    }
+  }
+
+  close(): void {
+    this.session.disconnect();
+  }
+}
+
+/**
+ * Wrap a Lambda handler so selected invocations are profiled with the Node
+ * inspector: every invocation of a PROFILING_FIELDS field, a PROFILING_SAMPLE_RATE
+ * share of the others, and any request whose PROFILING_HEADER header carries
+ * PROFILING_HEADER_SECRET.
+ * The invocation's CPU profile and sampling heap profile are written to the
+ * sink as `<field>-<time>-<request id>.cpuprofile` / `.heapprofile`, which
+ * Chrome DevTools and `python -m perf.profile_summary` read.
+ *
+ * A profiled invocation runs slower (sampling, and writing the profiles before
+ * it returns), and only one is captured at a time per container. Profiling
+ * failures are logged and never fail the invocation. Unconfigured, the
+ * wrapper only checks a flag.
+ */
+export function withProfiling<E, R>(
+  handle: (event: E, timer?: InvocationTimer) => Promise<R>,
+): (event: E, timer?: InvocationTimer) => Promise<R> {
+  return async (event, timer) => {
+    const options = profilingSettings();
+    if (!profilingConfigured(options) || capturing || !shouldProfile(event, options)) {
+      return handle(event, timer);
+    }
+
+    capturing = true;
+    const fieldName = fieldNameOf(event);
+    const capture = new Capture(options);
+    let started = false;
+    try {
+      await capture.start();
+      started = true;
+    } catch (error) {
+      capture.close();
+      logger.warn('Profiling failed to start', { fieldName, error });
+    }
+
+    try {
+      return await handle(event, timer);
+    } finally {
+      if (started) {
+        const requestId = (timer as ProfiledContext | undefined)?.awsRequestId ?? 'local';
+        const base = `${fieldName}-${new Date().toISOString().replace(/[:.]/g, '-')}-${requestId}`;
+        try {
+          const files = await capture.stop(base);
+          logger.info('Profile captured', { fieldName, files });
+        } catch (error) {
+          logger.warn('Profile capture failed', { fieldName, error });
+        }
+      }
+      capturing = false;
+    }
+  };
+}
@@ -42,6 +42,11 @@ export interface CreatePartArguments {
   input: GraphQLPartInput;
 }
 
+export interface CreatePartsArguments {
+  accountId: string;
+  inputs: GraphQLPartInput[];
+}
+
 export interface UpdatePartArguments {
   accountId: string;
   partId: string;
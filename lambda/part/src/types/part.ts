@@ -1,3 +1,5 @@
+import { BulkItemError } from '../shared';
+
 export type Condition = 'new' | 'used' | 'refurbished' | 'damaged' | 'unknown';
 export type Status = 'available' | 'installed' | 'reserved' | 'maintenance' | 'disposed';
 
@@ -104,6 +106,12 @@ export interface GraphQLPartListResponse {
   count: number;
 }
 
+export interface GraphQLPartBulkResult {
+  index: number;
+  part: Part | null;
+  error: BulkItemError | null;
+}
+
 export interface GraphQLPartInput {
   partNumber: string;
   description: string;
@@ -46,6 +46,15 @@ export interface PartApiResponse {
   data: Part;
 }
 
+/**
+ * The bulk create endpoint's answer (POST /parts/{accountId}/bulk): one entry
+ * per submitted part, in order
+ */
+export interface PartBulkApiResponse {
+  success: boolean;
+  data: Array<PartApiResponse | ErrorResponse>;
+}
+
 export interface DeleteApiResponse {
   success: boolean;
   data?: null;
@@ -0,0 +1,122 @@
+#!/usr/bin/env node
+/*
+ * Compare per-request TLS connections against the shared keep-alive pool.
+ *
+ * Starts a local HTTPS stub with a throwaway self-signed certificate, then
+ * issues the same sequence of requests through a non-keep-alive axios client
+ * (what each resolver created per invocation before) and through
+ * getPooledClient. Prints p50/p95/p99 latency and the number of TLS
+ * connections the stub accepted.
+ *
+ *   npm run bench:http-pool
+ *   BENCH_REQUESTS=2000 BENCH_CONCURRENCY=16 npm run bench:http-pool
+ *
+ * Requires `openssl` on the PATH to generate the certificate.
+ */
+const { execFileSync } = require('child_process');
+const fs = require('fs');
+const https = require('https');
+const os = require('os');
+const path = require('path');
+
+const axios = require('axios');
+
+const { getHttpAgents, getPooledClient, resetHttpPool } = require('../dist');
+
+const REQUESTS = Number(process.env.BENCH_REQUESTS || 500);
+const CONCURRENCY = Number(process.env.BENCH_CONCURRENCY || 8);
+const PAYLOAD = JSON.stringify({ items: Array.from({ length: 20 }, (_, i) => ({ id: `item-${i}` })) });
+
+function selfSignedCert() {
+  const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'http-pool-bench-'));
+  const key = path.join(dir, 'key.pem');
+  const cert = path.join(dir, 'cert.pem');
+  execFileSync('openssl', [
+    'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+    '-subj', '/CN=localhost', '-keyout', key, '-out', cert,
+  ], { stdio: 'ignore' });
+  const pair = { key: fs.readFileSync(key), cert: fs.readFileSync(cert) };
+  fs.rmSync(dir, { recursive: true, force: true });
+  return pair;
+}
+
+function startStub() {
+  const stats = { connections: 0 };
+  const server = https.createServer(selfSignedCert(), (req, res) => {
+    res.setHeader('Content-Type', 'application/json');
+    res.end(PAYLOAD);
+  });
+  server.on('secureConnection', () => {
+    stats.connections++;
+  });
+  return new Promise(resolve => {
+    server.listen(0, '127.0.0.1', () => {
+      resolve({ server, stats, baseURL: `https://127.0.0.1:${server.address().port}` });
+    });
+  });
+}
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+}
+
+async function run(name, client, stats) {
+  stats.connections = 0;
+  const latencies = [];
+  let next = 0;
+  const started = process.hrtime.bigint();
+
+  const worker = async () => {
+    while (next < REQUESTS) {
+      next++;
+      const t0 = process.hrtime.bigint();
+      await client.get('/items', { headers: { Authorization: 'Bearer bench-token' } });
+      latencies.push(Number(process.hrtime.bigint() - t0) / 1e6);
+    }
+  };
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+
+  const totalMs = Number(process.hrtime.bigint() - started) / 1e6;
+  latencies.sort((a, b) => a - b);
+  return {
+    client: name,
+    requests: REQUESTS,
+    'req/s': Math.round((REQUESTS / totalMs) * 1000),
+    'p50 ms': percentile(latencies, 50).toFixed(2),
+    'p95 ms': percentile(latencies, 95).toFixed(2),
+    'p99 ms': percentile(latencies, 99).toFixed(2),
+    'tls connections': stats.connections,
+  };
+}
+
+async function main() {
+  // The stub's certificate is self-signed
+  process.env.NODE_TLS_REJECT_UNAUTHORIZED = '0';
+  const { server, stats, baseURL } = await startStub();
+
+  const perInvocation = axios.create({
+    baseURL,
+    httpsAgent: new https.Agent({ keepAlive: false, rejectUnauthorized: false }),
+  });
+
+  resetHttpPool({ maxSockets: CONCURRENCY });
+  getHttpAgents().httpsAgent.options.rejectUnauthorized = false;
+  const pooled = getPooledClient(baseURL);
+
+  // Warm up both paths so JIT and DNS effects do not skew the first run
+  await perInvocation.get('/items');
+  await pooled.get('/items');
+
+  const results = [];
+  results.push(await run('per-invocation (no keep-alive)', perInvocation, stats));
+  results.push(await run('shared keep-alive pool', pooled, stats));
+  console.table(results);
+
+  resetHttpPool();
+  server.close();
+}
+
+main().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,112 @@
+#!/usr/bin/env node
+/*
+ * Per-item cost of a list transform with the old eager, pretty-printed
+ * logging against the shared structured logger.
+ *
+ * The transform mirrors workOrderToGraphQL: convert a backend row to its
+ * GraphQL shape. The "eager" variant logs the input row, the timestamp
+ * conversions and the result with JSON.stringify(..., null, 2) per row, as the
+ * resolvers did before. The logger variants log one lazy debug line per row,
+ * with the level at INFO (the deployed default), at DEBUG sampled at 5%, and
+ * at DEBUG unsampled. Output goes to a discarding stream so only the
+ * formatting and serialization cost is measured.
+ *
+ *   npm run bench:logging
+ *   BENCH_ITEMS=500 BENCH_ROUNDS=200 npm run bench:logging
+ */
+const { Console } = require('console');
+const { Writable } = require('stream');
+
+const { Logger } = require('../dist');
+
+const ITEMS = Number(process.env.BENCH_ITEMS || 100);
+const ROUNDS = Number(process.env.BENCH_ROUNDS || 500);
+
+const sink = new Writable({ write: (_chunk, _encoding, done) => done() });
+const eagerConsole = new Console({ stdout: sink, stderr: sink });
+
+const rows = Array.from({ length: ITEMS }, (_, i) => ({
+  workOrderId: `wo-${i}`,
+  accountId: 'acct-1',
+  contactId: `contact-${i % 7}`,
+  unitId: `unit-${i % 13}`,
+  status: 'OPEN',
+  description: 'Replace front brake pads and inspect rotors',
+  notes: ['Customer waiting', 'Parts on order'],
+  createdAt: 1700000000000 + i,
+  updatedAt: 1700000500000 + i,
+}));
+
+function toGraphQL(row) {
+  return {
+    workOrderId: row.workOrderId,
+    accountId: row.accountId,
+    contactId: row.contactId,
+    unitId: row.unitId,
+    status: row.status,
+    description: row.description,
+    notes: row.notes,
+    createdAt: Math.floor(row.createdAt / 1000),
+    updatedAt: Math.floor(row.updatedAt / 1000),
+  };
+}
+
+function eagerTransform(row) {
+  eagerConsole.log('Converting workOrder to GraphQL:', JSON.stringify(row, null, 2));
+  const result = toGraphQL(row);
+  eagerConsole.log('Timestamp conversions:', {
+    createdAt: { original: row.createdAt, converted: result.createdAt },
+    updatedAt: { original: row.updatedAt, converted: result.updatedAt },
+  });
+  eagerConsole.log('Final GraphQL result:', JSON.stringify(result, null, 2));
+  return result;
+}
+
+function loggerTransform(logger) {
+  return row => {
+    const result = toGraphQL(row);
+    logger.debug('Converted work order', () => ({ row, result }));
+    return result;
+  };
+}
+
+function bench(name, transform, logger) {
+  const run = () => (logger ? logger.runWithField('listWorkOrders', () => rows.map(transform)) : rows.map(transform));
+
+  for (let i = 0; i < Math.min(50, ROUNDS); i++) {
+    run();
+  }
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < ROUNDS; i++) {
+    run();
+  }
+  const elapsed = Number(process.hrtime.bigint() - start);
+  return { name, nsPerItem: elapsed / (ROUNDS * ITEMS) };
+}
+
+function createLogger(level, rate) {
+  return new Logger({
+    level,
+    sampleRates: new Map([['listWorkOrders', rate]]),
+    defaultSampleRate: 1,
+    write: (_level, line) => sink.write(line),
+  });
+}
+
+const info = createLogger('info', 1);
+const sampled = createLogger('debug', 0.05);
+const debug = createLogger('debug', 1);
+
+const results = [
+  bench('baseline (no logging)', toGraphQL),
+  bench('eager pretty-print', eagerTransform),
+  bench('logger, LOG_LEVEL=INFO', loggerTransform(info), info),
+  bench('logger, DEBUG sampled 5%', loggerTransform(sampled), sampled),
+  bench('logger, DEBUG', loggerTransform(debug), debug),
+];
+
+console.log(`${ITEMS} items x ${ROUNDS} rounds`);
+const eager = results[1].nsPerItem;
+for (const { name, nsPerItem } of results) {
+  console.log(`${name.padEnd(28)} ${nsPerItem.toFixed(0).padStart(8)} ns/item  ${(eager / nsPerItem).toFixed(1).padStart(6)}x vs eager`);
+}
@@ -0,0 +1,58 @@
+#!/bin/bash
+# Build the resolver lambdas as single-file, minified deployment bundles.
+#
+#   ./bundle.sh              bundle every lambda
+#   ./bundle.sh unit event   bundle only these
+#
+# esbuild follows the imports from each src/index.ts, so only code a handler
+# can reach is shipped: unused exports and dependencies (aws-sdk v2 outside
+# the event lambda, @aws-sdk/client-appsync) drop out and no node_modules
+# tree is packaged or resolved at init. Modules pulled in with import()
+# (rarely used paths such as the event status index, and event exports with
+# the aws-sdk v2 S3 and Lambda clients they use) stay in the bundle but are
+# only evaluated on first use.
+#
+# Each lambda gets bundle/index.js, bundle/meta.json (esbuild metafile) and
+# lambda.zip with index.js at its root, so the Terraform handler
+# ("index.handler") and zip path are unchanged. The zip is built from fixed
+# timestamps so an unchanged bundle keeps the same source_code_hash.
+set -e
+
+cd "$(dirname "$0")"
+
+ESBUILD_VERSION="0.23.1"
+LAMBDAS="account contact event laborline location part task unit workorder"
+
+# Make sure the shared sources copied into src/shared are current
+./sync.sh --check
+
+for fn in ${@:-$LAMBDAS}; do
+  echo "Bundling $fn Lambda function..."
+  (
+    cd "../$fn"
+    rm -rf bundle lambda.zip
+
+    npm ci --no-audit --no-fund
+    npx tsc --noEmit
+
+    npx --yes "esbuild@$ESBUILD_VERSION" src/index.ts \
+      --bundle \
+      --platform=node \
+      --target=node18 \
+      --format=cjs \
+      --minify \
+      --keep-names \
+      --legal-comments=none \
+      --external:@aws-sdk/* \
+      --metafile=bundle/meta.json \
+      --outfile=bundle/index.js \
+      --log-level=warning
+
+    touch -t 198001010000 bundle/index.js
+    (cd bundle && zip -q -X ../lambda.zip index.js)
+
+    echo "$fn: bundle/index.js $(wc -c < bundle/index.js) bytes, lambda.zip $(wc -c < lambda.zip) bytes"
+  )
+done
+
+echo "Bundle sizes and cold starts per function: python -m perf.coldstart --artifact bundle"
@@ -0,0 +1,143 @@
+import { ThrottledError, configureAdmission, withAdmission } from '../admission/admission';
+import { CostedEvent, FieldCosts, capLimit, eventCost, invocationCost } from '../admission/query-cost';
+import { MemoryRateLimitStore, RateLimitStore, RateLimiter, takeTokens } from '../admission/rate-limiter';
+
+const costs: FieldCosts = {
+  listUnits: { limitArg: 'limit', defaultLimit: 20, maxLimit: 100 },
+  getUnitWithWorkOrders: {
+    limitArg: 'limit',
+    defaultLimit: 20,
+    maxLimit: 50,
+    perItem: 1,
+    perItemWhen: ['items/workOrders'],
+  },
+  unit: { base: 2, batched: true },
+};
+
+function event(
+  fieldName: string,
+  args: Record<string, unknown> = {},
+  selection?: string[],
+): CostedEvent & { identity: { sub: string } } {
+  return {
+    arguments: args,
+    info: { fieldName, ...(selection !== undefined && { selectionSetList: selection }) },
+    identity: { sub: 'acct-1' },
+  };
+}
+
+describe('takeTokens', () => {
+  const spec = { capacity: 10, refillPerSecond: 5 };
+
+  it('starts full and refills with time up to the capacity', () => {
+    const first = takeTokens(undefined, 8, spec, 0);
+    expect(first.result).toEqual({ allowed: true, remaining: 2, retryInMs: 0 });
+
+    const refused = takeTokens(first.state, 4, spec, 200);
+    expect(refused.result).toEqual({ allowed: false, remaining: 3, retryInMs: 200 });
+
+    expect(takeTokens(refused.state, 0, spec, 60_000).result.remaining).toBe(10);
+  });
+
+  it('never allows a cost above the capacity', () => {
+    expect(takeTokens(undefined, 11, spec, 0).result).toEqual({
+      allowed: false,
+      remaining: 10,
+      retryInMs: Number.POSITIVE_INFINITY,
+    });
+  });
+});
+
+describe('query cost', () => {
+  it('charges fan-out per row only when it was selected', () => {
+    expect(eventCost(costs, event('getUnitWithWorkOrders', { limit: 10 }, ['items', 'items/id']))).toBe(1);
+    expect(eventCost(costs, event('getUnitWithWorkOrders', { limit: 10 }, ['items', 'items/workOrders']))).toBe(11);
+    expect(eventCost(costs, event('getUnitWithWorkOrders', {}))).toBe(21);
+    expect(eventCost(costs, event('getUnitWithWorkOrders', { limit: 500 }))).toBe(51);
+    expect(eventCost(costs, event('getUnit'))).toBe(1);
+  });
+
+  it('multiplies the cost by the requests a resolution has in flight at once', () => {
+    const scanned: FieldCosts = { listEvents: { base: 2, fanOut: args => (args['from'] !== undefined ? 4 : 1) } };
+
+    expect(eventCost(scanned, event('listEvents', { from: '2026-01-01T00:00:00Z' }))).toBe(8);
+    expect(eventCost(scanned, event('listEvents'))).toBe(2);
+  });
+
+  it('charges a batched field once per batch', () => {
+    expect(invocationCost(costs, [event('unit'), event('unit'), event('getUnit'), event('getUnit')])).toBe(4);
+  });
+
+  it('lowers a limit above the maximum and leaves the rest alone', () => {
+    const wide = event('listUnits', { limit: 500, cursor: 'c' });
+    expect(capLimit(costs, wide).arguments).toEqual({ limit: 100, cursor: 'c' });
+    expect(wide.arguments).toEqual({ limit: 500, cursor: 'c' });
+
+    const narrow = event('listUnits', { limit: 50 });
+    expect(capLimit(costs, narrow)).toBe(narrow);
+  });
+});
+
+describe('RateLimiter', () => {
+  it('shares buckets between limiters using one store', async () => {
+    const store = new MemoryRateLimitStore(10_000, () => 0);
+    const spec = { capacity: 10, refillPerSecond: 1 };
+    const first = new RateLimiter(spec, store);
+    const second = new RateLimiter(spec, store);
+
+    await expect(first.take('acct-1', 6)).resolves.toMatchObject({ allowed: true, remaining: 4 });
+    await expect(second.take('acct-1', 6)).resolves.toMatchObject({ allowed: false, remaining: 4 });
+    await expect(second.take('acct-2', 6)).resolves.toMatchObject({ allowed: true });
+  });
+
+  it('admits requests when the store fails', async () => {
+    const store: RateLimitStore = { take: () => Promise.reject(new Error('down')) };
+    await expect(new RateLimiter({ capacity: 10, refillPerSecond: 1 }, store).take('acct-1', 5)).resolves.toEqual({
+      allowed: true,
+      remaining: 10,
+      retryInMs: 0,
+    });
+  });
+});
+
+describe('withAdmission', () => {
+  afterEach(() => configureAdmission());
+
+  it('caps limits even with rate limiting off', async () => {
+    configureAdmission({ enabled: false });
+    const handle = jest.fn(async (received: CostedEvent) => received.arguments);
+
+    await expect(withAdmission(costs, handle)(event('listUnits', { limit: 1000 }))).resolves.toEqual({ limit: 100 });
+  });
+
+  it('throws a ThrottledError with the budget left once the account is spent', async () => {
+    configureAdmission({ enabled: true, capacity: 30, refillPerSecond: 1, store: new MemoryRateLimitStore() });
+    const handle = jest.fn(async () => 'ok');
+    const admitted = withAdmission(costs, handle);
+
+    await expect(admitted(event('getUnitWithWorkOrders', { limit: 20 }))).resolves.toBe('ok');
+    const throttled = admitted(event('getUnitWithWorkOrders', { limit: 20 }));
+
+    await expect(throttled).rejects.toBeInstanceOf(ThrottledError);
+    await expect(throttled).rejects.toMatchObject({ name: 'ThrottledError', cost: 21, accountId: 'acct-1' });
+    expect(handle).toHaveBeenCalledTimes(1);
+  });
+
+  it('fails every item of a throttled batch', async () => {
+    configureAdmission({ enabled: true, capacity: 1, refillPerSecond: 1, store: new MemoryRateLimitStore() });
+    const handle = jest.fn(async () => [] as unknown[]);
+
+    const results = await withAdmission(costs, handle)([event('listUnits'), event('getUnit')]);
+
+    expect(handle).not.toHaveBeenCalled();
+    expect(results).toHaveLength(2);
+    expect(results[0]).toMatchObject({ data: null, errorType: 'ThrottledError' });
+  });
+
+  it('passes events without a field name through', async () => {
+    configureAdmission({ enabled: true, capacity: 1, refillPerSecond: 1, store: new MemoryRateLimitStore() });
+    const job = { eventExport: {} };
+
+    await expect(withAdmission(costs, async (received: unknown) => received)(job)).resolves.toBe(job);
+  });
+});
@@ -0,0 +1,81 @@
+import { resolveBatch, resolveBySourceId } from '../appsync/batch';
+
+interface TestEvent {
+  info: { fieldName: string };
+  source?: { unitId?: string };
+  id: number;
+}
+
+const event = (fieldName: string, id: number, unitId?: string): TestEvent => ({
+  info: { fieldName },
+  id,
+  ...(unitId !== undefined && { source: { unitId } }),
+});
+
+describe('resolveBatch', () => {
+  it('answers each batched field with one call and keeps payload order', async () => {
+    const batched = jest.fn(async (events: TestEvent[]) => events.map(e => `unit-for-${e.id}`));
+    const single = jest.fn(async (e: TestEvent) => `single-${e.id}`);
+    const events = [event('unit', 0), event('getUnit', 1), event('unit', 2)];
+
+    const results = await resolveBatch(events, { unit: batched }, single);
+
+    expect(batched).toHaveBeenCalledTimes(1);
+    expect(batched.mock.calls[0]?.[0].map(e => e.id)).toEqual([0, 2]);
+    expect(results).toEqual([{ data: 'unit-for-0' }, { data: 'single-1' }, { data: 'unit-for-2' }]);
+  });
+
+  it('reports errors on the affected items only', async () => {
+    const results = await resolveBatch(
+      [event('unit', 0), event('unit', 1), event('getUnit', 2)],
+      { unit: async () => ['ok', new TypeError('bad unit')] },
+      async () => {
+        throw new Error('lookup failed');
+      },
+    );
+
+    expect(results).toEqual([
+      { data: 'ok' },
+      { data: null, errorMessage: 'bad unit', errorType: 'TypeError' },
+      { data: null, errorMessage: 'lookup failed', errorType: 'Error' },
+    ]);
+  });
+
+  it('fails every item of a field when its batch resolver throws', async () => {
+    const results = await resolveBatch(
+      [event('unit', 0), event('unit', 1)],
+      {
+        unit: async () => {
+          throw new Error('backend down');
+        },
+      },
+      async () => null,
+    );
+
+    expect(results.map(result => result.errorMessage)).toEqual(['backend down', 'backend down']);
+  });
+});
+
+describe('resolveBySourceId', () => {
+  it('loads each distinct ID once and maps results back to every parent', async () => {
+    const loadMany = jest.fn(async (ids: string[]) => new Map(ids.filter(id => id !== 'u-missing').map(id => [id, { id }])));
+
+    const results = await resolveBySourceId(
+      [event('unit', 0, 'u-1'), event('unit', 1), event('unit', 2, 'u-1'), event('unit', 3, 'u-missing')],
+      e => e.source?.unitId,
+      loadMany,
+    );
+
+    expect(loadMany).toHaveBeenCalledWith(['u-1', 'u-missing']);
+    expect(results).toEqual([{ id: 'u-1' }, null, { id: 'u-1' }, null]);
+  });
+
+  it('skips the load entirely when no parent references an entity', async () => {
+    const loadMany = jest.fn();
+
+    const results = await resolveBySourceId([event('unit', 0)], e => e.source?.unitId, loadMany);
+
+    expect(loadMany).not.toHaveBeenCalled();
+    expect(results).toEqual([null]);
+  });
+});
@@ -0,0 +1,131 @@
+import { AxiosError, AxiosHeaders } from 'axios';
+
+import { MissingEndpointLatch, assertBulkSize, isMissingEndpoint, runBulk } from '../appsync/bulk';
+import { runWithDeadline } from '../utils/deadline';
+
+const httpError = (status: number, data: unknown = {}, headers: Record<string, string> = {}): AxiosError =>
+  new AxiosError('failed', 'ERR_BAD_REQUEST', undefined, undefined, {
+    status,
+    statusText: '',
+    data,
+    headers,
+    config: { headers: new AxiosHeaders() },
+  });
+
+describe('runBulk', () => {
+  it('answers per item, in input order, with at most `concurrency` in flight', async () => {
+    let inFlight = 0;
+    let peak = 0;
+    const execute = async (n: number): Promise<number> => {
+      inFlight += 1;
+      peak = Math.max(peak, inFlight);
+      await new Promise(resolve => setTimeout(resolve, 10 - n));
+      inFlight -= 1;
+      if (n === 3) {
+        throw new Error('bad item');
+      }
+      return n * 10;
+    };
+
+    const results = await runBulk([1, 2, 3, 4, 5, 6], execute, { concurrency: 2 });
+
+    expect(peak).toBe(2);
+    expect(results.map(result => result.data)).toEqual([10, 20, null, 40, 50, 60]);
+    expect(results[2]).toEqual({ index: 2, data: null, error: { message: 'bad item', errorType: 'Error' } });
+  });
+
+  it('sends chunks to the bulk endpoint and maps per-item errors', async () => {
+    const bulk = jest.fn(async (chunk: number[]) => chunk.map(n => (n === 2 ? new Error('rejected') : n * 10)));
+    const execute = jest.fn();
+
+    const results = await runBulk([1, 2, 3], execute, { bulk, chunkSize: 2 });
+
+    expect(bulk.mock.calls).toEqual([[[1, 2]], [[3]]]);
+    expect(execute).not.toHaveBeenCalled();
+    expect(results.map(result => result.data)).toEqual([10, null, 30]);
+    expect(results[1]?.error?.message).toBe('rejected');
+  });
+
+  it('falls back to one call per item when there is no bulk endpoint', async () => {
+    const results = await runBulk([1, 2], async n => n * 10, { bulk: async () => undefined });
+
+    expect(results.map(result => result.data)).toEqual([10, 20]);
+  });
+
+  it('fails every item of a chunk that failed as a whole, without retrying them', async () => {
+    const execute = jest.fn();
+
+    const results = await runBulk([1, 2], execute, {
+      bulk: async () => {
+        throw new Error('bulk call failed');
+      },
+    });
+
+    expect(execute).not.toHaveBeenCalled();
+    expect(results.map(result => result.error?.message)).toEqual(['bulk call failed', 'bulk call failed']);
+  });
+
+  it('does not start items once the invocation is nearly out of time', async () => {
+    const execute = jest.fn(async (n: number) => n);
+
+    const results = await runWithDeadline({ getRemainingTimeInMillis: () => 500 }, () =>
+      runBulk([1, 2], execute, { minRemainingMs: 1000 })
+    );
+
+    expect(execute).not.toHaveBeenCalled();
+    expect(results.map(result => result.error?.errorType)).toEqual(['DeadlineExceeded', 'DeadlineExceeded']);
+  });
+});
+
+describe('assertBulkSize', () => {
+  it('rejects lists over the limit', () => {
+    expect(() => assertBulkSize([1, 2, 3], 2)).toThrow('Too many items: 3 (at most 2 per request)');
+    expect(() => assertBulkSize([1, 2], 2)).not.toThrow();
+  });
+});
+
+describe('isMissingEndpoint', () => {
+  it('recognizes 405 and 501 answers', () => {
+    expect([405, 501, 400, 500].map(status => isMissingEndpoint(httpError(status)))).toEqual([
+      true,
+      true,
+      false,
+      false,
+    ]);
+    expect(isMissingEndpoint(new Error('network'))).toBe(false);
+  });
+
+  it("recognizes a router's 404, but not the service's own", () => {
+    const html = { 'content-type': 'text/html; charset=utf-8' };
+    const json = { 'content-type': 'application/json' };
+    const problem = { 'content-type': 'application/problem+json' };
+
+    expect(isMissingEndpoint(httpError(404, 'Cannot POST /accounts/acct-1/work-orders/bulk', html))).toBe(true);
+    expect(isMissingEndpoint(httpError(404, '', {}))).toBe(true);
+    expect(isMissingEndpoint(httpError(404, { message: 'Not Found' }, json))).toBe(true);
+    expect(isMissingEndpoint(httpError(404, { title: 'Not Found', detail: 'Account acct-1 not found' }, problem))).toBe(
+      false
+    );
+    expect(isMissingEndpoint(httpError(404, { message: 'Account not found' }, json))).toBe(false);
+    expect(isMissingEndpoint(httpError(404, {}, json))).toBe(false);
+  });
+});
+
+describe('MissingEndpointLatch', () => {
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('holds for its TTL, then lets the endpoint be tried again', () => {
+    let now = 1_000;
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+    const latch = new MissingEndpointLatch(60_000);
+
+    expect(latch.missing).toBe(false);
+    latch.markMissing();
+    now += 59_999;
+    expect(latch.missing).toBe(true);
+    now += 1;
+    expect(latch.missing).toBe(false);
+  });
+});
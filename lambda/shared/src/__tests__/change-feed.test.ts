@@ -0,0 +1,196 @@
+import http from 'http';
+import { AddressInfo } from 'net';
+
+import {
+  AppSyncChangeSink,
+  Change,
+  ChangeSink,
+  changeOf,
+  configureChangeFeed,
+  publishChanges,
+  publishRequest,
+  signAppSyncRequest,
+} from '../appsync/change-feed';
+import { resetHttpPool } from '../http/pool';
+import { logger } from '../logging/logger';
+
+const workOrder = {
+  workOrderId: 'wo-1',
+  accountId: 'acct-1',
+  unitId: 'unit-1',
+  status: 'inProgress',
+  description: 'Brakes',
+  notes: null,
+};
+
+describe('changeOf', () => {
+  it('carries the whole record, compacted, for a create', () => {
+    const change = changeOf('WorkOrder', 'CREATED', 'acct-1', 'wo-1', workOrder);
+
+    expect(change).toMatchObject({
+      entity: 'WorkOrder',
+      operation: 'CREATED',
+      accountId: 'acct-1',
+      id: 'wo-1',
+      unitId: 'unit-1',
+      status: 'inProgress',
+      statusChanged: false,
+    });
+    expect(change.changes).toEqual({
+      workOrderId: 'wo-1',
+      accountId: 'acct-1',
+      unitId: 'unit-1',
+      status: 'inProgress',
+      description: 'Brakes',
+    });
+  });
+
+  it('carries only the changed fields for an update and flags a status change', () => {
+    const statusUpdate = changeOf('WorkOrder', 'UPDATED', 'acct-1', 'wo-1', workOrder, ['status']);
+    const descriptionUpdate = changeOf('WorkOrder', 'UPDATED', 'acct-1', 'wo-1', workOrder, ['description']);
+
+    expect(statusUpdate).toMatchObject({ status: 'inProgress', statusChanged: true, changes: { status: 'inProgress' } });
+    expect(descriptionUpdate).toMatchObject({ statusChanged: false, changes: { description: 'Brakes' } });
+    // The filter keys are always there, changed or not
+    expect(descriptionUpdate).toMatchObject({ unitId: 'unit-1', status: 'inProgress' });
+  });
+
+  it('carries only the id for a delete', () => {
+    const change = changeOf('Task', 'DELETED', 'acct-1', 'task-1');
+
+    expect(change).toEqual({
+      entity: 'Task',
+      operation: 'DELETED',
+      accountId: 'acct-1',
+      id: 'task-1',
+      statusChanged: false,
+      changedAt: expect.any(Number),
+    });
+  });
+});
+
+describe('publishRequest', () => {
+  it('publishes every change in one request, with changes as an AWSJSON string', () => {
+    const created = changeOf('Event', 'CREATED', 'acct-1', 'evt-1', { eventId: 'evt-1', status: 'open' });
+    const deleted = changeOf('Event', 'DELETED', 'acct-1', 'evt-2');
+
+    const { query, variables } = publishRequest([created, deleted]);
+
+    expect(query).toContain('mutation PublishChanges($c0: ChangeInput!, $c1: ChangeInput!)');
+    expect(query).toContain('c1: publishChange(change: $c1) { entity operation accountId id');
+    expect(variables['c0']).toMatchObject({ id: 'evt-1', changes: '{"eventId":"evt-1","status":"open"}' });
+    expect(variables['c1']).not.toHaveProperty('changes');
+  });
+});
+
+describe('signAppSyncRequest', () => {
+  const url = new URL('https://example.appsync-api.us-west-2.amazonaws.com/graphql');
+  const credentials = { accessKeyId: 'AKIDEXAMPLE', secretAccessKey: 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY' };
+  const now = new Date('2024-01-02T03:04:05.678Z');
+
+  it('signs the body for the appsync service', () => {
+    const headers = signAppSyncRequest(url, '{"query":"mutation"}', 'us-west-2', credentials, now);
+
+    expect(headers['x-amz-date']).toBe('20240102T030405Z');
+    expect(headers['authorization']).toBe(
+      'AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/20240102/us-west-2/appsync/aws4_request, ' +
+        'SignedHeaders=content-type;host;x-amz-date, ' +
+        'Signature=0dc8a215324b4295e0d19a80dca7590dbb75528f3d0207e522791478de4bbb22'
+    );
+  });
+
+  it('signs the session token of temporary credentials', () => {
+    const headers = signAppSyncRequest(url, '{}', 'us-west-2', { ...credentials, sessionToken: 'token' }, now);
+
+    expect(headers['x-amz-security-token']).toBe('token');
+    expect(headers['authorization']).toContain('SignedHeaders=content-type;host;x-amz-date;x-amz-security-token,');
+  });
+});
+
+describe('publishChanges', () => {
+  const change: Change = changeOf('WorkOrder', 'DELETED', 'acct-1', 'wo-1');
+
+  afterEach(() => {
+    configureChangeFeed();
+    jest.restoreAllMocks();
+  });
+
+  it('does nothing without a sink', async () => {
+    delete process.env['CHANGE_FEED_URL'];
+    configureChangeFeed();
+
+    await expect(publishChanges([change])).resolves.toBeUndefined();
+  });
+
+  it('hands the changes to the sink', async () => {
+    const sink: ChangeSink = { publish: jest.fn(async () => undefined) };
+    configureChangeFeed({ sink });
+
+    await publishChanges([change]);
+
+    expect(sink.publish).toHaveBeenCalledWith([change]);
+  });
+
+  it('logs and swallows a failed publish', async () => {
+    const warn = jest.spyOn(logger, 'warn').mockImplementation(() => undefined);
+    configureChangeFeed({ sink: { publish: async () => Promise.reject(new Error('AppSync unavailable')) } });
+
+    await expect(publishChanges([change])).resolves.toBeUndefined();
+    expect(warn).toHaveBeenCalledWith('Change feed publish failed', expect.objectContaining({ entity: 'WorkOrder' }));
+  });
+
+  it('stops waiting for a slow publish after the timeout', async () => {
+    const warn = jest.spyOn(logger, 'warn').mockImplementation(() => undefined);
+    configureChangeFeed({ sink: { publish: () => new Promise(resolve => setTimeout(resolve, 500)) }, timeoutMs: 20 });
+
+    const started = Date.now();
+    await publishChanges([change]);
+
+    expect(Date.now() - started).toBeLessThan(400);
+    expect(warn).toHaveBeenCalled();
+  });
+});
+
+describe('AppSyncChangeSink', () => {
+  let server: http.Server;
+  let endpoint: string;
+  const bodies: unknown[] = [];
+  let reply: unknown = { data: {} };
+
+  beforeAll(async () => {
+    server = http.createServer((req, res) => {
+      let body = '';
+      req.on('data', chunk => (body += chunk));
+      req.on('end', () => {
+        bodies.push({ authorization: req.headers.authorization, body: JSON.parse(body) });
+        res.setHeader('Content-Type', 'application/json');
+        res.end(JSON.stringify(reply));
+      });
+    });
+    await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+    endpoint = `http://127.0.0.1:${(server.address() as AddressInfo).port}/graphql`;
+  });
+
+  afterAll(async () => {
+    resetHttpPool();
+    await new Promise<void>(resolve => server.close(() => resolve()));
+  });
+
+  it('posts the publish mutation, unsigned to a plain http endpoint', async () => {
+    const change = changeOf('Task', 'UPDATED', 'acct-1', 'task-1', { status: 'completed' }, ['status']);
+
+    await new AppSyncChangeSink(endpoint, 'us-west-2').publish([change]);
+
+    expect(bodies).toEqual([
+      { authorization: undefined, body: expect.objectContaining({ variables: { c0: expect.objectContaining({ id: 'task-1' }) } }) },
+    ]);
+  });
+
+  it('fails on a GraphQL error', async () => {
+    reply = { errors: [{ message: 'Not Authorized to access publishChange on type Mutation' }] };
+
+    await expect(
+      new AppSyncChangeSink(endpoint, 'us-west-2').publish([changeOf('Task', 'DELETED', 'acct-1', 'task-1')])
+    ).rejects.toThrow('publishChange failed: Not Authorized');
+  });
+});
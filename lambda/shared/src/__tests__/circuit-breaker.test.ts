@@ -0,0 +1,76 @@
+import { CallOutcome, CircuitBreaker, CircuitOpenError } from '../http/circuit-breaker';
+
+describe('CircuitBreaker', () => {
+  let now: number;
+  let breaker: CircuitBreaker;
+  const failure = (): CallOutcome => 'failure';
+  const fail = (): Promise<never> => breaker.run(() => Promise.reject(new Error('down')), failure);
+  const succeed = (): Promise<string> => breaker.run(async () => 'ok', failure);
+
+  beforeEach(() => {
+    now = 0;
+    breaker = new CircuitBreaker('backend', { failureThreshold: 3, cooldownMs: 1000 }, () => now);
+  });
+
+  it('opens after consecutive failures and then fails fast', async () => {
+    await expect(fail()).rejects.toThrow('down');
+    await expect(fail()).rejects.toThrow('down');
+    expect(breaker.state).toBe('closed');
+    await expect(fail()).rejects.toThrow('down');
+
+    expect(breaker.state).toBe('open');
+    const call = jest.fn(async () => 'ok');
+    await expect(breaker.run(call, failure)).rejects.toBeInstanceOf(CircuitOpenError);
+    expect(call).not.toHaveBeenCalled();
+    expect(breaker.stats()).toEqual({ state: 'open', consecutiveFailures: 3, rejected: 1 });
+  });
+
+  it('resets the count on success', async () => {
+    await expect(fail()).rejects.toThrow();
+    await expect(fail()).rejects.toThrow();
+    await succeed();
+    await expect(fail()).rejects.toThrow();
+
+    expect(breaker.state).toBe('closed');
+  });
+
+  it('lets one probe through after the cooldown and closes when it succeeds', async () => {
+    for (let i = 0; i < 3; i += 1) {
+      await expect(fail()).rejects.toThrow();
+    }
+    now = 1000;
+    expect(breaker.state).toBe('half-open');
+
+    let answer: (value: string) => void = () => undefined;
+    const probe = breaker.run(() => new Promise<string>(resolve => (answer = resolve)), failure);
+    await expect(succeed()).rejects.toBeInstanceOf(CircuitOpenError);
+    answer('ok');
+
+    await expect(probe).resolves.toBe('ok');
+    expect(breaker.state).toBe('closed');
+    await expect(succeed()).resolves.toBe('ok');
+  });
+
+  it('reopens for another cooldown when the probe fails', async () => {
+    for (let i = 0; i < 3; i += 1) {
+      await expect(fail()).rejects.toThrow();
+    }
+    now = 1500;
+    await expect(fail()).rejects.toThrow('down');
+
+    expect(breaker.state).toBe('open');
+    now = 2400;
+    await expect(succeed()).rejects.toBeInstanceOf(CircuitOpenError);
+    now = 2500;
+    await expect(succeed()).resolves.toBe('ok');
+  });
+
+  it('does not count answers that say nothing about the backend', async () => {
+    for (let i = 0; i < 5; i += 1) {
+      await expect(breaker.run(() => Promise.reject(new Error('404')), () => 'healthy')).rejects.toThrow();
+      await expect(breaker.run(() => Promise.reject(new Error('cancelled')), () => 'unknown')).rejects.toThrow();
+    }
+
+    expect(breaker.state).toBe('closed');
+  });
+});
@@ -0,0 +1,50 @@
+import { remainingTimeMs, runWithDeadline, withDeadline } from '../utils/deadline';
+
+const timer = (ms: number): { getRemainingTimeInMillis: () => number } => ({ getRemainingTimeInMillis: () => ms });
+
+describe('deadlines', () => {
+  const reserve = process.env['DEADLINE_RESERVE_MS'];
+
+  beforeAll(() => {
+    process.env['DEADLINE_RESERVE_MS'] = '100';
+  });
+
+  afterAll(() => {
+    if (reserve === undefined) {
+      delete process.env['DEADLINE_RESERVE_MS'];
+    } else {
+      process.env['DEADLINE_RESERVE_MS'] = reserve;
+    }
+  });
+
+  it('has no deadline outside an invocation', () => {
+    expect(remainingTimeMs()).toBeUndefined();
+    expect(runWithDeadline(undefined, remainingTimeMs)).toBeUndefined();
+  });
+
+  it('keeps the reserve back from the remaining time', () => {
+    const remaining = runWithDeadline(timer(1000), remainingTimeMs);
+
+    expect(remaining).toBeLessThanOrEqual(900);
+    expect(remaining).toBeGreaterThan(800);
+  });
+
+  it('carries the deadline across awaits and only lets nested scopes shorten it', async () => {
+    const remaining = await runWithDeadline(timer(1000), async () => {
+      await new Promise(resolve => setTimeout(resolve, 5));
+      return runWithDeadline(timer(5000), remainingTimeMs);
+    });
+
+    expect(remaining).toBeLessThanOrEqual(900);
+  });
+
+  it('wraps a handler with the deadline of the context it is invoked with', async () => {
+    const handler = withDeadline(async (event: string) => ({ event, remaining: remainingTimeMs() }));
+
+    const result = await handler('e', timer(2000));
+
+    expect(result.event).toBe('e');
+    expect(result.remaining).toBeLessThanOrEqual(1900);
+    await expect(handler('e')).resolves.toEqual({ event: 'e', remaining: undefined });
+  });
+});
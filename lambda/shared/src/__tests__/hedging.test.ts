@@ -0,0 +1,85 @@
+import { HedgeOptions, LatencyTracker, hedged } from '../http/hedging';
+
+const delay = (ms: number): Promise<void> => new Promise(resolve => setTimeout(resolve, ms));
+
+const options = (overrides: Partial<HedgeOptions> = {}): HedgeOptions => ({
+  maxAttempts: 2,
+  hedgeAfterMs: undefined,
+  backoffMs: 1,
+  retryable: () => true,
+  ...overrides,
+});
+
+describe('LatencyTracker', () => {
+  it('reports percentiles over the most recent window once it has enough samples', () => {
+    const tracker = new LatencyTracker(10, 5);
+    [1, 2, 3, 4].forEach(ms => tracker.record(ms));
+    expect(tracker.percentile(0.95)).toBeUndefined();
+
+    for (let ms = 1; ms <= 20; ms += 1) {
+      tracker.record(ms);
+    }
+    expect(tracker.percentile(0)).toBe(11);
+    expect(tracker.percentile(0.95)).toBe(20);
+  });
+});
+
+describe('hedged', () => {
+  it('starts a second attempt when the first is slow and takes whichever answers first', async () => {
+    const signals: AbortSignal[] = [];
+    const attempt = jest.fn(async (signal: AbortSignal) => {
+      const first = signals.push(signal) === 1;
+      await delay(first ? 200 : 5);
+      return first ? 'slow' : 'fast';
+    });
+    const onAttempt = jest.fn();
+
+    await expect(hedged(attempt, options({ hedgeAfterMs: 20, onAttempt }))).resolves.toBe('fast');
+
+    expect(attempt).toHaveBeenCalledTimes(2);
+    expect(onAttempt).toHaveBeenCalledWith('hedge');
+    expect(signals[0]?.aborted).toBe(true);
+  });
+
+  it('retries a retryable failure', async () => {
+    const attempt = jest.fn().mockRejectedValueOnce(new Error('503')).mockResolvedValue('ok');
+
+    await expect(hedged(attempt, options())).resolves.toBe('ok');
+    expect(attempt).toHaveBeenCalledTimes(2);
+  });
+
+  it('gives up after maxAttempts with the last error', async () => {
+    const attempt = jest.fn().mockRejectedValueOnce(new Error('first')).mockRejectedValue(new Error('second'));
+
+    await expect(hedged(attempt, options({ maxAttempts: 2 }))).rejects.toThrow('second');
+    expect(attempt).toHaveBeenCalledTimes(2);
+  });
+
+  it('fails at once on an error that is not retryable', async () => {
+    const attempt = jest.fn().mockRejectedValue(new Error('404'));
+
+    await expect(hedged(attempt, options({ retryable: () => false }))).rejects.toThrow('404');
+    expect(attempt).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not retry when the backoff would outlast the remaining time', async () => {
+    const attempt = jest.fn().mockRejectedValue(new Error('503'));
+
+    await expect(hedged(attempt, options({ backoffMs: 100, remainingMs: () => 0 }))).rejects.toThrow('503');
+    expect(attempt).toHaveBeenCalledTimes(1);
+  });
+
+  it('aborts the attempts in flight when the caller aborts', async () => {
+    const caller = new AbortController();
+    let upstream: AbortSignal | undefined;
+    const result = hedged(signal => {
+      upstream = signal;
+      return delay(1000).then(() => 'late');
+    }, options(), caller.signal);
+
+    caller.abort();
+
+    await expect(result).rejects.toBeDefined();
+    expect(upstream?.aborted).toBe(true);
+  });
+});
@@ -0,0 +1,81 @@
+import { LogLevel, Logger, LoggerOptions } from '../logging/logger';
+
+describe('Logger', () => {
+  let lines: Array<{ level: LogLevel; entry: Record<string, unknown> }>;
+
+  const createLogger = (options: Partial<LoggerOptions> = {}): Logger =>
+    new Logger({
+      level: 'info',
+      sampleRates: new Map(),
+      defaultSampleRate: 1,
+      write: (level, line) => lines.push({ level, entry: JSON.parse(line) }),
+      ...options,
+    });
+
+  beforeEach(() => {
+    lines = [];
+  });
+
+  it('writes one JSON line per call with the scope bindings', async () => {
+    const logger = createLogger();
+
+    await logger.runWithField('listUnits', async () => {
+      logger.info('Fetched units', { count: 3 });
+    }, { requestId: 'r-1' });
+
+    expect(lines).toEqual([
+      { level: 'info', entry: { level: 'info', message: 'Fetched units', fieldName: 'listUnits', requestId: 'r-1', count: 3 } },
+    ]);
+  });
+
+  it('skips lines below the level without evaluating lazy fields', () => {
+    const logger = createLogger();
+    const fields = jest.fn(() => ({ event: {} }));
+
+    logger.debug('Received event', fields);
+
+    expect(fields).not.toHaveBeenCalled();
+    expect(lines).toEqual([]);
+  });
+
+  it('samples debug/info per invocation but always keeps warnings and errors', () => {
+    const logger = createLogger({ sampleRates: new Map([['listWorkOrders', 0]]) });
+
+    logger.runWithField('listWorkOrders', () => {
+      logger.info('Listing work orders');
+      logger.warn('Slow backend');
+      logger.error('Backend failed');
+    });
+    logger.runWithField('getWorkOrder', () => logger.info('Fetching work order'));
+
+    expect(lines.map(line => line.entry['message'])).toEqual(['Slow backend', 'Backend failed', 'Fetching work order']);
+  });
+
+  it('redacts credentials and flattens errors', () => {
+    const logger = createLogger();
+    const error = Object.assign(new Error('boom'), { code: 'ECONNRESET' });
+
+    logger.error('Request failed', {
+      event: { request: { headers: { Authorization: 'Bearer secret-jwt', host: 'api' } } },
+      refreshToken: 'abc',
+      error,
+    });
+
+    const entry = lines[0]?.entry;
+    expect(entry?.['event']).toEqual({ request: { headers: { Authorization: '[REDACTED]', host: 'api' } } });
+    expect(entry?.['refreshToken']).toBe('[REDACTED]');
+    expect(entry?.['error']).toMatchObject({ name: 'Error', message: 'boom', code: 'ECONNRESET' });
+  });
+
+  it('survives values JSON cannot serialize', () => {
+    const logger = createLogger();
+    const circular: Record<string, unknown> = {};
+    circular['self'] = circular;
+
+    logger.info('Circular', { circular });
+
+    expect(lines).toHaveLength(1);
+    expect(lines[0]?.entry).toMatchObject({ level: 'info', message: 'Circular' });
+    expect(lines[0]?.entry).toHaveProperty('logError');
+  });
+});
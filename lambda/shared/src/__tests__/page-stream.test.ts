@@ -0,0 +1,83 @@
+import { Page, PageFetcher, collect, streamItems, streamPages } from '../utils/page-stream';
+
+// Three pages of two items; cursors are the index of the next page
+const pages: Array<Page<number>> = [
+  { items: [1, 2], nextCursor: '1' },
+  { items: [3, 4], nextCursor: '2' },
+  { items: [5, 6], nextCursor: null },
+];
+
+const createFetcher = (): jest.Mock<ReturnType<PageFetcher<number>>, Parameters<PageFetcher<number>>> =>
+  jest.fn(async (cursor: string | undefined) => pages[Number(cursor ?? 0)]!);
+
+describe('streamPages', () => {
+  it('yields every page in order and stops at the last cursor', async () => {
+    const fetchPage = createFetcher();
+
+    const result = await collect(streamPages(fetchPage));
+
+    expect(result).toEqual([[1, 2], [3, 4], [5, 6]]);
+    expect(fetchPage.mock.calls.map(([cursor]) => cursor)).toEqual([undefined, '1', '2']);
+  });
+
+  it('requests the next page before the consumer finishes the current one', async () => {
+    const fetchPage = createFetcher();
+    const stream = streamPages(fetchPage, { prefetch: 1 });
+
+    await stream.next();
+    await new Promise(resolve => setImmediate(resolve));
+
+    expect(fetchPage).toHaveBeenCalledTimes(2);
+    await stream.return(undefined);
+  });
+
+  it('stops paging and aborts the signal when the consumer breaks out', async () => {
+    const fetchPage = createFetcher();
+    let signal: AbortSignal | undefined;
+    fetchPage.mockImplementation(async (cursor, pageSignal) => {
+      signal = pageSignal;
+      return pages[Number(cursor ?? 0)]!;
+    });
+
+    for await (const items of streamPages(fetchPage, { prefetch: 0 })) {
+      expect(items).toEqual([1, 2]);
+      break;
+    }
+
+    expect(fetchPage).toHaveBeenCalledTimes(1);
+    expect(signal?.aborted).toBe(true);
+  });
+
+  it('honours maxPages', async () => {
+    const fetchPage = createFetcher();
+
+    const result = await collect(streamPages(fetchPage, { maxPages: 2 }));
+
+    expect(result).toEqual([[1, 2], [3, 4]]);
+    expect(fetchPage).toHaveBeenCalledTimes(2);
+  });
+
+  it('rethrows a failed page when the consumer reaches it', async () => {
+    const fetchPage = createFetcher();
+    fetchPage.mockImplementationOnce(async () => pages[0]!).mockImplementationOnce(async () => Promise.reject(new Error('502')));
+    const seen: number[][] = [];
+
+    await expect((async () => {
+      for await (const items of streamPages(fetchPage)) {
+        seen.push(items);
+      }
+    })()).rejects.toThrow('502');
+    expect(seen).toEqual([[1, 2]]);
+  });
+});
+
+describe('collect', () => {
+  it('stops pulling items once the limit is reached', async () => {
+    const fetchPage = createFetcher();
+
+    const result = await collect(streamItems(fetchPage, { prefetch: 0 }), 3);
+
+    expect(result).toEqual([1, 2, 3]);
+    expect(fetchPage).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,216 @@
+import http from 'http';
+import { AddressInfo } from 'net';
+import zlib from 'zlib';
+
+import {
+  getHttpAgents,
+  getHttpResilienceStats,
+  getPooledClient,
+  getSingleFlightStats,
+  resetHttpPool,
+  withAuth,
+} from '../http/pool';
+import { runWithDeadline } from '../utils/deadline';
+
+describe('http pool', () => {
+  let server: http.Server;
+  let baseURL: string;
+  const seen: Array<{ authorization: string | undefined; port: number }> = [];
+  const stalled = new Set<string>();
+
+  beforeAll(async () => {
+    server = http.createServer((req, res) => {
+      seen.push({ authorization: req.headers.authorization, port: req.socket.remotePort ?? 0 });
+      res.setHeader('Content-Type', 'application/json');
+      const url = req.url ?? '';
+      if (url.startsWith('/gzip')) {
+        res.setHeader('Content-Encoding', 'gzip');
+        res.end(zlib.gzipSync(JSON.stringify({ ok: true, acceptEncoding: req.headers['accept-encoding'] })));
+        return;
+      }
+      if (url.startsWith('/fail')) {
+        res.statusCode = 503;
+        res.end(JSON.stringify({ error: 'unavailable' }));
+        return;
+      }
+      const body = JSON.stringify({ ok: true, url });
+      // Slow paths stay in flight long enough for identical requests to overlap;
+      // stalled ones outlast the deadlines below, /stall-once only the first time
+      const stall = url.startsWith('/stall') && !(url.startsWith('/stall-once') && stalled.has(url));
+      stalled.add(url);
+      setTimeout(() => res.end(body), stall ? 300 : url.startsWith('/slow') ? 50 : 0);
+    });
+    await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+    baseURL = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+  });
+
+  afterAll(async () => {
+    resetHttpPool();
+    await new Promise<void>(resolve => server.close(() => resolve()));
+  });
+
+  beforeEach(() => {
+    seen.length = 0;
+    stalled.clear();
+    resetHttpPool({ maxSockets: 4 });
+  });
+
+  it('returns the same client for the same base URL and runs init once', () => {
+    const init = jest.fn();
+
+    const first = getPooledClient(baseURL, init);
+    const second = getPooledClient(baseURL, init);
+
+    expect(second).toBe(first);
+    expect(init).toHaveBeenCalledTimes(1);
+  });
+
+  it('reuses sockets across sequential requests', async () => {
+    const client = getPooledClient(baseURL);
+
+    await client.get('/a');
+    await client.get('/b');
+    await client.get('/c');
+
+    expect(new Set(seen.map(request => request.port)).size).toBe(1);
+  });
+
+  it('asks backends for compressed bodies and decompresses them', async () => {
+    const response = await getPooledClient(baseURL).get('/gzip');
+
+    expect(response.data).toEqual({ ok: true, acceptEncoding: 'br, gzip' });
+  });
+
+  it('sends the per-request token without leaking it to later requests', async () => {
+    const client = getPooledClient(baseURL);
+
+    await client.get('/a', withAuth('token-a'));
+    await client.get('/b', withAuth('token-b'));
+    await client.get('/c');
+
+    expect(seen.map(request => request.authorization)).toEqual(['Bearer token-a', 'Bearer token-b', undefined]);
+  });
+
+  it('sends identical concurrent reads upstream once and shares the response', async () => {
+    const client = getPooledClient(baseURL);
+
+    const responses = await Promise.all([
+      client.get('/slow', withAuth('token-a', { params: { limit: 5 } })),
+      client.get('/slow', withAuth('token-a', { params: { limit: 5 } })),
+      client.get('/slow', withAuth('token-a', { params: { limit: 5 } })),
+    ]);
+
+    expect(seen).toHaveLength(1);
+    expect(responses.map(response => response.data)).toEqual(Array(3).fill({ ok: true, url: '/slow?limit=5' }));
+    expect(responses[1]?.data).toBe(responses[0]?.data);
+    expect(getSingleFlightStats()).toEqual({ calls: 3, shared: 2, dedupeRatio: 2 / 3 });
+  });
+
+  it('never shares a read across tokens, params or writes', async () => {
+    const client = getPooledClient(baseURL);
+
+    await Promise.all([
+      client.get('/slow', withAuth('token-a')),
+      client.get('/slow', withAuth('token-b')),
+      client.get('/slow', withAuth('token-a', { params: { limit: 5 } })),
+      client.post('/slow', {}, withAuth('token-a')),
+      client.post('/slow', {}, withAuth('token-a')),
+    ]);
+
+    expect(seen).toHaveLength(5);
+    expect(getSingleFlightStats().shared).toBe(0);
+  });
+
+  it('sends every read upstream when single-flight is off', async () => {
+    resetHttpPool({ singleFlight: false });
+    const client = getPooledClient(baseURL);
+
+    await Promise.all([client.get('/slow'), client.get('/slow')]);
+
+    expect(seen).toHaveLength(2);
+  });
+
+  it('cuts a call off at the invocation deadline', async () => {
+    const client = getPooledClient(baseURL);
+    const started = Date.now();
+
+    // 350ms left less the 250ms reserve
+    const call = runWithDeadline({ getRemainingTimeInMillis: () => 350 }, () => client.get('/stall'));
+
+    await expect(call).rejects.toMatchObject({ code: 'ECONNABORTED' });
+    expect(Date.now() - started).toBeLessThan(250);
+  });
+
+  it('does not start a call once the deadline has passed', async () => {
+    const client = getPooledClient(baseURL);
+
+    const call = runWithDeadline({ getRemainingTimeInMillis: () => 100 }, () => client.get('/a'));
+
+    await expect(call).rejects.toThrow('Invocation deadline exceeded');
+    expect(seen).toHaveLength(0);
+  });
+
+  it('retries a failed read once but sends a failed write only once', async () => {
+    resetHttpPool({ retryBackoffMs: 1 });
+    const client = getPooledClient(baseURL);
+
+    await expect(client.get('/fail')).rejects.toMatchObject({ response: { status: 503 } });
+    expect(seen).toHaveLength(2);
+    await expect(client.post('/fail', {})).rejects.toMatchObject({ response: { status: 503 } });
+    expect(seen).toHaveLength(3);
+    expect(getHttpResilienceStats().retries).toBe(1);
+  });
+
+  it('hedges a read that runs past the backend p95', async () => {
+    resetHttpPool({ hedgeMinDelayMs: 10 });
+    const client = getPooledClient(baseURL);
+    for (let i = 0; i < 20; i += 1) {
+      await client.get(`/warm-${i}`);
+    }
+    seen.length = 0;
+    const started = Date.now();
+
+    const response = await client.get('/stall-once');
+
+    expect(response.data).toEqual({ ok: true, url: '/stall-once' });
+    expect(Date.now() - started).toBeLessThan(250);
+    expect(seen).toHaveLength(2);
+    expect(getHttpResilienceStats().hedges).toBe(1);
+  });
+
+  it('opens the circuit for a failing backend and then fails fast', async () => {
+    resetHttpPool({ hedgeReads: false, breakerFailureThreshold: 2 });
+    const client = getPooledClient(baseURL);
+
+    await expect(client.get('/fail')).rejects.toMatchObject({ response: { status: 503 } });
+    await expect(client.get('/fail')).rejects.toMatchObject({ response: { status: 503 } });
+    await expect(client.get('/a')).rejects.toMatchObject({ code: 'ECIRCUITOPEN' });
+
+    expect(seen).toHaveLength(2);
+    const host = new URL(baseURL).host;
+    expect(getHttpResilienceStats().backends[host]?.circuit).toMatchObject({ state: 'open', rejected: 1 });
+  });
+
+  it('applies pool options to the shared agents', () => {
+    expect(getHttpAgents().httpAgent.maxSockets).toBe(4);
+    expect(getHttpAgents().httpsAgent.maxSockets).toBe(4);
+  });
+});
+
+describe('withAuth', () => {
+  it('keeps existing config and headers', () => {
+    const config = withAuth('abc', { params: { limit: 5 }, headers: { 'Content-Type': 'application/merge-patch+json' } });
+
+    expect(config).toEqual({
+      params: { limit: 5 },
+      headers: { 'Content-Type': 'application/merge-patch+json', Authorization: 'Bearer abc' },
+    });
+  });
+
+  it('leaves config untouched without a token', () => {
+    const config = { params: { limit: 5 } };
+
+    expect(withAuth(undefined, config)).toBe(config);
+    expect(withAuth('', config)).toBe(config);
+  });
+});
@@ -0,0 +1,183 @@
+import http from 'http';
+import { AddressInfo } from 'net';
+
+import {
+  ProfileSink,
+  ProfiledContext,
+  S3ProfileSink,
+  configureProfiling,
+  profilingOptionsFromEnv,
+  withProfiling,
+} from '../profiling/profiler';
+
+/** A sink that keeps profiles in memory */
+const memorySink = (): ProfileSink & { files: Map<string, string> } => {
+  const files = new Map<string, string>();
+  return {
+    files,
+    write: async (name, contents) => {
+      files.set(name, contents);
+    },
+  };
+};
+
+const busyWork = async (): Promise<number> => {
+  let total = 0;
+  for (let i = 0; i < 200_000; i += 1) {
+    total += JSON.stringify({ i }).length;
+  }
+  return total;
+};
+
+const event = (fieldName: string, headers: Record<string, string> = {}): object => ({
+  info: { fieldName },
+  request: { headers },
+});
+
+describe('profiling', () => {
+  afterAll(() => configureProfiling());
+
+  it('writes a CPU and a heap profile for a selected field', async () => {
+    const sink = memorySink();
+    configureProfiling({ fields: new Set(['listEventsByStatus']), sampleRate: 0, sink });
+    const context: ProfiledContext = { getRemainingTimeInMillis: () => 1000, awsRequestId: 'req-1' };
+
+    await expect(withProfiling(busyWork)(event('listEventsByStatus'), context)).resolves.toBeGreaterThan(0);
+
+    const names = [...sink.files.keys()];
+    expect(names).toHaveLength(2);
+    expect(names.find(name => name.endsWith('.cpuprofile'))).toMatch(/^listEventsByStatus-.*-req-1\.cpuprofile$/);
+    const cpu = JSON.parse(sink.files.get(names.find(name => name.endsWith('.cpuprofile')) ?? '') ?? '{}');
+    expect(cpu.nodes.length).toBeGreaterThan(0);
+    expect(cpu.samples.length).toBeGreaterThan(0);
+    const heap = JSON.parse(sink.files.get(names.find(name => name.endsWith('.heapprofile')) ?? '') ?? '{}');
+    expect(heap.head.callFrame).toBeDefined();
+  });
+
+  it('leaves other fields alone', async () => {
+    const sink = memorySink();
+    configureProfiling({ fields: new Set(['listEventsByStatus']), sampleRate: 0, sink });
+
+    await withProfiling(busyWork)(event('getEvent'));
+
+    expect(sink.files.size).toBe(0);
+  });
+
+  it('profiles a request whose profiling header carries the secret', async () => {
+    const sink = memorySink();
+    configureProfiling({
+      fields: new Set(),
+      sampleRate: 0,
+      header: 'x-bff-profile',
+      headerSecret: 's3cret',
+      heap: false,
+      sink,
+    });
+    const handler = withProfiling(busyWork);
+
+    await handler(event('listParts'));
+    await handler(event('listParts', { 'X-Bff-Profile': '1' }));
+    await handler(event('listParts', { 'X-Bff-Profile': 's3cret' }));
+
+    expect([...sink.files.keys()]).toEqual([expect.stringMatching(/^listParts-.*-local\.cpuprofile$/)]);
+  });
+
+  it('ignores the profiling header without a secret', async () => {
+    const sink = memorySink();
+    configureProfiling({ fields: new Set(), sampleRate: 0, header: 'x-bff-profile', heap: false, sink });
+
+    await withProfiling(busyWork)(event('listParts', { 'x-bff-profile': '' }));
+
+    expect(sink.files.size).toBe(0);
+  });
+
+  it('captures one invocation at a time', async () => {
+    const sink = memorySink();
+    configureProfiling({ fields: new Set(), sampleRate: 1, heap: false, sink });
+    const handler = withProfiling(async (value: number) => {
+      await new Promise(resolve => setTimeout(resolve, 5));
+      return value;
+    });
+
+    await expect(Promise.all([handler(1), handler(2)])).resolves.toEqual([1, 2]);
+    expect(sink.files.size).toBe(1);
+  });
+
+  it('never fails the invocation when the profile cannot be written', async () => {
+    configureProfiling({ fields: new Set(), sampleRate: 1, sink: { write: () => Promise.reject(new Error('bucket unavailable')) } });
+
+    await expect(withProfiling(busyWork)(event('listParts'))).resolves.toBeGreaterThan(0);
+  });
+});
+
+describe('S3ProfileSink', () => {
+  const requests: Array<{ method?: string; url?: string; headers: http.IncomingHttpHeaders; body: string }> = [];
+  let status = 200;
+  let endpoint = '';
+  const server = http.createServer((request, response) => {
+    const chunks: Buffer[] = [];
+    request.on('data', (chunk: Buffer) => chunks.push(chunk));
+    request.on('end', () => {
+      const body = Buffer.concat(chunks).toString();
+      requests.push({ method: request.method, url: request.url, headers: request.headers, body });
+      response.statusCode = status;
+      response.end(status === 200 ? '' : '<Error><Code>AccessDenied</Code></Error>');
+    });
+  });
+  const environment = { ...process.env };
+
+  beforeAll(async () => {
+    await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+    endpoint = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+  });
+
+  afterAll(async () => {
+    await new Promise(resolve => server.close(resolve));
+  });
+
+  beforeEach(() => {
+    requests.length = 0;
+    status = 200;
+    process.env['AWS_ACCESS_KEY_ID'] = 'AKIDEXAMPLE';
+    process.env['AWS_SECRET_ACCESS_KEY'] = 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY';
+    process.env['AWS_SESSION_TOKEN'] = 'token';
+  });
+
+  afterEach(() => {
+    process.env = { ...environment };
+  });
+
+  it('puts the profile under the prefix, signed for s3', async () => {
+    const sink = new S3ProfileSink('profiles', 'us-west-2', 'srnext-dev-event', endpoint);
+
+    await sink.write('listParts-2024-01-02-req-1.cpuprofile', '{"nodes":[]}');
+
+    expect(requests).toHaveLength(1);
+    const [request] = requests;
+    expect(request?.method).toBe('PUT');
+    expect(request?.url).toBe('/profiles/srnext-dev-event/listParts-2024-01-02-req-1.cpuprofile');
+    expect(request?.body).toBe('{"nodes":[]}');
+    expect(request?.headers['x-amz-security-token']).toBe('token');
+    expect(request?.headers['authorization']).toMatch(/Credential=AKIDEXAMPLE\/\d{8}\/us-west-2\/s3\/aws4_request/);
+    expect(request?.headers['authorization']).toContain(
+      'SignedHeaders=content-type;host;x-amz-content-sha256;x-amz-date;x-amz-security-token,'
+    );
+  });
+
+  it('fails the write when S3 refuses it', async () => {
+    status = 403;
+    const sink = new S3ProfileSink('profiles', 'us-west-2', '', endpoint);
+
+    await expect(sink.write('a.cpuprofile', '{}')).rejects.toThrow('failed with 403');
+  });
+
+  it('is the sink when PROFILING_BUCKET is set', () => {
+    process.env['PROFILING_BUCKET'] = 'srnext-dev-profiles';
+    process.env['AWS_LAMBDA_FUNCTION_NAME'] = 'srnext-dev-part';
+
+    const { sink } = profilingOptionsFromEnv();
+
+    expect(sink).toBeInstanceOf(S3ProfileSink);
+    expect(sink).toMatchObject({ bucket: 'srnext-dev-profiles', prefix: 'srnext-dev-part' });
+  });
+});
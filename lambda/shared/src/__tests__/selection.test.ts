@@ -0,0 +1,79 @@
+import { Selection, project, projectAll } from '../appsync/selection';
+
+const selectionOf = (selectionSetList?: string[]): Selection =>
+  Selection.fromEvent({ info: selectionSetList === undefined ? {} : { selectionSetList } });
+
+describe('Selection', () => {
+  const selection = selectionOf(['items', 'items/id', 'items/workOrders', 'items/workOrders/status', 'nextCursor']);
+
+  it('reports selected paths relative to the current level', () => {
+    expect(selection.has('nextCursor')).toBe(true);
+    expect(selection.has('count')).toBe(false);
+    expect(selection.at('items').has('workOrders')).toBe(true);
+    expect(selection.at('items').hasAny('make', 'model')).toBe(false);
+    expect(selection.at('items').fields()).toEqual(['id', 'workOrders']);
+    expect(selection.at('items').at('workOrders').fields()).toEqual(['status']);
+  });
+
+  it('treats a missing selection set as selecting everything', () => {
+    const all = selectionOf();
+
+    expect(all.isAll).toBe(true);
+    expect(all.at('items').has('anything')).toBe(true);
+    expect(all.fields()).toBeUndefined();
+  });
+
+  it('treats a field listed without children as fully selected below', () => {
+    const partial = selectionOf(['items']);
+
+    expect(partial.at('items').isAll).toBe(true);
+    expect(partial.at('items').has('workOrders')).toBe(true);
+  });
+});
+
+describe('project', () => {
+  const row = { id: 'u-1', accountId: 'a-1', make: 'Volvo', model: 'VNL', workOrders: [] };
+
+  it('keeps only selected fields plus key fields', () => {
+    const items = selectionOf(['items', 'items/make']).at('items');
+
+    expect(project(row, items, ['id'])).toEqual({ make: 'Volvo', id: 'u-1' });
+    expect(projectAll([row, row], items)).toEqual([{ make: 'Volvo' }, { make: 'Volvo' }]);
+  });
+
+  it('returns rows untouched when everything is selected', () => {
+    const rows = [row];
+
+    expect(projectAll(rows, selectionOf().at('items'))).toBe(rows);
+    expect(project(row, selectionOf())).toBe(row);
+  });
+});
+
+describe('projectAll with nested fields', () => {
+  const unitInfo = { model: 'VNL', modelYear: '2020', suggestedVin: 'VIN1' };
+  const rows = [
+    { eventId: 'e-1', status: 'created', notes: null, unitInfo },
+    { eventId: 'e-2', status: 'closed', notes: null, unitInfo },
+  ];
+
+  it('projects a shared sub-object once and leaves null fields out', () => {
+    const items = selectionOf(['items', 'items/status', 'items/notes', 'items/unitInfo', 'items/unitInfo/model']).at('items');
+
+    const projected = projectAll(rows, items, ['eventId'], { unitInfo: [] });
+
+    expect(projected).toEqual([
+      { status: 'created', unitInfo: { model: 'VNL' }, eventId: 'e-1' },
+      { status: 'closed', unitInfo: { model: 'VNL' }, eventId: 'e-2' },
+    ]);
+    expect(projected[0]?.unitInfo).toBe(projected[1]?.unitInfo);
+  });
+
+  it('projects each entry of a nested list, keeping its key fields', () => {
+    const units = [{ id: 'u-1', make: 'Volvo', workOrders: [{ workOrderId: 'wo-1', unitId: 'u-1', status: 'draft', notes: [] }] }];
+    const items = selectionOf(['items', 'items/workOrders', 'items/workOrders/status']).at('items');
+
+    expect(projectAll(units, items, ['id'], { workOrders: ['workOrderId'] })).toEqual([
+      { workOrders: [{ status: 'draft', workOrderId: 'wo-1' }], id: 'u-1' },
+    ]);
+  });
+});
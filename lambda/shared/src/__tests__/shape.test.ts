@@ -0,0 +1,87 @@
+import { compact, withCompactResponses } from '../appsync/shape';
+
+describe('compact', () => {
+  it('drops null and undefined fields at any depth', () => {
+    expect(compact({ id: 'u-1', plantCity: null, trim: undefined, address: { city: 'Spokane', state: null }, notes: [null, 'x'] })).toEqual({
+      id: 'u-1',
+      address: { city: 'Spokane' },
+      notes: [null, 'x'],
+    });
+  });
+
+  it('returns objects without null fields untouched', () => {
+    const row = { id: 'u-1', tags: ['a'], address: { city: 'Spokane' } };
+    const page = { items: [row], cursor: 'next' };
+
+    expect(compact(page)).toBe(page);
+  });
+
+  it('compacts a shared sub-object once and keeps it shared', () => {
+    const unitInfo = { model: 'VNL', series2: null };
+    const result = compact({ items: [{ id: 'e-1', unitInfo }, { id: 'e-2', unitInfo }] });
+
+    expect(result.items[0]?.unitInfo).toEqual({ model: 'VNL' });
+    expect(result.items[0]?.unitInfo).toBe(result.items[1]?.unitInfo);
+  });
+
+  it('leaves the values of AWSJSON fields as stored, nulls included', () => {
+    const extendedAttributes = { fleet: null, tags: [null], nested: { x: null } };
+    const result = compact(
+      { items: [{ id: 'e-1', notes: null, extendedAttributes, unitInfo: { model: null } }] },
+      new Set(['extendedAttributes'])
+    );
+
+    expect(result.items[0]).toEqual({ id: 'e-1', extendedAttributes, unitInfo: {} });
+    expect(result.items[0]?.extendedAttributes).toBe(extendedAttributes);
+  });
+
+  it('passes scalars and null through', () => {
+    expect(compact(null)).toBeNull();
+    expect(compact('x')).toBe('x');
+  });
+});
+
+describe('withCompactResponses', () => {
+  const env = process.env['RESPONSE_COMPACT'];
+
+  afterEach(() => {
+    if (env === undefined) {
+      delete process.env['RESPONSE_COMPACT'];
+    } else {
+      process.env['RESPONSE_COMPACT'] = env;
+    }
+  });
+
+  it('compacts a single result', async () => {
+    const handler = withCompactResponses(async () => ({ id: 'u-1', basePrice: null }));
+
+    await expect(handler({})).resolves.toEqual({ id: 'u-1' });
+  });
+
+  it('compacts only the data of each batch item', async () => {
+    const handler = withCompactResponses(async () => [{ data: { id: 'u-1', trim: null } }, { data: null, errorMessage: 'Not found', errorType: 'Error' }]);
+
+    await expect(handler([{}, {}])).resolves.toEqual([
+      { data: { id: 'u-1' } },
+      { data: null, errorMessage: 'Not found', errorType: 'Error' },
+    ]);
+  });
+
+  it('passes the AWSJSON fields it is given through untouched', async () => {
+    const handler = withCompactResponses(
+      async () => [{ data: { partId: 'p-1', vendor: null, specifications: { voltage: null }, extendedAttributes: { x: null } } }],
+      ['specifications', 'extendedAttributes']
+    );
+
+    await expect(handler([{}])).resolves.toEqual([
+      { data: { partId: 'p-1', specifications: { voltage: null }, extendedAttributes: { x: null } } },
+    ]);
+  });
+
+  it('can be turned off', async () => {
+    process.env['RESPONSE_COMPACT'] = 'false';
+    const result = { id: 'u-1', basePrice: null };
+
+    await expect(withCompactResponses(async () => result)({})).resolves.toBe(result);
+  });
+});
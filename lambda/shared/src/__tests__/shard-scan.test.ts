@@ -0,0 +1,138 @@
+import { collect } from '../utils/page-stream';
+import {
+  ScannedItem,
+  ShardPageFetcher,
+  decodeShardCursor,
+  encodeShardCursor,
+  scanShards,
+  timeShards,
+} from '../utils/shard-scan';
+
+// Three shards of five items each, served two per page; cursors are offsets
+const shards = [
+  [1, 2, 3, 4, 5],
+  [6, 7, 8, 9, 10],
+  [11, 12, 13, 14, 15],
+];
+
+const createFetcher = (): jest.Mock<ReturnType<ShardPageFetcher<number>>, Parameters<ShardPageFetcher<number>>> =>
+  jest.fn(async (shard: number, cursor: string | undefined) => {
+    const offset = Number(cursor ?? 0);
+    const items = shards[shard]!;
+    return { items: items.slice(offset, offset + 2), nextCursor: offset + 2 < items.length ? String(offset + 2) : null };
+  });
+
+const itemsOf = (scanned: Array<ScannedItem<number>>): number[] => scanned.map(({ item }) => item);
+
+describe('timeShards', () => {
+  it('splits a window into adjacent shards that cover it exactly', () => {
+    expect(timeShards(0, 99, 4)).toEqual([
+      { from: 0, to: 24 },
+      { from: 25, to: 49 },
+      { from: 50, to: 74 },
+      { from: 75, to: 99 },
+    ]);
+    expect(timeShards(0, 9, 3)).toEqual([
+      { from: 0, to: 2 },
+      { from: 3, to: 5 },
+      { from: 6, to: 9 },
+    ]);
+  });
+
+  it('makes fewer shards of a window narrower than the count, and none of an empty one', () => {
+    expect(timeShards(10, 11, 8)).toEqual([
+      { from: 10, to: 10 },
+      { from: 11, to: 11 },
+    ]);
+    expect(timeShards(10, 9, 8)).toEqual([]);
+  });
+});
+
+describe('scanShards', () => {
+  it('returns every shard in shard order', async () => {
+    const result = await collect(scanShards(3, createFetcher()));
+
+    expect(itemsOf(result)).toEqual([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]);
+    expect(result[result.length - 1]!.next).toEqual({ shard: 3, offset: 0 });
+  });
+
+  it('fetches the next shards while the consumer is on the first', async () => {
+    const fetchPage = createFetcher();
+    const scan = scanShards(3, fetchPage, { concurrency: 2, prefetch: 0 });
+
+    await scan.next();
+    await new Promise(resolve => setImmediate(resolve));
+
+    // Shard 0 and shard 1 are open, shard 2 waits for a free slot
+    expect(fetchPage.mock.calls.map(([shard, cursor]) => [shard, cursor])).toEqual([
+      [0, undefined],
+      [1, undefined],
+    ]);
+    await scan.return(undefined);
+  });
+
+  it('resumes from the position after the last item returned', async () => {
+    const fetchPage = createFetcher();
+    const first = await collect(scanShards(3, fetchPage), 7);
+    const start = first[first.length - 1]!.next;
+
+    const rest = await collect(scanShards(3, fetchPage, { start }));
+
+    // 7 ends the first page of shard 1, so the scan resumes at the start of its next page
+    expect(start).toEqual({ shard: 1, cursor: '2', offset: 0 });
+    expect(itemsOf(first)).toEqual([1, 2, 3, 4, 5, 6, 7]);
+    expect(itemsOf(rest)).toEqual([8, 9, 10, 11, 12, 13, 14, 15]);
+  });
+
+  it('aborts the open shards when the consumer stops early', async () => {
+    const fetchPage = createFetcher();
+    const signals: AbortSignal[] = [];
+    fetchPage.mockImplementation(async (shard, cursor, signal) => {
+      signals.push(signal);
+      return { items: shards[shard]!.slice(Number(cursor ?? 0), Number(cursor ?? 0) + 2), nextCursor: '2' };
+    });
+
+    await collect(scanShards(3, fetchPage), 1);
+
+    expect(signals.length).toBeGreaterThan(0);
+    expect(signals.every(signal => signal.aborted)).toBe(true);
+  });
+
+  it('rethrows a failed shard when the consumer reaches it', async () => {
+    const fetchPage = createFetcher();
+    fetchPage.mockImplementation(async (shard, cursor) => {
+      if (shard === 1) {
+        throw new Error('backend unavailable');
+      }
+      return { items: shards[shard]!.slice(Number(cursor ?? 0), Number(cursor ?? 0) + 2), nextCursor: null };
+    });
+    const returned: number[] = [];
+
+    await expect(
+      (async () => {
+        for await (const { item } of scanShards(3, fetchPage)) {
+          returned.push(item);
+        }
+      })()
+    ).rejects.toThrow('backend unavailable');
+    expect(returned).toEqual([1, 2]);
+  });
+});
+
+describe('shard cursors', () => {
+  it('round-trip the window, shard count and position', () => {
+    const cursor = { from: 1000, to: 2000, shards: 4, position: { shard: 2, cursor: 'abc', offset: 3 } };
+
+    expect(decodeShardCursor(encodeShardCursor(cursor))).toEqual(cursor);
+    expect(decodeShardCursor(encodeShardCursor({ ...cursor, position: { shard: 1, offset: 0 } }))).toEqual({
+      ...cursor,
+      position: { shard: 1, offset: 0 },
+    });
+  });
+
+  it('decode to undefined when they are not shard cursors', () => {
+    expect(decodeShardCursor('50')).toBeUndefined();
+    expect(decodeShardCursor('shards:not-json')).toBeUndefined();
+    expect(decodeShardCursor(`shards:${Buffer.from('{"f":1}').toString('base64url')}`)).toBeUndefined();
+  });
+});
@@ -0,0 +1,110 @@
+import { SingleFlight } from '../http/single-flight';
+
+function deferred<T>(): { promise: Promise<T>; resolve: (value: T) => void; reject: (error: unknown) => void } {
+  let resolve!: (value: T) => void;
+  let reject!: (error: unknown) => void;
+  const promise = new Promise<T>((res, rej) => {
+    resolve = res;
+    reject = rej;
+  });
+  return { promise, resolve, reject };
+}
+
+describe('SingleFlight', () => {
+  it('runs one load for concurrent calls with the same key', async () => {
+    const flights = new SingleFlight<{ n: number }>();
+    const pending = deferred<{ n: number }>();
+    const load = jest.fn(() => pending.promise);
+
+    const first = flights.run('a', load);
+    const second = flights.run('a', load);
+    pending.resolve({ n: 1 });
+
+    const [a, b] = await Promise.all([first, second]);
+    expect(a).toBe(b);
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(flights.stats()).toEqual({ calls: 2, shared: 1, dedupeRatio: 0.5 });
+  });
+
+  it('keeps different keys apart and forgets a key once it settles', async () => {
+    const flights = new SingleFlight<string>();
+    const load = jest.fn(async () => 'x');
+
+    await Promise.all([flights.run('a', load), flights.run('b', load)]);
+    await flights.run('a', load);
+
+    expect(load).toHaveBeenCalledTimes(3);
+    expect(flights.has('a')).toBe(false);
+    expect(flights.stats().shared).toBe(0);
+  });
+
+  it('shares a failure with every waiter, then retries', async () => {
+    const flights = new SingleFlight<string>();
+    const load = jest.fn().mockRejectedValueOnce(new Error('boom')).mockResolvedValue('ok');
+
+    const results = await Promise.allSettled([flights.run('a', load), flights.run('a', load)]);
+    expect(results.map(result => result.status)).toEqual(['rejected', 'rejected']);
+
+    await expect(flights.run('a', load)).resolves.toBe('ok');
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it('cancels only the aborting caller while others still wait', async () => {
+    const flights = new SingleFlight<string>();
+    const pending = deferred<string>();
+    let upstream: AbortSignal | undefined;
+    const load = (signal: AbortSignal): Promise<string> => {
+      upstream = signal;
+      return pending.promise;
+    };
+    const caller = new AbortController();
+
+    const aborted = flights.run('a', load, caller.signal);
+    const kept = flights.run('a', load, new AbortController().signal);
+    caller.abort();
+
+    await expect(aborted).rejects.toBeDefined();
+    expect(upstream?.aborted).toBe(false);
+    pending.resolve('ok');
+    await expect(kept).resolves.toBe('ok');
+  });
+
+  it('aborts the load once every waiter has given up', async () => {
+    const flights = new SingleFlight<string>();
+    let upstream: AbortSignal | undefined;
+    const load = (signal: AbortSignal): Promise<string> => {
+      upstream = signal;
+      return new Promise<string>((_, reject) => signal.addEventListener('abort', () => reject(new Error('aborted'))));
+    };
+    const first = new AbortController();
+    const second = new AbortController();
+
+    const results = Promise.allSettled([flights.run('a', load, first.signal), flights.run('a', load, second.signal)]);
+    first.abort();
+    second.abort();
+
+    expect((await results).map(result => result.status)).toEqual(['rejected', 'rejected']);
+    expect(upstream?.aborted).toBe(true);
+    expect(flights.has('a')).toBe(false);
+  });
+
+  it('does not abort a load a caller without a signal is waiting on', async () => {
+    const flights = new SingleFlight<string>();
+    const pending = deferred<string>();
+    let upstream: AbortSignal | undefined;
+    const load = (signal: AbortSignal): Promise<string> => {
+      upstream = signal;
+      return pending.promise;
+    };
+    const caller = new AbortController();
+
+    const pinned = flights.run('a', load);
+    const aborted = flights.run('a', load, caller.signal);
+    caller.abort();
+
+    await expect(aborted).rejects.toBeDefined();
+    pending.resolve('ok');
+    await expect(pinned).resolves.toBe('ok');
+    expect(upstream?.aborted).toBe(false);
+  });
+});
@@ -0,0 +1,226 @@
+import { ByteBudgetLru } from '../cache/lru';
+import { CacheTier, MemoryCacheTier, TenantCache, TenantCacheOptions } from '../cache/tenant-cache';
+
+const createCache = (options: Partial<TenantCacheOptions> = {}): TenantCache =>
+  new TenantCache({
+    enabled: true,
+    maxBytes: 1024 * 1024,
+    defaultTtlMs: 60_000,
+    ttls: new Map(),
+    ...options,
+  });
+
+describe('ByteBudgetLru', () => {
+  it('evicts least recently used entries to stay under the byte budget', () => {
+    const lru = new ByteBudgetLru(700);
+    const value = 'x'.repeat(100);
+
+    lru.set('a', 'g', value, 1000);
+    lru.set('b', 'g', value, 1000);
+    lru.get('a');
+    lru.set('c', 'g', value, 1000);
+
+    expect(lru.get('a')).toBe(value);
+    expect(lru.get('b')).toBeUndefined();
+    expect(lru.get('c')).toBe(value);
+    expect(lru.evictions).toBe(1);
+    expect(lru.bytes).toBeLessThanOrEqual(700);
+  });
+
+  it('expires entries and drops whole groups', () => {
+    const lru = new ByteBudgetLru(10_000);
+
+    lru.set('a', 'acct-1|unit', '1', 1000, 0);
+    lru.set('b', 'acct-1|unit', '2', 1000, 0);
+    lru.set('c', 'acct-2|unit', '3', 1000, 0);
+
+    expect(lru.get('a', 1000)).toBeUndefined();
+    expect(lru.deleteGroup('acct-1|unit')).toBe(1);
+    expect(lru.get('c', 0)).toBe('3');
+    expect(lru.size).toBe(1);
+  });
+});
+
+describe('TenantCache', () => {
+  it('loads once and serves repeats from memory', async () => {
+    const cache = createCache();
+    const load = jest.fn(async () => ({ id: 'u-1', make: 'Volvo' }));
+
+    await cache.getOrLoad('acct-1', 'unit', 'u-1', load);
+    const second = await cache.getOrLoad('acct-1', 'unit', 'u-1', load);
+
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(second).toEqual({ id: 'u-1', make: 'Volvo' });
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 1, entries: 1 });
+  });
+
+  it('keeps tenants apart and keys list calls by their arguments', async () => {
+    const cache = createCache();
+    const load = jest.fn(async () => ['row']);
+
+    await cache.getOrLoad('acct-1', 'unit', { list: { limit: 20, cursor: 'c1' } }, load);
+    await cache.getOrLoad('acct-1', 'unit', { list: { cursor: 'c1', limit: 20 } }, load);
+    await cache.getOrLoad('acct-2', 'unit', { list: { limit: 20, cursor: 'c1' } }, load);
+    await cache.getOrLoad('acct-1', 'unit', { list: { limit: 50, cursor: 'c1' } }, load);
+
+    expect(load).toHaveBeenCalledTimes(3);
+  });
+
+  it('invalidates every entry of an entity for the account only', async () => {
+    const cache = createCache();
+    const load = jest.fn(async () => 'value');
+
+    await cache.getOrLoad('acct-1', 'unit', 'u-1', load);
+    await cache.getOrLoad('acct-1', 'unit', { list: {} }, load);
+    await cache.getOrLoad('acct-1', 'task', 't-1', load);
+    await cache.getOrLoad('acct-2', 'unit', 'u-1', load);
+    await cache.invalidate('acct-1', 'unit');
+
+    expect(cache.stats().entries).toBe(2);
+  });
+
+  it('applies per-entity TTLs and does not cache failures or empty results', async () => {
+    jest.useFakeTimers();
+    try {
+      const cache = createCache({ ttls: new Map([['workOrder', 1000]]) });
+      const load = jest.fn(async () => 'value');
+
+      await cache.getOrLoad('acct-1', 'workOrder', 'wo-1', load);
+      jest.advanceTimersByTime(1001);
+      await cache.getOrLoad('acct-1', 'workOrder', 'wo-1', load);
+      expect(load).toHaveBeenCalledTimes(2);
+
+      await expect(cache.getOrLoad('acct-1', 'unit', 'u-1', async () => Promise.reject(new Error('404')))).rejects.toThrow('404');
+      await cache.getOrLoad('acct-1', 'unit', 'u-2', async () => null);
+      expect(cache.stats().entries).toBe(1);
+    } finally {
+      jest.useRealTimers();
+    }
+  });
+
+  it('fills from and invalidates the second tier shared between containers', async () => {
+    const shared = new MemoryCacheTier();
+    const first = createCache({ secondTier: shared });
+    const second = createCache({ secondTier: shared });
+    const load = jest.fn(async () => ({ id: 'c-1' }));
+
+    await first.getOrLoad('acct-1', 'contact', 'c-1', load);
+    await second.getOrLoad('acct-1', 'contact', 'c-1', load);
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(second.stats().secondTierHits).toBe(1);
+
+    await first.invalidate('acct-1', 'contact');
+    await createCache({ secondTier: shared }).getOrLoad('acct-1', 'contact', 'c-1', load);
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it('treats a failing second tier as a miss', async () => {
+    const broken: CacheTier = {
+      get: async () => Promise.reject(new Error('timeout')),
+      set: async () => Promise.reject(new Error('timeout')),
+      deleteGroup: async () => Promise.reject(new Error('timeout')),
+    };
+    const cache = createCache({ secondTier: broken });
+
+    await expect(cache.getOrLoad('acct-1', 'unit', 'u-1', async () => 'value')).resolves.toBe('value');
+    await expect(cache.invalidate('acct-1', 'unit')).resolves.toBeUndefined();
+  });
+
+  it('does not cache a load that was in flight when its entity was invalidated', async () => {
+    const shared = new MemoryCacheTier();
+    const cache = createCache({ secondTier: shared });
+    let answer: (value: string) => void = () => undefined;
+    const slowLoad = (): Promise<string> => new Promise<string>(resolve => (answer = resolve));
+    const loading = cache.getOrLoad('acct-1', 'unit', 'u-1', slowLoad);
+    // Past the second tier lookup, into the loader
+    await new Promise(resolve => setImmediate(resolve));
+
+    await cache.invalidate('acct-1', 'unit');
+    answer('before the update');
+
+    await expect(loading).resolves.toBe('before the update');
+    const load = jest.fn(async () => 'after the update');
+    await expect(cache.getOrLoad('acct-1', 'unit', 'u-1', load)).resolves.toBe('after the update');
+    expect(load).toHaveBeenCalledTimes(1);
+    await expect(shared.get('acct-1|unit|u-1')).resolves.toBe('"after the update"');
+  });
+
+  it('goes straight to the loader when disabled', async () => {
+    const cache = createCache({ enabled: false });
+    const load = jest.fn(async () => 'value');
+
+    await cache.getOrLoad('acct-1', 'unit', 'u-1', load);
+    await cache.getOrLoad('acct-1', 'unit', 'u-1', load);
+
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe('TenantCache prefetch', () => {
+  const prefetch = { ttlMs: 10_000, maxInFlight: 2, maxMemoryFraction: 100 };
+  const settle = (): Promise<void> => new Promise(resolve => setImmediate(resolve));
+  const nextPage = { list: { pageSize: 20, cursor: 'c2' } };
+
+  it('serves the prefetched page without calling the loader again', async () => {
+    const cache = createCache({ prefetch });
+    const load = jest.fn(async () => ({ items: ['row'] }));
+
+    cache.prefetch('acct-1', 'workOrder', nextPage, load);
+    await settle();
+    const page = await cache.getOrLoad('acct-1', 'workOrder', { list: { cursor: 'c2', pageSize: 20 } }, load);
+
+    expect(page).toEqual({ items: ['row'] });
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(cache.stats()).toMatchObject({ prefetches: 1, prefetchHits: 1, misses: 0 });
+  });
+
+  it('joins a prefetch still in flight', async () => {
+    const cache = createCache({ prefetch });
+    let answer: (value: string) => void = () => undefined;
+    const load = jest.fn(() => new Promise<string>(resolve => (answer = resolve)));
+
+    cache.prefetch('acct-1', 'workOrder', nextPage, load);
+    const page = cache.getOrLoad('acct-1', 'workOrder', nextPage, load);
+    answer('page 2');
+
+    await expect(page).resolves.toBe('page 2');
+    expect(load).toHaveBeenCalledTimes(1);
+  });
+
+  it('skips prefetches beyond the in-flight limit or under memory pressure', async () => {
+    const load = jest.fn(() => new Promise<string>(() => undefined));
+    const busy = createCache({ prefetch: { ...prefetch, maxInFlight: 1 } });
+    busy.prefetch('acct-1', 'task', 'a', load);
+    busy.prefetch('acct-1', 'task', 'b', load);
+
+    const short = createCache({ prefetch: { ...prefetch, maxMemoryFraction: 0 } });
+    short.prefetch('acct-1', 'task', 'a', load);
+
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(busy.stats()).toMatchObject({ prefetches: 1, prefetchSkipped: 1 });
+    expect(short.stats()).toMatchObject({ prefetches: 0, prefetchSkipped: 1 });
+  });
+
+  it('drops a prefetch that completes after its entity was invalidated', async () => {
+    const cache = createCache({ prefetch });
+    let answer: (value: string) => void = () => undefined;
+    cache.prefetch('acct-1', 'part', nextPage, () => new Promise<string>(resolve => (answer = resolve)));
+
+    await cache.invalidate('acct-1', 'part');
+    answer('stale page');
+    await settle();
+
+    const load = jest.fn(async () => 'fresh page');
+    await expect(cache.getOrLoad('acct-1', 'part', nextPage, load)).resolves.toBe('fresh page');
+    expect(load).toHaveBeenCalledTimes(1);
+  });
+
+  it('does nothing unless prefetching is configured', async () => {
+    const cache = createCache();
+    const load = jest.fn(async () => 'value');
+
+    cache.prefetch('acct-1', 'unit', nextPage, load);
+
+    expect(load).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,126 @@
+import http from 'http';
+import { AddressInfo } from 'net';
+
+import { TimingReceiver, TraceSummary, configureTracing, span, spanSync, toEmf, withTracing } from '../tracing/tracer';
+
+const delay = (ms: number): Promise<void> => new Promise(resolve => setTimeout(resolve, ms));
+
+/** A Lambda context that keeps the last timing reported to it */
+const receiver = (): TimingReceiver & { timing?: TraceSummary } => {
+  const context: TimingReceiver & { timing?: TraceSummary } = {
+    getRemainingTimeInMillis: () => 1000,
+    reportTiming: timing => {
+      context.timing = timing;
+    },
+  };
+  return context;
+};
+
+describe('tracing', () => {
+  let lines: string[];
+
+  beforeEach(() => {
+    lines = [];
+    configureTracing({ enabled: true, metrics: true, extension: true, write: line => lines.push(line) });
+  });
+
+  afterAll(() => configureTracing());
+
+  it('records handler, init, nested and serialize spans and reports them to the caller', async () => {
+    const context = receiver();
+    const handler = withTracing(async (event: { info: { fieldName: string } }) => {
+      spanSync('auth', () => 'token');
+      await span('http', () => delay(5), { path: '/units' });
+      return { ok: true, field: event.info.fieldName };
+    });
+
+    await expect(handler({ info: { fieldName: 'getUnit' } }, context)).resolves.toEqual({ ok: true, field: 'getUnit' });
+
+    const timing = context.timing;
+    expect(timing?.fieldName).toBe('getUnit');
+    expect(timing?.coldStart).toBe(true);
+    expect(timing?.spans.map(s => s.name)).toEqual(['init', 'handler', 'auth', 'http', 'serialize']);
+    expect(timing?.counts).toMatchObject({ handler: 1, auth: 1, http: 1, serialize: 1 });
+    expect(timing?.totals['http']).toBeGreaterThanOrEqual(4);
+    expect(timing?.spans.find(s => s.name === 'serialize')?.attributes).toEqual({ bytes: 29 });
+
+    await handler({ info: { fieldName: 'getUnit' } }, context);
+    expect(context.timing?.coldStart).toBe(false);
+    expect(context.timing?.spans.map(s => s.name)).not.toContain('init');
+  });
+
+  it('writes one EMF line per invocation, failed ones included', async () => {
+    const handler = withTracing(async (): Promise<never> => {
+      await span('http', () => Promise.reject(new Error('503')));
+      throw new Error('unreachable');
+    });
+
+    await expect(handler({ info: { fieldName: 'listUnits' } })).rejects.toThrow('503');
+
+    expect(lines).toHaveLength(1);
+    const emf = JSON.parse(lines[0] ?? '{}');
+    expect(emf._aws.CloudWatchMetrics[0].Dimensions).toEqual([['FunctionName', 'FieldName']]);
+    expect(emf.FieldName).toBe('listUnits');
+    expect(emf.httpCalls).toBe(1);
+    expect(emf.spans.find((s: { name: string }) => s.name === 'http').error).toBe(true);
+  });
+
+  it('times the network phases of HTTP calls made inside a span', async () => {
+    const server = http.createServer((_request, response) => setTimeout(() => response.end('ok'), 10));
+    await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+    const { port } = server.address() as AddressInfo;
+    const context = receiver();
+    try {
+      const handler = withTracing(() =>
+        span('http', () => new Promise<void>(resolve => http.get(`http://127.0.0.1:${port}/`, r => r.resume().on('end', resolve))))
+      );
+      await handler({}, context);
+    } finally {
+      server.close();
+    }
+
+    const phases = context.timing?.spans.find(s => s.name === 'http')?.phases;
+    expect(Object.keys(phases ?? {})).toEqual(expect.arrayContaining(['connect', 'ttfb', 'body']));
+    expect(phases?.['ttfb']).toBeGreaterThanOrEqual(phases?.['connect'] ?? 0);
+  });
+
+  it('keeps at most maxSpans spans but counts them all', async () => {
+    configureTracing({ enabled: true, metrics: false, extension: true, maxSpans: 3 });
+    const context = receiver();
+    const handler = withTracing(async () => {
+      for (let i = 0; i < 5; i += 1) {
+        spanSync('transform', () => i);
+      }
+    });
+
+    await handler({}, context);
+
+    expect(context.timing?.spans).toHaveLength(3);
+    expect(context.timing?.counts['transform']).toBe(5);
+    expect(context.timing?.dropped).toBeGreaterThan(0);
+  });
+
+  it('runs spans straight through when disabled', async () => {
+    configureTracing({ enabled: false, write: line => lines.push(line) });
+    const handler = withTracing(async () => spanSync('auth', () => 'value'));
+
+    await expect(handler({})).resolves.toBe('value');
+    expect(lines).toEqual([]);
+  });
+});
+
+describe('toEmf', () => {
+  it('declares a metric per span name', () => {
+    const emf = toEmf(
+      { fieldName: 'getUnit', coldStart: false, totalMs: 12, totals: { http: 8, auth: 0.1 }, counts: { http: 2 }, spans: [], dropped: 0 },
+      'SrNextBff',
+      'unit'
+    );
+
+    expect(emf).toMatchObject({ FunctionName: 'unit', FieldName: 'getUnit', totalMs: 12, httpCalls: 2, httpMs: 8, authMs: 0.1 });
+    expect((emf['_aws'] as { CloudWatchMetrics: Array<{ Metrics: unknown[] }> }).CloudWatchMetrics[0]?.Metrics).toContainEqual({
+      Name: 'httpCalls',
+      Unit: 'Count',
+    });
+  });
+});
@@ -0,0 +1,151 @@
+import fs from 'fs';
+import http from 'http';
+import { AddressInfo } from 'net';
+import os from 'os';
+import path from 'path';
+
+import { getPooledClient, resetHttpPool, withAuth } from '../http/pool';
+import {
+  RecordedExchange,
+  configureTraffic,
+  getRecordedExchanges,
+  getTrafficStats,
+  loadTrafficFixture,
+} from '../http/traffic';
+
+const exchange = (url: string, durationMs: number, body: unknown, startMs = 0): RecordedExchange => ({
+  method: 'GET',
+  url,
+  requestBytes: 0,
+  startMs,
+  durationMs,
+  status: 200,
+  headers: { 'content-type': 'application/json' },
+  body,
+});
+
+describe('traffic record/replay', () => {
+  let server: http.Server;
+  let baseURL: string;
+  let requests = 0;
+  let fixture: string;
+
+  beforeAll(async () => {
+    server = http.createServer((req, res) => {
+      requests += 1;
+      res.setHeader('Content-Type', 'application/json');
+      res.setHeader('X-Amzn-RequestId', `req-${requests}`);
+      if ((req.url ?? '').startsWith('/fail')) {
+        res.statusCode = 404;
+        res.end(JSON.stringify({ error: 'not found' }));
+        return;
+      }
+      let body = '';
+      req.on('data', chunk => (body += chunk));
+      req.on('end', () => setTimeout(() => res.end(JSON.stringify({ url: req.url, body })), 40));
+    });
+    await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+    baseURL = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+    fixture = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'traffic-')), 'exchanges.jsonl');
+  });
+
+  afterAll(async () => {
+    configureTraffic({ mode: 'off' });
+    resetHttpPool();
+    await new Promise<void>(resolve => server.close(() => resolve()));
+  });
+
+  beforeEach(() => {
+    requests = 0;
+    resetHttpPool({ hedgeReads: false });
+  });
+
+  it('records status, headers, sizes, timing and body, but never the token', async () => {
+    configureTraffic({ mode: 'record', fixture });
+    const client = getPooledClient(baseURL);
+
+    await client.get('/units/acct-1', withAuth('secret-token', { params: { limit: 2 } }));
+    await client.post('/events', { name: 'oil change' }, withAuth('secret-token'));
+    await expect(client.get('/fail')).rejects.toMatchObject({ response: { status: 404 } });
+
+    const recorded = loadTrafficFixture(fixture);
+    expect(recorded).toEqual(getRecordedExchanges());
+    expect(recorded.map(e => [e.method, e.url, e.status])).toEqual([
+      ['GET', '/units/acct-1?limit=2', 200],
+      ['POST', '/events', 200],
+      ['GET', '/fail', 404],
+    ]);
+    expect(recorded[0]).toMatchObject({
+      headers: { 'content-type': 'application/json' },
+      body: { url: '/units/acct-1?limit=2', body: '' },
+      requestBytes: 0,
+    });
+    expect(recorded[0]?.durationMs).toBeGreaterThanOrEqual(35);
+    expect(recorded[0]?.responseBytes).toBe(JSON.stringify(recorded[0]?.body).length);
+    expect(recorded[1]?.bodyHash).toMatch(/^[0-9a-f]{16}$/);
+    expect(recorded[1]?.requestBytes).toBe(JSON.stringify({ name: 'oil change' }).length);
+    expect(fs.readFileSync(fixture, 'utf-8')).not.toMatch(/secret-token|x-amzn-requestid/i);
+  });
+
+  it('replays the recording without the network, with its latency', async () => {
+    configureTraffic({ mode: 'replay', fixture });
+    const client = getPooledClient(baseURL);
+    const started = Date.now();
+
+    const [units, created] = await Promise.all([
+      client.get('/units/acct-1', withAuth('another-token', { params: { limit: 2 } })),
+      client.post('/events', { name: 'oil change' }),
+    ]);
+
+    expect(Date.now() - started).toBeGreaterThanOrEqual(35);
+    expect(units.data).toEqual({ url: '/units/acct-1?limit=2', body: '' });
+    expect(created.data).toEqual({ url: '/events', body: JSON.stringify({ name: 'oil change' }) });
+    await expect(client.get('/fail')).rejects.toMatchObject({ response: { status: 404, data: { error: 'not found' } } });
+    expect(requests).toBe(0);
+    expect(getTrafficStats()).toEqual({
+      calls: 3,
+      peakConcurrency: 2,
+      unmatched: 0,
+      routes: { 'GET /units/acct-1?limit=2': 1, 'POST /events': 1, 'GET /fail': 1 },
+    });
+  });
+
+  it('fails requests that were never recorded, including writes with another body', async () => {
+    configureTraffic({ mode: 'replay', fixture });
+    const client = getPooledClient(baseURL);
+
+    await expect(client.post('/events', { name: 'tire rotation' })).rejects.toMatchObject({ code: 'ETRAFFICMISS' });
+    expect(getTrafficStats()?.unmatched).toBe(1);
+  });
+
+  it('serves repeated requests in recorded order, then the last one again', async () => {
+    configureTraffic({
+      mode: 'replay',
+      latencyScale: 0,
+      exchanges: [exchange('/poll', 5, { n: 2 }, 10), exchange('/poll', 5, { n: 1 }, 0)],
+    });
+    const client = getPooledClient(baseURL);
+
+    const answers = [];
+    for (let i = 0; i < 3; i += 1) {
+      answers.push((await client.get('/poll')).data);
+    }
+
+    expect(answers).toEqual([{ n: 1 }, { n: 2 }, { n: 2 }]);
+  });
+
+  it('times out a replayed request that was slower than its timeout', async () => {
+    configureTraffic({ mode: 'replay', exchanges: [exchange('/slow', 200, {})] });
+
+    await expect(getPooledClient(baseURL).get('/slow', { timeout: 20 })).rejects.toMatchObject({ code: 'ECONNABORTED' });
+  });
+
+  it('scales replayed latency', async () => {
+    configureTraffic({ mode: 'replay', latencyScale: 0.1, exchanges: [exchange('/slow', 300, {})] });
+    const started = Date.now();
+
+    await getPooledClient(baseURL).get('/slow');
+
+    expect(Date.now() - started).toBeLessThan(150);
+  });
+});
@@ -0,0 +1,141 @@
+import type { BatchItemResult } from '../appsync/batch';
+import { logger } from '../logging/logger';
+import { annotateSpan, span } from '../tracing/tracer';
+import { envInt } from '../utils/concurrency';
+import type { InvocationTimer } from '../utils/deadline';
+import { CostedEvent, FieldCosts, capLimit, invocationCost } from './query-cost';
+import { HttpRateLimitStore, MemoryRateLimitStore, RateLimitStore, RateLimiter } from './rate-limiter';
+
+/**
+ * Thrown (or, for a BatchInvoke, returned for every item) when an account
+ * has spent its budget. Fails before any backend call is made.
+ */
+export class ThrottledError extends Error {
+  constructor(
+    readonly accountId: string,
+    readonly cost: number,
+    readonly remaining: number,
+    readonly retryInMs: number,
+  ) {
+    super(
+      Number.isFinite(retryInMs)
+        ? `Rate limit exceeded: cost ${cost}, ${Math.floor(remaining)} left; retry in ${retryInMs}ms`
+        : `Rate limit exceeded: cost ${cost} is more than the account's whole budget`,
+    );
+    this.name = 'ThrottledError';
+  }
+}
+
+export interface AdmissionOptions {
+  /** Per-account rate limiting; limit caps apply either way */
+  enabled: boolean;
+  /** Cost an account can spend in a burst */
+  capacity: number;
+  /** Cost an account regains per second */
+  refillPerSecond: number;
+  store: RateLimitStore;
+}
+
+/**
+ * Admission settings from the environment:
+ *
+ *   RATE_LIMIT_ENABLED              "true" rate-limits each account (default off)
+ *   RATE_LIMIT_CAPACITY             cost an account can spend in a burst (default 600)
+ *   RATE_LIMIT_REFILL_PER_SECOND    cost an account regains per second (default 100)
+ *   RATE_LIMIT_STORE                "memory" keeps buckets in the container (default);
+ *                                   an http(s) URL uses a shared HttpRateLimitStore
+ *   RATE_LIMIT_STORE_TIMEOUT_MS     how long to wait for a shared store (default 50)
+ */
+export function admissionOptionsFromEnv(): AdmissionOptions {
+  const store = process.env['RATE_LIMIT_STORE'] ?? '';
+  return {
+    enabled: process.env['RATE_LIMIT_ENABLED'] === 'true',
+    capacity: envInt('RATE_LIMIT_CAPACITY', 600),
+    refillPerSecond: envInt('RATE_LIMIT_REFILL_PER_SECOND', 100),
+    store: /^https?:\/\//.test(store)
+      ? new HttpRateLimitStore(store, envInt('RATE_LIMIT_STORE_TIMEOUT_MS', 50))
+      : new MemoryRateLimitStore(),
+  };
+}
+
+let limiter: RateLimiter | undefined;
+let enabled: boolean | undefined;
+
+function rateLimiter(): RateLimiter | undefined {
+  if (enabled === undefined) {
+    configureAdmission(admissionOptionsFromEnv());
+  }
+  return limiter;
+}
+
+/**
+ * Replace the admission settings. Intended for tests and the local harness;
+ * without options they are read from the environment again.
+ */
+export function configureAdmission(options?: Partial<AdmissionOptions>): void {
+  if (options === undefined) {
+    limiter = enabled = undefined;
+    return;
+  }
+  const { capacity, refillPerSecond, store, ...rest } = { ...admissionOptionsFromEnv(), ...options };
+  enabled = rest.enabled;
+  limiter = enabled ? new RateLimiter({ capacity, refillPerSecond }, store) : undefined;
+}
+
+function isAppSyncEvent(event: unknown): event is CostedEvent {
+  return typeof (event as CostedEvent | null)?.info?.fieldName === 'string';
+}
+
+function accountOf(event: unknown): string | undefined {
+  const sub = (event as { identity?: { sub?: unknown } | null } | undefined)?.identity?.sub;
+  return typeof sub === 'string' && sub !== '' ? sub : undefined;
+}
+
+/**
+ * Wrap a Lambda handler with admission control. Limit arguments above their
+ * field's maxLimit are lowered to it. With rate limiting on, the
+ * invocation's cost (see `invocationCost`) is taken from the caller's
+ * account bucket first; an account without the budget gets a
+ * ThrottledError at once, which carries the budget left and when to retry.
+ * The cost and budget left are recorded on the `admission` span.
+ *
+ * Events without a field name (asynchronous jobs) and callers without a sub
+ * claim are not limited.
+ */
+export function withAdmission<E, R>(
+  costs: FieldCosts,
+  handle: (event: E, timer?: InvocationTimer) => Promise<R>,
+): (event: E, timer?: InvocationTimer) => Promise<R> {
+  return async (event, timer) => {
+    const events: unknown[] = Array.isArray(event) ? event : [event];
+    if (!events.every(isAppSyncEvent)) {
+      return handle(event, timer);
+    }
+    const capped = (
+      Array.isArray(event) ? events.map(item => capLimit(costs, item as CostedEvent)) : capLimit(costs, event as CostedEvent)
+    ) as E;
+
+    const accountId = accountOf(events[0]);
+    const rateLimits = rateLimiter();
+    if (rateLimits === undefined || accountId === undefined) {
+      return handle(capped, timer);
+    }
+    const cost = invocationCost(costs, capped as CostedEvent | CostedEvent[]);
+    const taken = await span('admission', async () => {
+      const result = await rateLimits.take(accountId, cost);
+      annotateSpan({ cost, remaining: Math.floor(result.remaining), allowed: result.allowed });
+      return result;
+    });
+    if (taken.allowed) {
+      return handle(capped, timer);
+    }
+
+    const error = new ThrottledError(accountId, cost, taken.remaining, taken.retryInMs);
+    logger.warn('Request throttled', { accountId, cost, remaining: taken.remaining, retryInMs: taken.retryInMs });
+    if (!Array.isArray(event)) {
+      throw error;
+    }
+    const failed: BatchItemResult = { data: null, errorMessage: error.message, errorType: error.name };
+    return events.map(() => failed) as R;
+  };
+}
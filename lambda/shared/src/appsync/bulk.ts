@@ -0,0 +1,195 @@
+import axios from 'axios';
+
+import { envInt, mapWithConcurrency } from '../utils/concurrency';
+import { remainingTimeMs } from '../utils/deadline';
+
+/**
+ * Why one item of a bulk mutation failed (GraphQL `BulkItemError`)
+ */
+export interface BulkItemError {
+  message: string;
+  errorType: string;
+}
+
+/**
+ * One item's outcome: `data` on success, `error` otherwise
+ */
+export interface BulkItemResult<T> {
+  /** Position of the item in the input list */
+  index: number;
+  data: T | null;
+  error: BulkItemError | null;
+}
+
+export interface BulkOptions {
+  /** Items written at once when falling back to one call per item */
+  concurrency: number;
+  /** Items per call to a bulk endpoint */
+  chunkSize: number;
+  /** Largest input list accepted */
+  maxItems: number;
+  /** No item or chunk is started with less than this left of the invocation */
+  minRemainingMs: number;
+}
+
+/**
+ * Send a chunk of items to a backend bulk endpoint: one outcome per item, in
+ * order, or undefined when the backend has no such endpoint (the items then
+ * fall back to one call each)
+ */
+export type BulkSender<I, R> = (items: I[]) => Promise<Array<R | Error> | undefined>;
+
+/**
+ * Bulk settings from the environment:
+ *
+ *   BULK_CONCURRENCY       per-item calls in flight (default 8)
+ *   BULK_CHUNK_SIZE        items per bulk endpoint call (default 100)
+ *   BULK_MAX_ITEMS         largest input list (default 500)
+ *   BULK_MIN_REMAINING_MS  invocation time an item needs to be started (default 1000)
+ */
+export function bulkOptionsFromEnv(): BulkOptions {
+  return {
+    concurrency: envInt('BULK_CONCURRENCY', 8),
+    chunkSize: envInt('BULK_CHUNK_SIZE', 100),
+    maxItems: envInt('BULK_MAX_ITEMS', 500),
+    minRemainingMs: envInt('BULK_MIN_REMAINING_MS', 1000),
+  };
+}
+
+/**
+ * Reject input lists over BULK_MAX_ITEMS before anything is written
+ */
+export function assertBulkSize(items: readonly unknown[], maxItems = bulkOptionsFromEnv().maxItems): void {
+  if (items.length > maxItems) {
+    throw new Error(`Too many items: ${items.length} (at most ${maxItems} per request)`);
+  }
+}
+
+/**
+ * Whether a failed call means the endpoint does not exist, as opposed to the
+ * call failing: a 405 or 501, or a 404 from the router rather than the
+ * service, i.e. without a JSON body or with API Gateway's bare
+ * {"message":"Not Found"}. A 404 with the service's own error body (an
+ * unknown account, say) is a failed call.
+ */
+export function isMissingEndpoint(error: unknown): boolean {
+  const response = axios.isAxiosError(error) ? error.response : undefined;
+  if (response?.status === 405 || response?.status === 501) {
+    return true;
+  }
+  if (response?.status !== 404) {
+    return false;
+  }
+  const { data } = response;
+  if (typeof data === 'object' && data !== null) {
+    const { message, ...rest } = data as { message?: unknown };
+    return Object.keys(rest).length === 0 && /^not found$/i.test(String(message));
+  }
+  return !/json/i.test(String(response.headers?.['content-type'] ?? ''));
+}
+
+/**
+ * Remembers that a backend has no bulk endpoint, so bulk mutations go
+ * straight to one call per item, for `ttlMs` (BULK_ENDPOINT_RECHECK_MS,
+ * default 300000); the endpoint is then tried again, in case it has been
+ * deployed since. Services keep one per endpoint in module scope, so it
+ * lasts for the container.
+ */
+export class MissingEndpointLatch {
+  private missingUntil = 0;
+
+  constructor(private readonly ttlMs = envInt('BULK_ENDPOINT_RECHECK_MS', 300_000)) {}
+
+  get missing(): boolean {
+    return Date.now() < this.missingUntil;
+  }
+
+  markMissing(): void {
+    this.missingUntil = Date.now() + this.ttlMs;
+  }
+}
+
+function itemError(error: unknown): BulkItemError {
+  return error instanceof Error
+    ? { message: error.message, errorType: error.name }
+    : { message: String(error), errorType: 'Error' };
+}
+
+function outOfTime(minRemainingMs: number): boolean {
+  const remaining = remainingTimeMs();
+  return remaining !== undefined && remaining < minRemainingMs;
+}
+
+const NOT_STARTED: BulkItemError = {
+  message: 'Not attempted: the request ran out of time',
+  errorType: 'DeadlineExceeded',
+};
+
+/**
+ * Apply a mutation to every item of a list, each item succeeding or failing
+ * on its own, and answer one result per item in input order.
+ *
+ * With a `bulk` sender the items go to the backend's bulk endpoint in chunks
+ * of `chunkSize`; if the backend turns out not to have one, they fall back to
+ * `execute`, one call per item with at most `concurrency` in flight. A chunk
+ * that fails as a whole fails each of its items and is not retried item by
+ * item, since part of it may have been applied. Items (or chunks) that would
+ * start with less than `minRemainingMs` of the invocation left are not
+ * attempted and come back with a DeadlineExceeded error, so the response
+ * still reaches AppSync in time.
+ */
+export async function runBulk<I, R>(
+  items: readonly I[],
+  execute: (item: I, index: number) => Promise<R>,
+  options: Partial<BulkOptions> & { bulk?: BulkSender<I, R> } = {},
+): Promise<Array<BulkItemResult<R>>> {
+  const { bulk, ...overrides } = options;
+  const settings = { ...bulkOptionsFromEnv(), ...overrides };
+  const results = new Array<BulkItemResult<R>>(items.length);
+  let pending = items.map((item, index) => ({ item, index }));
+
+  if (bulk !== undefined) {
+    const fallback: typeof pending = [];
+    for (let start = 0; start < pending.length; start += settings.chunkSize) {
+      const chunk = pending.slice(start, start + settings.chunkSize);
+      if (outOfTime(settings.minRemainingMs)) {
+        chunk.forEach(({ index }) => (results[index] = { index, data: null, error: NOT_STARTED }));
+        continue;
+      }
+      let outcomes: Array<R | Error> | undefined;
+      try {
+        outcomes = await bulk(chunk.map(({ item }) => item));
+      } catch (error) {
+        chunk.forEach(({ index }) => (results[index] = { index, data: null, error: itemError(error) }));
+        continue;
+      }
+      if (outcomes === undefined) {
+        fallback.push(...chunk);
+        continue;
+      }
+      chunk.forEach(({ index }, position) => {
+        const outcome = outcomes?.[position];
+        results[index] =
+          outcome === undefined
+            ? { index, data: null, error: { message: 'No result from the bulk endpoint', errorType: 'Error' } }
+            : outcome instanceof Error
+              ? { index, data: null, error: itemError(outcome) }
+              : { index, data: outcome, error: null };
+      });
+    }
+    pending = fallback;
+  }
+
+  await mapWithConcurrency(pending, settings.concurrency, async ({ item, index }) => {
+    if (outOfTime(settings.minRemainingMs)) {
+      results[index] = { index, data: null, error: NOT_STARTED };
+      return;
+    }
+    try {
+      results[index] = { index, data: await execute(item, index), error: null };
+    } catch (error) {
+      results[index] = { index, data: null, error: itemError(error) };
+    }
+  });
+  return results;
+}
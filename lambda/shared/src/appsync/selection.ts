@@ -0,0 +1,178 @@
+import { spanSync } from '../tracing/tracer';
+
+/**
+ * Minimal event shape needed to read the client's selection set
+ */
+export interface SelectionSource {
+  info?: {
+    selectionSetList?: string[] | null;
+  };
+}
+
+/**
+ * The fields a GraphQL client selected, read from AppSync's
+ * `info.selectionSetList` (slash-separated paths such as
+ * "items/workOrders/status"). AppSync lists every intermediate path and
+ * reports aliased fields by field name.
+ *
+ * When no selection set is available (direct invokes, tests, batched nested
+ * fields) every field counts as selected, so callers can skip work based on
+ * `has` without ever dropping data a client asked for.
+ */
+export class Selection {
+  private constructor(
+    private readonly paths: ReadonlySet<string> | undefined,
+    private readonly prefix: string,
+  ) {}
+
+  static fromEvent(event: SelectionSource): Selection {
+    const list = event.info?.selectionSetList;
+    return new Selection(Array.isArray(list) && list.length > 0 ? new Set(list) : undefined, '');
+  }
+
+  static all(): Selection {
+    return new Selection(undefined, '');
+  }
+
+  /**
+   * True when every field is selected (no selection set was provided)
+   */
+  get isAll(): boolean {
+    return this.paths === undefined;
+  }
+
+  /**
+   * Whether the field at `path`, relative to this selection, was selected
+   */
+  has(path: string): boolean {
+    return this.paths === undefined || this.paths.has(this.prefix + path);
+  }
+
+  /**
+   * Whether any of the given fields was selected
+   */
+  hasAny(...paths: string[]): boolean {
+    return paths.some(path => this.has(path));
+  }
+
+  /**
+   * The selection below a field, e.g. `at('items')` for the rows of a
+   * connection. If the selection set lists the field but nothing below it,
+   * the sub-selection is unknown and everything below counts as selected.
+   */
+  at(path: string): Selection {
+    const prefix = `${this.prefix}${path}/`;
+    if (this.paths === undefined || ![...this.paths].some(entry => entry.startsWith(prefix))) {
+      return new Selection(undefined, prefix);
+    }
+    return new Selection(this.paths, prefix);
+  }
+
+  /**
+   * Names of the fields selected directly at this level
+   */
+  fields(): string[] | undefined {
+    if (this.paths === undefined) {
+      return undefined;
+    }
+    const fields: string[] = [];
+    for (const path of this.paths) {
+      if (path.startsWith(this.prefix)) {
+        const rest = path.slice(this.prefix.length);
+        if (rest !== '' && !rest.includes('/')) {
+          fields.push(rest);
+        }
+      }
+    }
+    return fields;
+  }
+}
+
+/**
+ * Copy only the selected top-level fields of an object, plus `keep` (fields
+ * nested resolvers read from their source, such as IDs). Null and undefined
+ * fields are left out: AppSync answers an absent field as null anyway.
+ * Returns the object itself when everything is selected.
+ */
+export function project<T extends object>(value: T, selection: Selection, keep: readonly string[] = []): T {
+  const projectRow = projector(selection, keep, {});
+  return projectRow === undefined ? value : (projectRow(value) as T);
+}
+
+/**
+ * `project` over a list of rows; the selected field list is computed once.
+ * Fields named in `nested` (an object or a list of objects, e.g. `unitInfo`
+ * or `workOrders`) are projected by their own sub-selection, keeping the
+ * fields listed for them, and a sub-object shared by several rows is
+ * projected once and shared by the projected rows too.
+ */
+export function projectAll<T extends object>(
+  values: T[],
+  selection: Selection,
+  keep: readonly string[] = [],
+  nested: Readonly<Record<string, readonly string[]>> = {},
+): T[] {
+  const projectRow = projector(selection, keep, nested);
+  if (projectRow === undefined) {
+    return values;
+  }
+  return spanSync('transform', () => values.map(value => projectRow(value) as T), { rows: values.length });
+}
+
+type Projector = (value: object) => object;
+
+/**
+ * A row projection for `selection`, or undefined when everything is selected
+ */
+function projector(
+  selection: Selection,
+  keep: readonly string[],
+  nested: Readonly<Record<string, readonly string[]>>,
+): Projector | undefined {
+  const fields = selection.fields();
+  if (fields === undefined) {
+    return undefined;
+  }
+  const wanted = [...fields, ...keep];
+  const children = new Map<string, (value: unknown) => unknown>();
+  for (const [field, childKeep] of Object.entries(nested)) {
+    const projectChild = fields.includes(field) ? projector(selection.at(field), childKeep, {}) : undefined;
+    if (projectChild !== undefined) {
+      children.set(field, sharedProjection(projectChild));
+    }
+  }
+  return value => pick(value, wanted, children);
+}
+
+/**
+ * Apply `projectChild` to an object or to each object of a list, once per
+ * distinct object
+ */
+function sharedProjection(projectChild: Projector): (value: unknown) => unknown {
+  const projected = new WeakMap<object, object>();
+  const once = (value: unknown): unknown => {
+    if (value === null || typeof value !== 'object') {
+      return value;
+    }
+    let copy = projected.get(value);
+    if (copy === undefined) {
+      copy = projectChild(value);
+      projected.set(value, copy);
+    }
+    return copy;
+  };
+  return value => (Array.isArray(value) ? value.map(once) : once(value));
+}
+
+function pick(value: object, fields: readonly string[], children: ReadonlyMap<string, (value: unknown) => unknown>): object {
+  const source = value as Record<string, unknown>;
+  const picked: Record<string, unknown> = {};
+  for (const field of fields) {
+    const fieldValue = source[field];
+    if (fieldValue !== undefined && fieldValue !== null) {
+      const projectChild = children.get(field);
+      picked[field] = projectChild === undefined ? fieldValue : projectChild(fieldValue);
+    }
+  }
+  return picked;
+}
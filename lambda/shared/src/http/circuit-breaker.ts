@@ -0,0 +1,120 @@
+import { logger } from '../logging/logger';
+
+export type CircuitState = 'closed' | 'open' | 'half-open';
+
+/**
+ * How a call through the breaker went: `failure` counts against the backend,
+ * `healthy` proves it is answering (a 404 does), and `unknown` says nothing
+ * about it (the caller cancelled)
+ */
+export type CallOutcome = 'failure' | 'healthy' | 'unknown';
+
+export interface CircuitBreakerOptions {
+  /** Consecutive failures that open the circuit */
+  failureThreshold: number;
+  /** How long an open circuit fails fast before letting one probe through */
+  cooldownMs: number;
+}
+
+export interface CircuitStats {
+  state: CircuitState;
+  consecutiveFailures: number;
+  /** Calls refused while open */
+  rejected: number;
+}
+
+/**
+ * Thrown instead of calling a backend whose circuit is open
+ */
+export class CircuitOpenError extends Error {
+  constructor(readonly circuit: string, readonly retryInMs: number) {
+    super(`Circuit open for ${circuit}; retry in ${retryInMs}ms`);
+    this.name = 'CircuitOpenError';
+  }
+}
+
+/**
+ * Consecutive-failure circuit breaker for one backend.
+ *
+ * After `failureThreshold` failures in a row the circuit opens and every call
+ * fails fast with `CircuitOpenError` for `cooldownMs`. The first call after
+ * that is a probe (half-open): if the backend answers the circuit closes,
+ * otherwise it opens for another cooldown. Other calls keep failing fast
+ * while the probe is in flight.
+ */
+export class CircuitBreaker {
+  private consecutiveFailures = 0;
+  private openedAt: number | undefined;
+  private probing = false;
+  private rejected = 0;
+
+  constructor(
+    readonly name: string,
+    private readonly options: CircuitBreakerOptions,
+    private readonly now: () => number = Date.now,
+  ) {}
+
+  get state(): CircuitState {
+    if (this.openedAt === undefined) {
+      return 'closed';
+    }
+    return this.probing || this.now() - this.openedAt < this.options.cooldownMs ? 'open' : 'half-open';
+  }
+
+  async run<T>(call: () => Promise<T>, outcomeOf: (error: unknown) => CallOutcome): Promise<T> {
+    const probe = this.admit();
+    let result: T;
+    try {
+      result = await call();
+    } catch (error) {
+      this.record(outcomeOf(error), probe);
+      throw error;
+    }
+    this.record('healthy', probe);
+    return result;
+  }
+
+  stats(): CircuitStats {
+    return { state: this.state, consecutiveFailures: this.consecutiveFailures, rejected: this.rejected };
+  }
+
+  /** Refuse the call while open; returns whether it is the half-open probe */
+  private admit(): boolean {
+    if (this.openedAt === undefined) {
+      return false;
+    }
+    const openFor = this.now() - this.openedAt;
+    if (this.probing || openFor < this.options.cooldownMs) {
+      this.rejected += 1;
+      throw new CircuitOpenError(this.name, Math.max(0, this.options.cooldownMs - openFor));
+    }
+    this.probing = true;
+    return true;
+  }
+
+  private record(outcome: CallOutcome, probe: boolean): void {
+    if (probe) {
+      this.probing = false;
+    }
+    if (outcome === 'unknown') {
+      return;
+    }
+    if (outcome === 'healthy') {
+      if (this.openedAt !== undefined && probe) {
+        logger.info('Circuit closed', { circuit: { name: this.name } });
+        this.openedAt = undefined;
+      }
+      if (this.openedAt === undefined) {
+        this.consecutiveFailures = 0;
+      }
+      return;
+    }
+    this.consecutiveFailures += 1;
+    if (probe || (this.openedAt === undefined && this.consecutiveFailures >= this.options.failureThreshold)) {
+      this.openedAt = this.now();
+      logger.warn('Circuit opened', {
+        circuit: { name: this.name, consecutiveFailures: this.consecutiveFailures, cooldownMs: this.options.cooldownMs },
+      });
+    }
+  }
+}
@@ -0,0 +1,135 @@
+/**
+ * Rolling window of recent call latencies for one backend
+ */
+export class LatencyTracker {
+  private readonly samples: number[] = [];
+  private next = 0;
+
+  constructor(
+    private readonly size = 128,
+    /** Percentiles are undefined until this many samples have been seen */
+    private readonly minSamples = 20,
+  ) {}
+
+  record(ms: number): void {
+    if (this.samples.length < this.size) {
+      this.samples.push(ms);
+    } else {
+      this.samples[this.next] = ms;
+    }
+    this.next = (this.next + 1) % this.size;
+  }
+
+  percentile(p: number): number | undefined {
+    if (this.samples.length < this.minSamples) {
+      return undefined;
+    }
+    const sorted = [...this.samples].sort((a, b) => a - b);
+    return sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+  }
+}
+
+export interface HedgeOptions {
+  /** Attempts in total, the first included */
+  maxAttempts: number;
+  /** Start another attempt when one has been in flight this long; undefined never hedges */
+  hedgeAfterMs: number | undefined;
+  /** Base for the full-jitter backoff before retrying a failed attempt */
+  backoffMs: number;
+  /** Whether a failed attempt may be retried (and a hedge may still win) */
+  retryable: (error: unknown) => boolean;
+  /** Time left for the whole call; no retry is started that could not finish in it */
+  remainingMs?: () => number | undefined;
+  /** Called whenever an attempt after the first starts */
+  onAttempt?: (kind: 'hedge' | 'retry') => void;
+}
+
+/**
+ * Run an idempotent call with hedging and retries.
+ *
+ * If the attempt in flight has not answered after `hedgeAfterMs` (plus up to
+ * 25% jitter), a second one is started alongside it, and a retryable failure
+ * starts another attempt after a full-jitter backoff, up to `maxAttempts` in
+ * all. The first success wins and the other attempts are aborted through
+ * their signals. Only ever use it for reads: losing attempts may still have
+ * reached the backend.
+ */
+export function hedged<T>(
+  attempt: (signal: AbortSignal) => Promise<T>,
+  options: HedgeOptions,
+  signal?: AbortSignal,
+): Promise<T> {
+  return new Promise<T>((resolve, reject) => {
+    if (signal?.aborted === true) {
+      reject(signal.reason);
+      return;
+    }
+
+    const controllers: AbortController[] = [];
+    let inFlight = 0;
+    let settled = false;
+    let timer: NodeJS.Timeout | undefined;
+
+    const finish = (settle: () => void): void => {
+      if (settled) {
+        return;
+      }
+      settled = true;
+      clearTimeout(timer);
+      signal?.removeEventListener('abort', onAbort);
+      for (const controller of controllers) {
+        controller.abort();
+      }
+      settle();
+    };
+    const onAbort = (): void => finish(() => reject(signal?.reason));
+
+    const schedule = (delayMs: number, kind: 'hedge' | 'retry'): void => {
+      clearTimeout(timer);
+      timer = setTimeout(() => {
+        options.onAttempt?.(kind);
+        launch();
+      }, delayMs);
+    };
+
+    const launch = (): void => {
+      if (settled) {
+        return;
+      }
+      const controller = new AbortController();
+      controllers.push(controller);
+      inFlight += 1;
+      if (options.hedgeAfterMs !== undefined && controllers.length < options.maxAttempts) {
+        schedule(options.hedgeAfterMs * (1 + Math.random() * 0.25), 'hedge');
+      }
+
+      attempt(controller.signal).then(
+        value => finish(() => resolve(value)),
+        (error: unknown) => {
+          inFlight -= 1;
+          if (settled) {
+            return;
+          }
+          if (!options.retryable(error)) {
+            finish(() => reject(error));
+            return;
+          }
+          if (inFlight > 0) {
+            // An attempt still in flight may yet answer
+            return;
+          }
+          const delayMs = Math.random() * options.backoffMs * 2 ** (controllers.length - 1);
+          const remaining = options.remainingMs?.();
+          if (controllers.length >= options.maxAttempts || (remaining !== undefined && remaining <= delayMs)) {
+            finish(() => reject(error));
+            return;
+          }
+          schedule(delayMs, 'retry');
+        },
+      );
+    };
+
+    signal?.addEventListener('abort', onAbort, { once: true });
+    launch();
+  });
+}
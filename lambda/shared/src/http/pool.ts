@@ -0,0 +1,507 @@
+import http from 'http';
+import https from 'https';
+
+import axios, {
+  AxiosAdapter,
+  AxiosError,
+  AxiosInstance,
+  AxiosRequestConfig,
+  AxiosResponse,
+  InternalAxiosRequestConfig,
+  RawAxiosRequestHeaders,
+} from 'axios';
+
+import { logger } from '../logging/logger';
+import { annotateSpan, span, tracingEnabled } from '../tracing/tracer';
+import { remainingTimeMs } from '../utils/deadline';
+import { CallOutcome, CircuitBreaker, CircuitOpenError, CircuitStats } from './circuit-breaker';
+import { LatencyTracker, hedged } from './hedging';
+import { SingleFlight, SingleFlightStats } from './single-flight';
+import { throughTraffic } from './traffic';
+
+export interface HttpPoolOptions {
+  /** Maximum concurrent sockets per backend host */
+  maxSockets: number;
+  /** Maximum idle sockets kept open per backend host */
+  maxFreeSockets: number;
+  /** Idle sockets are closed after this many milliseconds */
+  idleTimeoutMs: number;
+  /** Default request timeout for pooled clients */
+  requestTimeoutMs: number;
+  /** Accept-Encoding sent to backends; "identity" asks for uncompressed bodies */
+  acceptEncoding: string;
+  /** Share one upstream request between identical concurrent reads */
+  singleFlight: boolean;
+  /** Hedge slow reads and retry failed ones (GET/HEAD only) */
+  hedgeReads: boolean;
+  /** Attempts per read, the first included, when hedging */
+  maxReadAttempts: number;
+  /** Never hedge a read sooner than this, whatever the backend's p95 */
+  hedgeMinDelayMs: number;
+  /** Base of the full-jitter backoff before retrying a failed read */
+  retryBackoffMs: number;
+  /** Consecutive failures that open a backend host's circuit */
+  breakerFailureThreshold: number;
+  /** How long an open circuit fails fast before probing the backend again */
+  breakerCooldownMs: number;
+}
+
+export interface BackendStats {
+  circuit: CircuitStats;
+  /** p95 of recent successful calls, once there are enough of them */
+  p95Ms: number | undefined;
+}
+
+export interface HttpResilienceStats {
+  /** Reads that started a second attempt because the first passed the backend's p95 */
+  hedges: number;
+  /** Reads retried after a failed attempt */
+  retries: number;
+  /** Per backend host */
+  backends: Record<string, BackendStats>;
+}
+
+const IDEMPOTENT_METHODS = new Set(['get', 'head', 'options', 'put', 'delete']);
+const READ_METHODS = new Set(['get', 'head']);
+
+function envNumber(name: string, fallback: number): number {
+  const raw = process.env[name];
+  if (raw === undefined || raw === '') {
+    return fallback;
+  }
+  const value = Number(raw);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+/**
+ * Pool settings from the environment. The idle timeout stays well under the
+ * 60s ALB default so a frozen container does not wake up holding sockets the
+ * backend has already closed. The request timeout is an upper bound: inside
+ * `runWithDeadline` no call outlives the invocation's remaining time.
+ * Backends are asked for brotli or gzip bodies (HTTP_ACCEPT_ENCODING), which
+ * axios decompresses as they stream in.
+ */
+export function httpPoolOptionsFromEnv(): HttpPoolOptions {
+  return {
+    maxSockets: envNumber('HTTP_MAX_SOCKETS', 50),
+    maxFreeSockets: envNumber('HTTP_MAX_FREE_SOCKETS', 10),
+    idleTimeoutMs: envNumber('HTTP_IDLE_TIMEOUT_MS', 30000),
+    requestTimeoutMs: envNumber('HTTP_REQUEST_TIMEOUT_MS', 30000),
+    acceptEncoding: process.env['HTTP_ACCEPT_ENCODING'] || 'br, gzip',
+    singleFlight: process.env['HTTP_SINGLE_FLIGHT'] !== 'false',
+    hedgeReads: process.env['HTTP_HEDGE_READS'] !== 'false',
+    maxReadAttempts: envNumber('HTTP_MAX_READ_ATTEMPTS', 2),
+    hedgeMinDelayMs: envNumber('HTTP_HEDGE_MIN_DELAY_MS', 50),
+    retryBackoffMs: envNumber('HTTP_RETRY_BACKOFF_MS', 50),
+    breakerFailureThreshold: envNumber('HTTP_BREAKER_FAILURES', 5),
+    breakerCooldownMs: envNumber('HTTP_BREAKER_COOLDOWN_MS', 10000),
+  };
+}
+
+interface PoolState {
+  options: HttpPoolOptions;
+  httpAgent: http.Agent;
+  httpsAgent: https.Agent;
+  clients: Map<string, AxiosInstance>;
+  reads: SingleFlight<AxiosResponse>;
+  backends: Map<string, Backend>;
+  hedges: number;
+  retries: number;
+}
+
+interface Backend {
+  breaker: CircuitBreaker;
+  latency: LatencyTracker;
+}
+
+let pool: PoolState | undefined;
+
+function createPool(options: HttpPoolOptions): PoolState {
+  const agentOptions = {
+    keepAlive: true,
+    maxSockets: options.maxSockets,
+    maxFreeSockets: options.maxFreeSockets,
+    timeout: options.idleTimeoutMs,
+    // Reuse the most recently used socket first so cold ones can age out
+    scheduling: 'lifo' as const,
+  };
+  return {
+    options,
+    httpAgent: new http.Agent(agentOptions),
+    httpsAgent: new https.Agent(agentOptions),
+    clients: new Map(),
+    reads: new SingleFlight(),
+    backends: new Map(),
+    hedges: 0,
+    retries: 0,
+  };
+}
+
+function getPool(): PoolState {
+  if (pool === undefined) {
+    pool = createPool(httpPoolOptionsFromEnv());
+  }
+  return pool;
+}
+
+/**
+ * The module-scope keep-alive agents shared by every pooled client
+ */
+export function getHttpAgents(): { httpAgent: http.Agent; httpsAgent: https.Agent } {
+  const { httpAgent, httpsAgent } = getPool();
+  return { httpAgent, httpsAgent };
+}
+
+/**
+ * How many pooled reads were answered by an identical request already in flight
+ */
+export function getSingleFlightStats(): SingleFlightStats {
+  return getPool().reads.stats();
+}
+
+/**
+ * Hedges, retries and each backend host's circuit and latency, for metrics and tests
+ */
+export function getHttpResilienceStats(): HttpResilienceStats {
+  const { hedges, retries, backends } = getPool();
+  return {
+    hedges,
+    retries,
+    backends: Object.fromEntries(
+      [...backends].map(([host, backend]) => [
+        host,
+        { circuit: backend.breaker.stats(), p95Ms: backend.latency.percentile(0.95) },
+      ]),
+    ),
+  };
+}
+
+/**
+ * Replace the pool, closing any sockets held by the previous one.
+ * Intended for tests and benchmarks.
+ */
+export function resetHttpPool(options?: Partial<HttpPoolOptions>): void {
+  if (pool !== undefined) {
+    pool.httpAgent.destroy();
+    pool.httpsAgent.destroy();
+  }
+  pool = options === undefined ? undefined : createPool({ ...httpPoolOptionsFromEnv(), ...options });
+}
+
+/**
+ * Get the shared axios client for a backend base URL.
+ *
+ * Clients live in module scope so connections stay warm across invocations.
+ * They carry no credentials: pass the caller's token on each request with
+ * `withAuth`. Every request goes through `buildAdapter`: GET and HEAD
+ * requests identical to one already in flight share its response, so treat
+ * `response.data` as read-only. `init` runs once, when the client for a base URL is first
+ * created, and is the place to register interceptors.
+ */
+export function getPooledClient(baseURL: string, init?: (client: AxiosInstance) => void): AxiosInstance {
+  const state = getPool();
+  const existing = state.clients.get(baseURL);
+  if (existing !== undefined) {
+    return existing;
+  }
+
+  const client = axios.create({
+    baseURL,
+    timeout: state.options.requestTimeoutMs,
+    httpAgent: state.httpAgent,
+    httpsAgent: state.httpsAgent,
+    decompress: true,
+    headers: {
+      'Content-Type': 'application/json',
+      'Accept-Encoding': state.options.acceptEncoding,
+    },
+  });
+  client.defaults.adapter = buildAdapter(axios.getAdapter(client.defaults.adapter), state);
+  retryStaleSockets(client);
+  if (init !== undefined) {
+    init(client);
+  }
+  state.clients.set(baseURL, client);
+  return client;
+}
+
+/**
+ * Merge a bearer token into per-request config
+ */
+export function withAuth(authToken: string | undefined, config: AxiosRequestConfig = {}): AxiosRequestConfig {
+  if (authToken === undefined || authToken === '') {
+    return config;
+  }
+  const headers: RawAxiosRequestHeaders = {
+    ...(config.headers as RawAxiosRequestHeaders | undefined),
+    Authorization: `Bearer ${authToken}`,
+  };
+  return { ...config, headers };
+}
+
+/**
+ * A kept-alive socket can be closed by the backend while the container is
+ * frozen. Retry idempotent requests once when that surfaces as ECONNRESET.
+ */
+function retryStaleSockets(client: AxiosInstance): void {
+  client.interceptors.response.use(undefined, async (error: AxiosError) => {
+    const config = error.config as (AxiosRequestConfig & { staleSocketRetried?: boolean }) | undefined;
+    const method = (config?.method ?? 'get').toLowerCase();
+    if (
+      config === undefined ||
+      error.code !== 'ECONNRESET' ||
+      config.staleSocketRetried === true ||
+      !IDEMPOTENT_METHODS.has(method)
+    ) {
+      throw error;
+    }
+    config.staleSocketRetried = true;
+    return client.request(config);
+  });
+}
+
+/**
+ * Everything that can change a read's response: method, full URL with query
+ * string, and the request headers. Authorization is one of the headers, so
+ * callers with different tokens never share a response, and the account is
+ * part of every backend path.
+ */
+function readKey(config: InternalAxiosRequestConfig): string {
+  const headers = Object.entries(config.headers.toJSON(true))
+    .map(([name, value]): [string, string] => [name.toLowerCase(), String(value)])
+    .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+  return JSON.stringify([
+    (config.method ?? 'get').toLowerCase(),
+    axios.getUri(config),
+    config.responseType ?? null,
+    headers,
+  ]);
+}
+
+/**
+ * Parse a JSON body once for every caller sharing it, the way axios' default
+ * response transform would; the transform passes already-parsed data through.
+ */
+function parseOnce(response: AxiosResponse): AxiosResponse {
+  const { data } = response;
+  if (typeof data !== 'string' || data === '' || (response.config.responseType ?? 'json') !== 'json') {
+    return response;
+  }
+  try {
+    return { ...response, data: JSON.parse(data) as unknown };
+  } catch {
+    return response;
+  }
+}
+
+function isRead(config: InternalAxiosRequestConfig): boolean {
+  return READ_METHODS.has((config.method ?? 'get').toLowerCase());
+}
+
+/**
+ * The adapter chain under every pooled client, outermost first:
+ *
+ * - identical concurrent reads share one request (`coalesceReads`);
+ * - reads are hedged and retried (`hedgeReads`); writes are sent once, since
+ *   a POST that timed out may still have been applied;
+ * - no attempt outlives the invocation deadline (`withinDeadline`);
+ * - each backend host has a circuit breaker and a latency window (`guardBackend`);
+ * - each attempt that goes on the wire is an `http` span of the invocation's trace (`traceCalls`);
+ * - the wire itself can be recorded or replayed from a fixture (`throughTraffic`).
+ */
+function buildAdapter(transport: AxiosAdapter, state: PoolState): AxiosAdapter {
+  let send = withinDeadline(guardBackend(traceCalls(throughTraffic(transport)), state));
+  if (state.options.hedgeReads && state.options.maxReadAttempts > 1) {
+    send = hedgeReads(send, state);
+  }
+  if (state.options.singleFlight) {
+    send = coalesceReads(send, state.reads);
+  }
+  return send;
+}
+
+/**
+ * Identical concurrent GET/HEAD requests go upstream once and share the
+ * parsed response. This sits at the adapter, below the interceptors, so each
+ * caller still gets its own config, transforms and error handling, and a
+ * stale-socket retry joins whatever identical read is in flight. A caller's
+ * abort signal only cancels the upstream request once nobody else is waiting.
+ */
+function coalesceReads(send: AxiosAdapter, reads: SingleFlight<AxiosResponse>): AxiosAdapter {
+  return async config => {
+    if (!isRead(config)) {
+      return send(config);
+    }
+    const key = readKey(config);
+    const joined = reads.has(key);
+    const response = await reads.run(
+      key,
+      async signal => parseOnce(await send({ ...config, signal })),
+      config.signal as AbortSignal | undefined,
+    );
+    if (joined) {
+      logger.info('Request coalesced', () => ({ singleFlight: { url: config.url, ...reads.stats() } }));
+    }
+    return { ...response, config };
+  };
+}
+
+/**
+ * Whether a failed read is worth another attempt: the backend did not answer,
+ * or answered 5xx or 429. An open circuit and a cancelled call are final.
+ */
+function retryable(error: unknown): boolean {
+  if (!axios.isAxiosError(error) || axios.isCancel(error) || error.code === 'ECIRCUITOPEN') {
+    return false;
+  }
+  const status = error.response?.status;
+  return status === undefined || status >= 500 || status === 429;
+}
+
+/**
+ * A read still unanswered after its backend's p95 gets a second attempt
+ * alongside it, and a retryable failure is retried after a jittered backoff,
+ * within `maxReadAttempts` and the invocation's remaining time. Until the
+ * backend has enough latency samples reads are only retried, not hedged.
+ */
+function hedgeReads(send: AxiosAdapter, state: PoolState): AxiosAdapter {
+  return config => {
+    if (!isRead(config)) {
+      return send(config);
+    }
+    const p95 = backendFor(state, config).latency.percentile(0.95);
+    return hedged(
+      signal => send({ ...config, signal }),
+      {
+        maxAttempts: state.options.maxReadAttempts,
+        hedgeAfterMs: p95 === undefined ? undefined : Math.max(p95, state.options.hedgeMinDelayMs),
+        backoffMs: state.options.retryBackoffMs,
+        retryable,
+        remainingMs: remainingTimeMs,
+        onAttempt: kind => {
+          if (kind === 'hedge') {
+            state.hedges += 1;
+          } else {
+            state.retries += 1;
+          }
+          logger.debug('Read attempt', { attempt: { kind, url: config.url, p95Ms: p95 } });
+        },
+      },
+      config.signal as AbortSignal | undefined,
+    );
+  };
+}
+
+/**
+ * Cap each attempt's timeout at the time left in the invocation (see
+ * `runWithDeadline`), and refuse to start one once it has run out, so a slow
+ * backend ends in a timeout error of ours rather than Lambda killing the
+ * invocation. Both surface as ECONNABORTED, like any axios timeout.
+ */
+function withinDeadline(send: AxiosAdapter): AxiosAdapter {
+  return config => {
+    const remaining = remainingTimeMs();
+    if (remaining === undefined) {
+      return send(config);
+    }
+    if (remaining <= 0) {
+      return Promise.reject(new AxiosError('Invocation deadline exceeded', AxiosError.ECONNABORTED, config));
+    }
+    const timeout = config.timeout !== undefined && config.timeout > 0 ? Math.min(config.timeout, remaining) : remaining;
+    return send({ ...config, timeout: Math.ceil(timeout) });
+  };
+}
+
+/**
+ * Time each request sent as an `http` span, with its method, host, path and
+ * query, and status; the tracer adds the network phases. A no-op unless
+ * tracing is on.
+ */
+function traceCalls(send: AxiosAdapter): AxiosAdapter {
+  return config => {
+    if (!tracingEnabled()) {
+      return send(config);
+    }
+    let url: URL | undefined;
+    try {
+      url = new URL(axios.getUri(config));
+    } catch {
+      url = undefined;
+    }
+    const attributes = {
+      method: (config.method ?? 'get').toUpperCase(),
+      host: url?.host ?? config.baseURL ?? '',
+      path: url === undefined ? config.url ?? '' : `${url.pathname}${url.search}`,
+    };
+    return span(
+      'http',
+      async () => {
+        try {
+          const response = await send(config);
+          annotateSpan({ status: response.status });
+          return response;
+        } catch (error) {
+          if (axios.isAxiosError(error)) {
+            annotateSpan(error.response !== undefined ? { status: error.response.status } : { failure: error.code ?? 'error' });
+          }
+          throw error;
+        }
+      },
+      attributes,
+    );
+  };
+}
+
+function backendFor(state: PoolState, config: InternalAxiosRequestConfig): Backend {
+  let host: string;
+  try {
+    host = new URL(axios.getUri(config)).host;
+  } catch {
+    host = config.baseURL ?? '';
+  }
+  let backend = state.backends.get(host);
+  if (backend === undefined) {
+    backend = {
+      breaker: new CircuitBreaker(host, {
+        failureThreshold: state.options.breakerFailureThreshold,
+        cooldownMs: state.options.breakerCooldownMs,
+      }),
+      latency: new LatencyTracker(),
+    };
+    state.backends.set(host, backend);
+  }
+  return backend;
+}
+
+/**
+ * Backend unavailable (no answer, 5xx, 429) counts against the circuit; any
+ * other answer proves the backend is up; a cancelled call proves nothing.
+ */
+function outcomeOf(error: unknown): CallOutcome {
+  if (axios.isCancel(error)) {
+    return 'unknown';
+  }
+  return retryable(error) || !axios.isAxiosError(error) ? 'failure' : 'healthy';
+}
+
+/**
+ * Every attempt goes through its backend host's circuit breaker, which fails
+ * fast with ECIRCUITOPEN while the backend is down, and successful attempts
+ * feed the host's latency window that hedging reads its p95 from.
+ */
+function guardBackend(send: AxiosAdapter, state: PoolState): AxiosAdapter {
+  return async config => {
+    const backend = backendFor(state, config);
+    const started = Date.now();
+    try {
+      const response = await backend.breaker.run(() => send(config), outcomeOf);
+      backend.latency.record(Date.now() - started);
+      return response;
+    } catch (error) {
+      if (error instanceof CircuitOpenError) {
+        throw new AxiosError(error.message, 'ECIRCUITOPEN', config);
+      }
+      throw error;
+    }
+  };
+}
@@ -0,0 +1,112 @@
+export interface SingleFlightStats {
+  /** Calls made through `run` */
+  calls: number;
+  /** Calls answered by a flight another caller had already started */
+  shared: number;
+  /** shared / calls: the fraction of calls that did not go upstream */
+  dedupeRatio: number;
+}
+
+interface Flight<T> {
+  promise: Promise<T>;
+  controller: AbortController;
+  /** Callers still waiting that could abort; the flight is cancelled when the last of them does */
+  abortable: number;
+  /** Callers waiting that can never abort, which keep the flight alive */
+  pinned: number;
+}
+
+function abortReason(signal: AbortSignal): unknown {
+  return signal.reason ?? new Error('Aborted');
+}
+
+/**
+ * Collapse identical concurrent loads into one.
+ *
+ * The first `run` for a key starts `load`; every `run` for the same key while
+ * it is in flight waits on that one promise instead of starting another, and
+ * the key is forgotten as soon as it settles, so nothing is cached. The key
+ * must capture everything that can change the result, credentials included.
+ *
+ * A caller's `signal` only cancels that caller's wait. The load itself is
+ * aborted once every caller that could abort has, unless some caller without
+ * a signal is still waiting.
+ */
+export class SingleFlight<T> {
+  private readonly flights = new Map<string, Flight<T>>();
+  private calls = 0;
+  private shared = 0;
+
+  run(key: string, load: (signal: AbortSignal) => Promise<T>, signal?: AbortSignal): Promise<T> {
+    if (signal?.aborted === true) {
+      return Promise.reject(abortReason(signal));
+    }
+    this.calls += 1;
+
+    let flight = this.flights.get(key);
+    if (flight === undefined) {
+      const controller = new AbortController();
+      const started: Flight<T> = {
+        promise: (async (): Promise<T> => load(controller.signal))().finally(() => {
+          if (this.flights.get(key) === started) {
+            this.flights.delete(key);
+          }
+        }),
+        controller,
+        abortable: 0,
+        pinned: 0,
+      };
+      flight = started;
+      this.flights.set(key, flight);
+    } else {
+      this.shared += 1;
+    }
+
+    if (signal === undefined) {
+      flight.pinned += 1;
+      return flight.promise;
+    }
+    return this.wait(key, flight, signal);
+  }
+
+  /** Whether a `run` for `key` would join a load already in flight */
+  has(key: string): boolean {
+    return this.flights.has(key);
+  }
+
+  stats(): SingleFlightStats {
+    return {
+      calls: this.calls,
+      shared: this.shared,
+      dedupeRatio: this.calls === 0 ? 0 : this.shared / this.calls,
+    };
+  }
+
+  private wait(key: string, flight: Flight<T>, signal: AbortSignal): Promise<T> {
+    flight.abortable += 1;
+    return new Promise<T>((resolve, reject) => {
+      const onAbort = (): void => {
+        flight.abortable -= 1;
+        if (flight.abortable === 0 && flight.pinned === 0) {
+          // Nobody is left to use the response: cancel it and let the next caller start afresh
+          flight.controller.abort(signal.reason);
+          if (this.flights.get(key) === flight) {
+            this.flights.delete(key);
+          }
+        }
+        reject(abortReason(signal));
+      };
+      signal.addEventListener('abort', onAbort, { once: true });
+      flight.promise.then(
+        value => {
+          signal.removeEventListener('abort', onAbort);
+          resolve(value);
+        },
+        (error: unknown) => {
+          signal.removeEventListener('abort', onAbort);
+          reject(error);
+        }
+      );
+    });
+  }
+}
@@ -0,0 +1,23 @@
+export * from './admission/admission';
+export * from './admission/query-cost';
+export * from './admission/rate-limiter';
+export * from './appsync/batch';
+export * from './appsync/bulk';
+export * from './appsync/change-feed';
+export * from './appsync/selection';
+export * from './appsync/shape';
+export * from './cache/lru';
+export * from './cache/tenant-cache';
+export * from './http/circuit-breaker';
+export * from './http/hedging';
+export * from './http/pool';
+export * from './http/sigv4';
+export * from './http/single-flight';
+export * from './http/traffic';
+export * from './logging/logger';
+export * from './profiling/profiler';
+export * from './tracing/tracer';
+export * from './utils/concurrency';
+export * from './utils/deadline';
+export * from './utils/page-stream';
+export * from './utils/shard-scan';
@@ -0,0 +1,356 @@
+import { AsyncLocalStorage } from 'async_hooks';
+import diagnosticsChannel from 'diagnostics_channel';
+import type { ClientRequest, IncomingMessage } from 'http';
+import type { Socket } from 'net';
+import { performance } from 'perf_hooks';
+
+import type { InvocationTimer } from '../utils/deadline';
+
+export type SpanAttributes = Record<string, string | number | boolean>;
+
+/**
+ * One timed step of an invocation
+ */
+export interface Span {
+  name: string;
+  /** Milliseconds from the start of the invocation */
+  startMs: number;
+  durationMs: number;
+  /** Milestones within the span, in ms from its start (an HTTP call's dns, connect, tls, ttfb, body) */
+  phases?: Record<string, number>;
+  attributes?: SpanAttributes;
+  error?: true;
+}
+
+/**
+ * What one invocation spent its time on
+ */
+export interface TraceSummary {
+  fieldName: string;
+  coldStart: boolean;
+  totalMs: number;
+  /** Milliseconds per span name, summed (concurrent spans overlap) */
+  totals: Record<string, number>;
+  /** Spans per name */
+  counts: Record<string, number>;
+  spans: Span[];
+  /** Spans left out of `spans` once the trace held `maxSpans`; still counted in the totals */
+  dropped: number;
+}
+
+/**
+ * The Lambda context as the local AppSync stand-in passes it: with
+ * TRACING_EXTENSION on, each invocation's timing is handed to `reportTiming`
+ */
+export interface TimingReceiver extends InvocationTimer {
+  reportTiming?(timing: TraceSummary): void;
+}
+
+export interface TracingOptions {
+  /** Master switch; when false spans cost one AsyncLocalStorage lookup */
+  enabled: boolean;
+  /** Write one CloudWatch embedded metric format (EMF) line per invocation */
+  metrics: boolean;
+  /** Hand the trace to the caller through `TimingReceiver.reportTiming` */
+  extension: boolean;
+  /** CloudWatch namespace of the EMF metrics */
+  namespace: string;
+  /** Spans kept per invocation */
+  maxSpans: number;
+  /** Where EMF lines go; defaults to console.log, which Lambda ships to CloudWatch Logs */
+  write?: (line: string) => void;
+}
+
+/**
+ * Tracing settings from the environment:
+ *
+ *   TRACING_ENABLED     "true" records spans (default off)
+ *   TRACING_METRICS     "false" stops the EMF line per invocation
+ *   TRACING_EXTENSION   "true" reports each invocation's spans to the caller
+ *   TRACING_NAMESPACE   CloudWatch namespace (default SrNextBff)
+ *   TRACING_MAX_SPANS   spans kept per invocation (default 200)
+ */
+export function tracingOptionsFromEnv(): TracingOptions {
+  const maxSpans = Number(process.env['TRACING_MAX_SPANS']);
+  return {
+    enabled: process.env['TRACING_ENABLED'] === 'true',
+    metrics: process.env['TRACING_METRICS'] !== 'false',
+    extension: process.env['TRACING_EXTENSION'] === 'true',
+    namespace: process.env['TRACING_NAMESPACE'] || 'SrNextBff',
+    maxSpans: Number.isInteger(maxSpans) && maxSpans >= 0 ? maxSpans : 200,
+  };
+}
+
+const round = (ms: number): number => Math.round(ms * 100) / 100;
+
+class Trace {
+  readonly started = performance.now();
+  readonly spans: Span[] = [];
+  readonly totals: Record<string, number> = {};
+  readonly counts: Record<string, number> = {};
+  dropped = 0;
+
+  constructor(readonly fieldName: string, readonly coldStart: boolean, private readonly maxSpans: number) {}
+
+  /** Milliseconds since the invocation started */
+  now(): number {
+    return performance.now() - this.started;
+  }
+
+  open(name: string, attributes: SpanAttributes | undefined, startMs = this.now()): Span {
+    const span: Span = { name, startMs, durationMs: 0, ...(attributes !== undefined && { attributes: { ...attributes } }) };
+    if (this.spans.length < this.maxSpans) {
+      this.spans.push(span);
+    } else {
+      this.dropped += 1;
+    }
+    return span;
+  }
+
+  close(span: Span, failed: boolean, endMs = this.now()): void {
+    span.durationMs = round(endMs - span.startMs);
+    span.startMs = round(span.startMs);
+    if (failed) {
+      span.error = true;
+    }
+    this.totals[span.name] = round((this.totals[span.name] ?? 0) + span.durationMs);
+    this.counts[span.name] = (this.counts[span.name] ?? 0) + 1;
+  }
+
+  summary(): TraceSummary {
+    return {
+      fieldName: this.fieldName,
+      coldStart: this.coldStart,
+      totalMs: round(this.now()),
+      totals: this.totals,
+      counts: this.counts,
+      spans: this.spans,
+      dropped: this.dropped,
+    };
+  }
+}
+
+interface TraceScope {
+  trace: Trace;
+  span: Span | undefined;
+}
+
+const scopes = new AsyncLocalStorage<TraceScope>();
+let settings: TracingOptions | undefined;
+let invocations = 0;
+let observingHttp = false;
+
+function tracingSettings(): TracingOptions {
+  if (settings === undefined) {
+    settings = tracingOptionsFromEnv();
+  }
+  return settings;
+}
+
+/**
+ * Whether invocations are traced (TRACING_ENABLED)
+ */
+export function tracingEnabled(): boolean {
+  return tracingSettings().enabled;
+}
+
+/**
+ * Replace the tracing settings. Intended for tests and benchmarks; without
+ * options they are read from the environment again.
+ */
+export function configureTracing(options?: Partial<TracingOptions>): void {
+  settings = options === undefined ? undefined : { ...tracingOptionsFromEnv(), ...options };
+  invocations = 0;
+}
+
+/**
+ * Time `fn` as a span of the current invocation. Outside a traced invocation
+ * it just runs `fn`.
+ */
+export function span<T>(name: string, fn: () => Promise<T>, attributes?: SpanAttributes): Promise<T> {
+  const scope = scopes.getStore();
+  if (scope === undefined) {
+    return fn();
+  }
+  const { trace } = scope;
+  const record = trace.open(name, attributes);
+  return scopes.run({ trace, span: record }, async () => {
+    try {
+      const value = await fn();
+      trace.close(record, false);
+      return value;
+    } catch (error) {
+      trace.close(record, true);
+      throw error;
+    }
+  });
+}
+
+/**
+ * `span` for synchronous work, e.g. transforming a page of rows
+ */
+export function spanSync<T>(name: string, fn: () => T, attributes?: SpanAttributes): T {
+  const scope = scopes.getStore();
+  if (scope === undefined) {
+    return fn();
+  }
+  const { trace } = scope;
+  const record = trace.open(name, attributes);
+  let failed = true;
+  try {
+    const value = scopes.run({ trace, span: record }, fn);
+    failed = false;
+    return value;
+  } finally {
+    trace.close(record, failed);
+  }
+}
+
+/**
+ * Add attributes to the innermost open span, if any
+ */
+export function annotateSpan(attributes: SpanAttributes): void {
+  const current = scopes.getStore()?.span;
+  if (current !== undefined) {
+    current.attributes = { ...current.attributes, ...attributes };
+  }
+}
+
+/**
+ * Record a milestone of a span, e.g. an HTTP call's first byte
+ */
+function markPhase(scope: TraceScope, record: Span, phase: string): void {
+  record.phases = { ...record.phases, [phase]: round(scope.trace.now() - record.startMs) };
+}
+
+/**
+ * Time the network phases of every HTTP request made inside a span: DNS
+ * lookup, TCP connect and TLS handshake (only on a new socket), time to the
+ * response headers and to the end of the body. Node publishes each client
+ * request on a diagnostics channel synchronously, so the request's span is
+ * still the current one.
+ */
+function observeHttpPhases(): void {
+  if (observingHttp) {
+    return;
+  }
+  observingHttp = true;
+  diagnosticsChannel.subscribe('http.client.request.start', message => {
+    const scope = scopes.getStore();
+    const record = scope?.span;
+    if (scope === undefined || record === undefined) {
+      return;
+    }
+    const { request } = message as { request: ClientRequest };
+    const onSocket = (socket: Socket): void => {
+      if (!socket.connecting) {
+        record.attributes = { ...record.attributes, reusedSocket: true };
+        return;
+      }
+      socket.once('lookup', () => markPhase(scope, record, 'dns'));
+      socket.once('connect', () => markPhase(scope, record, 'connect'));
+      socket.once('secureConnect', () => markPhase(scope, record, 'tls'));
+    };
+    if (request.socket !== null) {
+      onSocket(request.socket);
+    } else {
+      request.once('socket', onSocket);
+    }
+    request.once('response', (response: IncomingMessage) => {
+      markPhase(scope, record, 'ttfb');
+      response.once('end', () => markPhase(scope, record, 'body'));
+    });
+  });
+}
+
+/**
+ * One CloudWatch embedded metric format document for an invocation: a
+ * `<span>Ms` metric per span name, `totalMs` and `httpCalls`, by function and
+ * GraphQL field, with the spans themselves as a searchable property
+ */
+export function toEmf(
+  timing: TraceSummary,
+  namespace: string,
+  functionName = process.env['AWS_LAMBDA_FUNCTION_NAME'] ?? 'local',
+): Record<string, unknown> {
+  const metrics: Record<string, number> = { totalMs: timing.totalMs, httpCalls: timing.counts['http'] ?? 0 };
+  for (const [name, ms] of Object.entries(timing.totals)) {
+    metrics[`${name}Ms`] = ms;
+  }
+  return {
+    _aws: {
+      Timestamp: Date.now(),
+      CloudWatchMetrics: [
+        {
+          Namespace: namespace,
+          Dimensions: [['FunctionName', 'FieldName']],
+          Metrics: Object.keys(metrics).map(name => ({ Name: name, Unit: name.endsWith('Ms') ? 'Milliseconds' : 'Count' })),
+        },
+      ],
+    },
+    FunctionName: functionName,
+    FieldName: timing.fieldName,
+    coldStart: timing.coldStart,
+    ...metrics,
+    spans: timing.spans,
+    droppedSpans: timing.dropped,
+  };
+}
+
+function fieldNameOf(event: unknown): string {
+  const first = (Array.isArray(event) ? event[0] : event) as { info?: { fieldName?: string } } | undefined;
+  return first?.info?.fieldName ?? 'unknown';
+}
+
+function report(trace: Trace, options: TracingOptions, timer: TimingReceiver | undefined): void {
+  const timing = trace.summary();
+  if (options.metrics) {
+    const line = JSON.stringify(toEmf(timing, options.namespace));
+    if (options.write !== undefined) {
+      options.write(line);
+    } else {
+      console.log(line);
+    }
+  }
+  if (options.extension) {
+    timer?.reportTiming?.(timing);
+  }
+}
+
+/**
+ * Wrap a Lambda handler so each invocation is traced: a `handler` span around
+ * it, an `init` span on a container's first invocation (from the runtime's
+ * start until then, i.e. runtime boot and module init), a `serialize` span
+ * for the JSON encoding of the result, and whatever spans the resolver, its
+ * services and the HTTP pool open. The trace is written as an EMF line and,
+ * with TRACING_EXTENSION, handed to `context.reportTiming` when the caller
+ * provides it (the local AppSync stand-in returns it as `extensions.timing`).
+ *
+ * Disabled, the wrapper only checks a flag.
+ */
+export function withTracing<E, R>(
+  handle: (event: E, timer?: InvocationTimer) => Promise<R>,
+): (event: E, timer?: InvocationTimer) => Promise<R> {
+  return (event, timer) => {
+    const options = tracingSettings();
+    if (!options.enabled) {
+      return handle(event, timer);
+    }
+    observeHttpPhases();
+    const coldStart = invocations === 0;
+    invocations += 1;
+    const trace = new Trace(fieldNameOf(event), coldStart, options.maxSpans);
+    if (coldStart) {
+      trace.close(trace.open('init', undefined, -performance.now()), false, 0);
+    }
+    return scopes.run({ trace, span: undefined }, async () => {
+      try {
+        const result = await span('handler', () => handle(event, timer), { batch: Array.isArray(event) });
+        spanSync('serialize', () => annotateSpan({ bytes: Buffer.byteLength(JSON.stringify(result) ?? '') }));
+        return result;
+      } finally {
+        report(trace, options, timer as TimingReceiver | undefined);
+      }
+    });
+  };
+}
@@ -0,0 +1,55 @@
+import { AsyncLocalStorage } from 'async_hooks';
+
+import { envInt } from './concurrency';
+
+/**
+ * The part of a Lambda context that carries the invocation's time budget
+ */
+export interface InvocationTimer {
+  getRemainingTimeInMillis(): number;
+}
+
+const deadlines = new AsyncLocalStorage<number>();
+
+/**
+ * Run `fn` with the invocation's deadline in scope, so every backend call it
+ * makes is cut off before Lambda kills the invocation. DEADLINE_RESERVE_MS
+ * (default 250) is kept back for answering AppSync with an error of our own
+ * instead of a generic timeout. Without a timer `fn` runs unbounded; nested
+ * scopes can only shorten the deadline.
+ */
+export function runWithDeadline<T>(timer: InvocationTimer | undefined, fn: () => T): T {
+  if (typeof timer?.getRemainingTimeInMillis !== 'function') {
+    return fn();
+  }
+  const deadline = Date.now() + timer.getRemainingTimeInMillis() - envInt('DEADLINE_RESERVE_MS', 250);
+  const outer = deadlines.getStore();
+  return deadlines.run(outer === undefined ? deadline : Math.min(outer, deadline), fn);
+}
+
+/**
+ * Wrap a Lambda handler so its invocation runs under `runWithDeadline`
+ */
+export function withDeadline<E, R>(
+  handle: (event: E, timer?: InvocationTimer) => Promise<R>,
+): (event: E, timer?: InvocationTimer) => Promise<R> {
+  return (event, timer) => runWithDeadline(timer, () => handle(event, timer));
+}
+
+/**
+ * Milliseconds left before the current invocation's deadline (negative once
+ * it has passed), or undefined outside `runWithDeadline`
+ */
+export function remainingTimeMs(): number | undefined {
+  const deadline = deadlines.getStore();
+  return deadline === undefined ? undefined : deadline - Date.now();
+}
+
+/**
+ * Run `fn` outside any invocation's deadline, for background work that may
+ * outlive the invocation that started it (it is then bounded only by the HTTP
+ * pool's request timeout)
+ */
+export function outsideDeadline<T>(fn: () => T): T {
+  return deadlines.exit(fn);
+}
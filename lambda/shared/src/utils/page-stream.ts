@@ -0,0 +1,121 @@
+/**
+ * One page of a cursor-paginated backend list
+ */
+export interface Page<T> {
+  items: T[];
+  /** Cursor for the following page; absent, null or empty on the last page */
+  nextCursor?: string | null | undefined;
+}
+
+/**
+ * Fetch the page after `cursor` (undefined for the first page). `signal` is
+ * aborted when the consumer stops early, so an in-flight prefetch can be
+ * cancelled.
+ */
+export type PageFetcher<T> = (cursor: string | undefined, signal: AbortSignal) => Promise<Page<T>>;
+
+export interface PageStreamOptions {
+  /** Pages requested ahead of the one the consumer is working on (default 1, 0 disables prefetch) */
+  prefetch?: number;
+  /** Stop after this many pages even if the backend has more */
+  maxPages?: number;
+}
+
+/**
+ * Stream a cursor-paginated list page by page.
+ *
+ * While the consumer works on one page the next `prefetch` pages are already
+ * being fetched, so paging latency overlaps with the consumer's own work. At
+ * most `prefetch + 1` pages are held at any time. Breaking out of the loop
+ * stops paging and aborts any request still in flight.
+ *
+ *   for await (const units of streamPages((cursor, signal) => fetchUnitPage(accountId, cursor, signal))) {
+ *     ...
+ *   }
+ */
+export async function* streamPages<T>(fetchPage: PageFetcher<T>, options: PageStreamOptions = {}): AsyncGenerator<T[], void, undefined> {
+  const prefetch = Math.max(0, options.prefetch ?? 1);
+  const maxPages = options.maxPages ?? Number.POSITIVE_INFINITY;
+  const controller = new AbortController();
+  const queue: Array<Promise<Page<T> | undefined>> = [];
+  let last: Promise<Page<T> | undefined> | undefined;
+  let scheduled = 0;
+  let ended = false;
+
+  // Each request waits for the previous page's cursor; a request scheduled
+  // after the last page resolves to undefined without calling the backend
+  const schedule = (): void => {
+    const previous = last;
+    const request =
+      previous === undefined
+        ? fetchPage(undefined, controller.signal)
+        : previous.then(page => {
+            const cursor = page?.nextCursor;
+            return cursor === undefined || cursor === null || cursor === '' || controller.signal.aborted
+              ? undefined
+              : fetchPage(cursor, controller.signal);
+          });
+    // Buffered requests may fail before the consumer reaches them; the error
+    // is rethrown when it does
+    request.catch(() => undefined);
+    last = request;
+    queue.push(request);
+    scheduled += 1;
+  };
+
+  // Keep `prefetch` requests queued behind the page being handed over
+  const fill = (): void => {
+    while (!ended && queue.length < prefetch && scheduled < maxPages) {
+      schedule();
+    }
+  };
+
+  try {
+    for (;;) {
+      if (queue.length === 0) {
+        if (ended || scheduled >= maxPages) {
+          return;
+        }
+        schedule();
+      }
+      const page = await queue.shift();
+      if (page === undefined) {
+        return;
+      }
+      if (page.nextCursor === undefined || page.nextCursor === null || page.nextCursor === '') {
+        ended = true;
+      }
+      // Request the following pages before handing this one over
+      fill();
+      yield page.items;
+    }
+  } finally {
+    controller.abort();
+  }
+}
+
+/**
+ * `streamPages` flattened to individual items
+ */
+export async function* streamItems<T>(fetchPage: PageFetcher<T>, options: PageStreamOptions = {}): AsyncGenerator<T, void, undefined> {
+  for await (const items of streamPages(fetchPage, options)) {
+    yield* items;
+  }
+}
+
+/**
+ * Drain a stream into an array, stopping early once `limit` items are collected
+ */
+export async function collect<T>(stream: AsyncIterable<T>, limit = Number.POSITIVE_INFINITY): Promise<T[]> {
+  const items: T[] = [];
+  if (limit <= 0) {
+    return items;
+  }
+  for await (const item of stream) {
+    items.push(item);
+    if (items.length >= limit) {
+      break;
+    }
+  }
+  return items;
+}
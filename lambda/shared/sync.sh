@@ -0,0 +1,42 @@
+#!/bin/bash
+# Copy the shared runtime sources into every resolver lambda's src/shared/.
+# Each lambda is built and deployed on its own, so the copies are committed;
+# edit the sources here and re-run this script instead of editing the copies.
+#
+#   ./sync.sh          refresh the copies
+#   ./sync.sh --check  fail if any copy is out of date
+set -e
+
+cd "$(dirname "$0")"
+
+LAMBDAS="account contact event gateway laborline location part task unit workorder"
+HEADER="// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy."
+
+render() {
+  local target="$1"
+  rm -rf "$target"
+  mkdir -p "$target"
+  (cd src && find . -name '*.ts' ! -path './__tests__/*' ! -name '*.test.ts') | while read -r file; do
+    mkdir -p "$target/$(dirname "$file")"
+    { echo "$HEADER"; cat "src/$file"; } > "$target/$file"
+  done
+}
+
+if [ "$1" = "--check" ]; then
+  scratch="$(mktemp -d)"
+  trap 'rm -rf "$scratch"' EXIT
+  render "$scratch/shared"
+  status=0
+  for fn in $LAMBDAS; do
+    if ! diff -r "$scratch/shared" "../$fn/src/shared" > /dev/null 2>&1; then
+      echo "lambda/$fn/src/shared is out of date; run lambda/shared/sync.sh"
+      status=1
+    fi
+  done
+  exit $status
+fi
+
+for fn in $LAMBDAS; do
+  render "../$fn/src/shared"
+done
+echo "Synced shared sources into: $LAMBDAS"
@@ -15,11 +15,13 @@ import {
   GraphQLTaskListResponse,
 } from '../types';
 import { TasksApiService } from '../services/tasks-api';
+import { changeOf, getTenantCache, logger, publishChanges, spanSync } from '../shared';
 
 export class TaskResolver {
   private readonly tasksApiService: TasksApiService;
   private readonly jwtToken: string | undefined;
   private readonly jwtAccountId: string | undefined;
+  private readonly cache = getTenantCache();
 
   constructor(event: AppSyncEvent) {
     const apiUrl = process.env['TASKS_API_URL'] ?? 'https://srnext-tasks.sb.fullbay.com';
@@ -147,7 +149,7 @@ export class TaskResolver {
 
   async resolve(event: AppSyncEvent): Promise<unknown> {
     const fieldName = event.info.fieldName;
-    console.log(`Resolving ${fieldName}`, JSON.stringify(event.arguments, null, 2));
+    logger.debug('Resolving field', () => ({ arguments: event.arguments }));
 
     try {
       switch (fieldName) {
@@ -165,7 +167,7 @@ export class TaskResolver {
           throw new Error(`Unknown field: ${fieldName}`);
       }
     } catch (error) {
-      console.error(`Error in ${fieldName}:`, error);
+      logger.error('Resolver failed', { error });
       throw error;
     }
   }
@@ -175,7 +177,9 @@ export class TaskResolver {
     
     this.validateAccountAccess(accountId);
     
-    const task = await this.tasksApiService.getTask(accountId, taskId, this.jwtToken);
+    const task = await this.cache.getOrLoad(accountId, 'task', taskId, () =>
+      this.tasksApiService.getTask(accountId, taskId, this.jwtToken)
+    );
     return this.taskToGraphQL(task);
   }
 
@@ -195,10 +199,13 @@ export class TaskResolver {
       taskId,
     };
     
-    console.log('Creating task with input:', JSON.stringify(taskInput, null, 2));
+    logger.debug('Creating task', () => ({ input: taskInput }));
     
     const task = await this.tasksApiService.createTask(accountId, taskInput, this.jwtToken);
-    return this.taskToGraphQL(task);
+    await this.cache.invalidate(accountId, 'task');
+    const created = this.taskToGraphQL(task);
+    await publishChanges([changeOf('Task', 'CREATED', accountId, created.taskId, created)]);
+    return created;
   }
 
   private async updateTask(event: AppSyncEvent<UpdateTaskArguments>): Promise<GraphQLTask> {
@@ -208,10 +215,13 @@ export class TaskResolver {
     
     const updateInput = this.transformGraphQLUpdateInputToTask(input);
     
-    console.log('Updating task with input:', JSON.stringify(updateInput, null, 2));
+    logger.debug('Updating task', () => ({ input: updateInput }));
     
     const task = await this.tasksApiService.updateTask(accountId, taskId, updateInput, this.jwtToken);
-    return this.taskToGraphQL(task);
+    await this.cache.invalidate(accountId, 'task');
+    const updated = this.taskToGraphQL(task);
+    await publishChanges([changeOf('Task', 'UPDATED', accountId, taskId, updated, Object.keys(input))]);
+    return updated;
   }
 
   private async deleteTask(event: AppSyncEvent<DeleteTaskArguments>): Promise<boolean> {
@@ -220,6 +230,10 @@ export class TaskResolver {
     this.validateAccountAccess(accountId);
     
     const success = await this.tasksApiService.deleteTask(accountId, taskId, this.jwtToken);
+    await this.cache.invalidate(accountId, 'task');
+    if (success) {
+      await publishChanges([changeOf('Task', 'DELETED', accountId, taskId)]);
+    }
     return success;
   }
 
@@ -234,22 +248,32 @@ export class TaskResolver {
     
     if (cursor !== undefined) { options.cursor = cursor; }
     
-    const response = await this.tasksApiService.listTasks(
-      accountId,
-      options,
-      this.jwtToken
+    const response = await this.cache.getOrLoad(accountId, 'task', { list: options }, () =>
+      this.tasksApiService.listTasks(accountId, options, this.jwtToken)
     );
     
     const result: GraphQLTaskListResponse = {
-      items: response.items.map(task => this.taskToGraphQL(task)),
+      items: spanSync('transform', () => response.items.map(task => this.taskToGraphQL(task)), {
+        rows: response.items.length,
+      }),
       limit: response.limit,
       count: response.count,
     };
     
     if (response.nextCursor !== null && response.nextCursor !== undefined) {
       result.nextCursor = response.nextCursor;
+      this.prefetchNextPage(accountId, { ...options, cursor: response.nextCursor });
     }
     
     return result;
   }
+
+  /**
+   * Clients usually ask for the next page right away; load it in the background
+   */
+  private prefetchNextPage(accountId: string, options: { limit?: number; cursor?: string }): void {
+    this.cache.prefetch(accountId, 'task', { list: options }, () =>
+      this.tasksApiService.listTasks(accountId, options, this.jwtToken)
+    );
+  }
 }
\ No newline at end of file
@@ -1,16 +1,27 @@
 import { AppSyncEvent } from './types';
 import { TaskResolver } from './handlers/task-resolver';
+import { logger, resolveBatch, spanSync, withCompactResponses, withDeadline, withProfiling, withTracing } from './shared';
 
-export const handler = async (event: AppSyncEvent): Promise<unknown> => {
-  console.log('Received event:', JSON.stringify(event, null, 2));
-  
-  try {
-    const resolver = new TaskResolver(event);
-    const result = await resolver.resolve(event);
-    console.log('Returning result:', JSON.stringify(result, null, 2));
-    return result;
-  } catch (error) {
-    console.error('Error in task resolver:', error);
-    throw error;
+export const handler = withDeadline(withProfiling(withTracing(withCompactResponses(async (event: AppSyncEvent | AppSyncEvent[]): Promise<unknown> => {
+  if (Array.isArray(event)) {
+    // BatchInvoke: one result per item, in order, with per-item errors
+    logger.info('Received batch', { size: event.length });
+    return resolveBatch(event, {}, item =>
+      logger.runWithField(item.info.fieldName, () => spanSync('auth', () => new TaskResolver(item)).resolve(item)),
+    );
   }
-};
\ No newline at end of file
+
+  return logger.runWithField(event.info.fieldName, async () => {
+    logger.debug('Received event', () => ({ event }));
+
+    try {
+      const resolver = spanSync('auth', () => new TaskResolver(event));
+      const result = await resolver.resolve(event);
+      logger.debug('Returning result', () => ({ result }));
+      return result;
+    } catch (error) {
+      logger.error('Error in task resolver', { error });
+      throw error;
+    }
+  });
+}))));
@@ -6,18 +6,13 @@ import {
   PaginatedTaskResponse,
   ErrorResponse 
 } from '../types';
+import { PageStreamOptions, getPooledClient, logger, streamPages, withAuth } from '../shared';
 
 export class TasksApiService {
   private readonly client: AxiosInstance;
 
   constructor(apiUrl: string) {
-    this.client = axios.create({
-      baseURL: apiUrl,
-      timeout: 30000,
-      headers: {
-        'Content-Type': 'application/json',
-      },
-    });
+    this.client = getPooledClient(apiUrl);
   }
 
   private handleApiError(error: unknown): never {
@@ -26,10 +21,10 @@ export class TasksApiService {
       const errorMessage = axiosError.response?.data?.message ?? axiosError.message;
       const statusCode = axiosError.response?.status ?? 500;
       
-      console.error('API Error:', {
+      logger.error('API response error', {
         status: statusCode,
         message: errorMessage,
-        data: JSON.stringify(axiosError.response?.data, null, 2),
+        data: axiosError.response?.data,
         url: axiosError.config?.url,
         method: axiosError.config?.method,
         requestData: axiosError.config?.data,
@@ -44,9 +39,7 @@ export class TasksApiService {
     try {
       const response = await this.client.get<Task>(
         `/tasks/${accountId}/${taskId}`,
-        {
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken)
       );
       return response.data;
     } catch (error) {
@@ -59,9 +52,7 @@ export class TasksApiService {
       const response = await this.client.post<Task>(
         `/tasks/${accountId}`,
         task,
-        {
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken)
       );
       return response.data;
     } catch (error) {
@@ -74,9 +65,7 @@ export class TasksApiService {
       const response = await this.client.put<Task>(
         `/tasks/${accountId}/${taskId}`,
         updates,
-        {
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken)
       );
       return response.data;
     } catch (error) {
@@ -88,9 +77,7 @@ export class TasksApiService {
     try {
       await this.client.delete(
         `/tasks/${accountId}/${taskId}`,
-        {
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken)
       );
       return true;
     } catch (error) {
@@ -114,14 +101,26 @@ export class TasksApiService {
 
       const response = await this.client.get<PaginatedTaskResponse>(
         `/tasks/${accountId}`,
-        {
-          params,
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken, { params })
       );
       return response.data;
     } catch (error) {
       this.handleApiError(error);
     }
   }
+
+  /**
+   * Stream all of an account's tasks page by page, prefetching the next page
+   */
+  streamTasks(
+    accountId: string,
+    limit = 100,
+    authToken?: string,
+    options?: PageStreamOptions
+  ): AsyncGenerator<Task[], void, undefined> {
+    return streamPages(
+      cursor => this.listTasks(accountId, { limit, ...(cursor !== undefined && { cursor }) }, authToken),
+      options
+    );
+  }
 }
\ No newline at end of file
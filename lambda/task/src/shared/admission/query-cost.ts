@@ -0,0 +1,106 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { Selection, SelectionSource } from '../appsync/selection';
+
+/**
+ * What resolving a field costs, in units of roughly one backend request.
+ * A field without an entry costs 1.
+ */
+export interface FieldCost {
+  /** Cost of resolving the field once (default 1) */
+  base?: number;
+  /** Name of the page-size argument, for fields that return a page */
+  limitArg?: string;
+  /** Page size the resolver uses when the argument is missing */
+  defaultLimit?: number;
+  /** Largest page size; a larger argument is lowered to it before resolving */
+  maxLimit?: number;
+  /** Cost of each row of a page, for fields that fan out per row */
+  perItem?: number;
+  /** Selection paths that make the rows fan out; perItem applies to every page when absent */
+  perItemWhen?: string[];
+  /** Resolved once for a whole BatchInvoke, so a batch of it costs `base` once */
+  batched?: boolean;
+  /**
+   * Backend requests one resolution with these arguments can have in flight
+   * at once, e.g. the shards a scanned page reads ahead; the cost is
+   * multiplied by it (default 1)
+   */
+  fanOut?: (args: Record<string, unknown>) => number;
+}
+
+export type FieldCosts = Readonly<Record<string, FieldCost>>;
+
+/**
+ * Minimal event shape the cost of a field is read from
+ */
+export interface CostedEvent extends SelectionSource {
+  arguments?: Record<string, unknown> | null;
+  info?: SelectionSource['info'] & { fieldName: string };
+}
+
+/**
+ * The page size a field is resolved with: its limit argument, or the
+ * default, lowered to maxLimit
+ */
+export function effectiveLimit(cost: FieldCost, args: Record<string, unknown> | null | undefined): number {
+  const requested = cost.limitArg === undefined ? undefined : args?.[cost.limitArg];
+  const limit = typeof requested === 'number' && requested >= 0 ? requested : (cost.defaultLimit ?? 0);
+  return cost.maxLimit === undefined ? limit : Math.min(limit, cost.maxLimit);
+}
+
+/**
+ * The cost of one event: its base plus, for a field that fans out and whose
+ * fan-out was selected, its perItem cost for every row of the page, times
+ * the requests it can have in flight at once.
+ */
+export function eventCost(costs: FieldCosts, event: CostedEvent): number {
+  const cost = costs[event.info?.fieldName ?? ''];
+  if (cost === undefined) {
+    return 1;
+  }
+  const base = cost.base ?? 1;
+  const fansOut =
+    cost.perItem !== undefined &&
+    (cost.perItemWhen === undefined || Selection.fromEvent(event).hasAny(...cost.perItemWhen));
+  const single = fansOut ? base + (cost.perItem ?? 0) * effectiveLimit(cost, event.arguments) : base;
+  return cost.fanOut === undefined ? single : single * Math.max(1, cost.fanOut(event.arguments ?? {}));
+}
+
+/**
+ * The cost of an invocation: one event's cost, or a BatchInvoke's sum, with
+ * each batched field counted once
+ */
+export function invocationCost(costs: FieldCosts, event: CostedEvent | CostedEvent[]): number {
+  if (!Array.isArray(event)) {
+    return eventCost(costs, event);
+  }
+  const batchedFields = new Set<string>();
+  let total = 0;
+  for (const item of event) {
+    const fieldName = item.info?.fieldName ?? '';
+    if (costs[fieldName]?.batched === true) {
+      if (batchedFields.has(fieldName)) {
+        continue;
+      }
+      batchedFields.add(fieldName);
+    }
+    total += eventCost(costs, item);
+  }
+  return total;
+}
+
+/**
+ * Lower an event's limit argument to its field's maxLimit. Returns the event
+ * itself when nothing changed, otherwise a copy with new arguments.
+ */
+export function capLimit<E extends CostedEvent>(costs: FieldCosts, event: E): E {
+  const cost = costs[event.info?.fieldName ?? ''];
+  if (cost?.limitArg === undefined || cost.maxLimit === undefined) {
+    return event;
+  }
+  const requested = event.arguments?.[cost.limitArg];
+  if (typeof requested !== 'number' || requested <= cost.maxLimit) {
+    return event;
+  }
+  return { ...event, arguments: { ...event.arguments, [cost.limitArg]: cost.maxLimit } };
+}
@@ -0,0 +1,164 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { getPooledClient } from '../http/pool';
+import { logger } from '../logging/logger';
+
+/**
+ * Size and refill rate of one account's token bucket, in cost units (see
+ * query-cost)
+ */
+export interface BucketSpec {
+  /** Cost an account can spend in a burst */
+  capacity: number;
+  /** Cost units an account regains per second */
+  refillPerSecond: number;
+}
+
+export interface BucketState {
+  tokens: number;
+  updatedAt: number;
+}
+
+/**
+ * The outcome of taking from a bucket: whether the request may run, the
+ * budget left after it (or, refused, before it) and, refused, how long until
+ * the bucket holds `cost` again
+ */
+export interface TakeResult {
+  allowed: boolean;
+  remaining: number;
+  retryInMs: number;
+}
+
+/**
+ * Refill a bucket for the time since it was last touched, then take `cost`
+ * from it if it holds that much. A missing bucket starts full. A cost larger
+ * than the capacity is never allowed. Every store applies this same step, so
+ * a shared store only has to run it atomically per key.
+ */
+export function takeTokens(
+  state: BucketState | undefined,
+  cost: number,
+  spec: BucketSpec,
+  now: number,
+): { state: BucketState; result: TakeResult } {
+  const elapsedMs = state === undefined ? 0 : Math.max(0, now - state.updatedAt);
+  const tokens = Math.min(spec.capacity, (state?.tokens ?? spec.capacity) + (elapsedMs * spec.refillPerSecond) / 1000);
+  if (cost <= tokens) {
+    return { state: { tokens: tokens - cost, updatedAt: now }, result: { allowed: true, remaining: tokens - cost, retryInMs: 0 } };
+  }
+  const retryInMs =
+    cost > spec.capacity || spec.refillPerSecond <= 0
+      ? Number.POSITIVE_INFINITY
+      : Math.ceil(((cost - tokens) * 1000) / spec.refillPerSecond);
+  return { state: { tokens, updatedAt: now }, result: { allowed: false, remaining: tokens, retryInMs } };
+}
+
+/**
+ * Where the buckets live. The default is the container's own memory, which
+ * limits what one container serves an account; a store shared by every
+ * container makes the limit hold for the whole function. A shared store must
+ * apply takeTokens atomically per key.
+ */
+export interface RateLimitStore {
+  take(key: string, cost: number, spec: BucketSpec): Promise<TakeResult>;
+}
+
+/**
+ * Buckets in this process. Also the stand-in for a shared store in tests and
+ * local runs: share one instance between limiters to simulate several
+ * containers. Buckets idle long enough to be full again are dropped once
+ * there are more than `maxKeys`, since a full bucket is the same as none.
+ */
+export class MemoryRateLimitStore implements RateLimitStore {
+  private readonly buckets = new Map<string, { state: BucketState; spec: BucketSpec }>();
+
+  constructor(
+    private readonly maxKeys = 10_000,
+    private readonly now: () => number = Date.now,
+  ) {}
+
+  async take(key: string, cost: number, spec: BucketSpec): Promise<TakeResult> {
+    const now = this.now();
+    const { state, result } = takeTokens(this.buckets.get(key)?.state, cost, spec, now);
+    // Re-inserted so the map's order is least recently used first
+    this.buckets.delete(key);
+    this.buckets.set(key, { state, spec });
+    if (this.buckets.size > this.maxKeys) {
+      this.prune(now);
+    }
+    return result;
+  }
+
+  get size(): number {
+    return this.buckets.size;
+  }
+
+  private prune(now: number): void {
+    for (const [key, { state, spec }] of this.buckets) {
+      if (this.buckets.size <= this.maxKeys) {
+        return;
+      }
+      if (takeTokens(state, 0, spec, now).state.tokens >= spec.capacity) {
+        this.buckets.delete(key);
+      }
+    }
+  }
+}
+
+type StoreAnswer = Omit<TakeResult, 'retryInMs'> & { retryInMs?: number | null };
+
+/**
+ * Buckets kept by a rate-limit service over HTTP: POST {key, cost, capacity,
+ * refillPerSecond} answers a TakeResult, with a null retryInMs for a cost
+ * that never fits. perf/rate_limit.py serves a local stand-in, so limits
+ * across several containers can be tried offline.
+ */
+export class HttpRateLimitStore implements RateLimitStore {
+  private readonly url: URL;
+
+  constructor(
+    endpoint: string,
+    private readonly timeoutMs: number,
+  ) {
+    this.url = new URL(endpoint);
+  }
+
+  async take(key: string, cost: number, spec: BucketSpec): Promise<TakeResult> {
+    const response = await getPooledClient(this.url.origin).post<StoreAnswer>(
+      this.url.pathname,
+      { key, cost, ...spec },
+      { timeout: this.timeoutMs },
+    );
+    const { allowed, remaining, retryInMs } = response.data;
+    return {
+      allowed: allowed === true,
+      remaining: Number(remaining),
+      retryInMs: retryInMs === null ? Number.POSITIVE_INFINITY : Number(retryInMs ?? 0),
+    };
+  }
+}
+
+/**
+ * Per-account admission: one token bucket per account in `store`. A store
+ * that fails fails open, so a rate-limit outage never takes the API down
+ * with it; the failure is logged and the request admitted.
+ */
+export class RateLimiter {
+  constructor(
+    private readonly spec: BucketSpec,
+    private readonly store: RateLimitStore = new MemoryRateLimitStore(),
+  ) {}
+
+  get capacity(): number {
+    return this.spec.capacity;
+  }
+
+  async take(accountId: string, cost: number): Promise<TakeResult> {
+    try {
+      return await this.store.take(`account:${accountId}`, cost, this.spec);
+    } catch (error) {
+      logger.warn('Rate limit store failed; admitting the request', { accountId, cost, error });
+      return { allowed: true, remaining: this.spec.capacity, retryInMs: 0 };
+    }
+  }
+}
@@ -0,0 +1,234 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { getPooledClient } from '../http/pool';
+import { AwsCredentials, credentialsFromEnv, sha256, signRequest } from '../http/sigv4';
+import { logger } from '../logging/logger';
+import { span } from '../tracing/tracer';
+import { compact } from './shape';
+
+export type ChangeEntity = 'WorkOrder' | 'Event' | 'Task';
+
+export type ChangeOperation = 'CREATED' | 'UPDATED' | 'DELETED';
+
+/**
+ * One row of a change-feed subscription (the GraphQL `Change` type). Clients
+ * apply it to the list they loaded instead of polling the list again.
+ */
+export interface Change {
+  entity: ChangeEntity;
+  operation: ChangeOperation;
+  accountId: string;
+  id: string;
+  /** Filter keys, copied from the record so subscriptions can match on them */
+  unitId?: string;
+  workOrderId?: string;
+  status?: string;
+  /** The update set the status, so the row may have left a status-filtered list */
+  statusChanged: boolean;
+  /** GraphQL fields, compacted: the whole record when created, the changed fields when updated */
+  changes?: Record<string, unknown>;
+  /** AWSTimestamp (epoch seconds) */
+  changedAt: number;
+}
+
+function stringField(record: Record<string, unknown>, field: string): string | undefined {
+  const value = record[field];
+  return typeof value === 'string' && value !== '' ? value : undefined;
+}
+
+/**
+ * The change a mutation made to one record. `record` is what the mutation
+ * returned (GraphQL shape); for an update, `changedFields` are the input's
+ * fields, and only those go into `changes`.
+ */
+export function changeOf(
+  entity: ChangeEntity,
+  operation: ChangeOperation,
+  accountId: string,
+  id: string,
+  record?: object | null,
+  changedFields?: readonly string[],
+): Change {
+  const change: Change = {
+    entity,
+    operation,
+    accountId,
+    id,
+    statusChanged: operation === 'UPDATED' && changedFields !== undefined && changedFields.includes('status'),
+    changedAt: Math.floor(Date.now() / 1000),
+  };
+  if (record === undefined || record === null || operation === 'DELETED') {
+    return change;
+  }
+  const fields = record as Record<string, unknown>;
+  const unitId = stringField(fields, 'unitId');
+  const workOrderId = stringField(fields, 'workOrderId');
+  const status = stringField(fields, 'status');
+  if (unitId !== undefined) {
+    change.unitId = unitId;
+  }
+  if (workOrderId !== undefined) {
+    change.workOrderId = workOrderId;
+  }
+  if (status !== undefined) {
+    change.status = status;
+  }
+  if (operation === 'CREATED' || changedFields === undefined) {
+    change.changes = compact({ ...fields });
+  } else {
+    const changed: Record<string, unknown> = {};
+    for (const field of changedFields) {
+      if (field in fields) {
+        changed[field] = fields[field];
+      }
+    }
+    change.changes = compact(changed);
+  }
+  return change;
+}
+
+/**
+ * Where changes are published. The default posts them to the AppSync API's
+ * `publishChange` mutation, which fans them out to subscribers.
+ */
+export interface ChangeSink {
+  publish(changes: readonly Change[]): Promise<void>;
+}
+
+/**
+ * Signature Version 4 headers for a POST of `body` to an AppSync endpoint,
+ * as the API's AWS_IAM auth mode expects
+ */
+export function signAppSyncRequest(
+  url: URL,
+  body: string,
+  region: string,
+  credentials: AwsCredentials,
+  now: Date = new Date(),
+): Record<string, string> {
+  const headers = { 'content-type': 'application/json' };
+  const request = { method: 'POST', url, headers, payloadHash: sha256(body), service: 'appsync', region };
+  return signRequest(request, credentials, now);
+}
+
+const CHANGE_FIELDS = 'entity operation accountId id unitId workOrderId status statusChanged changes changedAt';
+
+/**
+ * The GraphQL request publishing `changes`: one aliased `publishChange` per
+ * change, so a bulk mutation's changes go out in one request. Every field is
+ * selected because subscribers only receive what the mutation selected.
+ */
+export function publishRequest(changes: readonly Change[]): { query: string; variables: Record<string, unknown> } {
+  const variables: Record<string, unknown> = {};
+  const declarations: string[] = [];
+  const fields: string[] = [];
+  changes.forEach((change, index) => {
+    declarations.push(`$c${index}: ChangeInput!`);
+    fields.push(`c${index}: publishChange(change: $c${index}) { ${CHANGE_FIELDS} }`);
+    const { changes: changed, ...rest } = change;
+    // AWSJSON arguments travel as strings
+    variables[`c${index}`] = changed === undefined ? rest : { ...rest, changes: JSON.stringify(changed) };
+  });
+  return { query: `mutation PublishChanges(${declarations.join(', ')}) { ${fields.join(' ')} }`, variables };
+}
+
+/**
+ * Posts changes to an AppSync GraphQL endpoint, signed with the function's
+ * role when it is an https endpoint (a plain http URL is a local stand-in
+ * and gets no signature)
+ */
+export class AppSyncChangeSink implements ChangeSink {
+  private readonly url: URL;
+
+  constructor(
+    endpoint: string,
+    private readonly region: string,
+  ) {
+    this.url = new URL(endpoint);
+  }
+
+  async publish(changes: readonly Change[]): Promise<void> {
+    const body = JSON.stringify(publishRequest(changes));
+    const credentials = this.url.protocol === 'https:' ? credentialsFromEnv() : undefined;
+    const headers =
+      credentials === undefined
+        ? { 'content-type': 'application/json' }
+        : signAppSyncRequest(this.url, body, this.region, credentials);
+    const response = await getPooledClient(this.url.origin).post<{ errors?: Array<{ message?: string }> }>(
+      this.url.pathname,
+      body,
+      { headers },
+    );
+    const error = response.data?.errors?.[0];
+    if (error !== undefined) {
+      throw new Error(`publishChange failed: ${error.message ?? 'unknown error'}`);
+    }
+  }
+}
+
+export interface ChangeFeedOptions {
+  /** Where changes go; none turns the feed off */
+  sink?: ChangeSink;
+  /** How long a mutation waits for its changes to be published */
+  timeoutMs: number;
+}
+
+/**
+ * Change feed settings from the environment:
+ *
+ *   CHANGE_FEED_URL          AppSync GraphQL endpoint changes are published
+ *                            to (unset: no change feed)
+ *   CHANGE_FEED_ENABLED      "false" turns the feed off
+ *   CHANGE_FEED_TIMEOUT_MS   longest a mutation waits to publish (default 1000)
+ *   AWS_REGION               signing region (set by Lambda)
+ */
+export function changeFeedOptionsFromEnv(): ChangeFeedOptions {
+  const url = process.env['CHANGE_FEED_URL'] || undefined;
+  const timeout = Number(process.env['CHANGE_FEED_TIMEOUT_MS']);
+  return {
+    ...(url !== undefined && process.env['CHANGE_FEED_ENABLED'] !== 'false' && { sink: new AppSyncChangeSink(url, process.env['AWS_REGION'] ?? 'us-west-2') }),
+    timeoutMs: Number.isFinite(timeout) && timeout > 0 ? timeout : 1000,
+  };
+}
+
+let settings: ChangeFeedOptions | undefined;
+
+function changeFeedSettings(): ChangeFeedOptions {
+  if (settings === undefined) {
+    settings = changeFeedOptionsFromEnv();
+  }
+  return settings;
+}
+
+/**
+ * Replace the change feed settings. Intended for tests and the local harness;
+ * without options they are read from the environment again.
+ */
+export function configureChangeFeed(options?: Partial<ChangeFeedOptions>): void {
+  settings = options === undefined ? undefined : { ...changeFeedOptionsFromEnv(), ...options };
+}
+
+/**
+ * Publish what a mutation changed to the change-feed subscriptions. Called
+ * after the backend write succeeded, so it never fails the mutation: a
+ * publish that errors or takes longer than CHANGE_FEED_TIMEOUT_MS is logged
+ * and dropped, and subscribers catch up on their next full list load. The
+ * mutation waits for the publish because a Lambda container is frozen as
+ * soon as it answers.
+ */
+export async function publishChanges(changes: readonly Change[]): Promise<void> {
+  const { sink, timeoutMs } = changeFeedSettings();
+  if (sink === undefined || changes.length === 0) {
+    return;
+  }
+  let timer: NodeJS.Timeout | undefined;
+  const timeout = new Promise<never>((_, reject) => {
+    timer = setTimeout(() => reject(new Error(`Change feed publish timed out after ${timeoutMs} ms`)), timeoutMs);
+  });
+  try {
+    await span('publish', () => Promise.race([sink.publish(changes), timeout]), { changes: changes.length });
+  } catch (error) {
+    logger.warn('Change feed publish failed', { entity: changes[0]?.entity, changes: changes.length, error });
+  } finally {
+    clearTimeout(timer);
+  }
+}
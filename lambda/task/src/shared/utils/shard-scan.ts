@@ -0,0 +1,190 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { Page, streamPages } from './page-stream';
+
+/**
+ * One slice of a time window, in epoch milliseconds, both ends inclusive (as
+ * a backend `from`/`to` filter is)
+ */
+export interface TimeShard {
+  from: number;
+  to: number;
+}
+
+/**
+ * Split [from, to] into `count` adjacent shards of (nearly) equal width that
+ * neither overlap nor leave a gap, so every record falls in exactly one.
+ * A window narrower than `count` milliseconds gets fewer shards.
+ */
+export function timeShards(from: number, to: number, count: number): TimeShard[] {
+  if (!(to >= from)) {
+    return [];
+  }
+  const span = to - from + 1;
+  const shards = Math.max(1, Math.min(Math.floor(count), span));
+  const starts = Array.from({ length: shards }, (_, index) => from + Math.floor((index * span) / shards));
+  return starts.map((start, index) => ({ from: start, to: (starts[index + 1] ?? to + 1) - 1 }));
+}
+
+/**
+ * Where a scan stands: the shard it is in, the backend cursor of the page it
+ * is in (absent for the shard's first page) and how many of that page's items
+ * were already returned. Shards before `shard` are finished and those after
+ * it not started, so this is the position in every shard.
+ */
+export interface ShardPosition {
+  shard: number;
+  cursor?: string;
+  offset: number;
+}
+
+/**
+ * An item of a scan and the position right after it, to resume from
+ */
+export interface ScannedItem<T> {
+  item: T;
+  next: ShardPosition;
+}
+
+/**
+ * Fetch one page of one shard; `cursor` is undefined for the shard's first page
+ */
+export type ShardPageFetcher<T> = (shard: number, cursor: string | undefined, signal: AbortSignal) => Promise<Page<T>>;
+
+export interface ShardScanOptions {
+  /** Shards being fetched at once, the one being returned included (default 4) */
+  concurrency?: number;
+  /** Pages each open shard fetches ahead of the one being returned (default 1) */
+  prefetch?: number;
+  /** Resume here instead of at the start of the first shard */
+  start?: ShardPosition;
+}
+
+interface OpenShard<T> {
+  pages: AsyncGenerator<Array<ScannedItem<T>>, void, undefined>;
+  first: Promise<IteratorResult<Array<ScannedItem<T>>, void>>;
+}
+
+function positionOf(shard: number, cursor: string | undefined, offset: number): ShardPosition {
+  return { shard, ...(cursor !== undefined && { cursor }), offset };
+}
+
+/**
+ * Scan `shardCount` shards of one ordered list, fetching up to `concurrency`
+ * of them at once, and return the items in shard order: everything from
+ * shard 0, then shard 1, ... Shards are time slices of one window, so shard
+ * order is time order and nothing needs merging; while the consumer works
+ * through one shard, the next ones are already paging in.
+ *
+ * Each item comes with the position after it, so a consumer that stops early
+ * can resume there later (`start`). Memory is bounded by the open shards'
+ * buffered pages. Stopping early, or an error in any shard the consumer
+ * reaches, aborts the requests still in flight.
+ */
+export async function* scanShards<T>(
+  shardCount: number,
+  fetchPage: ShardPageFetcher<T>,
+  options: ShardScanOptions = {}
+): AsyncGenerator<ScannedItem<T>, void, undefined> {
+  const concurrency = Math.max(1, options.concurrency ?? 4);
+  const prefetch = Math.max(0, options.prefetch ?? 1);
+  const start = options.start ?? { shard: 0, offset: 0 };
+  const controller = new AbortController();
+
+  const open = (shard: number): OpenShard<T> => {
+    const resume = shard === start.shard ? start : undefined;
+    const pages = streamPages<ScannedItem<T>>(
+      async cursor => {
+        // streamPages asks for the first page without a cursor; a resumed shard starts mid-way
+        const requested = cursor ?? resume?.cursor;
+        const page = await fetchPage(shard, requested, controller.signal);
+        const nextCursor = page.nextCursor === null || page.nextCursor === '' ? undefined : page.nextCursor;
+        const items = page.items.map((item, index) => ({
+          item,
+          next:
+            index + 1 < page.items.length
+              ? positionOf(shard, requested, index + 1)
+              : nextCursor !== undefined
+                ? positionOf(shard, nextCursor, 0)
+                : positionOf(shard + 1, undefined, 0),
+        }));
+        return { items: cursor === undefined && resume !== undefined ? items.slice(resume.offset) : items, nextCursor };
+      },
+      { prefetch }
+    );
+    // Pull the first page now, so the shard pages in while earlier ones are returned
+    const first = pages.next();
+    // Rethrown when the consumer reaches this shard
+    first.catch(() => undefined);
+    return { pages, first };
+  };
+
+  const opened = new Map<number, OpenShard<T>>();
+  let nextToOpen = start.shard;
+  try {
+    for (let shard = start.shard; shard < shardCount; shard += 1) {
+      while (nextToOpen < shardCount && nextToOpen < shard + concurrency) {
+        opened.set(nextToOpen, open(nextToOpen));
+        nextToOpen += 1;
+      }
+      const { pages, first } = opened.get(shard) as OpenShard<T>;
+      for (let result = await first; result.done !== true; result = await pages.next()) {
+        yield* result.value;
+      }
+      opened.delete(shard);
+    }
+  } finally {
+    controller.abort();
+    for (const { pages } of opened.values()) {
+      pages.return(undefined).catch(() => undefined);
+    }
+  }
+}
+
+/**
+ * A scan position as an opaque cursor, together with the window and shard
+ * count it belongs to, so a resumed scan splits the window the same way even
+ * if the shard count setting changed in between
+ */
+export interface ShardCursor {
+  from: number;
+  to: number;
+  shards: number;
+  position: ShardPosition;
+}
+
+const SHARD_CURSOR_PREFIX = 'shards:';
+
+export function encodeShardCursor({ from, to, shards, position }: ShardCursor): string {
+  const state = { f: from, t: to, n: shards, s: position.shard, c: position.cursor, o: position.offset };
+  return SHARD_CURSOR_PREFIX + Buffer.from(JSON.stringify(state)).toString('base64url');
+}
+
+/**
+ * Decode a cursor produced by encodeShardCursor; returns undefined for
+ * anything else, such as a backend's own cursor
+ */
+export function decodeShardCursor(cursor: string): ShardCursor | undefined {
+  if (!cursor.startsWith(SHARD_CURSOR_PREFIX)) {
+    return undefined;
+  }
+  try {
+    const state = JSON.parse(Buffer.from(cursor.slice(SHARD_CURSOR_PREFIX.length), 'base64url').toString('utf8')) as Record<
+      string,
+      unknown
+    >;
+    const { f, t, n, s, c, o } = state;
+    if (
+      typeof f !== 'number' ||
+      typeof t !== 'number' ||
+      typeof n !== 'number' ||
+      typeof s !== 'number' ||
+      typeof o !== 'number' ||
+      (c !== undefined && typeof c !== 'string')
+    ) {
+      return undefined;
+    }
+    return { from: f, to: t, shards: n, position: positionOf(s, c, o) };
+  } catch {
+    return undefined;
+  }
+}
@@ -7,6 +7,9 @@ echo "Building Unit Lambda function..."
 rm -rf dist
 rm -rf lambda.zip
 
+# Make sure the shared sources copied into src/shared are current
+../shared/sync.sh --check
+
 # Install dependencies
 npm ci
 
@@ -1,6 +1,7 @@
 import { UnitResolver } from "../handlers/unit-resolver";
 import { AppSyncResolverEvent, GetUnitArguments, GetUnitWithWorkOrdersArguments } from "../types";
 import { UnitsApiService } from "../services/units-api.service";
+import { resetTenantCache } from "../shared";
 
 // Mock the UnitsApiService
 jest.mock("../services/units-api.service");
@@ -38,6 +39,7 @@ describe("UnitResolver", () => {
 
   beforeEach(() => {
     jest.clearAllMocks();
+    resetTenantCache();
   });
 
   describe("getUnit", () => {
@@ -66,6 +68,28 @@ describe("UnitResolver", () => {
       expect(result).toEqual(mockUnit);
     });
 
+    it("should serve repeated reads from the tenant cache until the unit is updated", async () => {
+      const mockUnit = { id: "test-unit-id", accountId: "test-account-id", suggestedVin: "TEST123" };
+      const mockGetUnit = jest.fn().mockResolvedValue(mockUnit);
+      const mockUpdateUnit = jest.fn().mockResolvedValue({ ...mockUnit, suggestedVin: "NEW456" });
+      (UnitsApiService as jest.MockedClass<typeof UnitsApiService>).mockImplementation(() => ({
+        getUnit: mockGetUnit,
+        updateUnit: mockUpdateUnit,
+      } as any));
+
+      await UnitResolver.getUnit(mockEvent);
+      const cached = await UnitResolver.getUnit(mockEvent);
+      expect(mockGetUnit).toHaveBeenCalledTimes(1);
+      expect(cached).toEqual(mockUnit);
+
+      await UnitResolver.updateUnit({
+        ...mockEvent,
+        arguments: { id: "test-unit-id", input: { suggestedVin: "NEW456" } },
+      } as any);
+      await UnitResolver.getUnit(mockEvent);
+      expect(mockGetUnit).toHaveBeenCalledTimes(2);
+    });
+
     it("should throw UnauthorizedError when authorization header is missing", async () => {
       const eventWithoutAuth = {
         ...mockEvent,
@@ -167,6 +191,33 @@ describe("UnitResolver", () => {
       expect(result).toEqual(mockResponse);
     });
 
+    it("should skip work orders and unselected fields when the client did not select them", async () => {
+      const eventWithoutWorkOrders = {
+        ...mockEventWithWorkOrders,
+        info: {
+          ...mockEventWithWorkOrders.info,
+          selectionSetList: ["items", "items/id", "items/suggestedVin", "cursor"],
+          selectionSetGraphQL: "{ items { id suggestedVin } cursor }",
+        },
+      };
+
+      const mockGetUnitsWithWorkOrders = jest.fn().mockResolvedValue({
+        items: [{ id: "unit-1", accountId: "test-account-id", suggestedVin: "TEST123", make: "Volvo", workOrders: [] }],
+        cursor: "next",
+      });
+      (UnitsApiService as jest.MockedClass<typeof UnitsApiService>).mockImplementation(() => ({
+        getUnitsWithWorkOrders: mockGetUnitsWithWorkOrders,
+      } as any));
+
+      const result = await UnitResolver.getUnitWithWorkOrders(eventWithoutWorkOrders);
+
+      expect(mockGetUnitsWithWorkOrders.mock.calls[0][1]).toEqual({ includeWorkOrders: false });
+      expect(result).toEqual({
+        items: [{ id: "unit-1", accountId: "test-account-id", suggestedVin: "TEST123" }],
+        cursor: "next",
+      });
+    });
+
     it("should use default limit when not provided", async () => {
       const eventWithoutLimit = {
         ...mockEventWithWorkOrders,
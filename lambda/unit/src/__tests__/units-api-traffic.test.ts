@@ -0,0 +1,65 @@
+import path from "path";
+
+import { UnitsApiService } from "../services/units-api.service";
+import { configureTraffic, getTrafficStats, resetHttpPool } from "../shared";
+
+// Backend exchanges recorded with HTTP_TRAFFIC_MODE=record, replayed here without a network
+const fixture = (name: string): string => path.join(__dirname, "fixtures", `${name}.jsonl`);
+
+describe("UnitsApiService against recorded backends", () => {
+  const env = process.env;
+
+  beforeEach(() => {
+    process.env = { ...env };
+    resetHttpPool();
+  });
+
+  afterAll(() => {
+    process.env = env;
+    configureTraffic({ mode: "off" });
+    resetHttpPool();
+  });
+
+  it("loads a page of units with their work orders in two backend calls", async () => {
+    configureTraffic({ mode: "replay", fixture: fixture("get-units-with-work-orders"), latencyScale: 0.2 });
+
+    const page = await new UnitsApiService("test-token").getUnitsWithWorkOrders({ accountId: "acct-1", limit: 3 });
+
+    expect(page.items.map((unit) => [unit.id, unit.workOrders.map((wo) => wo.workOrderId)])).toEqual([
+      ["unit-1", ["wo-1", "wo-2"]],
+      ["unit-2", []],
+      ["unit-3", ["wo-3"]],
+    ]);
+    expect(page.cursor).toBe("units-3");
+    // One call per unit here would be the N+1 this path exists to avoid
+    expect(getTrafficStats()).toEqual({
+      calls: 2,
+      peakConcurrency: 1,
+      unmatched: 0,
+      routes: {
+        "GET /units/acct-1?limit=3": 1,
+        "GET /accounts/acct-1/work-orders?pageSize=100": 1,
+      },
+    });
+  });
+
+  it("falls back to per-unit calls within the fetch concurrency when the scan runs out of budget", async () => {
+    process.env["WORKORDERS_SCAN_MAX_PAGES"] = "2";
+    process.env["WORKORDERS_FETCH_CONCURRENCY"] = "2";
+    configureTraffic({ mode: "replay", fixture: fixture("get-units-with-work-orders-fallback"), latencyScale: 0.2 });
+
+    const page = await new UnitsApiService("test-token").getUnitsWithWorkOrders({ accountId: "acct-1", limit: 4 });
+
+    expect(page.items.map((unit) => unit.workOrders.map((wo) => wo.workOrderId))).toEqual([
+      ["wo-11"],
+      ["wo-12"],
+      ["wo-13"],
+      ["wo-14"],
+    ]);
+    const stats = getTrafficStats();
+    // The units page, the two scan pages allowed, then one call per unit
+    expect(stats?.calls).toBe(1 + 2 + 4);
+    expect(stats?.peakConcurrency).toBe(2);
+    expect(stats?.unmatched).toBe(0);
+  });
+});
@@ -0,0 +1,78 @@
+import { AxiosInstance } from "axios";
+
+import { WorkOrdersLoader } from "../services/work-orders-loader";
+import { WorkOrder } from "../types";
+
+const workOrder = (workOrderId: string, unitId: string): WorkOrder => ({
+  workOrderId,
+  accountId: "test-account-id",
+  contactId: "contact-1",
+  unitId,
+  status: "pending",
+  description: "Test work order",
+  notes: [],
+  createdAt: 0,
+  updatedAt: 0,
+});
+
+const mockClient = (get: jest.Mock): AxiosInstance => ({ get } as unknown as AxiosInstance);
+
+describe("WorkOrdersLoader", () => {
+  it("should group an account-scoped scan by unit in a single request", async () => {
+    const get = jest.fn().mockResolvedValue({
+      data: {
+        items: [workOrder("wo-1", "unit-1"), workOrder("wo-2", "unit-2"), workOrder("wo-3", "unit-9")],
+      },
+    });
+    const loader = new WorkOrdersLoader(mockClient(get), "test-token");
+
+    const result = await loader.loadMany("test-account-id", ["unit-1", "unit-2", "unit-1"]);
+
+    expect(get).toHaveBeenCalledTimes(1);
+    expect(get).toHaveBeenCalledWith("/accounts/test-account-id/work-orders", {
+      params: { pageSize: 100 },
+      headers: { Authorization: "Bearer test-token" },
+    });
+    expect(result.get("unit-1")?.workOrders.map((wo) => wo.workOrderId)).toEqual(["wo-1"]);
+    expect(result.get("unit-2")?.workOrders.map((wo) => wo.workOrderId)).toEqual(["wo-2"]);
+    expect(result.has("unit-9")).toBe(false);
+  });
+
+  it("should fall back to bounded per-unit requests when the scan exceeds its budget", async () => {
+    let inFlight = 0;
+    let peak = 0;
+    const get = jest.fn().mockImplementation(async (_url: string, config: { params: Record<string, unknown> }) => {
+      if (config.params["unitId"] === undefined) {
+        return { data: { items: [], nextCursor: "more" } };
+      }
+      inFlight += 1;
+      peak = Math.max(peak, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      inFlight -= 1;
+      const unitId = config.params["unitId"] as string;
+      return { data: { items: [workOrder(`wo-${unitId}`, unitId)] } };
+    });
+    const loader = new WorkOrdersLoader(mockClient(get), "test-token", { maxScanPages: 1, concurrency: 2 });
+    const unitIds = ["a", "b", "c", "d", "e"];
+
+    const result = await loader.loadMany("test-account-id", unitIds);
+
+    expect(get).toHaveBeenCalledTimes(1 + unitIds.length);
+    expect(peak).toBeLessThanOrEqual(2);
+    expect(result.get("c")?.workOrders.map((wo) => wo.workOrderId)).toEqual(["wo-c"]);
+  });
+
+  it("should flag per-unit failures instead of returning silent empty lists", async () => {
+    const get = jest.fn().mockImplementation(async (_url: string, config: { params: Record<string, unknown> }) => {
+      if (config.params["unitId"] === "broken") {
+        throw new Error("socket hang up");
+      }
+      return { data: { items: [] } };
+    });
+    const loader = new WorkOrdersLoader(mockClient(get), "test-token");
+
+    const result = await loader.loadMany("test-account-id", ["broken"]);
+
+    expect(result.get("broken")).toEqual({ workOrders: [], error: "socket hang up" });
+  });
+});
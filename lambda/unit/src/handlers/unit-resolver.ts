@@ -12,18 +12,40 @@ import {
 } from "../types";
 import { UnitsApiService } from "../services/units-api.service";
 import { CreateUnitInput, UpdateUnitInput } from "../types";
+import { Selection, getTenantCache, projectAll, resolveBySourceId, spanSync } from "../shared";
+
+/**
+ * Unit fields kept in projected results even when not selected
+ */
+const UNIT_KEY_FIELDS = ["id", "accountId"] as const;
+
+/**
+ * Work order fields kept in projected results: nested resolvers (WorkOrder.unit) read them
+ */
+const WORK_ORDER_KEY_FIELDS = ["workOrderId", "accountId", "unitId"] as const;
+
+/**
+ * Drop the account's cached units and unit pages after a mutation, passing the
+ * mutation result through
+ */
+async function invalidateUnits<T>(accountId: string, result: T): Promise<T> {
+  await getTenantCache().invalidate(accountId, "unit");
+  return result;
+}
 
 export class UnitResolver {
   /**
    * Extract JWT token from AppSync event
    */
   private static extractAuthToken<T>(event: AppSyncResolverEvent<T>): string {
-    const authHeader = event.request.headers.authorization;
-    if (authHeader === undefined || authHeader === null || authHeader === "") {
-      throw new UnauthorizedError("Authorization header is missing");
-    }
-    // Extract just the token part, removing "Bearer " prefix
-    return authHeader.replace(/^Bearer\s+/i, "");
+    return spanSync("auth", () => {
+      const authHeader = event.request.headers.authorization;
+      if (authHeader === undefined || authHeader === null || authHeader === "") {
+        throw new UnauthorizedError("Authorization header is missing");
+      }
+      // Extract just the token part, removing "Bearer " prefix
+      return authHeader.replace(/^Bearer\s+/i, "");
+    });
   }
 
   /**
@@ -50,7 +72,7 @@ export class UnitResolver {
     }
 
     const service = new UnitsApiService(authToken);
-    return service.getUnit({ accountId, id });
+    return getTenantCache().getOrLoad(accountId, "unit", id, () => service.getUnit({ accountId, id }));
   }
 
   /**
@@ -69,7 +91,23 @@ export class UnitResolver {
     if (cursor !== undefined && cursor !== null && cursor !== "") {
       params.cursor = cursor;
     }
-    return service.listUnits(params);
+
+    // Only return the unit fields the client selected
+    const items = Selection.fromEvent(event).at("items");
+    const cache = getTenantCache();
+    return cache
+      .getOrLoad(accountId, "unit", { list: params }, () => service.listUnits(params))
+      .then((response) => {
+        // Clients usually ask for the next page right away; load it in the background
+        if (response.hasMore !== false && response.cursor) {
+          const next: ListUnitsParams = { ...params, cursor: response.cursor };
+          cache.prefetch(accountId, "unit", { list: next }, () => service.listUnits(next));
+        }
+        return {
+          ...response,
+          items: projectAll(response.items, items, UNIT_KEY_FIELDS),
+        };
+      });
   }
 
   /**
@@ -102,10 +140,12 @@ export class UnitResolver {
     };
 
     const service = new UnitsApiService(authToken);
-    return service.createUnit({
-      accountId,
-      unit: unitInput,
-    });
+    return service
+      .createUnit({
+        accountId,
+        unit: unitInput,
+      })
+      .then((unit) => invalidateUnits(accountId, unit));
   }
 
   /**
@@ -132,11 +172,13 @@ export class UnitResolver {
     };
 
     const service = new UnitsApiService(authToken);
-    return service.updateUnit({
-      accountId,
-      id,
-      unit: unitUpdate,
-    });
+    return service
+      .updateUnit({
+        accountId,
+        id,
+        unit: unitUpdate,
+      })
+      .then((unit) => invalidateUnits(accountId, unit));
   }
 
   /**
@@ -155,8 +197,47 @@ export class UnitResolver {
     if (cursor !== undefined && cursor !== null && cursor !== "") {
       params.cursor = cursor;
     }
-    
-    return service.getUnitsWithWorkOrders(params);
+
+    // Skip the work-order fetch entirely when the client did not ask for it
+    const selection = Selection.fromEvent(event);
+    const items = selection.at("items");
+    const includeWorkOrders = selection.has("items") && items.hasAny("workOrders", "workOrdersError");
+
+    return service.getUnitsWithWorkOrders(params, { includeWorkOrders }).then((response) => ({
+      ...response,
+      items: projectAll(response.items, items, UNIT_KEY_FIELDS, { workOrders: WORK_ORDER_KEY_FIELDS }),
+    }));
+  }
+
+  /**
+   * Handle a batch of nested `unit` fields (WorkOrder.unit, EventWithUnitInfo.unit).
+   * Returns one entry per event, in order: the unit, null, or an Error.
+   */
+  static async resolveSourceUnits(events: AppSyncResolverEvent[]): Promise<unknown[]> {
+    const first = events[0];
+    if (first === undefined) {
+      return [];
+    }
+
+    // Every item of a BatchInvoke comes from the same GraphQL request, so they share a caller
+    const authToken = this.extractAuthToken(first);
+    const accountId = this.extractAccountId(first);
+    const service = new UnitsApiService(authToken);
+
+    const units = await resolveBySourceId(
+      events,
+      (event) => sourceString(event, "unitId"),
+      (unitIds) => service.getUnitsByIds(accountId, unitIds),
+    );
+
+    // Never hand out a unit for a parent row that belongs to another account
+    return units.map((unit, index) => {
+      const sourceAccountId = sourceString(events[index] as AppSyncResolverEvent, "accountId");
+      if (sourceAccountId !== undefined && sourceAccountId !== accountId) {
+        return new UnauthorizedError("Access denied: unit belongs to another account");
+      }
+      return unit;
+    });
   }
 
   /**
@@ -173,6 +254,7 @@ export class UnitResolver {
 
     const service = new UnitsApiService(authToken);
     await service.deleteUnit({ accountId, id });
+    await getTenantCache().invalidate(accountId, "unit");
 
     // Return success response
     return {
@@ -181,4 +263,12 @@ export class UnitResolver {
       message: "Unit deleted successfully",
     };
   }
-}
\ No newline at end of file
+}
+
+/**
+ * Read a string field from the parent object of a nested resolver
+ */
+function sourceString(event: AppSyncResolverEvent, field: string): string | undefined {
+  const value = event.source?.[field];
+  return typeof value === "string" && value !== "" ? value : undefined;
+}
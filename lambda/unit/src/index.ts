@@ -10,60 +10,125 @@ import {
   DeleteUnitArguments,
   GetUnitWithWorkOrdersArguments,
 } from "./types";
+import {
+  BatchItemResult,
+  FieldCosts,
+  logger,
+  resolveBatch,
+  withAdmission,
+  withCompactResponses,
+  withDeadline,
+  withProfiling,
+  withTracing,
+} from "./shared";
+
+/**
+ * Admission cost of the unit fields (see withAdmission). getUnitWithWorkOrders
+ * fetches each unit's work orders when they are selected, so every row of
+ * its page costs another backend request.
+ */
+const FIELD_COSTS: FieldCosts = {
+  listUnits: { limitArg: "limit", defaultLimit: 20, maxLimit: 100 },
+  getUnitWithWorkOrders: {
+    limitArg: "limit",
+    defaultLimit: 20,
+    maxLimit: 50,
+    perItem: 1,
+    perItemWhen: ["items/workOrders", "items/workOrdersError"],
+  },
+  unit: { batched: true },
+};
+
+/**
+ * Route a single AppSync event to the matching resolver method
+ */
+function routeEvent(event: AppSyncResolverEvent): Promise<unknown> {
+  const { fieldName } = event.info;
+
+  switch (fieldName) {
+    case "getUnit":
+      return UnitResolver.getUnit(event as unknown as AppSyncResolverEvent<GetUnitArguments>);
+
+    case "listUnits":
+      return UnitResolver.listUnits(event as unknown as AppSyncResolverEvent<ListUnitsArguments>);
+
+    case "createUnit":
+      return UnitResolver.createUnit(event as unknown as AppSyncResolverEvent<CreateUnitArguments>);
+
+    case "updateUnit":
+      return UnitResolver.updateUnit(event as unknown as AppSyncResolverEvent<UpdateUnitArguments>);
+
+    case "deleteUnit":
+      return UnitResolver.deleteUnit(event as unknown as AppSyncResolverEvent<DeleteUnitArguments>);
+
+    case "getUnitWithWorkOrders":
+      return UnitResolver.getUnitWithWorkOrders(event as unknown as AppSyncResolverEvent<GetUnitWithWorkOrdersArguments>);
+
+    case "unit":
+      return UnitResolver.resolveSourceUnits([event]).then((results): unknown => {
+        const [unit] = results;
+        if (unit instanceof Error) {
+          throw unit;
+        }
+        return unit ?? null;
+      });
+
+    default:
+      return Promise.reject(new Error(`Unknown field: ${fieldName}`));
+  }
+}
 
 /**
  * Main Lambda handler for AppSync resolver
- * Routes requests to appropriate resolver methods based on the field name
+ * Routes requests to appropriate resolver methods based on the field name.
+ * BatchInvoke payloads (arrays of events) are answered with one result per
+ * event, and nested `unit` fields are loaded for the whole batch at once.
  */
-export const handler: Handler<AppSyncResolverEvent, unknown> = async (
-  event: AppSyncResolverEvent,
+export const handler: Handler<AppSyncResolverEvent | AppSyncResolverEvent[], unknown> = withDeadline(withProfiling(withTracing(withAdmission(FIELD_COSTS, withCompactResponses(async (
+  event: AppSyncResolverEvent | AppSyncResolverEvent[],
 ): Promise<unknown> => {
-  // Log event only in development
-  if (process.env["NODE_ENV"] !== "production") {
-    console.warn("Received AppSync event:", JSON.stringify(event, null, 2));
+  if (Array.isArray(event)) {
+    return handleBatch(event);
   }
 
-  try {
-    const { fieldName } = event.info;
-
-    switch (fieldName) {
-      case "getUnit":
-        return UnitResolver.getUnit(event as unknown as AppSyncResolverEvent<GetUnitArguments>);
-      
-      case "listUnits":
-        return UnitResolver.listUnits(event as unknown as AppSyncResolverEvent<ListUnitsArguments>);
-      
-      case "createUnit":
-        return UnitResolver.createUnit(event as unknown as AppSyncResolverEvent<CreateUnitArguments>);
-      
-      case "updateUnit":
-        return UnitResolver.updateUnit(event as unknown as AppSyncResolverEvent<UpdateUnitArguments>);
-      
-      case "deleteUnit":
-        return await UnitResolver.deleteUnit(event as unknown as AppSyncResolverEvent<DeleteUnitArguments>);
-      
-      case "getUnitWithWorkOrders":
-        return UnitResolver.getUnitWithWorkOrders(event as unknown as AppSyncResolverEvent<GetUnitWithWorkOrdersArguments>);
-      
-      default:
-        throw new Error(`Unknown field: ${fieldName}`);
-    }
-  } catch (error) {
-    console.error("Error processing request:", error);
-    
-    // Format error for AppSync
-    if (error instanceof Error) {
+  return logger.runWithField(event.info.fieldName, async (): Promise<unknown> => {
+    logger.debug("Received AppSync event", () => ({ event }));
+
+    try {
+      return await routeEvent(event);
+    } catch (error) {
+      logger.error("Error processing request", { error });
+
+      // Format error for AppSync
+      if (error instanceof Error) {
+        return {
+          error: error.message,
+          errorType: error.name,
+          // Include stack trace only in non-production environments
+          ...(process.env["NODE_ENV"] !== "production" && { stack: error.stack }),
+        };
+      }
+
       return {
-        error: error.message,
-        errorType: error.name,
-        // Include stack trace only in non-production environments
-        ...(process.env["NODE_ENV"] !== "production" && { stack: error.stack }),
+        error: "An unexpected error occurred",
+        errorType: "InternalError",
       };
     }
-    
-    return {
-      error: "An unexpected error occurred",
-      errorType: "InternalError",
-    };
+  });
+})))));
+
+async function handleBatch(events: AppSyncResolverEvent[]): Promise<BatchItemResult[]> {
+  logger.info("Received AppSync batch", { size: events.length });
+
+  const results = await resolveBatch(
+    events,
+    { unit: (items) => logger.runWithField("unit", () => UnitResolver.resolveSourceUnits(items)) },
+    (item) => logger.runWithField(item.info.fieldName, () => routeEvent(item)),
+  );
+
+  const failed = results.filter((result) => result.errorMessage !== undefined).length;
+  if (failed > 0) {
+    logger.error("Batched items failed", { failed, size: events.length });
   }
-};
\ No newline at end of file
+  return results;
+}
@@ -1,4 +1,4 @@
-import axios, { AxiosInstance, AxiosError } from "axios";
+import { AxiosInstance, AxiosError } from "axios";
 
 import {
   Unit,
@@ -9,26 +9,38 @@ import {
   CreateUnitParams,
   UpdateUnitParams,
   DeleteUnitParams,
-  WorkOrder,
   UnitWithWorkOrders,
+  WorkOrdersLoadResult,
 } from "../types";
 import { ServiceError } from "../types/appsync";
+import { envInt, getPooledClient, logger, mapWithConcurrency, withAuth } from "../shared";
+
+import type { WorkOrdersLoader } from "./work-orders-loader";
 
 export class UnitsApiService {
   private readonly client: AxiosInstance;
   private readonly baseUrl: string;
+  private workOrdersLoader?: Promise<WorkOrdersLoader>;
 
-  constructor(authToken: string) {
+  constructor(private readonly authToken: string) {
     this.baseUrl = process.env["UNITS_API_URL"] ?? "https://unit-srnext.sb.fullbay.com";
-    
-    this.client = axios.create({
-      baseURL: this.baseUrl,
-      headers: {
-        "Content-Type": "application/json",
-        Authorization: `Bearer ${authToken}`,
-      },
-      timeout: 30000, // 30 seconds
-    });
+
+    // Pooled clients are shared across warm invocations; auth is added per request
+    this.client = getPooledClient(this.baseUrl);
+  }
+
+  /**
+   * The work orders loader, imported on first use: only getUnitWithWorkOrders
+   * needs it, so cold starts of the other unit resolvers skip loading it
+   */
+  private loadWorkOrdersLoader(): Promise<WorkOrdersLoader> {
+    this.workOrdersLoader ??= import("./work-orders-loader").then(
+      ({ WorkOrdersLoader }) => new WorkOrdersLoader(
+        getPooledClient(process.env["WORKORDERS_API_URL"] ?? "https://workorder-srnext.sb.fullbay.com"),
+        this.authToken,
+      ),
+    );
+    return this.workOrdersLoader;
   }
 
   /**
@@ -38,12 +50,12 @@ export class UnitsApiService {
     try {
       const response = await this.client.get<PaginatedResponse>(
         `/units/${params.accountId}`,
-        {
+        withAuth(this.authToken, {
           params: {
             cursor: params.cursor,
             limit: params.limit,
           },
-        },
+        }),
       );
       return response.data;
     } catch (error) {
@@ -58,6 +70,7 @@ export class UnitsApiService {
     try {
       const response = await this.client.get<Unit>(
         `/units/${params.accountId}/${params.id}`,
+        withAuth(this.authToken),
       );
       return response.data;
     } catch (error) {
@@ -73,6 +86,7 @@ export class UnitsApiService {
       const response = await this.client.post<Unit>(
         `/units/${params.accountId}`,
         params.unit,
+        withAuth(this.authToken),
       );
       return response.data;
     } catch (error) {
@@ -88,6 +102,7 @@ export class UnitsApiService {
       const response = await this.client.put<Unit>(
         `/units/${params.accountId}/${params.id}`,
         params.unit,
+        withAuth(this.authToken),
       );
       return response.data;
     } catch (error) {
@@ -100,57 +115,43 @@ export class UnitsApiService {
    */
   async deleteUnit(params: DeleteUnitParams): Promise<void> {
     try {
-      await this.client.delete(`/units/${params.accountId}/${params.id}`);
+      await this.client.delete(`/units/${params.accountId}/${params.id}`, withAuth(this.authToken));
     } catch (error) {
       throw this.handleApiError(error as AxiosError<ErrorResponse>);
     }
   }
 
   /**
-   * Get units with their associated work orders
+   * Get units with their associated work orders.
+   * With `includeWorkOrders: false` no work orders are fetched and every unit
+   * gets an empty list.
    */
-  async getUnitsWithWorkOrders(params: ListUnitsParams): Promise<PaginatedResponse<UnitWithWorkOrders>> {
+  async getUnitsWithWorkOrders(
+    params: ListUnitsParams,
+    options: { includeWorkOrders?: boolean } = {},
+  ): Promise<PaginatedResponse<UnitWithWorkOrders>> {
     try {
-      // First, get all units
       const unitsResponse = await this.listUnits(params);
-      
-      // Create workorder service client with same auth as units service
-      const workOrderClient = axios.create({
-        baseURL: process.env["WORKORDERS_API_URL"] ?? "https://workorder-srnext.sb.fullbay.com",
-        headers: this.client.defaults.headers,
-        timeout: 30000,
-      });
 
-      // For each unit, fetch its work orders
-      const unitsWithWorkOrders: UnitWithWorkOrders[] = await Promise.all(
-        unitsResponse.items.map(async (unit): Promise<UnitWithWorkOrders> => {
-          try {
-            const workOrdersResponse = await workOrderClient.get<{ items: WorkOrder[] }>(
-              `/accounts/${params.accountId}/work-orders`,
-              {
-                params: {
-                  unitId: unit.id,
-                },
-              },
-            );
-            
-            // Get work orders for this specific unit
-            const unitWorkOrders = workOrdersResponse.data.items;
-
-            return {
-              ...unit,
-              workOrders: unitWorkOrders,
-            };
-          } catch (error) {
-            // If work order fetching fails, return unit with empty work orders array
-            console.error(`Failed to fetch work orders for unit ${unit.id}:`, error);
-            return {
-              ...unit,
-              workOrders: [],
-            };
-          }
-        })
-      );
+      // Load work orders for the whole page in one batch instead of one request per unit
+      const workOrdersByUnit = options.includeWorkOrders === false
+        ? new Map<string, WorkOrdersLoadResult>()
+        : await (await this.loadWorkOrdersLoader()).loadMany(
+          params.accountId,
+          unitsResponse.items.map((unit) => unit.id),
+        );
+
+      const unitsWithWorkOrders = unitsResponse.items.map((unit): UnitWithWorkOrders => {
+        const loaded = workOrdersByUnit.get(unit.id);
+        const result: UnitWithWorkOrders = {
+          ...unit,
+          workOrders: loaded?.workOrders ?? [],
+        };
+        if (loaded?.error !== undefined) {
+          result.workOrdersError = loaded.error;
+        }
+        return result;
+      });
 
       const result: PaginatedResponse<UnitWithWorkOrders> = {
         items: unitsWithWorkOrders,
@@ -169,6 +170,63 @@ export class UnitsApiService {
       throw this.handleApiError(error as AxiosError<ErrorResponse>);
     }
   }
+
+  /**
+   * Load several units of one account, keyed by unit ID.
+   *
+   * Used by batched nested resolvers (WorkOrder.unit, EventWithUnitInfo.unit).
+   * The account's unit list is scanned first, bounded so it never costs more
+   * requests than fetching each unit would; units the scan did not reach are
+   * then fetched one by one with bounded concurrency. Units that do not exist
+   * are left out of the map, and per-unit failures are returned as errors.
+   */
+  async getUnitsByIds(accountId: string, unitIds: readonly string[]): Promise<Map<string, Unit | Error>> {
+    const wanted = new Set(unitIds);
+    const found = new Map<string, Unit | Error>();
+    if (wanted.size === 0) {
+      return found;
+    }
+
+    let scanComplete = false;
+    const pageBudget = Math.min(envInt("UNITS_SCAN_MAX_PAGES", 3), wanted.size - 1);
+    try {
+      let cursor: string | undefined;
+      for (let page = 0; page < pageBudget && !scanComplete; page += 1) {
+        const params: ListUnitsParams = { accountId, limit: envInt("UNITS_SCAN_PAGE_SIZE", 100) };
+        if (cursor !== undefined) {
+          params.cursor = cursor;
+        }
+        const response = await this.listUnits(params);
+        for (const unit of response.items) {
+          if (wanted.has(unit.id)) {
+            found.set(unit.id, unit);
+          }
+        }
+        cursor = response.cursor;
+        scanComplete = response.hasMore !== true || cursor === undefined || cursor === "" || found.size === wanted.size;
+      }
+    } catch (error) {
+      logger.error("Unit scan failed, falling back to per-unit requests", { accountId, error });
+    }
+
+    if (scanComplete) {
+      return found;
+    }
+
+    const remaining = [...wanted].filter((id) => !found.has(id));
+    await mapWithConcurrency(remaining, envInt("UNITS_FETCH_CONCURRENCY", 8), async (id): Promise<void> => {
+      try {
+        found.set(id, await this.getUnit({ accountId, id }));
+      } catch (error) {
+        if (error instanceof ServiceError && error.statusCode === 404) {
+          return;
+        }
+        found.set(id, error instanceof Error ? error : new ServiceError("Unknown error occurred", 500));
+      }
+    });
+    return found;
+  }
+
   private handleApiError(error: AxiosError<ErrorResponse>): Error {
     if (error.response) {
       const data = error.response.data;
@@ -0,0 +1,144 @@
+import axios, { AxiosInstance } from "axios";
+
+import { WorkOrder, WorkOrdersLoadResult } from "../types";
+import { envInt, logger, mapWithConcurrency, withAuth } from "../shared";
+
+interface WorkOrderPage {
+  items: WorkOrder[];
+  nextCursor?: string | null;
+}
+
+export interface WorkOrdersLoaderOptions {
+  /** Page size used when scanning the account-scoped work-order list */
+  scanPageSize?: number;
+  /** Upper bound on account-scoped pages fetched before falling back to per-unit calls */
+  maxScanPages?: number;
+  /** Maximum number of per-unit requests in flight during the fallback */
+  concurrency?: number;
+}
+
+/**
+ * Batched work-order loader for a set of units in one account.
+ *
+ * Unit IDs are deduplicated, then work orders are fetched with one
+ * account-scoped list and grouped by unitId in memory. The scan is never
+ * allowed to cost more requests than the per-unit fallback would, and if it
+ * fails or runs out of budget the loader falls back to per-unit requests with
+ * bounded concurrency. Per-unit failures are returned as flagged results
+ * rather than empty work-order lists.
+ */
+export class WorkOrdersLoader {
+  private readonly scanPageSize: number;
+  private readonly maxScanPages: number;
+  private readonly concurrency: number;
+
+  constructor(
+    private readonly client: AxiosInstance,
+    private readonly authToken: string,
+    options: WorkOrdersLoaderOptions = {},
+  ) {
+    this.scanPageSize = options.scanPageSize ?? envInt("WORKORDERS_SCAN_PAGE_SIZE", 100);
+    this.maxScanPages = options.maxScanPages ?? envInt("WORKORDERS_SCAN_MAX_PAGES", 5);
+    this.concurrency = options.concurrency ?? envInt("WORKORDERS_FETCH_CONCURRENCY", 8);
+  }
+
+  /**
+   * Load work orders for every unit ID, keyed by unit ID
+   */
+  async loadMany(accountId: string, unitIds: readonly string[]): Promise<Map<string, WorkOrdersLoadResult>> {
+    const uniqueIds = [...new Set(unitIds)];
+    if (uniqueIds.length === 0) {
+      return new Map();
+    }
+
+    // A scan only pays off when it replaces more than one per-unit request
+    const scanBudget = Math.min(this.maxScanPages, uniqueIds.length - 1);
+    if (scanBudget > 0) {
+      try {
+        const grouped = await this.scanAccount(accountId, uniqueIds, scanBudget);
+        if (grouped) {
+          return grouped;
+        }
+      } catch (error) {
+        logger.error("Account-scoped work-order scan failed, falling back to per-unit requests", {
+          accountId,
+          error: describeError(error),
+        });
+      }
+    }
+
+    return this.loadPerUnit(accountId, uniqueIds);
+  }
+
+  /**
+   * Page through the account's work orders and group them by unit.
+   * Returns undefined when the scan does not finish within the page budget.
+   */
+  private async scanAccount(
+    accountId: string,
+    unitIds: readonly string[],
+    pageBudget: number,
+  ): Promise<Map<string, WorkOrdersLoadResult> | undefined> {
+    const grouped = new Map<string, WorkOrdersLoadResult>(
+      unitIds.map((id) => [id, { workOrders: [] }]),
+    );
+
+    let cursor: string | undefined;
+    for (let page = 0; page < pageBudget; page += 1) {
+      const params: Record<string, string | number> = { pageSize: this.scanPageSize };
+      if (cursor !== undefined) {
+        params["cursor"] = cursor;
+      }
+
+      const response = await this.client.get<WorkOrderPage>(
+        `/accounts/${accountId}/work-orders`,
+        withAuth(this.authToken, { params }),
+      );
+
+      for (const workOrder of response.data.items) {
+        grouped.get(workOrder.unitId)?.workOrders.push(workOrder);
+      }
+
+      const nextCursor = response.data.nextCursor;
+      if (nextCursor === undefined || nextCursor === null || nextCursor === "") {
+        return grouped;
+      }
+      cursor = nextCursor;
+    }
+
+    return undefined;
+  }
+
+  /**
+   * Fetch work orders one unit at a time with bounded concurrency
+   */
+  private async loadPerUnit(accountId: string, unitIds: readonly string[]): Promise<Map<string, WorkOrdersLoadResult>> {
+    const results = await mapWithConcurrency(
+      unitIds,
+      this.concurrency,
+      async (unitId): Promise<WorkOrdersLoadResult> => {
+        try {
+          const response = await this.client.get<WorkOrderPage>(
+            `/accounts/${accountId}/work-orders`,
+            withAuth(this.authToken, { params: { unitId } }),
+          );
+          return { workOrders: response.data.items };
+        } catch (error) {
+          const message = describeError(error);
+          logger.error("Failed to fetch work orders for unit", { unitId, error: message });
+          return { workOrders: [], error: message };
+        }
+      },
+    );
+
+    return new Map(unitIds.map((id, index) => [id, results[index] as WorkOrdersLoadResult]));
+  }
+}
+
+function describeError(error: unknown): string {
+  if (axios.isAxiosError(error)) {
+    const status = error.response?.status;
+    return status !== undefined ? `Work order service returned ${status}` : error.message;
+  }
+  return error instanceof Error ? error.message : "Unknown error occurred";
+}
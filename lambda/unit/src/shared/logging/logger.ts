@@ -0,0 +1,212 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { AsyncLocalStorage } from 'async_hooks';
+
+export type LogLevel = 'debug' | 'info' | 'warn' | 'error';
+
+export type LogFields = Record<string, unknown>;
+
+/**
+ * Fields for a log line, or a function producing them. Pass a function for
+ * anything expensive (whole events, results, rows): it only runs when the
+ * line is actually written.
+ */
+export type LazyLogFields = LogFields | (() => LogFields);
+
+export interface LoggerOptions {
+  /** Lowest level written */
+  level: LogLevel;
+  /** Fraction of invocations whose debug/info lines are written, by GraphQL field name */
+  sampleRates: ReadonlyMap<string, number>;
+  /** Sample rate for fields without an entry in sampleRates */
+  defaultSampleRate: number;
+  /** Where serialized lines go; defaults to the console method for the level */
+  write?: (level: LogLevel, line: string) => void;
+}
+
+const LEVEL_RANK: Record<LogLevel, number> = { debug: 10, info: 20, warn: 30, error: 40 };
+
+const REDACTED = '[REDACTED]';
+const SENSITIVE_KEY = /^(authorization|cookie|set-cookie|x-api-key)$|token|password|secret/i;
+
+interface LogScope {
+  bindings: LogFields;
+  sampled: boolean;
+}
+
+const scopes = new AsyncLocalStorage<LogScope>();
+
+function parseLevel(raw: string | undefined): LogLevel {
+  const level = (raw ?? '').toLowerCase();
+  return level in LEVEL_RANK ? (level as LogLevel) : 'info';
+}
+
+function parseRate(raw: string | undefined, fallback: number): number {
+  if (raw === undefined || raw.trim() === '') {
+    return fallback;
+  }
+  const rate = Number(raw);
+  return Number.isFinite(rate) ? Math.min(1, Math.max(0, rate)) : fallback;
+}
+
+/**
+ * Logger settings from the environment:
+ *
+ *   LOG_LEVEL         DEBUG | INFO | WARN | ERROR (default INFO)
+ *   LOG_SAMPLE_RATE   default fraction of invocations that log debug/info (default 1)
+ *   LOG_SAMPLE_RATES  per-field overrides, e.g. "listWorkOrders=0.05,getUnit=0.5"
+ *
+ * Warnings and errors are never sampled out.
+ */
+export function loggerOptionsFromEnv(): LoggerOptions {
+  const sampleRates = new Map<string, number>();
+  for (const entry of (process.env['LOG_SAMPLE_RATES'] ?? '').split(',')) {
+    const [fieldName, rate] = entry.split('=');
+    if (fieldName !== undefined && fieldName.trim() !== '' && rate !== undefined) {
+      sampleRates.set(fieldName.trim(), parseRate(rate, 1));
+    }
+  }
+  return {
+    level: parseLevel(process.env['LOG_LEVEL']),
+    sampleRates,
+    defaultSampleRate: parseRate(process.env['LOG_SAMPLE_RATE'], 1),
+  };
+}
+
+/**
+ * Flatten an error to the fields worth logging. Axios errors keep the request
+ * line and response status/body but not their config, which carries headers
+ * and agents.
+ */
+function describeError(error: Error): LogFields {
+  const details = error as Error & {
+    code?: unknown;
+    statusCode?: unknown;
+    isAxiosError?: boolean;
+    config?: { method?: string; url?: string };
+    response?: { status?: number; data?: unknown };
+  };
+  return {
+    name: details.name,
+    message: details.message,
+    ...(details.code !== undefined && { code: details.code }),
+    ...(details.statusCode !== undefined && { statusCode: details.statusCode }),
+    ...(details.isAxiosError === true && {
+      request: `${(details.config?.method ?? '').toUpperCase()} ${details.config?.url ?? ''}`,
+      status: details.response?.status,
+      data: details.response?.data,
+    }),
+    stack: details.stack,
+  };
+}
+
+/**
+ * JSON.stringify replacer: redacts credentials and flattens errors
+ */
+function redactingReplacer(key: string, value: unknown): unknown {
+  if (key !== '' && SENSITIVE_KEY.test(key)) {
+    return value === undefined || value === null || value === '' ? value : REDACTED;
+  }
+  return value instanceof Error ? describeError(value) : value;
+}
+
+function defaultWrite(level: LogLevel, line: string): void {
+  switch (level) {
+    case 'error':
+      console.error(line);
+      break;
+    case 'warn':
+      console.warn(line);
+      break;
+    default:
+      console.info(line);
+  }
+}
+
+/**
+ * Structured JSON logger shared by the resolver lambdas.
+ *
+ * Each line is a single JSON object with `level` and `message`, the fields
+ * bound by the surrounding `runWithField` scope, and the call's own fields.
+ * Nothing is serialized, and lazy fields are not evaluated, unless the level
+ * is enabled and the current invocation was sampled in.
+ */
+export class Logger {
+  constructor(private options: LoggerOptions = loggerOptionsFromEnv()) {}
+
+  /**
+   * Replace the logger settings (tests, benchmarks)
+   */
+  configure(options: Partial<LoggerOptions>): void {
+    this.options = { ...this.options, ...options };
+  }
+
+  /**
+   * Run `fn` with `fieldName` (and any other bindings) attached to every line
+   * it logs. The sampling decision for debug/info is made once here, so an
+   * invocation is either logged in full or not at all.
+   */
+  runWithField<T>(fieldName: string, fn: () => T, bindings: LogFields = {}): T {
+    const parent = scopes.getStore();
+    const rate = this.options.sampleRates.get(fieldName) ?? this.options.defaultSampleRate;
+    const scope: LogScope = {
+      bindings: { ...parent?.bindings, fieldName, ...bindings },
+      sampled: rate >= 1 || Math.random() < rate,
+    };
+    return scopes.run(scope, fn);
+  }
+
+  /**
+   * Whether a line at `level` would be written in the current scope. Use it to
+   * guard work that only exists to feed a log line.
+   */
+  isEnabled(level: LogLevel): boolean {
+    if (LEVEL_RANK[level] < LEVEL_RANK[this.options.level]) {
+      return false;
+    }
+    return LEVEL_RANK[level] >= LEVEL_RANK.warn || (scopes.getStore()?.sampled ?? true);
+  }
+
+  debug(message: string, fields?: LazyLogFields): void {
+    this.log('debug', message, fields);
+  }
+
+  info(message: string, fields?: LazyLogFields): void {
+    this.log('info', message, fields);
+  }
+
+  warn(message: string, fields?: LazyLogFields): void {
+    this.log('warn', message, fields);
+  }
+
+  error(message: string, fields?: LazyLogFields): void {
+    this.log('error', message, fields);
+  }
+
+  private log(level: LogLevel, message: string, fields: LazyLogFields | undefined): void {
+    if (!this.isEnabled(level)) {
+      return;
+    }
+    const resolved = typeof fields === 'function' ? fields() : fields;
+    const header: LogFields = { level, message, ...scopes.getStore()?.bindings };
+    const entry: LogFields = { ...header };
+    for (const [key, value] of Object.entries(resolved ?? {})) {
+      // Errors are flattened before serialization: JSON.stringify would
+      // otherwise prefer their own toJSON (axios dumps its whole config)
+      entry[key] = value instanceof Error ? describeError(value) : value;
+    }
+
+    let line: string;
+    try {
+      line = JSON.stringify(entry, redactingReplacer);
+    } catch (error) {
+      // Circular or BigInt fields: keep the line, drop the payload
+      line = JSON.stringify({ ...header, logError: `Unserializable log fields: ${(error as Error).message}` });
+    }
+    (this.options.write ?? defaultWrite)(level, line);
+  }
+}
+
+/**
+ * The container-wide logger
+ */
+export const logger = new Logger();
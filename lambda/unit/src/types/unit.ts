@@ -238,4 +238,14 @@ export interface WorkOrder {
  */
 export interface UnitWithWorkOrders extends Unit {
   workOrders: WorkOrder[];
+  /** Set when this unit's work orders could not be loaded */
+  workOrdersError?: string;
+}
+
+/**
+ * Work orders loaded for a single unit, flagged when the load failed
+ */
+export interface WorkOrdersLoadResult {
+  workOrders: WorkOrder[];
+  error?: string;
 }
\ No newline at end of file
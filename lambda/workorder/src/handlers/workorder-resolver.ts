@@ -5,6 +5,9 @@ import {
   CreateWorkOrderArguments,
   UpdateWorkOrderArguments,
   DeleteWorkOrderArguments,
+  CreateWorkOrdersArguments,
+  UpdateWorkOrdersArguments,
+  DeleteWorkOrdersArguments,
   ListWorkOrdersArguments,
   WorkOrder,
   CreateWorkOrderRequest,
@@ -13,13 +16,74 @@ import {
   GraphQLWorkOrderInput,
   GraphQLWorkOrderUpdateInput,
   GraphQLWorkOrderListResponse,
+  GraphQLWorkOrderBulkResult,
+  GraphQLDeleteBulkResult,
 } from '../types';
 import { WorkOrdersApiService } from '../services/workorders-api';
+import {
+  BulkItemResult,
+  assertBulkSize,
+  changeOf,
+  getTenantCache,
+  logger,
+  publishChanges,
+  runBulk,
+  spanSync,
+} from '../shared';
+
+function convertTimestampToGraphQL(epochMilliseconds?: number | null): number | undefined {
+  if (!epochMilliseconds) {
+    return undefined;
+  }
+  // AWSTimestamp expects seconds, so convert from milliseconds
+  const seconds = Math.floor(epochMilliseconds / 1000);
+  
+  // AWSTimestamp has a limit based on 32-bit signed integer (max value: 2147483647)
+  // This represents January 19, 2038 03:14:07 GMT
+  const maxTimestamp = 2147483647;
+  
+  if (seconds > maxTimestamp) {
+    logger.warn('Timestamp exceeds AWSTimestamp max value, capping', { seconds, maxTimestamp });
+    return maxTimestamp;
+  }
+  
+  return seconds;
+}
+
+/**
+ * A backend work order as the GraphQL WorkOrder type returns it
+ */
+export function workOrderToGraphQL(workOrder: WorkOrder): GraphQLWorkOrder {
+  // Runs once per row of every list: no logging here, the handler logs the
+  // final result at debug level
+  const createdAtConverted = convertTimestampToGraphQL(workOrder.createdAt);
+  const updatedAtConverted = convertTimestampToGraphQL(workOrder.updatedAt);
+  
+  const result: GraphQLWorkOrder = {
+    workOrderId: workOrder.workOrderId,
+    accountId: workOrder.accountId,
+    contactId: workOrder.contactId,
+    unitId: workOrder.unitId,
+    status: workOrder.status,
+    description: workOrder.description,
+    notes: workOrder.notes ?? [],
+    createdAt: createdAtConverted ?? 0,
+    updatedAt: updatedAtConverted ?? 0,
+  };
+  
+  const deletedAt = convertTimestampToGraphQL(workOrder.deletedAt);
+  if (deletedAt !== undefined) {
+    result.deletedAt = deletedAt;
+  }
+  
+  return result;
+}
 
 export class WorkOrderResolver {
   private readonly workOrdersApiService: WorkOrdersApiService;
   private readonly jwtToken: string | undefined;
   private readonly jwtAccountId: string | undefined;
+  private readonly cache = getTenantCache();
 
   constructor(event: AppSyncEvent) {
     const apiUrl = process.env['WORKORDERS_API_URL'] ?? 'https://workorder-srnext.sb.fullbay.com';
@@ -39,59 +103,6 @@ export class WorkOrderResolver {
     }
   }
 
-  private convertTimestampToGraphQL(epochMilliseconds?: number | null): number | undefined {
-    if (!epochMilliseconds) {
-      return undefined;
-    }
-    // AWSTimestamp expects seconds, so convert from milliseconds
-    const seconds = Math.floor(epochMilliseconds / 1000);
-    
-    // AWSTimestamp has a limit based on 32-bit signed integer (max value: 2147483647)
-    // This represents January 19, 2038 03:14:07 GMT
-    const maxTimestamp = 2147483647;
-    
-    if (seconds > maxTimestamp) {
-      console.warn(`Timestamp ${seconds} exceeds AWSTimestamp max value. Capping at ${maxTimestamp}`);
-      return maxTimestamp;
-    }
-    
-    return seconds;
-  }
-
-
-  private workOrderToGraphQL(workOrder: WorkOrder): GraphQLWorkOrder {
-    console.log('Converting workOrder to GraphQL:', JSON.stringify(workOrder, null, 2));
-    
-    const createdAtConverted = this.convertTimestampToGraphQL(workOrder.createdAt);
-    const updatedAtConverted = this.convertTimestampToGraphQL(workOrder.updatedAt);
-    
-    console.log('Timestamp conversions:', {
-      createdAt: { original: workOrder.createdAt, converted: createdAtConverted },
-      updatedAt: { original: workOrder.updatedAt, converted: updatedAtConverted }
-    });
-    
-    const result: GraphQLWorkOrder = {
-      workOrderId: workOrder.workOrderId,
-      accountId: workOrder.accountId,
-      contactId: workOrder.contactId,
-      unitId: workOrder.unitId,
-      status: workOrder.status,
-      description: workOrder.description,
-      notes: workOrder.notes ?? [],
-      createdAt: createdAtConverted ?? 0,
-      updatedAt: updatedAtConverted ?? 0,
-    };
-    
-    const deletedAt = this.convertTimestampToGraphQL(workOrder.deletedAt);
-    if (deletedAt !== undefined) {
-      result.deletedAt = deletedAt;
-    }
-    
-    console.log('Final GraphQL result:', JSON.stringify(result, null, 2));
-    
-    return result;
-  }
-
   private transformGraphQLInputToWorkOrder(input: GraphQLWorkOrderInput): Omit<CreateWorkOrderRequest, 'workOrderId'> {
     const result: Omit<CreateWorkOrderRequest, 'workOrderId'> = {
       contactId: input.contactId,
@@ -121,7 +132,7 @@ export class WorkOrderResolver {
 
   async resolve(event: AppSyncEvent): Promise<unknown> {
     const fieldName = event.info.fieldName;
-    console.log(`Resolving ${fieldName}`, JSON.stringify(event.arguments, null, 2));
+    logger.debug('Resolving field', () => ({ arguments: event.arguments }));
 
     try {
       switch (fieldName) {
@@ -133,13 +144,19 @@ export class WorkOrderResolver {
           return await this.updateWorkOrder(event as unknown as AppSyncEvent<UpdateWorkOrderArguments>);
         case 'deleteWorkOrder':
           return await this.deleteWorkOrder(event as unknown as AppSyncEvent<DeleteWorkOrderArguments>);
+        case 'createWorkOrders':
+          return await this.createWorkOrders(event as unknown as AppSyncEvent<CreateWorkOrdersArguments>);
+        case 'updateWorkOrders':
+          return await this.updateWorkOrders(event as unknown as AppSyncEvent<UpdateWorkOrdersArguments>);
+        case 'deleteWorkOrders':
+          return await this.deleteWorkOrders(event as unknown as AppSyncEvent<DeleteWorkOrdersArguments>);
         case 'listWorkOrders':
           return await this.listWorkOrders(event as unknown as AppSyncEvent<ListWorkOrdersArguments>);
         default:
           throw new Error(`Unknown field: ${fieldName}`);
       }
     } catch (error) {
-      console.error(`Error in ${fieldName}:`, error);
+      logger.error('Resolver failed', { error });
       throw error;
     }
   }
@@ -149,8 +166,10 @@ export class WorkOrderResolver {
     
     this.validateAccountAccess(accountId);
     
-    const workOrder = await this.workOrdersApiService.getWorkOrder(accountId, workOrderId, this.jwtToken);
-    return this.workOrderToGraphQL(workOrder);
+    const workOrder = await this.cache.getOrLoad(accountId, 'workOrder', workOrderId, () =>
+      this.workOrdersApiService.getWorkOrder(accountId, workOrderId, this.jwtToken)
+    );
+    return workOrderToGraphQL(workOrder);
   }
 
   private async createWorkOrder(event: AppSyncEvent<CreateWorkOrderArguments>): Promise<GraphQLWorkOrder> {
@@ -168,10 +187,13 @@ export class WorkOrderResolver {
       workOrderId,
     };
     
-    console.log('Creating work order with input:', JSON.stringify(workOrderInput, null, 2));
+    logger.debug('Creating work order', () => ({ input: workOrderInput }));
     
     const workOrder = await this.workOrdersApiService.createWorkOrder(accountId, workOrderInput, this.jwtToken);
-    return this.workOrderToGraphQL(workOrder);
+    await this.cache.invalidate(accountId, 'workOrder');
+    const created = workOrderToGraphQL(workOrder);
+    await publishChanges([changeOf('WorkOrder', 'CREATED', accountId, created.workOrderId, created)]);
+    return created;
   }
 
   private async updateWorkOrder(event: AppSyncEvent<UpdateWorkOrderArguments>): Promise<GraphQLWorkOrder> {
@@ -181,10 +203,13 @@ export class WorkOrderResolver {
     
     const updateInput = this.transformGraphQLUpdateInputToWorkOrder(input);
     
-    console.log('Updating work order with input:', JSON.stringify(updateInput, null, 2));
+    logger.debug('Updating work order', () => ({ input: updateInput }));
     
     const workOrder = await this.workOrdersApiService.updateWorkOrder(accountId, workOrderId, updateInput, this.jwtToken);
-    return this.workOrderToGraphQL(workOrder);
+    await this.cache.invalidate(accountId, 'workOrder');
+    const updated = workOrderToGraphQL(workOrder);
+    await publishChanges([changeOf('WorkOrder', 'UPDATED', accountId, workOrderId, updated, Object.keys(input))]);
+    return updated;
   }
 
   private async deleteWorkOrder(event: AppSyncEvent<DeleteWorkOrderArguments>): Promise<boolean> {
@@ -193,9 +218,105 @@ export class WorkOrderResolver {
     this.validateAccountAccess(accountId);
     
     const success = await this.workOrdersApiService.deleteWorkOrder(accountId, workOrderId, this.jwtToken);
+    await this.cache.invalidate(accountId, 'workOrder');
+    if (success) {
+      await publishChanges([changeOf('WorkOrder', 'DELETED', accountId, workOrderId)]);
+    }
     return success;
   }
 
+  private async createWorkOrders(event: AppSyncEvent<CreateWorkOrdersArguments>): Promise<GraphQLWorkOrderBulkResult[]> {
+    const { accountId, inputs } = event.arguments;
+    
+    this.validateAccountAccess(accountId);
+    assertBulkSize(inputs);
+    
+    const requests: CreateWorkOrderRequest[] = inputs.map(input => ({
+      ...this.transformGraphQLInputToWorkOrder(input),
+      workOrderId: uuidv4(),
+    }));
+    
+    const results = await runBulk(
+      requests,
+      request => this.workOrdersApiService.createWorkOrder(accountId, request, this.jwtToken),
+      { bulk: chunk => this.workOrdersApiService.createWorkOrdersBulk(accountId, chunk, this.jwtToken) }
+    );
+    await this.invalidateAfterBulk(accountId, results);
+    const workOrders = results.map(result => this.bulkResultToGraphQL(result));
+    await publishChanges(
+      workOrders.flatMap(({ workOrder }) =>
+        workOrder === null ? [] : [changeOf('WorkOrder', 'CREATED', accountId, workOrder.workOrderId, workOrder)]
+      )
+    );
+    return workOrders;
+  }
+
+  private async updateWorkOrders(event: AppSyncEvent<UpdateWorkOrdersArguments>): Promise<GraphQLWorkOrderBulkResult[]> {
+    const { accountId, inputs } = event.arguments;
+    
+    this.validateAccountAccess(accountId);
+    assertBulkSize(inputs);
+    
+    const updates = inputs.map(item => ({
+      workOrderId: item.workOrderId,
+      changes: this.transformGraphQLUpdateInputToWorkOrder(item.input),
+    }));
+    
+    const results = await runBulk(
+      updates,
+      update => this.workOrdersApiService.updateWorkOrder(accountId, update.workOrderId, update.changes, this.jwtToken),
+      { bulk: chunk => this.workOrdersApiService.updateWorkOrdersBulk(accountId, chunk, this.jwtToken) }
+    );
+    await this.invalidateAfterBulk(accountId, results);
+    const workOrders = results.map(result => this.bulkResultToGraphQL(result));
+    await publishChanges(
+      workOrders.flatMap(({ index, workOrder }) => {
+        const changed = Object.keys(inputs[index]?.input ?? {});
+        return workOrder === null ? [] : [changeOf('WorkOrder', 'UPDATED', accountId, workOrder.workOrderId, workOrder, changed)];
+      })
+    );
+    return workOrders;
+  }
+
+  private async deleteWorkOrders(event: AppSyncEvent<DeleteWorkOrdersArguments>): Promise<GraphQLDeleteBulkResult[]> {
+    const { accountId, workOrderIds } = event.arguments;
+    
+    this.validateAccountAccess(accountId);
+    assertBulkSize(workOrderIds);
+    
+    const results = await runBulk(
+      workOrderIds,
+      workOrderId => this.workOrdersApiService.deleteWorkOrder(accountId, workOrderId, this.jwtToken),
+      { bulk: chunk => this.workOrdersApiService.deleteWorkOrdersBulk(accountId, chunk, this.jwtToken) }
+    );
+    await this.invalidateAfterBulk(accountId, results);
+    await publishChanges(
+      results.flatMap(({ index, data }) => {
+        const workOrderId = workOrderIds[index];
+        return data === true && workOrderId !== undefined ? [changeOf('WorkOrder', 'DELETED', accountId, workOrderId)] : [];
+      })
+    );
+    return results.map(({ index, data, error }) => ({
+      index,
+      id: workOrderIds[index] ?? '',
+      deleted: data === true,
+      error,
+    }));
+  }
+
+  private bulkResultToGraphQL({ index, data, error }: BulkItemResult<WorkOrder>): GraphQLWorkOrderBulkResult {
+    return { index, workOrder: data === null ? null : workOrderToGraphQL(data), error };
+  }
+
+  private async invalidateAfterBulk(accountId: string, results: Array<BulkItemResult<unknown>>): Promise<void> {
+    const failed = results.filter(result => result.error !== null).length;
+    if (failed > 0) {
+      logger.warn('Bulk items failed', { failed, size: results.length });
+    }
+    // Even failed items may have been applied (a chunk can fail after the backend wrote it)
+    await this.cache.invalidate(accountId, 'workOrder');
+  }
+
   private async listWorkOrders(event: AppSyncEvent<ListWorkOrdersArguments>): Promise<GraphQLWorkOrderListResponse> {
     const { accountId, pageSize, cursor } = event.arguments;
     
@@ -207,22 +328,32 @@ export class WorkOrderResolver {
     
     if (cursor !== undefined) { options.cursor = cursor; }
     
-    const response = await this.workOrdersApiService.listWorkOrders(
-      accountId,
-      options,
-      this.jwtToken
+    const response = await this.cache.getOrLoad(accountId, 'workOrder', { list: options }, () =>
+      this.workOrdersApiService.listWorkOrders(accountId, options, this.jwtToken)
     );
     
     const result: GraphQLWorkOrderListResponse = {
-      items: response.items.map(workOrder => this.workOrderToGraphQL(workOrder)),
+      items: spanSync('transform', () => response.items.map(workOrder => workOrderToGraphQL(workOrder)), {
+        rows: response.items.length,
+      }),
       pageSize: options.pageSize ?? 20,
       count: response.items.length,
     };
     
     if (response.nextCursor !== undefined) {
       result.nextCursor = response.nextCursor;
+      this.prefetchNextPage(accountId, { ...options, cursor: response.nextCursor });
     }
     
     return result;
   }
+
+  /**
+   * Clients usually ask for the next page right away; load it in the background
+   */
+  private prefetchNextPage(accountId: string, options: { pageSize?: number; cursor?: string }): void {
+    this.cache.prefetch(accountId, 'workOrder', { list: options }, () =>
+      this.workOrdersApiService.listWorkOrders(accountId, options, this.jwtToken)
+    );
+  }
 }
\ No newline at end of file
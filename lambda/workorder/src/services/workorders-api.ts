@@ -3,21 +3,30 @@ import {
   WorkOrder,
   CreateWorkOrderRequest,
   UpdateWorkOrderRequest,
+  WorkOrderBulkOperation,
+  WorkOrderBulkResponse,
   PaginatedWorkOrderResponse,
   ProblemDetail,
 } from '../types';
+import {
+  MissingEndpointLatch,
+  PageStreamOptions,
+  getPooledClient,
+  isMissingEndpoint,
+  logger,
+  streamPages,
+  withAuth,
+} from '../shared';
+
+// Set when the backend answers that it has no bulk endpoint, so bulk
+// mutations in this container go straight to per-item calls for a while
+const bulkEndpoint = new MissingEndpointLatch();
 
 export class WorkOrdersApiService {
   private readonly client: AxiosInstance;
 
   constructor(apiUrl: string) {
-    this.client = axios.create({
-      baseURL: apiUrl,
-      timeout: 30000,
-      headers: {
-        'Content-Type': 'application/json',
-      },
-    });
+    this.client = getPooledClient(apiUrl);
   }
 
   private handleApiError(error: unknown): never {
@@ -32,10 +41,10 @@ export class WorkOrdersApiService {
       const errorMessage = axiosError.response?.statusText ?? axiosError.message;
       const statusCode = axiosError.response?.status ?? 500;
       
-      console.error('API Error:', {
+      logger.error('API response error', {
         status: statusCode,
         message: errorMessage,
-        data: JSON.stringify(axiosError.response?.data, null, 2),
+        data: axiosError.response?.data,
         url: axiosError.config?.url,
         method: axiosError.config?.method,
         requestData: axiosError.config?.data,
@@ -50,9 +59,7 @@ export class WorkOrdersApiService {
     try {
       const response = await this.client.get<WorkOrder>(
         `/accounts/${accountId}/work-orders/${workOrderId}`,
-        {
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken)
       );
       return response.data;
     } catch (error) {
@@ -62,30 +69,31 @@ export class WorkOrdersApiService {
 
   async createWorkOrder(accountId: string, workOrder: CreateWorkOrderRequest, authToken?: string): Promise<WorkOrder> {
     try {
-      // Generate missing fields that the backend requires
-      const workOrderId = workOrder.workOrderId || this.generateUuid();
-      const now = Date.now();
-      
-      const fullWorkOrder = {
-        ...workOrder,
-        workOrderId,
-        accountId,
-        createdAt: now,
-        updatedAt: now,
-      };
-      
       const response = await this.client.post<WorkOrder>(
         `/accounts/${accountId}/work-orders`,
-        fullWorkOrder,
-        {
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        this.toNewWorkOrder(accountId, workOrder),
+        withAuth(authToken)
       );
       return response.data;
     } catch (error) {
       this.handleApiError(error);
     }
   }
+
+  private toNewWorkOrder(
+    accountId: string,
+    workOrder: CreateWorkOrderRequest
+  ): Extract<WorkOrderBulkOperation, { op: 'create' }>['workOrder'] {
+    // Generate missing fields that the backend requires
+    const now = Date.now();
+    return {
+      ...workOrder,
+      workOrderId: workOrder.workOrderId || this.generateUuid(),
+      accountId,
+      createdAt: now,
+      updatedAt: now,
+    };
+  }
   
   private generateUuid(): string {
     // Simple UUID v4 generator
@@ -101,16 +109,9 @@ export class WorkOrdersApiService {
       const response = await this.client.put<WorkOrder>(
         `/accounts/${accountId}/work-orders/${workOrderId}`,
         updates,
-        {
-          headers: authToken 
-            ? { 
-                Authorization: `Bearer ${authToken}`,
-                'Content-Type': 'application/merge-patch+json'
-              } 
-            : {
-                'Content-Type': 'application/merge-patch+json'
-              },
-        }
+        withAuth(authToken, {
+          headers: { 'Content-Type': 'application/merge-patch+json' },
+        })
       );
       return response.data;
     } catch (error) {
@@ -122,9 +123,7 @@ export class WorkOrdersApiService {
     try {
       await this.client.delete(
         `/accounts/${accountId}/work-orders/${workOrderId}`,
-        {
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken)
       );
       return true;
     } catch (error) {
@@ -132,14 +131,104 @@ export class WorkOrdersApiService {
     }
   }
 
+  /**
+   * Create work orders through the backend's bulk endpoint: one work order or
+   * Error per request, in order, or undefined if the backend has no bulk
+   * endpoint
+   */
+  async createWorkOrdersBulk(
+    accountId: string,
+    workOrders: CreateWorkOrderRequest[],
+    authToken?: string
+  ): Promise<Array<WorkOrder | Error> | undefined> {
+    const results = await this.sendBulk(
+      accountId,
+      workOrders.map(workOrder => ({ op: 'create' as const, workOrder: this.toNewWorkOrder(accountId, workOrder) })),
+      authToken
+    );
+    return results?.map(result => this.bulkResultToWorkOrder(result));
+  }
+
+  /**
+   * Update work orders through the bulk endpoint; see `createWorkOrdersBulk`
+   */
+  async updateWorkOrdersBulk(
+    accountId: string,
+    updates: Array<{ workOrderId: string; changes: UpdateWorkOrderRequest }>,
+    authToken?: string
+  ): Promise<Array<WorkOrder | Error> | undefined> {
+    const results = await this.sendBulk(
+      accountId,
+      updates.map(update => ({ op: 'update' as const, ...update })),
+      authToken
+    );
+    return results?.map(result => this.bulkResultToWorkOrder(result));
+  }
+
+  /**
+   * Delete work orders through the bulk endpoint; see `createWorkOrdersBulk`
+   */
+  async deleteWorkOrdersBulk(
+    accountId: string,
+    workOrderIds: string[],
+    authToken?: string
+  ): Promise<Array<boolean | Error> | undefined> {
+    const results = await this.sendBulk(
+      accountId,
+      workOrderIds.map(workOrderId => ({ op: 'delete' as const, workOrderId })),
+      authToken
+    );
+    return results?.map(result => (result.error !== undefined || result.status >= 400 ? this.bulkError(result) : true));
+  }
+
+  private async sendBulk(
+    accountId: string,
+    operations: WorkOrderBulkOperation[],
+    authToken?: string
+  ): Promise<WorkOrderBulkResponse['results'] | undefined> {
+    if (bulkEndpoint.missing) {
+      return undefined;
+    }
+    try {
+      const response = await this.client.post<WorkOrderBulkResponse>(
+        `/accounts/${accountId}/work-orders/bulk`,
+        { operations },
+        withAuth(authToken)
+      );
+      return response.data.results;
+    } catch (error) {
+      if (isMissingEndpoint(error)) {
+        bulkEndpoint.markMissing();
+        logger.info('No work order bulk endpoint; writing one work order per call');
+        return undefined;
+      }
+      this.handleApiError(error);
+    }
+  }
+
+  private bulkResultToWorkOrder(result: WorkOrderBulkResponse['results'][number]): WorkOrder | Error {
+    if (result.error !== undefined || result.status >= 400 || result.workOrder === undefined) {
+      return this.bulkError(result);
+    }
+    return result.workOrder;
+  }
+
+  private bulkError(result: WorkOrderBulkResponse['results'][number]): Error {
+    return new Error(result.error?.detail ?? result.error?.title ?? `Failed with status ${result.status}`);
+  }
+
   async listWorkOrders(
     accountId: string,
-    options: { pageSize?: number; cursor?: string } = {},
+    options: { pageSize?: number; cursor?: string; unitId?: string } = {},
     authToken?: string
   ): Promise<PaginatedWorkOrderResponse> {
     try {
       const params = new URLSearchParams();
       
+      if (options.unitId !== undefined) {
+        params.append('unitId', options.unitId);
+      }
+      
       if (options.pageSize !== undefined) {
         params.append('pageSize', options.pageSize.toString());
       }
@@ -150,10 +239,7 @@ export class WorkOrdersApiService {
       
       const response = await this.client.get<PaginatedWorkOrderResponse>(
         `/accounts/${accountId}/work-orders`,
-        {
-          params,
-          headers: authToken ? { Authorization: `Bearer ${authToken}` } : {},
-        }
+        withAuth(authToken, { params })
       );
       
       return response.data;
@@ -161,4 +247,19 @@ export class WorkOrdersApiService {
       this.handleApiError(error);
     }
   }
+
+  /**
+   * Stream all of an account's work orders page by page, prefetching the next page
+   */
+  streamWorkOrders(
+    accountId: string,
+    pageSize = 100,
+    authToken?: string,
+    options?: PageStreamOptions
+  ): AsyncGenerator<WorkOrder[], void, undefined> {
+    return streamPages(
+      cursor => this.listWorkOrders(accountId, { pageSize, ...(cursor !== undefined && { cursor }) }, authToken),
+      options
+    );
+  }
 }
\ No newline at end of file
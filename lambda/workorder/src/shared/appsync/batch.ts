@@ -0,0 +1,135 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+/**
+ * Minimal shape shared by every lambda's AppSync event type
+ */
+export interface BatchableEvent {
+  info?: {
+    fieldName: string;
+  };
+}
+
+/**
+ * One entry of a BatchInvoke response. The batch response template turns
+ * errorMessage/errorType into a field error for that item only.
+ */
+export interface BatchItemResult {
+  data: unknown;
+  errorMessage?: string;
+  errorType?: string;
+}
+
+/**
+ * Resolve every event of one field at once. Must return one entry per input
+ * event, in the same order; an Error entry fails only that item.
+ */
+export type BatchFieldResolver<E> = (events: E[]) => Promise<unknown[]>;
+
+/**
+ * Answer a BatchInvoke payload.
+ *
+ * Events are grouped by fieldName. Fields with a batch resolver are answered
+ * with a single call for the whole group; any other field falls back to
+ * `resolveOne` per event. Results come back in payload order, and a failure
+ * is reported on the items it affects instead of failing the whole batch.
+ */
+export async function resolveBatch<E extends BatchableEvent>(
+  events: E[],
+  batchResolvers: Partial<Record<string, BatchFieldResolver<E>>>,
+  resolveOne: (event: E) => Promise<unknown>,
+): Promise<BatchItemResult[]> {
+  const results = new Array<BatchItemResult>(events.length);
+  const groups = new Map<string, number[]>();
+  events.forEach((event, index) => {
+    const fieldName = event.info?.fieldName ?? '';
+    const group = groups.get(fieldName);
+    if (group === undefined) {
+      groups.set(fieldName, [index]);
+    } else {
+      group.push(index);
+    }
+  });
+
+  await Promise.all(
+    [...groups].map(async ([fieldName, indexes]) => {
+      const resolver = batchResolvers[fieldName];
+      if (resolver === undefined) {
+        await Promise.all(
+          indexes.map(async index => {
+            results[index] = await settle(() => resolveOne(events[index] as E));
+          }),
+        );
+        return;
+      }
+
+      let values: unknown[];
+      try {
+        values = await resolver(indexes.map(index => events[index] as E));
+      } catch (error) {
+        const failed = toBatchItemResult(asError(error));
+        indexes.forEach(index => {
+          results[index] = failed;
+        });
+        return;
+      }
+      indexes.forEach((index, position) => {
+        results[index] = toBatchItemResult(values[position] ?? null);
+      });
+    }),
+  );
+
+  return results;
+}
+
+/**
+ * Group values by key, keeping each group in input order
+ */
+export function groupBy<T>(items: readonly T[], keyOf: (item: T) => string): Map<string, T[]> {
+  const groups = new Map<string, T[]>();
+  for (const item of items) {
+    const key = keyOf(item);
+    const group = groups.get(key);
+    if (group === undefined) {
+      groups.set(key, [item]);
+    } else {
+      group.push(item);
+    }
+  }
+  return groups;
+}
+
+/**
+ * Resolve a batch of parent rows to the entity each one points at.
+ *
+ * `idOf` picks the referenced ID from an event's source (undefined resolves
+ * to null). IDs are deduplicated and loaded with one `loadMany` call; an ID
+ * missing from the returned map resolves to null.
+ */
+export async function resolveBySourceId<E, V>(
+  events: readonly E[],
+  idOf: (event: E) => string | null | undefined,
+  loadMany: (ids: string[]) => Promise<Map<string, V | Error>>,
+): Promise<Array<V | Error | null>> {
+  const ids = events.map(idOf);
+  const unique = [...new Set(ids.filter((id): id is string => typeof id === 'string' && id !== ''))];
+  const loaded = unique.length > 0 ? await loadMany(unique) : new Map<string, V | Error>();
+  return ids.map(id => (typeof id === 'string' && id !== '' ? loaded.get(id) ?? null : null));
+}
+
+function toBatchItemResult(value: unknown): BatchItemResult {
+  if (value instanceof Error) {
+    return { data: null, errorMessage: value.message, errorType: value.name };
+  }
+  return { data: value };
+}
+
+function asError(error: unknown): Error {
+  return error instanceof Error ? error : new Error(String(error));
+}
+
+async function settle(run: () => Promise<unknown>): Promise<BatchItemResult> {
+  try {
+    return toBatchItemResult(await run());
+  } catch (error) {
+    return toBatchItemResult(asError(error));
+  }
+}
@@ -0,0 +1,116 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import { spanSync } from '../tracing/tracer';
+import type { InvocationTimer } from '../utils/deadline';
+import type { BatchItemResult } from './batch';
+
+const NO_FIELDS: ReadonlySet<string> = new Set();
+
+/**
+ * Drop null and undefined fields from a resolver result, at any depth, before
+ * it is serialized for AppSync, which answers an absent field as null anyway.
+ * A unit carries dozens of VIN-decode fields that are mostly null.
+ *
+ * The values of `jsonFields` (fields typed AWSJSON in the schema, such as
+ * `extendedAttributes`) are client data rather than schema-typed fields: they
+ * are returned exactly as stored, nulls inside them included.
+ *
+ * Copy on write: an object without null fields (a projected row, say) is
+ * returned as is, and an object shared by several parents is compacted once
+ * and stays shared. List entries are never dropped, since their positions
+ * matter.
+ */
+export function compact<T>(value: T, jsonFields: ReadonlySet<string> = NO_FIELDS): T {
+  return compactValue(value, jsonFields, new Map()) as T;
+}
+
+function compactValue(value: unknown, jsonFields: ReadonlySet<string>, seen: Map<object, unknown>): unknown {
+  if (value === null || typeof value !== 'object' || value instanceof Date) {
+    return value;
+  }
+  const done = seen.get(value);
+  if (done !== undefined) {
+    return done;
+  }
+  // Marks the object as in progress, so a cycle ends here instead of recursing forever
+  seen.set(value, value);
+
+  let result: unknown = value;
+  if (Array.isArray(value)) {
+    let copy: unknown[] | undefined;
+    for (let index = 0; index < value.length; index += 1) {
+      const entry: unknown = value[index];
+      const compacted = compactValue(entry, jsonFields, seen);
+      if (compacted !== entry) {
+        copy = copy ?? value.slice();
+        copy[index] = compacted;
+      }
+    }
+    result = copy ?? value;
+  } else {
+    const source = value as Record<string, unknown>;
+    const keys = Object.keys(source);
+    let copy: Record<string, unknown> | undefined;
+    for (let index = 0; index < keys.length; index += 1) {
+      const key = keys[index] as string;
+      const entry = source[key];
+      let compacted: unknown;
+      if (entry !== null && entry !== undefined) {
+        compacted = jsonFields.has(key) ? entry : compactValue(entry, jsonFields, seen);
+      }
+      if (copy === undefined && (compacted === undefined || compacted !== entry)) {
+        // First change: keep the fields before it as they are
+        copy = {};
+        for (const earlier of keys.slice(0, index)) {
+          copy[earlier] = source[earlier];
+        }
+      }
+      if (copy !== undefined && compacted !== undefined) {
+        copy[key] = compacted;
+      }
+    }
+    result = copy ?? value;
+  }
+  seen.set(value, result);
+  return result;
+}
+
+/**
+ * Whether resolver results are compacted before they are returned
+ * (RESPONSE_COMPACT, default on)
+ */
+export function responseCompactionEnabled(): boolean {
+  return process.env['RESPONSE_COMPACT'] !== 'false';
+}
+
+/**
+ * Wrap a Lambda handler so its result is compacted (see `compact`). For a
+ * BatchInvoke only each item's `data` is, so every item keeps the shape the
+ * batch response template reads. `jsonFields` names the AWSJSON fields of the
+ * types the handler returns; their values are left alone. Timed as a `shape`
+ * span.
+ */
+export function withCompactResponses<E, R>(
+  handle: (event: E, timer?: InvocationTimer) => Promise<R>,
+  jsonFields: readonly string[] = [],
+): (event: E, timer?: InvocationTimer) => Promise<R> {
+  const skip = jsonFields.length === 0 ? NO_FIELDS : new Set(jsonFields);
+  return async (event, timer) => {
+    const result = await handle(event, timer);
+    if (!responseCompactionEnabled()) {
+      return result;
+    }
+    return spanSync('shape', () => {
+      if (Array.isArray(event) && Array.isArray(result)) {
+        return result.map((item: unknown) => {
+          const batchItem = item as BatchItemResult | null;
+          if (batchItem === null || typeof batchItem !== 'object' || !('data' in batchItem)) {
+            return item;
+          }
+          const data = compact(batchItem.data, skip);
+          return data === batchItem.data ? item : { ...batchItem, data };
+        }) as R;
+      }
+      return compact(result, skip);
+    });
+  };
+}
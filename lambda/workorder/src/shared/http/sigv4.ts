@@ -0,0 +1,74 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+import crypto from 'crypto';
+
+export interface AwsCredentials {
+  accessKeyId: string;
+  secretAccessKey: string;
+  sessionToken?: string;
+}
+
+/**
+ * The function role's credentials, as Lambda puts them in the environment
+ */
+export function credentialsFromEnv(): AwsCredentials | undefined {
+  const accessKeyId = process.env['AWS_ACCESS_KEY_ID'];
+  const secretAccessKey = process.env['AWS_SECRET_ACCESS_KEY'];
+  if (!accessKeyId || !secretAccessKey) {
+    return undefined;
+  }
+  const sessionToken = process.env['AWS_SESSION_TOKEN'];
+  return { accessKeyId, secretAccessKey, ...(sessionToken !== undefined && sessionToken !== '' && { sessionToken }) };
+}
+
+export const sha256 = (data: string | Buffer): string => crypto.createHash('sha256').update(data).digest('hex');
+const hmac = (key: string | Buffer, data: string): Buffer => crypto.createHmac('sha256', key).update(data, 'utf8').digest();
+
+export interface SignedRequest {
+  method: string;
+  /** The request URL; its path must already be URI-encoded, and it has no query string */
+  url: URL;
+  /** Headers to sign besides host, x-amz-date and the session token, with lower-case names */
+  headers: Record<string, string>;
+  /** Hex SHA-256 of the body */
+  payloadHash: string;
+  service: string;
+  region: string;
+}
+
+/**
+ * Signature Version 4 headers for `request`: its own headers plus host,
+ * x-amz-date, the session token of temporary credentials and the
+ * authorization header, so the shared code can call AWS APIs without an SDK
+ */
+export function signRequest(
+  request: SignedRequest,
+  credentials: AwsCredentials,
+  now: Date = new Date(),
+): Record<string, string> {
+  const amzDate = now.toISOString().replace(/[-:]|\.\d{3}/g, '');
+  const date = amzDate.slice(0, 8);
+  const headers: Record<string, string> = {
+    ...request.headers,
+    host: request.url.host,
+    'x-amz-date': amzDate,
+    ...(credentials.sessionToken !== undefined && { 'x-amz-security-token': credentials.sessionToken }),
+  };
+  const names = Object.keys(headers).sort();
+  const signedHeaders = names.join(';');
+  const canonicalRequest = [
+    request.method,
+    request.url.pathname || '/',
+    '',
+    names.map(name => `${name}:${headers[name] ?? ''}\n`).join(''),
+    signedHeaders,
+    request.payloadHash,
+  ].join('\n');
+  const scope = `${date}/${request.region}/${request.service}/aws4_request`;
+  const stringToSign = ['AWS4-HMAC-SHA256', amzDate, scope, sha256(canonicalRequest)].join('\n');
+  const key = hmac(hmac(hmac(hmac(`AWS4${credentials.secretAccessKey}`, date), request.region), request.service), 'aws4_request');
+  const signature = crypto.createHmac('sha256', key).update(stringToSign, 'utf8').digest('hex');
+  return {
+    ...headers,
+    authorization: `AWS4-HMAC-SHA256 Credential=${credentials.accessKeyId}/${scope}, SignedHeaders=${signedHeaders}, Signature=${signature}`,
+  };
+}
@@ -0,0 +1,37 @@
+// Synced from lambda/shared/src by lambda/shared/sync.sh - do not edit this copy.
+/**
+ * Map over items with at most `limit` mapper calls in flight at once.
+ * Results are returned in input order.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  mapper: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  const workerCount = Math.max(1, Math.min(limit, items.length));
+  let nextIndex = 0;
+
+  const worker = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex;
+      nextIndex += 1;
+      results[index] = await mapper(items[index] as T, index);
+    }
+  };
+
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+}
+
+/**
+ * Read a positive integer from the environment, falling back to a default
+ */
+export function envInt(name: string, fallback: number): number {
+  const raw = process.env[name];
+  if (raw === undefined || raw === '') {
+    return fallback;
+  }
+  const value = parseInt(raw, 10);
+  return Number.isNaN(value) || value <= 0 ? fallback : value;
+}
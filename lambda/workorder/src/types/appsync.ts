@@ -30,7 +30,7 @@ export interface AppSyncEvent<TArguments = Record<string, unknown>> {
   stash: Record<string, unknown>;
 }
 
-import { GraphQLWorkOrderInput, GraphQLWorkOrderUpdateInput } from './workorder';
+import { GraphQLWorkOrderInput, GraphQLWorkOrderUpdateInput, GraphQLWorkOrderUpdateItem } from './workorder';
 
 // Argument types for each operation
 export interface GetWorkOrderArguments {
@@ -54,6 +54,21 @@ export interface DeleteWorkOrderArguments {
   workOrderId: string;
 }
 
+export interface CreateWorkOrdersArguments {
+  accountId: string;
+  inputs: GraphQLWorkOrderInput[];
+}
+
+export interface UpdateWorkOrdersArguments {
+  accountId: string;
+  inputs: GraphQLWorkOrderUpdateItem[];
+}
+
+export interface DeleteWorkOrdersArguments {
+  accountId: string;
+  workOrderIds: string[];
+}
+
 export interface ListWorkOrdersArguments {
   accountId: string;
   pageSize?: number;
@@ -66,11 +81,16 @@ export {
   WorkOrder,
   CreateWorkOrderRequest,
   UpdateWorkOrderRequest,
+  WorkOrderBulkOperation,
+  WorkOrderBulkResponse,
   PaginatedWorkOrderResponse,
   ProblemDetail,
   ValidationError,
   GraphQLWorkOrder,
   GraphQLWorkOrderInput,
   GraphQLWorkOrderUpdateInput,
-  GraphQLWorkOrderListResponse
+  GraphQLWorkOrderListResponse,
+  GraphQLWorkOrderUpdateItem,
+  GraphQLWorkOrderBulkResult,
+  GraphQLDeleteBulkResult
 } from './workorder';
\ No newline at end of file
@@ -1,3 +1,5 @@
+import { BulkItemError } from '../shared';
+
 export type WorkOrderStatus = 'draft' | 'pending' | 'inProgress' | 'completed';
 
 export interface WorkOrder {
@@ -30,6 +32,26 @@ export interface UpdateWorkOrderRequest {
   notes?: string[];
 }
 
+/**
+ * One operation sent to the backend's bulk endpoint
+ * (POST /accounts/{accountId}/work-orders/bulk)
+ */
+export type WorkOrderBulkOperation =
+  | { op: 'create'; workOrder: CreateWorkOrderRequest & { workOrderId: string; accountId: string; createdAt: number; updatedAt: number } }
+  | { op: 'update'; workOrderId: string; changes: UpdateWorkOrderRequest }
+  | { op: 'delete'; workOrderId: string };
+
+/**
+ * The bulk endpoint's answer: one result per operation, in order
+ */
+export interface WorkOrderBulkResponse {
+  results: Array<{
+    status: number;
+    workOrder?: WorkOrder;
+    error?: ProblemDetail;
+  }>;
+}
+
 export interface PaginatedWorkOrderResponse {
   items: WorkOrder[];
   nextCursor?: string;
@@ -84,4 +106,21 @@ export interface GraphQLWorkOrderListResponse {
   nextCursor?: string;
   pageSize: number;
   count: number;
-}
\ No newline at end of file
+}
+export interface GraphQLWorkOrderUpdateItem {
+  workOrderId: string;
+  input: GraphQLWorkOrderUpdateInput;
+}
+
+export interface GraphQLWorkOrderBulkResult {
+  index: number;
+  workOrder: GraphQLWorkOrder | null;
+  error: BulkItemError | null;
+}
+
+export interface GraphQLDeleteBulkResult {
+  index: number;
+  id: string;
+  deleted: boolean;
+  error: BulkItemError | null;
+}
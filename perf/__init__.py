@@ -0,0 +1 @@
+"""Offline performance harness for the resolver lambdas (see perf/bench.py)."""
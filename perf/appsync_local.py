@@ -0,0 +1,408 @@
+"""Local stand-in for the AppSync endpoint, routing to the lambda handlers.
+
+Accepts GraphQL POSTs on /graphql, resolves every root field through the
+compiled handler of the lambda that owns it (the same Direct Lambda payload
+lambda-request.vtl builds), and answers {"data": ..., "errors": [...]} shaped
+to the selection set. Each lambda runs in one warm Node process, so
+concurrent requests interleave the way they would in a warm container.
+
+    python -m perf.appsync_local --stub-backend --latency-ms 20
+    python -m perf.appsync_local --port 4000        # lambdas use their *_API_URL settings
+
+Identity comes from the bearer token's claims (not verified) or, without a
+token, from lambda-test-payload.json. Only root fields are resolved; nested
+fields backed by their own resolvers (WorkOrder.unit, EventWithUnitInfo.unit)
+come back as the root resolver returned them. A Server-Timing header carries
+each root resolver's handler time; with TRACING_ENABLED=true and
+TRACING_EXTENSION=true in the environment, the response also carries each
+root resolver's spans as `extensions.timing` (AppSync itself cannot return
+extensions from a Lambda resolver, so there the spans only go to CloudWatch).
+
+With --layout gateway every field goes to the consolidated handler
+(lambda/gateway) instead of its own lambda, and --lambda-scaling runs one
+invocation per container at a time with idle containers reclaimed, as Lambda
+does, so cold starts happen under load (see perf.layouts). Aggregate fields
+such as getUnitDetail only exist in the gateway, so they go there in either
+layout.
+
+The change feed runs here too: publishChange is answered in-process, as the
+NONE data source does, and each change goes to the subscriptions registered
+with `subscribe` whose filters match (the filter groups of
+change-subscription-response.vtl). Point the lambdas' CHANGE_FEED_URL at this
+server to have their mutations publish. Subscriptions are Python callbacks,
+not the WebSocket protocol.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+from .fleet import Fleet, FleetStats
+from .graphql import FieldNode, GraphQLSyntaxError, parse_operation, project, selection_set_list
+from .handler_process import ARTIFACTS, handler_module
+from .scenarios import load_payload
+from .stub_backend import BackendConfig, StubBackend
+
+# Root field name, minus its get/list/create/update/delete verb, starts with
+# the entity; longest entity names first
+FIELD_ENTITIES = [
+    ("LaborLine", "laborline"),
+    ("WorkOrder", "workorder"),
+    ("Location", "location"),
+    ("Account", "account"),
+    ("Contact", "contact"),
+    ("Event", "event"),
+    ("Part", "part"),
+    ("Task", "task"),
+    ("Unit", "unit"),
+]
+VERBS = ("get", "list", "create", "update", "delete")
+LAYOUTS = ("split", "gateway")
+GATEWAY = "gateway"
+# Aggregate fields: only the gateway answers them, in either layout
+GATEWAY_FIELDS = {"getUnitDetail"}
+# Fields AppSync answers itself, from a NONE data source
+LOCAL_FIELDS = {"publishChange"}
+# Change-feed subscription field => (Change entity, argument that narrows it)
+CHANGE_SUBSCRIPTIONS = {
+    "onWorkOrderChanged": ("WorkOrder", "unitId"),
+    "onEventChanged": ("Event", "unitId"),
+    "onTaskChanged": ("Task", "workOrderId"),
+}
+
+
+def function_for(field_name: str) -> str | None:
+    """The lambda that resolves a root Query/Mutation field."""
+    if field_name in GATEWAY_FIELDS:
+        return GATEWAY
+    for verb in VERBS:
+        if field_name.startswith(verb):
+            entity = field_name[len(verb):]
+            for prefix, function in FIELD_ENTITIES:
+                if entity.startswith(prefix):
+                    return function
+    return None
+
+
+def change_matches(field_name: str, arguments: dict, change: dict) -> bool:
+    """Whether a published change reaches a change-feed subscription: the
+    account's changes to the entity, narrowed by the key argument and by
+    status (a status change always gets through, the row may have left the
+    list); deletes carry only the id and always get through."""
+    entity, key = CHANGE_SUBSCRIPTIONS[field_name]
+    if change.get("entity") != entity or change.get("accountId") != arguments.get("accountId"):
+        return False
+    if change.get("operation") == "DELETED":
+        return True
+    if arguments.get(key) and change.get(key) != arguments[key]:
+        return False
+    statuses = arguments.get("status")
+    return not statuses or change.get("status") in statuses or change.get("statusChanged") is True
+
+
+@dataclass
+class ChangeSubscription:
+    field: str
+    arguments: dict
+    callback: Callable[[dict], None]
+
+
+def _claims_from(authorization: str | None) -> dict | None:
+    if not authorization:
+        return None
+    token = authorization.split(" ", 1)[-1]
+    segments = token.split(".")
+    if len(segments) != 3:
+        return None
+    try:
+        padded = segments[1] + "=" * (-len(segments[1]) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError:
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+class LocalAppSync:
+    """Resolve GraphQL requests through the lambda handlers."""
+
+    def __init__(self, env: dict[str, str] | None = None, show_logs: bool = False, node: str = "node",
+                 layout: str = "split", artifact: str = "dist", container_concurrency: int | None = None,
+                 idle_timeout_s: float | None = None):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout {layout!r}; expected one of {', '.join(LAYOUTS)}")
+        self.env = env or {}
+        self.show_logs = show_logs
+        self.node = node
+        self.layout = layout
+        self.artifact = artifact
+        self.container_concurrency = container_concurrency
+        self.idle_timeout_s = idle_timeout_s
+        self.template = load_payload()
+        self._fleets: dict[str, Fleet] = {}
+        self._connections: set[asyncio.Task] = set()
+        self._subscriptions: list[ChangeSubscription] = []
+        self.changes_published = 0
+        self.changes_delivered = 0
+
+    def close(self) -> None:
+        for fleet in self._fleets.values():
+            fleet.close()
+        self._fleets.clear()
+
+    def deployment_for(self, function: str) -> str:
+        """The deployed function that serves a lambda's fields in this layout."""
+        return GATEWAY if self.layout == GATEWAY else function
+
+    def start(self, functions: list[str] | None = None) -> list[str]:
+        """Load the given lambdas (default: every built one) ahead of traffic; returns those started."""
+        if self.layout == GATEWAY:
+            self._fleet(GATEWAY).start()
+            return [GATEWAY]
+        candidates = functions or sorted({function for _, function in FIELD_ENTITIES})
+        started = [function for function in candidates if functions or handler_module(function, self.artifact).exists()]
+        for function in started:
+            self._fleet(function).start()
+        return started
+
+    def stats(self) -> dict[str, FleetStats]:
+        """Invocations and cold starts per deployed function so far."""
+        return {name: fleet.stats for name, fleet in sorted(self._fleets.items())}
+
+    def reset_stats(self) -> None:
+        for fleet in self._fleets.values():
+            fleet.reset_stats()
+        self.changes_published = self.changes_delivered = 0
+
+    def subscribe(self, field_name: str, arguments: dict, callback: Callable[[dict], None]) -> Callable[[], None]:
+        """Register a change-feed subscription; `callback` gets each matching
+        change as subscribers receive it (`changes` as an AWSJSON string).
+        Returns a function that unsubscribes."""
+        if field_name not in CHANGE_SUBSCRIPTIONS:
+            raise ValueError(f"Unknown subscription {field_name!r}; expected one of {', '.join(CHANGE_SUBSCRIPTIONS)}")
+        if arguments.get("accountId") != self.template["identity"]["claims"]["sub"]:
+            raise PermissionError(f"Not Authorized to subscribe to {field_name} for another account")
+        subscription = ChangeSubscription(field_name, dict(arguments), callback)
+        self._subscriptions.append(subscription)
+        return lambda: self._subscriptions.remove(subscription)
+
+    def publish(self, change: dict) -> dict:
+        """Deliver a change to the matching subscriptions, as publishChange does."""
+        self.changes_published += 1
+        for subscription in list(self._subscriptions):
+            if change_matches(subscription.field, subscription.arguments, change):
+                self.changes_delivered += 1
+                subscription.callback(change)
+        return change
+
+    def _fleet(self, function: str) -> Fleet:
+        deployment = self.deployment_for(function)
+        if deployment not in self._fleets:
+            self._fleets[deployment] = Fleet(
+                deployment,
+                env=self.env,
+                node=self.node,
+                show_logs=self.show_logs,
+                # The gateway's dist/ is already a bundle
+                artifact="dist" if deployment == GATEWAY else self.artifact,
+                container_concurrency=self.container_concurrency,
+                idle_timeout_s=self.idle_timeout_s,
+            )
+        return self._fleets[deployment]
+
+    def _identity_and_headers(self, headers: dict[str, str]) -> tuple[dict, dict]:
+        claims = _claims_from(headers.get("authorization"))
+        if claims is None:
+            # No usable token: act as the account in the test payload
+            template_headers = self.template.get("request", {}).get("headers", {})
+            return dict(self.template["identity"], sub=self.template["identity"]["claims"]["sub"]), {**template_headers, **headers}
+        identity = {
+            "sub": claims.get("sub"),
+            "claims": claims,
+            "issuer": claims.get("iss"),
+            "username": claims.get("cognito:username", claims.get("sub")),
+            "groups": claims.get("cognito:groups"),
+            "defaultAuthStrategy": "ALLOW",
+            "sourceIp": ["127.0.0.1"],
+        }
+        return identity, headers
+
+    async def _resolve(self, node: FieldNode, parent_type: str, variables: dict, identity: dict,
+                       headers: dict) -> tuple[object, dict | None, float, dict | None]:
+        if node.name in LOCAL_FIELDS:
+            return project(self.publish(dict(node.arguments.get("change") or {})), node.selections), None, 0.0, None
+        function = function_for(node.name)
+        if function is None:
+            return None, {"message": f"No resolver for {parent_type}.{node.name}", "errorType": "UnknownField"}, 0.0, None
+        event = {
+            "arguments": node.arguments,
+            "identity": identity,
+            "source": None,
+            "request": {"headers": headers},
+            "info": {
+                "fieldName": node.name,
+                "parentTypeName": parent_type,
+                "variables": variables,
+                "selectionSetList": selection_set_list(node),
+                "selectionSetGraphQL": "",
+            },
+            "prev": None,
+            "stash": {},
+        }
+        try:
+            invocation, _ = await self._fleet(function).invoke(event, echo=True)
+        except (FileNotFoundError, RuntimeError) as error:
+            return None, {"message": str(error), "errorType": "Lambda:Unhandled"}, 0.0, None
+        duration_ms = invocation.duration_ns / 1e6
+        if not invocation.ok:
+            return None, {"message": invocation.error, "errorType": "Lambda:Unhandled"}, duration_ms, invocation.timing
+        return project(invocation.result, node.selections), None, duration_ms, invocation.timing
+
+    async def execute(self, body: dict, headers: dict[str, str]) -> tuple[dict, dict[str, float]]:
+        """The GraphQL response for a request body, and handler time per root field."""
+        try:
+            operation = parse_operation(body.get("query") or "", body.get("variables") or {}, body.get("operationName"))
+        except GraphQLSyntaxError as error:
+            return {"data": None, "errors": [{"message": str(error), "errorType": "MalformedHttpRequestException"}]}, {}
+        if operation.kind == "subscription":
+            return {"data": None, "errors": [{"message": "Subscriptions are not served over HTTP locally; use LocalAppSync.subscribe"}]}, {}
+
+        parent_type = "Mutation" if operation.kind == "mutation" else "Query"
+        identity, request_headers = self._identity_and_headers(headers)
+
+        async def resolve(node: FieldNode):
+            return await self._resolve(node, parent_type, operation.variables, identity, request_headers)
+
+        if operation.kind == "mutation":
+            # Root mutation fields run one after another
+            outcomes = [await resolve(node) for node in operation.fields]
+        else:
+            outcomes = await asyncio.gather(*(resolve(node) for node in operation.fields))
+
+        data, errors, timings, spans = {}, [], {}, {}
+        for node, (value, error, duration_ms, timing) in zip(operation.fields, outcomes):
+            data[node.response_key] = value
+            timings[node.response_key] = duration_ms
+            if timing is not None:
+                spans[node.response_key] = timing
+            if error is not None:
+                errors.append({**error, "path": [node.response_key], "locations": []})
+        response = {"data": data}
+        if errors:
+            response["errors"] = errors
+        if spans:
+            response["extensions"] = {"timing": spans}
+        return response, timings
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """Wait for open client connections to finish once clients have closed them."""
+        if self._connections:
+            await asyncio.wait(set(self._connections), timeout=timeout)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+            task.add_done_callback(self._connections.discard)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                raw = await reader.readexactly(int(headers.get("content-length") or 0))
+
+                status, extra_headers = 200, {}
+                if method == "GET" and path == "/health":
+                    payload = {"ok": True}
+                elif method == "POST" and path.split("?")[0] == "/graphql":
+                    try:
+                        body = json.loads(raw or b"{}")
+                    except ValueError:
+                        status, payload = 400, {"errors": [{"message": "Request body is not JSON"}]}
+                    else:
+                        payload, timings = await self.execute(body, headers)
+                        extra_headers["Server-Timing"] = ", ".join(f"{key};dur={ms:.2f}" for key, ms in timings.items())
+                else:
+                    status, payload = 404, {"errors": [{"message": f"No route for {method} {path}"}]}
+
+                encoded = json.dumps(payload).encode()
+                head = [f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}", "Content-Type: application/json",
+                        f"Content-Length: {len(encoded)}", *(f"{name}: {value}" for name, value in extra_headers.items() if value)]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + encoded)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(app: LocalAppSync, host: str, port: int) -> None:
+    server = await asyncio.start_server(app.handle_connection, host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Local AppSync listening on http://{address[0]}:{address[1]}/graphql", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = BackendConfig()
+    parser = argparse.ArgumentParser(prog="python -m perf.appsync_local", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--stub-backend", action="store_true", help="point every lambda at an in-process stub backend")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="stub backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--units", type=int, default=defaults.units)
+    parser.add_argument("--items", type=int, help="records per list for the other stub entities")
+    parser.add_argument("--log-level", default="WARN", help="LOG_LEVEL for the lambdas")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--node", default="node")
+    parser.add_argument("--layout", choices=LAYOUTS, default="split",
+                        help="split: each lambda on its own; gateway: every field through lambda/gateway")
+    parser.add_argument("--artifact", choices=ARTIFACTS, default="dist", help="which build of the split lambdas to run")
+    parser.add_argument("--lambda-scaling", action="store_true",
+                        help="one invocation per container at a time, new containers cold-start under load")
+    parser.add_argument("--idle-timeout", type=float, help="seconds before an idle container is reclaimed")
+    args = parser.parse_args(argv)
+
+    env = {"LOG_LEVEL": args.log_level}
+    backend = None
+    if args.stub_backend:
+        config = BackendConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, units=args.units)
+        if args.items is not None:
+            config.locations = config.contacts = config.tasks = config.parts = config.labor_lines = args.items
+        backend = StubBackend(config).start()
+        env.update(backend.env())
+        print(f"Stub backend on {backend.url}", file=sys.stderr)
+
+    app = LocalAppSync(env=env, show_logs=args.show_logs, node=args.node, layout=args.layout, artifact=args.artifact,
+                       container_concurrency=1 if args.lambda_scaling else None, idle_timeout_s=args.idle_timeout)
+    print(f"Loaded lambdas: {', '.join(app.start()) or 'none built'}", file=sys.stderr)
+    try:
+        asyncio.run(serve(app, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        app.close()
+        if backend is not None:
+            backend.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""Benchmark the compiled resolver lambdas against local stub backends.
+
+Each selected GraphQL field is invoked through its lambda's real handler
+(lambda/<fn>/dist/index.js) with events shaped like lambda-test-payload.json,
+while every *_API_URL points at an in-process stub backend with configurable
+latency and dataset size. Reports throughput, p50/p95/p99 handler latency
+and backend calls per operation for each field.
+
+    # build the lambdas first (npm run build in each lambda/<fn>)
+    python -m perf.bench
+    python -m perf.bench --fields getUnitWithWorkOrders,listEventsByStatus --units 200 --latency-ms 30
+    python -m perf.bench --save perf/baseline.json
+    python -m perf.bench --compare perf/baseline.json --max-regression 0.2
+    # a 5% tail of 2s backend calls and 10% 503s, in a 3s invocation budget
+    python -m perf.bench --fields getWorkOrder --slow-rate 0.05 --slow-ms 2000 --error-rate 0.1 --lambda-timeout-ms 3000
+    python -m perf.bench --fields getWorkOrder --slow-rate 0.05 --lambda-env HTTP_HEDGE_READS=false
+
+With --compare the run fails (exit 1) when a field's p95 grew by more than
+--max-regression over the baseline, or its backend calls per operation grew.
+Results of runs with different dataset or latency settings are not
+comparable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from dataclasses import asdict, dataclass
+from itertools import groupby
+
+from .handler_process import HandlerProcess, handler_module
+from .scenarios import Scenario, account_id_from, build_event, load_payload, scenarios
+from .stub_backend import BackendConfig, StubBackend
+
+
+@dataclass
+class FieldResult:
+    field: str
+    function: str
+    iterations: int
+    concurrency: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    backend_calls_per_op: float
+    result_bytes: int
+    first_error: str | None = None
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return math.nan
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_field(process: HandlerProcess, backend: StubBackend, scenario: Scenario, event: dict,
+              iterations: int, warmup: int, concurrency: int) -> FieldResult:
+    """Invoke one field `iterations` times with `concurrency` requests in flight."""
+    for _ in range(warmup):
+        process.invoke(event)
+
+    durations: list[float] = []
+    errors = 0
+    first_error = None
+    result_bytes = 0
+    calls_before = backend.requests
+    started = time.perf_counter()
+
+    in_flight = [process.submit(event) for _ in range(min(concurrency, iterations))]
+    submitted = len(in_flight)
+    while in_flight:
+        invocation = in_flight.pop(0).result(timeout=120)
+        if submitted < iterations:
+            in_flight.append(process.submit(event))
+            submitted += 1
+        durations.append(invocation.duration_ns / 1e6)
+        result_bytes = max(result_bytes, invocation.result_bytes)
+        if not invocation.ok:
+            errors += 1
+            first_error = first_error or invocation.error
+
+    elapsed = time.perf_counter() - started
+    durations.sort()
+    return FieldResult(
+        field=scenario.field_name,
+        function=scenario.function,
+        iterations=iterations,
+        concurrency=concurrency,
+        errors=errors,
+        throughput_rps=iterations / elapsed if elapsed > 0 else math.inf,
+        p50_ms=percentile(durations, 0.50),
+        p95_ms=percentile(durations, 0.95),
+        p99_ms=percentile(durations, 0.99),
+        mean_ms=sum(durations) / len(durations) if durations else math.nan,
+        backend_calls_per_op=(backend.requests - calls_before) / iterations if iterations else 0.0,
+        result_bytes=result_bytes,
+        first_error=first_error,
+    )
+
+
+def print_table(results: list[FieldResult], out=sys.stdout) -> None:
+    header = f"{'field':<24} {'lambda':<10} {'ops':>6} {'err':>4} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'calls/op':>9} {'bytes':>8}"
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        print(
+            f"{result.field:<24} {result.function:<10} {result.iterations:>6} {result.errors:>4} "
+            f"{result.throughput_rps:>9.1f} {result.p50_ms:>9.2f} {result.p95_ms:>9.2f} {result.p99_ms:>9.2f} "
+            f"{result.backend_calls_per_op:>9.1f} {result.result_bytes:>8}",
+            file=out,
+        )
+    for result in results:
+        if result.first_error:
+            print(f"{result.field}: {result.errors} errors, first: {result.first_error}", file=out)
+
+
+def compare(results: list[FieldResult], baseline: dict, max_regression: float) -> list[str]:
+    """Regressions of p95 latency or backend calls against a saved run."""
+    previous = {entry["field"]: entry for entry in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result.field)
+        if before is None:
+            continue
+        if before["p95_ms"] > 0 and result.p95_ms > before["p95_ms"] * (1 + max_regression):
+            regressions.append(
+                f"{result.field}: p95 {before['p95_ms']:.2f} ms -> {result.p95_ms:.2f} ms "
+                f"(+{(result.p95_ms / before['p95_ms'] - 1) * 100:.0f}%)"
+            )
+        if result.backend_calls_per_op > before["backend_calls_per_op"] + 1e-9:
+            regressions.append(
+                f"{result.field}: backend calls/op {before['backend_calls_per_op']:.1f} -> {result.backend_calls_per_op:.1f}"
+            )
+        if result.errors > before.get("errors", 0):
+            regressions.append(f"{result.field}: errors {before.get('errors', 0)} -> {result.errors}")
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    defaults = BackendConfig()
+    parser = argparse.ArgumentParser(prog="python -m perf.bench", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fields", help="comma-separated GraphQL fields (default: all)")
+    parser.add_argument("--list", action="store_true", help="list the available fields and exit")
+    parser.add_argument("--iterations", type=int, default=100, help="timed invocations per field")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed invocations per field first")
+    parser.add_argument("--concurrency", type=int, default=1, help="invocations in flight per lambda")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="stub backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms, help="+/- uniform jitter on the latency")
+    parser.add_argument("--units", type=int, default=defaults.units)
+    parser.add_argument("--work-orders-per-unit", type=int, default=defaults.work_orders_per_unit)
+    parser.add_argument("--events-per-unit", type=int, default=defaults.events_per_unit)
+    parser.add_argument("--items", type=int, help="records per list for locations, contacts, tasks, parts and labor lines")
+    parser.add_argument("--page-size", type=int, default=defaults.default_page_size, help="backend page size when the lambda sends none")
+    parser.add_argument("--slow-rate", type=float, default=defaults.slow_rate,
+                        help="fraction of backend requests that take --slow-ms (a latency tail)")
+    parser.add_argument("--slow-ms", type=float, default=defaults.slow_ms, help="latency of the slow requests")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate,
+                        help=f"fraction of backend requests that fail with {defaults.error_status}")
+    parser.add_argument("--lambda-timeout-ms", type=int, default=30000,
+                        help="invocation time budget reported by context.getRemainingTimeInMillis()")
+    parser.add_argument("--lambda-env", action="append", default=[], metavar="NAME=VALUE",
+                        help="extra environment for the lambdas, e.g. HTTP_HEDGE_READS=false (repeatable)")
+    parser.add_argument("--cache", action="store_true",
+                        help="keep the tenant cache and event status index on (default: off, so every call reaches the backend)")
+    parser.add_argument("--log-level", default="ERROR", help="LOG_LEVEL for the lambdas")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    parser.add_argument("--save", metavar="FILE", help="write results to FILE for later --compare")
+    parser.add_argument("--compare", metavar="FILE", help="compare against results saved with --save")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed p95 growth with --compare (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    payload = load_payload()
+    available = scenarios(account_id_from(payload))
+
+    if args.list:
+        for scenario in available.values():
+            print(f"{scenario.field_name:<24} {scenario.function:<10} {scenario.description}")
+        return 0
+
+    names = [name.strip() for name in args.fields.split(",")] if args.fields else list(available)
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        print(f"Unknown fields: {', '.join(unknown)} (see --list)", file=sys.stderr)
+        return 2
+    selected = [available[name] for name in names]
+    missing = sorted({scenario.function for scenario in selected if not handler_module(scenario.function).exists()})
+    if missing:
+        print(f"Not built: {', '.join(missing)}; run `npm run build` in lambda/<fn> first", file=sys.stderr)
+        return 2
+
+    config = BackendConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        units=args.units,
+        work_orders_per_unit=args.work_orders_per_unit,
+        events_per_unit=args.events_per_unit,
+        default_page_size=args.page_size,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        error_rate=args.error_rate,
+    )
+    if args.items is not None:
+        config.locations = config.contacts = config.tasks = config.parts = config.labor_lines = args.items
+
+    results: list[FieldResult] = []
+    with StubBackend(config) as backend:
+        env = {**backend.env(), "LOG_LEVEL": args.log_level, "LAMBDA_TIMEOUT_MS": str(args.lambda_timeout_ms)}
+        if not args.cache:
+            # Measure the backend paths, not the caches in front of them
+            env.update({"CACHE_ENABLED": "false", "EVENT_STATUS_INDEX_TTL_MS": "1"})
+        env.update(dict(setting.split("=", 1) for setting in args.lambda_env))
+        # One process per lambda, reused across its fields like a warm container
+        by_function = groupby(sorted(selected, key=lambda scenario: scenario.function), key=lambda scenario: scenario.function)
+        for function, function_scenarios in by_function:
+            with HandlerProcess(function, env=env, node=args.node, show_logs=args.show_logs) as process:
+                for scenario in function_scenarios:
+                    event = build_event(payload, scenario)
+                    results.append(run_field(process, backend, scenario, event, args.iterations, args.warmup, args.concurrency))
+    results.sort(key=lambda result: names.index(result.field))
+
+    report = {
+        "settings": {
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "cache": args.cache,
+            "lambda_timeout_ms": args.lambda_timeout_ms,
+            "lambda_env": args.lambda_env,
+            "backend": asdict(config),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("settings", {}).get("backend") != report["settings"]["backend"]:
+            print("warning: baseline was recorded with different backend settings", file=sys.stderr)
+        regressions = compare(results, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
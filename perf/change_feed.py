@@ -0,0 +1,335 @@
+"""Load and freshness of list screens, polling vs change-feed subscriptions.
+
+Each screen keeps three lists current: the account's work orders, its open
+events (listEventsByStatus) and its tasks. In "poll" mode, what screens do
+today, a screen re-queries all three every --poll-interval seconds. In
+"subscribe" mode it loads them once, then applies what onWorkOrderChanged,
+onEventChanged (open statuses only) and onTaskChanged deliver. Meanwhile a
+writer moves a work order, event or task to its next status every
+--write-interval seconds through the mutation resolvers; in subscribe mode
+their CHANGE_FEED_URL points at the local AppSync, so each write is published.
+
+Reports, per mode, the screens' GraphQL requests, lambda invocations and
+backend requests per minute (the writer's share is the same in both modes),
+and freshness: how long after a write was sent each screen showed it, p50
+and p95. A write a screen never showed (overwritten first, or the run ended)
+counts as missed.
+
+    # build workorder, event and task (npm run build) first
+    python -m perf.change_feed
+    python -m perf.change_feed --screens 50 --poll-interval 5 --write-interval 0.5 --duration 60
+    python -m perf.change_feed --modes subscribe --json
+
+After the writer stops, screens keep going for one poll interval, so the
+last writes can still show up on a polling screen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+
+from bff_client.http import HttpPool
+
+from .appsync_local import LocalAppSync
+from .bench import percentile
+from .handler_process import handler_module
+from .scenarios import account_id_from, load_payload
+from .stub_backend import WORK_ORDER_STATUSES, BackendConfig, StubBackend
+
+FUNCTIONS = ("workorder", "event", "task")
+MODES = ("poll", "subscribe")
+# Events a screen lists; the writer only cycles events among these
+OPEN_EVENT_STATUSES = ["created", "acknowledged", "in_progress", "escalated"]
+TASK_STATUSES = ["pending", "inProgress", "completed"]
+
+SCREEN_QUERY = """
+query Screen($accountId: ID!, $statuses: [EventStatus!], $limit: Int) {
+  listWorkOrders(accountId: $accountId, pageSize: $limit) { items { workOrderId status } nextCursor }
+  listEventsByStatus(accountId: $accountId, status: $statuses, limit: $limit) { items { eventId status } nextCursor }
+  listTasks(accountId: $accountId, limit: $limit) { items { taskId status } nextCursor }
+}
+"""
+
+
+@dataclass(frozen=True)
+class Entity:
+    mutation: str
+    id_field: str
+    list_field: str
+    subscription: str
+    status_type: str
+    # The writer moves a record to the next status in this cycle
+    statuses: list[str]
+
+    def write(self, account_id: str, record_id: str, status: str) -> dict:
+        """The request moving a record to `status`."""
+        return {
+            "query": f"mutation Write($accountId: ID!, $id: ID!, $status: {self.status_type}!) {{ "
+                     f"{self.mutation}(accountId: $accountId, {self.id_field}: $id, input: {{ status: $status }}) "
+                     f"{{ {self.id_field} status }} }}",
+            "variables": {"accountId": account_id, "id": record_id, "status": status},
+        }
+
+
+ENTITIES = {
+    "WorkOrder": Entity("updateWorkOrder", "workOrderId", "listWorkOrders", "onWorkOrderChanged", "WorkOrderStatus",
+                        WORK_ORDER_STATUSES),
+    "Event": Entity("updateEvent", "eventId", "listEventsByStatus", "onEventChanged", "EventStatus",
+                    OPEN_EVENT_STATUSES),
+    "Task": Entity("updateTask", "taskId", "listTasks", "onTaskChanged", "TaskStatus", TASK_STATUSES),
+}
+
+
+@dataclass
+class _Write:
+    status: str
+    sent_at: float
+    seen_by: set[int] = field(default_factory=set)
+
+
+class FreshnessTracker:
+    """When each screen first showed each write."""
+
+    def __init__(self, screens: int):
+        self.screens = screens
+        self.latencies_ms: list[float] = []
+        self.missed = 0
+        self._latest: dict[tuple[str, str], _Write] = {}
+
+    def written(self, entity: str, record_id: str, status: str) -> None:
+        previous = self._latest.get((entity, record_id))
+        if previous is not None:
+            self.missed += self.screens - len(previous.seen_by)
+        self._latest[(entity, record_id)] = _Write(status, time.perf_counter())
+
+    def observe(self, screen: int, entity: str, record_id: str, status: str | None) -> None:
+        write = self._latest.get((entity, record_id))
+        if write is None or write.status != status or screen in write.seen_by:
+            return
+        write.seen_by.add(screen)
+        self.latencies_ms.append((time.perf_counter() - write.sent_at) * 1000)
+
+    def finish(self) -> None:
+        self.missed += sum(self.screens - len(write.seen_by) for write in self._latest.values())
+        self._latest.clear()
+
+
+@dataclass
+class ModeResult:
+    mode: str
+    screens: int
+    seconds: float
+    writes: int
+    screen_requests: int
+    errors: int
+    invocations_per_min: float
+    backend_requests_per_min: float
+    changes_delivered: int
+    freshness_p50_ms: float
+    freshness_p95_ms: float
+    seen: int
+    missed: int
+    first_error: str | None = None
+
+
+def response_error(response) -> str | None:
+    if response.status != 200:
+        return f"HTTP {response.status}"
+    errors = (response.json() or {}).get("errors")
+    return errors[0].get("message", "error") if errors else None
+
+
+async def run_mode(mode: str, account_id: str, backend: StubBackend, env: dict[str, str],
+                   args: argparse.Namespace) -> ModeResult:
+    app = LocalAppSync(env=dict(env), node=args.node, show_logs=args.show_logs)
+    server = await asyncio.start_server(app.handle_connection, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/graphql"
+    if mode == "subscribe":
+        # Fleets start on first use, so the lambdas pick this up
+        app.env["CHANGE_FEED_URL"] = url
+    tracker = FreshnessTracker(args.screens)
+    rng = random.Random(args.seed)
+    data = backend.dataset(account_id)
+    records = {"WorkOrder": data.work_orders, "Event": data.events, "Task": data.tasks}
+    screen_body = {
+        "query": SCREEN_QUERY,
+        "variables": {"accountId": account_id, "statuses": OPEN_EVENT_STATUSES, "limit": args.limit},
+    }
+    counts = {"screen_requests": 0, "errors": 0, "writes": 0}
+    first_error: str | None = None
+    unsubscribes = []
+
+    def record_error(error: str) -> None:
+        nonlocal first_error
+        counts["errors"] += 1
+        first_error = first_error or error
+
+    async def load(pool: HttpPool, screen: int) -> None:
+        response = await pool.post_json(screen_body)
+        counts["screen_requests"] += 1
+        error = response_error(response)
+        if error is not None:
+            record_error(error)
+            return
+        lists = (response.json() or {}).get("data") or {}
+        for name, entity in ENTITIES.items():
+            for item in (lists.get(entity.list_field) or {}).get("items") or []:
+                tracker.observe(screen, name, item.get(entity.id_field), item.get("status"))
+
+    async def screen(pool: HttpPool, index: int, until: float) -> None:
+        if mode == "subscribe":
+            for name, entity in ENTITIES.items():
+                arguments = {"accountId": account_id, **({"status": OPEN_EVENT_STATUSES} if name == "Event" else {})}
+                unsubscribes.append(app.subscribe(
+                    entity.subscription, arguments,
+                    lambda change, name=name: tracker.observe(index, name, change.get("id"), change.get("status")),
+                ))
+            await load(pool, index)
+            return
+        # Polling screens start spread over one interval, as real clients would be
+        await asyncio.sleep(rng.uniform(0, args.poll_interval))
+        while time.perf_counter() < until:
+            await load(pool, index)
+            await asyncio.sleep(args.poll_interval)
+
+    async def writer(pool: HttpPool, until: float) -> None:
+        for name in itertools.cycle(ENTITIES):
+            if time.perf_counter() >= until:
+                return
+            entity = ENTITIES[name]
+            candidates = [record for record in records[name] if record.get("status") in entity.statuses]
+            if candidates:
+                record = rng.choice(candidates)
+                status = entity.statuses[(entity.statuses.index(record["status"]) + 1) % len(entity.statuses)]
+                tracker.written(name, record[entity.id_field], status)
+                response = await pool.post_json(entity.write(account_id, record[entity.id_field], status))
+                counts["writes"] += 1
+                error = response_error(response)
+                if error is not None:
+                    record_error(f"{entity.mutation}: {error}")
+            await asyncio.sleep(args.write_interval)
+
+    try:
+        async with HttpPool(url, max_connections=args.screens + 1) as pool:
+            # One untimed load so every lambda is warm before the clock starts
+            await pool.post_json(screen_body)
+            app.reset_stats()
+            backend_before = backend.requests
+            started = time.perf_counter()
+            writes_until = started + args.duration
+            screens_until = writes_until + args.poll_interval
+            await asyncio.gather(
+                writer(pool, writes_until),
+                *(screen(pool, index, screens_until) for index in range(args.screens)),
+            )
+            await asyncio.sleep(max(0.0, screens_until - time.perf_counter()))
+            elapsed = time.perf_counter() - started
+            backend_requests = backend.requests - backend_before
+            stats = app.stats()
+            delivered = app.changes_delivered
+    finally:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+        server.close()
+        await server.wait_closed()
+        await app.drain()
+        app.close()
+
+    tracker.finish()
+    latencies = sorted(tracker.latencies_ms)
+    per_minute = 60 / elapsed if elapsed else 0.0
+    return ModeResult(
+        mode=mode,
+        screens=args.screens,
+        seconds=elapsed,
+        writes=counts["writes"],
+        screen_requests=counts["screen_requests"],
+        errors=counts["errors"],
+        invocations_per_min=sum(entry.invocations for entry in stats.values()) * per_minute,
+        backend_requests_per_min=backend_requests * per_minute,
+        changes_delivered=delivered,
+        freshness_p50_ms=percentile(latencies, 0.50),
+        freshness_p95_ms=percentile(latencies, 0.95),
+        seen=len(latencies),
+        missed=tracker.missed,
+        first_error=first_error,
+    )
+
+
+def print_table(results: list[ModeResult], out=sys.stdout) -> None:
+    header = (f"{'mode':<10} {'screens':>7} {'writes':>6} {'reads':>7} {'err':>4} {'invokes/min':>12} "
+              f"{'backend/min':>12} {'pushed':>7} {'fresh p50':>10} {'fresh p95':>10} {'seen':>6} {'missed':>6}")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        print(
+            f"{result.mode:<10} {result.screens:>7} {result.writes:>6} {result.screen_requests:>7} {result.errors:>4} "
+            f"{result.invocations_per_min:>12.1f} {result.backend_requests_per_min:>12.1f} "
+            f"{result.changes_delivered:>7} {result.freshness_p50_ms:>8.0f}ms {result.freshness_p95_ms:>8.0f}ms "
+            f"{result.seen:>6} {result.missed:>6}",
+            file=out,
+        )
+    for result in results:
+        if result.first_error:
+            print(f"{result.mode}: {result.errors} errors, first: {result.first_error}", file=out)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m perf.change_feed", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated modes to run, in order")
+    parser.add_argument("--screens", type=int, default=20, help="screens watching the lists")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds the writer runs")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="seconds between a polling screen's loads")
+    parser.add_argument("--write-interval", type=float, default=1.0, help="seconds between writes")
+    parser.add_argument("--units", type=int, default=10, help="units in the dataset (3 work orders and events each)")
+    parser.add_argument("--tasks", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=200, help="page size of each list, enough for the whole list")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="stub backend jitter")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the writer's picks")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    modes = [mode.strip() for mode in args.modes.split(",")]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        print(f"Unknown modes: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    missing = [name for name in FUNCTIONS if not handler_module(name).exists()]
+    if missing:
+        print(f"Not built: {', '.join(missing)}; run `npm run build` in lambda/<fn> first", file=sys.stderr)
+        return 2
+
+    account_id = account_id_from(load_payload())
+    results: list[ModeResult] = []
+    for mode in modes:
+        # A fresh backend per mode: the writer's updates are applied to the dataset
+        config = BackendConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, units=args.units,
+                               work_orders_per_unit=3, events_per_unit=3, tasks=args.tasks,
+                               default_page_size=args.limit, apply_updates=True)
+        with StubBackend(config) as backend:
+            env = {**backend.env(), "LOG_LEVEL": "ERROR", "CACHE_ENABLED": "false"}
+            results.append(asyncio.run(run_mode(mode, account_id, backend, env, args)))
+
+    if args.json:
+        json.dump({"settings": vars(args), "results": [asdict(result) for result in results]}, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
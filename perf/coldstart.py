@@ -0,0 +1,236 @@
+"""Cold-start benchmark of every resolver lambda against a local stub backend.
+
+Each run starts a fresh Node process, as Lambda does for a new container,
+loads the lambda's handler module and sends it one typical event (the first
+bench scenario for that lambda), so the numbers cover what a request pays on
+a cold start: Node startup, module init (require) and the first invocation
+(first backend connection, cold JIT). Runs go round-robin across the
+lambdas so background noise is spread evenly. Artifact sizes are reported
+next to the timings, so bundle size and init time are tracked per function.
+
+    python -m perf.coldstart                       # tsc output: dist/ plus node_modules
+    python -m perf.coldstart --artifact bundle     # lambda/shared/bundle.sh output
+    python -m perf.coldstart --artifact bundle --save perf/coldstart-baseline.json
+    python -m perf.coldstart --artifact bundle --compare perf/coldstart-baseline.json
+
+With --compare the run fails (exit 1) when a lambda's median init or first
+invocation grew by more than --max-regression over the baseline, or its code
+grew by more than --max-size-growth. Absolute times are those of this
+machine, not of a 256 MB Lambda; compare runs from the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+
+from .bench import percentile
+from .handler_process import ARTIFACTS, BUILD_COMMANDS, REPO_ROOT, HandlerProcess, handler_module
+from .scenarios import Scenario, account_id_from, build_event, load_payload, scenarios
+from .stub_backend import BackendConfig, StubBackend
+
+FUNCTIONS = ("account", "contact", "event", "laborline", "location", "part", "task", "unit", "workorder")
+
+
+@dataclass
+class ColdStartResult:
+    function: str
+    artifact: str
+    field: str
+    runs: int
+    errors: int
+    code_bytes: int
+    zip_bytes: int | None
+    startup_p50_ms: float
+    init_p50_ms: float
+    init_p95_ms: float
+    first_invoke_p50_ms: float
+    first_invoke_p95_ms: float
+    first_error: str | None = None
+
+
+def code_bytes(function: str, artifact: str) -> int:
+    """JavaScript loaded from the artifact itself (node_modules not included for dist)."""
+    if artifact == "bundle":
+        return handler_module(function, artifact).stat().st_size
+    return sum(path.stat().st_size for path in (REPO_ROOT / "lambda" / function / "dist").rglob("*.js"))
+
+
+def zip_bytes(function: str, artifact: str) -> int | None:
+    """Size of lambda.zip when it was built from this artifact (bundle.sh writes both)."""
+    package = REPO_ROOT / "lambda" / function / "lambda.zip"
+    if artifact != "bundle" or not package.exists():
+        return None
+    return package.stat().st_size
+
+
+def first_scenario(function: str, available: dict[str, Scenario]) -> Scenario:
+    return next(scenario for scenario in available.values() if scenario.function == function)
+
+
+def cold_start(function: str, artifact: str, env: dict[str, str], event: dict, node: str,
+               show_logs: bool) -> tuple[float, float, float, str | None]:
+    """One fresh process: startup, init and first invocation times in ms, and the invocation's error."""
+    with HandlerProcess(function, env=env, node=node, show_logs=show_logs, artifact=artifact) as process:
+        invocation = process.invoke(event)
+    error = None if invocation.ok else invocation.error
+    return process.startup_ns / 1e6, process.init_ns / 1e6, invocation.duration_ns / 1e6, error
+
+
+def run(functions: list[str], artifact: str, runs: int, warmup: int, env: dict[str, str], node: str,
+        show_logs: bool) -> list[ColdStartResult]:
+    payload = load_payload()
+    available = scenarios(account_id_from(payload))
+    chosen = {function: first_scenario(function, available) for function in functions}
+    events = {function: build_event(payload, scenario) for function, scenario in chosen.items()}
+
+    # The untimed rounds bring node, the artifacts and node_modules into the OS file cache
+    for _ in range(warmup):
+        for function in functions:
+            cold_start(function, artifact, env, events[function], node, show_logs)
+
+    samples: dict[str, list[tuple[float, float, float, str | None]]] = {function: [] for function in functions}
+    for _ in range(runs):
+        for function in functions:
+            samples[function].append(cold_start(function, artifact, env, events[function], node, show_logs))
+
+    results = []
+    for function in functions:
+        startups = sorted(sample[0] for sample in samples[function])
+        inits = sorted(sample[1] for sample in samples[function])
+        first_invokes = sorted(sample[2] for sample in samples[function])
+        errors = [sample[3] for sample in samples[function] if sample[3] is not None]
+        results.append(ColdStartResult(
+            function=function,
+            artifact=artifact,
+            field=chosen[function].field_name,
+            runs=runs,
+            errors=len(errors),
+            code_bytes=code_bytes(function, artifact),
+            zip_bytes=zip_bytes(function, artifact),
+            startup_p50_ms=percentile(startups, 0.50),
+            init_p50_ms=percentile(inits, 0.50),
+            init_p95_ms=percentile(inits, 0.95),
+            first_invoke_p50_ms=percentile(first_invokes, 0.50),
+            first_invoke_p95_ms=percentile(first_invokes, 0.95),
+            first_error=errors[0] if errors else None,
+        ))
+    return results
+
+
+def print_table(results: list[ColdStartResult], out=sys.stdout) -> None:
+    header = (f"{'lambda':<10} {'artifact':<8} {'code KB':>9} {'zip KB':>8} {'startup ms':>11} {'init p50':>9} "
+              f"{'init p95':>9} {'1st p50':>9} {'1st p95':>9} {'err':>4}  first invocation")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        zip_kb = f"{result.zip_bytes / 1024:>8.1f}" if result.zip_bytes is not None else f"{'-':>8}"
+        print(
+            f"{result.function:<10} {result.artifact:<8} {result.code_bytes / 1024:>9.1f} {zip_kb} "
+            f"{result.startup_p50_ms:>11.1f} {result.init_p50_ms:>9.1f} {result.init_p95_ms:>9.1f} "
+            f"{result.first_invoke_p50_ms:>9.1f} {result.first_invoke_p95_ms:>9.1f} {result.errors:>4}  {result.field}",
+            file=out,
+        )
+    for result in results:
+        if result.first_error:
+            print(f"{result.function}: {result.errors} errors, first: {result.first_error}", file=out)
+
+
+def compare(results: list[ColdStartResult], baseline: dict, max_regression: float, max_size_growth: float) -> list[str]:
+    """Regressions of median init, first invocation or code size against a saved run."""
+    previous = {entry["function"]: entry for entry in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get(result.function)
+        if before is None:
+            continue
+        if before["artifact"] != result.artifact:
+            print(f"warning: {result.function} baseline is for the {before['artifact']} artifact", file=sys.stderr)
+            continue
+        for key, label in (("init_p50_ms", "init p50"), ("first_invoke_p50_ms", "first invocation p50")):
+            old, new = before[key], getattr(result, key)
+            if old > 0 and new > old * (1 + max_regression):
+                regressions.append(f"{result.function}: {label} {old:.1f} ms -> {new:.1f} ms (+{(new / old - 1) * 100:.0f}%)")
+        if before["code_bytes"] > 0 and result.code_bytes > before["code_bytes"] * (1 + max_size_growth):
+            regressions.append(f"{result.function}: code {before['code_bytes']} -> {result.code_bytes} bytes")
+        if result.errors > before.get("errors", 0):
+            regressions.append(f"{result.function}: errors {before.get('errors', 0)} -> {result.errors}")
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m perf.coldstart", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--functions", help=f"comma-separated lambdas (default: every built one of {', '.join(FUNCTIONS)})")
+    parser.add_argument("--artifact", choices=ARTIFACTS, default="dist",
+                        help="dist: tsc output with node_modules; bundle: the single-file deployment bundle")
+    parser.add_argument("--runs", type=int, default=10, help="cold starts timed per lambda")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed rounds first, to warm the OS file cache")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="stub backend latency (default 0, so the first invocation is the lambda's own cost)")
+    parser.add_argument("--log-level", default="ERROR", help="LOG_LEVEL for the lambdas")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    parser.add_argument("--save", metavar="FILE", help="write results to FILE for later --compare")
+    parser.add_argument("--compare", metavar="FILE", help="compare against results saved with --save")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="allowed growth of median init and first invocation with --compare (0.2 = 20%%)")
+    parser.add_argument("--max-size-growth", type=float, default=0.05,
+                        help="allowed code size growth with --compare (0.05 = 5%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.functions:
+        functions = [name.strip() for name in args.functions.split(",")]
+        unknown = [name for name in functions if name not in FUNCTIONS]
+        if unknown:
+            print(f"Unknown lambdas: {', '.join(unknown)}", file=sys.stderr)
+            return 2
+        missing = [name for name in functions if not handler_module(name, args.artifact).exists()]
+        if missing:
+            print(f"Not built: {', '.join(missing)}; run `{BUILD_COMMANDS[args.artifact]}` in lambda/<fn> first",
+                  file=sys.stderr)
+            return 2
+    else:
+        functions = [name for name in FUNCTIONS if handler_module(name, args.artifact).exists()]
+        if not functions:
+            print(f"No lambda is built as {args.artifact}; run `{BUILD_COMMANDS[args.artifact]}` in lambda/<fn> first",
+                  file=sys.stderr)
+            return 2
+
+    config = BackendConfig(latency_ms=args.latency_ms, jitter_ms=0.0)
+    with StubBackend(config) as backend:
+        env = {**backend.env(), "LOG_LEVEL": args.log_level}
+        results = run(functions, args.artifact, args.runs, args.warmup, env, args.node, args.show_logs)
+
+    report = {
+        "settings": {"artifact": args.artifact, "runs": args.runs, "backend_latency_ms": args.latency_ms},
+        "results": [asdict(result) for result in results],
+    }
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.max_regression, args.max_size_growth)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Reading a wide listEvents from/to window: sequential paging vs time-sharded scans.
+
+A client reads every event of one unit in a 90-day window, following
+nextCursor until the last page, through the compiled event lambda. The stub
+backend answers a from/to window oldest first and, like a DynamoDB query with
+a filter expression, reads --read-per-page events per page before applying
+the unitId filter, so most backend pages come back with a few events or
+none. "sequential" is EVENT_SCAN_SHARDS=1: every backend page is a
+GraphQL page, one round trip after the other. "shards-N" splits the window
+into N time shards, fetched --concurrency at a time, and fills each GraphQL
+page from them.
+
+Reports, per variant, the wall time of a full read (p50 and p95), the
+GraphQL pages and backend requests it took, and whether the events came back
+complete and in createdAt order.
+
+    # build the event lambda (npm run build) first
+    python -m perf.event_scan
+    python -m perf.event_scan --shards 4,8,16,32 --concurrency 8 --latency-ms 40
+    python -m perf.event_scan --read-per-page 0       # dense pages: nothing to gain
+    python -m perf.event_scan --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+from .bench import percentile
+from .handler_process import HandlerProcess, handler_module
+from .scenarios import account_id_from, load_payload
+from .stub_backend import EPOCH_MS, BackendConfig, StubBackend, _iso
+
+WINDOW_DAYS = 90
+SELECTION = ["items", "items/eventId", "items/createdAt", "nextCursor", "count"]
+
+
+@dataclass
+class VariantResult:
+    variant: str
+    reads: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    pages_per_read: float
+    backend_requests_per_read: float
+    events_per_read: float
+    # Every read returned exactly the window's events, oldest first
+    complete: bool
+    first_error: str | None = None
+
+
+def list_event(template: dict, arguments: dict) -> dict:
+    """A listEvents resolver event based on the test payload."""
+    event = copy.deepcopy(template)
+    event["arguments"] = arguments
+    event["identity"] = {**event.get("identity", {}), "sub": arguments["accountId"]}
+    event["source"] = None
+    event["info"] = {"fieldName": "listEvents", "parentTypeName": "Query", "variables": {},
+                     "selectionSetList": SELECTION}
+    return event
+
+
+def read_window(handler: HandlerProcess, template: dict, arguments: dict) -> tuple[list[str], int]:
+    """Every event id of the window, following nextCursor, and the pages it took."""
+    event_ids: list[str] = []
+    cursor, pages = None, 0
+    while True:
+        invocation = handler.invoke(list_event(template, {**arguments, **({"cursor": cursor} if cursor else {})}),
+                                    echo=True)
+        if not invocation.ok:
+            raise RuntimeError(invocation.error or "listEvents failed")
+        pages += 1
+        result = invocation.result or {}
+        event_ids.extend(item["eventId"] for item in result.get("items", []))
+        cursor = result.get("nextCursor")
+        if not cursor:
+            return event_ids, pages
+
+
+def run_variant(variant: str, shards: int, template: dict, arguments: dict, expected: list[str],
+                backend: StubBackend, args: argparse.Namespace) -> VariantResult:
+    env = {
+        **backend.env(),
+        "LOG_LEVEL": "ERROR",
+        "CACHE_ENABLED": "false",
+        "EVENT_SCAN_SHARDS": str(shards),
+        "EVENT_SCAN_CONCURRENCY": str(args.concurrency),
+        "EVENT_SCAN_MIN_WINDOW_HOURS": "1",
+    }
+    latencies: list[float] = []
+    pages = backend_requests = events = errors = 0
+    complete, first_error = True, None
+    with HandlerProcess("event", env=env, node=args.node, show_logs=args.show_logs) as handler:
+        for _ in range(args.warmup):
+            read_window(handler, template, arguments)
+        for _ in range(args.reads):
+            backend_before = backend.requests
+            started = time.perf_counter()
+            try:
+                event_ids, read_pages = read_window(handler, template, arguments)
+            except RuntimeError as error:
+                errors += 1
+                first_error = first_error or str(error)
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+            pages += read_pages
+            backend_requests += backend.requests - backend_before
+            events += len(event_ids)
+            complete = complete and event_ids == expected
+
+    latencies.sort()
+    count = len(latencies) or 1
+    return VariantResult(
+        variant=variant,
+        reads=len(latencies),
+        errors=errors,
+        p50_ms=percentile(latencies, 0.50),
+        p95_ms=percentile(latencies, 0.95),
+        pages_per_read=pages / count,
+        backend_requests_per_read=backend_requests / count,
+        events_per_read=events / count,
+        complete=complete and not errors,
+        first_error=first_error,
+    )
+
+
+def print_table(results: list[VariantResult], out=sys.stdout) -> None:
+    header = (f"{'variant':<12} {'reads':>6} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'pages':>7} "
+              f"{'backend':>8} {'events':>7} {'complete':>9}")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        print(
+            f"{result.variant:<12} {result.reads:>6} {result.errors:>4} {result.p50_ms:>9.1f} {result.p95_ms:>9.1f} "
+            f"{result.pages_per_read:>7.1f} {result.backend_requests_per_read:>8.1f} {result.events_per_read:>7.1f} "
+            f"{'yes' if result.complete else 'NO':>9}",
+            file=out,
+        )
+    for result in results:
+        if result.first_error:
+            print(f"{result.variant}: {result.errors} errors, first: {result.first_error}", file=out)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m perf.event_scan", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--shards", default="2,4,8,16", help="comma-separated shard counts to compare with sequential")
+    parser.add_argument("--concurrency", type=int, default=4, help="shards fetched at once (EVENT_SCAN_CONCURRENCY)")
+    parser.add_argument("--reads", type=int, default=10, help="timed full-window reads per variant")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed reads first")
+    parser.add_argument("--limit", type=int, default=50, help="GraphQL page size")
+    parser.add_argument("--units", type=int, default=50, help="units in the stub dataset")
+    parser.add_argument("--events-per-unit", type=int, default=40, help="events per unit over the window")
+    parser.add_argument("--read-per-page", type=int, default=50,
+                        help="events a backend page reads before filtering (0: filter first, dense pages)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="stub backend jitter")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if not handler_module("event").exists():
+        print("Not built: event; run `npm run build` in lambda/event first", file=sys.stderr)
+        return 2
+    variants = [("sequential", 1)] + [(f"shards-{count}", count)
+                                      for count in (int(value) for value in args.shards.split(",") if value.strip())]
+
+    template = load_payload()
+    account_id = account_id_from(template)
+    config = BackendConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, units=args.units,
+                           events_per_unit=args.events_per_unit, events_read_per_page=args.read_per_page)
+    results: list[VariantResult] = []
+    with StubBackend(config) as backend:
+        unit_id = backend.dataset(account_id).units[0]["id"]
+        arguments = {"accountId": account_id, "unitId": unit_id, "from": _iso(EPOCH_MS),
+                     "to": _iso(EPOCH_MS + WINDOW_DAYS * 86_400_000), "limit": args.limit}
+        expected = [event["eventId"] for event in sorted(backend.dataset(account_id).events,
+                                                         key=lambda event: (event["createdAt"], event["eventId"]))
+                    if event["unitId"] == unit_id]
+        for variant, shards in variants:
+            results.append(run_variant(variant, shards, template, arguments, expected, backend, args))
+
+    if args.json:
+        json.dump({"settings": vars(args), "results": [asdict(result) for result in results]}, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""The containers of one deployed Lambda function, for the local stand-in.
+
+By default a function is one warm Node process taking every invocation
+concurrently, which is what the latency benchmarks want. With
+`container_concurrency=1` it scales the way Lambda does instead: a container
+runs one invocation at a time, a request that finds every container busy
+starts a new one and waits for its cold start, and containers idle for longer
+than `idle_timeout_s` are reclaimed, so the next request after a quiet spell
+is cold again. Cold starts are counted per function.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from .handler_process import HandlerProcess, Invocation
+
+
+@dataclass
+class FleetStats:
+    invocations: int = 0
+    cold_starts: int = 0
+    containers_peak: int = 0
+    init_ms: list[float] = field(default_factory=list)
+
+    @property
+    def cold_start_rate(self) -> float:
+        return self.cold_starts / self.invocations if self.invocations else 0.0
+
+
+class _Container:
+    def __init__(self, process: HandlerProcess):
+        self.process = process
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+
+
+class Fleet:
+    """Containers running one function's handler (`function` names lambda/<function>)."""
+
+    def __init__(self, function: str, env: dict[str, str] | None = None, node: str = "node", show_logs: bool = False,
+                 artifact: str = "dist", container_concurrency: int | None = None, idle_timeout_s: float | None = None):
+        self.function = function
+        self.env = env or {}
+        self.node = node
+        self.show_logs = show_logs
+        self.artifact = artifact
+        self.container_concurrency = container_concurrency
+        self.idle_timeout_s = idle_timeout_s
+        self.stats = FleetStats()
+        self._containers: list[_Container] = []
+
+    def _new_process(self) -> HandlerProcess:
+        return HandlerProcess(self.function, env=self.env, node=self.node, show_logs=self.show_logs,
+                              artifact=self.artifact)
+
+    def _add(self, process: HandlerProcess) -> _Container:
+        container = _Container(process)
+        self._containers.append(container)
+        self.stats.containers_peak = max(self.stats.containers_peak, len(self._containers))
+        return container
+
+    def start(self) -> None:
+        """Start one container ahead of traffic (not counted as a cold start)."""
+        if not self._containers:
+            self._add(self._new_process())
+
+    def _reclaim_idle(self) -> None:
+        if self.idle_timeout_s is None:
+            return
+        deadline = time.monotonic() - self.idle_timeout_s
+        for container in [c for c in self._containers if c.in_flight == 0 and c.last_used < deadline]:
+            self._containers.remove(container)
+            asyncio.get_running_loop().run_in_executor(None, container.process.close)
+
+    async def _acquire(self) -> tuple[_Container, float]:
+        self._reclaim_idle()
+        for container in self._containers:
+            if self.container_concurrency is None or container.in_flight < self.container_concurrency:
+                container.in_flight += 1
+                return container, 0.0
+        # Every container is busy (or there is none): this request pays a cold start
+        process = await asyncio.to_thread(self._new_process)
+        container = self._add(process)
+        container.in_flight += 1
+        init_ms = process.startup_ns / 1e6
+        self.stats.cold_starts += 1
+        self.stats.init_ms.append(init_ms)
+        return container, init_ms
+
+    async def invoke(self, event: dict | list, echo: bool = False) -> tuple[Invocation, float]:
+        """Run one invocation; also returns the cold start it waited for in ms (0 when warm)."""
+        container, init_ms = await self._acquire()
+        self.stats.invocations += 1
+        try:
+            invocation = await asyncio.wrap_future(container.process.submit(event, echo=echo))
+        finally:
+            container.in_flight -= 1
+            container.last_used = time.monotonic()
+        return invocation, init_ms
+
+    def reset_stats(self) -> None:
+        """Start counting afresh, keeping the containers that are running."""
+        self.stats = FleetStats(containers_peak=len(self._containers))
+
+    def close(self) -> None:
+        for container in self._containers:
+            container.process.close()
+        self._containers.clear()
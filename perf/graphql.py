@@ -0,0 +1,298 @@
+"""Just enough GraphQL to stand in for AppSync in front of the lambdas.
+
+Parses an executable document (operations, variables, fragments, aliases),
+resolves each root field's arguments against the request variables, and
+derives what AppSync hands a resolver: the selectionSetList paths. Results
+are projected back onto the selection set the way AppSync shapes responses.
+No schema validation is done; that is AppSync's job, not the harness's.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+
+_TOKEN = re.compile(
+    r'(?P<skip>[\s,\ufeff]+|#[^\n]*)'
+    r'|(?P<block>"""(?:\\"""|[^"]|"(?!""))*""")'
+    r'|(?P<string>"(?:\\.|[^"\\])*")'
+    r'|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)'
+    r'|(?P<spread>\.\.\.)'
+    r'|(?P<name>[_A-Za-z][_0-9A-Za-z]*)'
+    r'|(?P<punct>[!$&():=@\[\]{}|])'
+)
+
+
+class GraphQLSyntaxError(ValueError):
+    pass
+
+
+@dataclass
+class FieldNode:
+    name: str
+    alias: str | None = None
+    arguments: dict = field(default_factory=dict)
+    selections: list["FieldNode"] = field(default_factory=list)
+
+    @property
+    def response_key(self) -> str:
+        return self.alias or self.name
+
+
+@dataclass
+class Operation:
+    kind: str
+    name: str | None
+    fields: list[FieldNode]
+    variables: dict
+
+
+class _Variable:
+    def __init__(self, name: str):
+        self.name = name
+
+
+def _tokenize(source: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    while position < len(source):
+        match = _TOKEN.match(source, position)
+        if match is None:
+            raise GraphQLSyntaxError(f"Unexpected character {source[position]!r} at {position}")
+        position = match.end()
+        kind = match.lastgroup
+        if kind != "skip":
+            tokens.append((kind, match.group()))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.index = 0
+
+    def peek(self, value: str | None = None, kind: str | None = None) -> bool:
+        if self.index >= len(self.tokens):
+            return False
+        token_kind, token_value = self.tokens[self.index]
+        return (value is None or token_value == value) and (kind is None or token_kind == kind)
+
+    def take(self, value: str | None = None, kind: str | None = None) -> str:
+        if not self.peek(value, kind):
+            found = self.tokens[self.index][1] if self.index < len(self.tokens) else "end of document"
+            raise GraphQLSyntaxError(f"Expected {value or kind}, found {found!r}")
+        self.index += 1
+        return self.tokens[self.index - 1][1]
+
+    def document(self):
+        operations, fragments = [], {}
+        while self.index < len(self.tokens):
+            if self.peek("fragment"):
+                self.take("fragment")
+                name = self.take(kind="name")
+                self.take("on")
+                self.take(kind="name")
+                self.directives()
+                fragments[name] = self.selection_set()
+            elif self.peek("{"):
+                operations.append(("query", None, {}, self.selection_set()))
+            else:
+                kind = self.take(kind="name")
+                if kind not in ("query", "mutation", "subscription"):
+                    raise GraphQLSyntaxError(f"Unknown definition {kind!r}")
+                name = self.take(kind="name") if self.peek(kind="name") else None
+                defaults = self.variable_definitions() if self.peek("(") else {}
+                self.directives()
+                operations.append((kind, name, defaults, self.selection_set()))
+        return operations, fragments
+
+    def variable_definitions(self) -> dict:
+        defaults = {}
+        self.take("(")
+        while not self.peek(")"):
+            self.take("$")
+            name = self.take(kind="name")
+            self.take(":")
+            self.type_reference()
+            if self.peek("="):
+                self.take("=")
+                defaults[name] = self.value()
+            self.directives()
+        self.take(")")
+        return defaults
+
+    def type_reference(self) -> None:
+        if self.peek("["):
+            self.take("[")
+            self.type_reference()
+            self.take("]")
+        else:
+            self.take(kind="name")
+        if self.peek("!"):
+            self.take("!")
+
+    def directives(self) -> None:
+        while self.peek("@"):
+            self.take("@")
+            self.take(kind="name")
+            if self.peek("("):
+                self.arguments()
+
+    def selection_set(self) -> list:
+        selections = []
+        self.take("{")
+        while not self.peek("}"):
+            if self.peek(kind="spread"):
+                self.take(kind="spread")
+                if self.peek("on") or self.peek("{") or self.peek("@"):
+                    if self.peek("on"):
+                        self.take("on")
+                        self.take(kind="name")
+                    self.directives()
+                    selections.append(("inline", self.selection_set()))
+                else:
+                    selections.append(("spread", self.take(kind="name")))
+                    self.directives()
+                continue
+            name = self.take(kind="name")
+            alias = None
+            if self.peek(":"):
+                self.take(":")
+                alias, name = name, self.take(kind="name")
+            arguments = self.arguments() if self.peek("(") else {}
+            self.directives()
+            children = self.selection_set() if self.peek("{") else []
+            selections.append(("field", name, alias, arguments, children))
+        self.take("}")
+        return selections
+
+    def arguments(self) -> dict:
+        arguments = {}
+        self.take("(")
+        while not self.peek(")"):
+            name = self.take(kind="name")
+            self.take(":")
+            arguments[name] = self.value()
+        self.take(")")
+        return arguments
+
+    def value(self):
+        if self.peek("$"):
+            self.take("$")
+            return _Variable(self.take(kind="name"))
+        if self.peek("["):
+            self.take("[")
+            items = []
+            while not self.peek("]"):
+                items.append(self.value())
+            self.take("]")
+            return items
+        if self.peek("{"):
+            self.take("{")
+            fields = {}
+            while not self.peek("}"):
+                name = self.take(kind="name")
+                self.take(":")
+                fields[name] = self.value()
+            self.take("}")
+            return fields
+        if self.peek(kind="string"):
+            return json.loads(self.take(kind="string"))
+        if self.peek(kind="block"):
+            return self.take(kind="block")[3:-3]
+        if self.peek(kind="number"):
+            text = self.take(kind="number")
+            return float(text) if any(c in text for c in ".eE") else int(text)
+        word = self.take(kind="name")
+        return {"true": True, "false": False, "null": None}.get(word, word)
+
+
+def _resolve(value, variables: dict):
+    if isinstance(value, _Variable):
+        return variables.get(value.name)
+    if isinstance(value, list):
+        return [_resolve(item, variables) for item in value]
+    if isinstance(value, dict):
+        return {key: _resolve(item, variables) for key, item in value.items()}
+    return value
+
+
+def _build(selections: list, fragments: dict, variables: dict, seen: frozenset = frozenset()) -> list[FieldNode]:
+    nodes: list[FieldNode] = []
+    for selection in selections:
+        if selection[0] == "field":
+            _, name, alias, arguments, children = selection
+            nodes.append(FieldNode(
+                name=name,
+                alias=alias,
+                # Like AppSync, an argument bound to a variable that was not sent is omitted
+                arguments={
+                    key: _resolve(value, variables)
+                    for key, value in arguments.items()
+                    if not isinstance(value, _Variable) or value.name in variables
+                },
+                selections=_build(children, fragments, variables, seen),
+            ))
+        elif selection[0] == "inline":
+            nodes.extend(_build(selection[1], fragments, variables, seen))
+        else:
+            fragment = selection[1]
+            if fragment not in fragments:
+                raise GraphQLSyntaxError(f"Unknown fragment {fragment!r}")
+            if fragment not in seen:
+                nodes.extend(_build(fragments[fragment], fragments, variables, seen | {fragment}))
+    return nodes
+
+
+def parse_operation(query: str, variables: dict | None = None, operation_name: str | None = None) -> Operation:
+    """The operation to execute, with arguments resolved from `variables`."""
+    operations, fragments = _Parser(query).document()
+    if not operations:
+        raise GraphQLSyntaxError("Document has no operation")
+    if operation_name is not None:
+        matching = [operation for operation in operations if operation[1] == operation_name]
+        if not matching:
+            raise GraphQLSyntaxError(f"Unknown operation {operation_name!r}")
+        chosen = matching[0]
+    elif len(operations) == 1:
+        chosen = operations[0]
+    else:
+        raise GraphQLSyntaxError("operationName is required for documents with several operations")
+    kind, name, defaults, selections = chosen
+    resolved = {**{key: _resolve(value, {}) for key, value in defaults.items()}, **(variables or {})}
+    return Operation(kind, name, _build(selections, fragments, resolved), resolved)
+
+
+def selection_set_list(node: FieldNode) -> list[str]:
+    """AppSync's info.selectionSetList for a field: every sub-field path."""
+    paths: list[str] = []
+
+    def walk(children: list[FieldNode], prefix: str) -> None:
+        for child in children:
+            if child.name == "__typename":
+                continue
+            path = f"{prefix}{child.name}"
+            if path not in paths:
+                paths.append(path)
+            walk(child.selections, f"{path}/")
+
+    walk(node.selections, "")
+    return paths
+
+
+def project(value, selections: list[FieldNode]):
+    """Shape a resolver result to the requested fields, applying aliases."""
+    if not selections or value is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, selections) for item in value]
+    if not isinstance(value, dict):
+        return value
+    shaped = {}
+    for node in selections:
+        if node.name == "__typename":
+            shaped[node.response_key] = value.get("__typename")
+            continue
+        shaped[node.response_key] = project(value.get(node.name), node.selections)
+    return shaped
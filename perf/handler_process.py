@@ -0,0 +1,138 @@
+"""A compiled resolver lambda running in a Node child process.
+
+Wraps perf/invoke-handler.js: events are written to the child as JSON lines
+and completions are matched back to their request by id, so several
+invocations can be in flight at once, as in one warm Lambda container.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BRIDGE = Path(__file__).resolve().parent / "invoke-handler.js"
+
+
+@dataclass
+class Invocation:
+    """Outcome of one handler call, timed inside the Node process."""
+
+    ok: bool
+    duration_ns: int
+    result_bytes: int = 0
+    error: str | None = None
+    result: object = None
+    # The handler's spans, when it runs with TRACING_ENABLED and TRACING_EXTENSION
+    timing: dict | None = None
+
+
+ARTIFACTS = ("dist", "bundle")
+BUILD_COMMANDS = {"dist": "npm run build", "bundle": "npm run bundle"}
+
+
+def handler_module(function: str, artifact: str = "dist") -> Path:
+    """The entry point of lambda/<function>: the tsc output (`npm run build`) or
+    the single-file deployment bundle (`npm run bundle`)."""
+    if artifact not in ARTIFACTS:
+        raise ValueError(f"Unknown artifact {artifact!r}; expected one of {', '.join(ARTIFACTS)}")
+    return REPO_ROOT / "lambda" / function / artifact / "index.js"
+
+
+class HandlerProcess:
+    """One Node process running one lambda's handler; use as a context manager."""
+
+    def __init__(self, function: str, env: dict[str, str] | None = None, node: str = "node", show_logs: bool = False,
+                 startup_timeout: float = 30.0, artifact: str = "dist"):
+        module = handler_module(function, artifact)
+        if not module.exists():
+            raise FileNotFoundError(
+                f"{module} not found; build the lambda first (cd lambda/{function} && {BUILD_COMMANDS[artifact]})"
+            )
+        self.function = function
+        # Time spent requiring the module, and from spawning Node until it was loaded
+        self.init_ns = 0
+        self.startup_ns = 0
+        started = time.perf_counter_ns()
+        self._ids = itertools.count(1)
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._process = subprocess.Popen(
+            [node, str(BRIDGE), str(module)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None if show_logs else subprocess.DEVNULL,
+            env={**os.environ, **(env or {})},
+            text=True,
+            bufsize=1,
+        )
+        self._ready = threading.Event()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+        # Loading the module is the cold start; keep it out of the first invocation
+        if not self._ready.wait(startup_timeout):
+            self._process.kill()
+            raise RuntimeError(f"{function} handler did not load within {startup_timeout}s")
+        if self._process.poll() is not None:
+            raise RuntimeError(f"{function} handler process exited while loading (code {self._process.returncode})")
+        self.startup_ns = time.perf_counter_ns() - started
+
+    def submit(self, event: dict, echo: bool = False) -> "Future[Invocation]":
+        """Send an event; the future resolves when the handler returns or throws."""
+        future: Future = Future()
+        with self._lock:
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            self._process.stdin.write(json.dumps({"id": request_id, "event": event, "echo": echo}) + "\n")
+            self._process.stdin.flush()
+        return future
+
+    def invoke(self, event: dict, echo: bool = False, timeout: float | None = 60) -> Invocation:
+        return self.submit(event, echo).result(timeout)
+
+    def close(self) -> None:
+        if self._process.stdin and not self._process.stdin.closed:
+            self._process.stdin.close()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._reader.join(timeout=1)
+
+    def __enter__(self) -> "HandlerProcess":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _read(self) -> None:
+        for line in self._process.stdout:
+            message = json.loads(line)
+            if message.get("ready"):
+                self.init_ns = message.get("initNs", 0)
+                self._ready.set()
+                continue
+            with self._lock:
+                future = self._pending.pop(message["id"], None)
+            if future is not None:
+                future.set_result(Invocation(
+                    ok=message["ok"],
+                    duration_ns=message["durationNs"],
+                    result_bytes=message.get("resultBytes", 0),
+                    error=message.get("error"),
+                    result=message.get("result"),
+                    timing=message.get("timing"),
+                ))
+        # The process exited; fail whatever is still waiting
+        self._ready.set()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(RuntimeError(f"{self.function} handler process exited (code {self._process.poll()})"))
@@ -0,0 +1,98 @@
+#!/usr/bin/env node
+/*
+ * Run a compiled resolver lambda in-process for the benchmark harness.
+ *
+ *   node perf/invoke-handler.js lambda/workorder/dist/index.js
+ *   node perf/invoke-handler.js lambda/workorder/bundle/index.js
+ *
+ * Reads one JSON request per line on stdin, {"id": 1, "event": {...}}, invokes
+ * the module's `handler` with it and writes one JSON line per completed
+ * invocation to stdout, after a {"ready": true, "initNs": ...} line once the
+ * module has loaded (initNs is the time spent requiring it, the module part of
+ * a Lambda cold start):
+ *
+ *   {"id": 1, "ok": true, "durationNs": 1234567, "resultBytes": 2048}
+ *   {"id": 2, "ok": false, "durationNs": 34567, "error": "Unauthorized: ..."}
+ *
+ * Invocations run concurrently, like several AppSync requests hitting one
+ * warm container. Handler logging goes to stderr so stdout stays a clean
+ * protocol stream. An optional "echo": true on a request adds the result.
+ * LAMBDA_TIMEOUT_MS (default 30000) sets the budget the handler sees through
+ * context.getRemainingTimeInMillis(). With TRACING_ENABLED and
+ * TRACING_EXTENSION set, the handler reports its spans through
+ * context.reportTiming and the reply carries them as "timing". The PROFILING_*
+ * settings work as in Lambda, with the profiles named after awsRequestId.
+ */
+const path = require('path');
+const readline = require('readline');
+
+for (const method of ['log', 'info', 'debug', 'warn', 'error']) {
+  console[method] = (...args) => process.stderr.write(`${args.join(' ')}\n`);
+}
+
+const modulePath = process.argv[2];
+if (!modulePath) {
+  process.stderr.write('usage: invoke-handler.js <compiled handler module>\n');
+  process.exit(2);
+}
+
+const initStart = process.hrtime.bigint();
+const { handler } = require(path.resolve(modulePath));
+const initNs = Number(process.hrtime.bigint() - initStart);
+if (typeof handler !== 'function') {
+  process.stderr.write(`${modulePath} does not export a handler\n`);
+  process.exit(2);
+}
+
+let pending = 0;
+let closed = false;
+
+function write(message) {
+  process.stdout.write(`${JSON.stringify(message)}\n`);
+}
+
+// The function timeout: each invocation's budget, counting down from when it starts
+const timeoutMs = Number(process.env.LAMBDA_TIMEOUT_MS) || 30000;
+
+function context(id, report) {
+  const deadline = Date.now() + timeoutMs;
+  return {
+    awsRequestId: `bench-${id}`,
+    functionName: path.basename(path.dirname(path.dirname(path.resolve(modulePath)))),
+    getRemainingTimeInMillis: () => Math.max(0, deadline - Date.now()),
+    reportTiming: report,
+  };
+}
+
+async function invoke({ id, event, echo }) {
+  pending += 1;
+  let timing;
+  const start = process.hrtime.bigint();
+  try {
+    const result = await handler(event, context(id, reported => (timing = reported)), () => undefined);
+    const durationNs = Number(process.hrtime.bigint() - start);
+    const body = JSON.stringify(result) ?? '';
+    write({ id, ok: true, durationNs, resultBytes: Buffer.byteLength(body), ...(echo && { result }), ...(timing && { timing }) });
+  } catch (error) {
+    const durationNs = Number(process.hrtime.bigint() - start);
+    write({ id, ok: false, durationNs, error: error instanceof Error ? error.message : String(error), ...(timing && { timing }) });
+  } finally {
+    pending -= 1;
+    if (closed && pending === 0) {
+      process.exit(0);
+    }
+  }
+}
+
+write({ ready: true, initNs });
+
+readline.createInterface({ input: process.stdin }).on('line', line => {
+  if (line.trim() !== '') {
+    void invoke(JSON.parse(line));
+  }
+}).on('close', () => {
+  closed = true;
+  if (pending === 0) {
+    process.exit(0);
+  }
+});
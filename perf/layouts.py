@@ -0,0 +1,163 @@
+"""Compare the split and consolidated (gateway) lambda layouts under load.
+
+Replays a workload file through the local AppSync stand-in once per layout,
+with Lambda-style scaling: each container runs one invocation at a time, a
+request that finds every container busy waits for a new one to cold-start,
+and containers idle for --idle-timeout seconds are reclaimed. Every layout
+starts with no containers, like a fresh deploy. Reports invocations, cold
+starts and the cold-start rate per deployed function, and request latency
+percentiles per layout.
+
+    # build every lambda (npm run build) and lambda/gateway (npm run build) first
+    python -m perf.layouts perf/workloads/long-tail.json
+    python -m perf.layouts perf/workloads/dispatcher-mix.json --rps 40 --duration 30 --idle-timeout 5
+    python -m perf.layouts perf/workloads/long-tail.json --artifact bundle --json layouts.json
+
+Lambda keeps idle containers for minutes; a short run only shows the
+difference with a proportionally short --idle-timeout. Latencies include the
+stub backend's, and cold starts are this machine's, not a 256 MB Lambda's.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import random
+import sys
+
+from bff_client.http import HttpPool
+
+from .appsync_local import GATEWAY, LAYOUTS, LocalAppSync
+from .coldstart import FUNCTIONS
+from .handler_process import ARTIFACTS, handler_module
+from .loadgen import Context, LoadGenerator, Workload, load_workload, percentile, report
+from .scenarios import account_id_from, load_payload
+from .stub_backend import BackendConfig, StubBackend
+
+
+async def run_layout(layout: str, workload: Workload, args: argparse.Namespace, env: dict[str, str]) -> dict:
+    app = LocalAppSync(env=env, layout=layout, artifact=args.artifact, container_concurrency=1,
+                       idle_timeout_s=args.idle_timeout, node=args.node, show_logs=args.show_logs)
+    server = await asyncio.start_server(app.handle_connection, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/graphql"
+    constants = {"accountId": account_id_from(load_payload()), **workload.constants}
+    try:
+        async with HttpPool(url, max_connections=args.connections) as pool:
+            generator = LoadGenerator(workload, pool, {}, Context(constants, random.Random(args.seed)))
+            await generator.setup()
+            # Setup traffic warms containers but is not part of the comparison
+            app.reset_stats()
+            elapsed = await generator.run()
+            summary = report(generator, elapsed, histograms=False, out=io.StringIO())
+            fleet_stats = app.stats()
+    finally:
+        server.close()
+        await server.wait_closed()
+        await app.drain()
+        app.close()
+
+    latencies = [ms for stats in generator.stats.values() for ms in stats.latencies_ms]
+    functions = {}
+    for name, stats in fleet_stats.items():
+        functions[name] = {
+            "invocations": stats.invocations,
+            "cold_starts": stats.cold_starts,
+            "cold_start_rate": round(stats.cold_start_rate, 4),
+            "containers_peak": stats.containers_peak,
+            "init_p50_ms": percentile(stats.init_ms, 0.50),
+        }
+    invocations = sum(entry["invocations"] for entry in functions.values())
+    cold_starts = sum(entry["cold_starts"] for entry in functions.values())
+    return {
+        "layout": layout,
+        "requests": len(latencies),
+        "errors": sum(stats.errors for stats in generator.stats.values()),
+        "dropped": generator.dropped,
+        "invocations": invocations,
+        "cold_starts": cold_starts,
+        "cold_start_rate": round(cold_starts / invocations, 4) if invocations else 0.0,
+        "containers_peak": sum(entry["containers_peak"] for entry in functions.values()),
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "functions": functions,
+        "operations": summary["operations"],
+    }
+
+
+def print_comparison(results: list[dict], out=sys.stdout) -> None:
+    header = (f"{'layout':<8} {'reqs':>6} {'err':>5} {'invocations':>11} {'cold':>6} {'cold %':>7} "
+              f"{'containers':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        print(f"{result['layout']:<8} {result['requests']:>6} {result['errors']:>5} {result['invocations']:>11} "
+              f"{result['cold_starts']:>6} {result['cold_start_rate'] * 100:>6.1f}% {result['containers_peak']:>10} "
+              f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f}", file=out)
+    for result in results:
+        print(f"\n{result['layout']} by deployed function:", file=out)
+        for name, entry in result["functions"].items():
+            print(f"  {name:<10} {entry['invocations']:>7} invocations {entry['cold_starts']:>5} cold "
+                  f"({entry['cold_start_rate'] * 100:.1f}%), peak {entry['containers_peak']} containers, "
+                  f"init p50 {entry['init_p50_ms']:.1f} ms", file=out)
+
+
+async def _run(args: argparse.Namespace, workload: Workload) -> list[dict]:
+    backend = StubBackend(BackendConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, units=args.units)).start()
+    env = {**backend.env(), "LOG_LEVEL": "ERROR"}
+    try:
+        return [await run_layout(layout, workload, args, env) for layout in args.layouts]
+    finally:
+        backend.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m perf.layouts", description=__doc__.split("\n\n")[0])
+    parser.add_argument("workload", help="workload JSON file (see perf/workloads)")
+    parser.add_argument("--layouts", default=",".join(LAYOUTS), help="comma-separated layouts to run, in order")
+    parser.add_argument("--artifact", choices=ARTIFACTS, default="dist", help="which build of the split lambdas to run")
+    parser.add_argument("--idle-timeout", type=float, default=10.0, help="seconds before an idle container is reclaimed")
+    parser.add_argument("--rps", type=float, help="override the workload's target operations per second")
+    parser.add_argument("--duration", type=float, help="override the workload's duration in seconds")
+    parser.add_argument("--connections", type=int, default=64, help="HTTP connection pool size")
+    parser.add_argument("--seed", type=int, default=1, help="random seed; both layouts replay the same operations")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="stub backend jitter")
+    parser.add_argument("--units", type=int, default=50, help="stub units")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    args.layouts = [layout.strip() for layout in args.layouts.split(",")]
+    unknown = [layout for layout in args.layouts if layout not in LAYOUTS]
+    if unknown:
+        print(f"Unknown layouts: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    needed = [(name, args.artifact) for name in FUNCTIONS] if "split" in args.layouts else []
+    if GATEWAY in args.layouts:
+        needed.append((GATEWAY, "dist"))
+    missing = [f"lambda/{name}" for name, artifact in needed if not handler_module(name, artifact).exists()]
+    if missing:
+        print(f"Not built: {', '.join(missing)}; the workload's fields on them will fail", file=sys.stderr)
+
+    workload = load_workload(args.workload)
+    if args.rps is not None:
+        workload.rps = args.rps
+    if args.duration is not None:
+        workload.duration_s = args.duration
+
+    results = asyncio.run(_run(args, workload))
+    print(f"{workload.name}: {workload.rps}/s for {workload.duration_s}s, idle timeout {args.idle_timeout}s")
+    print_comparison(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump({"workload": workload.name, "idle_timeout_s": args.idle_timeout, "results": results}, out, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
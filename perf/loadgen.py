@@ -0,0 +1,487 @@
+"""Open-loop GraphQL load generator with pagination walkers.
+
+Replays a workload file, a weighted mix of queries and mutations, at a target
+request rate over one pooled keep-alive HTTP session. Operations can walk a
+cursor chain to the end and capture values from responses (IDs to read or
+delete later). Reports per-operation latency percentiles, histograms and
+error rates, plus per-page latency by pagination depth.
+
+    # against the local AppSync stand-in and stub backends, in-process
+    python -m perf.loadgen perf/workloads/dispatcher-mix.json --local
+    # against a running endpoint
+    python -m perf.loadgen perf/workloads/deep-pagination.json --url http://127.0.0.1:4000/graphql
+    python -m perf.loadgen perf/workloads/dispatcher-mix.json --url https://.../graphql --token-command ./get_token.sh
+
+Workload files are JSON:
+
+    {
+      "name": "dispatcher-mix",
+      "rps": 20, "duration_s": 60, "arrival": "poisson", "max_in_flight": 200,
+      "setup": ["walkWorkOrders"],
+      "operations": [
+        {"name": "walkWorkOrders", "weight": 10,
+         "query": "query ($accountId: ID!, $cursor: String) { listWorkOrders(...) { items { workOrderId } nextCursor } }",
+         "variables": {"accountId": "${accountId}"},
+         "paginate": {"cursor": "listWorkOrders.nextCursor", "variable": "cursor", "max_pages": 100},
+         "capture": {"workOrderIds": "listWorkOrders.items[*].workOrderId"}},
+        {"name": "getWorkOrder", "weight": 40, "query": "...",
+         "variables": {"accountId": "${accountId}", "workOrderId": "${pick:workOrderIds}"}}
+      ]
+    }
+
+Placeholders in variables: ${accountId} and the workload's other
+"constants", ${seq}, ${uuid}, ${now_ms}, ${choice:a,b,c}, ${randint:1,100},
+${env:NAME}, ${pick:pool} (random captured value) and ${take:pool} (removes
+it, for deletes). An operation whose pool is
+empty is skipped and counted as such. "paginate" may name a "has_more" path
+for connections that signal the end with a flag (listUnits). Operations named
+in "setup" run once, unrecorded, before the timed run to fill the pools.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from bff_client.http import HttpPool
+
+# Pagination depth ranges reported separately, to show what deep pages cost
+DEPTH_BUCKETS = [(1, 1), (2, 5), (6, 20), (21, 100), (101, math.inf)]
+PLACEHOLDER = re.compile(r"\$\{([^}]+)\}")
+
+
+class PoolEmpty(Exception):
+    """A ${pick:...}/${take:...} placeholder had nothing to draw from."""
+
+
+@dataclass
+class OperationSpec:
+    name: str
+    query: str
+    weight: float = 1.0
+    variables: dict = field(default_factory=dict)
+    operation_name: str | None = None
+    paginate: dict | None = None
+    capture: dict = field(default_factory=dict)
+
+
+@dataclass
+class Workload:
+    name: str
+    operations: list[OperationSpec]
+    rps: float = 10.0
+    duration_s: float = 30.0
+    arrival: str = "poisson"
+    max_in_flight: int = 200
+    setup: list[str] = field(default_factory=list)
+    constants: dict = field(default_factory=dict)
+
+
+def load_workload(path: str | Path) -> Workload:
+    with open(path, encoding="utf-8") as workload_file:
+        raw = json.load(workload_file)
+    operations = [
+        OperationSpec(
+            name=entry["name"],
+            query=entry["query"],
+            weight=float(entry.get("weight", 1)),
+            variables=entry.get("variables", {}),
+            operation_name=entry.get("operationName"),
+            paginate=entry.get("paginate"),
+            capture=entry.get("capture", {}),
+        )
+        for entry in raw["operations"]
+    ]
+    names = {operation.name for operation in operations}
+    unknown = [name for name in raw.get("setup", []) if name not in names]
+    if unknown:
+        raise ValueError(f"setup names unknown operations: {', '.join(unknown)}")
+    return Workload(
+        name=raw.get("name", Path(path).stem),
+        operations=operations,
+        rps=float(raw.get("rps", 10)),
+        duration_s=float(raw.get("duration_s", 30)),
+        arrival=raw.get("arrival", "poisson"),
+        max_in_flight=int(raw.get("max_in_flight", 200)),
+        setup=raw.get("setup", []),
+        constants=raw.get("constants", {}),
+    )
+
+
+def extract(data, path: str) -> list:
+    """Values at a dotted path; `[*]` fans out over a list."""
+    values = [data]
+    for segment in path.split("."):
+        fan_out = segment.endswith("[*]")
+        key = segment[:-3] if fan_out else segment
+        next_values = []
+        for value in values:
+            if isinstance(value, dict):
+                value = value.get(key)
+            else:
+                value = None
+            if fan_out and isinstance(value, list):
+                next_values.extend(value)
+            elif value is not None:
+                next_values.append(value)
+        values = next_values
+    return values
+
+
+class Context:
+    """Values placeholders draw from: constants, a sequence and captured pools."""
+
+    def __init__(self, variables: dict, rng: random.Random):
+        self.variables = variables
+        self.rng = rng
+        self.pools: dict[str, list] = {}
+        self.sequence = 0
+
+    def capture(self, pool: str, values: list) -> None:
+        # Bounded, so long runs do not grow without limit
+        entries = self.pools.setdefault(pool, [])
+        entries.extend(values)
+        del entries[:-10_000]
+
+    def _placeholder(self, expression: str):
+        kind, _, argument = expression.partition(":")
+        if kind == "seq":
+            self.sequence += 1
+            return self.sequence
+        if kind == "uuid":
+            return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+        if kind == "now_ms":
+            return int(time.time() * 1000)
+        if kind == "choice" and argument:
+            return self.rng.choice(argument.split(","))
+        if kind == "randint" and argument:
+            low, high = (int(bound) for bound in argument.split(","))
+            return self.rng.randint(low, high)
+        if kind == "env" and argument:
+            return os.environ.get(argument, "")
+        if kind in ("pick", "take") and argument:
+            pool = self.pools.get(argument)
+            if not pool:
+                raise PoolEmpty(argument)
+            index = self.rng.randrange(len(pool))
+            return pool.pop(index) if kind == "take" else pool[index]
+        if expression in self.variables:
+            return self.variables[expression]
+        raise KeyError(f"Unknown placeholder ${{{expression}}}")
+
+    def render(self, value):
+        if isinstance(value, dict):
+            return {key: self.render(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.render(item) for item in value]
+        if not isinstance(value, str):
+            return value
+        whole = PLACEHOLDER.fullmatch(value)
+        if whole:
+            # A lone placeholder keeps the value's type (numbers stay numbers)
+            return self._placeholder(whole.group(1))
+        return PLACEHOLDER.sub(lambda match: str(self._placeholder(match.group(1))), value)
+
+
+@dataclass
+class OperationStats:
+    requests: int = 0
+    errors: int = 0
+    skipped: int = 0
+    latencies_ms: list = field(default_factory=list)
+    walks: int = 0
+    walk_ms: list = field(default_factory=list)
+    walk_pages: list = field(default_factory=list)
+    truncated_walks: int = 0
+    by_depth: dict = field(default_factory=dict)
+    first_error: str | None = None
+
+    def record(self, latency_ms: float, depth: int, error: str | None) -> None:
+        self.requests += 1
+        self.latencies_ms.append(latency_ms)
+        self.by_depth.setdefault(depth, []).append(latency_ms)
+        if error is not None:
+            self.errors += 1
+            self.first_error = self.first_error or error
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    return ordered[min(len(ordered), max(1, math.ceil(fraction * len(ordered)))) - 1]
+
+
+def histogram(values: list[float]) -> list[tuple[str, int]]:
+    """Counts in power-of-two millisecond buckets: <1, 1-2, 2-4, ..."""
+    if not values:
+        return []
+    top = max(0, math.ceil(math.log2(max(max(values), 1))))
+    counts = [0] * (top + 2)
+    for value in values:
+        counts[0 if value < 1 else min(top + 1, math.floor(math.log2(value)) + 1)] += 1
+    labels = ["<1"] + [f"{2 ** (i - 1)}-{2 ** i}" for i in range(1, top + 2)]
+    occupied = [index for index, count in enumerate(counts) if count]
+    return list(zip(labels, counts))[occupied[0]:occupied[-1] + 1]
+
+
+class LoadGenerator:
+    def __init__(self, workload: Workload, pool: HttpPool, headers: dict[str, str], context: Context):
+        self.workload = workload
+        self.pool = pool
+        self.headers = headers
+        self.context = context
+        self.stats = {operation.name: OperationStats() for operation in workload.operations}
+        self.dropped = 0
+        self.started = 0
+        self._weights = [operation.weight for operation in workload.operations]
+
+    async def _post(self, spec: OperationSpec, variables: dict) -> tuple[dict | None, float, str | None]:
+        body = {"query": spec.query, "variables": variables}
+        if spec.operation_name:
+            body["operationName"] = spec.operation_name
+        started = time.perf_counter()
+        try:
+            response = await self.pool.post_json(body, self.headers)
+            latency_ms = (time.perf_counter() - started) * 1000
+            payload = response.json() or {}
+        except (ConnectionError, asyncio.TimeoutError, OSError, ValueError) as error:
+            return None, (time.perf_counter() - started) * 1000, f"{type(error).__name__}: {error}"
+        if response.status != 200:
+            return payload, latency_ms, f"HTTP {response.status}"
+        if payload.get("errors"):
+            return payload, latency_ms, payload["errors"][0].get("message", "GraphQL error")
+        return payload, latency_ms, None
+
+    async def run_operation(self, spec: OperationSpec, record: bool = True) -> None:
+        stats = self.stats[spec.name]
+        try:
+            variables = self.context.render(spec.variables)
+        except PoolEmpty:
+            stats.skipped += 1
+            return
+
+        paginate = spec.paginate or {}
+        max_pages = int(paginate.get("max_pages", 1)) if paginate else 1
+        walk_started = time.perf_counter()
+        pages = 0
+        complete = not paginate
+        while pages < max_pages:
+            payload, latency_ms, error = await self._post(spec, variables)
+            pages += 1
+            if record:
+                stats.record(latency_ms, pages, error)
+            data = (payload or {}).get("data")
+            if error is not None or data is None:
+                break
+            for pool, path in spec.capture.items():
+                self.context.capture(pool, extract(data, path))
+            if not paginate:
+                break
+            cursors = extract(data, paginate["cursor"])
+            has_more = extract(data, paginate["has_more"]) if "has_more" in paginate else [True]
+            if not cursors or cursors[0] in ("", None) or has_more[:1] == [False]:
+                complete = True
+                break
+            variables = {**variables, paginate.get("variable", "cursor"): cursors[0]}
+
+        if paginate and record:
+            stats.walks += 1
+            stats.walk_pages.append(pages)
+            stats.walk_ms.append((time.perf_counter() - walk_started) * 1000)
+            if not complete:
+                stats.truncated_walks += 1
+
+    async def setup(self) -> None:
+        by_name = {operation.name: operation for operation in self.workload.operations}
+        for name in self.workload.setup:
+            await self.run_operation(by_name[name], record=False)
+
+    async def run(self) -> float:
+        """Issue operations at the target rate for the duration; returns elapsed seconds."""
+        workload = self.workload
+        loop = asyncio.get_running_loop()
+        tasks: set[asyncio.Task] = set()
+        start = loop.time()
+        next_at = start
+        while next_at - start < workload.duration_s:
+            delay = next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(tasks) >= workload.max_in_flight:
+                # Open loop: the target system is saturated; count it rather than wait
+                self.dropped += 1
+            else:
+                spec = self.context.rng.choices(workload.operations, weights=self._weights)[0]
+                task = asyncio.create_task(self.run_operation(spec))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                self.started += 1
+            interval = self.context.rng.expovariate(workload.rps) if workload.arrival == "poisson" else 1 / workload.rps
+            next_at += interval
+        if tasks:
+            await asyncio.gather(*tasks)
+        return loop.time() - start
+
+
+def report(generator: LoadGenerator, elapsed_s: float, histograms: bool, out=sys.stdout) -> dict:
+    workload = generator.workload
+    summary = {
+        "workload": workload.name,
+        "target_rps": workload.rps,
+        "elapsed_s": round(elapsed_s, 3),
+        "operations_started": generator.started,
+        "achieved_ops_per_s": round(generator.started / elapsed_s, 2) if elapsed_s else 0,
+        "dropped": generator.dropped,
+        "connections_opened": generator.pool.connections_opened,
+        "operations": {},
+    }
+    print(f"{workload.name}: {generator.started} operations in {elapsed_s:.1f}s "
+          f"({summary['achieved_ops_per_s']}/s, target {workload.rps}/s), {generator.dropped} dropped, "
+          f"{generator.pool.connections_opened} connections", file=out)
+    header = f"{'operation':<28} {'reqs':>7} {'err%':>6} {'skip':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for name, stats in generator.stats.items():
+        latencies = stats.latencies_ms
+        error_rate = stats.errors / stats.requests if stats.requests else 0.0
+        entry = {
+            "requests": stats.requests,
+            "errors": stats.errors,
+            "error_rate": round(error_rate, 4),
+            "skipped": stats.skipped,
+            "p50_ms": percentile(latencies, 0.50),
+            "p95_ms": percentile(latencies, 0.95),
+            "p99_ms": percentile(latencies, 0.99),
+            "max_ms": max(latencies) if latencies else math.nan,
+            "histogram": histogram(latencies),
+            "first_error": stats.first_error,
+        }
+        print(f"{name:<28} {stats.requests:>7} {error_rate * 100:>6.1f} {stats.skipped:>5} {entry['p50_ms']:>9.1f} "
+              f"{entry['p95_ms']:>9.1f} {entry['p99_ms']:>9.1f} {entry['max_ms']:>9.1f}", file=out)
+        if stats.walks:
+            depth = {}
+            for low, high in DEPTH_BUCKETS:
+                values = [ms for page, samples in stats.by_depth.items() if low <= page <= high for ms in samples]
+                if values:
+                    label = f"{low}+" if high == math.inf else (f"{low}" if low == high else f"{low}-{high}")
+                    depth[label] = {"pages": len(values), "p50_ms": percentile(values, 0.5), "p95_ms": percentile(values, 0.95)}
+            entry["walks"] = {
+                "count": stats.walks,
+                "truncated": stats.truncated_walks,
+                "pages_p50": percentile(stats.walk_pages, 0.5),
+                "pages_max": max(stats.walk_pages),
+                "walk_p50_ms": percentile(stats.walk_ms, 0.5),
+                "walk_p95_ms": percentile(stats.walk_ms, 0.95),
+                "page_latency_by_depth": depth,
+            }
+            walks = entry["walks"]
+            print(f"{'':<4}walks {walks['count']} ({walks['truncated']} hit max_pages), pages p50 {walks['pages_p50']} "
+                  f"max {walks['pages_max']}, walk p50 {walks['walk_p50_ms']:.1f} ms p95 {walks['walk_p95_ms']:.1f} ms", file=out)
+            for label, bucket in depth.items():
+                print(f"{'':<4}page {label:<7} n={bucket['pages']:<6} p50 {bucket['p50_ms']:>8.1f} ms  p95 {bucket['p95_ms']:>8.1f} ms", file=out)
+        if histograms and latencies:
+            peak = max(count for _, count in entry["histogram"])
+            for label, count in entry["histogram"]:
+                print(f"{'':<4}{label + ' ms':>12} {count:>7} {'#' * round(40 * count / peak) if peak else ''}", file=out)
+        if stats.first_error:
+            print(f"{'':<4}first error: {stats.first_error}", file=out)
+        summary["operations"][name] = entry
+    return summary
+
+
+def _token(args: argparse.Namespace) -> str | None:
+    if args.token:
+        return args.token
+    if args.token_command:
+        return subprocess.check_output(args.token_command, shell=True, text=True).strip()
+    return os.environ.get("APPSYNC_TOKEN")
+
+
+async def _run(args: argparse.Namespace, workload: Workload) -> dict:
+    local_app = backend = server = None
+    url = args.url
+    if args.local:
+        from .appsync_local import LocalAppSync
+        from .stub_backend import BackendConfig, StubBackend
+
+        backend = StubBackend(BackendConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, units=args.units)).start()
+        local_app = LocalAppSync(env={**backend.env(), "LOG_LEVEL": "ERROR"})
+        local_app.start()
+        server = await asyncio.start_server(local_app.handle_connection, "127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/graphql"
+
+    token = _token(args)
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    constants = dict(workload.constants)
+    if args.account_id:
+        constants["accountId"] = args.account_id
+    elif "accountId" not in constants:
+        from .scenarios import account_id_from, load_payload
+        constants["accountId"] = account_id_from(load_payload())
+    context = Context(constants, random.Random(args.seed))
+
+    try:
+        async with HttpPool(url, max_connections=args.connections) as pool:
+            generator = LoadGenerator(workload, pool, headers, context)
+            await generator.setup()
+            elapsed = await generator.run()
+            return report(generator, elapsed, args.histograms)
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+        if local_app is not None:
+            await local_app.drain()
+            local_app.close()
+        if backend is not None:
+            backend.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m perf.loadgen", description=__doc__.split("\n\n")[0])
+    parser.add_argument("workload", help="workload JSON file (see perf/workloads)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="GraphQL endpoint")
+    target.add_argument("--local", action="store_true", help="start the local AppSync stand-in and stub backends in-process")
+    parser.add_argument("--rps", type=float, help="override the workload's target operations per second")
+    parser.add_argument("--duration", type=float, help="override the workload's duration in seconds")
+    parser.add_argument("--connections", type=int, default=64, help="HTTP connection pool size")
+    parser.add_argument("--account-id", help="value of ${accountId} (default: lambda-test-payload.json)")
+    parser.add_argument("--token", help="bearer token (or APPSYNC_TOKEN)")
+    parser.add_argument("--token-command", help="command printing a bearer token, e.g. ./get_token.sh")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for the operation mix and placeholders")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub backend latency with --local")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="stub backend jitter with --local")
+    parser.add_argument("--units", type=int, default=50, help="stub units with --local")
+    parser.add_argument("--histograms", action="store_true", help="print a latency histogram per operation")
+    parser.add_argument("--json", metavar="FILE", help="also write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    workload = load_workload(args.workload)
+    if args.rps is not None:
+        workload.rps = args.rps
+    if args.duration is not None:
+        workload.duration_s = args.duration
+
+    summary = asyncio.run(_run(args, workload))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump(summary, out, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""Response size and serialization cost of the unit-heavy fields, shaped and not.
+
+Runs each field through its compiled lambda against the stub backend twice:
+"raw", with response compaction off and uncompressed backend bodies
+(RESPONSE_COMPACT=false, HTTP_ACCEPT_ENCODING=identity), and "shaped", with
+the defaults (null fields dropped, projected sub-objects shared, gzip from
+the backend). Reports the bytes returned to AppSync, the time spent
+compacting (`shape` span) and JSON-encoding (`serialize` span) the result,
+handler latency, and backend body bytes per operation before and after
+compression, i.e. what crossed the wire.
+
+    # build the unit and event lambdas first (npm run build)
+    python -m perf.payload
+    python -m perf.payload --units 1000 --limit 500 --fields listUnits,getUnit
+    python -m perf.payload --selection scenario     # the bench scenarios' selection sets
+
+By default the client selects every field (no selection set), the worst case
+for the ~40 mostly-null VIN-decode fields of a unit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+
+from .bench import percentile
+from .handler_process import HandlerProcess, handler_module
+from .scenarios import account_id_from, build_event, load_payload, scenarios
+from .stub_backend import BackendConfig, StubBackend
+
+FIELDS = ("getUnit", "listUnits", "getUnitWithWorkOrders", "listEventsByStatus")
+LIST_FIELDS = {"listUnits", "getUnitWithWorkOrders", "listEventsByStatus"}
+VARIANTS = {
+    "raw": {"RESPONSE_COMPACT": "false", "HTTP_ACCEPT_ENCODING": "identity"},
+    "shaped": {},
+}
+
+
+@dataclass
+class PayloadResult:
+    field: str
+    variant: str
+    iterations: int
+    errors: int
+    result_bytes: int
+    shape_p50_ms: float
+    serialize_p50_ms: float
+    handler_p50_ms: float
+    backend_body_bytes_per_op: float
+    backend_wire_bytes_per_op: float
+    first_error: str | None = None
+
+
+def run_field(process: HandlerProcess, backend: StubBackend, field: str, variant: str, event: dict,
+              iterations: int, warmup: int) -> PayloadResult:
+    for _ in range(warmup):
+        process.invoke(event)
+    body_before, wire_before = backend.body_bytes, backend.wire_bytes
+    shape, serialize, handler = [], [], []
+    errors, result_bytes, first_error = 0, 0, None
+    for _ in range(iterations):
+        invocation = process.invoke(event)
+        if not invocation.ok:
+            errors += 1
+            first_error = first_error or invocation.error
+            continue
+        result_bytes = max(result_bytes, invocation.result_bytes)
+        totals = (invocation.timing or {}).get("totals", {})
+        shape.append(totals.get("shape", 0.0))
+        serialize.append(totals.get("serialize", 0.0))
+        handler.append(invocation.duration_ns / 1e6)
+    return PayloadResult(
+        field=field,
+        variant=variant,
+        iterations=iterations,
+        errors=errors,
+        result_bytes=result_bytes,
+        shape_p50_ms=percentile(sorted(shape), 0.5),
+        serialize_p50_ms=percentile(sorted(serialize), 0.5),
+        handler_p50_ms=percentile(sorted(handler), 0.5),
+        backend_body_bytes_per_op=(backend.body_bytes - body_before) / iterations if iterations else 0.0,
+        backend_wire_bytes_per_op=(backend.wire_bytes - wire_before) / iterations if iterations else 0.0,
+        first_error=first_error,
+    )
+
+
+def print_table(results: list[PayloadResult], out=sys.stdout) -> None:
+    header = (f"{'field':<24} {'variant':<7} {'ops':>5} {'err':>4} {'result KB':>10} {'shape ms':>9} "
+              f"{'serial ms':>10} {'p50 ms':>9} {'backend KB/op':>14} {'wire KB/op':>11}")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        print(
+            f"{result.field:<24} {result.variant:<7} {result.iterations:>5} {result.errors:>4} "
+            f"{result.result_bytes / 1024:>10.1f} {result.shape_p50_ms:>9.2f} {result.serialize_p50_ms:>10.2f} "
+            f"{result.handler_p50_ms:>9.2f} {result.backend_body_bytes_per_op / 1024:>14.1f} "
+            f"{result.backend_wire_bytes_per_op / 1024:>11.1f}",
+            file=out,
+        )
+    for result in results:
+        if result.first_error:
+            print(f"{result.field} ({result.variant}): {result.errors} errors, first: {result.first_error}", file=out)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m perf.payload", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fields", default=",".join(FIELDS), help=f"comma-separated fields (default: {','.join(FIELDS)})")
+    parser.add_argument("--iterations", type=int, default=30, help="timed invocations per field and variant")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed invocations first")
+    parser.add_argument("--units", type=int, default=500)
+    parser.add_argument("--events-per-unit", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=200, help="page size asked for by the list fields")
+    parser.add_argument("--selection", choices=("all", "scenario"), default="all",
+                        help="all: no selection set, every field selected; scenario: the bench scenario's selection")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="stub backend latency")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    payload = load_payload()
+    available = scenarios(account_id_from(payload))
+    names = [name.strip() for name in args.fields.split(",")]
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        print(f"Unknown fields: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    missing = sorted({available[name].function for name in names if not handler_module(available[name].function).exists()})
+    if missing:
+        print(f"Not built: {', '.join(missing)}; run `npm run build` in lambda/<fn> first", file=sys.stderr)
+        return 2
+
+    events = {}
+    for name in names:
+        event = build_event(payload, available[name])
+        if name in LIST_FIELDS:
+            event["arguments"]["limit"] = args.limit
+        if args.selection == "all":
+            event["info"]["selectionSetList"] = []
+        events[name] = event
+
+    config = BackendConfig(latency_ms=args.latency_ms, jitter_ms=0.0, units=args.units,
+                           events_per_unit=args.events_per_unit, default_page_size=args.limit)
+    results: list[PayloadResult] = []
+    with StubBackend(config) as backend:
+        base_env = {
+            **backend.env(),
+            "LOG_LEVEL": "ERROR",
+            "CACHE_ENABLED": "false",
+            "EVENT_STATUS_INDEX_TTL_MS": "1",
+            "TRACING_ENABLED": "true",
+            "TRACING_EXTENSION": "true",
+            "TRACING_METRICS": "false",
+        }
+        for variant, variant_env in VARIANTS.items():
+            processes: dict[str, HandlerProcess] = {}
+            try:
+                for name in names:
+                    function = available[name].function
+                    if function not in processes:
+                        processes[function] = HandlerProcess(function, env={**base_env, **variant_env}, node=args.node,
+                                                             show_logs=args.show_logs)
+                    results.append(run_field(processes[function], backend, name, variant, events[name],
+                                             args.iterations, args.warmup))
+            finally:
+                for process in processes.values():
+                    process.close()
+    results.sort(key=lambda result: (names.index(result.field), list(VARIANTS).index(result.variant)))
+
+    if args.json:
+        json.dump({"settings": vars(args), "results": [asdict(result) for result in results]}, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
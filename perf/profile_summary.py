@@ -0,0 +1,183 @@
+"""Hottest functions in CPU and heap profiles captured by the lambdas.
+
+Reads the .cpuprofile / .heapprofile files written with PROFILING_FIELDS,
+PROFILING_SAMPLE_RATE or PROFILING_HEADER (lambda/shared/src/profiling) and
+ranks functions by self time and by bytes allocated, summed over every file
+given, so several captures of one field add up:
+
+    python -m perf.profile_summary /tmp/profiles
+    python -m perf.profile_summary /tmp/profiles/listEventsByStatus-*.cpuprofile --top 10
+    python -m perf.profile_summary perf/profiles --match /lambda/ --json
+
+Self is time (or sampled allocation) in the function itself; total adds its
+callees, counted once per stack so recursion is not double counted. Heap
+figures come from sampling, so they estimate allocation, not retained size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .handler_process import REPO_ROOT
+
+
+@dataclass
+class HotFunction:
+    function: str
+    location: str
+    self: float
+    total: float
+    self_share: float
+
+
+def _location(call_frame: dict) -> str:
+    url = call_frame.get("url") or ""
+    if url.startswith("file://"):
+        url = url[len("file://"):]
+    if url.startswith(str(REPO_ROOT)):
+        url = url[len(str(REPO_ROOT)) + 1:]
+    if not url:
+        return ""
+    return f"{url}:{call_frame.get('lineNumber', -1) + 1}"
+
+
+def _key(call_frame: dict) -> tuple[str, str]:
+    return call_frame.get("functionName") or "(anonymous)", _location(call_frame)
+
+
+def cpu_totals(profile: dict) -> tuple[dict[tuple[str, str], float], dict[tuple[str, str], float]]:
+    """Self and total milliseconds per function of one .cpuprofile."""
+    nodes = {node["id"]: node for node in profile["nodes"]}
+    parents = {child: node["id"] for node in profile["nodes"] for child in node.get("children", ())}
+    samples, deltas = profile.get("samples", []), profile.get("timeDeltas", [])
+    # timeDeltas[i] is the gap before sample i, so sample i lasted until sample i + 1
+    timestamps, at = [], profile.get("startTime", 0)
+    for delta in deltas:
+        at += delta
+        timestamps.append(at)
+    end = profile.get("endTime", timestamps[-1] if timestamps else 0)
+
+    self_ms: dict[tuple[str, str], float] = defaultdict(float)
+    total_ms: dict[tuple[str, str], float] = defaultdict(float)
+    for index, node_id in enumerate(samples):
+        following = timestamps[index + 1] if index + 1 < len(timestamps) else end
+        ms = max(0, following - timestamps[index]) / 1000 if index < len(timestamps) else 0
+        self_ms[_key(nodes[node_id]["callFrame"])] += ms
+        seen = set()
+        while node_id is not None:
+            key = _key(nodes[node_id]["callFrame"])
+            if key not in seen:
+                seen.add(key)
+                total_ms[key] += ms
+            node_id = parents.get(node_id)
+    return self_ms, total_ms
+
+
+def heap_totals(profile: dict) -> tuple[dict[tuple[str, str], float], dict[tuple[str, str], float]]:
+    """Self and total sampled allocation bytes per function of one .heapprofile."""
+    self_bytes: dict[tuple[str, str], float] = defaultdict(float)
+    total_bytes: dict[tuple[str, str], float] = defaultdict(float)
+
+    def walk(node: dict, stack: frozenset) -> float:
+        key = _key(node["callFrame"])
+        self_bytes[key] += node.get("selfSize", 0)
+        subtree = node.get("selfSize", 0) + sum(walk(child, stack | {key}) for child in node.get("children", ()))
+        if key not in stack:
+            total_bytes[key] += subtree
+        return subtree
+
+    walk(profile["head"], frozenset())
+    return self_bytes, total_bytes
+
+
+def hottest(self_totals: dict, totals: dict, top: int, match: str | None) -> list[HotFunction]:
+    overall = sum(self_totals.values()) or 1
+    ranked = sorted(self_totals.items(), key=lambda item: item[1], reverse=True)
+    return [
+        HotFunction(function, location, round(value, 2), round(totals.get((function, location), value), 2), round(value / overall, 4))
+        for (function, location), value in ranked
+        if match is None or match in location
+    ][:top]
+
+
+def profile_files(paths: list[str], suffix: str) -> list[Path]:
+    files: list[Path] = []
+    for name in paths:
+        path = Path(name)
+        files.extend(sorted(path.glob(f"*{suffix}")) if path.is_dir() else [path] if path.suffix == suffix else [])
+    return files
+
+
+def summarize(paths: list[str], top: int, match: str | None) -> dict:
+    report: dict = {}
+    for suffix, read, unit in ((".cpuprofile", cpu_totals, "ms"), (".heapprofile", heap_totals, "bytes")):
+        files = profile_files(paths, suffix)
+        if not files:
+            continue
+        self_sum: dict = defaultdict(float)
+        total_sum: dict = defaultdict(float)
+        for file in files:
+            with open(file, encoding="utf-8") as source:
+                self_values, total_values = read(json.load(source))
+            for key, value in self_values.items():
+                self_sum[key] += value
+            for key, value in total_values.items():
+                total_sum[key] += value
+        report[suffix[1:]] = {
+            "files": len(files),
+            "unit": unit,
+            "overall": round(sum(self_sum.values()), 2),
+            "functions": [asdict(hot) for hot in hottest(self_sum, total_sum, top, match)],
+        }
+    return report
+
+
+def print_report(report: dict, out=sys.stdout) -> None:
+    for kind, section in report.items():
+        unit = section["unit"]
+        overall = section["overall"] / 1024 if unit == "bytes" else section["overall"]
+        shown = "KB" if unit == "bytes" else unit
+        print(f"{kind}: {section['files']} file(s), {overall:.1f} {shown} sampled", file=out)
+        header = f"{'self ' + shown:>12} {'self %':>7} {'total ' + shown:>12}  function"
+        print(header, file=out)
+        print("-" * len(header), file=out)
+        for hot in section["functions"]:
+            scale = 1024 if unit == "bytes" else 1
+            print(
+                f"{hot['self'] / scale:>12.1f} {hot['self_share'] * 100:>6.1f}% {hot['total'] / scale:>12.1f}  "
+                f"{hot['function']} {hot['location']}".rstrip(),
+                file=out,
+            )
+        print(file=out)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m perf.profile_summary", description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", nargs="+", help=".cpuprofile/.heapprofile files, or directories holding them")
+    parser.add_argument("--top", type=int, default=20, help="functions listed per profile kind")
+    parser.add_argument("--match", help="only list functions whose location contains this, e.g. /lambda/")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON instead of tables")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    report = summarize(args.paths, args.top, args.match)
+    if not report:
+        print(f"No .cpuprofile or .heapprofile files in {', '.join(args.paths)}", file=sys.stderr)
+        return 1
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
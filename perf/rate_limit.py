@@ -0,0 +1,241 @@
+"""Per-account rate limiting across several containers: in-container vs shared buckets.
+
+Runs --containers handler processes of the unit lambda with RATE_LIMIT_ENABLED
+and sends one account's getUnitWithWorkOrders requests round-robin across
+them as fast as they are answered, for --duration seconds. With
+RATE_LIMIT_STORE=memory each container keeps its own bucket, so the account
+can spend its budget once per container; with the shared store every
+container takes from one bucket, which this module also serves: a local
+stand-in for the rate-limit service HttpRateLimitStore talks to, applying the
+same refill-then-take step per key under a lock.
+
+Reports, per store, the requests admitted and throttled, the cost admitted
+per second, and the bound a single bucket allows over the run
+(capacity + refill x duration).
+
+    # build the unit lambda (npm run build) first
+    python -m perf.rate_limit
+    python -m perf.rate_limit --containers 4 --capacity 200 --refill 50 --duration 5
+    python -m perf.rate_limit --serve --port 4100   # only the store, for RATE_LIMIT_STORE=http://127.0.0.1:4100/take
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .handler_process import HandlerProcess, handler_module
+from .scenarios import build_event, load_payload, scenarios
+from .stub_backend import BackendConfig, StubBackend
+
+THROTTLED = "Rate limit exceeded"
+
+
+class _Server(ThreadingHTTPServer):
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class RateLimitStore:
+    """Token buckets served over HTTP (POST {key, cost, capacity, refillPerSecond}
+    answers {allowed, remaining, retryInMs}); use as a context manager."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/take"
+
+    def take(self, key: str, cost: float, capacity: float, refill_per_second: float) -> dict:
+        """The same step as takeTokens in lambda/shared/src/admission/rate-limiter.ts."""
+        now = time.monotonic() * 1000
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_second / 1000)
+            if cost <= tokens:
+                self._buckets[key] = (tokens - cost, now)
+                return {"allowed": True, "remaining": tokens - cost, "retryInMs": 0}
+            self._buckets[key] = (tokens, now)
+        if cost > capacity or refill_per_second <= 0:
+            # Never enough: JSON has no Infinity, and the lambdas read null as one
+            return {"allowed": False, "remaining": tokens, "retryInMs": None}
+        return {"allowed": False, "remaining": tokens, "retryInMs": math.ceil((cost - tokens) * 1000 / refill_per_second)}
+
+    def start(self) -> "RateLimitStore":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "RateLimitStore":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _handler_class(self):
+        store = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                    status, answer = 200, store.take(str(body["key"]), float(body["cost"]), float(body["capacity"]),
+                                                     float(body["refillPerSecond"]))
+                except (KeyError, TypeError, ValueError) as error:
+                    status, answer = 400, {"message": f"Bad request: {error}"}
+                payload = json.dumps(answer).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+                pass
+
+        return Handler
+
+
+@dataclass
+class StoreResult:
+    store: str
+    containers: int
+    admitted: int
+    throttled: int
+    errors: int
+    admitted_cost_per_s: float
+    # Cost one bucket admits over the run: capacity + refill x duration
+    single_bucket_cost_per_s: float
+    first_error: str | None = None
+
+
+def run_store(store: str, store_env: str, event: dict, cost: int, backend: StubBackend,
+              args: argparse.Namespace) -> StoreResult:
+    env = {
+        **backend.env(),
+        "LOG_LEVEL": "ERROR",
+        "CACHE_ENABLED": "false",
+        "RATE_LIMIT_ENABLED": "true",
+        "RATE_LIMIT_CAPACITY": str(args.capacity),
+        "RATE_LIMIT_REFILL_PER_SECOND": str(args.refill),
+        "RATE_LIMIT_STORE": store_env,
+    }
+    handlers = [HandlerProcess("unit", env=env, node=args.node, show_logs=args.show_logs)
+                for _ in range(args.containers)]
+    admitted = throttled = errors = 0
+    first_error = None
+    try:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        while time.perf_counter() < deadline:
+            # One request in flight per container, like a client fanning out over warm containers
+            futures: list[Future] = [handler.submit(event) for handler in handlers]
+            for future in futures:
+                invocation = future.result(60)
+                if invocation.ok:
+                    admitted += 1
+                elif (invocation.error or "").startswith(THROTTLED):
+                    throttled += 1
+                else:
+                    errors += 1
+                    first_error = first_error or invocation.error
+        elapsed = time.perf_counter() - started
+    finally:
+        for handler in handlers:
+            handler.close()
+    return StoreResult(
+        store=store,
+        containers=args.containers,
+        admitted=admitted,
+        throttled=throttled,
+        errors=errors,
+        admitted_cost_per_s=admitted * cost / elapsed,
+        single_bucket_cost_per_s=(args.capacity + args.refill * elapsed) / elapsed,
+        first_error=first_error,
+    )
+
+
+def print_table(results: list[StoreResult], out=sys.stdout) -> None:
+    header = f"{'store':<8} {'containers':>10} {'admitted':>9} {'throttled':>10} {'err':>4} {'cost/s':>9} {'1 bucket/s':>11}"
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        print(
+            f"{result.store:<8} {result.containers:>10} {result.admitted:>9} {result.throttled:>10} {result.errors:>4} "
+            f"{result.admitted_cost_per_s:>9.1f} {result.single_bucket_cost_per_s:>11.1f}",
+            file=out,
+        )
+    for result in results:
+        if result.first_error:
+            print(f"{result.store}: {result.errors} errors, first: {result.first_error}", file=out)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m perf.rate_limit", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--containers", type=int, default=3, help="unit handler processes sharing one account")
+    parser.add_argument("--capacity", type=int, default=100, help="RATE_LIMIT_CAPACITY")
+    parser.add_argument("--refill", type=int, default=40, help="RATE_LIMIT_REFILL_PER_SECOND")
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds of requests per store")
+    parser.add_argument("--limit", type=int, default=20, help="getUnitWithWorkOrders page size, at most 50 (its cost is limit + 1)")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="stub backend latency")
+    parser.add_argument("--serve", action="store_true", help="only run the shared store until interrupted")
+    parser.add_argument("--port", type=int, default=0, help="port of the shared store")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.serve:
+        with RateLimitStore(port=args.port) as shared:
+            print(f"RATE_LIMIT_STORE={shared.url}", flush=True)
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
+        return 0
+    if not handler_module("unit").exists():
+        print("Not built: unit; run `npm run build` in lambda/unit first", file=sys.stderr)
+        return 2
+
+    template = load_payload()
+    scenario = scenarios("")["getUnitWithWorkOrders"]
+    event = build_event(template, scenario)
+    event["arguments"] = {"limit": args.limit}
+    results: list[StoreResult] = []
+    with StubBackend(BackendConfig(latency_ms=args.latency_ms, jitter_ms=0.0)) as backend, RateLimitStore() as shared:
+        cost = min(args.limit, 50) + 1
+        results.append(run_store("memory", "memory", event, cost, backend, args))
+        results.append(run_store("shared", shared.url, event, cost, backend, args))
+
+    if args.json:
+        json.dump({"settings": vars(args), "results": [asdict(result) for result in results]}, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""GraphQL operations the harness can time, as AppSync resolver events.
+
+Events are built from lambda-test-payload.json (identity, request headers) so
+they match what AppSync sends the lambdas; each scenario fills in the field
+name, its arguments and the client's selection set.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from dataclasses import dataclass, field
+
+from .handler_process import REPO_ROOT
+
+PAYLOAD = REPO_ROOT / "lambda-test-payload.json"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One GraphQL field, the lambda that resolves it and a typical request."""
+
+    field_name: str
+    function: str
+    arguments: dict = field(default_factory=dict)
+    selection: tuple[str, ...] = ()
+    description: str = ""
+
+
+def _items(*fields: str, extra: tuple[str, ...] = ()) -> tuple[str, ...]:
+    return ("items", *(f"items/{name}" for name in fields), *extra)
+
+
+WORK_ORDER_FIELDS = ("workOrderId", "accountId", "unitId", "status", "description", "notes", "createdAt", "updatedAt")
+UNIT_FIELDS = ("id", "accountId", "locationId", "suggestedVin", "model", "modelYear", "make", "createdAt", "updatedAt")
+EVENT_FIELDS = ("eventId", "unitId", "eventType", "eventCategory", "status", "severity", "createdAt")
+
+
+def scenarios(account_id: str) -> dict[str, Scenario]:
+    """Every benchmarked field, keyed by GraphQL field name."""
+    all_scenarios = [
+        Scenario(
+            "listWorkOrders", "workorder", {"accountId": account_id, "pageSize": 50},
+            _items(*WORK_ORDER_FIELDS, extra=("nextCursor", "count")),
+            "One backend page, per-row conversion",
+        ),
+        Scenario(
+            "getWorkOrder", "workorder", {"accountId": account_id, "workOrderId": "wo-0001-00"},
+            WORK_ORDER_FIELDS,
+            "Single record read",
+        ),
+        Scenario(
+            "listUnits", "unit", {"limit": 50},
+            _items(*UNIT_FIELDS, extra=("cursor", "hasMore")),
+            "One backend page of units",
+        ),
+        Scenario(
+            "getUnit", "unit", {"id": "unit-0001"},
+            UNIT_FIELDS,
+            "Single record read",
+        ),
+        Scenario(
+            "getUnitWithWorkOrders", "unit", {"limit": 20},
+            _items(*UNIT_FIELDS, extra=("items/workOrders", *(f"items/workOrders/{name}" for name in WORK_ORDER_FIELDS), "cursor", "hasMore")),
+            "Units page fanned out to each unit's work orders",
+        ),
+        Scenario(
+            "listEvents", "event", {"accountId": account_id, "limit": 50},
+            _items(*EVENT_FIELDS, extra=("nextCursor", "count")),
+            "One backend page of events",
+        ),
+        Scenario(
+            "listEventsByStatus", "event", {"accountId": account_id, "status": ["created", "acknowledged", "escalated"], "limit": 20},
+            _items(*EVENT_FIELDS, "unitInfo", "unitInfo/model", "unitInfo/modelYear", extra=("nextCursor", "count")),
+            "Every unit's events fetched, indexed and merged by status",
+        ),
+        Scenario(
+            "listLocations", "location", {"accountId": account_id, "limit": 50},
+            _items("locationId", "accountId", "locationType", "address", "address/city", extra=("nextCursor",)),
+        ),
+        Scenario(
+            "listContacts", "contact", {"accountId": account_id, "limit": 50},
+            _items("email", "accountId", "firstName", "lastName", extra=("nextCursor",)),
+        ),
+        Scenario(
+            "listTasks", "task", {"accountId": account_id, "limit": 50},
+            _items("taskId", "accountId", "workOrderId", "status", extra=("nextCursor", "count")),
+        ),
+        Scenario(
+            "listParts", "part", {"accountId": account_id, "limit": 50},
+            _items("partId", "accountId", "partNumber", "description", "quantity", extra=("nextCursor", "count")),
+        ),
+        Scenario(
+            "listLaborLines", "laborline", {"accountId": account_id, "limit": 50},
+            _items("laborLineId", "accountId", "taskId", "description", extra=("nextCursor",)),
+        ),
+        Scenario(
+            "createWorkOrders", "workorder",
+            {
+                "accountId": account_id,
+                "inputs": [
+                    {"contactId": "contact-0001", "unitId": f"unit-{n:04d}", "status": "draft", "description": f"Bulk work order {n}"}
+                    for n in range(1, 51)
+                ],
+            },
+            ("index", *(f"workOrder/{name}" for name in WORK_ORDER_FIELDS), "error", "error/message"),
+            "50 work orders through the backend bulk endpoint",
+        ),
+        Scenario(
+            "createParts", "part",
+            {
+                "accountId": account_id,
+                "inputs": [
+                    {
+                        "partNumber": f"PN-{n:04d}", "description": f"Bulk part {n}", "manufacturer": "Stub",
+                        "category": "engine", "condition": "new", "status": "available", "quantity": 1,
+                    }
+                    for n in range(1, 51)
+                ],
+            },
+            ("index", "part/partId", "part/partNumber", "error", "error/message"),
+            "50 parts, one backend call each (no bulk endpoint) with bounded concurrency",
+        ),
+        Scenario(
+            "getAccount", "account", {"id": account_id},
+            ("id", "name", "status", "createdAt", "updatedAt"),
+            "Single record read",
+        ),
+    ]
+    return {scenario.field_name: scenario for scenario in all_scenarios}
+
+
+def load_payload() -> dict:
+    with open(PAYLOAD, encoding="utf-8") as payload:
+        return json.load(payload)
+
+
+def account_id_from(payload: dict) -> str:
+    return payload["identity"]["claims"]["sub"]
+
+
+def build_event(template: dict, scenario: Scenario) -> dict:
+    """An AppSync resolver event for the scenario, based on the test payload."""
+    event = copy.deepcopy(template)
+    account_id = account_id_from(template)
+    event["arguments"] = copy.deepcopy(scenario.arguments)
+    # Some resolvers read identity.sub, others identity.claims.sub
+    event["identity"] = {**event.get("identity", {}), "sub": account_id}
+    event["source"] = None
+    event["info"] = {
+        "fieldName": scenario.field_name,
+        "parentTypeName": "Query",
+        "variables": {},
+        "selectionSetList": list(scenario.selection),
+    }
+    return event
@@ -0,0 +1,527 @@
+"""Local stand-in for the srnext REST backends the resolver lambdas call.
+
+One threaded HTTP server answers every backend route (units, work orders,
+events, locations, contacts, tasks, parts, accounts, labor lines) with
+deterministic generated data, so the compiled handlers can be pointed at it
+through their *_API_URL variables and run offline.
+
+Each request sleeps for a configurable latency (with jitter) before answering,
+and the server counts requests so the harness can report backend calls per
+GraphQL operation. Faults can be injected too: a fraction of requests can be
+slow (a latency tail) or fail with a 5xx, for exercising the lambdas'
+deadlines, hedged reads and circuit breakers. Bodies over 1 KB are gzipped
+for clients that accept it, and the server counts body bytes before and
+after compression.
+"""
+
+from __future__ import annotations
+
+import calendar
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+EPOCH_MS = 1_735_689_600_000  # 2025-01-01T00:00:00Z
+
+WORK_ORDER_STATUSES = ["draft", "pending", "inProgress", "completed"]
+EVENT_STATUSES = ["created", "acknowledged", "in_progress", "resolved", "closed", "escalated"]
+EVENT_CATEGORIES = ["maintenance", "fault", "inspection", "fuel", "driver_report"]
+# VIN-decode fields the units API returns on every unit, null for most vehicles
+VIN_DECODE_NULL_FIELDS = (
+    "additionalErrorText", "destinationMarket", "trim", "plantCompanyName", "plantState", "trim2", "series2",
+    "basePrice", "nonLandUse", "windows", "wheelBaseType", "trackWidthInches", "bedLengthInches",
+    "curbWeightPounds", "wheelBaseInchesTo", "grossCombinationWeightRatingFrom", "grossCombinationWeightRatingTo",
+    "trailerLengthFeet", "otherTrailerInfo", "numberOfWheels", "wheelSizeFrontInches", "wheelSizeRearInches",
+    "otherMotorcycleInfo", "fuelTankType", "fuelTankMaterial", "combinedBrakingSystem", "wheelieMitigation",
+    "busLengthFeet", "otherBusInfo", "entertainmentSystem", "steeringLocation", "numberOfSeats",
+    "numberOfSeatRows", "transmissionStyle", "transmissionSpeeds", "driveType", "axles", "axleConfiguration",
+    "brakeSystemType", "brakeSystemDescription",
+)
+COMPRESS_MIN_BYTES = 1024
+
+
+@dataclass
+class BackendConfig:
+    """Size of the generated dataset and how slow the backend is."""
+
+    latency_ms: float = 20.0
+    jitter_ms: float = 5.0
+    units: int = 50
+    work_orders_per_unit: int = 3
+    events_per_unit: int = 10
+    locations: int = 20
+    contacts: int = 50
+    tasks: int = 100
+    parts: int = 100
+    labor_lines: int = 100
+    default_page_size: int = 50
+    seed: int = 1
+    # Fault injection: this fraction of requests takes slow_ms instead of latency_ms
+    slow_rate: float = 0.0
+    slow_ms: float = 1000.0
+    # ...and this fraction answers error_status instead of routing
+    error_rate: float = 0.0
+    error_status: int = 503
+    # Gzip bodies over COMPRESS_MIN_BYTES when the request's Accept-Encoding allows it
+    compress: bool = True
+    # Merge updates to a work order, event or task into the stored record, so
+    # later reads see them; off, every write is echoed back and forgotten
+    apply_updates: bool = False
+    # Events a listEvents page reads before filtering, as a DynamoDB query with
+    # a filter expression does: a filtered page comes back with fewer items
+    # (often none) and a cursor. 0 filters the whole list first.
+    events_read_per_page: int = 0
+
+
+def _iso(ms: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ms / 1000)) + f".{ms % 1000:03d}Z"
+
+
+def _ms(iso: str) -> int:
+    """Epoch milliseconds of an ISO timestamp as _iso or Date.toISOString writes it."""
+    seconds, _, fraction = iso.rstrip("Z").partition(".")
+    return calendar.timegm(time.strptime(seconds, "%Y-%m-%dT%H:%M:%S")) * 1000 + int((fraction or "0")[:3].ljust(3, "0"))
+
+
+class Dataset:
+    """Deterministic records for one account, generated on first use."""
+
+    def __init__(self, account_id: str, config: BackendConfig):
+        rng = random.Random(f"{config.seed}:{account_id}")
+        self.units = [
+            {
+                "id": f"unit-{i:04d}",
+                "accountId": account_id,
+                "locationId": f"loc-{i % max(config.locations, 1):04d}",
+                "suggestedVin": f"1FUJGLDR{i:09d}",
+                "make": rng.choice(["FREIGHTLINER", "VOLVO", "KENWORTH", "PETERBILT"]),
+                "manufacturerName": "DAIMLER TRUCKS NORTH AMERICA",
+                "model": rng.choice(["Cascadia", "VNL", "T680", "579"]),
+                "modelYear": str(2015 + i % 10),
+                "vehicleType": "TRUCK",
+                "unitType": "tractor",
+                "createdAt": _iso(EPOCH_MS + i * 60_000),
+                "updatedAt": _iso(EPOCH_MS + i * 60_000),
+                "deletedAt": "",
+                **dict.fromkeys(VIN_DECODE_NULL_FIELDS),
+            }
+            for i in range(config.units)
+        ]
+        self.work_orders = [
+            {
+                "workOrderId": f"wo-{u:04d}-{w:02d}",
+                "accountId": account_id,
+                "contactId": f"contact-{(u + w) % max(config.contacts, 1):04d}",
+                "unitId": unit["id"],
+                "status": rng.choice(WORK_ORDER_STATUSES),
+                "description": "Replace front brake pads and inspect rotors",
+                "notes": ["Customer waiting"],
+                "createdAt": EPOCH_MS + (u * 100 + w) * 1000,
+                "updatedAt": EPOCH_MS + (u * 100 + w) * 1000,
+            }
+            for u, unit in enumerate(self.units)
+            for w in range(config.work_orders_per_unit)
+        ]
+        self.events = [
+            {
+                "accountId": account_id,
+                "eventId": f"evt-{u:04d}-{e:03d}",
+                "unitId": unit["id"],
+                "eventType": "engine_fault",
+                "eventCategory": rng.choice(EVENT_CATEGORIES),
+                "severity": rng.choice(["low", "medium", "high"]),
+                "priority": rng.choice(["low", "medium", "high"]),
+                "description": "Check engine light reported by telematics",
+                "sourceSystem": "telematics",
+                "status": rng.choice(EVENT_STATUSES),
+                "createdAt": _iso(EPOCH_MS + rng.randrange(0, 90 * 86_400_000)),
+            }
+            for u, unit in enumerate(self.units)
+            for e in range(config.events_per_unit)
+        ]
+        self.locations = [
+            {
+                "locationId": f"loc-{i:04d}",
+                "accountId": account_id,
+                "locationType": "address",
+                "address": {"streetAddress": f"{100 + i} Main St", "city": "Spokane", "state": "WA", "postalCode": "99201", "country": "US"},
+                "createdAt": _iso(EPOCH_MS),
+                "updatedAt": _iso(EPOCH_MS),
+            }
+            for i in range(config.locations)
+        ]
+        self.contacts = [
+            {
+                "accountId": account_id,
+                "email": f"contact-{i:04d}@example.com",
+                "firstName": "Pat",
+                "lastName": f"Driver {i}",
+                "phone": "+15095550100",
+                "createdAt": _iso(EPOCH_MS),
+                "updatedAt": _iso(EPOCH_MS),
+            }
+            for i in range(config.contacts)
+        ]
+        self.tasks = [
+            {
+                "taskId": f"task-{i:04d}",
+                "accountId": account_id,
+                "workOrderId": self.work_orders[i % len(self.work_orders)]["workOrderId"] if self.work_orders else "",
+                "title": "Inspect brakes",
+                "status": "pending",
+                "createdAt": EPOCH_MS,
+                "updatedAt": EPOCH_MS,
+            }
+            for i in range(config.tasks)
+        ]
+        self.parts = [
+            {
+                "accountId": account_id,
+                "partId": f"part-{i:04d}",
+                "sortKey": f"part-{i:04d}",
+                "unitId": self.units[i % len(self.units)]["id"] if self.units else None,
+                "partNumber": f"BP-{i:05d}",
+                "description": "Brake pad set",
+                "quantity": 1 + i % 12,
+                "createdAt": EPOCH_MS,
+                "updatedAt": EPOCH_MS,
+            }
+            for i in range(config.parts)
+        ]
+        self.labor_lines = [
+            {
+                "accountId": account_id,
+                "laborLineId": f"labor-{i:04d}",
+                "taskId": self.tasks[i % len(self.tasks)]["taskId"] if self.tasks else "",
+                "description": "Brake service",
+                "hours": 1.5,
+                "createdAt": EPOCH_MS,
+                "updatedAt": EPOCH_MS,
+            }
+            for i in range(config.labor_lines)
+        ]
+
+
+def _page(items, query, config, size_param="limit"):
+    """Slice items by the offset cursor; returns (page, next cursor or None)."""
+    offset = int(query.get("cursor", "0") or 0)
+    size = int(query.get(size_param, config.default_page_size) or config.default_page_size)
+    page = items[offset:offset + size]
+    return page, (str(offset + size) if offset + size < len(items) else None)
+
+
+def _find(items, key, value):
+    return next((item for item in items if item.get(key) == value), None)
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 overflows on fan-out bursts, and each overflowed
+    # connection then waits a full second for the SYN retransmit
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class StubBackend:
+    """Serve the generated datasets on localhost; use as a context manager."""
+
+    def __init__(self, config: BackendConfig | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or BackendConfig()
+        self._datasets: dict[str, Dataset] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._body_bytes = 0
+        self._wire_bytes = 0
+        self._server = _Server((host, port), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> int:
+        """Requests answered so far."""
+        return self._requests
+
+    @property
+    def body_bytes(self) -> int:
+        """Response body bytes so far, before compression."""
+        return self._body_bytes
+
+    @property
+    def wire_bytes(self) -> int:
+        """Response body bytes so far as sent, after any compression."""
+        return self._wire_bytes
+
+    def env(self) -> dict[str, str]:
+        """Backend URL variables pointing every lambda at this server."""
+        names = ["ACCOUNTS", "CONTACTS", "EVENTS", "LABORLINES", "LOCATIONS", "PARTS", "TASKS", "UNITS", "WORKORDERS"]
+        return {f"{name}_API_URL": self.url for name in names}
+
+    def start(self) -> "StubBackend":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubBackend":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def dataset(self, account_id: str) -> Dataset:
+        with self._lock:
+            if account_id not in self._datasets:
+                self._datasets[account_id] = Dataset(account_id, self.config)
+            return self._datasets[account_id]
+
+    def _delay(self) -> None:
+        config = self.config
+        if config.slow_rate > 0 and random.random() < config.slow_rate:
+            delay = config.slow_ms
+        else:
+            delay = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def _injected_error(self):
+        """(status, body) for a request picked to fail, else None."""
+        config = self.config
+        if config.error_rate > 0 and random.random() < config.error_rate:
+            return config.error_status, {"error": "InjectedFailure", "message": "Fault injected by the stub backend"}
+        return None
+
+    def _bulk(self, parts: list[str], body: object):
+        """(status, body) for a bulk write: work orders have a bulk endpoint,
+        parts do not, so both the bulk and the per-item paths get exercised."""
+        if parts[:1] != ["accounts"] or len(parts) != 4 or parts[2] != "work-orders":
+            return 404, {"error": "NotFound", "message": "No bulk endpoint"}
+        operations = body.get("operations", []) if isinstance(body, dict) else []
+        now = {"createdAt": _iso(EPOCH_MS), "updatedAt": _iso(EPOCH_MS)}
+        results = []
+        for operation in operations:
+            if operation.get("op") == "delete":
+                results.append({"status": 204})
+            elif operation.get("op") == "update":
+                work_order = {"workOrderId": operation.get("workOrderId"), "accountId": parts[1], **operation.get("changes", {}), **now}
+                results.append({"status": 200, "workOrder": work_order})
+            else:
+                results.append({"status": 201, "workOrder": {**operation.get("workOrder", {}), **now}})
+        return 200, {"results": results}
+
+    def _apply_update(self, parts: list[str], body: object):
+        """The stored work order, event or task an update addressed, with the
+        update merged in; None for any other write."""
+        if not isinstance(body, dict):
+            return None
+        if parts[:1] == ["accounts"] and len(parts) == 4 and parts[2] == "work-orders":
+            records, key, record_id = self.dataset(parts[1]).work_orders, "workOrderId", parts[3]
+        elif parts[:1] == ["events"] and len(parts) == 3:
+            records, key, record_id = self.dataset(parts[1]).events, "eventId", parts[2]
+        elif parts[:1] == ["tasks"] and len(parts) == 3:
+            records, key, record_id = self.dataset(parts[1]).tasks, "taskId", parts[2]
+        else:
+            return None
+        with self._lock:
+            record = _find(records, key, record_id)
+            if record is None:
+                return None
+            now_ms = int(time.time() * 1000)
+            record.update(body)
+            record["updatedAt"] = now_ms if isinstance(record.get("createdAt"), int) else _iso(now_ms)
+            return dict(record)
+
+    def route(self, method: str, path: str, query: dict[str, str], body: object = None):
+        """(status, body) for a request; the routing table of the stub."""
+        config = self.config
+        parts = [unquote(part) for part in path.split("/") if part]
+
+        if method != "GET":
+            # Writes are echoed back but not applied, so the dataset stays fixed
+            # however long a load test runs (unless config.apply_updates)
+            if parts[-1:] == ["bulk"]:
+                return self._bulk(parts, body)
+            if method in ("PUT", "PATCH") and config.apply_updates:
+                updated = self._apply_update(parts, body)
+                if updated is not None:
+                    return 200, updated
+            if method == "DELETE":
+                record = {"success": True}
+            else:
+                record = {**(body if isinstance(body, dict) else {}), "createdAt": _iso(EPOCH_MS), "updatedAt": _iso(EPOCH_MS)}
+            return (200, {"success": True, "data": record}) if parts[:1] == ["parts"] else (200, record)
+
+        if parts[:1] == ["accounts"] and len(parts) >= 3 and parts[2] == "work-orders":
+            data = self.dataset(parts[1])
+            if len(parts) == 4:
+                found = _find(data.work_orders, "workOrderId", parts[3])
+                return (200, found) if found else (404, {"error": "NotFound", "message": "Work order not found"})
+            items = data.work_orders
+            if "unitId" in query:
+                items = [item for item in items if item["unitId"] == query["unitId"]]
+            page, cursor = _page(items, query, config, "pageSize")
+            return 200, {"items": page, **({"nextCursor": cursor} if cursor else {})}
+
+        if parts[:1] == ["accounts"]:
+            if len(parts) == 2:
+                return 200, {"accountId": parts[1], "name": "Stub Fleet", "createdAt": _iso(EPOCH_MS), "updatedAt": _iso(EPOCH_MS)}
+            return 200, {"items": [], "limit": 0, "count": 0}
+
+        if parts[:1] == ["units"] and len(parts) >= 2:
+            data = self.dataset(parts[1])
+            if len(parts) == 3:
+                found = _find(data.units, "id", parts[2])
+                return (200, found) if found else (404, {"error": "NotFound", "message": "Unit not found"})
+            page, cursor = _page(data.units, query, config)
+            return 200, {"items": page, "hasMore": cursor is not None, **({"cursor": cursor} if cursor else {})}
+
+        if parts[:1] == ["events"] and len(parts) >= 2:
+            data = self.dataset(parts[1])
+            if len(parts) == 3:
+                found = _find(data.events, "eventId", parts[2])
+                return (200, found) if found else (404, {"error": "NotFound", "message": "Event not found"})
+            page, cursor = self._events_page(data.events, query)
+            return 200, {"items": page, "limit": len(page), "count": len(page), **({"nextCursor": cursor} if cursor else {})}
+
+        if parts[:1] == ["locations"]:
+            data = self.dataset(query.get("accountId", ""))
+            if len(parts) == 2:
+                for dataset in list(self._datasets.values()):
+                    found = _find(dataset.locations, "locationId", parts[1])
+                    if found:
+                        return 200, found
+                return 404, {"error": "NotFound", "message": "Location not found"}
+            page, cursor = _page(data.locations, query, config)
+            return 200, {"items": page, "limit": len(page), "count": len(page), **({"nextCursor": cursor} if cursor else {})}
+
+        if parts[:1] == ["contacts"] and len(parts) >= 2:
+            data = self.dataset(parts[1])
+            if len(parts) == 3:
+                found = _find(data.contacts, "email", parts[2])
+                return (200, found) if found else (404, {"error": "NotFound", "message": "Contact not found"})
+            page, cursor = _page(data.contacts, query, config)
+            return 200, {"items": page, "limit": len(page), **({"nextCursor": cursor} if cursor else {})}
+
+        if parts[:1] == ["tasks"] and len(parts) >= 2:
+            data = self.dataset(parts[1])
+            if len(parts) == 3:
+                found = _find(data.tasks, "taskId", parts[2])
+                return (200, found) if found else (404, {"error": "NotFound", "message": "Task not found"})
+            page, cursor = _page(data.tasks, query, config)
+            return 200, {"items": page, "limit": len(page), "count": len(page), **({"nextCursor": cursor} if cursor else {})}
+
+        if parts[:1] == ["parts"] and len(parts) >= 2:
+            data = self.dataset(parts[1])
+            if len(parts) == 3:
+                found = _find(data.parts, "sortKey", parts[2])
+                return (200, {"success": True, "data": found}) if found else (404, {"success": False, "error": {"message": "Part not found", "timestamp": EPOCH_MS}})
+            items = data.parts
+            for field in ("unitId", "locationId"):
+                if field in query:
+                    items = [item for item in items if item.get(field) == query[field]]
+            page, cursor = _page(items, query, config)
+            pagination = {"limit": len(page), "hasNextPage": cursor is not None, "nextCursor": cursor, "count": len(page)}
+            return 200, {"success": True, "data": page, "pagination": pagination}
+
+        if parts[:1] == ["labor-lines"] and len(parts) >= 2:
+            data = self.dataset(parts[1])
+            if len(parts) == 3:
+                found = _find(data.labor_lines, "laborLineId", parts[2])
+                return (200, found) if found else (404, {"error": "NotFound", "message": "Labor line not found"})
+            items = data.labor_lines
+            if "taskId" in query:
+                items = [item for item in items if item["taskId"] == query["taskId"]]
+            page, cursor = _page(items, query, config)
+            return 200, {"items": page, "hasMore": cursor is not None, **({"nextCursor": cursor} if cursor else {})}
+
+        return 404, {"error": "NotFound", "message": f"No stub route for {path}"}
+
+    def _events_page(self, events, query):
+        """A listEvents page: a from/to window (inclusive) is listed oldest
+        first, and with events_read_per_page the filters apply to each page's
+        reads, not to the whole list."""
+        config = self.config
+        items = events
+        if "from" in query or "to" in query:
+            start, end = _ms(query.get("from", _iso(0))), _ms(query.get("to", _iso(2 ** 42)))
+            items = sorted((item for item in items if start <= _ms(item["createdAt"]) <= end),
+                           key=lambda item: (item["createdAt"], item["eventId"]))
+        filters = {field: query[field] for field in ("unitId", "status", "eventCategory", "severity", "priority")
+                   if field in query}
+        matches = lambda item: all(item.get(field) == value for field, value in filters.items())
+        if not config.events_read_per_page:
+            return _page([item for item in items if matches(item)], query, config)
+        offset = int(query.get("cursor", "0") or 0)
+        size = int(query.get("limit", config.default_page_size) or config.default_page_size)
+        read = min(size, config.events_read_per_page)
+        page = [item for item in items[offset:offset + read] if matches(item)]
+        return page, (str(offset + read) if offset + read < len(items) else None)
+
+    def _handler_class(self):
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this Nagle adds ~40 ms
+            disable_nagle_algorithm = True
+
+            def _respond(self) -> None:
+                raw = self._read_body()
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = None
+                url = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                backend._delay()
+                status, body = backend._injected_error() or backend.route(
+                    self.command, re.sub(r"/+", "/", url.path), query, body)
+                payload = json.dumps(body).encode()
+                raw_length = len(payload)
+                accepted = self.headers.get("Accept-Encoding", "")
+                gzipped = (backend.config.compress and raw_length > COMPRESS_MIN_BYTES
+                           and "gzip" in [coding.split(";")[0].strip() for coding in accepted.split(",")])
+                if gzipped:
+                    payload = gzip.compress(payload, compresslevel=6)
+                with backend._lock:
+                    backend._requests += 1
+                    backend._body_bytes += raw_length
+                    backend._wire_bytes += len(payload)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _read_body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                        if size == 0:
+                            while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                                pass
+                            return b"".join(chunks)
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+            def log_message(self, format, *args) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+                pass
+
+        return Handler
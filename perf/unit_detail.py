@@ -0,0 +1,228 @@
+"""End-to-end latency of the unit detail screen: five root fields vs getUnitDetail.
+
+Sends the screen's data needs through the local AppSync stand-in two ways:
+"multi-field", the query the screen sends today (getUnit, listWorkOrders,
+listParts, listEvents and getLocation as root fields, which AppSync resolves
+in parallel, each through its own lambda), and "aggregate", one getUnitDetail
+field that the gateway answers with all five backend calls in one invocation.
+Both select the same fields and go over HTTP to the stand-in, so the latency
+is what a client sees, minus the network to AppSync.
+
+    # build unit, workorder, part, event and location and lambda/gateway (npm run build) first
+    python -m perf.unit_detail
+    python -m perf.unit_detail --latency-ms 40 --jitter-ms 20 --requests 200 --concurrency 8
+    python -m perf.unit_detail --lambda-scaling --idle-timeout 2     # cold starts under load
+    python -m perf.unit_detail --layout gateway                      # root fields through the gateway too
+
+The multi-field query names the unit's location up front, as a screen that
+already listed the unit would; getUnitDetail finds it from the unit, so its
+location call waits for the unit call. listWorkOrders has no unit filter and
+pages the account's work orders, where getUnitDetail asks for the unit's.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+from bff_client.http import HttpPool
+
+from .appsync_local import GATEWAY, LAYOUTS, LocalAppSync
+from .bench import percentile
+from .handler_process import handler_module
+from .scenarios import account_id_from, load_payload
+from .stub_backend import BackendConfig, StubBackend
+
+UNIT_FIELDS = "id accountId locationId suggestedVin make model modelYear unitType"
+WORK_ORDER_FIELDS = "workOrderId unitId status description createdAt"
+PART_FIELDS = "partId sortKey partNumber description quantity"
+EVENT_FIELDS = "eventId unitId eventCategory severity status description createdAt"
+LOCATION_FIELDS = "... on AddressLocation { locationId locationType address { city state } }"
+
+MULTI_FIELD_QUERY = f"""
+query UnitDetailScreen($accountId: ID!, $unitId: ID!, $locationId: ID!, $limit: Int) {{
+  getUnit(id: $unitId) {{ {UNIT_FIELDS} }}
+  getLocation(accountId: $accountId, locationId: $locationId) {{ {LOCATION_FIELDS} }}
+  listWorkOrders(accountId: $accountId, pageSize: $limit) {{ items {{ {WORK_ORDER_FIELDS} }} nextCursor }}
+  listParts(accountId: $accountId, unitId: $unitId, limit: $limit) {{ items {{ {PART_FIELDS} }} nextCursor }}
+  listEvents(accountId: $accountId, unitId: $unitId, limit: $limit) {{ items {{ {EVENT_FIELDS} }} nextCursor }}
+}}
+"""
+
+AGGREGATE_QUERY = f"""
+query UnitDetailScreen($unitId: ID!, $limit: Int) {{
+  getUnitDetail(id: $unitId, workOrdersLimit: $limit, partsLimit: $limit, eventsLimit: $limit) {{
+    unit {{ {UNIT_FIELDS} }}
+    location {{ {LOCATION_FIELDS} }}
+    workOrders {{ items {{ {WORK_ORDER_FIELDS} }} nextCursor }}
+    parts {{ items {{ {PART_FIELDS} }} nextCursor }}
+    events {{ items {{ {EVENT_FIELDS} }} nextCursor }}
+    errors {{ section message }}
+  }}
+}}
+"""
+
+VARIANTS = {"multi-field": MULTI_FIELD_QUERY, "aggregate": AGGREGATE_QUERY}
+SPLIT_FUNCTIONS = ("unit", "workorder", "part", "event", "location")
+
+
+@dataclass
+class VariantResult:
+    variant: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    invocations_per_request: float
+    cold_starts: int
+    backend_requests_per_request: float
+    first_error: str | None = None
+
+
+def response_error(response) -> str | None:
+    """The first GraphQL or section error in a response, if any."""
+    if response.status != 200:
+        return f"HTTP {response.status}"
+    body = response.json() or {}
+    if body.get("errors"):
+        return body["errors"][0].get("message", "error")
+    detail = (body.get("data") or {}).get("getUnitDetail") or {}
+    if detail.get("errors"):
+        return f"{detail['errors'][0]['section']}: {detail['errors'][0]['message']}"
+    return None
+
+
+async def run_variant(variant: str, variables: dict, backend: StubBackend, env: dict[str, str],
+                      args: argparse.Namespace) -> VariantResult:
+    app = LocalAppSync(env=env, layout=args.layout, node=args.node, show_logs=args.show_logs,
+                       container_concurrency=1 if args.lambda_scaling else None, idle_timeout_s=args.idle_timeout)
+    server = await asyncio.start_server(app.handle_connection, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/graphql"
+    body = {"query": VARIANTS[variant], "variables": variables}
+    latencies: list[float] = []
+    errors, first_error = 0, None
+    try:
+        async with HttpPool(url, max_connections=args.concurrency) as pool:
+            for _ in range(args.warmup):
+                await pool.post_json(body)
+            app.reset_stats()
+            backend_before = backend.requests
+            remaining = args.requests
+
+            async def client() -> None:
+                nonlocal remaining, errors, first_error
+                while remaining > 0:
+                    remaining -= 1
+                    started = time.perf_counter()
+                    response = await pool.post_json(body)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    error = response_error(response)
+                    if error is not None:
+                        errors += 1
+                        first_error = first_error or error
+                        if args.verbose:
+                            print(json.dumps(response.json(), indent=2), file=sys.stderr)
+
+            await asyncio.gather(*(client() for _ in range(args.concurrency)))
+            backend_requests = backend.requests - backend_before
+            stats = app.stats()
+    finally:
+        server.close()
+        await server.wait_closed()
+        await app.drain()
+        app.close()
+
+    latencies.sort()
+    count = len(latencies) or 1
+    return VariantResult(
+        variant=variant,
+        requests=len(latencies),
+        errors=errors,
+        p50_ms=percentile(latencies, 0.50),
+        p95_ms=percentile(latencies, 0.95),
+        p99_ms=percentile(latencies, 0.99),
+        invocations_per_request=sum(entry.invocations for entry in stats.values()) / count,
+        cold_starts=sum(entry.cold_starts for entry in stats.values()),
+        backend_requests_per_request=backend_requests / count,
+        first_error=first_error,
+    )
+
+
+def print_table(results: list[VariantResult], out=sys.stdout) -> None:
+    header = (f"{'variant':<12} {'reqs':>6} {'err':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+              f"{'invokes/req':>12} {'cold':>5} {'backend/req':>12}")
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        print(
+            f"{result.variant:<12} {result.requests:>6} {result.errors:>5} {result.p50_ms:>8.1f} {result.p95_ms:>8.1f} "
+            f"{result.p99_ms:>8.1f} {result.invocations_per_request:>12.2f} {result.cold_starts:>5} "
+            f"{result.backend_requests_per_request:>12.2f}",
+            file=out,
+        )
+    for result in results:
+        if result.first_error:
+            print(f"{result.variant}: {result.errors} errors, first: {result.first_error}", file=out)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m perf.unit_detail", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--variants", default=",".join(VARIANTS), help="comma-separated variants to run, in order")
+    parser.add_argument("--requests", type=int, default=100, help="timed requests per variant")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed requests first")
+    parser.add_argument("--concurrency", type=int, default=1, help="requests in flight at once")
+    parser.add_argument("--limit", type=int, default=20, help="page size of each list section")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="stub backend latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="stub backend jitter")
+    parser.add_argument("--layout", choices=LAYOUTS, default="split",
+                        help="where the multi-field query's root fields run; getUnitDetail always runs in the gateway")
+    parser.add_argument("--lambda-scaling", action="store_true",
+                        help="one invocation per container at a time, new containers cold-start under load")
+    parser.add_argument("--idle-timeout", type=float, help="seconds before an idle container is reclaimed")
+    parser.add_argument("--node", default="node", help="node executable")
+    parser.add_argument("--show-logs", action="store_true", help="pass lambda logs through to stderr")
+    parser.add_argument("--verbose", action="store_true", help="print failed responses to stderr")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    variants = [variant.strip() for variant in args.variants.split(",")]
+    unknown = [variant for variant in variants if variant not in VARIANTS]
+    if unknown:
+        print(f"Unknown variants: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    needed = [GATEWAY] if "aggregate" in variants or args.layout == GATEWAY else []
+    if "multi-field" in variants and args.layout != GATEWAY:
+        needed.extend(SPLIT_FUNCTIONS)
+    missing = [name for name in needed if not handler_module(name).exists()]
+    if missing:
+        print(f"Not built: {', '.join(missing)}; run `npm run build` in lambda/<fn> first", file=sys.stderr)
+        return 2
+
+    account_id = account_id_from(load_payload())
+    config = BackendConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+    results: list[VariantResult] = []
+    with StubBackend(config) as backend:
+        unit = backend.dataset(account_id).units[0]
+        variables = {"accountId": account_id, "unitId": unit["id"], "locationId": unit["locationId"], "limit": args.limit}
+        env = {**backend.env(), "LOG_LEVEL": "ERROR", "CACHE_ENABLED": "false"}
+        for variant in variants:
+            results.append(asyncio.run(run_variant(variant, variables, backend, env, args)))
+
+    if args.json:
+        json.dump({"settings": vars(args), "results": [asdict(result) for result in results]}, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
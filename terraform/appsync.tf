@@ -8,6 +8,11 @@ resource "aws_appsync_graphql_api" "main" {
     aws_region     = "us-west-2"
   }
 
+  # The resolver lambdas publish change-feed events with their roles
+  additional_authentication_provider {
+    authentication_type = "AWS_IAM"
+  }
+
   schema = file("${path.module}/schema.graphql")
 
   xray_enabled = true
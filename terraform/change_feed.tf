@@ -0,0 +1,67 @@
+# Change feed: the work order, event and task mutation resolvers publish what
+# they changed through the IAM-only Mutation.publishChange field, a NONE data
+# source that hands the change back to AppSync, which pushes it to the
+# onWorkOrderChanged / onEventChanged / onTaskChanged subscribers whose
+# filters match. With change_feed_enabled false the lambdas get no
+# CHANGE_FEED_URL and publish nothing.
+
+locals {
+  change_feed_url = var.change_feed_enabled ? aws_appsync_graphql_api.main.uris["GRAPHQL"] : ""
+
+  # Roles of the functions that run the mutation resolvers
+  change_feed_publisher_roles = merge(
+    {
+      event     = aws_iam_role.event_lambda.id
+      task      = aws_iam_role.task_lambda.id
+      workorder = aws_iam_role.workorder_lambda.id
+    },
+    local.gateway_enabled ? { gateway = aws_iam_role.gateway_lambda[0].id } : {}
+  )
+
+  # Subscription field => the Change entity it delivers and the key it narrows on
+  change_feed_subscriptions = {
+    onWorkOrderChanged = { entity = "WorkOrder", key = "unitId" }
+    onEventChanged     = { entity = "Event", key = "unitId" }
+    onTaskChanged      = { entity = "Task", key = "workOrderId" }
+  }
+}
+
+resource "aws_appsync_resolver" "publish_change" {
+  count = var.change_feed_enabled ? 1 : 0
+
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Mutation"
+  field             = "publishChange"
+  data_source       = aws_appsync_datasource.none.name
+  request_template  = file("${path.module}/resolvers/publish-change-request.vtl")
+  response_template = file("${path.module}/resolvers/publish-change-response.vtl")
+}
+
+resource "aws_appsync_resolver" "change_subscription" {
+  for_each = var.change_feed_enabled ? local.change_feed_subscriptions : {}
+
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Subscription"
+  field             = each.key
+  data_source       = aws_appsync_datasource.none.name
+  request_template  = file("${path.module}/resolvers/change-subscription-request.vtl")
+  response_template = templatefile("${path.module}/resolvers/change-subscription-response.vtl", each.value)
+}
+
+resource "aws_iam_role_policy" "change_feed_publish" {
+  for_each = var.change_feed_enabled ? local.change_feed_publisher_roles : {}
+
+  name = "${var.project}-${var.environment}-${each.key}-change-feed-policy"
+  role = each.value
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["appsync:GraphQL"]
+        Resource = "${aws_appsync_graphql_api.main.arn}/types/Mutation/fields/publishChange"
+      }
+    ]
+  })
+}
@@ -0,0 +1,199 @@
+# Event exports: startEventExport records a RUNNING manifest in the export
+# bucket and asynchronously invokes the export worker, a second function with
+# the event lambda's code and a longer timeout, which scans the requested
+# from/to window in time shards, streams the events as NDJSON next to the
+# manifest in a multipart upload and completes it; getEventExport reads the manifest back
+# with a presigned download URL. Exports expire with the bucket's lifecycle
+# rule.
+#
+# The worker makes the backend requests with the caller's token, which its
+# payload carries sealed with a KMS key for that export. Its invocations are
+# not retried and have no dead-letter queue or on-failure destination, so a
+# failed one leaves no copy of the payload; startEventExport refuses a token
+# that expires before the export could have waited in the queue and run.
+# With event_export_enabled false the lambdas get no
+# EVENT_EXPORT_BUCKET and the export fields fail.
+
+locals {
+  event_export_bucket  = var.event_export_enabled ? aws_s3_bucket.event_exports[0].id : ""
+  event_export_kms_key = var.event_export_enabled ? aws_kms_key.event_exports[0].arn : ""
+
+  # A literal name, since the worker's own environment refers to it
+  event_export_function = "${var.project}-${var.environment}-event-export"
+
+  # Roles of the functions that run the export resolvers (the worker shares
+  # the event lambda's)
+  event_export_roles = merge(
+    { event = aws_iam_role.event_lambda.id },
+    local.gateway_enabled ? { gateway = aws_iam_role.gateway_lambda[0].id } : {}
+  )
+}
+
+resource "aws_s3_bucket" "event_exports" {
+  count = var.event_export_enabled ? 1 : 0
+
+  bucket = "${var.project}-${var.environment}-event-exports-${data.aws_caller_identity.current.account_id}"
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-event-exports"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
+
+resource "aws_s3_bucket_public_access_block" "event_exports" {
+  count = var.event_export_enabled ? 1 : 0
+
+  bucket                  = aws_s3_bucket.event_exports[0].id
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+resource "aws_s3_bucket_lifecycle_configuration" "event_exports" {
+  count = var.event_export_enabled ? 1 : 0
+
+  bucket = aws_s3_bucket.event_exports[0].id
+
+  rule {
+    id     = "expire-exports"
+    status = "Enabled"
+
+    filter {
+      prefix = "exports/"
+    }
+
+    expiration {
+      days = var.event_export_retention_days
+    }
+  }
+}
+
+resource "aws_kms_key" "event_exports" {
+  count = var.event_export_enabled ? 1 : 0
+
+  description             = "Seals the caller's token in ${var.project}-${var.environment} event export invocations"
+  deletion_window_in_days = 7
+  enable_key_rotation     = true
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-event-exports"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
+
+resource "aws_iam_role_policy" "event_export" {
+  for_each = var.event_export_enabled ? local.event_export_roles : {}
+
+  name = "${var.project}-${var.environment}-${each.key}-event-export-policy"
+  role = each.value
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["s3:GetObject", "s3:PutObject", "s3:AbortMultipartUpload", "s3:ListMultipartUploadParts"]
+        Resource = "${aws_s3_bucket.event_exports[0].arn}/exports/*"
+      },
+      {
+        Effect   = "Allow"
+        Action   = ["lambda:InvokeFunction"]
+        Resource = aws_lambda_function.event_export[0].arn
+      },
+      {
+        # Every role seals tokens; only the worker's (the event lambda's) unseals them
+        Effect   = "Allow"
+        Action   = each.key == "event" ? ["kms:Encrypt", "kms:Decrypt"] : ["kms:Encrypt"]
+        Resource = aws_kms_key.event_exports[0].arn
+      }
+    ]
+  })
+}
+
+# The export worker: the event lambda's package, with the time to read a
+# whole window. Its events are streamed to S3, so memory does not grow with
+# the export.
+resource "aws_lambda_function" "event_export" {
+  count = var.event_export_enabled ? 1 : 0
+
+  filename      = "../lambda/event/lambda.zip"
+  function_name = local.event_export_function
+  role          = aws_iam_role.event_lambda.arn
+  handler       = "index.handler"
+  runtime       = "nodejs18.x"
+  timeout       = var.event_export_timeout_seconds
+  memory_size   = 512
+
+  environment {
+    variables = {
+      EVENTS_API_URL               = "https://event-srnext.sb.fullbay.com"
+      LOG_LEVEL                    = var.lambda_log_level
+      LOG_SAMPLE_RATES             = var.lambda_log_sample_rates
+      PROFILING_BUCKET             = local.profiling_bucket
+      PROFILING_FIELDS             = local.profiling_fields
+      PROFILING_SAMPLE_RATE        = local.profiling_sample_rate
+      PROFILING_HEADER             = local.profiling_header
+      PROFILING_HEADER_SECRET      = local.profiling_header_secret
+      EVENT_EXPORT_BUCKET          = local.event_export_bucket
+      EVENT_EXPORT_KMS_KEY         = local.event_export_kms_key
+      EVENT_EXPORT_TIMEOUT_SECONDS = tostring(var.event_export_timeout_seconds)
+    }
+  }
+
+  source_code_hash = filebase64sha256("../lambda/event/lambda.zip")
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-event-export-lambda"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
+
+# A failed export is recorded in its manifest, so the invocation is never
+# retried, and it has no destination: its payload carries the sealed token.
+# The event age matches EXPORT_QUEUE_SECONDS in event-export.ts.
+resource "aws_lambda_function_event_invoke_config" "event_export" {
+  count = var.event_export_enabled ? 1 : 0
+
+  function_name                = aws_lambda_function.event_export[0].function_name
+  maximum_retry_attempts       = 0
+  maximum_event_age_in_seconds = 300
+}
+
+resource "aws_cloudwatch_log_group" "event_export" {
+  count = var.event_export_enabled ? 1 : 0
+
+  name              = "/aws/lambda/${local.event_export_function}"
+  retention_in_days = 7
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-event-export-lambda-logs"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
+
+resource "aws_appsync_resolver" "start_event_export" {
+  count = var.event_export_enabled ? 1 : 0
+
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Mutation"
+  field             = "startEventExport"
+  data_source       = aws_appsync_datasource.event_lambda.name
+  request_template  = file("${path.module}/resolvers/lambda-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-response.vtl")
+}
+
+resource "aws_appsync_resolver" "get_event_export" {
+  count = var.event_export_enabled ? 1 : 0
+
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Query"
+  field             = "getEventExport"
+  data_source       = aws_appsync_datasource.event_lambda.name
+  request_template  = file("${path.module}/resolvers/lambda-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-response.vtl")
+}
@@ -0,0 +1,168 @@
+# Consolidated gateway Lambda: one function that can serve the fields of any
+# resolver lambda. AppSync data sources listed in var.gateway_functions invoke
+# it instead of their own function, so those entities share one warm
+# container, HTTP pool and tenant cache. It also serves the aggregate fields
+# (getUnitDetail) that call several lambdas' backends at once. Nothing here is
+# created while the list is empty and unit_detail_enabled is false, as it is
+# by default.
+
+locals {
+  gateway_enabled = length(var.gateway_functions) > 0 || var.unit_detail_enabled
+
+  resolver_lambda_arns = {
+    account   = aws_lambda_function.account.arn
+    contact   = aws_lambda_function.contact.arn
+    event     = aws_lambda_function.event.arn
+    laborline = aws_lambda_function.laborline.arn
+    location  = aws_lambda_function.location.arn
+    part      = aws_lambda_function.part.arn
+    task      = aws_lambda_function.task.arn
+    unit      = aws_lambda_function.unit.arn
+    workorder = aws_lambda_function.workorder.arn
+  }
+
+  # The function each resolver data source invokes
+  resolver_datasource_arns = {
+    for name, arn in local.resolver_lambda_arns :
+    name => contains(var.gateway_functions, name) ? aws_lambda_function.gateway[0].arn : arn
+  }
+}
+
+resource "aws_lambda_function" "gateway" {
+  count = local.gateway_enabled ? 1 : 0
+
+  filename      = "../lambda/gateway/lambda.zip"
+  function_name = "${var.project}-${var.environment}-gateway"
+  role          = aws_iam_role.gateway_lambda[0].arn
+  handler       = "index.handler"
+  runtime       = "nodejs18.x"
+  timeout       = 30
+  memory_size   = 256
+
+  environment {
+    variables = {
+      ACCOUNTS_API_URL             = "https://account-srnext.sb.fullbay.com"
+      CONTACTS_API_URL             = "https://contact-srnext.sb.fullbay.com"
+      EVENTS_API_URL               = "https://event-srnext.sb.fullbay.com"
+      LABORLINES_API_URL           = "https://laborlines-dev.sb.fullbay.com"
+      LOCATIONS_API_URL            = "https://location-srnext.sb.fullbay.com"
+      PARTS_API_URL                = "https://part-srnext.sb.fullbay.com"
+      TASKS_API_URL                = "https://srnext-tasks.sb.fullbay.com"
+      UNITS_API_URL                = "https://unit-srnext.sb.fullbay.com"
+      WORKORDERS_API_URL           = "https://workorder-srnext.sb.fullbay.com"
+      LOG_LEVEL                    = var.lambda_log_level
+      LOG_SAMPLE_RATES             = var.lambda_log_sample_rates
+      PROFILING_BUCKET             = local.profiling_bucket
+      PROFILING_FIELDS             = local.profiling_fields
+      PROFILING_SAMPLE_RATE        = local.profiling_sample_rate
+      PROFILING_HEADER             = local.profiling_header
+      PROFILING_HEADER_SECRET      = local.profiling_header_secret
+      CHANGE_FEED_URL              = local.change_feed_url
+      EVENT_EXPORT_BUCKET          = local.event_export_bucket
+      EVENT_EXPORT_FUNCTION        = local.event_export_function
+      EVENT_EXPORT_KMS_KEY         = local.event_export_kms_key
+      EVENT_EXPORT_TIMEOUT_SECONDS = tostring(var.event_export_timeout_seconds)
+      RATE_LIMIT_ENABLED           = tostring(var.rate_limit_enabled)
+      RATE_LIMIT_CAPACITY          = tostring(var.rate_limit_capacity)
+      RATE_LIMIT_REFILL_PER_SECOND = tostring(var.rate_limit_refill_per_second)
+    }
+  }
+
+  source_code_hash = filebase64sha256("../lambda/gateway/lambda.zip")
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-gateway-lambda"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
+
+# Data source and resolver for the fields only the gateway answers. They follow
+# unit_detail_enabled itself, not gateway_enabled: routing resolver lambdas
+# through the gateway does not turn getUnitDetail on.
+resource "aws_appsync_datasource" "gateway_lambda" {
+  count = var.unit_detail_enabled ? 1 : 0
+
+  api_id           = aws_appsync_graphql_api.main.id
+  name             = "gateway_lambda_datasource"
+  type             = "AWS_LAMBDA"
+  service_role_arn = aws_iam_role.appsync_lambda.arn
+
+  lambda_config {
+    function_arn = aws_lambda_function.gateway[0].arn
+  }
+}
+
+resource "aws_appsync_resolver" "get_unit_detail" {
+  count = var.unit_detail_enabled ? 1 : 0
+
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Query"
+  field             = "getUnitDetail"
+  data_source       = aws_appsync_datasource.gateway_lambda[0].name
+  request_template  = file("${path.module}/resolvers/lambda-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-response.vtl")
+}
+
+# IAM Role for Gateway Lambda
+resource "aws_iam_role" "gateway_lambda" {
+  count = local.gateway_enabled ? 1 : 0
+
+  name = "${var.project}-${var.environment}-gateway-lambda-role"
+
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Principal = {
+          Service = "lambda.amazonaws.com"
+        }
+        Action = "sts:AssumeRole"
+      }
+    ]
+  })
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-gateway-lambda-role"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
+
+# IAM Policy for Gateway Lambda
+resource "aws_iam_role_policy" "gateway_lambda" {
+  count = local.gateway_enabled ? 1 : 0
+
+  name = "${var.project}-${var.environment}-gateway-lambda-policy"
+  role = aws_iam_role.gateway_lambda[0].id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "logs:CreateLogGroup",
+          "logs:CreateLogStream",
+          "logs:PutLogEvents"
+        ]
+        Resource = "arn:aws:logs:${data.aws_region.current.name}:${data.aws_caller_identity.current.account_id}:log-group:/aws/lambda/${var.project}-${var.environment}-gateway:*"
+      }
+    ]
+  })
+}
+
+# CloudWatch Log Group for Gateway Lambda
+resource "aws_cloudwatch_log_group" "gateway_lambda" {
+  count = local.gateway_enabled ? 1 : 0
+
+  name              = "/aws/lambda/${var.project}-${var.environment}-gateway"
+  retention_in_days = 7
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-gateway-lambda-logs"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
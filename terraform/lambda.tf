@@ -10,9 +10,18 @@ resource "aws_lambda_function" "unit" {
 
   environment {
     variables = {
-      UNITS_API_URL      = "https://unit-srnext.sb.fullbay.com"
-      WORKORDERS_API_URL = "https://workorder-srnext.sb.fullbay.com"
-      LOG_LEVEL          = "INFO"
+      UNITS_API_URL                = "https://unit-srnext.sb.fullbay.com"
+      WORKORDERS_API_URL           = "https://workorder-srnext.sb.fullbay.com"
+      LOG_LEVEL                    = var.lambda_log_level
+      LOG_SAMPLE_RATES             = var.lambda_log_sample_rates
+      PROFILING_BUCKET             = local.profiling_bucket
+      PROFILING_FIELDS             = local.profiling_fields
+      PROFILING_SAMPLE_RATE        = local.profiling_sample_rate
+      PROFILING_HEADER             = local.profiling_header
+      PROFILING_HEADER_SECRET      = local.profiling_header_secret
+      RATE_LIMIT_ENABLED           = tostring(var.rate_limit_enabled)
+      RATE_LIMIT_CAPACITY          = tostring(var.rate_limit_capacity)
+      RATE_LIMIT_REFILL_PER_SECOND = tostring(var.rate_limit_refill_per_second)
     }
   }
 
@@ -90,7 +99,7 @@ resource "aws_appsync_datasource" "unit_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.unit.arn
+    function_arn = local.resolver_datasource_arns["unit"]
   }
 }
 
@@ -131,7 +140,7 @@ resource "aws_iam_role_policy" "appsync_lambda" {
         Action = [
           "lambda:InvokeFunction"
         ]
-        Resource = [
+        Resource = concat([
           aws_lambda_function.unit.arn,
           aws_lambda_function.account.arn,
           aws_lambda_function.contact.arn,
@@ -141,7 +150,7 @@ resource "aws_iam_role_policy" "appsync_lambda" {
           aws_lambda_function.part.arn,
           aws_lambda_function.task.arn,
           aws_lambda_function.workorder.arn
-        ]
+        ], aws_lambda_function.gateway[*].arn)
       }
     ]
   })
@@ -202,6 +211,27 @@ resource "aws_appsync_resolver" "get_unit_with_work_orders" {
   response_template = file("${path.module}/resolvers/lambda-response.vtl")
 }
 
+# Nested unit fields, answered with one BatchInvoke per batch of parent rows
+resource "aws_appsync_resolver" "work_order_unit" {
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "WorkOrder"
+  field             = "unit"
+  data_source       = aws_appsync_datasource.unit_lambda.name
+  max_batch_size    = var.lambda_max_batch_size["unit"]
+  request_template  = file("${path.module}/resolvers/lambda-batch-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-batch-response.vtl")
+}
+
+resource "aws_appsync_resolver" "event_with_unit_info_unit" {
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "EventWithUnitInfo"
+  field             = "unit"
+  data_source       = aws_appsync_datasource.unit_lambda.name
+  max_batch_size    = var.lambda_max_batch_size["unit"]
+  request_template  = file("${path.module}/resolvers/lambda-batch-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-batch-response.vtl")
+}
+
 # Account Lambda Function
 resource "aws_lambda_function" "account" {
   filename      = "../lambda/account/lambda.zip"
@@ -214,8 +244,14 @@ resource "aws_lambda_function" "account" {
 
   environment {
     variables = {
-      ACCOUNTS_API_URL = "https://account-srnext.sb.fullbay.com"
-      LOG_LEVEL        = "INFO"
+      ACCOUNTS_API_URL        = "https://account-srnext.sb.fullbay.com"
+      LOG_LEVEL               = var.lambda_log_level
+      LOG_SAMPLE_RATES        = var.lambda_log_sample_rates
+      PROFILING_BUCKET        = local.profiling_bucket
+      PROFILING_FIELDS        = local.profiling_fields
+      PROFILING_SAMPLE_RATE   = local.profiling_sample_rate
+      PROFILING_HEADER        = local.profiling_header
+      PROFILING_HEADER_SECRET = local.profiling_header_secret
     }
   }
 
@@ -293,7 +329,7 @@ resource "aws_appsync_datasource" "account_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.account.arn
+    function_arn = local.resolver_datasource_arns["account"]
   }
 }
 
@@ -355,7 +391,14 @@ resource "aws_lambda_function" "contact" {
 
   environment {
     variables = {
-      CONTACTS_API_URL = "https://contact-srnext.sb.fullbay.com"
+      CONTACTS_API_URL        = "https://contact-srnext.sb.fullbay.com"
+      LOG_LEVEL               = var.lambda_log_level
+      LOG_SAMPLE_RATES        = var.lambda_log_sample_rates
+      PROFILING_BUCKET        = local.profiling_bucket
+      PROFILING_FIELDS        = local.profiling_fields
+      PROFILING_SAMPLE_RATE   = local.profiling_sample_rate
+      PROFILING_HEADER        = local.profiling_header
+      PROFILING_HEADER_SECRET = local.profiling_header_secret
     }
   }
 
@@ -433,7 +476,7 @@ resource "aws_appsync_datasource" "contact_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.contact.arn
+    function_arn = local.resolver_datasource_arns["contact"]
   }
 }
 
@@ -495,7 +538,22 @@ resource "aws_lambda_function" "event" {
 
   environment {
     variables = {
-      EVENTS_API_URL = "https://event-srnext.sb.fullbay.com"
+      EVENTS_API_URL               = "https://event-srnext.sb.fullbay.com"
+      LOG_LEVEL                    = var.lambda_log_level
+      LOG_SAMPLE_RATES             = var.lambda_log_sample_rates
+      PROFILING_BUCKET             = local.profiling_bucket
+      PROFILING_FIELDS             = local.profiling_fields
+      PROFILING_SAMPLE_RATE        = local.profiling_sample_rate
+      PROFILING_HEADER             = local.profiling_header
+      PROFILING_HEADER_SECRET      = local.profiling_header_secret
+      CHANGE_FEED_URL              = local.change_feed_url
+      EVENT_EXPORT_BUCKET          = local.event_export_bucket
+      EVENT_EXPORT_FUNCTION        = local.event_export_function
+      EVENT_EXPORT_KMS_KEY         = local.event_export_kms_key
+      EVENT_EXPORT_TIMEOUT_SECONDS = tostring(var.event_export_timeout_seconds)
+      RATE_LIMIT_ENABLED           = tostring(var.rate_limit_enabled)
+      RATE_LIMIT_CAPACITY          = tostring(var.rate_limit_capacity)
+      RATE_LIMIT_REFILL_PER_SECOND = tostring(var.rate_limit_refill_per_second)
     }
   }
 
@@ -573,7 +631,7 @@ resource "aws_appsync_datasource" "event_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.event.arn
+    function_arn = local.resolver_datasource_arns["event"]
   }
 }
 
@@ -644,8 +702,14 @@ resource "aws_lambda_function" "laborline" {
 
   environment {
     variables = {
-      LABORLINES_API_URL = "https://laborlines-dev.sb.fullbay.com"
-      LOG_LEVEL          = "INFO"
+      LABORLINES_API_URL      = "https://laborlines-dev.sb.fullbay.com"
+      LOG_LEVEL               = var.lambda_log_level
+      LOG_SAMPLE_RATES        = var.lambda_log_sample_rates
+      PROFILING_BUCKET        = local.profiling_bucket
+      PROFILING_FIELDS        = local.profiling_fields
+      PROFILING_SAMPLE_RATE   = local.profiling_sample_rate
+      PROFILING_HEADER        = local.profiling_header
+      PROFILING_HEADER_SECRET = local.profiling_header_secret
     }
   }
 
@@ -723,7 +787,7 @@ resource "aws_appsync_datasource" "laborline_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.laborline.arn
+    function_arn = local.resolver_datasource_arns["laborline"]
   }
 }
 
@@ -785,8 +849,14 @@ resource "aws_lambda_function" "location" {
 
   environment {
     variables = {
-      LOCATIONS_API_URL = "https://location-srnext.sb.fullbay.com"
-      LOG_LEVEL         = "INFO"
+      LOCATIONS_API_URL       = "https://location-srnext.sb.fullbay.com"
+      LOG_LEVEL               = var.lambda_log_level
+      LOG_SAMPLE_RATES        = var.lambda_log_sample_rates
+      PROFILING_BUCKET        = local.profiling_bucket
+      PROFILING_FIELDS        = local.profiling_fields
+      PROFILING_SAMPLE_RATE   = local.profiling_sample_rate
+      PROFILING_HEADER        = local.profiling_header
+      PROFILING_HEADER_SECRET = local.profiling_header_secret
     }
   }
 
@@ -864,7 +934,7 @@ resource "aws_appsync_datasource" "location_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.location.arn
+    function_arn = local.resolver_datasource_arns["location"]
   }
 }
 
@@ -914,6 +984,17 @@ resource "aws_appsync_resolver" "delete_location" {
   response_template = file("${path.module}/resolvers/lambda-response.vtl")
 }
 
+# Nested Part.location field, answered with one BatchInvoke per batch of parts
+resource "aws_appsync_resolver" "part_location" {
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Part"
+  field             = "location"
+  data_source       = aws_appsync_datasource.location_lambda.name
+  max_batch_size    = var.lambda_max_batch_size["location"]
+  request_template  = file("${path.module}/resolvers/lambda-batch-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-batch-response.vtl")
+}
+
 # Part Lambda Function
 resource "aws_lambda_function" "part" {
   filename      = "../lambda/part/lambda.zip"
@@ -926,8 +1007,14 @@ resource "aws_lambda_function" "part" {
 
   environment {
     variables = {
-      PARTS_API_URL = "https://part-srnext.sb.fullbay.com"
-      LOG_LEVEL     = "INFO"
+      PARTS_API_URL           = "https://part-srnext.sb.fullbay.com"
+      LOG_LEVEL               = var.lambda_log_level
+      LOG_SAMPLE_RATES        = var.lambda_log_sample_rates
+      PROFILING_BUCKET        = local.profiling_bucket
+      PROFILING_FIELDS        = local.profiling_fields
+      PROFILING_SAMPLE_RATE   = local.profiling_sample_rate
+      PROFILING_HEADER        = local.profiling_header
+      PROFILING_HEADER_SECRET = local.profiling_header_secret
     }
   }
 
@@ -1005,7 +1092,7 @@ resource "aws_appsync_datasource" "part_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.part.arn
+    function_arn = local.resolver_datasource_arns["part"]
   }
 }
 
@@ -1037,6 +1124,15 @@ resource "aws_appsync_resolver" "create_part" {
   response_template = file("${path.module}/resolvers/lambda-response.vtl")
 }
 
+resource "aws_appsync_resolver" "create_parts" {
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Mutation"
+  field             = "createParts"
+  data_source       = aws_appsync_datasource.part_lambda.name
+  request_template  = file("${path.module}/resolvers/lambda-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-response.vtl")
+}
+
 resource "aws_appsync_resolver" "update_part" {
   api_id            = aws_appsync_graphql_api.main.id
   type              = "Mutation"
@@ -1067,8 +1163,15 @@ resource "aws_lambda_function" "task" {
 
   environment {
     variables = {
-      TASKS_API_URL = "https://srnext-tasks.sb.fullbay.com"
-      LOG_LEVEL     = "INFO"
+      TASKS_API_URL           = "https://srnext-tasks.sb.fullbay.com"
+      LOG_LEVEL               = var.lambda_log_level
+      LOG_SAMPLE_RATES        = var.lambda_log_sample_rates
+      PROFILING_BUCKET        = local.profiling_bucket
+      PROFILING_FIELDS        = local.profiling_fields
+      PROFILING_SAMPLE_RATE   = local.profiling_sample_rate
+      PROFILING_HEADER        = local.profiling_header
+      PROFILING_HEADER_SECRET = local.profiling_header_secret
+      CHANGE_FEED_URL         = local.change_feed_url
     }
   }
 
@@ -1146,7 +1249,7 @@ resource "aws_appsync_datasource" "task_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.task.arn
+    function_arn = local.resolver_datasource_arns["task"]
   }
 }
 
@@ -1208,8 +1311,15 @@ resource "aws_lambda_function" "workorder" {
 
   environment {
     variables = {
-      WORKORDERS_API_URL = "https://workorder-srnext.sb.fullbay.com"
-      LOG_LEVEL          = "INFO"
+      WORKORDERS_API_URL      = "https://workorder-srnext.sb.fullbay.com"
+      LOG_LEVEL               = var.lambda_log_level
+      LOG_SAMPLE_RATES        = var.lambda_log_sample_rates
+      PROFILING_BUCKET        = local.profiling_bucket
+      PROFILING_FIELDS        = local.profiling_fields
+      PROFILING_SAMPLE_RATE   = local.profiling_sample_rate
+      PROFILING_HEADER        = local.profiling_header
+      PROFILING_HEADER_SECRET = local.profiling_header_secret
+      CHANGE_FEED_URL         = local.change_feed_url
     }
   }
 
@@ -1287,7 +1397,7 @@ resource "aws_appsync_datasource" "workorder_lambda" {
   service_role_arn = aws_iam_role.appsync_lambda.arn
 
   lambda_config {
-    function_arn = aws_lambda_function.workorder.arn
+    function_arn = local.resolver_datasource_arns["workorder"]
   }
 }
 
@@ -1335,4 +1445,31 @@ resource "aws_appsync_resolver" "delete_workorder" {
   data_source       = aws_appsync_datasource.workorder_lambda.name
   request_template  = file("${path.module}/resolvers/lambda-request.vtl")
   response_template = file("${path.module}/resolvers/lambda-response.vtl")
+}
+
+resource "aws_appsync_resolver" "create_workorders" {
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Mutation"
+  field             = "createWorkOrders"
+  data_source       = aws_appsync_datasource.workorder_lambda.name
+  request_template  = file("${path.module}/resolvers/lambda-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-response.vtl")
+}
+
+resource "aws_appsync_resolver" "update_workorders" {
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Mutation"
+  field             = "updateWorkOrders"
+  data_source       = aws_appsync_datasource.workorder_lambda.name
+  request_template  = file("${path.module}/resolvers/lambda-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-response.vtl")
+}
+
+resource "aws_appsync_resolver" "delete_workorders" {
+  api_id            = aws_appsync_graphql_api.main.id
+  type              = "Mutation"
+  field             = "deleteWorkOrders"
+  data_source       = aws_appsync_datasource.workorder_lambda.name
+  request_template  = file("${path.module}/resolvers/lambda-request.vtl")
+  response_template = file("${path.module}/resolvers/lambda-response.vtl")
 }
\ No newline at end of file
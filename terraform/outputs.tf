@@ -16,4 +16,9 @@ output "appsync_api_id" {
 output "cognito_user_pool_id" {
   description = "The Cognito User Pool ID used for authentication"
   value       = var.cognito_user_pool_id
-}
\ No newline at end of file
+}
+
+output "profiles_bucket" {
+  description = "The S3 bucket the lambdas put their profiles into (empty unless profiling_enabled)"
+  value       = local.profiling_bucket
+}
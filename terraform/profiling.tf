@@ -0,0 +1,90 @@
+# Profiling: withProfiling puts the CPU and heap profiles of the invocations
+# it selects into the profiles bucket, under the function's name, where
+# `aws s3 sync` fetches them for Chrome DevTools or perf.profile_summary.
+# Invocations are selected by profiling_fields, profiling_sample_rate, or an
+# x-bff-profile request header carrying profiling_header_secret (no secret:
+# the header is ignored). With profiling_enabled false the lambdas get no
+# PROFILING_* settings and profile nothing.
+
+locals {
+  profiling_bucket        = var.profiling_enabled ? aws_s3_bucket.profiles[0].id : ""
+  profiling_fields        = var.profiling_enabled ? join(",", var.profiling_fields) : ""
+  profiling_sample_rate   = var.profiling_enabled ? tostring(var.profiling_sample_rate) : "0"
+  profiling_header        = var.profiling_enabled && var.profiling_header_secret != "" ? "x-bff-profile" : ""
+  profiling_header_secret = var.profiling_enabled ? var.profiling_header_secret : ""
+
+  # Roles of every function wrapped in withProfiling (the export worker shares
+  # the event lambda's)
+  profiling_roles = merge(
+    {
+      account   = aws_iam_role.account_lambda.id
+      contact   = aws_iam_role.contact_lambda.id
+      event     = aws_iam_role.event_lambda.id
+      laborline = aws_iam_role.laborline_lambda.id
+      location  = aws_iam_role.location_lambda.id
+      part      = aws_iam_role.part_lambda.id
+      task      = aws_iam_role.task_lambda.id
+      unit      = aws_iam_role.unit_lambda.id
+      workorder = aws_iam_role.workorder_lambda.id
+    },
+    local.gateway_enabled ? { gateway = aws_iam_role.gateway_lambda[0].id } : {}
+  )
+}
+
+resource "aws_s3_bucket" "profiles" {
+  count = var.profiling_enabled ? 1 : 0
+
+  bucket = "${var.project}-${var.environment}-profiles-${data.aws_caller_identity.current.account_id}"
+
+  tags = {
+    Name        = "${var.project}-${var.environment}-profiles"
+    Environment = var.environment
+    Project     = var.project
+  }
+}
+
+resource "aws_s3_bucket_public_access_block" "profiles" {
+  count = var.profiling_enabled ? 1 : 0
+
+  bucket                  = aws_s3_bucket.profiles[0].id
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+resource "aws_s3_bucket_lifecycle_configuration" "profiles" {
+  count = var.profiling_enabled ? 1 : 0
+
+  bucket = aws_s3_bucket.profiles[0].id
+
+  rule {
+    id     = "expire-profiles"
+    status = "Enabled"
+
+    filter {}
+
+    expiration {
+      days = var.profiling_retention_days
+    }
+  }
+}
+
+resource "aws_iam_role_policy" "profiling" {
+  for_each = var.profiling_enabled ? local.profiling_roles : {}
+
+  name = "${var.project}-${var.environment}-${each.key}-profiling-policy"
+  role = each.value
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        # Write-only: profiles are read back with an operator's credentials
+        Effect   = "Allow"
+        Action   = ["s3:PutObject"]
+        Resource = "${aws_s3_bucket.profiles[0].arn}/*"
+      }
+    ]
+  })
+}
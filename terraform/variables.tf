@@ -26,4 +26,125 @@ variable "base_domain" {
   description = "Base domain for Route53 hosted zone"
   type        = string
   default     = "sb.fullbay.com"
-}
\ No newline at end of file
+}
+
+variable "lambda_log_level" {
+  description = "Lowest log level the resolver Lambdas write (DEBUG, INFO, WARN or ERROR)"
+  type        = string
+  default     = "INFO"
+}
+
+variable "lambda_log_sample_rates" {
+  description = "Per-field debug/info log sampling for the resolver Lambdas, e.g. \"listWorkOrders=0.05,listUnits=0.1\" (warnings and errors are always logged)"
+  type        = string
+  default     = ""
+}
+
+variable "lambda_max_batch_size" {
+  description = "Maximum number of nested-field resolutions AppSync sends in one BatchInvoke, per Lambda data source (0 disables batching)"
+  type        = map(number)
+  default = {
+    account   = 0
+    contact   = 0
+    event     = 0
+    laborline = 0
+    location  = 20
+    part      = 0
+    task      = 0
+    unit      = 20
+    workorder = 0
+  }
+}
+
+variable "gateway_functions" {
+  description = "Resolver lambdas whose AppSync data sources invoke the consolidated gateway Lambda instead of their own function, e.g. [\"laborline\", \"location\"] (empty: no gateway is deployed)"
+  type        = set(string)
+  default     = []
+
+  validation {
+    condition = alltrue([
+      for name in var.gateway_functions :
+      contains(["account", "contact", "event", "laborline", "location", "part", "task", "unit", "workorder"], name)
+    ])
+    error_message = "gateway_functions may only contain account, contact, event, laborline, location, part, task, unit and workorder."
+  }
+}
+
+variable "unit_detail_enabled" {
+  description = "Serve Query.getUnitDetail (unit, location, work orders, parts and events in one invocation) from the gateway Lambda, which is deployed for it even when gateway_functions is empty (off: the field has no resolver)"
+  type        = bool
+  default     = false
+}
+
+variable "change_feed_enabled" {
+  description = "Publish work order, event and task changes from the mutation resolvers to the onWorkOrderChanged, onEventChanged and onTaskChanged subscriptions"
+  type        = bool
+  default     = true
+}
+
+variable "event_export_enabled" {
+  description = "Serve startEventExport/getEventExport: event exports are streamed to an S3 bucket by an asynchronous invocation of the event export worker"
+  type        = bool
+  default     = true
+}
+
+variable "event_export_timeout_seconds" {
+  description = "Timeout of the event export worker, the longest an export can take to read its window"
+  type        = number
+  default     = 900
+}
+
+variable "event_export_retention_days" {
+  description = "Days an event export is kept in the export bucket"
+  type        = number
+  default     = 7
+}
+
+variable "rate_limit_enabled" {
+  description = "Rate-limit each account's queries on the unit, event and gateway lambdas by their admission cost (limit arguments are capped either way); buckets are kept per container"
+  type        = bool
+  default     = true
+}
+
+variable "rate_limit_capacity" {
+  description = "Admission cost an account can spend in a burst (RATE_LIMIT_CAPACITY)"
+  type        = number
+  default     = 600
+}
+
+variable "rate_limit_refill_per_second" {
+  description = "Admission cost an account regains per second (RATE_LIMIT_REFILL_PER_SECOND)"
+  type        = number
+  default     = 100
+}
+
+variable "profiling_enabled" {
+  description = "Create the profiles bucket and let the lambdas profile the invocations selected by profiling_fields, profiling_sample_rate and profiling_header_secret into it"
+  type        = bool
+  default     = false
+}
+
+variable "profiling_fields" {
+  description = "GraphQL fields profiled on every invocation while profiling_enabled, e.g. [\"listEventsByStatus\"] (PROFILING_FIELDS)"
+  type        = list(string)
+  default     = []
+}
+
+variable "profiling_sample_rate" {
+  description = "Share of all other invocations profiled while profiling_enabled, 0..1 (PROFILING_SAMPLE_RATE)"
+  type        = number
+  default     = 0
+}
+
+variable "profiling_header_secret" {
+  description = "Value an x-bff-profile request header must carry to profile its invocation (empty: the header is ignored)"
+  type        = string
+  default     = ""
+  sensitive   = true
+}
+
+variable "profiling_retention_days" {
+  description = "Days a profile is kept in the profiles bucket"
+  type        = number
+  default     = 14
+}